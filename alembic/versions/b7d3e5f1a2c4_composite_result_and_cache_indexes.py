@@ -0,0 +1,90 @@
+"""composite result and cache indexes
+
+Revision ID: b7d3e5f1a2c4
+Revises: a4c8b2e1d9f0
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d3e5f1a2c4"
+down_revision: Union[str, Sequence[str], None] = "a4c8b2e1d9f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, index prefix) of the result tables keyed by result category
+CATEGORY_TABLES = (
+    ("story_drifts", "ix_drift"),
+    ("story_accelerations", "ix_accel"),
+    ("story_forces", "ix_force"),
+    ("story_displacements", "ix_disp"),
+    ("wall_shears", "ix_wallshear"),
+    ("quad_rotations", "ix_quadrot"),
+    ("column_shears", "ix_colshear"),
+    ("column_axials", "ix_colaxial"),
+    ("brace_axials", "ix_braceaxial"),
+    ("column_rotations", "ix_colrot"),
+    ("beam_rotations", "ix_beamrot"),
+)
+
+
+def upgrade() -> None:
+    """Composite (category, load case) indexes and cache lookups led by result_set_id."""
+    for table, prefix in CATEGORY_TABLES:
+        op.drop_index(f"{prefix}_category", table_name=table)
+        op.create_index(
+            f"{prefix}_category_case",
+            table,
+            ["result_category_id", "load_case_id"],
+        )
+
+    op.drop_index("ix_cache_lookup", table_name="global_results_cache")
+    op.create_index(
+        "ix_cache_set_type_order",
+        "global_results_cache",
+        ["result_set_id", "result_type", "story_sort_order"],
+    )
+    op.drop_index("ix_elem_cache_lookup", table_name="element_results_cache")
+    op.create_index(
+        "ix_elem_cache_set_type",
+        "element_results_cache",
+        ["result_set_id", "result_type", "element_id"],
+    )
+    op.drop_index("ix_joint_cache_lookup", table_name="joint_results_cache")
+    op.create_index(
+        "ix_joint_cache_set_type",
+        "joint_results_cache",
+        ["result_set_id", "result_type"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_joint_cache_set_type", table_name="joint_results_cache")
+    op.create_index(
+        "ix_joint_cache_lookup",
+        "joint_results_cache",
+        ["project_id", "result_set_id", "result_type"],
+    )
+    op.drop_index("ix_elem_cache_set_type", table_name="element_results_cache")
+    op.create_index(
+        "ix_elem_cache_lookup",
+        "element_results_cache",
+        ["project_id", "result_set_id", "result_type", "element_id"],
+    )
+    op.drop_index("ix_cache_set_type_order", table_name="global_results_cache")
+    op.create_index(
+        "ix_cache_lookup",
+        "global_results_cache",
+        ["project_id", "result_set_id", "result_type"],
+    )
+
+    for table, prefix in CATEGORY_TABLES:
+        op.drop_index(f"{prefix}_category_case", table_name=table)
+        op.create_index(f"{prefix}_category", table, ["result_category_id"])
@@ -0,0 +1,64 @@
+"""add element peaks
+
+Revision ID: b8f3d6a2c4e7
+Revises: e5a1c7f3b9d2
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8f3d6a2c4e7"
+down_revision: Union[str, Sequence[str], None] = "e5a1c7f3b9d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PEAK_INDEXES = {
+    "ix_element_peak_set_type": "element_id",
+    "ix_element_peak_abs_avg": "abs_avg",
+    "ix_element_peak_abs_max": "abs_max",
+    "ix_element_peak_max": "max_value",
+    "ix_element_peak_min": "min_value",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "element_peaks",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("result_set_id", sa.Integer(), nullable=False),
+        sa.Column("result_type", sa.String(length=50), nullable=False),
+        sa.Column("element_id", sa.Integer(), nullable=False),
+        sa.Column("abs_avg", sa.Float(), nullable=False),
+        sa.Column("abs_avg_story_id", sa.Integer(), nullable=False),
+        sa.Column("abs_max", sa.Float(), nullable=False),
+        sa.Column("abs_max_story_id", sa.Integer(), nullable=False),
+        sa.Column("max_value", sa.Float(), nullable=False),
+        sa.Column("max_story_id", sa.Integer(), nullable=False),
+        sa.Column("min_value", sa.Float(), nullable=False),
+        sa.Column("min_story_id", sa.Integer(), nullable=False),
+        sa.Column("last_updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"]),
+        sa.ForeignKeyConstraint(["result_set_id"], ["result_sets.id"]),
+        sa.ForeignKeyConstraint(["element_id"], ["elements.id"]),
+        sa.ForeignKeyConstraint(["abs_avg_story_id"], ["stories.id"]),
+        sa.ForeignKeyConstraint(["abs_max_story_id"], ["stories.id"]),
+        sa.ForeignKeyConstraint(["max_story_id"], ["stories.id"]),
+        sa.ForeignKeyConstraint(["min_story_id"], ["stories.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    for name, column in PEAK_INDEXES.items():
+        op.create_index(name, "element_peaks", ["result_set_id", "result_type", column])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in PEAK_INDEXES:
+        op.drop_index(name, table_name="element_peaks")
+    op.drop_table("element_peaks")
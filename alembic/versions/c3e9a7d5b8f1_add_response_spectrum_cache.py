@@ -0,0 +1,50 @@
+"""add response spectrum cache
+
+Revision ID: c3e9a7d5b8f1
+Revises: b7d3e5f1a2c4
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e9a7d5b8f1"
+down_revision: Union[str, Sequence[str], None] = "b7d3e5f1a2c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "response_spectrum_cache",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("result_set_id", sa.Integer(), nullable=False),
+        sa.Column("load_case_name", sa.String(length=100), nullable=False),
+        sa.Column("direction", sa.String(length=10), nullable=False),
+        sa.Column("damping_ratio", sa.Float(), nullable=False),
+        sa.Column("periods", sa.JSON(), nullable=False),
+        sa.Column("values", sa.JSON(), nullable=False),
+        sa.Column("pga", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"]),
+        sa.ForeignKeyConstraint(["result_set_id"], ["result_sets.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_spectrum_unique",
+        "response_spectrum_cache",
+        ["result_set_id", "direction", "load_case_name", "damping_ratio"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_spectrum_unique", table_name="response_spectrum_cache")
+    op.drop_table("response_spectrum_cache")
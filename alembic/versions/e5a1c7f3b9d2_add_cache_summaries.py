@@ -0,0 +1,53 @@
+"""add cache summaries
+
+Revision ID: e5a1c7f3b9d2
+Revises: c3e9a7d5b8f1
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a1c7f3b9d2"
+down_revision: Union[str, Sequence[str], None] = "c3e9a7d5b8f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "cache_summaries",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("result_set_id", sa.Integer(), nullable=False),
+        sa.Column("cache_kind", sa.String(length=20), nullable=False),
+        sa.Column("result_type", sa.String(length=50), nullable=False),
+        sa.Column("direction", sa.String(length=20), nullable=False),
+        sa.Column("element_id", sa.Integer(), nullable=True),
+        sa.Column("row_stats", sa.JSON(), nullable=False),
+        sa.Column("column_max", sa.JSON(), nullable=False),
+        sa.Column("column_min", sa.JSON(), nullable=False),
+        sa.Column("min_value", sa.Float(), nullable=True),
+        sa.Column("max_value", sa.Float(), nullable=True),
+        sa.Column("last_updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"]),
+        sa.ForeignKeyConstraint(["result_set_id"], ["result_sets.id"]),
+        sa.ForeignKeyConstraint(["element_id"], ["elements.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_cache_summary_lookup",
+        "cache_summaries",
+        ["result_set_id", "cache_kind", "result_type", "element_id", "direction"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_cache_summary_lookup", table_name="cache_summaries")
+    op.drop_table("cache_summaries")
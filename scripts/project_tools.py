@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import json
 import sys
 from pathlib import Path
 
@@ -14,6 +15,9 @@
 
 from services.project_service import (
     delete_project_context,
+    get_project_context,
+    get_result_sets_for_project,
+    list_project_contexts,
     list_project_summaries,
 )
 
@@ -57,6 +61,118 @@ def cmd_delete(args: argparse.Namespace) -> int:
     return 1
 
 
+def cmd_report(args: argparse.Namespace) -> int:
+    # Imported lazily: report rendering pulls in Qt, the other commands do not need it
+    from gui.reporting.batch_report import ALL_SECTIONS, plan_report_jobs, run_report_jobs
+    from gui.reporting.report_section_catalog import parse_template
+
+    patterns = list(args.sections or [])
+    if args.template:
+        patterns.extend(parse_template(Path(args.template).read_text(encoding="utf-8").splitlines()))
+    patterns = patterns or list(ALL_SECTIONS)
+
+    if args.all:
+        names = [ctx.name for ctx in list_project_contexts()]
+    elif args.name:
+        names = args.name
+    else:
+        print("Please specify --name (repeatable) or --all.")
+        return 1
+
+    jobs = []
+    for name in names:
+        try:
+            jobs.extend(plan_report_jobs(name, Path(args.output_dir), args.result_set, patterns))
+        except ValueError as exc:
+            if not args.all:
+                print(str(exc))
+                return 1
+            # --all with --result-set: projects without those result sets are skipped
+            print(f"Warning: skipping '{name}': {exc}")
+
+    if not jobs:
+        print("No result sets to report.")
+        return 0
+
+    timings = None
+    if args.timings:
+        Path(args.timings).parent.mkdir(parents=True, exist_ok=True)
+        timings = open(args.timings, "a", encoding="utf-8")
+    try:
+        def on_result(result) -> None:
+            print(result.summary(), flush=True)
+            if timings:
+                timings.write(json.dumps(result.to_record()) + "\n")
+                timings.flush()
+
+        results = run_report_jobs(jobs, max_workers=args.workers, on_result=on_result)
+    finally:
+        if timings:
+            timings.close()
+
+    failed = sum(1 for result in results if result.error)
+    print(f"{len(results) - failed} of {len(results)} reports written.")
+    return 1 if failed else 0
+
+
+def cmd_portfolio(args: argparse.Namespace) -> int:
+    from services.portfolio import PortfolioService
+
+    service = PortfolioService(max_workers=args.workers)
+    try:
+        result = service.query(args.metric, refresh=args.refresh)
+    except ValueError as exc:
+        print(str(exc))
+        return 1
+
+    frame = result.to_frame()
+    if args.csv:
+        Path(args.csv).parent.mkdir(parents=True, exist_ok=True)
+        frame.to_csv(args.csv, index=False)
+        print(f"Wrote {len(frame)} rows to {args.csv}")
+    elif args.json:
+        print(frame.to_json(orient="records", indent=2))
+    elif frame.empty:
+        print("No result sets found.")
+    else:
+        print(frame.to_string(index=False, na_rep="—"))
+
+    for project, error in result.errors.items():
+        print(f"! {project}: {error}")
+    print(
+        f"{result.queried_projects} project(s) queried, "
+        f"{result.cached_projects} answered from cache."
+    )
+    return 1 if result.errors else 0
+
+
+def cmd_shard(args: argparse.Namespace) -> int:
+    from database.shards import has_shard, move_to_shard
+
+    context = get_project_context(args.name)
+    if context is None:
+        print(f"Project '{args.name}' not found.")
+        return 1
+
+    result_sets = {
+        name: result_set_id for result_set_id, name in get_result_sets_for_project(context)
+    }
+    names = args.result_set or list(result_sets)
+    missing = [name for name in names if name not in result_sets]
+    if missing:
+        print(f"Result set(s) not found in '{args.name}': {', '.join(missing)}")
+        return 1
+
+    for name in names:
+        result_set_id = result_sets[name]
+        if has_shard(context.db_path, result_set_id):
+            print(f"- {name}: already sharded")
+            continue
+        moved = move_to_shard(context.db_path, result_set_id)
+        print(f"- {name}: moved {sum(moved.values())} rows into its shard")
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Project catalog tooling.")
     subparsers = parser.add_subparsers(dest="command")
@@ -73,6 +189,76 @@ def build_parser() -> argparse.ArgumentParser:
     )
     delete_parser.set_defaults(func=cmd_delete)
 
+    report_parser = subparsers.add_parser(
+        "report",
+        help="Render PDF reports headlessly (one per result set).",
+    )
+    report_parser.add_argument("--name", action="append", help="Project name (repeatable).")
+    report_parser.add_argument("--all", action="store_true", help="Report every catalogued project.")
+    report_parser.add_argument(
+        "--result-set",
+        action="append",
+        help="Result set name (repeatable, default: all result sets).",
+    )
+    report_parser.add_argument(
+        "--sections",
+        action="append",
+        help="Section pattern such as 'Global/Drifts/*' or 'Element/*' (repeatable, default: all).",
+    )
+    report_parser.add_argument(
+        "--template",
+        help="File with one section pattern per line (# starts a comment).",
+    )
+    report_parser.add_argument("--output-dir", required=True, help="Directory for the PDF files.")
+    report_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count, 1 renders in-process).",
+    )
+    report_parser.add_argument(
+        "--timings",
+        help="Append per-report timings as JSON lines to this file.",
+    )
+    report_parser.set_defaults(func=cmd_report)
+
+    portfolio_parser = subparsers.add_parser(
+        "portfolio",
+        help="Peak results of every result set across all catalogued projects.",
+    )
+    portfolio_parser.add_argument(
+        "--metric",
+        action="append",
+        help="Metric key such as peak_drift or max_quad_rotation (repeatable).",
+    )
+    portfolio_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count, 1 queries in-process).",
+    )
+    portfolio_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore answers cached for unchanged project databases.",
+    )
+    portfolio_output = portfolio_parser.add_mutually_exclusive_group()
+    portfolio_output.add_argument("--csv", help="Write the table to this CSV file.")
+    portfolio_output.add_argument("--json", action="store_true", help="Print JSON records.")
+    portfolio_parser.set_defaults(func=cmd_portfolio)
+
+    shard_parser = subparsers.add_parser(
+        "shard",
+        help="Move result sets into their own shard databases.",
+    )
+    shard_parser.add_argument("--name", required=True, help="Project name.")
+    shard_parser.add_argument(
+        "--result-set",
+        action="append",
+        help="Result set name (repeatable, default: all result sets).",
+    )
+    shard_parser.set_defaults(func=cmd_shard)
+
     return parser
 
 
@@ -0,0 +1,103 @@
+"""Acceptance criteria: demand limits per result type, optionally per element group."""
+
+from dataclasses import dataclass, replace
+from fnmatch import fnmatchcase
+from typing import Iterable, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class AcceptanceLimit:
+    """Limit (capacity) for a result type."""
+
+    result_type: str
+    """Result config key (e.g. 'Drifts', 'ColumnRotations_R2'); base keys cover their variants"""
+
+    limit: float
+    """Capacity in display units (e.g. % for drifts), compared with |demand|"""
+
+    element_group: Optional[str] = None
+    """Element name pattern (fnmatch, e.g. 'P*'); None applies to every element"""
+
+    @property
+    def key(self) -> str:
+        """Identifier used for stored overrides (e.g. 'QuadRotations|P*')."""
+        if self.element_group:
+            return f"{self.result_type}|{self.element_group}"
+        return self.result_type
+
+
+# Indicative starting points in display units; projects override them from the
+# Acceptance Criteria dialog (stored as settings overrides keyed by ``key``).
+ACCEPTANCE_LIMITS: Tuple[AcceptanceLimit, ...] = (
+    AcceptanceLimit("Drifts", 3.0),
+    AcceptanceLimit("QuadRotations", 1.5),
+    AcceptanceLimit("ColumnRotations", 3.0),
+    AcceptanceLimit("BeamRotations", 4.0),
+    AcceptanceLimit("SoilPressures_Min", 500.0),
+)
+
+DCR_WARNING = 0.8  # Ratios from here up are flagged as approaching the limit
+DCR_EXCEEDED = 1.0
+DCR_TOLERANCE = 1e-9  # Demands equal to a threshold count as reaching it despite rounding
+
+DCR_COLORS = {
+    "warning": "#fbbf24",  # Amber
+    "exceeded": "#ef4444",  # Red
+}
+
+
+def apply_overrides(
+    limits: Iterable[AcceptanceLimit], overrides: Mapping[str, float]
+) -> Tuple[AcceptanceLimit, ...]:
+    """Replace limit values by ``overrides`` (keyed by ``AcceptanceLimit.key``)."""
+    return tuple(
+        replace(limit, limit=float(overrides[limit.key])) if limit.key in overrides else limit
+        for limit in limits
+    )
+
+
+def _candidates(limits: Iterable[AcceptanceLimit], result_type: str) -> Tuple[AcceptanceLimit, ...]:
+    """Limits declared for ``result_type``, else for its base type."""
+    limits = tuple(limits)
+    exact = tuple(limit for limit in limits if limit.result_type == result_type)
+    if exact:
+        return exact
+    base = result_type.split("_", 1)[0]
+    return tuple(limit for limit in limits if limit.result_type == base)
+
+
+def has_limits(limits: Iterable[AcceptanceLimit], result_type: str) -> bool:
+    """Whether any limit (grouped or not) is declared for a result type."""
+    return bool(_candidates(limits, result_type))
+
+
+def resolve_limit(
+    limits: Iterable[AcceptanceLimit],
+    result_type: str,
+    element_name: Optional[str] = None,
+) -> Optional[float]:
+    """Limit applying to a result type (and element), or None if there is none.
+
+    A limit whose element group matches ``element_name`` takes precedence over
+    the result type's ungrouped limit. Non-positive limits count as unset.
+    """
+    candidates = _candidates(limits, result_type)
+    if element_name is not None:
+        for limit in candidates:
+            if limit.element_group and fnmatchcase(element_name, limit.element_group):
+                return abs(limit.limit) or None
+    for limit in candidates:
+        if not limit.element_group:
+            return abs(limit.limit) or None
+    return None
+
+
+def dcr_band(ratio: Optional[float]) -> Optional[str]:
+    """'exceeded', 'warning' or None for a demand-to-capacity ratio."""
+    if ratio is None or ratio != ratio:  # None or NaN
+        return None
+    if ratio >= DCR_EXCEEDED - DCR_TOLERANCE:
+        return "exceeded"
+    if ratio >= DCR_WARNING - DCR_TOLERANCE:
+        return "warning"
+    return None
@@ -0,0 +1,200 @@
+"""Analytical query backends for pivots and aggregations over result tables.
+
+Report, export and comparison paths read many result rows and reshape them
+into load-case columns. Instead of hydrating ORM objects and pivoting in
+Python loops, they build a SQLAlchemy Core ``select`` of plain columns (with
+any per-row arithmetic done in SQL) and hand it to an analytics backend:
+
+- ``sqlite``: runs the statement on the session's own connection. Always
+  available and sees uncommitted rows of the session.
+- ``duckdb``: runs the statement in DuckDB over the SQLite file(s) behind the
+  session (project database and, for shard sessions, the attached project),
+  vectorized and multi-threaded. Requires the optional ``duckdb`` package and
+  its ``sqlite`` extension, and only sees committed rows.
+
+``RPS_ANALYTICS_ENGINE`` selects the backend: ``sqlite`` (default), ``auto``
+(DuckDB when it can be used) or ``duckdb``. DuckDB is opt-in because it runs
+SQL compiled for SQLite and misses the session's pending rows. Any backend
+that cannot be opened falls back to SQLite.
+
+Usage:
+    with open_analytics(session) as analytics:
+        rows = analytics.frame(statement)
+        wide = analytics.pivot(rows, ["Story", "Element"], "load_case", "value")
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import logging
+import os
+from contextlib import contextmanager
+from typing import Iterator, Optional, Sequence
+
+import pandas as pd
+from sqlalchemy import JSON
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ("auto", "duckdb", "sqlite")
+DEFAULT_ENGINE = "sqlite"
+
+
+def configured_engine() -> str:
+    """Backend requested through RPS_ANALYTICS_ENGINE."""
+    engine = os.environ.get("RPS_ANALYTICS_ENGINE", DEFAULT_ENGINE).strip().lower()
+    if engine not in ENGINES:
+        logger.warning(f"Unknown RPS_ANALYTICS_ENGINE={engine!r}, using {DEFAULT_ENGINE}")
+        return DEFAULT_ENGINE
+    return engine
+
+
+def duckdb_available() -> bool:
+    """Whether the optional DuckDB package is installed."""
+    return importlib.util.find_spec("duckdb") is not None
+
+
+def literal_sql(statement: Select) -> str:
+    """Compile a statement to SQLite SQL with its parameters inlined."""
+    return str(statement.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class SQLiteAnalytics:
+    """Run analytical statements on the session's SQLite connection."""
+
+    name = "sqlite"
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def frame(self, statement: Select) -> pd.DataFrame:
+        """Result rows of a statement as a DataFrame (one column per selected label)."""
+        result = self.session.execute(statement)
+        return pd.DataFrame(result.all(), columns=list(result.keys()))
+
+    def pivot(
+        self, frame: pd.DataFrame, index: Sequence[str], columns: str, values: str
+    ) -> pd.DataFrame:
+        """Wide table with one column per distinct ``columns`` value.
+
+        Rows and value columns keep the order in which they first appear in
+        ``frame``; when a cell occurs several times the last value wins.
+        """
+        index = list(index)
+        if frame.empty:
+            return pd.DataFrame(columns=index)
+        keys = frame[index].drop_duplicates()
+        latest = frame.drop_duplicates(subset=index + [columns], keep="last")
+        wide = latest.set_index(index + [columns])[values].unstack(columns)
+        order = pd.MultiIndex.from_frame(keys) if len(index) > 1 else pd.Index(keys[index[0]])
+        wide = wide.reindex(index=order, columns=pd.unique(frame[columns]))
+        wide.columns.name = None
+        return wide.reset_index()
+
+    def close(self) -> None:
+        pass
+
+
+class DuckDBAnalytics(SQLiteAnalytics):
+    """Run analytical statements in DuckDB over the session's SQLite files."""
+
+    name = "duckdb"
+
+    def __init__(self, session: Session):
+        import duckdb
+
+        super().__init__(session)
+        databases = [
+            (name, path)
+            for _, name, path in session.connection().exec_driver_sql("PRAGMA database_list")
+            if name != "temp" and path
+        ]
+        if not databases:
+            raise ValueError("DuckDB analytics needs a file-backed database")
+
+        self._connection = duckdb.connect()
+        try:
+            self._load_sqlite_extension()
+            for name, path in databases:
+                quoted = path.replace("'", "''")
+                self._connection.execute(
+                    f"ATTACH '{quoted}' AS sqlite_{name} (TYPE SQLITE, READ_ONLY)"
+                )
+            # Same name resolution as the SQLite connection: main first, then attached
+            search_path = ",".join(f"sqlite_{name}" for name, _ in databases)
+            self._connection.execute(f"SET search_path = '{search_path}'")
+        except Exception:
+            self._connection.close()
+            raise
+
+    def _load_sqlite_extension(self) -> None:
+        """Load the sqlite extension, downloading it only when it is not installed."""
+        import duckdb
+
+        try:
+            self._connection.execute("LOAD sqlite")
+        except duckdb.Error:
+            self._connection.execute("INSTALL sqlite")
+            self._connection.execute("LOAD sqlite")
+
+    def frame(self, statement: Select) -> pd.DataFrame:
+        frame = self._connection.execute(literal_sql(statement)).df()
+        # The SQLite scanner returns JSON columns as text
+        for column in statement.selected_columns:
+            if isinstance(column.type, JSON) and column.name in frame.columns:
+                frame[column.name] = [
+                    json.loads(value) if isinstance(value, str) else value
+                    for value in frame[column.name]
+                ]
+        return frame
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def get_analytics(session: Session, engine: Optional[str] = None) -> SQLiteAnalytics:
+    """Analytics backend for a session, falling back to SQLite.
+
+    Args:
+        session: Session whose database is queried
+        engine: "auto", "duckdb" or "sqlite"; defaults to RPS_ANALYTICS_ENGINE
+    """
+    engine = engine or configured_engine()
+    if engine != "sqlite":
+        if duckdb_available():
+            try:
+                return DuckDBAnalytics(session)
+            except Exception as exc:
+                # In-memory databases are expected to fall back silently in auto mode
+                log = logger.warning if engine == "duckdb" else logger.debug
+                log(f"DuckDB analytics unavailable, using SQLite: {exc}")
+        elif engine == "duckdb":
+            logger.warning("DuckDB is not installed, using SQLite for analytics")
+    return SQLiteAnalytics(session)
+
+
+@contextmanager
+def open_analytics(session: Session, engine: Optional[str] = None) -> Iterator[SQLiteAnalytics]:
+    """Context manager around :func:`get_analytics` that closes the backend."""
+    analytics = get_analytics(session, engine)
+    try:
+        yield analytics
+    finally:
+        analytics.close()
+
+
+__all__ = [
+    "ENGINES",
+    "DEFAULT_ENGINE",
+    "configured_engine",
+    "duckdb_available",
+    "literal_sql",
+    "SQLiteAnalytics",
+    "DuckDBAnalytics",
+    "get_analytics",
+    "open_analytics",
+]
@@ -4,11 +4,13 @@
 
 import logging
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Set
 from sqlalchemy import create_engine, Engine
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 from sqlalchemy.pool import NullPool
 
+from .query_profile import profile_engine
+
 logger = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
@@ -25,6 +27,30 @@
 # Track engines per database path for proper disposal
 _project_engines: Dict[str, Engine] = {}
 
+# Database paths whose indexes were checked against the models since the engine was created
+_synced_indexes: Set[str] = set()
+
+# Indexes replaced by later schema revisions (see alembic/versions); dropped from
+# existing project databases when they are opened
+RETIRED_INDEXES = frozenset(
+    {
+        "ix_drift_category",
+        "ix_accel_category",
+        "ix_force_category",
+        "ix_disp_category",
+        "ix_wallshear_category",
+        "ix_quadrot_category",
+        "ix_colshear_category",
+        "ix_colaxial_category",
+        "ix_braceaxial_category",
+        "ix_colrot_category",
+        "ix_beamrot_category",
+        "ix_cache_lookup",
+        "ix_elem_cache_lookup",
+        "ix_joint_cache_lookup",
+    }
+)
+
 
 def _normalize_db_path(db_path: Path) -> str:
     """Normalize database path for consistent key storage."""
@@ -54,6 +80,7 @@ def _get_or_create_engine(db_path: Path) -> Engine:
         connect_args={"check_same_thread": False},
         poolclass=NullPool,  # No connection pooling - closes connections immediately
     )
+    profile_engine(engine)
     _project_engines[db_path_str] = engine
     return engine
 
@@ -77,6 +104,10 @@ def dispose_project_engine(db_path: Path | str) -> None:
     logger.debug(f"Attempting to dispose engine for: {db_path_str}")
     logger.debug(f"Current engines in registry: {list(_project_engines.keys())}")
 
+    _synced_indexes.discard(db_path_str)
+    from .shards import dispose_shard_engines
+
+    dispose_shard_engines(db_path)
     if db_path_str in _project_engines:
         engine = _project_engines.pop(db_path_str)
         # Force dispose all connections
@@ -93,6 +124,10 @@ def dispose_all_engines() -> None:
         engine.dispose()
         logger.debug(f"Disposed engine: {db_path}")
     _project_engines.clear()
+    _synced_indexes.clear()
+    from .shards import dispose_shard_engines
+
+    dispose_shard_engines()
 
 
 # -----------------------------------------------------------------------------
@@ -129,6 +164,31 @@ def init_project_db(db_path: Path) -> None:
     engine = _get_or_create_engine(db_path)
     Base.metadata.create_all(bind=engine)
 
+    db_path_str = _normalize_db_path(db_path)
+    if db_path_str not in _synced_indexes:
+        sync_indexes(engine)
+        _synced_indexes.add(db_path_str)
+
+
+def sync_indexes(engine: Engine) -> None:
+    """Create model indexes missing from existing tables and drop retired ones.
+
+    ``create_all`` only creates indexes together with a new table, so project
+    databases created before an index revision would never get its indexes.
+    """
+    with engine.begin() as conn:
+        existing = set(
+            conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'").scalars()
+        )
+        for name in sorted(RETIRED_INDEXES & existing):
+            conn.exec_driver_sql(f'DROP INDEX "{name}"')
+            logger.info(f"Dropped retired index {name}")
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(conn)
+                    logger.info(f"Created index {index.name} on {table.name}")
+
 
 def init_db() -> None:
     """Backward-compatible initializer used by legacy startup code."""
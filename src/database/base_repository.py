@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Generic, Optional, Type, TypeVar
+from typing import Dict, Generic, Iterable, Optional, Type, TypeVar
 
 from sqlalchemy.orm import Session
 
 ModelT = TypeVar("ModelT")
 
+# IDs per ``IN (...)`` query, below SQLite's bound parameter limit
+IN_QUERY_CHUNK = 900
+
 
 class BaseRepository(Generic[ModelT]):
     """Provides common CRUD helpers for repositories."""
@@ -27,6 +30,19 @@ def create(self, **kwargs) -> ModelT:
     def get_by_id(self, pk: int) -> Optional[ModelT]:
         return self.session.query(self.model).filter(self.model.id == pk).first()
 
+    def get_names(self, ids: Iterable[int]) -> Dict[int, str]:
+        """``{id: name}`` of the given rows, for models with a ``name`` column."""
+        ids = sorted({pk for pk in ids if pk is not None})
+        names: Dict[int, str] = {}
+        for start in range(0, len(ids), IN_QUERY_CHUNK):
+            chunk = ids[start : start + IN_QUERY_CHUNK]
+            names.update(
+                self.session.query(self.model.id, self.model.name)
+                .filter(self.model.id.in_(chunk))
+                .all()
+            )
+        return names
+
     def delete(self, instance: ModelT) -> None:
         self.session.delete(instance)
         self.session.commit()
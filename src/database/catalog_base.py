@@ -2,6 +2,8 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 
+from .query_profile import profile_engine
+
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 DATA_DIR.mkdir(exist_ok=True)
 
@@ -9,10 +11,12 @@
 
 CatalogBase = declarative_base()
 
-_catalog_engine = create_engine(
-    f"sqlite:///{CATALOG_DB_PATH}",
-    echo=False,
-    connect_args={"check_same_thread": False},
+_catalog_engine = profile_engine(
+    create_engine(
+        f"sqlite:///{CATALOG_DB_PATH}",
+        echo=False,
+        connect_args={"check_same_thread": False},
+    )
 )
 CatalogSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_catalog_engine)
 
@@ -0,0 +1,183 @@
+"""Index audit: capture SQLite query plans for the statements an app run executes.
+
+The auditor listens to ``before_cursor_execute`` on every engine and, the first
+time it sees a statement fingerprint, runs ``EXPLAIN QUERY PLAN`` for it with the
+same parameters on the same connection. Plans that scan a table without an index
+(``SCAN table``) or sort through a temporary B-tree are flagged, together with
+the repository/service call site that issued the statement.
+
+Run it over the test suite (the report is written when the session ends):
+
+    RPS_INDEX_AUDIT=data/index_audit.json python -m pytest -q
+
+or around any block of code:
+
+    auditor = IndexAuditor()
+    auditor.install()
+    ...
+    auditor.uninstall()
+    print(auditor.format_report())
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .query_profile import fingerprint
+
+_AUDITED = re.compile(r"^\s*(?:WITH|SELECT|UPDATE|DELETE)\b", re.I)
+_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+_SRC_DIR = str(Path(__file__).resolve().parents[1])
+_SKIPPED_FRAMES = {
+    str(Path(__file__).resolve()),
+    str(Path(__file__).resolve().parent / "session.py"),
+}
+
+
+@dataclass
+class PlanRecord:
+    """Query plan of one statement fingerprint."""
+
+    fingerprint: str
+    plan: List[str]
+    count: int = 1
+    error: Optional[str] = None
+    origins: List[str] = field(default_factory=list)
+
+    @property
+    def full_scans(self) -> List[str]:
+        """Tables read without an index."""
+        tables = []
+        for line in self.plan:
+            match = _SCAN.match(line.strip())
+            if match and "USING" not in line and match.group(1) != "CONSTANT":
+                tables.append(match.group(1))
+        return tables
+
+    @property
+    def temp_btree(self) -> bool:
+        return any("USE TEMP B-TREE" in line for line in self.plan)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "origins": self.origins,
+            "plan": self.plan,
+            "full_scans": self.full_scans,
+            "temp_btree": self.temp_btree,
+            "error": self.error,
+        }
+
+
+class IndexAuditor:
+    """Records ``EXPLAIN QUERY PLAN`` output per statement fingerprint."""
+
+    MAX_ORIGINS = 5
+
+    def __init__(self) -> None:
+        self._records: Dict[str, PlanRecord] = {}
+        self._lock = threading.Lock()
+        self._targets: List[Any] = []
+
+    def install(self, target: Any = Engine) -> None:
+        """Audit one engine, or every engine (the default)."""
+        if target in self._targets:
+            return
+        event.listen(target, "before_cursor_execute", self._before_execute)
+        self._targets.append(target)
+
+    def uninstall(self) -> None:
+        for target in self._targets:
+            event.remove(target, "before_cursor_execute", self._before_execute)
+        self._targets.clear()
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if executemany or not _AUDITED.match(statement):
+            return
+        key = fingerprint(statement)
+        origin = _call_site()
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None:
+                record.count += 1
+                known = origin is None or origin in record.origins
+                if not known and len(record.origins) < self.MAX_ORIGINS:
+                    record.origins.append(origin)
+                return
+
+        plan: List[str] = []
+        error = None
+        explain = cursor.connection.cursor()
+        try:
+            explain.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+            plan = [row[-1] for row in explain.fetchall()]
+        except Exception as exc:  # Plans are best effort; the real statement still runs
+            error = str(exc)
+        finally:
+            explain.close()
+
+        with self._lock:
+            self._records.setdefault(
+                key,
+                PlanRecord(key, plan, error=error, origins=[origin] if origin else []),
+            )
+
+    # ===== Reporting =====
+
+    def records(self) -> List[PlanRecord]:
+        """Audited statements, full scans first, then by execution count."""
+        with self._lock:
+            items = list(self._records.values())
+        return sorted(items, key=lambda record: (not record.full_scans, -record.count))
+
+    def report(self) -> Dict[str, Any]:
+        records = self.records()
+        return {
+            "statements": len(records),
+            "with_full_scans": sum(1 for record in records if record.full_scans),
+            "with_temp_btree": sum(1 for record in records if record.temp_btree),
+            "records": [record.as_dict() for record in records],
+        }
+
+    def write_report(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+        return path
+
+    def format_report(self, limit: int = 20) -> str:
+        """Readable summary of the statements that scan tables without an index."""
+        records = self.records()
+        scanning = [record for record in records if record.full_scans]
+        lines = [f"Index audit: {len(records)} statements, {len(scanning)} with full table scans"]
+        for record in scanning[:limit]:
+            lines.append(
+                f"- scans {', '.join(sorted(set(record.full_scans)))} "
+                f"(x{record.count}) at {', '.join(record.origins) or 'unknown'}"
+            )
+            lines.append(f"    {record.fingerprint[:200]}")
+        return "\n".join(lines)
+
+
+def _call_site() -> Optional[str]:
+    """Innermost application frame (under src/) outside the database plumbing."""
+    for frame in reversed(traceback.extract_stack(limit=40)):
+        filename = frame.filename
+        if not filename.startswith(_SRC_DIR) or filename in _SKIPPED_FRAMES:
+            continue
+        relative = Path(filename).relative_to(_SRC_DIR).as_posix()
+        return f"{relative}:{frame.lineno} {frame.name}"
+    return None
+
+
+__all__ = ["IndexAuditor", "PlanRecord"]
@@ -40,7 +40,10 @@
     AbsoluteMaxMinDrift,
     ElementResultsCache,
     JointResultsCache,
+    CacheSummary,
+    ElementPeak,
     TimeSeriesGlobalCache,
+    ResponseSpectrumCache,
     # Pushover
     PushoverCase,
     PushoverCurvePoint,
@@ -73,7 +76,10 @@
     "AbsoluteMaxMinDrift",
     "ElementResultsCache",
     "JointResultsCache",
+    "CacheSummary",
+    "ElementPeak",
     "TimeSeriesGlobalCache",
+    "ResponseSpectrumCache",
     "PushoverCase",
     "PushoverCurvePoint",
 ]
@@ -44,7 +44,10 @@
     AbsoluteMaxMinDrift,
     ElementResultsCache,
     JointResultsCache,
+    CacheSummary,
+    ElementPeak,
     TimeSeriesGlobalCache,
+    ResponseSpectrumCache,
 )
 
 # Pushover models
@@ -85,7 +88,10 @@
     "AbsoluteMaxMinDrift",
     "ElementResultsCache",
     "JointResultsCache",
+    "CacheSummary",
+    "ElementPeak",
     "TimeSeriesGlobalCache",
+    "ResponseSpectrumCache",
     # Pushover
     "PushoverCase",
     "PushoverCurvePoint",
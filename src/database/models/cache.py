@@ -1,4 +1,5 @@
-"""Cache models: GlobalResultsCache, ElementResultsCache, JointResultsCache, TimeSeriesGlobalCache, AbsoluteMaxMinDrift."""
+"""Cache models: GlobalResultsCache, ElementResultsCache, JointResultsCache, CacheSummary, ElementPeak,
+TimeSeriesGlobalCache, ResponseSpectrumCache, AbsoluteMaxMinDrift."""
 
 from sqlalchemy import (
     Column,
@@ -43,9 +44,10 @@ class GlobalResultsCache(Base):
     # Relationships
     result_set = relationship("ResultSet", back_populates="cache_entries")
 
-    # Composite index for fast lookups
+    # Composite index for fast lookups. Project databases hold a single project, so
+    # lookups lead with result_set_id; story_sort_order serves the ordered table reads.
     __table_args__ = (
-        Index("ix_cache_lookup", "project_id", "result_set_id", "result_type"),
+        Index("ix_cache_set_type_order", "result_set_id", "result_type", "story_sort_order"),
         Index("ix_cache_lookup_project_type", "project_id", "result_type"),
         Index("ix_cache_story", "story_id"),
     )
@@ -123,9 +125,9 @@ class ElementResultsCache(Base):
     # Relationships
     result_set = relationship("ResultSet")
 
-    # Composite index for fast lookups
+    # Composite index for fast lookups (result_set_id first, see GlobalResultsCache)
     __table_args__ = (
-        Index("ix_elem_cache_lookup", "project_id", "result_set_id", "result_type", "element_id"),
+        Index("ix_elem_cache_set_type", "result_set_id", "result_type", "element_id"),
         Index("ix_elem_cache_project_type", "project_id", "result_type"),
         Index("ix_elem_cache_element", "element_id"),
         Index("ix_elem_cache_story", "story_id"),
@@ -163,9 +165,9 @@ class JointResultsCache(Base):
     # Relationships
     result_set = relationship("ResultSet")
 
-    # Composite index for fast lookups
+    # Composite index for fast lookups (result_set_id first, see GlobalResultsCache)
     __table_args__ = (
-        Index("ix_joint_cache_lookup", "project_id", "result_set_id", "result_type"),
+        Index("ix_joint_cache_set_type", "result_set_id", "result_type"),
         Index("ix_joint_cache_project_type", "project_id", "result_type"),
         Index("ix_joint_cache_unique", "project_id", "result_set_id", "result_type", "unique_name", unique=True),
     )
@@ -174,6 +176,96 @@ def __repr__(self):
         return f"<JointResultsCache(project_id={self.project_id}, type='{self.result_type}', unique='{self.unique_name}')>"
 
 
+class CacheSummary(Base):
+    """Summary statistics of the wide-format cache rows of one result type.
+
+    Written by ``CacheBuilder`` next to the cache rows so dataset builders do
+    not recompute them on every read. One row per result set, cache table
+    ('global', 'element' or 'joint'), result type, direction (global caches
+    hold both directions in one matrix) and element (element caches only).
+    Values are raw cache values, before any display multiplier.
+    Format:
+        row_stats: {"<story_id or unique_name>": [avg, max, min], ...}
+        column_max / column_min: {"TH01": 0.0023, ...}
+    """
+
+    __tablename__ = "cache_summaries"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    result_set_id = Column(Integer, ForeignKey("result_sets.id"), nullable=False)
+    cache_kind = Column(String(20), nullable=False)  # 'global', 'element', 'joint'
+    result_type = Column(String(50), nullable=False)  # Cache result type, e.g. 'WallShears_V2'
+    direction = Column(String(20), nullable=False, default="")  # 'X'/'Y' for global caches
+    element_id = Column(Integer, ForeignKey("elements.id"), nullable=True)
+
+    row_stats = Column(JSON, nullable=False)
+    column_max = Column(JSON, nullable=False)
+    column_min = Column(JSON, nullable=False)
+    min_value = Column(Float, nullable=True)  # Across all rows and load cases (colour scaling)
+    max_value = Column(Float, nullable=True)
+
+    # Metadata
+    last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index(
+            "ix_cache_summary_lookup",
+            "result_set_id",
+            "cache_kind",
+            "result_type",
+            "element_id",
+            "direction",
+        ),
+    )
+
+    def __repr__(self):
+        return f"<CacheSummary(result_set={self.result_set_id}, kind='{self.cache_kind}', type='{self.result_type}', dir='{self.direction}', element_id={self.element_id})>"
+
+
+class ElementPeak(Base):
+    """Peak values of one element for an element cache result type.
+
+    Written next to the element cache rows (see ``processing.cache_summary.element_peaks``)
+    so governing-element queries rank and filter elements through the indexes
+    below instead of reading every results matrix. One row per result set,
+    cache result type and element. Values are raw cache values, before any
+    display multiplier; each has the story where it occurs.
+    """
+
+    __tablename__ = "element_peaks"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    result_set_id = Column(Integer, ForeignKey("result_sets.id"), nullable=False)
+    result_type = Column(String(50), nullable=False)  # Cache result type, e.g. 'WallShears_V2'
+    element_id = Column(Integer, ForeignKey("elements.id"), nullable=False)
+
+    abs_avg = Column(Float, nullable=False)  # Largest |Avg| across load cases of any story
+    abs_avg_story_id = Column(Integer, ForeignKey("stories.id"), nullable=False)
+    abs_max = Column(Float, nullable=False)  # Largest |value| of any story and load case
+    abs_max_story_id = Column(Integer, ForeignKey("stories.id"), nullable=False)
+    max_value = Column(Float, nullable=False)
+    max_story_id = Column(Integer, ForeignKey("stories.id"), nullable=False)
+    min_value = Column(Float, nullable=False)
+    min_story_id = Column(Integer, ForeignKey("stories.id"), nullable=False)
+
+    # Metadata
+    last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Ranked (ORDER BY ... LIMIT) and range lookups per result set and type
+    __table_args__ = (
+        Index("ix_element_peak_set_type", "result_set_id", "result_type", "element_id"),
+        Index("ix_element_peak_abs_avg", "result_set_id", "result_type", "abs_avg"),
+        Index("ix_element_peak_abs_max", "result_set_id", "result_type", "abs_max"),
+        Index("ix_element_peak_max", "result_set_id", "result_type", "max_value"),
+        Index("ix_element_peak_min", "result_set_id", "result_type", "min_value"),
+    )
+
+    def __repr__(self):
+        return f"<ElementPeak(result_set={self.result_set_id}, type='{self.result_type}', element_id={self.element_id})>"
+
+
 class TimeSeriesGlobalCache(Base):
     """Cache for time-history global results optimized for animated visualization.
 
@@ -218,3 +310,46 @@ class TimeSeriesGlobalCache(Base):
 
     def __repr__(self):
         return f"<TimeSeriesGlobalCache(result_set={self.result_set_id}, case='{self.load_case_name}', type='{self.result_type}', dir='{self.direction}', story={self.story_id})>"
+
+
+class ResponseSpectrumCache(Base):
+    """Elastic response spectra of the base story acceleration of time-history records.
+
+    One row per record, direction and damping ratio. Pseudo-spectral
+    accelerations are stored in g as a JSON array matching ``periods``.
+    Computed by ``processing.response_spectrum.ResponseSpectrumBatch`` and
+    dropped when the record is re-imported.
+    """
+
+    __tablename__ = "response_spectrum_cache"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    result_set_id = Column(Integer, ForeignKey("result_sets.id"), nullable=False)
+    load_case_name = Column(String(100), nullable=False)  # e.g., 'TH02'
+    direction = Column(String(10), nullable=False)  # 'X' or 'Y'
+    damping_ratio = Column(Float, nullable=False)  # e.g., 0.05
+
+    periods = Column(JSON, nullable=False)  # Oscillator periods [s]
+    values = Column(JSON, nullable=False)  # Pseudo-spectral acceleration [g] per period
+    pga = Column(Float, nullable=True)  # Peak base acceleration [g]
+
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    result_set = relationship("ResultSet")
+
+    __table_args__ = (
+        Index(
+            "ix_spectrum_unique",
+            "result_set_id",
+            "direction",
+            "load_case_name",
+            "damping_ratio",
+            unique=True,
+        ),
+    )
+
+    def __repr__(self):
+        return f"<ResponseSpectrumCache(result_set={self.result_set_id}, case='{self.load_case_name}', dir='{self.direction}', damping={self.damping_ratio})>"
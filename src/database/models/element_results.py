@@ -39,7 +39,7 @@ class WallShear(Base):
     # Indexes
     __table_args__ = (
         Index("ix_wallshear_element_story_case", "element_id", "story_id", "load_case_id", "direction"),
-        Index("ix_wallshear_category", "result_category_id"),
+        Index("ix_wallshear_category_case", "result_category_id", "load_case_id"),
     )
 
     def __repr__(self):
@@ -76,7 +76,7 @@ class QuadRotation(Base):
     # Indexes
     __table_args__ = (
         Index("ix_quadrot_element_story_case", "element_id", "story_id", "load_case_id"),
-        Index("ix_quadrot_category", "result_category_id"),
+        Index("ix_quadrot_category_case", "result_category_id", "load_case_id"),
     )
 
     def __repr__(self):
@@ -113,7 +113,7 @@ class ColumnShear(Base):
     # Indexes
     __table_args__ = (
         Index("ix_colshear_element_story_case", "element_id", "story_id", "load_case_id", "direction"),
-        Index("ix_colshear_category", "result_category_id"),
+        Index("ix_colshear_category_case", "result_category_id", "load_case_id"),
     )
 
     def __repr__(self):
@@ -148,7 +148,7 @@ class ColumnAxial(Base):
     # Indexes
     __table_args__ = (
         Index("ix_colaxial_element_story_case", "element_id", "story_id", "load_case_id"),
-        Index("ix_colaxial_category", "result_category_id"),
+        Index("ix_colaxial_category_case", "result_category_id", "load_case_id"),
     )
 
     def __repr__(self):
@@ -182,7 +182,7 @@ class BraceAxial(Base):
     # Indexes
     __table_args__ = (
         Index("ix_braceaxial_element_story_case", "element_id", "story_id", "load_case_id"),
-        Index("ix_braceaxial_category", "result_category_id"),
+        Index("ix_braceaxial_category_case", "result_category_id", "load_case_id"),
     )
 
     def __repr__(self):
@@ -219,7 +219,7 @@ class ColumnRotation(Base):
     # Indexes
     __table_args__ = (
         Index("ix_colrot_element_story_case", "element_id", "story_id", "load_case_id", "direction"),
-        Index("ix_colrot_category", "result_category_id"),
+        Index("ix_colrot_category_case", "result_category_id", "load_case_id"),
     )
 
     def __repr__(self):
@@ -258,7 +258,7 @@ class BeamRotation(Base):
     # Indexes
     __table_args__ = (
         Index("ix_beamrot_element_story_case", "element_id", "story_id", "load_case_id"),
-        Index("ix_beamrot_category", "result_category_id"),
+        Index("ix_beamrot_category_case", "result_category_id", "load_case_id"),
     )
 
     def __repr__(self):
@@ -36,7 +36,7 @@ class StoryDrift(Base):
     # Indexes for fast querying
     __table_args__ = (
         Index("ix_drift_story_case", "story_id", "load_case_id", "direction"),
-        Index("ix_drift_category", "result_category_id"),
+        Index("ix_drift_category_case", "result_category_id", "load_case_id"),
     )
 
     def __repr__(self):
@@ -66,7 +66,7 @@ class StoryAcceleration(Base):
     # Indexes
     __table_args__ = (
         Index("ix_accel_story_case", "story_id", "load_case_id", "direction"),
-        Index("ix_accel_category", "result_category_id"),
+        Index("ix_accel_category_case", "result_category_id", "load_case_id"),
     )
 
     def __repr__(self):
@@ -97,7 +97,7 @@ class StoryForce(Base):
     # Indexes
     __table_args__ = (
         Index("ix_force_story_case", "story_id", "load_case_id", "direction"),
-        Index("ix_force_category", "result_category_id"),
+        Index("ix_force_category_case", "result_category_id", "load_case_id"),
     )
 
     def __repr__(self):
@@ -127,7 +127,7 @@ class StoryDisplacement(Base):
     # Indexes
     __table_args__ = (
         Index("ix_disp_story_case", "story_id", "load_case_id", "direction"),
-        Index("ix_disp_category", "result_category_id"),
+        Index("ix_disp_category_case", "result_category_id", "load_case_id"),
     )
 
     def __repr__(self):
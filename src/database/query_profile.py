@@ -0,0 +1,330 @@
+"""Opt-in SQL query profiling (RPS_SQL_PROFILE=1 or the Diagnostics dialog).
+
+Hooks SQLAlchemy's ``before_cursor_execute``/``after_cursor_execute`` events
+of the engines the application creates (``profile_engine``) and aggregates
+every statement by fingerprint (literals replaced by ``?``, parameter lists
+collapsed) under the logical operation running at the time: an import phase
+or export step timed by ``PhaseTimer``, or a ``@timed`` call such as a
+dataset load (see ``utils.timing.operation``).
+
+Per operation and fingerprint the profiler keeps the execution count, total,
+max and p95 time, and the rows reported by the cursor (DML row counts; SQLite
+reports none for SELECT). Two patterns are flagged as warnings in the JSON log:
+
+- slow statements, slower than RPS_SLOW_QUERY_MS (default 250 ms),
+- repeated statements, the same fingerprint executed RPS_REPEATED_QUERY_THRESHOLD
+  times (default 200) within one run of an operation, typical of per-row
+  ``get_or_create`` loops (N+1 queries).
+
+Profiling is off by default so statements pay no hook cost; engines are
+registered when created and the hooks are attached only while profiling is
+enabled (``set_query_profiling_enabled``).
+
+Usage:
+    from database.session import get_query_profiler, set_query_profiling_enabled
+
+    set_query_profiling_enabled(True)
+    for stats in get_query_profiler().snapshot():
+        print(stats.operation, stats.fingerprint, stats.count, stats.p95_ms)
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+import threading
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from utils.timing import current_operation
+
+logger = logging.getLogger(__name__)
+
+UNSCOPED_OPERATION = "(unscoped)"
+DEFAULT_SLOW_QUERY_MS = 250.0
+DEFAULT_REPEATED_QUERY_THRESHOLD = 200
+DURATION_SAMPLES = 1000  # Recent durations kept per fingerprint for the p95
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_ROWS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_SPACE = re.compile(r"\s+")
+
+
+def is_query_profiling_enabled() -> bool:
+    """Whether SQL profiling is on (set_query_profiling_enabled, else RPS_SQL_PROFILE=1)."""
+    if _enabled is not None:
+        return _enabled
+    value = os.environ.get("RPS_SQL_PROFILE", "")
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """Normalize a statement so executions differing only in literals group together.
+
+    >>> fingerprint("SELECT * FROM stories WHERE id IN (?, ?, ?) AND name = 'L1'")
+    'SELECT * FROM stories WHERE id IN (?) AND name = ?'
+    """
+    text = _SPACE.sub(" ", statement).strip()
+    text = _STRING.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _PARAM_LIST.sub("(?)", text)
+    return _VALUES_ROWS.sub("(?)", text)
+
+
+@dataclass
+class QueryStats:
+    """Aggregated executions of one statement fingerprint within one operation."""
+
+    operation: str
+    fingerprint: str
+    count: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    rows: int = 0
+    slow_count: int = 0
+    repeated: bool = False
+    durations: Deque[float] = field(default_factory=lambda: deque(maxlen=DURATION_SAMPLES))
+    # Executions within the current run of the operation, for repeated-query detection
+    invocation: Optional[int] = None
+    invocation_count: int = 0
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_s * 1000.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    @property
+    def p95_ms(self) -> float:
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)] * 1000.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "p95_ms": round(self.p95_ms, 3),
+            "max_ms": round(self.max_s * 1000.0, 3),
+            "rows": self.rows,
+            "slow_count": self.slow_count,
+            "repeated": self.repeated,
+        }
+
+
+class QueryProfiler:
+    """Collects per-operation statement statistics from SQLAlchemy engine events."""
+
+    def __init__(
+        self,
+        slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+        repeated_threshold: int = DEFAULT_REPEATED_QUERY_THRESHOLD,
+    ) -> None:
+        self.slow_query_s = slow_query_ms / 1000.0
+        self.repeated_threshold = repeated_threshold
+        self._stats: Dict[Tuple[str, str], QueryStats] = {}
+        self._lock = threading.Lock()
+        self._targets: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+    @classmethod
+    def from_env(cls) -> "QueryProfiler":
+        """Build a profiler with RPS_SLOW_QUERY_MS / RPS_REPEATED_QUERY_THRESHOLD thresholds."""
+        return cls(
+            slow_query_ms=_env_number("RPS_SLOW_QUERY_MS", DEFAULT_SLOW_QUERY_MS),
+            repeated_threshold=int(
+                _env_number("RPS_REPEATED_QUERY_THRESHOLD", DEFAULT_REPEATED_QUERY_THRESHOLD)
+            ),
+        )
+
+    # ===== Engine hooks =====
+
+    def install(self, target: Engine) -> None:
+        """Listen to cursor events of one engine."""
+        if target in self._targets:
+            return
+        event.listen(target, "before_cursor_execute", self._before_execute)
+        event.listen(target, "after_cursor_execute", self._after_execute)
+        event.listen(target, "handle_error", self._on_error)
+        self._targets.add(target)
+
+    def uninstall(self, target: Optional[Engine] = None) -> None:
+        """Stop listening to one engine, or to every engine it was installed on."""
+        targets = [target] if target is not None else list(self._targets)
+        for engine in targets:
+            if engine not in self._targets:
+                continue
+            event.remove(engine, "before_cursor_execute", self._before_execute)
+            event.remove(engine, "after_cursor_execute", self._after_execute)
+            event.remove(engine, "handle_error", self._on_error)
+            self._targets.discard(engine)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("rps_query_start", []).append(perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        starts = conn.info.get("rps_query_start")
+        if not starts:
+            return
+        duration = perf_counter() - starts.pop()
+        rows = max(getattr(cursor, "rowcount", -1) or 0, 0)
+        self.record(statement, duration, rows=rows, executemany=executemany)
+
+    def _on_error(self, context) -> None:
+        # A failed statement never reaches after_cursor_execute; drop its start time
+        connection = context.connection
+        starts = connection.info.get("rps_query_start") if connection is not None else None
+        if starts:
+            starts.pop()
+
+    # ===== Aggregation =====
+
+    def record(
+        self, statement: str, duration: float, rows: int = 0, executemany: bool = False
+    ) -> None:
+        """Add one statement execution to the stats of the current operation."""
+        scope = current_operation()
+        operation, invocation = scope if scope is not None else (UNSCOPED_OPERATION, None)
+        key = (operation, fingerprint(statement))
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = QueryStats(operation, key[1])
+            stats.count += 1
+            stats.total_s += duration
+            stats.max_s = max(stats.max_s, duration)
+            stats.rows += rows
+            stats.durations.append(duration)
+
+            slow = duration >= self.slow_query_s
+            if slow:
+                stats.slow_count += 1
+
+            if stats.invocation != invocation:
+                stats.invocation, stats.invocation_count = invocation, 0
+            stats.invocation_count += 1
+            repeated = (
+                not executemany
+                and invocation is not None
+                and stats.invocation_count == self.repeated_threshold
+                and not stats.repeated
+            )
+            if repeated:
+                stats.repeated = True
+
+        if slow:
+            logger.warning(
+                "Slow query",
+                extra={
+                    "operation": operation,
+                    "duration_ms": round(duration * 1000.0, 1),
+                    "rows": rows,
+                    "statement": key[1],
+                },
+            )
+        if repeated:
+            logger.warning(
+                "Repeated query (possible N+1)",
+                extra={
+                    "operation": operation,
+                    "executions": self.repeated_threshold,
+                    "statement": key[1],
+                },
+            )
+
+    def snapshot(self) -> List[QueryStats]:
+        """Copies of the collected stats, most total time first."""
+        with self._lock:
+            items = [
+                QueryStats(
+                    stats.operation,
+                    stats.fingerprint,
+                    count=stats.count,
+                    total_s=stats.total_s,
+                    max_s=stats.max_s,
+                    rows=stats.rows,
+                    slow_count=stats.slow_count,
+                    repeated=stats.repeated,
+                    durations=deque(stats.durations, maxlen=DURATION_SAMPLES),
+                )
+                for stats in self._stats.values()
+            ]
+        return sorted(items, key=lambda stats: stats.total_s, reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+def _env_number(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}")
+        return default
+
+
+_profiler: Optional[QueryProfiler] = None
+_enabled: Optional[bool] = None  # Runtime override of RPS_SQL_PROFILE
+# Engines created by the application, profiled while profiling is enabled
+_engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+
+def get_query_profiler() -> QueryProfiler:
+    """Return the application-wide profiler (created on first use)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = QueryProfiler.from_env()
+    return _profiler
+
+
+def profile_engine(engine: Engine) -> Engine:
+    """Register an application engine; it is profiled whenever profiling is enabled."""
+    _engines.add(engine)
+    if is_query_profiling_enabled():
+        get_query_profiler().install(engine)
+    return engine
+
+
+def set_query_profiling_enabled(enabled: bool) -> None:
+    """Turn profiling of the registered engines on or off at runtime."""
+    global _enabled
+    _enabled = bool(enabled)
+    profiler = get_query_profiler()
+    for engine in list(_engines):
+        if _enabled:
+            profiler.install(engine)
+        else:
+            profiler.uninstall(engine)
+
+
+__all__ = [
+    "QueryProfiler",
+    "QueryStats",
+    "fingerprint",
+    "get_query_profiler",
+    "is_query_profiling_enabled",
+    "profile_engine",
+    "set_query_profiling_enabled",
+]
@@ -19,6 +19,8 @@
     CacheRepository,
     ElementCacheRepository,
     JointCacheRepository,
+    CacheSummaryRepository,
+    ElementPeakRepository,
     AbsoluteMaxMinDriftRepository,
     ResultCategoryRepository,
 )
@@ -46,6 +48,8 @@
     "CacheRepository",
     "ElementCacheRepository",
     "JointCacheRepository",
+    "CacheSummaryRepository",
+    "ElementPeakRepository",
     "AbsoluteMaxMinDriftRepository",
     "ResultCategoryRepository",
     # Foundation
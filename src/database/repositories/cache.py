@@ -1,18 +1,28 @@
-"""Cache repositories for GlobalResultsCache, ElementResultsCache, JointResultsCache operations."""
+"""Cache repositories for GlobalResultsCache, ElementResultsCache, JointResultsCache, CacheSummary, ElementPeak operations."""
 
 from typing import List, Optional
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 
 from ..models import (
     GlobalResultsCache,
     ElementResultsCache,
     JointResultsCache,
+    CacheSummary,
+    ElementPeak,
     AbsoluteMaxMinDrift,
     ResultCategory,
     Story,
 )
 from ..base_repository import BaseRepository
 
+# ElementPeak value column -> column holding the story it occurs at
+PEAK_STORY_COLUMNS = {
+    "abs_avg": "abs_avg_story_id",
+    "abs_max": "abs_max_story_id",
+    "max_value": "max_story_id",
+    "min_value": "min_story_id",
+}
+
 
 class CacheRepository(BaseRepository[GlobalResultsCache]):
     """Repository for GlobalResultsCache operations - optimized for tabular display."""
@@ -136,6 +146,16 @@ def get_cache_for_display(
         ).all()
         return [cache for cache, _ in records]
 
+    def get_result_types(self, result_set_id: int) -> List[str]:
+        """Distinct global cache result types of a result set."""
+        rows = (
+            self.session.query(GlobalResultsCache.result_type)
+            .filter(GlobalResultsCache.result_set_id == result_set_id)
+            .distinct()
+            .all()
+        )
+        return sorted(result_type for (result_type,) in rows)
+
     def clear_cache_for_project(self, project_id: int, result_type: Optional[str] = None):
         """Clear cache entries for a project, optionally filtered by result type."""
         query = self.session.query(GlobalResultsCache).filter(
@@ -270,6 +290,53 @@ def get_cache_for_display(
         ).all()
         return [cache for cache, _ in records]
 
+    def get_cache_for_result_type(
+        self,
+        project_id: int,
+        result_type: str,
+        result_set_id: Optional[int] = None,
+    ) -> List[ElementResultsCache]:
+        """Get cache entries of every element for a result type in one query.
+
+        Entries are grouped by element and, within an element, ordered as
+        ``get_cache_for_display`` orders them.
+
+        Args:
+            project_id: Project ID
+            result_type: Result type (e.g., 'WallShears_V22')
+            result_set_id: Optional result set ID filter
+        """
+        query = (
+            self.session.query(ElementResultsCache, Story)
+            .join(Story, ElementResultsCache.story_id == Story.id)
+            .filter(
+                and_(
+                    ElementResultsCache.project_id == project_id,
+                    ElementResultsCache.result_type == result_type,
+                )
+            )
+        )
+
+        if result_set_id is not None:
+            query = query.filter(ElementResultsCache.result_set_id == result_set_id)
+
+        records = query.order_by(
+            ElementResultsCache.element_id,
+            ElementResultsCache.story_sort_order.desc(),
+            Story.name.desc(),
+        ).all()
+        return [cache for cache, _ in records]
+
+    def get_result_types(self, result_set_id: int) -> List[str]:
+        """Distinct element cache result types of a result set."""
+        rows = (
+            self.session.query(ElementResultsCache.result_type)
+            .filter(ElementResultsCache.result_set_id == result_set_id)
+            .distinct()
+            .all()
+        )
+        return sorted(result_type for (result_type,) in rows)
+
     def clear_cache_for_project(self, project_id: int, result_type: Optional[str] = None):
         """Clear cache entries for a project, optionally filtered by result type."""
         query = self.session.query(ElementResultsCache).filter(
@@ -332,6 +399,16 @@ def get_all_for_type(
             .all()
         )
 
+    def get_result_types(self, result_set_id: int) -> List[str]:
+        """Distinct joint cache result types of a result set."""
+        rows = (
+            self.session.query(JointResultsCache.result_type)
+            .filter(JointResultsCache.result_set_id == result_set_id)
+            .distinct()
+            .all()
+        )
+        return sorted(result_type for (result_type,) in rows)
+
     def upsert_cache_entry(
         self,
         project_id: int,
@@ -384,6 +461,195 @@ def replace_cache_entries(
         return len(entries)
 
 
+class CacheSummaryRepository(BaseRepository[CacheSummary]):
+    """Repository for summary statistics stored with the wide-format caches."""
+
+    model = CacheSummary
+
+    def get_summary(
+        self,
+        result_set_id: int,
+        cache_kind: str,
+        result_type: str,
+        direction: str = "",
+        element_id: Optional[int] = None,
+    ) -> Optional[CacheSummary]:
+        """Get the summary of one result type (and element, for element caches)."""
+        return (
+            self.session.query(CacheSummary)
+            .filter(
+                and_(
+                    CacheSummary.result_set_id == result_set_id,
+                    CacheSummary.cache_kind == cache_kind,
+                    CacheSummary.result_type == result_type,
+                    CacheSummary.element_id == element_id,
+                    CacheSummary.direction == direction,
+                )
+            )
+            .first()
+        )
+
+    def replace_summaries(
+        self,
+        project_id: int,
+        result_set_id: int,
+        cache_kind: str,
+        result_type: str,
+        summaries: List[dict],
+    ) -> int:
+        """Replace all summaries of a result type in a result set.
+
+        Each summary dict holds CacheSummary columns other than the identifying
+        ones (direction and element_id default to '' and None).
+        """
+        self.session.query(CacheSummary).filter(
+            and_(
+                CacheSummary.project_id == project_id,
+                CacheSummary.result_set_id == result_set_id,
+                CacheSummary.cache_kind == cache_kind,
+                CacheSummary.result_type == result_type,
+            )
+        ).delete(synchronize_session=False)
+
+        if summaries:
+            self.session.bulk_insert_mappings(
+                CacheSummary,
+                [
+                    {
+                        "direction": "",
+                        "element_id": None,
+                        **summary,
+                        "project_id": project_id,
+                        "result_set_id": result_set_id,
+                        "cache_kind": cache_kind,
+                        "result_type": result_type,
+                    }
+                    for summary in summaries
+                ],
+            )
+        self.session.commit()
+        return len(summaries)
+
+
+class ElementPeakRepository(BaseRepository[ElementPeak]):
+    """Repository for per-element peaks used by governing-element queries."""
+
+    model = ElementPeak
+
+    def has_current_peaks(self, result_set_id: int, result_type: str) -> bool:
+        """Whether peaks are stored and no element cache row changed after they were built."""
+        built = (
+            self.session.query(func.min(ElementPeak.last_updated))
+            .filter(
+                and_(
+                    ElementPeak.result_set_id == result_set_id,
+                    ElementPeak.result_type == result_type,
+                )
+            )
+            .scalar()
+        )
+        if built is None:
+            return False
+        cache_updated = (
+            self.session.query(func.max(ElementResultsCache.last_updated))
+            .filter(
+                and_(
+                    ElementResultsCache.result_set_id == result_set_id,
+                    ElementResultsCache.result_type == result_type,
+                )
+            )
+            .scalar()
+        )
+        return cache_updated is None or cache_updated <= built
+
+    def get_ranked(
+        self,
+        result_set_id: int,
+        result_type: str,
+        column: str,
+        largest: bool = True,
+        limit: Optional[int] = None,
+        threshold: Optional[float] = None,
+    ) -> List[tuple]:
+        """(element_id, value, story_id) rows ordered by a peak column.
+
+        Args:
+            result_set_id: Result set ID
+            result_type: Element cache result type (e.g., 'WallShears_V2')
+            column: ElementPeak value column ('abs_avg', 'abs_max', 'max_value', 'min_value')
+            largest: Order descending (ascending for minima)
+            limit: Optional maximum number of rows
+            threshold: Optional limit the value must reach (>= when ``largest``, else <=)
+        """
+        value = getattr(ElementPeak, column)
+        story = getattr(ElementPeak, PEAK_STORY_COLUMNS[column])
+        query = self.session.query(ElementPeak.element_id, value, story).filter(
+            and_(
+                ElementPeak.result_set_id == result_set_id,
+                ElementPeak.result_type == result_type,
+            )
+        )
+        if threshold is not None:
+            query = query.filter(value >= threshold if largest else value <= threshold)
+        query = query.order_by(value.desc() if largest else value.asc(), ElementPeak.element_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return [tuple(row) for row in query.all()]
+
+    def count_exceeding(
+        self,
+        result_set_id: int,
+        result_type: str,
+        column: str,
+        threshold: float,
+        largest: bool = True,
+    ) -> int:
+        """Number of elements whose peak column reaches ``threshold``."""
+        value = getattr(ElementPeak, column)
+        return (
+            self.session.query(ElementPeak.id)
+            .filter(
+                and_(
+                    ElementPeak.result_set_id == result_set_id,
+                    ElementPeak.result_type == result_type,
+                    value >= threshold if largest else value <= threshold,
+                )
+            )
+            .count()
+        )
+
+    def replace_peaks(
+        self,
+        project_id: int,
+        result_set_id: int,
+        result_type: str,
+        peaks: List[dict],
+    ) -> int:
+        """Replace all peaks of an element cache result type in a result set."""
+        self.session.query(ElementPeak).filter(
+            and_(
+                ElementPeak.result_set_id == result_set_id,
+                ElementPeak.result_type == result_type,
+            )
+        ).delete(synchronize_session=False)
+
+        if peaks:
+            self.session.bulk_insert_mappings(
+                ElementPeak,
+                [
+                    {
+                        **peak,
+                        "project_id": project_id,
+                        "result_set_id": result_set_id,
+                        "result_type": result_type,
+                    }
+                    for peak in peaks
+                ],
+            )
+        self.session.commit()
+        return len(peaks)
+
+
 class AbsoluteMaxMinDriftRepository(BaseRepository[AbsoluteMaxMinDrift]):
     """Repository for AbsoluteMaxMinDrift operations."""
 
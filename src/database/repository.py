@@ -26,6 +26,8 @@
     CacheRepository,
     ElementCacheRepository,
     JointCacheRepository,
+    CacheSummaryRepository,
+    ElementPeakRepository,
     AbsoluteMaxMinDriftRepository,
     ResultCategoryRepository,
     # Foundation
@@ -56,6 +58,8 @@
     "CacheRepository",
     "ElementCacheRepository",
     "JointCacheRepository",
+    "CacheSummaryRepository",
+    "ElementPeakRepository",
     "AbsoluteMaxMinDriftRepository",
     "ResultCategoryRepository",
     # Foundation
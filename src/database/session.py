@@ -23,10 +23,24 @@
     with thread_scoped_session(db_path) as session:
         # ... do work ...
 
+    # For rows of one result set (routed to its shard when it has one):
+    session = result_set_session_factory(db_path, result_set_id)()
+
     # For catalog database:
     from database.session import catalog_session_scope
     with catalog_session_scope() as session:
         # ... do work ...
+
+Query Profiling:
+    Opt-in (RPS_SQL_PROFILE=1 or ``set_query_profiling_enabled``); project,
+    shard and catalog engines are profiled while it is on. Statements are
+    grouped under the current ``query_operation`` scope; PhaseTimer phases and
+    ``@timed`` calls open one automatically. See ``database.query_profile``.
+
+        set_query_profiling_enabled(True)
+        with query_operation("rebuild_cache"):
+            ...
+        stats = get_query_profiler().snapshot()
 """
 
 from __future__ import annotations
@@ -34,7 +48,7 @@
 import logging
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, Iterator, Union
+from typing import Callable, Iterator, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -48,21 +62,40 @@
     PROJECTS_DIR,
     DATA_DIR,
 )
+from .shards import (
+    create_shard,
+    drop_shard,
+    get_shard_session,
+    has_shard,
+    list_shards,
+)
 from .catalog_base import (
     get_catalog_session,
     init_catalog_db,
     CATALOG_DB_PATH,
 )
+from .query_profile import (
+    QueryProfiler,
+    QueryStats,
+    get_query_profiler,
+    set_query_profiling_enabled,
+)
+from utils.timing import operation as query_operation
 
 logger = logging.getLogger(__name__)
 
 SessionFactory = Callable[[], Session]
+# Result set ID -> session factory for that result set's rows
+ResultSetSessionFactory = Callable[[int], SessionFactory]
 
 # Re-export commonly used items for single-source imports
 __all__ = [
     # Session factories
     "SessionFactory",
+    "ResultSetSessionFactory",
+    "ResultSetSessionScope",
     "project_session_factory",
+    "result_set_session_factory",
     "catalog_session_factory",
     # Context managers
     "session_scope",
@@ -76,10 +109,21 @@
     "dispose_all_engines",
     "PROJECTS_DIR",
     "DATA_DIR",
+    # Per-result-set shards
+    "create_shard",
+    "drop_shard",
+    "has_shard",
+    "list_shards",
     # Catalog database
     "get_catalog_session",
     "init_catalog_db",
     "CATALOG_DB_PATH",
+    # Query profiling
+    "QueryProfiler",
+    "QueryStats",
+    "get_query_profiler",
+    "query_operation",
+    "set_query_profiling_enabled",
 ]
 
 
@@ -93,6 +137,47 @@ def _factory() -> Session:
     return _factory
 
 
+def result_set_session_factory(db_path: Path, result_set_id: int) -> SessionFactory:
+    """Return a session factory for reading and writing one result set's rows.
+
+    Sessions open the result set's shard (with the project database attached)
+    when it has one, and the project database otherwise.
+    """
+
+    def _factory() -> Session:
+        init_project_db(db_path)
+        if has_shard(db_path, result_set_id):
+            return get_shard_session(db_path, result_set_id)
+        return get_project_session(db_path)
+
+    return _factory
+
+
+class ResultSetSessionScope:
+    """Mixin for services reading through short-lived, per-result-set sessions.
+
+    Subclasses set ``_session_factory`` (project database) and, optionally,
+    ``_result_set_session_factory`` (for example
+    ``ProjectContext.result_set_session_factory``), which routes the result and
+    cache rows of sharded result sets to their shard (see ``database.shards``).
+    """
+
+    _session_factory: SessionFactory
+    _result_set_session_factory: Optional[ResultSetSessionFactory] = None
+
+    @contextmanager
+    def _session_scope(self, result_set_id: Optional[int] = None) -> Iterator[Session]:
+        """Session closed on exit; pass ``result_set_id`` for one result set's rows."""
+        factory = self._session_factory
+        if result_set_id is not None and self._result_set_session_factory is not None:
+            factory = self._result_set_session_factory(result_set_id)
+        session = factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+
 def catalog_session_factory() -> SessionFactory:
     """Return a session factory for the catalog database."""
 
@@ -0,0 +1,282 @@
+"""Per-result-set shard databases.
+
+In the sharded layout each result set's normalized result rows and cache rows
+live in their own SQLite file next to the project database::
+
+    data/projects/160wil/160wil.db
+    data/projects/160wil/160wil_shards/rs3.db
+
+A shard engine opens the shard file as ``main`` and ``ATTACH``es the project
+database as ``project``. SQLite resolves unqualified table names through
+``main`` first and then through attached databases, so ``story_drifts`` and
+the cache tables resolve to the shard while ``result_categories``, ``stories``,
+``load_cases`` and the rest resolve to the project file. Repositories,
+importers and cache builders run unchanged on a shard session.
+
+Existing result sets are converted with :func:`move_to_shard` (``project_tools
+shard``). The project file keeps (empty) copies of the sharded tables, so
+sessions that are not routed through a shard see the result set as having no
+rows rather than failing. Deleting or replacing a sharded result set is a file operation
+(:func:`drop_shard`) instead of indexed DELETEs across the project tables.
+
+The project file is only locked while a shard transaction writes to it
+(categories, load cases, elements), so result sets can be imported into
+separate shards from separate workers.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from .base import Base, _normalize_db_path
+from .query_profile import profile_engine
+
+logger = logging.getLogger(__name__)
+
+# Tables whose rows belong to exactly one result set
+SHARD_TABLES = (
+    "story_drifts",
+    "story_accelerations",
+    "story_forces",
+    "story_displacements",
+    "wall_shears",
+    "quad_rotations",
+    "column_shears",
+    "column_axials",
+    "brace_axials",
+    "column_rotations",
+    "beam_rotations",
+    "soil_pressures",
+    "vertical_displacements",
+    "global_results_cache",
+    "absolute_maxmin_drifts",
+    "element_results_cache",
+    "joint_results_cache",
+    "cache_summaries",
+    "element_peaks",
+    "time_series_global_cache",
+    "response_spectrum_cache",
+)
+
+# Schema name of the project database inside a shard connection
+PROJECT_SCHEMA = "project"
+
+_SHARD_NAME = re.compile(r"^rs(\d+)\.db$")
+
+# Track shard engines per shard path for proper disposal
+_shard_engines: Dict[str, Engine] = {}
+
+
+def shard_dir(db_path: Path) -> Path:
+    """Directory holding the shards of a project database."""
+    return db_path.parent / f"{db_path.stem}_shards"
+
+
+def shard_path(db_path: Path, result_set_id: int) -> Path:
+    """Shard file of one result set (it may not exist)."""
+    return shard_dir(db_path) / f"rs{result_set_id}.db"
+
+
+def has_shard(db_path: Path, result_set_id: int) -> bool:
+    """Whether the result set is stored in its own shard."""
+    return shard_path(db_path, result_set_id).exists()
+
+
+def list_shards(db_path: Path) -> List[int]:
+    """Result set IDs that have a shard, ascending."""
+    directory = shard_dir(db_path)
+    if not directory.is_dir():
+        return []
+    ids = []
+    for path in directory.iterdir():
+        match = _SHARD_NAME.match(path.name)
+        if match:
+            ids.append(int(match.group(1)))
+    return sorted(ids)
+
+
+def _create_shard_engine(db_path: Path, path: Path) -> Engine:
+    engine = create_engine(
+        f"sqlite:///{path}",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=NullPool,
+    )
+    project_file = str(db_path.resolve())
+
+    @event.listens_for(engine, "connect")
+    def _attach_project(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"ATTACH DATABASE ? AS {PROJECT_SCHEMA}", (project_file,))
+        finally:
+            cursor.close()
+
+    return profile_engine(engine)
+
+
+def get_shard_engine(db_path: Path, result_set_id: int) -> Engine:
+    """Get or create the engine of an existing shard.
+
+    Raises:
+        FileNotFoundError: If the result set has no shard
+    """
+    path = shard_path(db_path, result_set_id)
+    key = _normalize_db_path(path)
+    if key in _shard_engines:
+        return _shard_engines[key]
+    if not path.exists():
+        raise FileNotFoundError(f"No shard for result set {result_set_id}: {path}")
+    engine = _create_shard_engine(db_path, path)
+    _shard_engines[key] = engine
+    return engine
+
+
+def get_shard_session(db_path: Path, result_set_id: int) -> Session:
+    """Session on a result set's shard with the project database attached."""
+    engine = get_shard_engine(db_path, result_set_id)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return SessionLocal()
+
+
+def create_shard(db_path: Path, result_set_id: int) -> Path:
+    """Create the (empty) shard of a result set; existing shards are kept.
+
+    Rows already stored for the result set in the project tables are not
+    moved; create the shard before importing into the result set.
+    """
+    path = shard_path(db_path, result_set_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    key = _normalize_db_path(path)
+    if key not in _shard_engines:
+        _shard_engines[key] = _create_shard_engine(db_path, path)
+    engine = _shard_engines[key]
+    tables = [Base.metadata.tables[name] for name in SHARD_TABLES]
+    Base.metadata.create_all(bind=engine, tables=tables)
+    logger.info(f"Created shard for result set {result_set_id}: {path}")
+    return path
+
+
+def dispose_shard_engine(db_path: Path, result_set_id: int) -> None:
+    """Close all connections to a shard."""
+    engine = _shard_engines.pop(_normalize_db_path(shard_path(db_path, result_set_id)), None)
+    if engine is not None:
+        engine.dispose()
+
+
+def dispose_shard_engines(db_path: Optional[Path] = None) -> None:
+    """Dispose the shard engines of one project database, or all of them."""
+    prefix = _normalize_db_path(shard_dir(db_path)) + "/" if db_path is not None else ""
+    for key in [key for key in _shard_engines if key.startswith(prefix)]:
+        _shard_engines.pop(key).dispose()
+
+
+def drop_shard(db_path: Path, result_set_id: int) -> bool:
+    """Delete a result set's shard file and its time-series store.
+
+    Returns:
+        True if a shard was deleted
+    """
+    from .time_series_store import TimeSeriesStore
+
+    path = shard_path(db_path, result_set_id)
+    dispose_shard_engine(db_path, result_set_id)
+    if not path.exists():
+        return False
+    for suffix in ("", "-journal", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+    shutil.rmtree(TimeSeriesStore.for_database(path).root, ignore_errors=True)
+    logger.info(f"Dropped shard for result set {result_set_id}: {path}")
+    return True
+
+
+def replace_shard(db_path: Path, result_set_id: int) -> Path:
+    """Replace a result set's shard with an empty one (re-import from scratch)."""
+    drop_shard(db_path, result_set_id)
+    return create_shard(db_path, result_set_id)
+
+
+def _result_set_filter(table_name: str) -> str:
+    """SQL predicate selecting one result set's rows (bound as ``:result_set_id``)."""
+    if "result_set_id" in Base.metadata.tables[table_name].c:
+        return "result_set_id = :result_set_id"
+    return (
+        f"result_category_id IN (SELECT id FROM {PROJECT_SCHEMA}.result_categories "
+        "WHERE result_set_id = :result_set_id)"
+    )
+
+
+def move_to_shard(db_path: Path, result_set_id: int) -> Dict[str, int]:
+    """Move a result set's rows from the project tables into a new shard.
+
+    Rows are copied and deleted in one transaction, so the result set is never
+    split across both files. Its time-series store moves with it.
+
+    Returns:
+        Number of rows moved per table (tables without rows are omitted)
+
+    Raises:
+        ValueError: If the result set already has a shard
+    """
+    from .time_series_store import TimeSeriesStore
+
+    if has_shard(db_path, result_set_id):
+        raise ValueError(f"Result set {result_set_id} already has a shard")
+
+    path = create_shard(db_path, result_set_id)
+    moved: Dict[str, int] = {}
+    params = {"result_set_id": result_set_id}
+    try:
+        engine = get_shard_engine(db_path, result_set_id)
+        quote = engine.dialect.identifier_preparer.quote
+        with engine.begin() as conn:
+            for name in SHARD_TABLES:
+                columns = ", ".join(quote(c.name) for c in Base.metadata.tables[name].columns)
+                where = _result_set_filter(name)
+                copied = conn.execute(
+                    text(
+                        f"INSERT INTO main.{name} ({columns}) "
+                        f"SELECT {columns} FROM {PROJECT_SCHEMA}.{name} WHERE {where}"
+                    ),
+                    params,
+                ).rowcount
+                conn.execute(text(f"DELETE FROM {PROJECT_SCHEMA}.{name} WHERE {where}"), params)
+                if copied:
+                    moved[name] = copied
+    except Exception:
+        drop_shard(db_path, result_set_id)
+        raise
+
+    source = TimeSeriesStore.for_database(db_path).root / f"rs{result_set_id}"
+    if source.is_dir():
+        target = TimeSeriesStore.for_database(path).root / f"rs{result_set_id}"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(source), str(target))
+    logger.info(f"Moved result set {result_set_id} into shard {path}: {moved}")
+    return moved
+
+
+__all__ = [
+    "SHARD_TABLES",
+    "PROJECT_SCHEMA",
+    "shard_dir",
+    "shard_path",
+    "has_shard",
+    "list_shards",
+    "get_shard_engine",
+    "get_shard_session",
+    "create_shard",
+    "dispose_shard_engine",
+    "dispose_shard_engines",
+    "drop_shard",
+    "replace_shard",
+    "move_to_shard",
+]
@@ -0,0 +1,319 @@
+"""Binary sidecar store for time-history global results.
+
+``TimeSeriesGlobalCache`` keeps one JSON row per story, which makes every
+load case switch in the animated view decode the whole record. The store keeps
+one contiguous ``stories x steps`` float32 matrix per (result set, load case,
+result type, direction) next to the project database:
+
+    <project>/<slug>_timeseries/rs<result_set_id>/<load_case>__<type>_<dir>/
+        manifest.json       story ids and the current array file names
+        values-<token>.npy  float32 (stories, steps), story_sort_order descending
+        time-<token>.npy    float64 (steps,)
+        lod-<token>.npy     float32 (2, stories, bins), min/max pyramid levels
+
+The manifest also carries each story's envelope (min/max over the record), so
+the view never reduces the full matrix, and the min/max level-of-detail
+pyramid lets long records be drawn at the resolution of the screen.
+
+Reads use ``np.load(mmap_mode="r")``, so the view gets a read-only memory map
+and only touches the pages it plots. The database stays the source of truth:
+records are written by the time-history importer and rebuilt from the cache
+rows when missing. Array files are versioned so a rewrite never has to replace
+a file that an open view still maps (Windows refuses that); the manifest is
+switched atomically and stale arrays are removed when no longer mapped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import uuid
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+# Each pyramid level reduces the previous one by LOD_FACTOR; levels stop once
+# a level has at most LOD_MIN_BINS bins (wider than any plot is drawn)
+LOD_FACTOR = 4
+LOD_MIN_BINS = 1024
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@dataclass
+class LodPyramid:
+    """Min/max reductions of a record's values by successive powers of ``LOD_FACTOR``.
+
+    Level ``i`` holds, per story, the min and max of every ``factors[i]``
+    consecutive steps. Drawing the coarsest level that still has a bin per
+    pixel keeps the number of plotted points near twice the plot width however
+    long the record is, without hiding any peak.
+    """
+
+    factors: List[int]
+    mins: List[np.ndarray]  # float32, shape (stories, bins) per level
+    maxs: List[np.ndarray]
+
+    @classmethod
+    def build(
+        cls, values: np.ndarray, factor: int = LOD_FACTOR, min_bins: int = LOD_MIN_BINS
+    ) -> "LodPyramid":
+        factors: List[int] = []
+        mins: List[np.ndarray] = []
+        maxs: List[np.ndarray] = []
+        low = high = np.asarray(values, dtype=np.float32)
+        while low.shape[1] > min_bins:
+            low = _reduce(low, factor, np.min)
+            high = _reduce(high, factor, np.max)
+            factors.append((factors[-1] if factors else 1) * factor)
+            mins.append(low)
+            maxs.append(high)
+        return cls(factors, mins, maxs)
+
+    def select_level(self, steps: int, pixels: int) -> int:
+        """Coarsest level with at least ``pixels`` bins across ``steps``; -1 for raw values."""
+        level = -1
+        for index, factor in enumerate(self.factors):
+            if steps / factor < pixels:
+                break
+            level = index
+        return level
+
+    def peak_series(
+        self,
+        row: int,
+        time_steps: np.ndarray,
+        values: np.ndarray,
+        start: int,
+        stop: int,
+        pixels: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Points that draw ``values[row, start:stop]`` across ``pixels`` pixels.
+
+        Returns the raw samples when they fit, otherwise the min and max of
+        each bin of the selected level, interleaved at the bin start time.
+        """
+        level = self.select_level(stop - start, pixels)
+        if level < 0:
+            return np.asarray(time_steps[start:stop]), np.asarray(values[row, start:stop])
+        factor = self.factors[level]
+        first, last = start // factor, -(-stop // factor)
+        peaks = np.column_stack(
+            [self.mins[level][row, first:last], self.maxs[level][row, first:last]]
+        )
+        bin_times = np.asarray(time_steps)[np.arange(first, last) * factor]
+        return np.repeat(bin_times, 2), peaks.ravel()
+
+
+@dataclass
+class TimeSeriesRecord:
+    """Time series of all stories for one load case, result type and direction."""
+
+    story_ids: List[int]
+    time_steps: np.ndarray  # float64, shape (steps,)
+    values: np.ndarray  # float32, shape (stories, steps); memory-mapped when read from disk
+    envelope_min: Optional[np.ndarray] = None  # float32, shape (stories,)
+    envelope_max: Optional[np.ndarray] = None
+    lod: Optional[LodPyramid] = None
+
+
+def summarize(record: TimeSeriesRecord) -> TimeSeriesRecord:
+    """Record with its LOD pyramid and per-story envelopes filled in."""
+    if record.lod is not None and record.envelope_min is not None:
+        return record
+    lod = LodPyramid.build(record.values)
+    if record.values.shape[1] == 0:
+        low = high = np.full((record.values.shape[0], 1), np.nan, dtype=np.float32)
+    else:
+        # The coarsest level already holds the extremes of every step
+        low = lod.mins[-1] if lod.factors else record.values
+        high = lod.maxs[-1] if lod.factors else record.values
+    return replace(
+        record,
+        envelope_min=np.min(low, axis=1).astype(np.float32),
+        envelope_max=np.max(high, axis=1).astype(np.float32),
+        lod=lod,
+    )
+
+
+def stack_series(
+    story_ids: Sequence[int],
+    time_steps: Sequence[Sequence[float]],
+    values: Sequence[Sequence[float]],
+) -> Optional[TimeSeriesRecord]:
+    """Stack per-story series into one record.
+
+    Shorter series are padded with their last value and the time axis is
+    extended with its last step, so every story has the same number of steps.
+
+    Args:
+        story_ids: Story of each series, in display order
+        time_steps: Time axis of each series (the first one is used)
+        values: Values of each series
+    """
+    if not values:
+        return None
+
+    steps = max(len(series) for series in values)
+    matrix = np.empty((len(values), steps), dtype=np.float32)
+    for row, series in enumerate(values):
+        length = len(series)
+        matrix[row, :length] = series
+        if length < steps:
+            matrix[row, length:] = series[-1] if length else np.nan
+
+    time = np.asarray(time_steps[0] if time_steps else [], dtype=np.float64)
+    if len(time) < steps:
+        dt = time[-1] - time[-2] if len(time) > 1 else 0.01
+        start = time[-1] if len(time) else 0.0
+        time = np.concatenate([time, start + dt * np.arange(1, steps - len(time) + 1)])
+
+    return TimeSeriesRecord(story_ids=list(story_ids), time_steps=time[:steps], values=matrix)
+
+
+class TimeSeriesStore:
+    """Memory-mapped time series records under one directory."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    @classmethod
+    def for_database(cls, db_path: Path) -> "TimeSeriesStore":
+        db_path = Path(db_path)
+        return cls(db_path.parent / f"{db_path.stem}_timeseries")
+
+    @classmethod
+    def for_session(cls, session: Session) -> Optional["TimeSeriesStore"]:
+        """Store next to the session's database file; None for in-memory databases."""
+        database = session.get_bind().url.database
+        if not database or database == ":memory:":
+            return None
+        return cls.for_database(Path(database))
+
+    def record_dir(
+        self, result_set_id: int, load_case_name: str, result_type: str, direction: str
+    ) -> Path:
+        name = f"{load_case_name}__{result_type}_{direction}"
+        safe = _UNSAFE.sub("_", name)
+        if safe != name:
+            # Keep distinct names distinct after sanitising
+            safe = f"{safe}-{hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]}"
+        return self.root / f"rs{result_set_id}" / safe
+
+    def read(
+        self, result_set_id: int, load_case_name: str, result_type: str, direction: str
+    ) -> Optional[TimeSeriesRecord]:
+        """Open a record as read-only memory maps; None when missing or unreadable."""
+        directory = self.record_dir(result_set_id, load_case_name, result_type, direction)
+        manifest_path = directory / MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("version") != STORE_VERSION:
+                return None
+            values = np.load(directory / manifest["values"], mmap_mode="r")
+            time_steps = np.load(directory / manifest["time"], mmap_mode="r")
+            levels = np.load(directory / manifest["lod"], mmap_mode="r")
+            offsets = manifest["lod_offsets"]
+            lod = LodPyramid(
+                factors=manifest["lod_factors"],
+                mins=[levels[0, :, a:b] for a, b in zip(offsets, offsets[1:])],
+                maxs=[levels[1, :, a:b] for a, b in zip(offsets, offsets[1:])],
+            )
+            envelope_min = np.asarray(manifest["envelope_min"], dtype=np.float32)
+            envelope_max = np.asarray(manifest["envelope_max"], dtype=np.float32)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning(f"Ignoring unreadable time series record {directory}: {exc}")
+            return None
+        stories = len(manifest["story_ids"])
+        if values.shape != (stories, len(time_steps)) or levels.shape[:2] != (2, stories):
+            logger.warning(f"Ignoring time series record {directory} with mismatched shapes")
+            return None
+        return TimeSeriesRecord(
+            manifest["story_ids"], time_steps, values, envelope_min, envelope_max, lod
+        )
+
+    def write(
+        self,
+        result_set_id: int,
+        load_case_name: str,
+        result_type: str,
+        direction: str,
+        record: TimeSeriesRecord,
+    ) -> Path:
+        """Write a record with its envelopes and LOD pyramid and switch the manifest to it."""
+        record = summarize(record)
+        directory = self.record_dir(result_set_id, load_case_name, result_type, direction)
+        directory.mkdir(parents=True, exist_ok=True)
+        token = uuid.uuid4().hex[:12]
+        widths = [level.shape[1] for level in record.lod.mins]
+        manifest = {
+            "version": STORE_VERSION,
+            "story_ids": [int(story_id) for story_id in record.story_ids],
+            "values": f"values-{token}.npy",
+            "time": f"time-{token}.npy",
+            "lod": f"lod-{token}.npy",
+            "lod_factors": record.lod.factors,
+            "lod_offsets": [0, *np.cumsum(widths, dtype=int).tolist()],
+            "envelope_min": record.envelope_min.tolist(),
+            "envelope_max": record.envelope_max.tolist(),
+        }
+        levels = np.empty((2, len(record.story_ids), sum(widths)), dtype=np.float32)
+        for index, (a, b) in enumerate(zip(manifest["lod_offsets"], manifest["lod_offsets"][1:])):
+            levels[0, :, a:b] = record.lod.mins[index]
+            levels[1, :, a:b] = record.lod.maxs[index]
+        np.save(directory / manifest["values"], np.asarray(record.values, dtype=np.float32))
+        np.save(directory / manifest["time"], np.asarray(record.time_steps, dtype=np.float64))
+        np.save(directory / manifest["lod"], levels)
+
+        staging = directory / f"{MANIFEST_NAME}.{token}"
+        staging.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(staging, directory / MANIFEST_NAME)
+        _remove_stale_arrays(
+            directory, keep={manifest["values"], manifest["time"], manifest["lod"]}
+        )
+        return directory
+
+    def delete(
+        self, result_set_id: int, load_case_name: str, result_type: str, direction: str
+    ) -> None:
+        """Drop a record so the next read falls back to the database."""
+        directory = self.record_dir(result_set_id, load_case_name, result_type, direction)
+        (directory / MANIFEST_NAME).unlink(missing_ok=True)
+        _remove_stale_arrays(directory, keep=set())
+
+    def delete_result_set(self, result_set_id: int) -> None:
+        shutil.rmtree(self.root / f"rs{result_set_id}", ignore_errors=True)
+
+
+def _reduce(values: np.ndarray, factor: int, reducer) -> np.ndarray:
+    """Reduce every ``factor`` consecutive columns; the last bin is padded with its edge."""
+    pad = -values.shape[1] % factor
+    if pad:
+        values = np.pad(values, ((0, 0), (0, pad)), mode="edge")
+    return reducer(values.reshape(values.shape[0], -1, factor), axis=2)
+
+
+def _remove_stale_arrays(directory: Path, keep: set) -> None:
+    for path in directory.glob("*.npy"):
+        if path.name in keep:
+            continue
+        try:
+            path.unlink()
+        except OSError:
+            # Still mapped by an open view (Windows); removed by a later write
+            pass
+
+
+__all__ = ["LodPyramid", "TimeSeriesRecord", "TimeSeriesStore", "stack_series", "summarize"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from services.project_service import (
     ProjectContext,
@@ -11,7 +11,9 @@
     get_project_context,
     list_project_summaries,
 )
-from services.project_runtime import ProjectRuntime, build_project_runtime
+
+if TYPE_CHECKING:
+    from services.project_runtime import ProjectRuntime
 
 
 class ProjectController:
@@ -30,4 +32,7 @@ def delete_project(self, name: str) -> bool:
         return delete_project_context(name)
 
     def build_runtime(self, context: ProjectContext) -> ProjectRuntime:
+        # Deferred: the runtime pulls in pandas and the result services
+        from services.project_runtime import build_project_runtime
+
         return build_project_runtime(context)
@@ -14,6 +14,8 @@
     SheetConflictDialog,
 )
 from .settings import DiagnosticsDialog
+from .governing import GoverningElementsDialog
+from .acceptance import AcceptanceCriteriaDialog
 
 __all__ = [
     # Import dialogs
@@ -30,4 +32,7 @@
     'SheetConflictDialog',
     # Settings dialogs
     'DiagnosticsDialog',
+    # Result query dialogs
+    'GoverningElementsDialog',
+    'AcceptanceCriteriaDialog',
 ]
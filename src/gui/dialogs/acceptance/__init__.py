@@ -0,0 +1,7 @@
+"""Acceptance criteria dialog subpackage."""
+
+from .acceptance_dialog import AcceptanceCriteriaDialog
+
+__all__ = [
+    "AcceptanceCriteriaDialog",
+]
@@ -0,0 +1,266 @@
+"""Acceptance criteria dialog: edit limits and check every result set against them."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QCheckBox,
+    QComboBox,
+    QDialog,
+    QDoubleSpinBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QPushButton,
+    QSplitter,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from config.acceptance_criteria import ACCEPTANCE_LIMITS, DCR_COLORS, AcceptanceLimit, dcr_band
+from gui.settings_manager import settings
+from services.governing_elements import display_config
+from utils.error_handling import handle_worker_error
+
+logger = logging.getLogger(__name__)
+
+LIMIT_COLUMN = 2
+
+
+class AcceptanceWorker(QThread):
+    """Worker thread running one acceptance evaluation."""
+
+    finished = pyqtSignal(object, float)  # AcceptanceResult, elapsed seconds
+    error = pyqtSignal(str)
+
+    def __init__(self, service, result_set_ids: List[int], statistic: str):
+        super().__init__()
+        self.service = service
+        self.result_set_ids = result_set_ids
+        self.statistic = statistic
+
+    def run(self):
+        try:
+            start = time.perf_counter()
+            result = self.service.evaluate(self.result_set_ids, statistic=self.statistic)
+            self.finished.emit(result, time.perf_counter() - start)
+        except Exception as e:
+            self.error.emit(handle_worker_error(e, "Acceptance evaluation failed"))
+
+
+class AcceptanceCriteriaDialog(QDialog):
+    """Edit acceptance limits and list demand-to-capacity ratios per result set.
+
+    Limit edits are saved as settings overrides and re-evaluated right away;
+    demands stay cached in the service, so only the ratios are recomputed.
+
+    Args:
+        service: AcceptanceService of the project
+        result_sets: (id, name) of the result sets to offer
+    """
+
+    def __init__(self, service, result_sets: Sequence[Tuple[int, str]], parent=None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Acceptance Criteria")
+        self.setMinimumSize(1000, 600)
+        self._service = service
+        self._limits: Tuple[AcceptanceLimit, ...] = tuple(service.limits)
+        self._worker: Optional[AcceptanceWorker] = None
+        self._pending = False
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 16, 16, 16)
+        layout.setSpacing(12)
+
+        controls = QHBoxLayout()
+        controls.setSpacing(8)
+        controls.addWidget(QLabel("Demand"))
+        self.statistic_combo = QComboBox()
+        self.statistic_combo.addItem("Peak |value|", "peak")
+        self.statistic_combo.addItem("|Avg|", "mean")
+        self.statistic_combo.currentIndexChanged.connect(self.run_evaluation)
+        controls.addWidget(self.statistic_combo)
+
+        self.overlay_check = QCheckBox("Show limits in tables and plots")
+        self.overlay_check.setChecked(settings.acceptance_overlay_enabled)
+        self.overlay_check.toggled.connect(self._on_overlay_toggled)
+        controls.addWidget(self.overlay_check)
+        controls.addStretch()
+
+        self.reset_button = QPushButton("Reset Limits")
+        self.reset_button.clicked.connect(self.reset_limits)
+        controls.addWidget(self.reset_button)
+
+        self.run_button = QPushButton("Evaluate")
+        self.run_button.setObjectName("primaryAction")
+        self.run_button.clicked.connect(self.run_evaluation)
+        controls.addWidget(self.run_button)
+        layout.addLayout(controls)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+
+        left_panel = QWidget()
+        left_layout = QVBoxLayout(left_panel)
+        left_layout.setContentsMargins(0, 0, 0, 0)
+        self.limits_table = QTableWidget(0, 4)
+        self.limits_table.setHorizontalHeaderLabels(["Result Type", "Group", "Limit", "Unit"])
+        self.limits_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.limits_table.verticalHeader().setVisible(False)
+        self.limits_table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.ResizeToContents
+        )
+        left_layout.addWidget(self.limits_table, stretch=2)
+
+        self.result_set_list = QListWidget()
+        for result_set_id, name in result_sets:
+            item = QListWidgetItem(name)
+            item.setData(Qt.ItemDataRole.UserRole, result_set_id)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked)
+            self.result_set_list.addItem(item)
+        self.result_set_list.itemChanged.connect(self.run_evaluation)
+        left_layout.addWidget(self.result_set_list, stretch=1)
+        splitter.addWidget(left_panel)
+
+        table_panel = QWidget()
+        table_layout = QVBoxLayout(table_panel)
+        table_layout.setContentsMargins(0, 0, 0, 0)
+        self.status_label = QLabel("")
+        table_layout.addWidget(self.status_label)
+        self.table = QTableWidget()
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        table_layout.addWidget(self.table, stretch=1)
+        splitter.addWidget(table_panel)
+        splitter.setStretchFactor(0, 1)
+        splitter.setStretchFactor(1, 3)
+        layout.addWidget(splitter, stretch=1)
+
+        self._populate_limits()
+
+    def selected_result_set_ids(self) -> List[int]:
+        """IDs of the checked result sets."""
+        items = (self.result_set_list.item(row) for row in range(self.result_set_list.count()))
+        return [
+            item.data(Qt.ItemDataRole.UserRole)
+            for item in items
+            if item.checkState() == Qt.CheckState.Checked
+        ]
+
+    def limits(self) -> Tuple[AcceptanceLimit, ...]:
+        """Limits as currently edited."""
+        return self._limits
+
+    def set_limit(self, row: int, value: float) -> None:
+        """Change one limit, save the override and re-evaluate."""
+        limits = list(self._limits)
+        limits[row] = replace(limits[row], limit=value)
+        self._limits = tuple(limits)
+        self._save_overrides()
+        self.run_evaluation()
+
+    def reset_limits(self) -> None:
+        """Restore the default limits."""
+        self._limits = ACCEPTANCE_LIMITS
+        self._save_overrides()
+        self._populate_limits()
+        self.run_evaluation()
+
+    def run_evaluation(self, *_args) -> None:
+        """Evaluate the checked result sets in the background."""
+        if self._worker is not None and self._worker.isRunning():
+            self._pending = True
+            return
+        result_set_ids = self.selected_result_set_ids()
+        if not result_set_ids:
+            self.status_label.setText("Select at least one result set")
+            return
+
+        self._pending = False
+        self._service.set_limits(self._limits)
+        self.status_label.setText("Evaluating...")
+        self._worker = AcceptanceWorker(
+            self._service, result_set_ids, self.statistic_combo.currentData()
+        )
+        self._worker.finished.connect(self._on_finished)
+        self._worker.error.connect(self._on_error)
+        self._worker.start()
+
+    def populate(self, result, elapsed: float = 0.0) -> None:
+        """Fill the results table from an AcceptanceResult."""
+        frame = result.to_frame()
+        self.table.clear()
+        self.table.setColumnCount(len(frame.columns))
+        self.table.setRowCount(len(frame))
+        self.table.setHorizontalHeaderLabels([str(column) for column in frame.columns])
+        ratio_column = frame.columns.get_loc("Max D/C")
+        for row, values in enumerate(frame.itertuples(index=False)):
+            decimals = display_config(result.rows[row].result_type).decimal_places
+            for column, value in enumerate(values):
+                if value is None or value != value:  # None or NaN
+                    text = ""
+                elif column == ratio_column:
+                    text = f"{value:.2f}"
+                elif isinstance(value, float):
+                    text = f"{value:.{decimals}f}"
+                else:
+                    text = str(value)
+                item = QTableWidgetItem(text)
+                if column == ratio_column:
+                    band = dcr_band(value)
+                    if band is not None:
+                        item.setForeground(QColor(DCR_COLORS[band]))
+                self.table.setItem(row, column, item)
+
+        failing = sum(1 for row in result.rows if row.exceeding)
+        self.status_label.setText(
+            f"{len(result.rows)} checks, {failing} exceeding limits ({elapsed * 1000:.0f} ms)"
+        )
+
+    def _on_finished(self, result, elapsed: float) -> None:
+        if self._pending:
+            self.run_evaluation()
+            return
+        self.populate(result, elapsed)
+
+    def _on_error(self, message: str) -> None:
+        self._pending = False
+        self.status_label.setText(message)
+
+    def _populate_limits(self) -> None:
+        self.limits_table.setRowCount(len(self._limits))
+        for row, limit in enumerate(self._limits):
+            config = display_config(limit.result_type)
+            self.limits_table.setItem(row, 0, QTableWidgetItem(limit.result_type))
+            self.limits_table.setItem(row, 1, QTableWidgetItem(limit.element_group or "All"))
+            spin = QDoubleSpinBox()
+            spin.setRange(0.0, 1e9)
+            spin.setDecimals(config.decimal_places + 1)
+            spin.setValue(limit.limit)
+            spin.valueChanged.connect(lambda value, row=row: self.set_limit(row, value))
+            self.limits_table.setCellWidget(row, LIMIT_COLUMN, spin)
+            self.limits_table.setItem(row, 3, QTableWidgetItem(config.unit))
+
+    def _save_overrides(self) -> None:
+        defaults: Dict[str, float] = {limit.key: limit.limit for limit in ACCEPTANCE_LIMITS}
+        settings.acceptance_limits = {
+            limit.key: limit.limit
+            for limit in self._limits
+            if defaults.get(limit.key) != limit.limit
+        }
+
+    def _on_overlay_toggled(self, checked: bool) -> None:
+        settings.acceptance_overlay_enabled = checked
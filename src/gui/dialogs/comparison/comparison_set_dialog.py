@@ -24,12 +24,19 @@
 class ComparisonSetDialog(QDialog):
     """Dialog to create a new comparison set by selecting result sets and result types."""
 
-    def __init__(self, project_id: int, result_sets: list, session_factory, parent=None):
+    def __init__(
+        self,
+        project_id: int,
+        result_sets: list,
+        session_factory,
+        parent=None,
+        result_set_session_factory=None,
+    ):
         super().__init__(parent)
         self.project_id = project_id
         self.result_sets = result_sets  # List of ResultSet objects
         self.session_factory = session_factory
-        self._data_service = DataAccessService(session_factory)
+        self._data_service = DataAccessService(session_factory, result_set_session_factory)
 
         # Get available result types from the database via DataAccessService
         result_set_ids = [rs.id for rs in result_sets]
@@ -0,0 +1,7 @@
+"""Governing elements dialog subpackage."""
+
+from .governing_elements_dialog import GoverningElementsDialog
+
+__all__ = [
+    'GoverningElementsDialog',
+]
@@ -0,0 +1,233 @@
+"""Governing elements dialog: top-N and limit exceedance queries across result sets."""
+
+from __future__ import annotations
+
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QDialog,
+    QDoubleSpinBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QPushButton,
+    QSpinBox,
+    QSplitter,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from services.governing_elements import GOVERNING_METRICS, display_config
+from utils.error_handling import handle_worker_error
+
+logger = logging.getLogger(__name__)
+
+MODE_TOP = "top"
+MODE_EXCEEDING = "exceeding"
+MAX_EXCEEDANCE_ROWS = 5000
+
+
+class GoverningQueryWorker(QThread):
+    """Worker thread running one governing-element query."""
+
+    finished = pyqtSignal(object)  # GoverningResult
+    error = pyqtSignal(str)
+
+    def __init__(self, service, mode: str, result_type: str, result_set_ids: List[int],
+                 metric: str, count: int = 10, limit: float = 0.0):
+        super().__init__()
+        self.service = service
+        self.mode = mode
+        self.result_type = result_type
+        self.result_set_ids = result_set_ids
+        self.metric = metric
+        self.count = count
+        self.limit = limit
+
+    def run(self):
+        try:
+            if self.mode == MODE_TOP:
+                result = self.service.top_elements(
+                    self.result_type, self.result_set_ids, metric=self.metric, count=self.count
+                )
+            else:
+                result = self.service.exceedances(
+                    self.result_type,
+                    self.result_set_ids,
+                    self.limit,
+                    metric=self.metric,
+                    max_rows=MAX_EXCEEDANCE_ROWS,
+                )
+            self.finished.emit(result)
+        except Exception as e:
+            self.error.emit(handle_worker_error(e, "Governing elements query failed"))
+
+
+class GoverningElementsDialog(QDialog):
+    """List the governing elements of a result type, or those exceeding a limit.
+
+    Args:
+        service: GoverningElementsService of the project
+        result_sets: (id, name) of the result sets to offer
+    """
+
+    def __init__(self, service, result_sets: Sequence[Tuple[int, str]], parent=None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Governing Elements")
+        self.setMinimumSize(900, 560)
+        self._service = service
+        self._worker: Optional[GoverningQueryWorker] = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 16, 16, 16)
+        layout.setSpacing(12)
+
+        controls = QHBoxLayout()
+        controls.setSpacing(8)
+
+        controls.addWidget(QLabel("Result type"))
+        self.result_type_combo = QComboBox()
+        self.result_type_combo.currentTextChanged.connect(self._update_limit_suffix)
+        controls.addWidget(self.result_type_combo)
+
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItem("Top", MODE_TOP)
+        self.mode_combo.addItem("Exceeding", MODE_EXCEEDING)
+        self.mode_combo.currentIndexChanged.connect(self._update_mode)
+        controls.addWidget(self.mode_combo)
+
+        self.count_spin = QSpinBox()
+        self.count_spin.setRange(1, 10000)
+        self.count_spin.setValue(10)
+        controls.addWidget(self.count_spin)
+
+        self.limit_spin = QDoubleSpinBox()
+        self.limit_spin.setRange(-1e9, 1e9)
+        self.limit_spin.setDecimals(3)
+        controls.addWidget(self.limit_spin)
+
+        controls.addWidget(QLabel("by"))
+        self.metric_combo = QComboBox()
+        for metric in GOVERNING_METRICS.values():
+            self.metric_combo.addItem(metric.label, metric.key)
+        controls.addWidget(self.metric_combo)
+
+        controls.addStretch()
+
+        self.run_button = QPushButton("Run")
+        self.run_button.setObjectName("primaryAction")
+        self.run_button.clicked.connect(self.run_query)
+        controls.addWidget(self.run_button)
+        layout.addLayout(controls)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+
+        self.result_set_list = QListWidget()
+        for result_set_id, name in result_sets:
+            item = QListWidgetItem(name)
+            item.setData(Qt.ItemDataRole.UserRole, result_set_id)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked)
+            self.result_set_list.addItem(item)
+        splitter.addWidget(self.result_set_list)
+
+        table_panel = QWidget()
+        table_layout = QVBoxLayout(table_panel)
+        table_layout.setContentsMargins(0, 0, 0, 0)
+        self.status_label = QLabel("")
+        table_layout.addWidget(self.status_label)
+        self.table = QTableWidget()
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        table_layout.addWidget(self.table, stretch=1)
+        splitter.addWidget(table_panel)
+        splitter.setStretchFactor(0, 1)
+        splitter.setStretchFactor(1, 4)
+        layout.addWidget(splitter, stretch=1)
+
+        self.result_type_combo.addItems(self._service.result_types(self.selected_result_set_ids()))
+        self._update_mode()
+
+    def selected_result_set_ids(self) -> List[int]:
+        """IDs of the checked result sets."""
+        items = (self.result_set_list.item(row) for row in range(self.result_set_list.count()))
+        return [
+            item.data(Qt.ItemDataRole.UserRole)
+            for item in items
+            if item.checkState() == Qt.CheckState.Checked
+        ]
+
+    def run_query(self) -> None:
+        """Start the query for the current selection in the background."""
+        if self._worker is not None and self._worker.isRunning():
+            return
+        result_type = self.result_type_combo.currentText()
+        result_set_ids = self.selected_result_set_ids()
+        if not result_type or not result_set_ids:
+            self.status_label.setText("Select a result type and at least one result set")
+            return
+
+        self.run_button.setEnabled(False)
+        self.status_label.setText("Querying...")
+        self._worker = GoverningQueryWorker(
+            self._service,
+            self.mode_combo.currentData(),
+            result_type,
+            result_set_ids,
+            self.metric_combo.currentData(),
+            count=self.count_spin.value(),
+            limit=self.limit_spin.value(),
+        )
+        self._worker.finished.connect(self._on_finished)
+        self._worker.error.connect(self._on_error)
+        self._worker.start()
+
+    def _on_finished(self, result) -> None:
+        self.run_button.setEnabled(True)
+        self.populate(result)
+
+    def _on_error(self, message: str) -> None:
+        self.run_button.setEnabled(True)
+        self.status_label.setText(message)
+
+    def populate(self, result) -> None:
+        """Fill the table from a GoverningResult."""
+        frame = result.to_frame()
+        decimals = display_config(result.result_type).decimal_places
+        self.table.clear()
+        self.table.setColumnCount(len(frame.columns))
+        self.table.setRowCount(len(frame))
+        self.table.setHorizontalHeaderLabels([str(column) for column in frame.columns])
+        for row, values in enumerate(frame.itertuples(index=False)):
+            for column, value in enumerate(values):
+                text = f"{value:.{decimals}f}" if isinstance(value, float) else str(value)
+                self.table.setItem(row, column, QTableWidgetItem(text))
+
+        if self.mode_combo.currentData() == MODE_EXCEEDING:
+            status = f"{result.total} exceedances"
+            if result.total > len(frame):
+                status += f" (showing {len(frame)})"
+        else:
+            status = f"{len(frame)} governing elements"
+        if result.built_result_sets:
+            status += f". Indexed {len(result.built_result_sets)} result set(s)"
+        self.status_label.setText(status)
+
+    def _update_mode(self) -> None:
+        exceeding = self.mode_combo.currentData() == MODE_EXCEEDING
+        self.count_spin.setVisible(not exceeding)
+        self.limit_spin.setVisible(exceeding)
+
+    def _update_limit_suffix(self, result_type: str) -> None:
+        if result_type:
+            self.limit_spin.setSuffix(f" {display_config(result_type).unit}")
@@ -971,9 +971,14 @@ def _handle_existing_data_conflicts(
             if not result_set:
                 return {}
 
-            existing_by_task = get_existing_load_cases_by_task_for_result_set(
-                session, project.id, result_set.id
-            )
+            # A sharded result set keeps its rows in its shard
+            scoped = context.result_set_session_factory(result_set.id)()
+            try:
+                existing_by_task = get_existing_load_cases_by_task_for_result_set(
+                    scoped, project.id, result_set.id
+                )
+            finally:
+                scoped.close()
 
             result_type_filter = (
                 {label.strip().lower() for label in self.result_types if label.strip()}
@@ -9,6 +9,7 @@
 from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6.QtWidgets import QWidget
 
+from gui.settings_manager import settings
 from processing.import_preparation import ImportPreparationService, PrescanResult
 from services.project_service import ProjectContext
 from processing.folder_importer import TARGET_SHEETS
@@ -39,7 +40,10 @@ def run(self) -> None:  # pragma: no cover - executes in worker thread
             if self.result_types:
                 result_types_set = {rt.strip().lower() for rt in self.result_types}
 
-            service = ImportPreparationService(TARGET_SHEETS)
+            service = ImportPreparationService(
+                TARGET_SHEETS,
+                max_workers=settings.get("prescan_workers") or None,
+            )
             prescan = service.prescan_folder(
                 self.folder_path,
                 result_types_set,
@@ -132,6 +136,7 @@ def run(self) -> None:  # pragma: no cover - executes in worker thread
                     conflict_resolution=self.conflict_resolution,
                     prescan_result=self.prescan_result,
                     existing_data_resolution=self.existing_data_resolution,
+                    result_set_session_factory=self.context.result_set_session_factory,
                 )
                 stats = importer.import_all()
                 if hasattr(importer, "result_set_id"):
@@ -151,6 +156,7 @@ def run(self) -> None:  # pragma: no cover - executes in worker thread
                     file_summaries=(
                         self.prescan_result.file_summaries if self.prescan_result else None
                     ),
+                    result_set_session_factory=self.context.result_set_session_factory,
                 )
                 stats = importer.import_all()
                 if hasattr(importer, "result_set_id"):
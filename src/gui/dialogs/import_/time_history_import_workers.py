@@ -9,7 +9,7 @@
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from processing.time_history_parser import prescan_time_history_file
-from processing.time_history_importer import TimeHistoryImporter
+from processing.time_history_batch import TimeHistoryBatchImporter
 from utils.error_handling import handle_worker_error
 
 logger = logging.getLogger(__name__)
@@ -95,62 +95,36 @@ def run(self):
 
             session = self.session_factory()
             try:
-                importer = TimeHistoryImporter(
+                # Records are parsed in worker processes; this thread is the only DB writer
+                batch = TimeHistoryBatchImporter(
                     session,
                     self.project_id,
                     self.result_set_id,
                     progress_callback=self._on_progress,
                 )
-
-                total_count = 0
-                num_files = len(self.file_paths)
-
-                for idx, file_path in enumerate(self.file_paths):
-                    base_progress = int((idx / num_files) * 90) + 5
-                    self.progress.emit(f"Processing {file_path.name}...", base_progress, 100)
-
-                    # Check if this file's load case should be imported
-                    # based on conflict resolution
-                    try:
-                        info = prescan_time_history_file(file_path)
-                        load_case = info.get("load_case_name", "Unknown")
-                    except Exception:
-                        continue
-
-                    # Skip if load case not selected
-                    if load_case not in self.selected_load_cases:
-                        continue
-
-                    # Skip if conflict resolution says use different file
-                    if load_case in self.conflict_resolution:
-                        preferred_file = self.conflict_resolution[load_case]
-                        if preferred_file and str(file_path) != preferred_file:
-                            self.progress.emit(
-                                f"Skipping {file_path.name} (using {Path(preferred_file).name} for {load_case})",
-                                base_progress,
-                                100,
-                            )
-                            continue
-
-                    # Import this file
-                    count = importer.import_file(file_path, self.selected_load_cases)
-                    total_count += count
-
-                self.progress.emit("Committing to database...", 95, 100)
-                session.commit()
+                outcome = batch.import_files(
+                    self.file_paths,
+                    selected_load_cases=self.selected_load_cases,
+                    conflict_resolution=self.conflict_resolution,
+                )
+                total_count = outcome.total_count
             finally:
                 session.close()
 
+            if outcome.errors:
+                logger.warning("Time history import finished with errors: %s", "; ".join(outcome.errors))
+                if not outcome.imported:
+                    self.error.emit("Import failed:\n" + "\n".join(outcome.errors))
+                    return
+                self.progress.emit(f"{len(outcome.errors)} file(s) failed to import", 100, 100)
+
             self.finished.emit(total_count, self.result_set_id)
 
         except Exception as e:
             error_msg = handle_worker_error(e, "Import failed")
             self.error.emit(error_msg)
 
-    def _on_progress(self, percent: int, message: str):
-        """Forward progress to signal.
-
-        The importer calls this with (percent, message) format.
-        We convert to (message, current, total) for the signal.
-        """
+    def _on_progress(self, message: str, current: int, total: int):
+        """Map per-record progress onto the 5-95% range of the progress bar."""
+        percent = 5 + int(90 * current / total) if total else 95
         self.progress.emit(message, percent, 100)
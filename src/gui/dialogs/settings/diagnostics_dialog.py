@@ -1,27 +1,46 @@
-"""Simple diagnostics dialog to inspect structured logs."""
+"""Simple diagnostics dialog to inspect structured logs, metrics and SQL query stats."""
 
 from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, Iterable, List
 
 from PyQt6.QtCore import Qt, QUrl
 from PyQt6.QtGui import QDesktopServices
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
+    QCheckBox,
     QDialog,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QTabWidget,
     QTextEdit,
     QVBoxLayout,
+    QWidget,
 )
 
+from database.query_profile import (
+    QueryStats,
+    get_query_profiler,
+    is_query_profiling_enabled,
+    set_query_profiling_enabled,
+)
+from gui.settings_manager import settings
+from utils import metrics
 from utils.logging_utils import get_log_file_path
 
+QUERY_COLUMNS = ["Operation", "Statement", "Count", "Total ms", "p95 ms", "Max ms", "Rows", "Flags"]
+METRIC_COLUMNS = ["Metric", "Labels", "Type", "Value / Count", "Mean", "p95", "Max"]
+
 
 class DiagnosticsDialog(QDialog):
-    """Display the latest application logs for quick troubleshooting."""
+    """Display the latest application logs, metrics and SQL query stats for troubleshooting."""
 
     MAX_BYTES = 20000  # limit file read for responsiveness
 
@@ -36,6 +55,21 @@ def __init__(self, parent=None) -> None:
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
 
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self._build_logs_tab(), "Logs")
+        self.tabs.addTab(self._build_metrics_tab(), "Metrics")
+        self.tabs.addTab(self._build_queries_tab(), "SQL Queries")
+        layout.addWidget(self.tabs, stretch=1)
+
+        self.refresh_logs()
+        self.refresh_metrics()
+        self.refresh_queries()
+
+    def _build_logs_tab(self) -> QWidget:
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        layout.setSpacing(12)
+
         header = QLabel("Review recent log entries for troubleshooting.")
         header.setWordWrap(True)
         layout.addWidget(header)
@@ -66,8 +100,80 @@ def __init__(self, parent=None) -> None:
         self.status_label = QLabel()
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         layout.addWidget(self.status_label)
+        return tab
 
-        self.refresh_logs()
+    def _build_metrics_tab(self) -> QWidget:
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        layout.setSpacing(12)
+
+        header = QLabel(
+            "Counters, gauges and timings since startup (cache hits, import rows/s, "
+            "dataset build and phase durations in seconds). Rollups are appended to "
+            "metrics.jsonl next to the log file."
+        )
+        header.setWordWrap(True)
+        layout.addWidget(header)
+
+        controls = QHBoxLayout()
+
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.refresh_metrics)
+        controls.addWidget(refresh_btn)
+
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self.reset_metrics)
+        controls.addWidget(reset_btn)
+
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.metrics_table = _stats_table(METRIC_COLUMNS, stretch_column=0)
+        layout.addWidget(self.metrics_table, stretch=1)
+
+        self.metrics_status_label = QLabel()
+        self.metrics_status_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        layout.addWidget(self.metrics_status_label)
+        return tab
+
+    def _build_queries_tab(self) -> QWidget:
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        layout.setSpacing(12)
+
+        header = QLabel(
+            "SQL statements while profiling is on, grouped by operation (import phase, "
+            "dataset load, export step). Slow and repeated (possible N+1) queries are "
+            "also logged as warnings."
+        )
+        header.setWordWrap(True)
+        layout.addWidget(header)
+
+        controls = QHBoxLayout()
+
+        self.profiling_check = QCheckBox("Profile SQL queries")
+        self.profiling_check.setChecked(is_query_profiling_enabled())
+        self.profiling_check.toggled.connect(self.set_query_profiling)
+        controls.addWidget(self.profiling_check)
+
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.refresh_queries)
+        controls.addWidget(refresh_btn)
+
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self.reset_queries)
+        controls.addWidget(reset_btn)
+
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.query_table = _stats_table(QUERY_COLUMNS, stretch_column=1)
+        layout.addWidget(self.query_table, stretch=1)
+
+        self.query_status_label = QLabel()
+        self.query_status_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        layout.addWidget(self.query_status_label)
+        return tab
 
     def refresh_logs(self) -> None:
         """Load latest log file contents."""
@@ -84,6 +190,41 @@ def refresh_logs(self) -> None:
         size_kb = path.stat().st_size / 1024
         self.status_label.setText(f"{path} • {size_kb:.1f} KB • Refreshed {timestamp}")
 
+    def refresh_metrics(self) -> None:
+        """Reload the metrics table from the registry."""
+        rows = metrics_rows(metrics.get_registry().snapshot())
+        _fill_table(self.metrics_table, rows)
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        state = "" if metrics.is_enabled() else "Disabled (RPS_METRICS=0) • "
+        self.metrics_status_label.setText(f"{state}{len(rows)} metrics • Refreshed {timestamp}")
+
+    def reset_metrics(self) -> None:
+        metrics.get_registry().reset()
+        self.refresh_metrics()
+
+    def refresh_queries(self) -> None:
+        """Reload the SQL query stats table from the profiler."""
+        stats = get_query_profiler().snapshot()
+        _fill_table(self.query_table, query_stats_rows(stats), tooltip_column=1)
+
+        total_count = sum(item.count for item in stats)
+        total_ms = sum(item.total_ms for item in stats)
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        state = "" if is_query_profiling_enabled() else "Profiling off • "
+        self.query_status_label.setText(
+            f"{state}{total_count} queries • {total_ms:.0f} ms • Refreshed {timestamp}"
+        )
+
+    def reset_queries(self) -> None:
+        get_query_profiler().reset()
+        self.refresh_queries()
+
+    def set_query_profiling(self, enabled: bool) -> None:
+        """Turn SQL profiling on or off now and for the next start."""
+        set_query_profiling_enabled(enabled)
+        settings.sql_profiling_enabled = enabled
+        self.refresh_queries()
+
     def copy_log_path(self) -> None:
         QApplication.clipboard().setText(str(self._log_path))
 
@@ -105,3 +246,80 @@ def read_log_tail(path: Path, max_bytes: int = DiagnosticsDialog.MAX_BYTES) -> s
         data = fh.read()
 
     return data.decode("utf-8", errors="replace")
+
+
+def _stats_table(columns: List[str], stretch_column: int) -> QTableWidget:
+    table = QTableWidget(0, len(columns))
+    table.setHorizontalHeaderLabels(columns)
+    table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+    table.verticalHeader().setVisible(False)
+    table.horizontalHeader().setSectionResizeMode(stretch_column, QHeaderView.ResizeMode.Stretch)
+    return table
+
+
+def _fill_table(table: QTableWidget, rows: List[list], tooltip_column: int = -1) -> None:
+    table.setSortingEnabled(False)
+    table.setRowCount(len(rows))
+    for row_index, row in enumerate(rows):
+        for column, value in enumerate(row):
+            item = QTableWidgetItem()
+            item.setData(Qt.ItemDataRole.DisplayRole, value)
+            if column == tooltip_column:
+                item.setToolTip(str(value))
+            table.setItem(row_index, column, item)
+    table.setSortingEnabled(True)
+
+
+def metrics_rows(snapshot: Dict[str, List[Dict[str, Any]]]) -> List[list]:
+    """Table rows (see METRIC_COLUMNS) for a metrics registry snapshot."""
+
+    def labels(entry: Dict[str, Any]) -> str:
+        return ", ".join(f"{key}={value}" for key, value in entry["labels"].items())
+
+    def number(value: Any) -> Any:
+        return "" if value is None else round(value, 4)
+
+    rows = []
+    for kind in ("counters", "gauges"):
+        for entry in snapshot.get(kind, []):
+            rows.append(
+                [entry["name"], labels(entry), kind[:-1], number(entry["value"]), "", "", ""]
+            )
+    for entry in snapshot.get("histograms", []):
+        rows.append(
+            [
+                entry["name"],
+                labels(entry),
+                "histogram",
+                entry["count"],
+                number(entry["mean"]),
+                number(entry["p95"]),
+                number(entry["max"]),
+            ]
+        )
+    return rows
+
+
+def query_stats_rows(stats: Iterable[QueryStats]) -> List[list]:
+    """Table rows (see QUERY_COLUMNS) for profiler stats, in the given order."""
+    rows = []
+    for item in stats:
+        flags = []
+        if item.slow_count:
+            flags.append(f"slow ×{item.slow_count}")
+        if item.repeated:
+            flags.append("N+1")
+        rows.append(
+            [
+                item.operation,
+                item.fingerprint,
+                item.count,
+                round(item.total_ms, 1),
+                round(item.p95_ms, 2),
+                round(item.max_s * 1000.0, 2),
+                item.rows,
+                ", ".join(flags),
+            ]
+        )
+    return rows
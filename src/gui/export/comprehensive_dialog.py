@@ -364,7 +364,9 @@ def _get_selected_result_types(self) -> List[str]:
                 # Element type - need to expand with directions if applicable
                 # Use DataAccessService to get full type names
                 result_set_ids = [rs_id for rs_id, _ in self.available_result_sets]
-                data_service = DataAccessService(self.context.session)
+                data_service = DataAccessService(
+                    self.context.session, self.context.result_set_session_factory
+                )
                 element_full_types = data_service.get_available_element_types(result_set_ids)
 
                 # Find all variants of this base type
@@ -375,7 +377,9 @@ def _get_selected_result_types(self) -> List[str]:
                 # Joint type - need to expand with suffix (_Min, _Ux, _Uy, _Uz)
                 # Use DataAccessService to get full type names
                 result_set_ids = [rs_id for rs_id, _ in self.available_result_sets]
-                data_service = DataAccessService(self.context.session)
+                data_service = DataAccessService(
+                    self.context.session, self.context.result_set_session_factory
+                )
                 joint_full_types = data_service.get_available_joint_types(result_set_ids)
 
                 # Find all variants of this base type
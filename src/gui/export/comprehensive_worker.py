@@ -57,7 +57,9 @@ def _export_combined(self):
         skipped = []
 
         # Get result set names using DataAccessService
-        data_service = DataAccessService(self.context.session)
+        data_service = DataAccessService(
+            self.context.session, self.context.result_set_session_factory
+        )
         result_set_names = data_service.get_result_set_names(self.result_set_ids)
 
         # Generate single timestamp for this export
@@ -196,7 +198,9 @@ def _export_per_file(self):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Get result set names using DataAccessService
-        data_service = DataAccessService(self.context.session)
+        data_service = DataAccessService(
+            self.context.session, self.context.result_set_session_factory
+        )
         result_set_names = data_service.get_result_set_names(self.result_set_ids)
 
         if self.format_type == "excel":
@@ -211,7 +215,9 @@ def _export_excel_per_result_set(self, result_set_names, timestamp):
         import pandas as pd
 
         export_service = ExportService(self.context, self.result_service)
-        data_service = DataAccessService(self.context.session)
+        data_service = DataAccessService(
+            self.context.session, self.context.result_set_session_factory
+        )
 
         # Calculate total operations (one per result set)
         total_operations = len(self.result_set_ids)
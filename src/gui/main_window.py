@@ -1,6 +1,6 @@
 """Main application window."""
 
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
 from PyQt6.QtWidgets import (
     QMainWindow,
@@ -28,16 +28,19 @@
 from datetime import datetime
 from pathlib import Path
 
-from .import_dialog import ImportDialog
 from .window_utils import enable_dark_title_bar
-from .project_detail import ProjectDetailWindow
 from .project_grid_widget import ProjectGridWidget
+from .portfolio_page import PortfolioPage
 from .styles import COLORS
-from .dialogs.settings.diagnostics_dialog import DiagnosticsDialog
-from services.project_service import result_set_exists
 from .controllers.project_controller import ProjectController
 from utils.env import is_dev_mode
 
+# The project detail window and dialogs pull in pandas, pyqtgraph and the
+# result widgets; they are imported when first opened so the home page can
+# paint without them.
+if TYPE_CHECKING:
+    from .project_detail import ProjectDetailWindow
+
 
 class MainWindow(QMainWindow):
     """Main application window with menu, results browser, and visualization area."""
@@ -54,7 +57,7 @@ def __init__(self):
         self.current_project = None
 
         # Track open project detail windows {project_name: window}
-        self._project_windows: Dict[str, ProjectDetailWindow] = {}
+        self._project_windows: Dict[str, "ProjectDetailWindow"] = {}
 
         # Controller orchestrating project CRUD ops
         self.project_controller = ProjectController()
@@ -93,6 +96,8 @@ def _create_status_bar(self):
 
     def _show_diagnostics(self):
         """Open diagnostics dialog showing log output."""
+        from .dialogs.settings.diagnostics_dialog import DiagnosticsDialog
+
         dialog = DiagnosticsDialog(self)
         dialog.exec()
 
@@ -165,6 +170,7 @@ def _create_header(self, container_layout: QVBoxLayout):
         nav_items = [
             ("Home", self._show_home),
             ("Projects", self._show_projects),
+            ("Portfolio", self._show_portfolio),
             ("Doc", self._show_docs),
         ]
 
@@ -184,10 +190,12 @@ def _create_content_area(self, container_layout: QVBoxLayout):
         self.stack = QStackedWidget()
         self.home_page = self._build_home_page()
         self.projects_page = self._build_projects_page()
+        self.portfolio_page = PortfolioPage()
         self.docs_page = self._build_docs_page()
 
         self.stack.addWidget(self.home_page)
         self.stack.addWidget(self.projects_page)
+        self.stack.addWidget(self.portfolio_page)
         self.stack.addWidget(self.docs_page)
 
         container_layout.addWidget(self.stack, stretch=1)
@@ -323,6 +331,9 @@ def _set_active_nav(self, name: str):
         elif name == "Projects":
             self.stack.setCurrentWidget(self.projects_page)
             self._refresh_projects()
+        elif name == "Portfolio":
+            self.stack.setCurrentWidget(self.portfolio_page)
+            self.portfolio_page.ensure_loaded()
         elif name == "Doc":
             self.stack.setCurrentWidget(self.docs_page)
 
@@ -334,6 +345,10 @@ def _show_projects(self):
         """Navigate to projects page."""
         self._set_active_nav("Projects")
 
+    def _show_portfolio(self):
+        """Navigate to portfolio page."""
+        self._set_active_nav("Portfolio")
+
     def _show_docs(self):
         """Navigate to docs page."""
         self._set_active_nav("Doc")
@@ -386,6 +401,8 @@ def _open_project_detail(self, project_name: str):
             )
             return
 
+        from .project_detail import ProjectDetailWindow
+
         detail_window = ProjectDetailWindow(runtime, self)
         self._project_windows[project_name] = detail_window
 
@@ -485,6 +502,9 @@ def _on_create_project(self):
     def _on_import(self):
         """Handle import action."""
         from processing.data_importer import DataImporter
+        from services.project_service import result_set_exists
+
+        from .import_dialog import ImportDialog
 
         dialog = ImportDialog(self)
         if dialog.exec():
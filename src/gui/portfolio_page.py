@@ -0,0 +1,155 @@
+"""Portfolio page: peak results of every result set across all projects."""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Optional, Sequence
+
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QCheckBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QSizePolicy,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from utils.error_handling import handle_worker_error
+
+logger = logging.getLogger(__name__)
+
+
+class PortfolioWorker(QThread):
+    """Worker thread running a portfolio query (projects are queried in worker processes)."""
+
+    progress = pyqtSignal(str, int, int)  # project, done, total
+    finished = pyqtSignal(object)  # PortfolioResult
+    error = pyqtSignal(str)
+
+    def __init__(self, service, metrics: Optional[Sequence[str]] = None, refresh: bool = False):
+        super().__init__()
+        self.service = service
+        self.metrics = metrics
+        self.refresh = refresh
+
+    def run(self):
+        try:
+            result = self.service.query(
+                self.metrics, refresh=self.refresh, progress_callback=self.progress.emit
+            )
+            self.finished.emit(result)
+        except Exception as e:
+            self.error.emit(handle_worker_error(e, "Portfolio query failed"))
+
+
+class PortfolioPage(QWidget):
+    """Dashboard table of portfolio metrics, filled on first show and on refresh.
+
+    Args:
+        service_factory: Callable returning a PortfolioService; defaults to the
+            catalog-wide service with the shared answer cache
+    """
+
+    def __init__(self, service_factory: Optional[Callable[[], object]] = None, parent=None):
+        super().__init__(parent)
+        self._service_factory = service_factory
+        self._worker: Optional[PortfolioWorker] = None
+        self._loaded = False
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(24, 4, 24, 24)
+        layout.setSpacing(12)
+
+        title = QLabel("Portfolio")
+        title.setObjectName("pageHeadline")
+        layout.addWidget(title)
+
+        controls = QHBoxLayout()
+        controls.setSpacing(12)
+
+        self.refresh_button = QPushButton("Refresh")
+        self.refresh_button.setObjectName("primaryAction")
+        self.refresh_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        self.refresh_button.clicked.connect(self.refresh)
+        controls.addWidget(self.refresh_button)
+
+        self.ignore_cache_check = QCheckBox("Ignore cached answers")
+        self.ignore_cache_check.setToolTip("Re-query every project database")
+        controls.addWidget(self.ignore_cache_check)
+
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.status_label = QLabel("")
+        self.status_label.setObjectName("pageBodyText")
+        layout.addWidget(self.status_label)
+
+        self.table = QTableWidget()
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table, stretch=1)
+
+    def ensure_loaded(self) -> None:
+        """Run the first query (cached answers make revisits cheap)."""
+        if not self._loaded:
+            self.refresh()
+
+    def refresh(self) -> None:
+        """Start a portfolio query in the background."""
+        if self._worker is not None and self._worker.isRunning():
+            return
+        from services.portfolio import PortfolioService
+
+        service = self._service_factory() if self._service_factory else PortfolioService()
+        self._loaded = True
+        self.refresh_button.setEnabled(False)
+        self.status_label.setText("Querying projects...")
+
+        self._worker = PortfolioWorker(service, refresh=self.ignore_cache_check.isChecked())
+        self._worker.progress.connect(self._on_progress)
+        self._worker.finished.connect(self._on_finished)
+        self._worker.error.connect(self._on_error)
+        self._worker.start()
+
+    def _on_progress(self, project: str, done: int, total: int) -> None:
+        self.status_label.setText(f"Queried {project} ({done}/{total})")
+
+    def _on_finished(self, result) -> None:
+        self.refresh_button.setEnabled(True)
+        self.populate(result)
+
+    def _on_error(self, message: str) -> None:
+        self.refresh_button.setEnabled(True)
+        self.status_label.setText(message)
+
+    def populate(self, result) -> None:
+        """Fill the table from a PortfolioResult."""
+        frame = result.to_frame()
+        self.table.clear()
+        self.table.setColumnCount(len(frame.columns))
+        self.table.setRowCount(len(frame))
+        self.table.setHorizontalHeaderLabels([str(column) for column in frame.columns])
+        for row, values in enumerate(frame.itertuples(index=False)):
+            for column, value in enumerate(values):
+                if isinstance(value, float):
+                    text = "" if value != value else f"{value:.4g}"
+                else:
+                    text = "" if value is None else str(value)
+                self.table.setItem(row, column, QTableWidgetItem(text))
+
+        status = (
+            f"{len(frame)} result sets in {result.cached_projects + result.queried_projects} "
+            f"projects ({result.cached_projects} from cache)"
+        )
+        if result.errors:
+            failed = "; ".join(f"{name}: {error}" for name, error in result.errors.items())
+            status += f". Failed: {failed}"
+        self.status_label.setText(status)
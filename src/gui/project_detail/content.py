@@ -14,6 +14,7 @@
 from gui.result_views.comparison_view import ComparisonResultView
 from gui.result_views.pushover_curve_view import PushoverCurveView
 from gui.result_views.time_series_animated_view import TimeSeriesAnimatedView
+from gui.result_views.response_spectrum_view import ResponseSpectrumView
 from gui.maxmin_drifts_widget import MaxMinDriftsWidget
 from gui.all_rotations_widget import AllRotationsWidget
 from gui.soil_pressure_plot_widget import SoilPressurePlotWidget
@@ -38,6 +39,7 @@ class ContentArea:
     pushover_curve_view: PushoverCurveView
     time_series_view: TimeSeriesAnimatedView
     combined_responses_widget: CombinedResponsesWidget
+    response_spectrum_view: ResponseSpectrumView
     # Reporting view placeholder - set by window.py after ReportView is created
     _report_view_placeholder: Optional[QWidget] = None
 
@@ -62,6 +64,7 @@ def hide_all(self) -> None:
         self.pushover_curve_view.hide()
         self.time_series_view.hide()
         self.combined_responses_widget.hide()
+        self.response_spectrum_view.hide()
 
     def show_standard(self) -> None:
         self.hide_all()
@@ -103,6 +106,10 @@ def show_time_series(self) -> None:
         self.hide_all()
         self.time_series_view.show()
 
+    def show_response_spectrum(self) -> None:
+        self.hide_all()
+        self.response_spectrum_view.show()
+
     def show_combined_responses(self) -> CombinedResponsesWidget:
         self.hide_all()
         self.combined_responses_widget.show()
@@ -216,6 +223,10 @@ def build_content_area() -> ContentArea:
     combined_responses_widget.hide()
     layout.addWidget(combined_responses_widget)
 
+    response_spectrum_view = ResponseSpectrumView()
+    response_spectrum_view.hide()
+    layout.addWidget(response_spectrum_view)
+
     return ContentArea(
         widget=widget,
         content_title=content_title,
@@ -230,4 +241,5 @@ def build_content_area() -> ContentArea:
         pushover_curve_view=pushover_curve_view,
         time_series_view=time_series_view,
         combined_responses_widget=combined_responses_widget,
+        response_spectrum_view=response_spectrum_view,
     )
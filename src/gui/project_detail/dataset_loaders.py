@@ -22,6 +22,11 @@ def load_joint_dataset(window, result_type: str, result_set_id: int) -> None:
     view_loaders.load_joint_dataset(window, result_type, result_set_id, window.content_area)
 
 
+def refresh_acceptance_overlay(window) -> None:
+    """Redraw the shown results with the current acceptance limits."""
+    view_loaders.refresh_acceptance_overlay(window, window.content_area)
+
+
 def load_maxmin_dataset(window, result_set_id: int, base_result_type: str = "Drifts"):
     """Load and display absolute Max/Min drift results."""
     view_loaders.load_maxmin_dataset(window, result_set_id, window.content_area, base_result_type)
@@ -119,7 +124,9 @@ def create_comparison_set(window):
     from PyQt6.QtWidgets import QMessageBox
     from services.data_access import DataAccessService
 
-    data_service = window.data_service or DataAccessService(window.context.session)
+    data_service = window.data_service or DataAccessService(
+        window.context.session, window.context.result_set_session_factory
+    )
     result_sets = data_service.get_result_sets(window.project_id)
 
     if len(result_sets) < 2:
@@ -133,7 +140,13 @@ def create_comparison_set(window):
 
     from gui.ui_helpers import show_dialog_with_blur
     # Pass session_factory for DataAccessService usage
-    dialog = ComparisonSetDialog(window.project_id, result_sets, window.context.session, window)
+    dialog = ComparisonSetDialog(
+        window.project_id,
+        result_sets,
+        window.context.session,
+        window,
+        result_set_session_factory=window.context.result_set_session_factory,
+    )
     if show_dialog_with_blur(dialog, window) == QDialog.DialogCode.Accepted:
         data = dialog.get_comparison_data()
 
@@ -177,7 +190,9 @@ def get_available_result_types(window, result_sets):
     from services.data_access import DataAccessService
 
     available_types = {}
-    data_service = window.data_service or DataAccessService(window.context.session)
+    data_service = window.data_service or DataAccessService(
+        window.context.session, window.context.result_set_session_factory
+    )
 
     for result_set in result_sets:
         types_for_set = set()
@@ -48,7 +48,9 @@ def on_browser_selection_changed(
 
     data_service = getattr(window, "data_service", None)
     if data_service is None:
-        data_service = DataAccessService(window.context.session)
+        data_service = DataAccessService(
+            window.context.session, window.context.result_set_session_factory
+        )
 
     result_set = data_service.get_result_set_by_id(result_set_id) if result_set_id else None
     if result_set:
@@ -145,6 +147,8 @@ def on_browser_selection_changed(
                 load_case_name = None
             window.controller.update_selection(load_case_name=load_case_name)
             view_loaders.load_time_series_global(window, actual_direction, load_case_name, window.content_area)
+        elif result_type == "ResponseSpectrum":
+            view_loaders.load_response_spectrum(window, direction, window.content_area)
         elif element_id > 0:
             window.content_area.show_standard()
             view_loaders.load_element_dataset(window, element_id, result_type, direction, result_set_id, window.content_area)
@@ -178,7 +182,9 @@ def on_comparison_selected(
         if data_service is None:
             from services.data_access import DataAccessService
 
-            data_service = DataAccessService(window.context.session)
+            data_service = DataAccessService(
+                window.context.session, window.context.result_set_session_factory
+            )
 
         comparison_set = data_service.get_comparison_set_by_id(comparison_set_id)
 
@@ -269,7 +275,9 @@ def on_comparison_element_selected(
         if data_service is None:
             from services.data_access import DataAccessService
 
-            data_service = DataAccessService(window.context.session)
+            data_service = DataAccessService(
+                window.context.session, window.context.result_set_session_factory
+            )
 
         comparison_set = data_service.get_comparison_set_by_id(comparison_set_id)
 
@@ -21,7 +21,9 @@ def export_nltha_results(window):
     if not result_set_id:
         from services.data_access import DataAccessService
 
-        data_service = window.data_service or DataAccessService(window.context.session)
+        data_service = window.data_service or DataAccessService(
+            window.context.session, window.context.result_set_session_factory
+        )
         result_sets = data_service.get_result_sets(window.project_id)
         if result_sets:
             result_set_id = result_sets[0].id
@@ -53,7 +55,9 @@ def open_reporting(window):
     if not result_set_id:
         from services.data_access import DataAccessService
 
-        data_service = window.data_service or DataAccessService(window.context.session)
+        data_service = window.data_service or DataAccessService(
+            window.context.session, window.context.result_set_session_factory
+        )
         result_sets = data_service.get_result_sets(window.project_id)
         nltha_sets = [rs for rs in result_sets if getattr(rs, 'analysis_type', None) != 'Pushover']
         if nltha_sets:
@@ -76,7 +80,9 @@ def open_pushover_reporting(window):
     if not result_set_id:
         from services.data_access import DataAccessService
 
-        data_service = window.data_service or DataAccessService(window.context.session)
+        data_service = window.data_service or DataAccessService(
+            window.context.session, window.context.result_set_session_factory
+        )
         result_sets = data_service.get_result_sets(window.project_id)
         pushover_sets = [rs for rs in result_sets if getattr(rs, 'analysis_type', None) == 'Pushover']
         if pushover_sets:
@@ -90,6 +96,63 @@ def open_pushover_reporting(window):
     show_dialog_with_blur(dialog, window)
 
 
+def open_governing_elements(window):
+    """Open the governing elements dialog for all result sets of the project."""
+    from gui.dialogs import GoverningElementsDialog
+    from gui.ui_helpers import show_dialog_with_blur
+    from services.data_access import DataAccessService
+    from services.governing_elements import GoverningElementsService
+
+    data_service = window.data_service or DataAccessService(
+        window.context.session, window.context.result_set_session_factory
+    )
+    result_sets = data_service.get_result_sets(window.project_id)
+    if not result_sets:
+        from PyQt6.QtWidgets import QMessageBox
+        QMessageBox.warning(window, "No Data", "No result sets available in this project")
+        return
+
+    service = GoverningElementsService(
+        window.project_id,
+        window.context.session,
+        window.context.result_set_session_factory,
+    )
+    dialog = GoverningElementsDialog(
+        service, [(rs.id, rs.name) for rs in result_sets], parent=window
+    )
+    show_dialog_with_blur(dialog, window)
+
+
+def open_acceptance_criteria(window):
+    """Open the acceptance criteria dialog for all result sets of the project."""
+    from config.acceptance_criteria import ACCEPTANCE_LIMITS, apply_overrides
+    from gui.dialogs import AcceptanceCriteriaDialog
+    from gui.settings_manager import settings
+    from gui.ui_helpers import show_dialog_with_blur
+    from services.acceptance import AcceptanceService
+    from services.data_access import DataAccessService
+
+    data_service = window.data_service or DataAccessService(
+        window.context.session, window.context.result_set_session_factory
+    )
+    result_sets = data_service.get_result_sets(window.project_id)
+    if not result_sets:
+        from PyQt6.QtWidgets import QMessageBox
+        QMessageBox.warning(window, "No Data", "No result sets available in this project")
+        return
+
+    service = AcceptanceService(
+        window.project_id,
+        window.context.session,
+        window.context.result_set_session_factory,
+        limits=apply_overrides(ACCEPTANCE_LIMITS, settings.acceptance_limits),
+    )
+    dialog = AcceptanceCriteriaDialog(
+        service, [(rs.id, rs.name) for rs in result_sets], parent=window
+    )
+    show_dialog_with_blur(dialog, window)
+
+
 def export_pushover_results(window):
     """Export pushover results."""
     from gui.export import ComprehensiveExportDialog
@@ -99,7 +162,9 @@ def export_pushover_results(window):
     if not result_set_id:
         from services.data_access import DataAccessService
 
-        data_service = window.data_service or DataAccessService(window.context.session)
+        data_service = window.data_service or DataAccessService(
+            window.context.session, window.context.result_set_session_factory
+        )
         result_sets = data_service.get_result_sets(window.project_id)
         pushover_sets = [rs for rs in result_sets if getattr(rs, 'analysis_type', None) == 'Pushover']
         if pushover_sets:
@@ -31,6 +31,8 @@ def __init__(
         on_settings,
         on_open_reporting=None,
         on_open_pushover_reporting=None,
+        on_open_governing=None,
+        on_open_acceptance=None,
     ):
         super().__init__()
         self.setObjectName("projectHeader")
@@ -144,6 +146,18 @@ def __init__(
         self._context_right_separator = self._create_separator()
         layout.addWidget(self._context_right_separator)
 
+        if on_open_governing:
+            governing_btn = self._create_text_link_button("Governing Elements")
+            governing_btn.setToolTip("Find governing elements and limit exceedances across result sets")
+            governing_btn.clicked.connect(on_open_governing)
+            layout.addWidget(governing_btn)
+
+        if on_open_acceptance:
+            acceptance_btn = self._create_text_link_button("Acceptance Criteria")
+            acceptance_btn.setToolTip("Check results against acceptance limits")
+            acceptance_btn.clicked.connect(on_open_acceptance)
+            layout.addWidget(acceptance_btn)
+
         export_project_btn = self._create_text_link_button("Export Project")
         export_project_btn.setToolTip("Export complete project to Excel")
         export_project_btn.clicked.connect(on_export_project)
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+from config.acceptance_criteria import ACCEPTANCE_LIMITS, apply_overrides, resolve_limit
 from config.analysis_types import AnalysisType
+from gui.settings_manager import settings
 
 if TYPE_CHECKING:
     from ..window import ProjectDetailWindow
@@ -13,3 +15,21 @@
 def _is_pushover_context(window: "ProjectDetailWindow") -> bool:
     """Check if the current analysis context is Pushover."""
     return window.controller.get_active_context() == AnalysisType.PUSHOVER
+
+
+def _acceptance_limit(
+    window: "ProjectDetailWindow",
+    result_type: str,
+    direction: Optional[str] = None,
+    element_id: Optional[int] = None,
+) -> Optional[float]:
+    """Acceptance limit to draw over a dataset (None when overlays are off or no limit applies)."""
+    if not settings.acceptance_overlay_enabled:
+        return None
+    element_name = None
+    if element_id is not None and window.data_service is not None:
+        element = window.data_service.get_element_by_id(element_id)
+        element_name = element.name if element else None
+    limits = apply_overrides(ACCEPTANCE_LIMITS, settings.acceptance_limits)
+    key = f"{result_type}_{direction}" if direction else result_type
+    return resolve_limit(limits, key, element_name)
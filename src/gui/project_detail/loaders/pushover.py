@@ -16,7 +16,9 @@ def _get_data_service(window: "ProjectDetailWindow"):
     if data_service is None:
         from services.data_access import DataAccessService
 
-        data_service = DataAccessService(window.context.session)
+        data_service = DataAccessService(
+            window.context.session, window.context.result_set_session_factory
+        )
     return data_service
 
 
@@ -6,6 +6,7 @@
 from typing import TYPE_CHECKING
 
 from utils.error_handling import log_exception
+from .common import _acceptance_limit
 
 if TYPE_CHECKING:
     from ..window import ProjectDetailWindow
@@ -35,7 +36,11 @@ def load_standard_dataset(
             return
 
         area.content_title.setText(f"> {dataset.meta.display_name}")
-        area.standard_view.set_dataset(dataset, shorthand_mapping=shorthand_mapping)
+        area.standard_view.set_dataset(
+            dataset,
+            shorthand_mapping=shorthand_mapping,
+            acceptance_limit=_acceptance_limit(window, result_type, direction),
+        )
 
         story_count = len(dataset.data.index)
         window.statusBar().showMessage(
@@ -78,7 +83,11 @@ def load_element_dataset(
 
         area.content_title.setText(f"> {dataset.meta.display_name}")
         logger.debug("Passing mapping to standard_view: %s", shorthand_mapping is not None)
-        area.standard_view.set_dataset(dataset, shorthand_mapping=shorthand_mapping)
+        area.standard_view.set_dataset(
+            dataset,
+            shorthand_mapping=shorthand_mapping,
+            acceptance_limit=_acceptance_limit(window, result_type, direction, element_id),
+        )
 
         story_count = len(dataset.data.index)
         window.statusBar().showMessage(
@@ -117,7 +126,11 @@ def load_joint_dataset(
 
         area.content_title.setText(f"> {dataset.meta.display_name}")
         logger.debug("Passing mapping to standard_view: %s", shorthand_mapping is not None)
-        area.standard_view.set_dataset(dataset, shorthand_mapping=shorthand_mapping)
+        area.standard_view.set_dataset(
+            dataset,
+            shorthand_mapping=shorthand_mapping,
+            acceptance_limit=_acceptance_limit(window, result_type),
+        )
 
         element_count = len(dataset.data.index)
         window.statusBar().showMessage(
@@ -130,6 +143,17 @@ def load_joint_dataset(
         log_exception(exc, "Error loading data")
 
 
+def refresh_acceptance_overlay(window: "ProjectDetailWindow", area: "ContentArea") -> None:
+    """Redraw the shown standard dataset with the current acceptance limit."""
+    dataset = area.standard_view.dataset
+    if dataset is None:
+        return
+    element_id = window.controller.selection.element_id or None
+    area.standard_view.set_acceptance_limit(
+        _acceptance_limit(window, dataset.meta.result_type, dataset.meta.direction, element_id)
+    )
+
+
 def load_maxmin_dataset(
     window: "ProjectDetailWindow",
     result_set_id: int,
@@ -4,7 +4,9 @@
 
 from typing import TYPE_CHECKING
 
-from utils.error_handling import log_exception
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from utils.error_handling import handle_worker_error, log_exception
 
 if TYPE_CHECKING:
     from ..window import ProjectDetailWindow
@@ -25,7 +27,6 @@ def load_time_series_global(
         load_case_name: Name of the load case to display (e.g., 'TH02')
         area: Content area to display in
     """
-    import numpy as np
     from gui.result_views.time_series_animated_view import TimeSeriesPlotData
 
     try:
@@ -37,7 +38,9 @@ def load_time_series_global(
         if data_service is None:
             from services.data_access import DataAccessService
 
-            data_service = DataAccessService(window.context.session)
+            data_service = DataAccessService(
+                window.context.session, window.context.result_set_session_factory
+            )
 
         # Use specified load case or fall back to first available
         if not load_case_name:
@@ -58,9 +61,9 @@ def load_time_series_global(
         stories = data_service.get_stories(window.project_id)
         story_lookup = {s.id: s.name for s in stories}
 
-        # Helper function to build TimeSeriesPlotData from cache entries
+        # Helper function to build TimeSeriesPlotData from the (memory-mapped) record
         def build_plot_data(result_type: str, unit: str) -> TimeSeriesPlotData | None:
-            entries = data_service.get_time_series_entries(
+            record = data_service.get_time_series_record(
                 window.project_id,
                 result_set_id,
                 current_load_case,
@@ -68,55 +71,24 @@ def build_plot_data(result_type: str, unit: str) -> TimeSeriesPlotData | None:
                 direction,
             )
 
-            if not entries:
+            if record is None:
                 return None
 
-            story_names = []
-            values_list = []
-            time_steps = None
-
-            for entry in entries:
-                story_name = story_lookup.get(entry.story_id, f"Story {entry.story_id}")
-                story_names.append(story_name)
-
-                if time_steps is None:
-                    time_steps = entry.time_steps
-
-                values_list.append(entry.values)
-
-            if not values_list:
-                return None
-
-            # Ensure all value arrays have the same length (pad if needed)
-            max_len = max(len(v) for v in values_list)
-            normalized_values = []
-            for v in values_list:
-                if len(v) < max_len:
-                    # Pad with the last value to maintain continuity
-                    padded = list(v) + [v[-1]] * (max_len - len(v))
-                    normalized_values.append(padded)
-                else:
-                    normalized_values.append(v)
-
-            # Also ensure time_steps matches the normalized length
-            if time_steps and len(time_steps) < max_len:
-                # Extrapolate time steps
-                dt = time_steps[-1] - time_steps[-2] if len(time_steps) > 1 else 0.01
-                extended_time = list(time_steps)
-                for _ in range(max_len - len(time_steps)):
-                    extended_time.append(extended_time[-1] + dt)
-                time_steps = extended_time
-
-            # Convert to numpy matrix (num_stories x num_time_steps)
-            values_matrix = np.array(normalized_values)
-
             return TimeSeriesPlotData(
                 result_type=result_type,
                 direction=direction,
-                stories=story_names,
-                time_steps=time_steps,
-                values_matrix=values_matrix,
+                stories=[
+                    story_lookup.get(story_id, f"Story {story_id}")
+                    for story_id in record.story_ids
+                ],
+                time_steps=record.time_steps.tolist(),
+                values_matrix=record.values,  # stories x steps, not copied
                 unit=unit,
+                min_envelope=record.envelope_min,
+                max_envelope=record.envelope_max,
+                lod=record.lod,
+                # Accelerations are stored in mm/s²; display in g (1g = 9810 mm/s²)
+                scale=1.0 / 9810.0 if result_type == "Accelerations" else 1.0,
             )
 
         # Build data for each result type
@@ -125,10 +97,6 @@ def build_plot_data(result_type: str, unit: str) -> TimeSeriesPlotData | None:
         accelerations = build_plot_data("Accelerations", "g")
         forces = build_plot_data("Forces", "kN")
 
-        # Convert accelerations from mm/s² to g (1g = 9810 mm/s²)
-        if accelerations is not None:
-            accelerations.values_matrix = accelerations.values_matrix / 9810.0
-
         # Set data on the animated view
         area.time_series_view.set_data(
             direction=direction,
@@ -153,3 +121,135 @@ def build_plot_data(result_type: str, unit: str) -> TimeSeriesPlotData | None:
     except Exception as exc:
         window.statusBar().showMessage(f"Error loading time series data: {str(exc)}")
         log_exception(exc, "Error loading data")
+
+
+class ResponseSpectrumWorker(QThread):
+    """Worker thread computing the missing response spectra of a result set."""
+
+    progress = pyqtSignal(str, int, int)  # message, done, total
+    finished = pyqtSignal(int)  # Spectra written
+    error = pyqtSignal(str)
+
+    def __init__(self, data_service, project_id: int, result_set_id: int, direction: str):
+        super().__init__()
+        self.data_service = data_service
+        self.project_id = project_id
+        self.result_set_id = result_set_id
+        self.direction = direction
+
+    def run(self):
+        try:
+            written = self.data_service.compute_response_spectra(
+                self.project_id,
+                self.result_set_id,
+                self.direction,
+                progress_callback=self.progress.emit,
+            )
+            self.finished.emit(written)
+        except Exception as e:
+            self.error.emit(handle_worker_error(e, "Response spectrum computation failed"))
+
+
+def load_response_spectrum(
+    window: "ProjectDetailWindow",
+    direction: str,
+    area: "ContentArea",
+    compute_missing: bool = True,
+) -> None:
+    """Load base acceleration response spectra of every record in the result set.
+
+    Only cached spectra are read here; spectra missing from the project
+    database are computed by a ResponseSpectrumWorker and the view reloads
+    when it finishes.
+
+    Args:
+        window: The project detail window
+        direction: 'X' or 'Y'
+        area: Content area to display in
+        compute_missing: Start a worker for records without cached spectra
+    """
+    try:
+        area.show_response_spectrum()
+
+        result_set_id = window.controller.selection.result_set_id
+        data_service = getattr(window, "data_service", None)
+        if data_service is None:
+            from services.data_access import DataAccessService
+
+            data_service = DataAccessService(
+                window.context.session, window.context.result_set_session_factory
+            )
+
+        spectra = data_service.get_response_spectra(window.project_id, result_set_id, direction)
+        area.response_spectrum_view.set_data(spectra)
+        missing = []
+        if compute_missing:
+            missing = data_service.get_missing_response_spectra(
+                window.project_id, result_set_id, direction
+            )
+        if missing:
+            _start_response_spectrum_worker(window, data_service, result_set_id, direction, area)
+
+        if not spectra:
+            if missing:
+                area.content_title.setText(f"Response Spectra - {direction} Direction")
+                window.statusBar().showMessage(
+                    f"Computing response spectra of {len(missing)} records..."
+                )
+            else:
+                area.content_title.setText(f"No Base Accelerations for {direction} Direction")
+                window.statusBar().showMessage("No acceleration time histories in this result set")
+            return
+
+        records = len(spectra[0].load_case_names)
+        area.content_title.setText(f"Response Spectra - {direction} Direction ({records} records)")
+        if missing:
+            window.statusBar().showMessage(
+                f"Loaded {records} response spectra; computing {len(missing)} more..."
+            )
+        else:
+            window.statusBar().showMessage(
+                f"Loaded response spectra of {records} records for {direction} direction"
+            )
+
+    except Exception as exc:
+        window.statusBar().showMessage(f"Error loading response spectra: {str(exc)}")
+        log_exception(exc, "Error loading data")
+
+
+def _start_response_spectrum_worker(
+    window: "ProjectDetailWindow",
+    data_service,
+    result_set_id: int,
+    direction: str,
+    area: "ContentArea",
+) -> None:
+    worker = getattr(window, "_response_spectrum_worker", None)
+    if worker is not None and worker.isRunning():
+        # Its completion reloads the view for whatever is selected by then
+        return
+
+    worker = ResponseSpectrumWorker(data_service, window.project_id, result_set_id, direction)
+    key = (result_set_id, direction)
+
+    def _on_progress(message: str, done: int, total: int) -> None:
+        window.statusBar().showMessage(f"Response spectra {done}/{total}: {message}")
+
+    def _reload(*_args) -> None:
+        selection = window.controller.selection
+        if selection.result_type != "ResponseSpectrum":
+            return
+        current = (selection.result_set_id, selection.direction)
+        # Reload without recomputing for the finished key (records without usable
+        # accelerations stay missing); another selection gets its own worker
+        load_response_spectrum(window, selection.direction, area, compute_missing=current != key)
+
+    def _on_error(message: str) -> None:
+        window.statusBar().showMessage(message)
+        _reload()
+
+    worker.progress.connect(_on_progress)
+    worker.finished.connect(_reload)
+    worker.error.connect(_on_error)
+    window._response_spectrum_worker = worker
+    worker.start()
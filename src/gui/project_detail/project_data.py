@@ -15,7 +15,9 @@ def load_project_data(window):
     window.result_service.invalidate_all()
     window.controller.reset_pushover_mapping()
     try:
-        data_service = window.data_service or DataAccessService(window.context.session)
+        data_service = window.data_service or DataAccessService(
+            window.context.session, window.context.result_set_session_factory
+        )
         result_sets = data_service.get_result_sets(window.project_id)
 
         if result_sets and not window.controller.selection.result_set_id:
@@ -6,6 +6,7 @@
     load_joint_dataset,
     load_maxmin_dataset,
     load_element_maxmin_dataset,
+    refresh_acceptance_overlay,
 )
 from .loaders.rotations import (
     load_all_rotations,
@@ -31,7 +32,7 @@
     load_pushover_curve,
     load_all_pushover_curves,
 )
-from .loaders.time_series import load_time_series_global
+from .loaders.time_series import load_response_spectrum, load_time_series_global
 from .loaders.combined import load_combined_responses
 
 __all__ = [
@@ -40,6 +41,7 @@
     "load_joint_dataset",
     "load_maxmin_dataset",
     "load_element_maxmin_dataset",
+    "refresh_acceptance_overlay",
     "load_all_rotations",
     "load_all_column_rotations",
     "load_all_beam_rotations",
@@ -57,5 +59,6 @@
     "load_pushover_curve",
     "load_all_pushover_curves",
     "load_time_series_global",
+    "load_response_spectrum",
     "load_combined_responses",
 ]
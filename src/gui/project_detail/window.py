@@ -94,6 +94,8 @@ def setup_ui(self):
             on_settings=self._show_settings_popup,
             on_open_reporting=self.open_reporting,
             on_open_pushover_reporting=self.open_pushover_reporting,
+            on_open_governing=self.open_governing_elements,
+            on_open_acceptance=self.open_acceptance_criteria,
         )
         self.header.set_context("NLTHA")
         layout.addWidget(self.header)
@@ -303,6 +305,14 @@ def open_pushover_reporting(self):
         """Open the reporting window for generating PDF reports for Pushover results."""
         return export_actions.open_pushover_reporting(self)
 
+    def open_governing_elements(self):
+        """Open the governing elements dialog (top-N and limit exceedance queries)."""
+        return export_actions.open_governing_elements(self)
+
+    def open_acceptance_criteria(self):
+        """Open the acceptance criteria dialog (limits and demand-to-capacity ratios)."""
+        return export_actions.open_acceptance_criteria(self)
+
     def export_pushover_results(self):
         """Export pushover results."""
         return export_actions.export_pushover_results(self)
@@ -320,6 +330,8 @@ def _on_settings_changed(self, key: str, value):
         """Handle global settings changes."""
         if key == "layout_borders_enabled":
             self._apply_layout_borders()
+        elif key in ("acceptance_overlay_enabled", "acceptance_limits"):
+            dataset_loaders.refresh_acceptance_overlay(self)
 
     def _apply_layout_borders(self):
         """Apply or remove layout borders based on settings."""
@@ -408,6 +420,14 @@ def _cleanup_resources(self) -> None:
 
         db_path = self.context.db_path if getattr(self, "context", None) else None
 
+        worker = getattr(self, "_response_spectrum_worker", None)
+        if worker is not None and worker.isRunning():
+            # It writes through the project engine disposed below; no view reload after close
+            logger.debug("Waiting for response spectrum computation...")
+            for signal in (worker.progress, worker.finished, worker.error):
+                signal.disconnect()
+            worker.wait()
+
         if getattr(self, "session", None):
             try:
                 logger.debug("Rolling back and closing session...")
@@ -0,0 +1,234 @@
+"""Headless batch PDF report generation.
+
+Builds the same PDF as the Report view's "Export PDF" for result sets chosen
+on the command line instead of through the checkbox tree. Each report (one
+project result set) is a job; jobs run in spawned worker processes, each
+with its own offscreen QApplication and database sessions, and return
+per-report timings.
+
+Usage:
+    jobs = plan_report_jobs("Tower A", Path("out"), patterns=["Global/*"])
+    for result in run_report_jobs(jobs, max_workers=4):
+        print(result.summary())
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+from services.project_runtime import build_project_runtime
+from services.project_service import ProjectContext, get_project_context
+from services.reporting_data import ReportingDataService
+from utils.parallel import spawn_process_pool
+from utils.slug import slugify
+from .report_section_catalog import get_available_sections, select_sections
+
+logger = logging.getLogger(__name__)
+
+ALL_SECTIONS = ("*",)
+
+# Keeps the worker's QApplication alive for the lifetime of the process
+_qt_app = None
+
+
+@dataclass(frozen=True)
+class ReportJob:
+    """One PDF report: a result set of a project and the sections to include."""
+
+    project_name: str
+    result_set_id: int
+    result_set_name: str
+    analysis_context: str
+    output_path: str
+    patterns: tuple = ALL_SECTIONS
+
+
+@dataclass
+class ReportJobResult:
+    """Outcome and timings of one report job."""
+
+    job: ReportJob
+    sections: int = 0
+    load_seconds: float = 0.0
+    render_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def total_seconds(self) -> float:
+        return self.load_seconds + self.render_seconds
+
+    def summary(self) -> str:
+        label = f"{self.job.project_name}/{self.job.result_set_name}"
+        if self.error:
+            return f"{label}: FAILED - {self.error}"
+        return (
+            f"{label}: {self.sections} sections | load {self.load_seconds:.2f}s "
+            f"| render {self.render_seconds:.2f}s | total {self.total_seconds:.2f}s "
+            f"-> {self.job.output_path}"
+        )
+
+    def to_record(self) -> dict:
+        """Flat dict for timing logs (one JSON line per report)."""
+        record = asdict(self.job)
+        record["patterns"] = list(self.job.patterns)
+        record.update(
+            sections=self.sections,
+            load_seconds=round(self.load_seconds, 4),
+            render_seconds=round(self.render_seconds, 4),
+            total_seconds=round(self.total_seconds, 4),
+            error=self.error,
+        )
+        return record
+
+
+def ensure_qt_application() -> None:
+    """Create an offscreen QApplication for painting if none exists."""
+    global _qt_app
+    # Forced rather than defaulted: an inherited display platform would break headless runs
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    from PyQt6.QtWidgets import QApplication
+
+    if QApplication.instance() is None:
+        _qt_app = QApplication([])
+
+
+def plan_report_jobs(
+    project_name: str,
+    output_dir: Path,
+    result_set_names: Optional[Sequence[str]] = None,
+    patterns: Sequence[str] = ALL_SECTIONS,
+) -> List[ReportJob]:
+    """Create one job per result set of a project.
+
+    Args:
+        project_name: Catalogued project name
+        output_dir: Directory for the PDFs ({project}_{result set}.pdf)
+        result_set_names: Result sets to include (default: all)
+        patterns: Section path patterns (see report_section_catalog)
+
+    Raises:
+        ValueError: Unknown project or result set name
+    """
+    context = _require_context(project_name)
+    runtime = build_project_runtime(context)
+    try:
+        result_sets = runtime.repos.result_set.get_by_project(runtime.project.id)
+    finally:
+        runtime.dispose()
+
+    if result_set_names:
+        by_name = {rs.name: rs for rs in result_sets}
+        missing = [name for name in result_set_names if name not in by_name]
+        if missing:
+            raise ValueError(f"Result set(s) not found in '{project_name}': {', '.join(missing)}")
+        result_sets = [by_name[name] for name in result_set_names]
+
+    output_dir = Path(output_dir)
+    return [
+        ReportJob(
+            project_name=context.name,
+            result_set_id=rs.id,
+            result_set_name=rs.name,
+            analysis_context="Pushover" if getattr(rs, "analysis_type", None) == "Pushover" else "NLTHA",
+            output_path=str(output_dir / f"{context.slug}_{slugify(rs.name, default='result-set')}.pdf"),
+            patterns=tuple(patterns),
+        )
+        for rs in result_sets
+    ]
+
+
+def run_report_job(job: ReportJob) -> ReportJobResult:
+    """Load the sections of one report and write its PDF (worker process entry point)."""
+    from .pdf_generator import PDFGenerator
+    from .report_section_loader import ReportSectionLoader
+
+    ensure_qt_application()
+    result = ReportJobResult(job=job)
+
+    context = _require_context(job.project_name)
+    runtime = build_project_runtime(context)
+    try:
+        start = time.perf_counter()
+        available = get_available_sections(runtime.data_service, job.result_set_id)
+        sections = select_sections(available, job.patterns, job.result_set_id, job.analysis_context)
+        loader = ReportSectionLoader(
+            runtime.result_service,
+            ReportingDataService(context.session, context.result_set_session_factory),
+            runtime.project.id,
+            job.analysis_context,
+        )
+        sections = loader.get_sections_with_data(sections)
+        result.load_seconds = time.perf_counter() - start
+        result.sections = len(sections)
+
+        if not sections:
+            result.error = "no sections with data matched the template"
+            return result
+
+        start = time.perf_counter()
+        Path(job.output_path).parent.mkdir(parents=True, exist_ok=True)
+        PDFGenerator(context.name).generate(sections, job.output_path)
+        result.render_seconds = time.perf_counter() - start
+    finally:
+        runtime.dispose()
+
+    return result
+
+
+def run_report_jobs(
+    jobs: Sequence[ReportJob],
+    max_workers: Optional[int] = None,
+    on_result: Optional[Callable[[ReportJobResult], None]] = None,
+) -> List[ReportJobResult]:
+    """Run report jobs, in worker processes when more than one worker is allowed.
+
+    A failing job is reported through its result's ``error``; the others continue.
+    Results are returned in job order; ``on_result`` sees them as they finish.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    results: List[Optional[ReportJobResult]] = [None] * len(jobs)
+
+    def _finish(index: int, result: ReportJobResult) -> None:
+        results[index] = result
+        if on_result:
+            on_result(result)
+
+    if max_workers <= 1 or len(jobs) <= 1:
+        for index, job in enumerate(jobs):
+            _finish(index, _run_safely(job))
+        return results
+
+    with spawn_process_pool(
+        min(max_workers, len(jobs)), initializer=ensure_qt_application
+    ) as executor:
+        futures = {executor.submit(_run_safely, job): index for index, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:  # Worker process died
+                result = ReportJobResult(job=jobs[index], error=str(exc) or type(exc).__name__)
+            _finish(index, result)
+    return results
+
+
+def _run_safely(job: ReportJob) -> ReportJobResult:
+    try:
+        return run_report_job(job)
+    except Exception as exc:
+        logger.exception("Report failed for %s/%s", job.project_name, job.result_set_name)
+        return ReportJobResult(job=job, error=str(exc) or type(exc).__name__)
+
+
+def _require_context(project_name: str) -> ProjectContext:
+    context = get_project_context(project_name)
+    if context is None:
+        raise ValueError(f"Project '{project_name}' not found in catalog.")
+    return context
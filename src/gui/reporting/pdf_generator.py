@@ -16,7 +16,6 @@
     QFont,
     QPen,
     QPixmap,
-    QImage,
     QPageSize,
     QPageLayout,
 )
@@ -25,6 +24,7 @@
 from gui.icon_utils import ICONS_DIR
 from .constants import PRINT_COLORS, PLOT_COLORS, AVERAGE_COLOR
 from .pdf_section_drawers import PushoverSectionDrawer
+from .report_header_footer import ReportHeaderFooter
 
 logger = logging.getLogger(__name__)
 
@@ -54,31 +54,12 @@ class PDFGenerator:
     def __init__(self, project_name: str):
         self.project_name = project_name
         self._logo_pixmap = self._load_colorized_logo()
+        self._scaled_logos: dict[int, QPixmap] = {}
         self._section_drawer = PushoverSectionDrawer(self._draw_placeholder)
 
     def _load_colorized_logo(self) -> QPixmap:
         """Load logo mask and colorize it for print."""
-        logo_path = ICONS_DIR / "RPS_Logo.png"
-        if not logo_path.exists():
-            return QPixmap()
-
-        image = QImage(str(logo_path))
-        if image.isNull():
-            return QPixmap()
-
-        # Use dark teal color for print
-        logo_color = QColor("#1f5c6a")
-        image = image.convertToFormat(QImage.Format.Format_ARGB32)
-
-        for y in range(image.height()):
-            for x in range(image.width()):
-                pixel = image.pixelColor(x, y)
-                if pixel.alpha() > 0:
-                    new_color = QColor(logo_color)
-                    new_color.setAlpha(pixel.alpha())
-                    image.setPixelColor(x, y, new_color)
-
-        return QPixmap.fromImage(image)
+        return ReportHeaderFooter.load_colorized_logo(ICONS_DIR / "RPS_Logo.png")
 
     def generate(self, sections: list, output_path: str) -> None:
         """Generate PDF file from sections."""
@@ -174,7 +155,11 @@ def _draw_header(self, painter: QPainter, x: int, y: int, width: int, height: in
         logo_h = int(8 * mm_to_px)
 
         if not self._logo_pixmap.isNull():
-            scaled_logo = self._logo_pixmap.scaledToHeight(logo_h, Qt.TransformationMode.SmoothTransformation)
+            # Scale once per resolution; every page reuses the same logo
+            scaled_logo = self._scaled_logos.get(logo_h)
+            if scaled_logo is None:
+                scaled_logo = self._logo_pixmap.scaledToHeight(logo_h, Qt.TransformationMode.SmoothTransformation)
+                self._scaled_logos[logo_h] = scaled_logo
             painter.drawPixmap(x, y, scaled_logo)
             logo_w = scaled_logo.width()
         else:
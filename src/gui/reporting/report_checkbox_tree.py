@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Optional
 
 from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from sqlalchemy.orm import Session
 
+from database.session import ResultSetSessionFactory
+
 from gui.styles import COLORS
 from services.data_access import DataAccessService
-from .report_models import ReportSection
+from . import report_section_catalog as catalog
 
 
 class ReportCheckboxTree(QTreeWidget):
@@ -29,55 +31,13 @@ class ReportCheckboxTree(QTreeWidget):
 
     selection_changed = pyqtSignal()
 
-    # Mapping of cache result types to display names and units
-    RESULT_TYPE_LABELS = {
-        "Drifts": "Story Drifts",
-        "Forces": "Story Forces",
-        "Displacements": "Floor Displacements",
-        "Accelerations": "Floor Accelerations",
-    }
-
-    # Units for each result type (matches config/result_config.py)
-    RESULT_TYPE_UNITS = {
-        "Drifts": "%",
-        "Forces": "kN",
-        "Displacements": "mm",
-        "Accelerations": "g",
-    }
-
-    # Element result type labels
-    ELEMENT_TYPE_LABELS = {
-        "BeamRotations": "Beam Plastic Rotations",
-        "ColumnRotations": "Column Plastic Rotations",
-        "WallShears": "Wall Shears",
-        "QuadRotations": "Quad Rotations",
-        "ColumnShears": "Column Shears",
-        "ColumnAxials": "Column Axials",
-        "BraceAxials": "Brace Axials",
-    }
-
-    # Element result type units
-    ELEMENT_TYPE_UNITS = {
-        "BeamRotations": "%",
-        "ColumnRotations": "%",
-        "WallShears": "kN",
-        "QuadRotations": "%",
-        "ColumnShears": "kN",
-        "ColumnAxials": "kN",
-        "BraceAxials": "kN",
-    }
-
-    # Joint result type labels
-    JOINT_TYPE_LABELS = {
-        "SoilPressures_Min": "Soil Pressures (Min)",
-        "VerticalDisplacements_Min": "Vertical Displacements (Min)",
-    }
-
-    # Joint result type units
-    JOINT_TYPE_UNITS = {
-        "SoilPressures_Min": "kN/m²",
-        "VerticalDisplacements_Min": "mm",
-    }
+    # Labels and units live in report_section_catalog (shared with headless reports)
+    RESULT_TYPE_LABELS = catalog.RESULT_TYPE_LABELS
+    RESULT_TYPE_UNITS = catalog.RESULT_TYPE_UNITS
+    ELEMENT_TYPE_LABELS = catalog.ELEMENT_TYPE_LABELS
+    ELEMENT_TYPE_UNITS = catalog.ELEMENT_TYPE_UNITS
+    JOINT_TYPE_LABELS = catalog.JOINT_TYPE_LABELS
+    JOINT_TYPE_UNITS = catalog.JOINT_TYPE_UNITS
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -127,18 +87,24 @@ def __init__(self, parent=None):
         self._signal_timer.setInterval(100)  # 100ms debounce
         self._signal_timer.timeout.connect(self.selection_changed.emit)
 
-    def populate_from_result_set(self, result_set_id: int, session_factory: Callable[[], Session]) -> None:
+    def populate_from_result_set(
+        self,
+        result_set_id: int,
+        session_factory: Callable[[], Session],
+        result_set_session_factory: Optional[ResultSetSessionFactory] = None,
+    ) -> None:
         """Populate tree with available result types for the given result set.
 
         Args:
             result_set_id: Result set ID to populate from
             session_factory: Callable that returns a new Session (used by DataAccessService)
+            result_set_session_factory: Optional per-result-set session factory (for shards)
         """
         self._updating = True
         self.clear()
 
         # Use DataAccessService for all queries
-        data_service = DataAccessService(session_factory)
+        data_service = DataAccessService(session_factory, result_set_session_factory)
 
         # Query available result types from cache
         available_types = self._get_available_types(result_set_id, data_service)
@@ -256,90 +222,16 @@ def populate_from_result_set(self, result_set_id: int, session_factory: Callable
         self._updating = False
 
     def _get_available_types(self, result_set_id: int, data_service: DataAccessService) -> dict[str, set[str]]:
-        """Query cache for available result types and directions via DataAccessService.
-
-        The cache stores result_type as base type (e.g., "Drifts") and directions
-        are embedded in the load case names within results_matrix JSON:
-        - Drifts: "_X", "_Y" (e.g., "TH01_X", "TH01_Y")
-        - Accelerations/Displacements: "_UX", "_UY" (e.g., "TH01_UX", "TH01_UY")
-        - Forces: "_VX", "_VY" (e.g., "TH01_VX", "TH01_VY")
-        """
-        import json
-
-        results = data_service.get_global_cache_with_matrix(result_set_id)
-
-        # Parse result types and extract directions from matrix keys
-        available: dict[str, set[str]] = {}
-        for result_type, results_matrix in results:
-            if result_type not in available:
-                available[result_type] = set()
-
-            # Parse the results_matrix JSON to extract directions from load case names
-            if results_matrix:
-                try:
-                    matrix = json.loads(results_matrix) if isinstance(results_matrix, str) else results_matrix
-                    for key in matrix.keys():
-                        # Different result types use different direction suffixes:
-                        # Drifts: _X, _Y
-                        # Accelerations/Displacements: _UX, _UY
-                        # Forces: _VX, _VY
-                        if key.endswith("_X") or key.endswith("_UX") or key.endswith("_VX"):
-                            available[result_type].add("X")
-                        elif key.endswith("_Y") or key.endswith("_UY") or key.endswith("_VY"):
-                            available[result_type].add("Y")
-                except (json.JSONDecodeError, AttributeError):
-                    pass
-
-        return available
+        """Query cache for available global result types and their directions."""
+        return catalog.get_available_global_types(data_service, result_set_id)
 
     def _get_available_element_types(self, result_set_id: int, data_service: DataAccessService) -> list[str]:
-        """Query element cache for available element result types via DataAccessService.
-
-        Returns list of available element result types (e.g., BeamRotations, ColumnRotations).
-        """
-        types = data_service.get_available_element_types_for_result_set(result_set_id)
-
-        available = []
-        for result_type in types:
-            # Map specific cache types to base types
-            if result_type.startswith("BeamRotations"):
-                if "BeamRotations" not in available:
-                    available.append("BeamRotations")
-            elif result_type.startswith("ColumnRotations"):
-                if "ColumnRotations" not in available:
-                    available.append("ColumnRotations")
-            elif result_type.startswith("WallShears"):
-                if "WallShears" not in available:
-                    available.append("WallShears")
-            elif result_type.startswith("QuadRotations"):
-                if "QuadRotations" not in available:
-                    available.append("QuadRotations")
-            elif result_type.startswith("ColumnShears"):
-                if "ColumnShears" not in available:
-                    available.append("ColumnShears")
-            elif result_type.startswith("ColumnAxials"):
-                if "ColumnAxials" not in available:
-                    available.append("ColumnAxials")
-            elif result_type.startswith("BraceAxials"):
-                if "BraceAxials" not in available:
-                    available.append("BraceAxials")
-
-        return available
+        """Query element cache for available element result types (e.g., BeamRotations)."""
+        return catalog.get_available_element_types(data_service, result_set_id)
 
     def _get_available_joint_types(self, result_set_id: int, data_service: DataAccessService) -> list[str]:
-        """Query joint cache for available joint result types via DataAccessService.
-
-        Returns list of available joint result types (e.g., SoilPressures_Min).
-        """
-        types = data_service.get_available_joint_types_for_result_set(result_set_id)
-
-        available = []
-        for result_type in types:
-            if result_type in ["SoilPressures_Min", "VerticalDisplacements_Min"]:
-                if result_type not in available:
-                    available.append(result_type)
-
-        return available
+        """Query joint cache for available joint result types (e.g., SoilPressures_Min)."""
+        return catalog.get_available_joint_types(data_service, result_set_id)
 
     def _on_item_changed(self, item: QTreeWidgetItem, column: int) -> None:
         """Handle item check state changes."""
@@ -415,47 +307,11 @@ def _collect_selected_items(self, parent: QTreeWidgetItem, result_set_id: int, s
                     category = data.get("category", "Global")
 
                     if result_type:
-                        # Element results (e.g., BeamRotations) don't have direction
-                        if category == "Element":
-                            display_name = self.ELEMENT_TYPE_LABELS.get(result_type, result_type)
-                            unit = self.ELEMENT_TYPE_UNITS.get(result_type, "")
-                            title = f"{display_name} [{unit}]" if unit else display_name
-                            section = ReportSection(
-                                title=title,
-                                result_type=result_type,
-                                direction=direction,
-                                result_set_id=result_set_id,
-                                category=category,
-                                analysis_context=analysis_context
-                            )
-                            sections.append(section)
-                        elif category == "Joint":
-                            display_name = self.JOINT_TYPE_LABELS.get(result_type, result_type)
-                            unit = self.JOINT_TYPE_UNITS.get(result_type, "")
-                            title = f"{display_name} [{unit}]" if unit else display_name
-                            section = ReportSection(
-                                title=title,
-                                result_type=result_type,
-                                direction=direction,
-                                result_set_id=result_set_id,
-                                category=category,
-                                analysis_context=analysis_context
-                            )
-                            sections.append(section)
-                        elif direction:
-                            # Global results require direction
-                            display_name = self.RESULT_TYPE_LABELS.get(result_type, result_type)
-                            unit = self.RESULT_TYPE_UNITS.get(result_type, "")
-                            # Match normal window format: "Story Drifts [%] - X Direction"
-                            title = f"{display_name} [{unit}] - {direction} Direction" if unit else f"{display_name} - {direction} Direction"
-                            section = ReportSection(
-                                title=title,
-                                result_type=result_type,
-                                direction=direction,
-                                result_set_id=result_set_id,
-                                category=category,
-                                analysis_context=analysis_context
-                            )
+                        # Element/joint results have no direction; global results require one
+                        section = catalog.build_section(
+                            category, result_type, direction, result_set_id, analysis_context
+                        )
+                        if section is not None:
                             sections.append(section)
             else:
                 # Parent node - recurse
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 from PyQt6.QtCore import Qt, QRectF
 from PyQt6.QtGui import QPainter, QColor, QFont, QPixmap, QPen, QImage
 
@@ -14,41 +17,54 @@
 class ReportHeaderFooter:
     """Renders the header and footer for report pages."""
 
-    def __init__(self, logo: QPixmap | None = None) -> None:
+    def __init__(self, logo: QPixmap | QImage | None = None) -> None:
+        # QImage logos can be drawn from page render threads; QPixmap only on the GUI thread
         self._logo = logo if logo is not None else QPixmap()
+        self._scaled_logo: QPixmap | QImage | None = None
 
     @staticmethod
     def load_colorized_logo(logo_path: Path) -> QPixmap:
         """Load logo mask and colorize it for print (dark color on light background)."""
+        image = ReportHeaderFooter.load_colorized_logo_image(logo_path)
+        return QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def load_colorized_logo_image(logo_path: Path) -> QImage:
+        """Colorized logo as a QImage, loaded once per path and safe to paint off the GUI thread."""
         if not logo_path.exists():
-            return QPixmap()
+            return QImage()
 
         image = QImage(str(logo_path))
         if image.isNull():
-            return QPixmap()
+            return QImage()
 
-        # Use dark teal color for print
+        # Use dark teal color for print; keep each pixel's alpha
         logo_color = QColor("#1f5c6a")
         image = image.convertToFormat(QImage.Format.Format_ARGB32)
 
-        # Colorize each pixel based on alpha
-        for y in range(image.height()):
-            for x in range(image.width()):
-                pixel = image.pixelColor(x, y)
-                if pixel.alpha() > 0:
-                    new_color = QColor(logo_color)
-                    new_color.setAlpha(pixel.alpha())
-                    image.setPixelColor(x, y, new_color)
+        # Format_ARGB32 is stored as B, G, R, A bytes per pixel
+        bits = image.bits()
+        bits.setsize(image.sizeInBytes())
+        pixels = np.frombuffer(bits, dtype=np.uint8).reshape(image.height(), image.bytesPerLine())
+        pixels = pixels[:, : image.width() * 4].reshape(image.height(), image.width(), 4)
+        opaque = pixels[:, :, 3] > 0
+        pixels[opaque, :3] = (logo_color.blue(), logo_color.green(), logo_color.red())
 
-        return QPixmap.fromImage(image)
+        return image
 
     def draw_header(self, painter: QPainter, x: int, y: int, width: int, project_name: str) -> None:
         """Draw compact header with logo and project name."""
         # Logo - 22px height, positioned at top
         logo_h = 22
         if not self._logo.isNull():
-            scaled = self._logo.scaledToHeight(logo_h, Qt.TransformationMode.SmoothTransformation)
-            painter.drawPixmap(x, y, scaled)
+            if self._scaled_logo is None:
+                self._scaled_logo = self._logo.scaledToHeight(logo_h, Qt.TransformationMode.SmoothTransformation)
+            scaled = self._scaled_logo
+            if isinstance(scaled, QImage):
+                painter.drawImage(x, y, scaled)
+            else:
+                painter.drawPixmap(x, y, scaled)
             logo_w = scaled.width()
         else:
             logo_w = 0
@@ -0,0 +1,166 @@
+"""Page render pipeline for the report preview.
+
+Sections are laid out into pages once, each page is painted into a QImage
+(painting into a QImage is safe off the GUI thread) and the images are kept
+in an LRU cache keyed by the page's sections, their loaded data and the page
+size. Changing the selection only re-paints pages whose content changed;
+unchanged pages are reused as-is.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Hashable, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QColor, QImage, QPainter
+
+from gui.icon_utils import ICONS_DIR
+from .report_header_footer import ReportHeaderFooter
+from .report_layout import A4_HEIGHT_PX, A4_WIDTH_PX, SECTION_GAP
+from .report_page_builder import ReportPageBuilder
+from .report_plot_renderer import ReportPlotRenderer
+from .report_table_renderer import ReportTableRenderer
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHED_PAGES = 200
+MAX_RENDER_THREADS = 4
+
+
+def paginate_sections(sections: Sequence) -> List[List]:
+    """Distribute sections across A4 pages using estimated section heights."""
+    pages: List[List] = []
+    max_height = ReportPageBuilder.get_content_height()
+    current_sections: List = []
+    current_h = 0
+
+    for section in sections:
+        section_h = ReportPageBuilder.estimate_section_height(section)
+
+        if current_h + section_h > max_height and current_sections:
+            pages.append(current_sections)
+            current_sections = []
+            current_h = 0
+
+        current_sections.append(section)
+        current_h += section_h + SECTION_GAP
+
+    if current_sections:
+        pages.append(current_sections)
+    return pages
+
+
+def section_render_key(section) -> Tuple[Hashable, ...]:
+    """Identity of what a section paints: its selection plus the loaded data objects.
+
+    The section loader hands out the same data object until it re-fetches, so
+    object identity serves as the data version. The cache keeps those objects
+    alive with the entry, so an id cannot be reused while the entry exists.
+    """
+    return (
+        section.title,
+        section.category,
+        section.result_type,
+        section.direction,
+        section.result_set_id,
+        section.element_id,
+        section.analysis_context,
+        id(section.dataset),
+        id(section.element_data),
+        id(section.joint_data),
+    )
+
+
+class ReportPageCache:
+    """Renders preview pages into QImages and caches them."""
+
+    def __init__(self, project_name: str, max_pages: int = MAX_CACHED_PAGES, max_workers: Optional[int] = None):
+        self.project_name = project_name
+        self.max_pages = max_pages
+        self.max_workers = max_workers or min(MAX_RENDER_THREADS, os.cpu_count() or 1)
+        # key -> (image, data objects kept alive for the key's ids)
+        self._pages: "OrderedDict[tuple, Tuple[QImage, tuple]]" = OrderedDict()
+
+        logo = ReportHeaderFooter.load_colorized_logo_image(ICONS_DIR / "RPS_Logo.png")
+        self._page_builder = ReportPageBuilder(
+            ReportHeaderFooter(logo), ReportTableRenderer(), ReportPlotRenderer()
+        )
+        # The logo is scaled lazily; do it once here so render threads only read it
+        self._render_page(QImage(1, 1, QImage.Format.Format_ARGB32_Premultiplied), [], 1)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def clear(self) -> None:
+        self._pages.clear()
+
+    def page_key(self, sections: Sequence, page_number: int, size: QSize, device_pixel_ratio: float) -> tuple:
+        return (
+            self.project_name,
+            page_number,
+            size.width(),
+            size.height(),
+            device_pixel_ratio,
+            tuple(section_render_key(section) for section in sections),
+        )
+
+    def render_pages(
+        self,
+        pages: Sequence[Sequence],
+        size: QSize = QSize(A4_WIDTH_PX, A4_HEIGHT_PX),
+        device_pixel_ratio: float = 1.0,
+    ) -> List[QImage]:
+        """Return one image per page, painting only pages missing from the cache."""
+        keys = [
+            self.page_key(sections, number, size, device_pixel_ratio)
+            for number, sections in enumerate(pages, start=1)
+        ]
+        missing = [index for index, key in enumerate(keys) if key not in self._pages]
+
+        if missing:
+            jobs = [(pages[index], index + 1) for index in missing]
+            if len(jobs) > 1 and self.max_workers > 1:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+                    images = list(executor.map(lambda job: self._paint(job[0], job[1], size, device_pixel_ratio), jobs))
+            else:
+                images = [self._paint(sections, number, size, device_pixel_ratio) for sections, number in jobs]
+
+            for index, image in zip(missing, images):
+                keep_alive = tuple(
+                    (section.dataset, section.element_data, section.joint_data) for section in pages[index]
+                )
+                self._pages[keys[index]] = (image, keep_alive)
+            logger.debug("Report preview: rendered %s of %s pages", len(missing), len(pages))
+
+        result = []
+        for key in keys:
+            self._pages.move_to_end(key)
+            result.append(self._pages[key][0])
+
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+        return result
+
+    def _paint(self, sections: Sequence, page_number: int, size: QSize, device_pixel_ratio: float) -> QImage:
+        image = QImage(
+            round(size.width() * device_pixel_ratio),
+            round(size.height() * device_pixel_ratio),
+            QImage.Format.Format_ARGB32_Premultiplied,
+        )
+        image.setDevicePixelRatio(device_pixel_ratio)
+        image.fill(QColor("#ffffff"))
+        self._render_page(image, sections, page_number)
+        return image
+
+    def _render_page(self, image: QImage, sections: Sequence, page_number: int) -> None:
+        painter = QPainter(image)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            self._page_builder.draw_page(painter, list(sections), self.project_name, page_number)
+        finally:
+            painter.end()
@@ -2,40 +2,34 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPainter, QColor, QPen
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QImage, QPainter, QColor, QPen
 from PyQt6.QtWidgets import QLabel, QScrollArea, QSizePolicy, QVBoxLayout, QWidget
 
-from gui.icon_utils import ICONS_DIR
 from gui.styles import COLORS
-from .report_header_footer import ReportHeaderFooter
-from .report_layout import A4_HEIGHT_PX, A4_WIDTH_PX, SECTION_GAP
+from .report_layout import A4_HEIGHT_PX, A4_WIDTH_PX
 from .report_page_builder import ReportPageBuilder
-from .report_plot_renderer import ReportPlotRenderer
-from .report_table_renderer import ReportTableRenderer
+from .report_page_cache import ReportPageCache, paginate_sections
 
 
 class ReportPageWidget(QWidget):
-    """Widget representing a single A4 page in the preview."""
+    """Widget representing a single A4 page in the preview.
+
+    Shows a page image rendered by :class:`ReportPageCache`.
+    """
 
     def __init__(self, project_name: str, page_number: int = 1, parent=None):
         super().__init__(parent)
         self.project_name = project_name
         self.page_number = page_number
         self.sections: List = []
+        self._image: Optional[QImage] = None
 
         self.setFixedSize(A4_WIDTH_PX, A4_HEIGHT_PX)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
 
-        logo_path = ICONS_DIR / "RPS_Logo.png"
-        logo = ReportHeaderFooter.load_colorized_logo(logo_path)
-        header_footer = ReportHeaderFooter(logo)
-        table_renderer = ReportTableRenderer()
-        plot_renderer = ReportPlotRenderer()
-        self._page_builder = ReportPageBuilder(header_footer, table_renderer, plot_renderer)
-
     @classmethod
     def estimate_section_height(cls, section, available_width: int = 485) -> int:
         """Estimate height for a section."""
@@ -46,23 +40,22 @@ def get_content_height(cls) -> int:
         """Available content height."""
         return ReportPageBuilder.get_content_height()
 
-    def set_sections(self, sections: list) -> None:
+    def set_page(self, sections: list, image: QImage) -> None:
         self.sections = sections
+        self._image = image
         self.update()
 
     def paintEvent(self, event) -> None:
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
 
         # White background
         painter.fillRect(self.rect(), QColor("#ffffff"))
+        if self._image is not None:
+            painter.drawImage(0, 0, self._image)
 
         # Page border
         painter.setPen(QPen(QColor(COLORS["border"]), 1))
         painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
-
-        self._page_builder.draw_page(painter, self.sections, self.project_name, self.page_number)
         painter.end()
 
 
@@ -73,6 +66,7 @@ def __init__(self, project_name: str, parent=None):
         super().__init__(parent)
         self.project_name = project_name
         self._pages: List[ReportPageWidget] = []
+        self._page_cache = ReportPageCache(project_name)
 
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
@@ -118,30 +112,16 @@ def set_sections(self, sections: list) -> None:
             self._show_empty_state()
             return
 
-        # Distribute sections across pages
-        max_height = ReportPageWidget.get_content_height()
-        current_sections = []
-        current_h = 0
-        page_num = 1
-
-        for section in sections:
-            section_h = ReportPageWidget.estimate_section_height(section)
-
-            if current_h + section_h > max_height and current_sections:
-                page = ReportPageWidget(self.project_name, page_number=page_num)
-                page.set_sections(current_sections)
-                self._layout.addWidget(page)
-                self._pages.append(page)
-                page_num += 1
-                current_sections = []
-                current_h = 0
-
-            current_sections.append(section)
-            current_h += section_h + SECTION_GAP
+        pages = paginate_sections(sections)
+        images = self._page_cache.render_pages(
+            pages,
+            QSize(A4_WIDTH_PX, A4_HEIGHT_PX),
+            self.devicePixelRatioF(),
+        )
 
-        if current_sections:
+        for page_num, (page_sections, image) in enumerate(zip(pages, images), start=1):
             page = ReportPageWidget(self.project_name, page_number=page_num)
-            page.set_sections(current_sections)
+            page.set_page(page_sections, image)
             self._layout.addWidget(page)
             self._pages.append(page)
 
@@ -0,0 +1,224 @@
+"""Available report sections for a result set, independent of the checkbox tree.
+
+The checkbox tree and the headless batch report both need to know which
+sections a result set can produce and how each section is titled. Section
+paths look like ``Global/Drifts/X``, ``Element/BeamRotations`` and
+``Joint/SoilPressures_Min``; templates select sections with shell-style
+patterns on those paths (e.g. ``Global/*``, ``*/Drifts/*``).
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from services.data_access import DataAccessService
+from .report_models import ReportSection
+
+# Mapping of cache result types to display names and units
+RESULT_TYPE_LABELS = {
+    "Drifts": "Story Drifts",
+    "Forces": "Story Forces",
+    "Displacements": "Floor Displacements",
+    "Accelerations": "Floor Accelerations",
+}
+
+# Units for each result type (matches config/result_config.py)
+RESULT_TYPE_UNITS = {
+    "Drifts": "%",
+    "Forces": "kN",
+    "Displacements": "mm",
+    "Accelerations": "g",
+}
+
+# Element result type labels
+ELEMENT_TYPE_LABELS = {
+    "BeamRotations": "Beam Plastic Rotations",
+    "ColumnRotations": "Column Plastic Rotations",
+    "WallShears": "Wall Shears",
+    "QuadRotations": "Quad Rotations",
+    "ColumnShears": "Column Shears",
+    "ColumnAxials": "Column Axials",
+    "BraceAxials": "Brace Axials",
+}
+
+# Element result type units
+ELEMENT_TYPE_UNITS = {
+    "BeamRotations": "%",
+    "ColumnRotations": "%",
+    "WallShears": "kN",
+    "QuadRotations": "%",
+    "ColumnShears": "kN",
+    "ColumnAxials": "kN",
+    "BraceAxials": "kN",
+}
+
+# Joint result type labels
+JOINT_TYPE_LABELS = {
+    "SoilPressures_Min": "Soil Pressures (Min)",
+    "VerticalDisplacements_Min": "Vertical Displacements (Min)",
+}
+
+# Joint result type units
+JOINT_TYPE_UNITS = {
+    "SoilPressures_Min": "kN/m²",
+    "VerticalDisplacements_Min": "mm",
+}
+
+
+@dataclass
+class AvailableSections:
+    """Result types a result set can report, in tree order."""
+
+    global_types: Dict[str, Set[str]]  # base type -> directions
+    element_types: List[str]
+    joint_types: List[str]
+
+    def is_empty(self) -> bool:
+        return not self.global_types and not self.element_types and not self.joint_types
+
+    def paths(self) -> List[str]:
+        """Section paths in the order the checkbox tree lists them."""
+        paths = [
+            f"Global/{result_type}/{direction}"
+            for result_type, directions in self.global_types.items()
+            for direction in sorted(directions)
+        ]
+        paths.extend(f"Element/{result_type}" for result_type in self.element_types)
+        paths.extend(f"Joint/{result_type}" for result_type in self.joint_types)
+        return paths
+
+
+def get_available_sections(data_service: DataAccessService, result_set_id: int) -> AvailableSections:
+    """Query the caches for the result types available in a result set."""
+    return AvailableSections(
+        global_types=get_available_global_types(data_service, result_set_id),
+        element_types=get_available_element_types(data_service, result_set_id),
+        joint_types=get_available_joint_types(data_service, result_set_id),
+    )
+
+
+def get_available_global_types(data_service: DataAccessService, result_set_id: int) -> Dict[str, Set[str]]:
+    """Query cache for available result types and directions.
+
+    The cache stores result_type as base type (e.g., "Drifts") and directions
+    are embedded in the load case names within results_matrix JSON:
+    - Drifts: "_X", "_Y" (e.g., "TH01_X", "TH01_Y")
+    - Accelerations/Displacements: "_UX", "_UY" (e.g., "TH01_UX", "TH01_UY")
+    - Forces: "_VX", "_VY" (e.g., "TH01_VX", "TH01_VY")
+    """
+    results = data_service.get_global_cache_with_matrix(result_set_id)
+
+    # Parse result types and extract directions from matrix keys
+    available: Dict[str, Set[str]] = {}
+    for result_type, results_matrix in results:
+        if result_type not in available:
+            available[result_type] = set()
+
+        # Parse the results_matrix JSON to extract directions from load case names
+        if results_matrix:
+            try:
+                matrix = json.loads(results_matrix) if isinstance(results_matrix, str) else results_matrix
+                for key in matrix.keys():
+                    if key.endswith("_X") or key.endswith("_UX") or key.endswith("_VX"):
+                        available[result_type].add("X")
+                    elif key.endswith("_Y") or key.endswith("_UY") or key.endswith("_VY"):
+                        available[result_type].add("Y")
+            except (json.JSONDecodeError, AttributeError):
+                pass
+
+    return available
+
+
+def get_available_element_types(data_service: DataAccessService, result_set_id: int) -> List[str]:
+    """Query element cache for available element result types (e.g., BeamRotations)."""
+    types = data_service.get_available_element_types_for_result_set(result_set_id)
+
+    # Map specific cache types (e.g. "BeamRotations_R3Plastic") to base types
+    available: List[str] = []
+    for result_type in types:
+        for base_type in ELEMENT_TYPE_LABELS:
+            if result_type.startswith(base_type):
+                if base_type not in available:
+                    available.append(base_type)
+                break
+
+    return available
+
+
+def get_available_joint_types(data_service: DataAccessService, result_set_id: int) -> List[str]:
+    """Query joint cache for available joint result types (e.g., SoilPressures_Min)."""
+    types = data_service.get_available_joint_types_for_result_set(result_set_id)
+
+    available: List[str] = []
+    for result_type in types:
+        if result_type in JOINT_TYPE_LABELS and result_type not in available:
+            available.append(result_type)
+
+    return available
+
+
+def build_section(
+    category: str,
+    result_type: str,
+    direction: str,
+    result_set_id: int,
+    analysis_context: str = "NLTHA",
+) -> Optional[ReportSection]:
+    """Create a titled ReportSection; global sections without a direction return None."""
+    if category == "Element":
+        display_name = ELEMENT_TYPE_LABELS.get(result_type, result_type)
+        unit = ELEMENT_TYPE_UNITS.get(result_type, "")
+        title = f"{display_name} [{unit}]" if unit else display_name
+    elif category == "Joint":
+        display_name = JOINT_TYPE_LABELS.get(result_type, result_type)
+        unit = JOINT_TYPE_UNITS.get(result_type, "")
+        title = f"{display_name} [{unit}]" if unit else display_name
+    elif direction:
+        # Global results require direction
+        display_name = RESULT_TYPE_LABELS.get(result_type, result_type)
+        unit = RESULT_TYPE_UNITS.get(result_type, "")
+        # Match normal window format: "Story Drifts [%] - X Direction"
+        title = f"{display_name} [{unit}] - {direction} Direction" if unit else f"{display_name} - {direction} Direction"
+    else:
+        return None
+
+    return ReportSection(
+        title=title,
+        result_type=result_type,
+        direction=direction,
+        result_set_id=result_set_id,
+        category=category,
+        analysis_context=analysis_context,
+    )
+
+
+def select_sections(
+    available: AvailableSections,
+    patterns: Iterable[str],
+    result_set_id: int,
+    analysis_context: str = "NLTHA",
+) -> List[ReportSection]:
+    """Build the sections whose paths match any template pattern, in tree order."""
+    patterns = list(patterns)
+    sections = []
+    for path in available.paths():
+        if not any(fnmatchcase(path, pattern) for pattern in patterns):
+            continue
+        category, result_type, *rest = path.split("/")
+        section = build_section(category, result_type, rest[0] if rest else "", result_set_id, analysis_context)
+        if section is not None:
+            sections.append(section)
+    return sections
+
+
+def parse_template(lines: Sequence[str]) -> List[str]:
+    """Read section patterns from template lines, ignoring blanks and # comments."""
+    patterns = []
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if line:
+            patterns.append(line)
+    return patterns
@@ -52,7 +52,9 @@ def __init__(self, runtime: ProjectRuntime, parent: Optional[QWidget] = None, an
         super().__init__(parent)
         self.runtime = runtime
         self.result_service = runtime.result_service
-        self.reporting_service = ReportingDataService(runtime.context.session)
+        self.reporting_service = ReportingDataService(
+            runtime.context.session, runtime.context.result_set_session_factory
+        )
         self.project_name = runtime.project.name
         self.project_id = runtime.project.id
         self.analysis_context = analysis_context  # 'NLTHA' or 'Pushover'
@@ -303,7 +305,8 @@ def _refresh_tree(self) -> None:
         # Pass session_factory to allow DataAccessService creation
         self.checkbox_tree.populate_from_result_set(
             self._selected_result_set_id,
-            self.runtime.context.session  # session_factory, not session instance
+            self.runtime.context.session,  # session_factory, not session instance
+            self.runtime.context.result_set_session_factory,
         )
         self._update_preview()
 
@@ -0,0 +1,137 @@
+"""Response spectrum view - base acceleration spectra of all records in a result set.
+
+Shows every record's pseudo-spectral acceleration against period, with the
+mean and mean ± σ across records. A damping selector switches between the
+damping ratios the spectra were computed for.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QVBoxLayout, QWidget
+
+from gui.styles import COLORS
+
+if TYPE_CHECKING:
+    from processing.response_spectrum import ResponseSpectrumSet
+
+logger = logging.getLogger(__name__)
+
+# Damping shown first when available
+DEFAULT_DAMPING_RATIO = 0.05
+
+
+class ResponseSpectrumView(QWidget):
+    """Spectra of all records with mean and mean ± σ envelopes."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.spectra: List["ResponseSpectrumSet"] = []
+        self._record_lines: List[pg.PlotDataItem] = []
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """Create the damping selector and the plot."""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(8)
+
+        controls = QHBoxLayout()
+        controls.addStretch()
+        damping_label = QLabel("Damping:")
+        damping_label.setStyleSheet(f"color: {COLORS['text']}; font-size: 12px;")
+        controls.addWidget(damping_label)
+        self.damping_combo = QComboBox()
+        self.damping_combo.setFixedWidth(90)
+        self.damping_combo.currentIndexChanged.connect(self._on_damping_changed)
+        controls.addWidget(self.damping_combo)
+        layout.addLayout(controls)
+
+        pg.setConfigOptions(antialias=True)
+        from gui.components.plot_factory import create_plot_widget
+        self.plot_widget = create_plot_widget(grid_alpha=0.3)
+        self.plot_widget.setLogMode(x=True, y=False)
+        self.plot_widget.setLabel('bottom', 'Period [s]')
+        self.plot_widget.setLabel('left', 'Sa [g]')
+        self.plot_widget.addLegend(offset=(-10, 10))
+        layout.addWidget(self.plot_widget, 1)
+
+        self.mean_line = self.plot_widget.plot(
+            [], [], name="Mean", pen=pg.mkPen(COLORS['accent'], width=3),
+        )
+        self.upper_line = self.plot_widget.plot(
+            [], [], name="Mean ± σ",
+            pen=pg.mkPen('#e74c3c', width=1.5, style=Qt.PenStyle.DashLine),
+        )
+        self.lower_line = self.plot_widget.plot(
+            [], [], pen=pg.mkPen('#e74c3c', width=1.5, style=Qt.PenStyle.DashLine),
+        )
+
+    def set_data(self, spectra: List["ResponseSpectrumSet"]):
+        """Set the spectra to show, one set per damping ratio."""
+        self.spectra = list(spectra)
+
+        self.damping_combo.blockSignals(True)
+        self.damping_combo.clear()
+        for spectrum in self.spectra:
+            self.damping_combo.addItem(f"{spectrum.damping_ratio:.0%}")
+        default = next(
+            (
+                index
+                for index, spectrum in enumerate(self.spectra)
+                if np.isclose(spectrum.damping_ratio, DEFAULT_DAMPING_RATIO)
+            ),
+            0,
+        )
+        self.damping_combo.setCurrentIndex(default if self.spectra else -1)
+        self.damping_combo.blockSignals(False)
+
+        self._show(self.current_spectrum())
+
+    def current_spectrum(self) -> Optional["ResponseSpectrumSet"]:
+        index = self.damping_combo.currentIndex()
+        if 0 <= index < len(self.spectra):
+            return self.spectra[index]
+        return None
+
+    def _on_damping_changed(self, _index: int):
+        self._show(self.current_spectrum())
+
+    def _show(self, spectrum: Optional["ResponseSpectrumSet"]):
+        """Draw one damping ratio's records and envelopes."""
+        for line in self._record_lines:
+            self.plot_widget.removeItem(line)
+        self._record_lines = []
+
+        if spectrum is None or spectrum.psa.size == 0:
+            self.mean_line.setData([], [])
+            self.upper_line.setData([], [])
+            self.lower_line.setData([], [])
+            return
+
+        record_pen = pg.mkPen(COLORS['text_secondary'], width=1)
+        for values in spectrum.psa:
+            # Added directly to the plot item so records stay out of the legend
+            line = pg.PlotDataItem(spectrum.periods, values, pen=record_pen)
+            line.setOpacity(0.5)
+            self.plot_widget.addItem(line)
+            self._record_lines.append(line)
+
+        mean, std = spectrum.mean, spectrum.std
+        self.mean_line.setData(spectrum.periods, mean)
+        self.upper_line.setData(spectrum.periods, mean + std)
+        self.lower_line.setData(spectrum.periods, np.maximum(mean - std, 0.0))
+        # Keep the envelopes drawn above the records
+        for line in (self.lower_line, self.upper_line, self.mean_line):
+            line.setZValue(1)
+
+        self.plot_widget.enableAutoRange()
+
+    def clear(self):
+        """Clear the view."""
+        self.set_data([])
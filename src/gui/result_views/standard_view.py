@@ -19,6 +19,8 @@ def __init__(self, parent: QWidget | None = None) -> None:
         self.table = ResultsTableWidget()
         self.plot = ResultsPlotWidget()
         self._initial_sizes_set = False
+        self._dataset: ResultDataset | None = None
+        self._shorthand_mapping: dict | None = None
 
         self._configure_layout()
         self._connect_signals()
@@ -35,22 +37,49 @@ def showEvent(self, event) -> None:
             QTimer.singleShot(0, self._apply_splitter_proportions)
             self._initial_sizes_set = True
 
-    def set_dataset(self, dataset: ResultDataset, shorthand_mapping: dict = None) -> None:
+    def set_dataset(
+        self,
+        dataset: ResultDataset,
+        shorthand_mapping: dict = None,
+        acceptance_limit: float | None = None,
+    ) -> None:
         """
         Populate the table and plot with the provided dataset.
 
         Args:
             dataset: The result dataset to display
             shorthand_mapping: Optional mapping for pushover load case names (full -> shorthand)
+            acceptance_limit: Optional limit (display units) overlaid on table and plot
         """
-        self.table.load_dataset(dataset, shorthand_mapping=shorthand_mapping)
-        self.plot.load_dataset(dataset, shorthand_mapping=shorthand_mapping)
+        self._dataset = dataset
+        self._shorthand_mapping = shorthand_mapping
+        self.table.load_dataset(
+            dataset, shorthand_mapping=shorthand_mapping, acceptance_limit=acceptance_limit
+        )
+        self.plot.load_dataset(
+            dataset, shorthand_mapping=shorthand_mapping, acceptance_limit=acceptance_limit
+        )
 
         # Force splitter proportions after data is loaded
         QTimer.singleShot(100, self._apply_splitter_proportions)
 
+    @property
+    def dataset(self) -> ResultDataset | None:
+        """Dataset currently shown (None after ``clear``)."""
+        return self._dataset
+
+    def set_acceptance_limit(self, acceptance_limit: float | None) -> None:
+        """Redraw the current dataset with another acceptance limit overlay."""
+        if self._dataset is not None:
+            self.set_dataset(
+                self._dataset,
+                shorthand_mapping=self._shorthand_mapping,
+                acceptance_limit=acceptance_limit,
+            )
+
     def clear(self) -> None:
         """Reset both table and plot."""
+        self._dataset = None
         self.table.clear_data()
         self.plot.clear_plots()
 
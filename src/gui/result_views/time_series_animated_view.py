@@ -8,7 +8,7 @@
 
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import numpy as np
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
@@ -22,6 +22,9 @@
 from gui.styles import COLORS
 from gui.ui_helpers import create_styled_button
 
+if TYPE_CHECKING:
+    from database.time_series_store import LodPyramid
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +38,10 @@ class TimeSeriesPlotData:
     time_steps: List[float]  # Time values
     values_matrix: np.ndarray  # Shape: (num_stories, num_time_steps)
     unit: str  # Display unit
+    min_envelope: Optional[np.ndarray] = None  # Per story, precomputed by the store
+    max_envelope: Optional[np.ndarray] = None
+    lod: Optional["LodPyramid"] = None  # Min/max pyramid of values_matrix
+    scale: float = 1.0  # Display factor applied to values, envelopes and LOD levels
 
 
 class AnimatedBuildingProfilePlot(QWidget):
@@ -101,14 +108,20 @@ def set_data(self, data: TimeSeriesPlotData):
             self.clear()
             return
 
-        # Calculate envelope (max/min over all time steps)
-        self.max_envelope = np.max(data.values_matrix, axis=1)
-        self.min_envelope = np.min(data.values_matrix, axis=1)
+        # Envelope (max/min over all time steps), precomputed when read from the store
+        if data.max_envelope is not None and data.min_envelope is not None:
+            max_envelope, min_envelope = data.max_envelope, data.min_envelope
+        else:
+            max_envelope = np.max(data.values_matrix, axis=1)
+            min_envelope = np.min(data.values_matrix, axis=1)
+        self.max_envelope = np.asarray(max_envelope) * data.scale
+        self.min_envelope = np.asarray(min_envelope) * data.scale
 
         # Set up y-axis (stories) - data comes in ascending order (lowest floor first)
         # so position 0 = bottom = first story in list (lowest floor)
         num_stories = len(data.stories)
         story_positions = list(range(num_stories))
+        self._story_positions = np.arange(num_stories)
 
         # Configure y-axis with story labels (position 0 = bottom = lowest floor)
         y_axis = self.plot_widget.getAxis('left')
@@ -119,8 +132,8 @@ def set_data(self, data: TimeSeriesPlotData):
         self.plot_widget.setLabel('bottom', self.unit)
 
         # Calculate x-range from envelope
-        x_min = np.min(self.min_envelope)
-        x_max = np.max(self.max_envelope)
+        x_min = float(np.min(self.min_envelope))
+        x_max = float(np.max(self.max_envelope))
         x_padding = (x_max - x_min) * 0.1 if x_max != x_min else 1.0
         self.plot_widget.setXRange(x_min - x_padding, x_max + x_padding)
         self.plot_widget.setYRange(-0.5, num_stories - 0.5)
@@ -160,18 +173,17 @@ def update_frame(self, position: float):
 
         self.current_step = step
 
-        # Get values at current step
-        values_current = self.data.values_matrix[:, step]
+        # Get values at current step (one column; the matrix may be memory-mapped)
+        values_current = self.data.values_matrix[:, step] * self.data.scale
 
         # Interpolate with next step if we have a fractional component
         if interp_factor > 0 and step < num_steps - 1:
-            values_next = self.data.values_matrix[:, step + 1]
+            values_next = self.data.values_matrix[:, step + 1] * self.data.scale
             values = values_current + interp_factor * (values_next - values_current)
         else:
             values = values_current
 
-        story_positions = list(range(len(values)))
-        self.profile_line.setData(values, story_positions)
+        self.profile_line.setData(values, self._story_positions)
 
     def clear(self):
         """Clear the plot."""
@@ -189,6 +201,9 @@ class TimeSeriesAnimatedView(QWidget):
     # Number of interpolation sub-frames between each data step
     INTERP_FRAMES = 4  # 4 sub-frames means smoother transitions
 
+    # Longer records skip steps so one playback pass stays within this many frames
+    MAX_PLAYBACK_FRAMES = 2400  # 2 minutes at 1.0x
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -403,6 +418,12 @@ def _create_base_acceleration_plot(self) -> QWidget:
         plot_widget.setFixedHeight(112)  # Reduced height (75% of 150px)
         configure_time_series(plot_widget, x_label='Time [s]', y_label='Accel [g]')
 
+        # Pan/zoom along time; the curve is redrawn at the matching LOD level
+        view_box = plot_widget.getPlotItem().getViewBox()
+        view_box.setMouseEnabled(x=True, y=False)
+        view_box.sigXRangeChanged.connect(self._refresh_base_accel_curve)
+        view_box.sigResized.connect(self._refresh_base_accel_curve)
+
         # Elapsed time shading region (from start to current time)
         self._elapsed_region = pg.LinearRegionItem(
             values=[0, 0],
@@ -431,8 +452,9 @@ def _create_base_acceleration_plot(self) -> QWidget:
 
         # Store reference
         self._base_accel_plot_widget = plot_widget
-        self._base_accel_time_steps = []
-        self._base_accel_values = []
+        self._base_accel_data: Optional[TimeSeriesPlotData] = None
+        self._base_accel_lod: Optional["LodPyramid"] = None
+        self._base_accel_time_steps = np.empty(0)
         self._base_accel_start_time = 0
 
         return container
@@ -480,27 +502,11 @@ def set_data(
         # Set data for base story acceleration time series
         # Base story is the first story (index 0) after descending sort
         if accelerations is not None and accelerations.values_matrix.size > 0:
-            self._base_accel_time_steps = accelerations.time_steps
-            # Get base story (first row, index 0 = lowest floor)
-            self._base_accel_values = accelerations.values_matrix[0, :]
-            self._base_accel_start_time = min(self._base_accel_time_steps)
-
-            # Plot the full time series
-            self._base_accel_line.setData(self._base_accel_time_steps, self._base_accel_values)
-
-            # Set axis ranges
-            self._base_accel_plot_widget.setXRange(
-                self._base_accel_start_time,
-                max(self._base_accel_time_steps)
-            )
-            y_max = max(abs(np.min(self._base_accel_values)), abs(np.max(self._base_accel_values)))
-            self._base_accel_plot_widget.setYRange(-y_max * 1.1, y_max * 1.1)
-
-            # Reset elapsed region
-            self._elapsed_region.setRegion([self._base_accel_start_time, self._base_accel_start_time])
+            self._set_base_accel_data(accelerations)
         else:
-            self._base_accel_time_steps = []
-            self._base_accel_values = []
+            self._base_accel_data = None
+            self._base_accel_lod = None
+            self._base_accel_time_steps = np.empty(0)
             self._base_accel_start_time = 0
             self._base_accel_line.setData([], [])
             self._elapsed_region.setRegion([0, 0])
@@ -508,6 +514,55 @@ def set_data(
         # Reset to start
         self._reset_playback()
 
+    def _set_base_accel_data(self, accelerations: TimeSeriesPlotData):
+        """Show the base story (first row, index 0 = lowest floor) acceleration history."""
+        from database.time_series_store import LodPyramid
+
+        self._base_accel_data = accelerations
+        # Only the base row is drawn; build its pyramid when the data has none
+        self._base_accel_lod = accelerations.lod
+        if self._base_accel_lod is None:
+            self._base_accel_lod = LodPyramid.build(accelerations.values_matrix[:1, :])
+        self._base_accel_time_steps = np.asarray(accelerations.time_steps, dtype=np.float64)
+        self._base_accel_start_time = float(self._base_accel_time_steps[0])
+        end_time = float(self._base_accel_time_steps[-1])
+
+        if accelerations.min_envelope is not None and accelerations.max_envelope is not None:
+            low, high = accelerations.min_envelope[0], accelerations.max_envelope[0]
+        else:
+            base_row = accelerations.values_matrix[0, :]
+            low, high = np.min(base_row), np.max(base_row)
+        y_max = float(max(abs(low), abs(high))) * accelerations.scale
+
+        # Set axis ranges (panning stops at the record ends); the range change redraws the curve
+        view_box = self._base_accel_plot_widget.getPlotItem().getViewBox()
+        view_box.setLimits(xMin=self._base_accel_start_time, xMax=end_time)
+        self._base_accel_plot_widget.setYRange(-y_max * 1.1, y_max * 1.1)
+        self._base_accel_plot_widget.setXRange(self._base_accel_start_time, end_time, padding=0)
+        self._refresh_base_accel_curve()
+
+        # Reset elapsed region
+        self._elapsed_region.setRegion([self._base_accel_start_time, self._base_accel_start_time])
+
+    def _refresh_base_accel_curve(self, *_):
+        """Redraw the visible part of the base acceleration at the view's pixel width."""
+        data = self._base_accel_data
+        if data is None or self._base_accel_lod is None:
+            return
+
+        view_box = self._base_accel_plot_widget.getPlotItem().getViewBox()
+        (x_start, x_end), _ = view_box.viewRange()
+        time_steps = self._base_accel_time_steps
+        start = max(int(np.searchsorted(time_steps, x_start, side="right")) - 1, 0)
+        stop = min(int(np.searchsorted(time_steps, x_end, side="left")) + 1, len(time_steps))
+        # Hidden or not yet laid out views report no width; assume a typical one
+        pixels = int(view_box.width()) or 1000
+
+        times, points = self._base_accel_lod.peak_series(
+            0, time_steps, data.values_matrix, start, max(stop, start + 1), pixels
+        )
+        self._base_accel_line.setData(times, points * data.scale)
+
     def _toggle_playback(self):
         """Toggle play/pause."""
         if self.is_playing:
@@ -545,8 +600,9 @@ def _advance_frame(self):
 
         num_steps = len(self.time_steps)
 
-        # Advance by a fraction of a step for smooth interpolation
-        step_increment = 1.0 / self.INTERP_FRAMES
+        # Advance by a fraction of a step for smooth interpolation; long records
+        # skip steps instead so playback does not take hours
+        step_increment = max(1.0 / self.INTERP_FRAMES, num_steps / self.MAX_PLAYBACK_FRAMES)
         self._current_position += step_increment
 
         # Loop back to start when we reach the end
@@ -675,8 +731,9 @@ def clear(self):
         self.force_plot.clear()
 
         # Clear base acceleration plot
-        self._base_accel_time_steps = []
-        self._base_accel_values = []
+        self._base_accel_data = None
+        self._base_accel_lod = None
+        self._base_accel_time_steps = np.empty(0)
         self._base_accel_start_time = 0
         self._base_accel_line.setData([], [])
         self._time_marker.setValue(0)
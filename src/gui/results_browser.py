@@ -73,7 +73,7 @@ def refresh(self) -> None:
             return
 
         for context in contexts:
-            data_service = DataAccessService(context.session)
+            data_service = DataAccessService(context.session, context.result_set_session_factory)
             project = data_service.get_project_by_name(context.name)
             if not project:
                 continue
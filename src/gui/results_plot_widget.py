@@ -21,6 +21,7 @@
 import pandas as pd
 import pyqtgraph as pg
 
+from config.acceptance_criteria import DCR_COLORS
 from utils.plot_builder import PlotBuilder
 from services.result_service import ResultDataset
 from config.visual_config import (
@@ -50,6 +51,7 @@ def __init__(self, parent=None):
         self._average_plot_item = None
         self._envelope_fill_item = None  # Store envelope fill for shading
         self._shorthand_mapping: dict = {}  # Full name -> shorthand for legend display
+        self._acceptance_limit: Optional[float] = None  # Drawn as limit lines when set
         self.setup_ui()
 
         # Connect to settings changes
@@ -250,13 +252,19 @@ def _add_envelope_fill(
         )
         plot.addItem(self._envelope_fill_item)
 
-    def load_dataset(self, dataset: ResultDataset, shorthand_mapping: dict = None) -> None:
+    def load_dataset(
+        self,
+        dataset: ResultDataset,
+        shorthand_mapping: dict = None,
+        acceptance_limit: Optional[float] = None,
+    ) -> None:
         """
         Load data and generate plots from a ResultDataset.
 
         Args:
             dataset: The result dataset to display
             shorthand_mapping: Optional mapping of full names to shorthand for legend display
+            acceptance_limit: Optional limit (display units) drawn as dashed lines at +/- limit
         """
         self._current_selection.clear()
         self._average_plot_item = None
@@ -267,6 +275,7 @@ def load_dataset(self, dataset: ResultDataset, shorthand_mapping: dict = None) -
         # Set dataset and mapping AFTER clearing (clear_plots sets current_dataset to None)
         self.current_dataset = dataset
         self._shorthand_mapping = shorthand_mapping if shorthand_mapping is not None else {}
+        self._acceptance_limit = abs(acceptance_limit) if acceptance_limit else None
 
         logger.debug(
             "Plot received shorthand_mapping: %s, length: %s",
@@ -318,8 +327,11 @@ def _plot_envelope(self, dataset: ResultDataset):
         if not numeric_cols:
             return
 
-        # Calculate max value for each story
-        max_values = df[numeric_cols].max(axis=1).tolist()
+        # Max value for each story: the stored/computed Max summary column when present
+        if "Max" in dataset.summary_columns:
+            max_values = df["Max"].tolist()
+        else:
+            max_values = df[numeric_cols].max(axis=1).tolist()
 
         # Plot as bar chart
         bargraph = pg.BarGraphItem(
@@ -558,6 +570,8 @@ def _plot_building_profile(self, dataset: ResultDataset):
             if include_base_anchor:
                 min_val = min(min_val, 0.0)
                 max_val = max(max_val, 0.0)
+            if self._acceptance_limit:
+                min_val, max_val = self._add_limit_lines(plot, container, min_val, max_val)
             # Small padding (3% on left, 5% on right for legend/label space)
             builder.set_value_range(min_val, max_val, left_padding=0.03, right_padding=0.05)
 
@@ -572,6 +586,27 @@ def _plot_building_profile(self, dataset: ResultDataset):
         # Finalize legend (add stretch to incomplete last row)
         self._finalize_legend(container)
 
+    def _add_limit_lines(self, plot: pg.PlotWidget, container, min_val: float, max_val: float):
+        """Draw the acceptance limit on the sides the data occupies; returns the widened range."""
+        limit = self._acceptance_limit
+        positions = [limit] if max_val > 0 else []
+        if min_val < 0:
+            positions.append(-limit)
+        for position in positions:
+            plot.addItem(
+                pg.InfiniteLine(
+                    pos=position,
+                    angle=90,
+                    movable=False,
+                    pen=pg.mkPen(DCR_COLORS["exceeded"], width=2, style=Qt.PenStyle.DashLine),
+                )
+            )
+        if positions:
+            self._add_legend_item(
+                container, DCR_COLORS["exceeded"], "Limit", pen_style=Qt.PenStyle.DashLine
+            )
+        return min(min_val, *positions), max(max_val, *positions)
+
     def _configure_bottom_axis_labels(self, plot: pg.PlotWidget, dataset: ResultDataset) -> None:
         """Keep drift tick labels in table units instead of PyQtGraph SI-scaled units."""
         axis = plot.getAxis("bottom")
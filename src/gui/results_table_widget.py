@@ -7,7 +7,7 @@
 
 import pandas as pd
 from PyQt6.QtCore import QEvent, Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont, QPainter, QPen
+from PyQt6.QtGui import QBrush, QColor, QFont, QPainter, QPen
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QFrame,
@@ -20,6 +20,8 @@
     QWidget,
 )
 
+from config.acceptance_criteria import DCR_COLORS, dcr_band
+from processing.acceptance import ratio_frame
 from utils.color_utils import get_gradient_color
 from .components.results_table_header import ClickableTableWidget, SelectableHeaderView, PerimeterBorderDelegate
 
@@ -250,13 +252,20 @@ def clear_shorthand_mapping(self):
         self._shorthand_mapping = {}
         self._reverse_mapping = {}
 
-    def load_dataset(self, dataset: "ResultDataset", shorthand_mapping: dict = None):
+    def load_dataset(
+        self,
+        dataset: "ResultDataset",
+        shorthand_mapping: dict = None,
+        acceptance_limit: Optional[float] = None,
+    ):
         """
         Load data from a ResultDataset into the table.
 
         Args:
             dataset: The result dataset to display
             shorthand_mapping: Optional mapping of full names to shorthand for column headers
+            acceptance_limit: Optional limit (display units); cells approaching or
+                exceeding it get a demand-to-capacity colour overlay
         """
         df = dataset.data
 
@@ -306,9 +315,25 @@ def load_dataset(self, dataset: "ResultDataset", shorthand_mapping: dict = None)
             logger.debug("Setting headers WITHOUT mapping (using original names): %s", column_names[:3])
             self.table.setHorizontalHeaderLabels(column_names)
 
-        min_val, max_val = self._compute_value_range(df, self._load_case_columns)
+        stored_range = (
+            dataset.summary.value_range(self._load_case_columns) if dataset.summary else None
+        )
+        if stored_range is not None:
+            min_val, max_val = stored_range
+            if min_val == max_val:
+                max_val = min_val + 1e-6
+        else:
+            min_val, max_val = self._compute_value_range(df, self._load_case_columns)
         config = dataset.config
 
+        ratio_columns = [col for col in column_names if col != "Story"]
+        ratios = (
+            ratio_frame(df, ratio_columns, acceptance_limit).to_numpy()
+            if acceptance_limit
+            else None
+        )
+        ratio_positions = {col: pos for pos, col in enumerate(ratio_columns)}
+
         for row_idx in range(row_count):
             for col_idx, col_name in enumerate(column_names):
                 item = QTableWidgetItem()
@@ -343,11 +368,39 @@ def load_dataset(self, dataset: "ResultDataset", shorthand_mapping: dict = None)
                         item.setForeground(default_color)
                         item._original_color = QColor(default_color)
 
+                    if ratios is not None:
+                        self._apply_acceptance_overlay(
+                            item, ratios[row_idx, ratio_positions[col_name]]
+                        )
+
                 self.table.setItem(row_idx, col_idx, item)
 
         self._resize_columns(column_count)
         self._update_header_styling()
 
+    @staticmethod
+    def _apply_acceptance_overlay(item: QTableWidgetItem, ratio: float) -> None:
+        """Tint a cell approaching or exceeding the acceptance limit."""
+        band = dcr_band(ratio)
+        if band is None:
+            return
+        overlay = QColor(DCR_COLORS[band])
+        overlay.setAlpha(70)
+        item._overlay_color = overlay
+        item.setData(Qt.ItemDataRole.BackgroundRole, overlay)
+        item.setToolTip(f"D/C {ratio:.2f}")
+
+    @staticmethod
+    def _apply_background(item: QTableWidgetItem, bg_color: Optional[QColor]) -> None:
+        """Selection colour if any, else the acceptance overlay (or no background)."""
+        color = bg_color if bg_color is not None else getattr(item, "_overlay_color", None)
+        if color is not None:
+            item.setBackground(QBrush(color))
+            item.setData(Qt.ItemDataRole.BackgroundRole, color)
+        else:
+            item.setBackground(QBrush())
+            item.setData(Qt.ItemDataRole.BackgroundRole, None)
+
     def _resize_columns(self, column_count: int) -> None:
         """Apply width constraints based on column type counts."""
         story_column_width = 52  # Reduced for 10px font
@@ -545,7 +598,7 @@ def eventFilter(self, obj, event):
 
     def _apply_row_style(self, table, row):
         """Apply style to a row based on selection and column selection state."""
-        from PyQt6.QtGui import QColor, QBrush
+        from PyQt6.QtGui import QColor
 
         if row < 0 or row >= table.rowCount():
             return
@@ -575,13 +628,7 @@ def _apply_row_style(self, table, row):
             else:
                 bg_color = None
 
-            if bg_color:
-                brush = QBrush(bg_color)
-                item.setBackground(brush)
-                item.setData(Qt.ItemDataRole.BackgroundRole, bg_color)
-            else:
-                item.setBackground(QBrush())
-                item.setData(Qt.ItemDataRole.BackgroundRole, None)
+            self._apply_background(item, bg_color)
 
             # Set bold for selected cells (column or row selection)
             should_bold = is_col_selected or is_row_selected
@@ -600,7 +647,7 @@ def _update_header_styling(self):
 
     def _update_column_highlighting(self):
         """Apply gentle background highlight and bold text to selected columns and rows."""
-        from PyQt6.QtGui import QBrush, QColor
+        from PyQt6.QtGui import QColor
 
         # Colors for different states
         col_select_color = QColor("#1a2a30")  # Gentle teal tint for column selection
@@ -628,12 +675,7 @@ def _update_column_highlighting(self):
                 else:
                     bg_color = None
 
-                if bg_color:
-                    item.setBackground(QBrush(bg_color))
-                    item.setData(Qt.ItemDataRole.BackgroundRole, bg_color)
-                else:
-                    item.setBackground(QBrush())
-                    item.setData(Qt.ItemDataRole.BackgroundRole, None)
+                self._apply_background(item, bg_color)
 
                 # Set bold for selected cells (column or row selection)
                 # But preserve hover bold state if cell is currently hovered
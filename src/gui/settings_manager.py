@@ -16,6 +16,10 @@
     "plot_shading_enabled": False,
     "plot_shading_opacity": 0.15,  # 15% opacity for subtle shading
     "layout_borders_enabled": False,  # Show borders between layout zones
+    "prescan_workers": 0,  # Folder prescan workers (0 = RPS_PRESCAN_WORKERS or CPU count)
+    "acceptance_overlay_enabled": True,  # Colour results against acceptance limits
+    "acceptance_limits": {},  # Limit overrides keyed by AcceptanceLimit.key
+    "sql_profiling_enabled": False,  # Profile SQL statements (also RPS_SQL_PROFILE=1)
 }
 
 # Settings file location
@@ -106,6 +110,33 @@ def layout_borders_enabled(self) -> bool:
     def layout_borders_enabled(self, value: bool):
         self.set("layout_borders_enabled", value)
 
+    @property
+    def acceptance_overlay_enabled(self) -> bool:
+        """Whether tables and plots show acceptance limit overlays."""
+        return self._settings.get("acceptance_overlay_enabled", True)
+
+    @acceptance_overlay_enabled.setter
+    def acceptance_overlay_enabled(self, value: bool):
+        self.set("acceptance_overlay_enabled", value)
+
+    @property
+    def acceptance_limits(self) -> dict:
+        """Acceptance limit overrides (AcceptanceLimit.key -> limit in display units)."""
+        return dict(self._settings.get("acceptance_limits", {}))
+
+    @acceptance_limits.setter
+    def acceptance_limits(self, value: dict):
+        self.set("acceptance_limits", dict(value))
+
+    @property
+    def sql_profiling_enabled(self) -> bool:
+        """Whether SQL statements are profiled (see database.query_profile)."""
+        return self._settings.get("sql_profiling_enabled", False)
+
+    @sql_profiling_enabled.setter
+    def sql_profiling_enabled(self, value: bool):
+        self.set("sql_profiling_enabled", value)
+
 
 # Global instance
 settings = SettingsManager()
@@ -115,6 +115,8 @@ def on_item_clicked(
     # Time-Series clicks
     elif item_type == "time_series_global":
         _handle_time_series_global(browser, data)
+    elif item_type == "response_spectrum":
+        _handle_response_spectrum(browser, data)
 
 
 # ============================================================================
@@ -468,3 +470,11 @@ def _handle_time_series_global(browser: "ResultsTreeBrowser", data: dict) -> Non
     # Encode load_case_name in direction parameter as "direction:load_case_name"
     direction_with_load_case = f"{direction}:{load_case_name}" if load_case_name else direction
     browser.selection_changed.emit(result_set_id, category, "TimeSeriesGlobal", direction_with_load_case, 0)
+
+
+def _handle_response_spectrum(browser: "ResultsTreeBrowser", data: dict) -> None:
+    """Handle Response Spectra click (base acceleration spectra of all records)."""
+    result_set_id = data.get("result_set_id")
+    category = data.get("category")  # "Time-Series"
+    direction = data.get("direction", "X")
+    browser.selection_changed.emit(result_set_id, category, "ResponseSpectrum", direction, 0)
@@ -142,6 +142,7 @@ def add_result_set(browser: "ResultsTreeBrowser", parent_item: QTreeWidgetItem,
 
         # Add Time-Series Global section
         add_time_series_global_section(browser, timeseries_item, result_set.id)
+        add_response_spectrum_section(browser, timeseries_item, result_set.id)
 
 
 def add_drifts_section(browser: "ResultsTreeBrowser", parent_item: QTreeWidgetItem, result_set_id: int, expand_first_path: bool = True) -> None:
@@ -980,3 +981,36 @@ def add_time_series_global_section(browser: "ResultsTreeBrowser", parent_item: Q
             "load_case_name": load_case_name,
             "direction": "Y"
         })
+
+
+def add_response_spectrum_section(browser: "ResultsTreeBrowser", parent_item: QTreeWidgetItem, result_set_id: int) -> None:
+    """Add Response Spectra section (base acceleration spectra of all load cases).
+
+    Structure:
+    └── Time-Series
+        └── Response Spectra
+            ├── X Direction
+            └── Y Direction
+    """
+    if not browser.time_series_load_cases.get(result_set_id):
+        return
+
+    spectra_item = QTreeWidgetItem(parent_item)
+    spectra_item.setText(0, "› Response Spectra")
+    spectra_item.setData(0, Qt.ItemDataRole.UserRole, {
+        "type": "category_type",
+        "result_set_id": result_set_id,
+        "category": "Time-Series",
+        "category_type": "ResponseSpectra"
+    })
+    spectra_item.setExpanded(True)
+
+    for prefix, direction in (("├", "X"), ("└", "Y")):
+        item = QTreeWidgetItem(spectra_item)
+        item.setText(0, f"  {prefix} {direction} Direction")
+        item.setData(0, Qt.ItemDataRole.UserRole, {
+            "type": "response_spectrum",
+            "result_set_id": result_set_id,
+            "category": "Time-Series",
+            "direction": direction
+        })
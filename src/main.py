@@ -2,62 +2,135 @@
 Results Processing System (RPS) - Main Entry Point
 
 A desktop application for processing structural engineering results from ETABS/SAP2000.
+
+Startup is ordered so a splash screen paints before the heavy imports
+(SQLAlchemy, the main window); the project detail window, dialogs and the
+pandas/pyqtgraph stacks are imported on first use. Set RPS_STARTUP_PROFILE=1
+to log a phase and import-time breakdown to the JSON log.
 """
 
+import multiprocessing
 import sys
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
 
-from gui.main_window import MainWindow
-from gui.styles import get_stylesheet
-from gui.window_utils import set_windows_app_id
-from gui.icon_utils import set_app_icons
-from database.session import init_catalog_db as init_db
-from utils.env import is_dev_mode
-from utils.logging_utils import setup_logging
+from utils.startup_profile import StartupProfiler
 
 
 def main():
     """Main application entry point."""
-    # Configure structured logging early so background threads use it
-    log_file = setup_logging()
+    profiler = StartupProfiler.from_env()
+
+    with profiler.phase("logging"):
+        from utils.logging_utils import setup_logging
+
+        # Configure structured logging early so background threads use it
+        log_file = setup_logging()
+
+        from utils.metrics import start_metrics_export
+
+        # Periodic metric rollups to data/logs/metrics.jsonl
+        start_metrics_export()
+
+    with profiler.phase("qt_app"):
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtGui import QFont
+
+        from gui.window_utils import set_windows_app_id
+        from gui.icon_utils import set_app_icons
+
+        # Set Windows-specific app ID for taskbar
+        set_windows_app_id("StructuralEng.RPS.App.1.0")
+
+        # Create Qt application
+        app = QApplication(sys.argv)
+        app.setApplicationName("Results Processing System")
+        app.setOrganizationName("StructuralEngineering")
+
+        # Enable high DPI scaling
+        QApplication.setHighDpiScaleFactorRoundingPolicy(
+            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+        )
+
+        # Set modern font
+        font = QFont("Segoe UI", 10)
+        app.setFont(font)
 
-    # Initialize database (create tables if they don't exist)
-    init_db()
+        # Set application icon
+        set_app_icons(app)
 
-    # Set Windows-specific app ID for taskbar
-    set_windows_app_id("StructuralEng.RPS.App.1.0")
+    with profiler.phase("splash"):
+        splash = _show_splash(app)
+    profiler.mark("splash_painted")
 
-    # Create Qt application
-    app = QApplication(sys.argv)
-    app.setApplicationName("Results Processing System")
-    app.setOrganizationName("StructuralEngineering")
+    with profiler.phase("catalog_db"):
+        from database.session import init_catalog_db as init_db
 
-    # Enable high DPI scaling
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
+        # Initialize database (create tables if they don't exist)
+        init_db()
 
-    # Set modern font
-    font = QFont("Segoe UI", 10)
-    app.setFont(font)
+        from database.session import set_query_profiling_enabled
+        from gui.settings_manager import settings
 
-    # Set application icon
-    set_app_icons(app)
+        # SQL profiling is opt-in: RPS_SQL_PROFILE=1 or the Diagnostics setting
+        if settings.sql_profiling_enabled:
+            set_query_profiling_enabled(True)
 
-    # Apply modern dark theme stylesheet
-    app.setStyleSheet(get_stylesheet())
+    with profiler.phase("main_window"):
+        from gui.main_window import MainWindow
+        from gui.styles import get_stylesheet
 
-    # Create and show main window
-    window = MainWindow()
-    window.statusBar().showMessage(f"Logs: {log_file}")
-    # Launch maximized by default for a full-screen project view
-    window.showMaximized()
+        # Apply modern dark theme stylesheet
+        app.setStyleSheet(get_stylesheet())
+
+        # Create and show main window
+        window = MainWindow()
+        window.statusBar().showMessage(f"Logs: {log_file}")
+        # Launch maximized by default for a full-screen project view
+        window.showMaximized()
+        if splash is not None:
+            splash.finish(window)
+
+    if profiler.enabled:
+        from PyQt6.QtCore import QTimer
+
+        # Runs once the event loop has painted the first frame of the window
+        QTimer.singleShot(0, lambda: (profiler.mark("first_paint"), profiler.report()))
 
     # Start event loop
     sys.exit(app.exec())
 
 
+def _show_splash(app):
+    """Paint the logo splash before the remaining imports run."""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QColor, QPainter, QPixmap
+    from PyQt6.QtWidgets import QSplashScreen
+
+    from gui.icon_utils import ICONS_DIR
+    from gui.styles import COLORS
+
+    # QSplashScreen waits up to a second for a window expose that headless platforms never send
+    if app.platformName() in {"offscreen", "minimal"}:
+        return None
+
+    logo = QPixmap(str(ICONS_DIR / "RPS_Logo.png"))
+    if logo.isNull():
+        return None
+
+    logo = logo.scaledToWidth(360, Qt.TransformationMode.SmoothTransformation)
+    canvas = QPixmap(logo.width() + 80, logo.height() + 80)
+    canvas.fill(QColor(COLORS["background"]))
+    painter = QPainter(canvas)
+    painter.drawPixmap(40, 40, logo)
+    painter.end()
+
+    splash = QSplashScreen(canvas)
+    splash.show()
+    app.processEvents()
+    return splash
+
+
 if __name__ == "__main__":
+    # Parser worker processes (time-history batch import) re-enter the frozen executable
+    multiprocessing.freeze_support()
     main()
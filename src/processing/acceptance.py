@@ -0,0 +1,205 @@
+"""Demand-to-capacity ratios of result rows against acceptance limits.
+
+Rows are stories (global results), element stories (element results) or
+foundation joints (joint results) of one result type in one result set.
+:func:`row_demands` reduces the cache matrices once to per-row demands in
+display units:
+
+- peak: largest |value| across load cases (and the load case it occurs in),
+- mean: |Avg| across load cases, as in the table summary columns.
+
+:func:`evaluate` divides them by a per-row capacity vector, built from the
+limits of each distinct element name, so a limit change costs one vector
+division over the whole result set (see ``services.acceptance``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from config.acceptance_criteria import DCR_EXCEEDED, DCR_TOLERANCE, AcceptanceLimit, resolve_limit
+from processing.result_transformers import ResultTransformer, row_statistics
+
+STATISTICS = ("peak", "mean")
+
+
+@dataclass
+class RowDemands:
+    """Per-row absolute demands of one result type in one result set."""
+
+    result_type: str
+    load_cases: List[str]
+    peak: np.ndarray  # Largest |value| per row (NaN without values)
+    peak_case: np.ndarray  # Load case index of the peak (-1 without values)
+    mean: np.ndarray  # |Avg| per row
+    locations: List[str]  # Story name or joint unique name per row
+    element_codes: np.ndarray  # Index into ``element_names`` per row
+    element_names: List[Optional[str]] = field(default_factory=lambda: [None])
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+
+@dataclass(frozen=True)
+class GoverningRatio:
+    """Row with the largest demand-to-capacity ratio."""
+
+    element: Optional[str]
+    location: str
+    load_case: Optional[str]
+    demand: float
+    capacity: float
+    ratio: float
+
+
+@dataclass
+class AcceptanceLayer:
+    """Demand-to-capacity ratios of every row of a ``RowDemands``."""
+
+    demands: RowDemands
+    capacities: np.ndarray  # Per row, NaN where no limit applies
+    peak_ratios: np.ndarray
+    mean_ratios: np.ndarray
+
+    def ratios(self, statistic: str = "peak") -> np.ndarray:
+        """Ratios of the 'peak' or 'mean' demands."""
+        if statistic not in STATISTICS:
+            raise ValueError(f"Unknown statistic: {statistic}. Available: {', '.join(STATISTICS)}")
+        return self.peak_ratios if statistic == "peak" else self.mean_ratios
+
+    @property
+    def checked_rows(self) -> int:
+        """Rows with a limit."""
+        return int(np.count_nonzero(~np.isnan(self.capacities)))
+
+    def max_ratio(self, statistic: str = "peak") -> Optional[float]:
+        """Largest ratio, or None when no row has both a demand and a limit."""
+        ratios = self.ratios(statistic)
+        if not len(ratios):
+            return None
+        value = np.fmax.reduce(ratios)
+        return None if np.isnan(value) else float(value)
+
+    def count_exceeding(self, statistic: str = "peak", threshold: float = DCR_EXCEEDED) -> int:
+        """Rows whose ratio reaches ``threshold``."""
+        return int(np.count_nonzero(self.ratios(statistic) >= threshold - DCR_TOLERANCE))
+
+    def governing(self, statistic: str = "peak") -> Optional[GoverningRatio]:
+        """The row with the largest ratio."""
+        if self.max_ratio(statistic) is None:
+            return None
+        ratios = self.ratios(statistic)
+        row = int(np.nanargmax(ratios))
+        demands = self.demands
+        load_case = None
+        if statistic == "peak" and demands.peak_case[row] >= 0:
+            load_case = demands.load_cases[demands.peak_case[row]]
+        source = demands.peak if statistic == "peak" else demands.mean
+        return GoverningRatio(
+            element=demands.element_names[demands.element_codes[row]],
+            location=demands.locations[row],
+            load_case=load_case,
+            demand=float(source[row]),
+            capacity=float(self.capacities[row]),
+            ratio=float(ratios[row]),
+        )
+
+
+def row_demands(
+    result_type: str,
+    matrices: Iterable[Mapping[str, Any]],
+    locations: Sequence[str],
+    element_names: Optional[Sequence[str]] = None,
+    multiplier: float = 1.0,
+    transformer: Optional[ResultTransformer] = None,
+) -> RowDemands:
+    """Per-row demands of cache matrices, in display units.
+
+    Args:
+        result_type: Result config key the limits are declared for
+        matrices: Results matrix per row (load case -> value)
+        locations: Story name or joint unique name per row
+        element_names: Element name per row (None for story and joint results)
+        multiplier: Display multiplier of the result type
+        transformer: Filters and renames matrix columns first (global results)
+    """
+    frame = pd.DataFrame([matrix or {} for matrix in matrices])
+    if transformer is not None:
+        frame = transformer.clean_column_names(transformer.filter_columns(frame))
+    numeric = frame.apply(pd.to_numeric, errors="coerce")
+    load_cases = [str(column) for column in numeric.columns]
+
+    stats = row_statistics(numeric)
+    peak = np.fmax(stats["Max"].abs().to_numpy(), stats["Min"].abs().to_numpy()) * multiplier
+    mean = stats["Avg"].abs().to_numpy() * multiplier
+    if load_cases:
+        magnitudes = np.abs(numeric.to_numpy(dtype=float))
+        peak_case = np.where(np.isnan(magnitudes), -np.inf, magnitudes).argmax(axis=1)
+        peak_case[np.isnan(peak)] = -1
+    else:
+        peak_case = np.full(len(numeric), -1)
+
+    if element_names is None:
+        codes, names = np.zeros(len(numeric), dtype=np.intp), [None]
+    else:
+        codes, uniques = pd.factorize(pd.Series(list(element_names), dtype=object))
+        names = list(uniques)
+
+    return RowDemands(
+        result_type=result_type,
+        load_cases=load_cases,
+        peak=peak.astype(float),
+        peak_case=peak_case,
+        mean=mean.astype(float),
+        locations=list(locations),
+        element_codes=codes,
+        element_names=names,
+    )
+
+
+def evaluate(demands: RowDemands, limits: Iterable[AcceptanceLimit]) -> AcceptanceLayer:
+    """Demand-to-capacity ratios of every row against ``limits``.
+
+    Limits are resolved once per distinct element name; rows get their
+    capacity by index, so the cost is dominated by two vector divisions.
+    """
+    limits = tuple(limits)
+    per_name = np.array(
+        [resolve_limit(limits, demands.result_type, name) for name in demands.element_names],
+        dtype=float,
+    )
+    capacities = per_name[demands.element_codes] if len(demands) else np.empty(0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        peak_ratios = demands.peak / capacities
+        mean_ratios = demands.mean / capacities
+    return AcceptanceLayer(
+        demands=demands,
+        capacities=capacities,
+        peak_ratios=peak_ratios,
+        mean_ratios=mean_ratios,
+    )
+
+
+def ratio_frame(
+    frame: pd.DataFrame, columns: Sequence[str], limit: Optional[float]
+) -> pd.DataFrame:
+    """|value| / limit for ``columns`` of a display frame (NaN where not numeric)."""
+    numeric = frame.loc[:, list(columns)].apply(pd.to_numeric, errors="coerce")
+    if not limit:
+        return numeric * np.nan
+    return numeric.abs() / abs(limit)
+
+
+__all__ = [
+    "STATISTICS",
+    "AcceptanceLayer",
+    "GoverningRatio",
+    "RowDemands",
+    "evaluate",
+    "ratio_frame",
+    "row_demands",
+]
@@ -65,8 +65,10 @@ def __init__(
         result_types: Optional[Iterable[str]] = None,
         session_factory: Optional[Callable[[], Session]] = None,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        result_set_session_factory: Optional[Callable[[int], Callable[[], Session]]] = None,
     ) -> None:
         super().__init__(result_types=result_types, session_factory=session_factory)
+        self._result_set_session_factory = result_set_session_factory
 
         self.folder_path = Path(folder_path)
         if not self.folder_path.exists() or not self.folder_path.is_dir():
@@ -81,6 +83,30 @@ def _find_excel_files(self) -> List[Path]:
             files.extend(self.folder_path.glob(pattern))
         return sorted(f for f in files if not f.name.startswith("~$"))
 
+    def _import_session_factory(
+        self, project_name: str, result_set_name: str
+    ) -> Callable[[], Session]:
+        """Session factory for writing into a result set.
+
+        Existing result sets are routed through ``result_set_session_factory``
+        (their shard, when they have one); new ones are created in the project.
+        """
+        if self._result_set_session_factory is None:
+            return self._session_factory
+
+        from database.repositories import ProjectRepository, ResultSetRepository
+
+        session = self._session_factory()
+        try:
+            project = ProjectRepository(session).get_by_name(project_name)
+            result_sets = ResultSetRepository(session).get_by_project(project.id) if project else []
+            result_set_id = next((rs.id for rs in result_sets if rs.name == result_set_name), None)
+        finally:
+            session.close()
+        if result_set_id is None:
+            return self._session_factory
+        return self._result_set_session_factory(result_set_id)
+
     def _report_progress(self, message: str, current: int, total: int) -> None:
         if self.progress_callback:
             self.progress_callback(message, current, total)
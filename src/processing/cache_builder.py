@@ -11,6 +11,12 @@
 Performance Note:
     All cache methods use batched queries to minimize database round trips.
     Avoid per-record queries in cache building code.
+
+Summaries:
+    Each cache write also stores the per-row Avg/Max/Min, per-load-case extrema
+    and overall min/max of the result type (see processing.cache_summary), so
+    dataset builders do not recompute them on every read. Element caches also
+    store per-element peaks for governing-element queries.
 """
 
 from __future__ import annotations
@@ -23,6 +29,12 @@
 from sqlalchemy import and_
 
 from utils.error_handling import timed
+from processing.cache_summary import (
+    element_peaks,
+    element_summaries,
+    global_summaries,
+    joint_summary,
+)
 
 from database.repositories import (
     StoryRepository,
@@ -32,6 +44,8 @@
     ElementRepository,
     ElementCacheRepository,
     JointCacheRepository,
+    CacheSummaryRepository,
+    ElementPeakRepository,
 )
 from database.models import (
     StoryDrift,
@@ -78,6 +92,8 @@ def __init__(
         self._element_repo = ElementRepository(session)
         self._element_cache_repo = ElementCacheRepository(session)
         self._joint_cache_repo = JointCacheRepository(session)
+        self._summary_repo = CacheSummaryRepository(session)
+        self._peak_repo = ElementPeakRepository(session)
 
     @timed
     def generate_all(self) -> None:
@@ -123,6 +139,14 @@ def _replace_global_cache_entries(
             result_type=result_type,
             entries=entries,
         )
+        self._replace_summaries(
+            "global",
+            result_type,
+            [
+                {"direction": direction, **summary}
+                for direction, summary in global_summaries(result_type, story_matrices)
+            ],
+        )
 
     def _replace_element_cache_entries(
         self,
@@ -135,6 +159,20 @@ def _replace_element_cache_entries(
             result_type=result_type,
             entries=entries,
         )
+        self._replace_summaries(
+            "element",
+            result_type,
+            [
+                {"element_id": element_id, **summary}
+                for element_id, summary in element_summaries(entries)
+            ],
+        )
+        self._peak_repo.replace_peaks(
+            project_id=self.project_id,
+            result_set_id=self.result_set_id,
+            result_type=result_type,
+            peaks=element_peaks(entries),
+        )
 
     def _replace_joint_cache_entries(
         self,
@@ -147,6 +185,17 @@ def _replace_joint_cache_entries(
             result_type=result_type,
             entries=entries,
         )
+        summary = joint_summary(entries)
+        self._replace_summaries("joint", result_type, [summary] if summary else [])
+
+    def _replace_summaries(self, cache_kind: str, result_type: str, summaries: list[dict]) -> None:
+        self._summary_repo.replace_summaries(
+            project_id=self.project_id,
+            result_set_id=self.result_set_id,
+            cache_kind=cache_kind,
+            result_type=result_type,
+            summaries=summaries,
+        )
 
     # ------------------------------------------------------------------
     # Generic Config-Driven Caching
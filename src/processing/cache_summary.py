@@ -0,0 +1,195 @@
+"""Summary statistics stored next to the wide-format caches.
+
+``CacheBuilder`` computes them once per result type when it writes cache rows
+(see ``database.models.CacheSummary``):
+
+- per-row Avg/Max/Min across load cases (the table summary columns),
+- per-load-case maximum and minimum,
+- overall minimum and maximum (table colour scaling).
+
+Element caches also get per-element peaks (``database.models.ElementPeak``)
+for governing-element queries, see :func:`element_peaks`.
+
+Dataset builders read them with :func:`stored_statistics`, which returns
+None for result sets cached before summaries existed or when cache rows were
+rewritten after the summary, so callers recompute as before.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.result_config import RESULT_CONFIGS
+from processing.result_transformers import ResultTransformer, get_transformer, row_statistics
+
+STAT_COLUMNS = ("Avg", "Max", "Min")
+
+
+def _json_float(value: Any) -> Optional[float]:
+    """Float for JSON storage; NaN becomes None."""
+    if value is None:
+        return None
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def summarize_matrices(
+    matrices: Mapping[str, Mapping[str, Any]],
+    transformer: Optional[ResultTransformer] = None,
+) -> Dict[str, Any]:
+    """Summary of cache matrices keyed by row key.
+
+    Args:
+        matrices: Row key (story ID or unique name, as str) -> results matrix
+        transformer: Filters and renames matrix columns first, as the dataset
+            builder does for global results
+
+    Returns:
+        CacheSummary column values (row_stats, column_max, column_min,
+        min_value, max_value)
+    """
+    frame = pd.DataFrame(list(matrices.values()))
+    if transformer is not None:
+        frame = transformer.clean_column_names(transformer.filter_columns(frame))
+    numeric = frame.apply(pd.to_numeric, errors="coerce")
+    stats = row_statistics(numeric)
+
+    row_stats = {
+        key: [_json_float(value) for value in row]
+        for key, row in zip(matrices, stats[list(STAT_COLUMNS)].itertuples(index=False))
+    }
+    column_max = {str(col): _json_float(value) for col, value in numeric.max(axis=0).items()}
+    column_min = {str(col): _json_float(value) for col, value in numeric.min(axis=0).items()}
+    present_max = [value for value in column_max.values() if value is not None]
+    present_min = [value for value in column_min.values() if value is not None]
+    return {
+        "row_stats": row_stats,
+        "column_max": column_max,
+        "column_min": column_min,
+        "min_value": min(present_min) if present_min else None,
+        "max_value": max(present_max) if present_max else None,
+    }
+
+
+def global_summaries(
+    result_type: str, story_matrices: Mapping[int, Mapping[str, Any]]
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """(direction, summary) for each direction variant of a global result type.
+
+    Global matrices hold every direction ("TH01_X", "TH01_Y"), so each
+    direction is summarized through its own transformer, matching
+    ``build_standard_dataset``.
+    """
+    if not story_matrices:
+        return []
+    matrices = {str(story_id): matrix for story_id, matrix in story_matrices.items()}
+    prefix = f"{result_type}_"
+    summaries = []
+    for key in RESULT_CONFIGS:
+        if not key.startswith(prefix):
+            continue
+        summary = summarize_matrices(matrices, get_transformer(key))
+        if summary["column_max"]:
+            summaries.append((key[len(prefix) :], summary))
+    return summaries
+
+
+def element_summaries(entries: Iterable[Mapping[str, Any]]) -> List[Tuple[int, Dict[str, Any]]]:
+    """(element_id, summary) per element of element cache rows, rows keyed by story ID."""
+    grouped: Dict[int, Dict[str, Mapping[str, Any]]] = defaultdict(dict)
+    for entry in entries:
+        grouped[entry["element_id"]][str(entry["story_id"])] = entry["results_matrix"]
+    return [(element_id, summarize_matrices(matrices)) for element_id, matrices in grouped.items()]
+
+
+def joint_summary(entries: Sequence[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Summary of joint cache rows, keyed by unique name."""
+    if not entries:
+        return None
+    return summarize_matrices({entry["unique_name"]: entry["results_matrix"] for entry in entries})
+
+
+# ElementPeak value column -> (row statistic it is taken from, story column, largest first)
+PEAK_COLUMNS = {
+    "abs_avg": ("abs_avg", "abs_avg_story_id", True),
+    "abs_max": ("abs_max", "abs_max_story_id", True),
+    "max_value": ("Max", "max_story_id", True),
+    "min_value": ("Min", "min_story_id", False),
+}
+
+
+def element_peaks(entries: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """ElementPeak values per element of element cache rows.
+
+    Row statistics are computed for all rows at once; each element's peaks
+    are the extreme row statistics and the stories they occur at. Elements
+    without numeric values are left out.
+    """
+    entries = list(entries)
+    if not entries:
+        return []
+    numeric = pd.DataFrame([entry["results_matrix"] or {} for entry in entries]).apply(
+        pd.to_numeric, errors="coerce"
+    )
+    stats = row_statistics(numeric)
+    stats["abs_avg"] = stats["Avg"].abs()
+    stats["abs_max"] = np.fmax(stats["Max"].abs(), stats["Min"].abs())
+    stats["element_id"] = [entry["element_id"] for entry in entries]
+    stats["story_id"] = [entry["story_id"] for entry in entries]
+    stats = stats.dropna(subset=["Avg"])
+    if stats.empty:
+        return []
+
+    grouped = stats.groupby("element_id", sort=False)
+    peaks = pd.DataFrame(index=list(grouped.groups))
+    for column, (source, story_column, largest) in PEAK_COLUMNS.items():
+        rows = grouped[source].idxmax() if largest else grouped[source].idxmin()
+        peaks[column] = stats.loc[rows, source].to_numpy()
+        peaks[story_column] = stats.loc[rows, "story_id"].to_numpy()
+    peaks = peaks.rename_axis("element_id").reset_index()
+    return peaks.astype({"element_id": int}).to_dict("records")
+
+
+def stored_statistics(
+    summary: Any, keys: Sequence[str], entries: Iterable[Any]
+) -> Optional[pd.DataFrame]:
+    """Stored Avg/Max/Min rows for cache entries, or None to recompute.
+
+    Args:
+        summary: CacheSummary row (or None)
+        keys: Row key of each entry, in display order
+        entries: Cache rows the dataset is built from (checked for later updates)
+    """
+    if summary is None:
+        return None
+    row_stats = summary.row_stats or {}
+    if len(row_stats) != len(keys):
+        return None
+    built = summary.last_updated
+    if built is not None:
+        for entry in entries:
+            updated = getattr(entry, "last_updated", None)
+            if updated is not None and updated > built:
+                return None
+    try:
+        rows = [row_stats[key] for key in keys]
+    except KeyError:
+        return None
+    return pd.DataFrame(rows, columns=list(STAT_COLUMNS), dtype=float)
+
+
+__all__ = [
+    "STAT_COLUMNS",
+    "summarize_matrices",
+    "global_summaries",
+    "element_summaries",
+    "joint_summary",
+    "PEAK_COLUMNS",
+    "element_peaks",
+    "stored_statistics",
+]
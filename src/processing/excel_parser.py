@@ -8,6 +8,7 @@
 from typing import List, Tuple, Optional, Dict, Any
 
 from utils.error_handling import timed
+from .xlsx_scanner import XlsxScanner
 
 
 class ExcelParser:
@@ -27,13 +28,24 @@ def __init__(self, file_path: str):
         self._available_sheets: Optional[List[str]] = None
         self._column_forces_df: Optional[pd.DataFrame] = None
         self._brace_forces_df: Optional[pd.DataFrame] = None
+        self._scanner: Optional[XlsxScanner] = None
 
     def _get_excel_file(self) -> pd.ExcelFile:
         if self._excel_file is None:
             self._excel_file = pd.ExcelFile(self.file_path)
         return self._excel_file
 
+    def _get_scanner(self) -> Optional[XlsxScanner]:
+        """Zip-level scanner for .xlsx files (None for formats it cannot read)."""
+        if self._scanner is None and XlsxScanner.supports(self.file_path):
+            self._scanner = XlsxScanner(self.file_path)
+        return self._scanner
+
     def close(self) -> None:
+        scanner = getattr(self, '_scanner', None)
+        if scanner is not None:
+            scanner.close()
+            self._scanner = None
         excel_file = getattr(self, '_excel_file', None)
         if excel_file is not None:
             try:
@@ -238,7 +250,11 @@ def get_available_sheets(self) -> List[str]:
         """
         try:
             if self._available_sheets is None:
-                self._available_sheets = list(self._get_excel_file().sheet_names)
+                scanner = self._get_scanner()
+                if scanner is not None:
+                    self._available_sheets = scanner.sheet_names
+                else:
+                    self._available_sheets = list(self._get_excel_file().sheet_names)
             return list(self._available_sheets)
         except Exception as e:
             raise ValueError(f"Error reading Excel file: {e}")
@@ -280,6 +296,17 @@ def get_load_cases_only(self, sheet_name: str) -> Optional[List[str]]:
         if not self.validate_sheet_exists(sheet_name):
             return []
 
+        scanner = self._get_scanner()
+        if scanner is not None:
+            # Header on row 2, units on row 3 (standard ETABS layout)
+            try:
+                column = scanner.column_index(sheet_name, "Output Case", header_row=2)
+                if column is None:
+                    return None
+                return [str(case) for case in scanner.distinct_values(sheet_name, column, min_row=4)]
+            except Exception:
+                return None
+
         try:
             header_df = self._get_excel_file().parse(
                 sheet_name=sheet_name,
@@ -72,12 +72,14 @@ def __init__(
         session_factory: Optional[Callable[[], Session]] = None,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
         file_summaries: Optional[Dict[str, FilePrescanSummary]] = None,
+        result_set_session_factory: Optional[Callable[[int], Callable[[], Session]]] = None,
     ):
         super().__init__(
             folder_path=folder_path,
             result_types=result_types,
             session_factory=session_factory,
             progress_callback=progress_callback,
+            result_set_session_factory=result_set_session_factory,
         )
         self.project_name = project_name
         self.result_set_name = result_set_name
@@ -99,6 +101,9 @@ def import_all(self) -> Dict[str, Any]:
         }
         aggregator = ImportStatsAggregator()
         result_set_id: Optional[int] = None
+        import_session_factory = self._import_session_factory(
+            self.project_name, self.result_set_name
+        )
 
         self._report_progress("Processing files...", 0, len(self.excel_files))
 
@@ -147,7 +152,7 @@ def import_all(self) -> Dict[str, Any]:
                     project_name=self.project_name,
                     result_set_name=self.result_set_name,
                     result_types=matched_labels,
-                    session_factory=self._session_factory,
+                    session_factory=import_session_factory,
                     file_summary=summary,
                 )
                 file_stats = importer.import_all()
@@ -247,6 +252,7 @@ def __init__(
         selection_provider: Optional[SelectionProvider] = None,
         conflict_resolver: Optional[ConflictResolver] = None,
         existing_data_resolution: Optional[Dict[str, Dict[str, str]] | Dict[str, str]] = None,
+        result_set_session_factory: Optional[Callable[[int], Callable[[], Session]]] = None,
     ):
         """
         Initialize enhanced folder importer.
@@ -263,12 +269,16 @@ def __init__(
             conflict_resolution: Sheet-based conflict resolution {sheet: {load_case: file}}
             existing_data_resolution: Resolution for existing DB data
                 {load_case: {result_type: "keep" | "replace"}}
+            result_set_session_factory: Optional callable returning the session
+                factory of an existing result set (routes sharded result sets
+                to their shard)
         """
         super().__init__(
             folder_path=folder_path,
             result_types=result_types,
             session_factory=session_factory,
             progress_callback=progress_callback,
+            result_set_session_factory=result_set_session_factory,
         )
         self.project_name = project_name
         self.result_set_name = result_set_name
@@ -650,9 +660,12 @@ def _import_with_selection_and_resolution(
             resolution,
         )
         load_cases_to_skip_by_task: Dict[str, Set[str]] = {}
+        import_session_factory = self._import_session_factory(
+            self.project_name, self.result_set_name
+        )
 
         # Handle existing data resolution (deletions and skips)
-        session = self._session_factory()
+        session = import_session_factory()
         try:
             from processing.data_deleter import LoadCaseDataDeleter
             from processing.import_preparation import get_existing_load_cases_by_task_for_result_set
@@ -765,7 +778,7 @@ def _import_with_selection_and_resolution(
                     result_set_name=self.result_set_name,
                     allowed_load_cases=allowed_load_cases,
                     result_types=result_types_list,
-                    session_factory=self._session_factory,
+                    session_factory=import_session_factory,
                     foundation_joints=self.foundation_joints,
                     file_summary=self._file_summaries.get(file_name),
                     generate_cache=False,
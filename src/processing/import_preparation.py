@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import logging
+import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
+from utils.parallel import InlineExecutor, spawn_process_pool
+
 from .excel_parser import ExcelParser
 from .data_deleter import TASK_CACHE_RESULT_TYPES
 
+logger = logging.getLogger(__name__)
+
+PRESCAN_EXECUTORS = ("auto", "process", "thread", "inline")
+PROCESS_POOL_MIN_BYTES = 256 * 1024 * 1024  # Below this, spawning workers costs more than it saves
+
 
 @dataclass
 class FilePrescanSummary:
@@ -32,6 +41,123 @@ class PrescanResult:
     errors: List[str] = field(default_factory=list)
 
 
+@dataclass
+class FileScanResult:
+    """What a prescan worker returns for one file (small and picklable)."""
+
+    file_name: str
+    summary: FilePrescanSummary
+    sheets_found: List[str] = field(default_factory=list)
+    sheets_errored: List[str] = field(default_factory=list)
+
+
+def prescan_workers(max_workers: Optional[int] = None) -> int:
+    """Worker count for prescans: explicit value, then RPS_PRESCAN_WORKERS, then CPU count."""
+    if max_workers:
+        return max(1, max_workers)
+    value = os.environ.get("RPS_PRESCAN_WORKERS", "").strip()
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    return os.cpu_count() or 1
+
+
+def prescan_executor_kind(
+    file_count: int,
+    workers: int,
+    executor: Optional[str] = None,
+    total_bytes: int = 0,
+) -> str:
+    """Resolve the prescan executor: "process", "thread" or "inline".
+
+    ``executor`` (or RPS_PRESCAN_EXECUTOR) may force a kind. "auto" uses a
+    process pool once the files add up to PROCESS_POOL_MIN_BYTES, since the
+    XML and pandas work of a scan holds the GIL; smaller folders finish
+    before spawned workers would have imported pandas.
+    """
+    kind = (executor or os.environ.get("RPS_PRESCAN_EXECUTOR", "") or "auto").strip().lower()
+    if kind not in PRESCAN_EXECUTORS:
+        logger.warning("Unknown prescan executor %r; using auto", kind)
+        kind = "auto"
+    if workers <= 1 or file_count <= 1:
+        return "inline"
+    if kind == "auto":
+        return "process" if total_bytes >= PROCESS_POOL_MIN_BYTES else "thread"
+    return kind
+
+
+def scan_file(
+    file_path: Path,
+    target_sheets: Dict[str, List[str]],
+    result_types: Optional[Set[str]] = None,
+    parser_factory: Callable[[Path], ExcelParser] = ExcelParser,
+) -> FileScanResult:
+    """Prescan one Excel file (runs inside prescan workers)."""
+    parser = parser_factory(file_path)
+    try:
+        return _scan_with_parser(parser, file_path, target_sheets, result_types)
+    finally:
+        close = getattr(parser, "close", None)
+        if close is not None:
+            close()
+
+
+def _scan_with_parser(
+    parser: ExcelParser,
+    file_path: Path,
+    target_sheets: Dict[str, List[str]],
+    result_types: Optional[Set[str]],
+) -> FileScanResult:
+    load_cases_by_sheet: Dict[str, List[str]] = {}
+    sheets_found: List[str] = []
+    sheets_errored: List[str] = []
+    available_sheets = set(parser.get_available_sheets())
+    foundation_joints: List[str] = []
+
+    for sheet_name, result_labels in target_sheets.items():
+        if not _should_import_any(result_labels, result_types):
+            continue
+        if sheet_name not in available_sheets and sheet_name != "Vertical Displacements":
+            continue
+
+        try:
+            load_cases = _extract_load_cases_from_sheet(parser, sheet_name)
+            if load_cases:
+                load_cases_by_sheet[sheet_name] = load_cases
+                sheets_found.append(f"{sheet_name}({len(load_cases)})")
+        except Exception as exc:  # noqa: PERF203
+            sheets_errored.append(f"{sheet_name}: {str(exc)[:30]}")
+
+    if "Fou" in available_sheets:
+        try:
+            foundation_joints = parser.get_foundation_joints()
+        except Exception as exc:  # noqa: PERF203
+            sheets_errored.append(f"Fou: {str(exc)[:30]}")
+
+    if "Joint Displacements" in available_sheets:
+        if result_types is None or "vertical displacements" in result_types:
+            try:
+                if hasattr(parser, "get_load_cases_only"):
+                    load_cases = parser.get_load_cases_only("Joint Displacements") or []
+                else:
+                    _, load_cases, _ = parser.get_joint_displacements()
+                if load_cases:
+                    load_cases_by_sheet["Vertical Displacements"] = load_cases
+                    sheets_found.append(f"Vertical Displacements({len(load_cases)})")
+            except Exception as exc:  # noqa: PERF203
+                sheets_errored.append(f"Joint Displacements: {str(exc)[:30]}")
+
+    return FileScanResult(
+        file_name=file_path.name,
+        summary=FilePrescanSummary(
+            load_cases_by_sheet=load_cases_by_sheet,
+            available_sheets=available_sheets,
+            foundation_joints=foundation_joints,
+        ),
+        sheets_found=sheets_found,
+        sheets_errored=sheets_errored,
+    )
+
+
 class ImportPreparationService:
     """Collects metadata needed before running the enhanced import."""
 
@@ -39,9 +165,21 @@ def __init__(
         self,
         target_sheets: Dict[str, List[str]],
         parser_factory: Callable[[Path], ExcelParser] = ExcelParser,
+        executor: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ) -> None:
+        """
+        Args:
+            target_sheets: Sheet name → result type labels to scan
+            parser_factory: Creates the parser for a file; must be picklable
+                (a module-level class or function) for the process executor
+            executor: "auto" (default), "process", "thread" or "inline"
+            max_workers: Scan workers (default: RPS_PRESCAN_WORKERS or CPU count)
+        """
         self._target_sheets = target_sheets
         self._parser_factory = parser_factory
+        self._executor = executor
+        self._max_workers = max_workers
 
     def prescan_folder(
         self,
@@ -62,161 +200,136 @@ def prescan_files(
         result_types: Optional[Set[str]] = None,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
     ) -> PrescanResult:
-        """Prescan a provided list of Excel files."""
+        """Prescan a provided list of Excel files.
+
+        Files are scanned in parallel, but results and progress messages are
+        applied in file order, so output does not depend on completion order.
+        """
         result = PrescanResult(files_scanned=len(excel_files))
         foundation_seen: Set[str] = set()
-
-        def _scan_file(
-            file_path: Path,
-        ) -> Tuple[str, Dict[str, List[str]], List[str], List[str], List[str], Set[str]]:
-            parser = self._parser_factory(file_path)
-            load_cases_by_sheet: Dict[str, List[str]] = {}
-            sheets_found: List[str] = []
-            sheets_errored: List[str] = []
-            available_sheets = set(parser.get_available_sheets())
-            foundation_joints: List[str] = []
-
-            for sheet_name, result_labels in self._target_sheets.items():
-                if not self._should_import_any(result_labels, result_types):
-                    continue
-                if sheet_name not in available_sheets and sheet_name != "Vertical Displacements":
-                    continue
-
-                try:
-                    load_cases = self._extract_load_cases_from_sheet(parser, sheet_name)
-                    if load_cases:
-                        load_cases_by_sheet[sheet_name] = load_cases
-                        sheets_found.append(f"{sheet_name}({len(load_cases)})")
-                except Exception as exc:  # noqa: PERF203
-                    sheets_errored.append(f"{sheet_name}: {str(exc)[:30]}")
-
-            if "Fou" in available_sheets:
-                try:
-                    foundation_joints = parser.get_foundation_joints()
-                except Exception as exc:  # noqa: PERF203
-                    sheets_errored.append(f"Fou: {str(exc)[:30]}")
-
-            if "Joint Displacements" in available_sheets:
-                if result_types is None or "vertical displacements" in result_types:
-                    try:
-                        if hasattr(parser, "get_load_cases_only"):
-                            load_cases = parser.get_load_cases_only("Joint Displacements") or []
-                        else:
-                            _, load_cases, _ = parser.get_joint_displacements()
-                        if load_cases:
-                            load_cases_by_sheet["Vertical Displacements"] = load_cases
-                            sheets_found.append(f"Vertical Displacements({len(load_cases)})")
-                    except Exception as exc:  # noqa: PERF203
-                        sheets_errored.append(f"Joint Displacements: {str(exc)[:30]}")
-
-            return (
-                file_path.name,
-                load_cases_by_sheet,
-                sheets_found,
-                sheets_errored,
-                foundation_joints,
-                available_sheets,
-            )
-
-        with ThreadPoolExecutor(max_workers=min(6, len(excel_files) or 1)) as executor:
+        total = len(excel_files)
+
+        def _apply(idx: int, file_path: Path, scanned: Optional[FileScanResult], error: Optional[str]) -> None:
+            if progress_callback:
+                progress_callback(f"Scanning {file_path.name}...", idx, total)
+            if scanned is None:
+                result.errors.append(f"{file_path.name}: {error}")
+                return
+
+            summary = scanned.summary
+            if summary.load_cases_by_sheet:
+                result.file_load_cases[scanned.file_name] = summary.load_cases_by_sheet
+            result.file_summaries[scanned.file_name] = summary
+
+            for joint in summary.foundation_joints:
+                if joint not in foundation_seen:
+                    foundation_seen.add(joint)
+                    result.foundation_joints.append(joint)
+
+            if progress_callback and scanned.sheets_found:
+                found = scanned.sheets_found
+                progress_callback(
+                    f"  ✓ {', '.join(found[:3])}{'...' if len(found) > 3 else ''}",
+                    idx,
+                    total,
+                )
+            if progress_callback and scanned.sheets_errored:
+                progress_callback(f"  ✗ {scanned.sheets_errored[0]}", idx, total)
+
+        workers = min(prescan_workers(self._max_workers), total or 1)
+        kind = prescan_executor_kind(total, workers, self._executor, _total_size(excel_files))
+        logger.debug("Prescanning %d file(s) with %s executor (%d workers)", total, kind, workers)
+
+        pending: Dict[int, Tuple[Optional[FileScanResult], Optional[str]]] = {}
+        next_index = 0
+        with _create_executor(kind, workers) as executor:
             futures = {
-                executor.submit(_scan_file, path): (idx, path)
+                executor.submit(
+                    scan_file, path, self._target_sheets, result_types, self._parser_factory
+                ): idx
                 for idx, path in enumerate(excel_files)
             }
             for future in as_completed(futures):
-                idx, file_path = futures[future]
-                if progress_callback:
-                    progress_callback(f"Scanning {file_path.name}...", idx, len(excel_files))
+                idx = futures[future]
                 try:
-                    (
-                        file_name,
-                        load_cases_by_sheet,
-                        sheets_found,
-                        sheets_errored,
-                        joints,
-                        available_sheets,
-                    ) = future.result()
-
-                    if load_cases_by_sheet:
-                        result.file_load_cases[file_name] = load_cases_by_sheet
-
-                    result.file_summaries[file_name] = FilePrescanSummary(
-                        load_cases_by_sheet=load_cases_by_sheet,
-                        available_sheets=available_sheets,
-                        foundation_joints=joints,
-                    )
-
-                    for joint in joints:
-                        if joint not in foundation_seen:
-                            foundation_seen.add(joint)
-                            result.foundation_joints.append(joint)
-
-                    if progress_callback and (sheets_found or sheets_errored):
-                        if sheets_found:
-                            progress_callback(
-                                f"  ✓ {', '.join(sheets_found[:3])}"
-                                f"{'...' if len(sheets_found) > 3 else ''}",
-                                idx,
-                                len(excel_files),
-                            )
-                        if sheets_errored:
-                            progress_callback(
-                                f"  ✗ {sheets_errored[0]}",
-                                idx,
-                                len(excel_files),
-                            )
+                    pending[idx] = (future.result(), None)
                 except Exception as exc:  # noqa: PERF203
-                    result.errors.append(f"{file_path.name}: {exc}")
+                    pending[idx] = (None, str(exc))
+                # Apply finished files in input order
+                while next_index in pending:
+                    scanned, error = pending.pop(next_index)
+                    _apply(next_index, excel_files[next_index], scanned, error)
+                    next_index += 1
 
         return result
 
-    def _should_import_any(self, labels: Iterable[str], result_types: Optional[Set[str]]) -> bool:
-        if not result_types:
+
+def _total_size(paths: Sequence[Path]) -> int:
+    total = 0
+    for path in paths:
+        try:
+            total += Path(path).stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def _create_executor(kind: str, workers: int):
+    if kind == "process":
+        return spawn_process_pool(workers)
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    return InlineExecutor()
+
+
+def _should_import_any(labels: Iterable[str], result_types: Optional[Set[str]]) -> bool:
+    if not result_types:
+        return True
+    for label in labels:
+        if label.strip().lower() in result_types:
             return True
-        for label in labels:
-            if label.strip().lower() in result_types:
-                return True
-        return False
-
-    def _extract_load_cases_from_sheet(self, parser: ExcelParser, sheet_name: str) -> List[str]:
-        if hasattr(parser, "get_load_cases_only"):
-            quick_cases = parser.get_load_cases_only(sheet_name)
-            if quick_cases is not None:
-                return quick_cases
-        if sheet_name == "Story Drifts":
-            _, load_cases, _ = parser.get_story_drifts()
-            return load_cases
-        if sheet_name == "Diaphragm Accelerations":
-            _, load_cases, _ = parser.get_story_accelerations()
-            return load_cases
-        if sheet_name == "Story Forces":
-            _, load_cases, _ = parser.get_story_forces()
-            return load_cases
-        if sheet_name == "Joint Displacements":
-            _, load_cases, _ = parser.get_joint_displacements()
-            return load_cases
-        if sheet_name == "Pier Forces":
-            _, load_cases, _, _ = parser.get_pier_forces()
-            return load_cases
-        if sheet_name == "Element Forces - Columns":
-            _, load_cases, _, _ = parser.get_column_forces()
-            return load_cases
-        if sheet_name == "Element Forces - Braces":
-            _, load_cases, _, _ = parser.get_brace_forces()
-            return load_cases
-        if sheet_name == "Fiber Hinge States":
-            _, load_cases, _, _ = parser.get_fiber_hinge_states()
-            return load_cases
-        if sheet_name == "Hinge States":
-            _, load_cases, _, _ = parser.get_hinge_states()
-            return load_cases
-        if sheet_name == "Quad Strain Gauge - Rotation":
-            _, load_cases, _, _ = parser.get_quad_rotations()
-            return load_cases
-        if sheet_name == "Soil Pressures":
-            _, load_cases, _ = parser.get_soil_pressures()
-            return load_cases
-        return []
+    return False
+
+
+def _extract_load_cases_from_sheet(parser: ExcelParser, sheet_name: str) -> List[str]:
+    if hasattr(parser, "get_load_cases_only"):
+        quick_cases = parser.get_load_cases_only(sheet_name)
+        if quick_cases is not None:
+            return quick_cases
+    if sheet_name == "Story Drifts":
+        _, load_cases, _ = parser.get_story_drifts()
+        return load_cases
+    if sheet_name == "Diaphragm Accelerations":
+        _, load_cases, _ = parser.get_story_accelerations()
+        return load_cases
+    if sheet_name == "Story Forces":
+        _, load_cases, _ = parser.get_story_forces()
+        return load_cases
+    if sheet_name == "Joint Displacements":
+        _, load_cases, _ = parser.get_joint_displacements()
+        return load_cases
+    if sheet_name == "Pier Forces":
+        _, load_cases, _, _ = parser.get_pier_forces()
+        return load_cases
+    if sheet_name == "Element Forces - Columns":
+        _, load_cases, _, _ = parser.get_column_forces()
+        return load_cases
+    if sheet_name == "Element Forces - Braces":
+        _, load_cases, _, _ = parser.get_brace_forces()
+        return load_cases
+    if sheet_name == "Fiber Hinge States":
+        _, load_cases, _, _ = parser.get_fiber_hinge_states()
+        return load_cases
+    if sheet_name == "Hinge States":
+        _, load_cases, _, _ = parser.get_hinge_states()
+        return load_cases
+    if sheet_name == "Quad Strain Gauge - Rotation":
+        _, load_cases, _, _ = parser.get_quad_rotations()
+        return load_cases
+    if sheet_name == "Soil Pressures":
+        _, load_cases, _ = parser.get_soil_pressures()
+        return load_cases
+    return []
 
 
 def detect_conflicts(
@@ -9,8 +9,12 @@
 from __future__ import annotations
 
 import logging
+from time import perf_counter
 from typing import Callable, Dict, Iterable, Optional, Sequence
 
+from utils import metrics
+
+from .import_stats import count_result_rows
 from .import_tasks import ImportTask
 
 logger = logging.getLogger(__name__)
@@ -56,7 +60,13 @@ def run_import_tasks(
     stats: Dict,
     file_name: str,
 ) -> None:
-    """Execute import tasks with timing and sheet checks."""
+    """Execute import tasks with timing and sheet checks.
+
+    Imported result rows are counted in the ``import.rows`` metric (per phase)
+    and the file's overall rate in ``import.rows_per_s``.
+    """
+    total_rows = 0
+    start = perf_counter()
     for task in tasks:
         if not should_import(task.label):
             continue
@@ -79,3 +89,11 @@ def run_import_tasks(
             task_stats = handler(session, project_id)
 
         merge_task_stats(stats, task_stats)
+        rows = count_result_rows(task_stats)
+        if rows:
+            metrics.increment("import.rows", rows, phase=task.phase)
+            total_rows += rows
+
+    elapsed = perf_counter() - start
+    if total_rows and elapsed > 0:
+        metrics.observe("import.rows_per_s", total_rows / elapsed)
@@ -3,7 +3,39 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Mapping, Optional
+
+# Stats keys that count imported result records (as opposed to stories, load cases, ids)
+RESULT_ROW_KEYS = frozenset(
+    {
+        "drifts",
+        "accelerations",
+        "forces",
+        "displacements",
+        "pier_forces",
+        "column_forces",
+        "column_axials",
+        "brace_axials",
+        "column_rotations",
+        "beam_rotations",
+        "quad_rotations",
+        "soil_pressures",
+        "vertical_displacements",
+    }
+)
+
+
+def count_result_rows(stats: Optional[Mapping[str, object]]) -> int:
+    """Number of result records in an import stats dict."""
+    if not stats:
+        return 0
+    return int(
+        sum(
+            value
+            for key, value in stats.items()
+            if key in RESULT_ROW_KEYS and isinstance(value, (int, float))
+        )
+    )
 
 
 @dataclass
@@ -5,6 +5,7 @@
 - Session management
 - Progress reporting
 - Entity caching (stories, load cases, elements)
+- Bulk insertion of melted result records
 - Import workflow template
 
 Subclasses implement:
@@ -15,17 +16,41 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Any
+from typing import Callable, Dict, Iterable, List, Optional, Set, Any, Type
 import logging
 
+import pandas as pd
 from sqlalchemy.orm import Session
 
 from database.models import Project, ResultSet, Story, LoadCase, Element
+from processing.pushover.pushover_bulk import (
+    LOAD_CASE_COLUMN,
+    bulk_insert_frame,
+    resolve_load_case_ids,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class BasePushoverImporter(ABC):
+class SelectedDirectionsMixin:
+    """Direction selection shared by importers holding per-direction load case selections.
+
+    Requires ``selected_load_cases_x`` and ``selected_load_cases_y`` attributes.
+    """
+
+    selected_load_cases_x: Iterable[str]
+    selected_load_cases_y: Iterable[str]
+
+    def _selected_directions(self) -> List[str]:
+        """Directions with at least one selected load case, in import order."""
+        return [
+            direction
+            for direction, selected in (('X', self.selected_load_cases_x), ('Y', self.selected_load_cases_y))
+            if selected
+        ]
+
+
+class BasePushoverImporter(SelectedDirectionsMixin, ABC):
     """Abstract base class for all pushover result importers.
 
     Provides shared functionality:
@@ -266,6 +291,46 @@ def _get_or_create_element(
         self.elements_cache[cache_key] = element
         return element
 
+    def _element_ids(self, element_type: str) -> Dict[str, int]:
+        """Return element name → ID for cached elements of one type."""
+        prefix = f"{element_type}:"
+        return {
+            key[len(prefix):]: element.id
+            for key, element in self.elements_cache.items()
+            if key.startswith(prefix)
+        }
+
+    def _story_ids(self) -> Dict[str, int]:
+        """Return story name → ID for all cached stories."""
+        return {name: story.id for name, story in self.stories_cache.items()}
+
+    def _story_sort_orders(self) -> Dict[int, Optional[int]]:
+        """Return story ID → global sort order for all cached stories."""
+        return {story.id: story.sort_order for story in self.stories_cache.values()}
+
+    def _insert_results(self, model_class: Type, records: pd.DataFrame, **constants) -> int:
+        """Resolve load cases and bulk insert long-format result records.
+
+        Args:
+            model_class: ORM result model (WallShear, ColumnRotation, ...)
+            records: Rows from ``melt_load_case_columns`` whose columns, apart
+                from ``LoadCase``, match the model's table columns
+            **constants: Column values shared by every record (direction, ...)
+
+        Returns:
+            Count of inserted records
+        """
+        if records.empty:
+            return 0
+
+        records = records.assign(
+            load_case_id=resolve_load_case_ids(
+                records[LOAD_CASE_COLUMN], self._get_or_create_load_case
+            ),
+            **constants,
+        ).drop(columns=[LOAD_CASE_COLUMN])
+        return bulk_insert_frame(self.session, model_class, records)
+
     def _get_load_case_ids(self) -> List[int]:
         """Get list of load case IDs from cache.
 
@@ -2,24 +2,29 @@
 Base class for pushover result parsers.
 
 Provides common functionality for all pushover parsers:
-- Excel file loading and sheet reading
-- Direction filtering
+- Excel file loading and cached sheet reading
+- Single-pass direction splitting
 - Order preservation
 - Common method signatures
 
+Each sheet is read once per parser and split into every pushover direction in
+one pass over its output case names. ``parse_all(directions)`` returns a
+per-direction result map; ``parse(direction)`` is a view onto the same cache.
+
 Subclasses only need to implement:
 - _get_primary_sheet(): Return the main sheet name for this parser
-- parse(direction): Parse results for a specific direction
+- _parse_direction(direction): Build the results container for one direction
 """
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional, Any
+from typing import Any, Dict, Iterable, List, Optional
 import logging
 
 import pandas as pd
 
 from utils.pushover_utils import detect_direction, preserve_order, restore_categorical_order
+from ..xlsx_scanner import XlsxScanner
 
 logger = logging.getLogger(__name__)
 
@@ -29,16 +34,19 @@ class BasePushoverParser(ABC):
 
     Provides shared functionality:
     - Excel file management
-    - Sheet reading with units row removal
-    - Direction detection and filtering
+    - Cached sheet reading with units row removal
+    - Direction detection and single-pass splitting
     - Order preservation utilities
 
-    Subclasses implement parse() for their specific result type.
+    Subclasses implement _parse_direction() for their specific result type.
     """
 
     # Valid directions for pushover analysis
     VALID_DIRECTIONS = ('X', 'Y', 'XY')
 
+    # Order in which detected directions are reported
+    _DETECTION_ORDER = ('XY', 'X', 'Y')
+
     def __init__(self, file_path: Path):
         """Initialize parser with Excel file path.
 
@@ -46,13 +54,61 @@ def __init__(self, file_path: Path):
             file_path: Path to Excel file with pushover results
         """
         self.file_path = file_path
-        self.excel_data = pd.ExcelFile(file_path)
-
-    def _read_sheet(self, sheet_name: str, drop_units: bool = True) -> pd.DataFrame:
+        self._excel_data: Optional[pd.ExcelFile] = None
+        self._sheet_name_list: Optional[List[str]] = None
+        if XlsxScanner.supports(file_path):
+            # Sheet names and scan columns come from the archive; the workbook opens on the first full read
+            with XlsxScanner(file_path) as scanner:
+                self._sheet_name_list = scanner.sheet_names
+        else:
+            self._excel_data = pd.ExcelFile(file_path)
+        self._sheet_cache: Dict[tuple, pd.DataFrame] = {}
+        self._distinct_cache: Dict[tuple, List[Any]] = {}
+        self._results_cache: Dict[str, Any] = {}
+
+    @property
+    def excel_data(self) -> pd.ExcelFile:
+        """Workbook handle, opened on the first full sheet read."""
+        if self._excel_data is None:
+            self._excel_data = pd.ExcelFile(self.file_path)
+        return self._excel_data
+
+    def _sheet_names(self) -> List[str]:
+        if self._sheet_name_list is None:
+            self._sheet_name_list = list(self.excel_data.sheet_names)
+        return self._sheet_name_list
+
+    def _distinct_column(self, sheet_name: str, column: str) -> List[Any]:
+        """Distinct non-empty values of a column (header row 2, units row dropped).
+
+        Uses an already-read sheet when available; otherwise scans only that
+        column from the archive instead of loading the whole sheet.
+        """
+        cache_key = (sheet_name, 1, True)
+        if cache_key in self._sheet_cache or not XlsxScanner.supports(self.file_path):
+            df = self._read_sheet(sheet_name)
+            if column not in df.columns:
+                return []
+            return df[column].dropna().unique().tolist()
+
+        if (sheet_name, column) not in self._distinct_cache:
+            with XlsxScanner(self.file_path) as scanner:
+                index = scanner.column_index(sheet_name, column, header_row=2)
+                values = [] if index is None else scanner.distinct_values(sheet_name, index, min_row=4)
+            self._distinct_cache[(sheet_name, column)] = values
+        return list(self._distinct_cache[(sheet_name, column)])
+
+    def _read_sheet(
+        self, sheet_name: str, header: int = 1, drop_units: bool = True
+    ) -> pd.DataFrame:
         """Read Excel sheet with standard preprocessing.
 
+        Each sheet is read from the workbook once; later calls return a copy
+        of the cached frame.
+
         Args:
             sheet_name: Name of sheet to read
+            header: Header row passed to ``pd.read_excel``
             drop_units: If True, drop the units row (row 0 after header)
 
         Returns:
@@ -61,13 +117,92 @@ def _read_sheet(self, sheet_name: str, drop_units: bool = True) -> pd.DataFrame:
         Raises:
             ValueError: If sheet does not exist
         """
-        if sheet_name not in self.excel_data.sheet_names:
-            raise ValueError(f"Sheet '{sheet_name}' not found in {self.file_path.name}")
+        cache_key = (sheet_name, header, drop_units)
+        if cache_key in self._sheet_cache:
+            return self._sheet_cache[cache_key].copy()
+
+        if sheet_name not in self._sheet_names():
+            raise ValueError(f"Sheet '{sheet_name}' not found in {Path(self.file_path).name}")
 
-        df = pd.read_excel(self.excel_data, sheet_name=sheet_name, header=1)
+        df = pd.read_excel(self.excel_data, sheet_name=sheet_name, header=header)
         if drop_units and len(df) > 0:
             df = df.drop(0)  # Drop units row
-        return df
+
+        self._sheet_cache[cache_key] = df
+        return df.copy()
+
+    def _case_matches_direction(self, case: Any, direction: str) -> bool:
+        """Return True if an output case name belongs to a pushover direction.
+
+        Args:
+            case: Output case name
+            direction: 'X', 'Y', or 'XY'
+
+        Returns:
+            True for 'XY' when both letters appear, otherwise when the
+            direction letter appears (case-insensitive)
+        """
+        name = str(case).upper()
+        if direction == 'XY':
+            return 'X' in name and 'Y' in name
+        return direction in name
+
+    def _direction_cases(self, cases: pd.Series) -> Dict[str, List[Any]]:
+        """Classify each distinct output case into every valid direction.
+
+        Args:
+            cases: Output case column
+
+        Returns:
+            Dict of direction → matching case names (first-occurrence order)
+        """
+        unique_cases = cases.dropna().unique()
+        return {
+            direction: [case for case in unique_cases if self._case_matches_direction(case, direction)]
+            for direction in self.VALID_DIRECTIONS
+        }
+
+    def _split_by_direction(
+        self,
+        df: pd.DataFrame,
+        column: str = 'Output Case'
+    ) -> Dict[str, pd.DataFrame]:
+        """Split a sheet into all valid directions in one pass.
+
+        Case names are classified once; rows keep their Excel order. A row can
+        appear in several directions (an XY case also matches X and Y).
+
+        Args:
+            df: DataFrame to split
+            column: Column containing output case names
+
+        Returns:
+            Dict of direction → filtered DataFrame
+        """
+        cases = df[column]
+        return {
+            direction: df[cases.isin(matching)]
+            for direction, matching in self._direction_cases(cases).items()
+        }
+
+    def _read_direction_sheet(self, sheet_name: str, direction: str) -> pd.DataFrame:
+        """Read the rows of a sheet that belong to one pushover direction.
+
+        The first call splits the sheet into every valid direction and caches
+        each part, so parsing further directions costs no extra reads or scans.
+
+        Args:
+            sheet_name: Name of sheet to read
+            direction: 'X', 'Y', or 'XY'
+
+        Returns:
+            Copy of the sheet rows for ``direction``
+        """
+        cache_key = (sheet_name, 1, True, direction)
+        if cache_key not in self._sheet_cache:
+            for part_direction, part in self._split_by_direction(self._read_sheet(sheet_name)).items():
+                self._sheet_cache[(sheet_name, 1, True, part_direction)] = part
+        return self._sheet_cache[cache_key].copy()
 
     def _filter_by_direction(
         self,
@@ -86,17 +221,12 @@ def _filter_by_direction(
             Filtered DataFrame
         """
         direction = direction.upper()
-
-        if direction == 'XY':
-            # Bi-directional: both X and Y in name
-            mask = df[column].apply(
-                lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper()
-            )
-        else:
-            # Uni-directional: X or Y in name
-            mask = df[column].apply(lambda x: direction in str(x).upper())
-
-        return df[mask].copy()
+        cases = df[column]
+        matching = [
+            case for case in cases.dropna().unique()
+            if self._case_matches_direction(case, direction)
+        ]
+        return df[cases.isin(matching)].copy()
 
     def _filter_by_direction_regex(
         self,
@@ -203,7 +333,9 @@ def validate_sheet_exists(self, sheet_name: str) -> bool:
         Returns:
             True if sheet exists
         """
-        return sheet_name in self.excel_data.sheet_names
+        if any(key[0] == sheet_name for key in self._sheet_cache):
+            return True
+        return sheet_name in self._sheet_names()
 
     @abstractmethod
     def _get_primary_sheet(self) -> str:
@@ -217,16 +349,57 @@ def _get_primary_sheet(self) -> str:
         pass
 
     @abstractmethod
+    def _parse_direction(self, direction: str) -> Any:
+        """Build the results container for one validated direction.
+
+        Implementations read sheets through _read_direction_sheet() so all
+        directions share one read and one split per sheet.
+
+        Args:
+            direction: Normalized direction
+
+        Returns:
+            Parser-specific results container (dataclass)
+        """
+        pass
+
+    def parse_all(self, directions: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Parse results for several directions from a single read of each sheet.
+
+        Args:
+            directions: Directions to parse (default: all detected directions)
+
+        Returns:
+            Dict of direction → parser-specific results container
+
+        Raises:
+            ValueError: If an invalid direction is specified
+        """
+        if directions is None:
+            directions = self.get_available_directions()
+
+        results = {}
+        for direction in directions:
+            direction = self._validate_direction(direction)
+            if direction not in self._results_cache:
+                self._results_cache[direction] = self._parse_direction(direction)
+            results[direction] = self._results_cache[direction]
+        return results
+
     def parse(self, direction: str) -> Any:
         """Parse results for specified direction.
 
         Args:
-            direction: 'X', 'Y', or 'XY'
+            direction: Pushover direction (see VALID_DIRECTIONS)
 
         Returns:
             Parser-specific results container (dataclass)
+
+        Raises:
+            ValueError: If invalid direction specified
         """
-        pass
+        direction = self._validate_direction(direction)
+        return self.parse_all([direction])[direction]
 
     def get_available_directions(self) -> List[str]:
         """Detect available pushover directions from output cases.
@@ -240,26 +413,14 @@ def get_available_directions(self) -> List[str]:
         if not self.validate_sheet_exists(sheet_name):
             return []
 
-        df = self._read_sheet(sheet_name)
-
-        if 'Output Case' not in df.columns:
-            return []
-
-        output_cases = df['Output Case'].dropna().unique()
-
-        directions = []
+        cases = pd.Series(self._distinct_column(sheet_name, 'Output Case'), dtype=object)
+        direction_cases = self._direction_cases(cases)
 
-        # Check for bi-directional first
-        if any('X' in str(case).upper() and 'Y' in str(case).upper() for case in output_cases):
-            directions.append('XY')
-
-        # Check for uni-directional
-        if any('X' in str(case).upper() for case in output_cases):
-            directions.append('X')
-        if any('Y' in str(case).upper() for case in output_cases):
-            directions.append('Y')
-
-        return directions
+        # Bi-directional first, then uni-directional
+        return [
+            direction for direction in self._DETECTION_ORDER
+            if direction_cases.get(direction)
+        ]
 
     def get_output_cases(self, direction: str) -> List[str]:
         """Get list of output cases for a direction.
@@ -274,19 +435,9 @@ def get_output_cases(self, direction: str) -> List[str]:
         if not self.validate_sheet_exists(sheet_name):
             return []
 
-        df = self._read_sheet(sheet_name)
-
-        if 'Output Case' not in df.columns:
-            return []
-
         direction = direction.upper()
-
-        if direction == 'XY':
-            mask = df['Output Case'].apply(
-                lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper()
-            )
-        else:
-            mask = df['Output Case'].apply(lambda x: direction in str(x).upper())
-
-        cases = df[mask]['Output Case'].unique()
-        return sorted(cases.tolist())
+        matching = [
+            case for case in self._distinct_column(sheet_name, 'Output Case')
+            if self._case_matches_direction(case, direction)
+        ]
+        return sorted(matching)
@@ -11,7 +11,7 @@
 
 from sqlalchemy.orm import Session
 
-from database.models import Element, Story, LoadCase, BeamRotation
+from database.models import BeamRotation
 from processing.pushover.pushover_element_base import (
     PushoverElementBaseImporter,
     ResultTypeConfig,
@@ -51,23 +51,6 @@ def _get_result_types(self) -> List[ResultTypeConfig]:
             )
         ]
 
-    def _create_result_record(
-        self,
-        config: ResultTypeConfig,
-        element: Element,
-        story: Story,
-        load_case: LoadCase,
-        value: float,
-        story_sort_order: int,
-    ) -> BeamRotation:
-        return BeamRotation(
-            element_id=element.id,
-            story_id=story.id,
-            load_case_id=load_case.id,
-            r3_plastic=value,
-            story_sort_order=story_sort_order,
-        )
-
     def _get_cache_base_name(self) -> str:
         return 'BeamRotations'
 
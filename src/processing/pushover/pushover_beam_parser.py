@@ -7,11 +7,10 @@
 
 import pandas as pd
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-from pathlib import Path
+from typing import List, Optional
 import logging
 
-from utils.pushover_utils import detect_direction
+from processing.pushover.pushover_base_parser import BasePushoverParser
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +22,7 @@ class PushoverBeamResults:
     direction: str = ""  # 'X' or 'Y'
 
 
-class PushoverBeamParser:
+class PushoverBeamParser(BasePushoverParser):
     """Parser for pushover beam hinge rotation Excel files.
 
     Extracts plastic rotation values (R3 Plastic) for each beam hinge location.
@@ -34,31 +33,10 @@ class PushoverBeamParser:
     - Extracts R3 Plastic values per hinge location
     """
 
-    def __init__(self, file_path: Path):
-        """Initialize parser with Excel file path.
+    def _get_primary_sheet(self) -> str:
+        return 'Hinge States'
 
-        Args:
-            file_path: Path to Excel file with pushover beam hinge results
-        """
-        self.file_path = file_path
-        self.excel_data = pd.ExcelFile(file_path)
-        self._sheet_cache = {}
-        self._results_cache = {}
-
-    def _read_sheet(self, sheet_name: str, header: int = 1, drop_units: bool = True) -> pd.DataFrame:
-        """Read and cache a sheet from the Excel file."""
-        cache_key = (sheet_name, header, drop_units)
-        if cache_key in self._sheet_cache:
-            return self._sheet_cache[cache_key].copy()
-
-        df = pd.read_excel(self.excel_data, sheet_name=sheet_name, header=header)
-        if drop_units and len(df) > 0:
-            df = df.drop(0)
-
-        self._sheet_cache[cache_key] = df
-        return df.copy()
-
-    def parse(self, direction: str) -> PushoverBeamResults:
+    def _parse_direction(self, direction: str) -> PushoverBeamResults:
         """Parse all beam hinge results for specified direction.
 
         Args:
@@ -66,19 +44,7 @@ def parse(self, direction: str) -> PushoverBeamResults:
 
         Returns:
             PushoverBeamResults with extracted data
-
-        Raises:
-            ValueError: If invalid direction specified
         """
-        if direction.upper() not in ['X', 'Y', 'XY']:
-            raise ValueError(f"Invalid direction '{direction}'. Must be 'X', 'Y', or 'XY'.")
-
-        direction = direction.upper()
-
-        cached = self._results_cache.get(direction)
-        if cached is not None:
-            return cached
-
         results = PushoverBeamResults(direction=direction)
 
         # Extract rotations with error handling
@@ -88,7 +54,6 @@ def parse(self, direction: str) -> PushoverBeamResults:
             logger.warning(f"Failed to extract R3 Plastic rotations for {direction}: {e}")
             results.rotations = None
 
-        self._results_cache[direction] = results
         return results
 
     def _extract_beam_rotations(self, direction: str) -> pd.DataFrame:
@@ -103,18 +68,12 @@ def _extract_beam_rotations(self, direction: str) -> pd.DataFrame:
         Returns:
             DataFrame with columns: Frame/Wall, Unique Name, [Output Cases...]
         """
-        # Read Hinge States sheet
-        df = self._read_sheet('Hinge States')
+        # Read Hinge States rows for this pushover direction
+        df = self._read_direction_sheet('Hinge States', direction)
 
         # Filter columns
         df = df[['Frame/Wall', 'Unique Name', 'Output Case', 'Step Type', 'R3 Plastic']]
 
-        # Filter by pushover direction
-        if direction == 'XY':
-            df = df[df['Output Case'].apply(lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper())]
-        else:
-            df = df[df['Output Case'].apply(lambda x: direction in str(x).upper())]
-
         # Preserve beam and hinge order from Excel
         beam_order = df['Frame/Wall'].unique().tolist()
         unique_name_order = df['Unique Name'].unique().tolist()
@@ -135,60 +94,10 @@ def _extract_beam_rotations(self, direction: str) -> pd.DataFrame:
 
         return max_rotations
 
-    def get_available_directions(self) -> List[str]:
-        """Detect available pushover directions from output cases.
-
-        Returns:
-            List of detected directions (e.g., ['X', 'Y', 'XY'])
-        """
-        # Read Hinge States sheet to detect directions
-        df = self._read_sheet('Hinge States')
-
-        output_cases = df['Output Case'].unique()
-
-        directions = []
-
-        # Check for bi-directional first (both X and Y in name)
-        if any('X' in str(case).upper() and 'Y' in str(case).upper() for case in output_cases):
-            directions.append('XY')
-
-        # Check for uni-directional
-        if any('X' in str(case).upper() for case in output_cases):
-            directions.append('X')
-        if any('Y' in str(case).upper() for case in output_cases):
-            directions.append('Y')
-
-        return directions
-
-    def get_output_cases(self, direction: str) -> List[str]:
-        """Get list of output cases for a direction.
-
-        Args:
-            direction: 'X', 'Y', or 'XY'
-
-        Returns:
-            List of output case names
-        """
-        df = self._read_sheet('Hinge States')
-
-        direction = direction.upper()
-
-        # Filter based on direction
-        if direction == 'XY':
-            # Both X and Y in name
-            cases = df[df['Output Case'].apply(lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper())]['Output Case'].unique()
-        else:
-            # X or Y in name
-            cases = df[df['Output Case'].apply(lambda x: direction in str(x).upper())]['Output Case'].unique()
-
-        return sorted(cases.tolist())
-
     def get_beams(self) -> List[str]:
         """Get list of all beams in the file.
 
         Returns:
             List of beam names
         """
-        df = self._read_sheet('Hinge States')
-
-        return sorted(df['Frame/Wall'].unique().tolist())
+        return sorted(self._distinct_column('Hinge States', 'Frame/Wall'))
@@ -15,12 +15,17 @@
     BraceAxial,
     Element,
     ElementResultsCache,
-    LoadCase,
     ResultCategory,
     Story,
 )
 from processing.pushover.pushover_base_importer import BasePushoverImporter
+from processing.pushover.pushover_bulk import LOAD_CASE_COLUMN, map_ids
 from processing.pushover.pushover_brace_parser import PushoverBraceParser
+from processing.pushover.pushover_cache_writer import (
+    build_results_matrices,
+    fetch_cache_records,
+    replace_cache_rows,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -51,15 +56,16 @@ def _ensure_entities(self):
         """Ensure all brace elements and stories exist."""
         parser = self._get_parser()
 
-        results = None
-        if self.selected_load_cases_x:
-            results = parser.parse("X")
-        if (
-            results is None or results.axials is None or results.axials.empty
-        ) and self.selected_load_cases_y:
-            results = parser.parse("Y")
-
-        if results is None or results.axials is None or results.axials.empty:
+        # First selected direction with brace data supplies the entities
+        results = next(
+            (
+                parsed
+                for parsed in parser.parse_all(self._selected_directions()).values()
+                if parsed.axials is not None and not parsed.axials.empty
+            ),
+            None,
+        )
+        if results is None:
             return
 
         df = results.axials
@@ -84,107 +90,65 @@ def _import_direction(self, direction: str, selected_load_cases: Set[str]) -> Di
 
     def _import_axials(self, df: pd.DataFrame, selected_load_cases: Set[str]) -> int:
         """Import parsed brace axial rows into BraceAxial records."""
-        count = 0
         result_category_id = self._get_or_create_result_category_id()
 
-        for _, row in df.iterrows():
-            load_case_name = str(row["Output Case"])
-            if load_case_name not in selected_load_cases:
-                continue
-
-            brace_name = str(row["Brace"])
-            story_name = str(row["Story"])
-            element = self.elements_cache.get(f"Brace:{brace_name}")
-            story = self.stories_cache.get(story_name)
-            if not element or not story:
-                continue
-
-            min_axial = row["MinAxial"]
-            max_axial = row["MaxAxial"]
-            if pd.isna(min_axial) and pd.isna(max_axial):
-                continue
-
-            load_case = self._get_or_create_load_case(load_case_name)
-            record = BraceAxial(
-                element_id=element.id,
-                story_id=story.id,
-                load_case_id=load_case.id,
-                result_category_id=result_category_id,
-                min_axial=float(min_axial) if not pd.isna(min_axial) else 0.0,
-                max_axial=float(max_axial) if not pd.isna(max_axial) else None,
-                story_sort_order=story.sort_order,
-            )
-            self.session.add(record)
-            count += 1
-
-        return count
+        rows = df[df["Output Case"].astype(str).isin(selected_load_cases)]
+        records = pd.DataFrame({
+            "element_id": map_ids(rows["Brace"].astype(str), self._element_ids("Brace")),
+            "story_id": map_ids(rows["Story"].astype(str), self._story_ids()),
+            LOAD_CASE_COLUMN: rows["Output Case"].astype(str),
+            "min_axial": rows["MinAxial"].astype(float),
+            "max_axial": rows["MaxAxial"].astype(float),
+        })
+        records = records[
+            records["element_id"].notna()
+            & records["story_id"].notna()
+            & (records["min_axial"].notna() | records["max_axial"].notna())
+        ].reset_index(drop=True)
+        records["min_axial"] = records["min_axial"].fillna(0.0)
+        records["story_sort_order"] = map_ids(records["story_id"], self._story_sort_orders())
+
+        return self._insert_results(
+            BraceAxial, records, result_category_id=result_category_id
+        )
 
     def _build_cache(self):
         """Build element result cache entries for brace min/max axial forces."""
-        self.session.query(ElementResultsCache).filter(
-            ElementResultsCache.result_set_id == self.result_set_id,
-            ElementResultsCache.result_type.in_(["BraceAxials_Min", "BraceAxials_Max"]),
-        ).delete(synchronize_session=False)
-
         self._cache_axials("Min")
         self._cache_axials("Max")
         logger.info("Built element cache for brace axials")
 
     def _cache_axials(self, max_min: str):
         """Build cache for either minimum or maximum brace axial values."""
+        rows = []
         load_case_ids = self._get_load_case_ids()
-        if not load_case_ids:
-            logger.warning("No load cases in cache for brace axials %s", max_min)
-            return
-
-        result_category_id = self._get_or_create_result_category_id()
-        records = (
-            self.session.query(
+        if load_case_ids:
+            value_field = "min_axial" if max_min == "Min" else "max_axial"
+            records = fetch_cache_records(
+                self.session,
                 BraceAxial,
-                LoadCase.name,
-                BraceAxial.element_id,
-                BraceAxial.story_id,
-                BraceAxial.story_sort_order,
-            )
-            .join(LoadCase, BraceAxial.load_case_id == LoadCase.id)
-            .join(Element, BraceAxial.element_id == Element.id)
-            .filter(
-                BraceAxial.load_case_id.in_(load_case_ids),
-                BraceAxial.result_category_id == result_category_id,
-                Element.element_type == "Brace",
+                value_field,
+                ["element_id", "story_id", "story_sort_order"],
+                load_case_ids,
+                filters=[
+                    BraceAxial.result_category_id == self._get_or_create_result_category_id(),
+                    Element.element_type == "Brace",
+                    getattr(BraceAxial, value_field).isnot(None),
+                ],
+                joins=[(Element, BraceAxial.element_id == Element.id)],
             )
-            .all()
-        )
-
-        element_story_data = {}
-        value_attr = "min_axial" if max_min == "Min" else "max_axial"
-        for axial, load_case_name, element_id, story_id, story_sort_order in records:
-            value = getattr(axial, value_attr)
-            if value is None:
-                continue
-
-            key = (element_id, story_id)
-            if key not in element_story_data:
-                element_story_data[key] = {
-                    "results_matrix": {},
-                    "story_sort_order": story_sort_order,
-                }
-            element_story_data[key]["results_matrix"][load_case_name] = value
-
-        result_type = f"BraceAxials_{max_min}"
-        for (element_id, story_id), data in element_story_data.items():
-            cache_entry = ElementResultsCache(
-                project_id=self.project_id,
-                result_set_id=self.result_set_id,
-                element_id=element_id,
-                story_id=story_id,
-                result_type=result_type,
-                story_sort_order=data["story_sort_order"],
-                results_matrix=data["results_matrix"],
-            )
-            self.session.add(cache_entry)
+            rows = build_results_matrices(records, ["element_id", "story_id"])
+        else:
+            logger.warning("No load cases in cache for brace axials %s", max_min)
 
-        logger.info("Created %s cache entries for %s", len(element_story_data), result_type)
+        replace_cache_rows(
+            self.session,
+            ElementResultsCache,
+            self.result_set_id,
+            f"BraceAxials_{max_min}",
+            rows,
+            project_id=self.project_id,
+        )
 
     def _get_or_create_result_category_id(self) -> int:
         """Create a result category so brace rows stay scoped to this pushover result set."""
@@ -8,11 +8,12 @@
 
 import logging
 from dataclasses import dataclass
-from pathlib import Path
 from typing import List, Optional
 
 import pandas as pd
 
+from processing.pushover.pushover_base_parser import BasePushoverParser
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,40 +25,14 @@ class PushoverBraceResults:
     direction: str = ""
 
 
-class PushoverBraceParser:
+class PushoverBraceParser(BasePushoverParser):
     """Parser for pushover brace axial force Excel files."""
 
-    def __init__(self, file_path: Path):
-        self.file_path = file_path
-        self.excel_data = pd.ExcelFile(file_path)
-        self._sheet_cache = {}
-        self._results_cache = {}
-
-    def _read_sheet(
-        self, sheet_name: str, header: int = 1, drop_units: bool = True
-    ) -> pd.DataFrame:
-        """Read and cache a sheet from the Excel file."""
-        cache_key = (sheet_name, header, drop_units)
-        if cache_key in self._sheet_cache:
-            return self._sheet_cache[cache_key].copy()
-
-        df = pd.read_excel(self.excel_data, sheet_name=sheet_name, header=header)
-        if drop_units and len(df) > 0:
-            df = df.drop(0)
-
-        self._sheet_cache[cache_key] = df
-        return df.copy()
+    def _get_primary_sheet(self) -> str:
+        return "Element Forces - Braces"
 
-    def parse(self, direction: str) -> PushoverBraceResults:
+    def _parse_direction(self, direction: str) -> PushoverBraceResults:
         """Parse brace axial forces for a pushover direction."""
-        direction = direction.upper()
-        if direction not in ["X", "Y", "XY"]:
-            raise ValueError(f"Invalid direction '{direction}'. Must be 'X', 'Y', or 'XY'.")
-
-        cached = self._results_cache.get(direction)
-        if cached is not None:
-            return cached
-
         results = PushoverBraceResults(direction=direction)
         try:
             results.axials = self._extract_brace_axials(direction)
@@ -65,17 +40,14 @@ def parse(self, direction: str) -> PushoverBraceResults:
             logger.warning("Failed to extract brace axials for %s: %s", direction, exc)
             results.axials = None
 
-        self._results_cache[direction] = results
         return results
 
     def _extract_brace_axials(self, direction: str) -> pd.DataFrame:
         """Extract min/max brace axial forces per brace, story, and output case."""
-        df = self._read_sheet("Element Forces - Braces")
+        df = self._read_direction_sheet("Element Forces - Braces", direction)
 
         required_cols = ["Story", "Brace", "Output Case", "P"]
         df = df[required_cols].copy()
-
-        df = self._filter_by_direction(df, direction)
         if df.empty:
             return pd.DataFrame(columns=["Brace", "Story", "Output Case", "MinAxial", "MaxAxial"])
 
@@ -102,40 +74,6 @@ def _extract_brace_axials(self, direction: str) -> pd.DataFrame:
 
         return grouped[["Brace", "Story", "Output Case", "MinAxial", "MaxAxial"]]
 
-    def get_available_directions(self) -> List[str]:
-        """Detect available pushover directions from brace force output cases."""
-        df = self._read_sheet("Element Forces - Braces")
-        output_cases = df["Output Case"].unique()
-
-        directions = []
-        if any("X" in str(case).upper() and "Y" in str(case).upper() for case in output_cases):
-            directions.append("XY")
-        if any("X" in str(case).upper() for case in output_cases):
-            directions.append("X")
-        if any("Y" in str(case).upper() for case in output_cases):
-            directions.append("Y")
-        return directions
-
-    def get_output_cases(self, direction: str) -> List[str]:
-        """Get output case names for a pushover direction."""
-        df = self._read_sheet("Element Forces - Braces")
-        direction = direction.upper()
-        filtered = self._filter_by_direction(df, direction)
-        return sorted(filtered["Output Case"].unique().tolist())
-
     def get_braces(self) -> List[str]:
         """Get brace names from the file."""
-        df = self._read_sheet("Element Forces - Braces")
-        return sorted(df["Brace"].unique().tolist())
-
-    @staticmethod
-    def _filter_by_direction(df: pd.DataFrame, direction: str) -> pd.DataFrame:
-        """Filter rows by pushover direction encoded in the output case name."""
-        if direction == "XY":
-            return df[
-                df["Output Case"].apply(
-                    lambda case: "X" in str(case).upper() and "Y" in str(case).upper()
-                )
-            ].copy()
-
-        return df[df["Output Case"].apply(lambda case: direction in str(case).upper())].copy()
+        return sorted(self._distinct_column("Element Forces - Braces", "Brace"))
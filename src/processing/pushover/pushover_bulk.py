@@ -0,0 +1,146 @@
+"""
+Vectorized helpers for bulk pushover result imports.
+
+Pushover parsers return wide DataFrames: identifier columns (element, story,
+unique name...) followed by one column per load case. Importers used to walk
+these row by row and call ``session.add`` once per value. These helpers melt
+each wide frame once, so names can be mapped to IDs with column operations and
+all records written with a single executemany INSERT.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Type
+
+import pandas as pd
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+LOAD_CASE_COLUMN = "LoadCase"
+VALUE_COLUMN = "Value"
+
+
+def normalize_unique_names(values: pd.Series) -> pd.Series:
+    """Vectorized ``str(int(float(value)))`` for ETABS numeric identifiers.
+
+    Args:
+        values: Series of unique names / labels (numeric or numeric strings)
+
+    Returns:
+        Series of integer strings aligned with ``values``
+    """
+    return pd.to_numeric(values).astype("int64").astype(str)
+
+
+def map_ids(values: pd.Series, lookup: Dict[Any, Any]) -> pd.Series:
+    """Map names to integer IDs, leaving unmatched rows as <NA>.
+
+    Args:
+        values: Names (or other keys) per row
+        lookup: Key → integer ID
+
+    Returns:
+        Nullable ``Int64`` Series aligned with ``values``
+    """
+    return values.map(lookup).astype("Int64")
+
+
+def melt_load_case_columns(
+    keys: pd.DataFrame,
+    values: pd.DataFrame,
+    selected_load_cases: Iterable[str],
+    required: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """Reshape wide load-case columns into one row per (source row, load case).
+
+    Rows missing a required key are dropped (the element/story lookup failed),
+    as are load cases outside the selection and empty cells. Output keeps the
+    row-major order of the original per-row loops: all selected load cases of
+    the first row, then the second row, and so on.
+
+    Args:
+        keys: Per-row key columns (already mapped to IDs or normalized names),
+            index-aligned with ``values``
+        values: Load-case columns of the wide DataFrame
+        selected_load_cases: Load cases to keep
+        required: Key columns that must be present (default: all of them);
+            other key columns are carried through and may be null
+
+    Returns:
+        DataFrame with the ``keys`` columns plus ``LoadCase`` and ``Value``
+    """
+    selected = set(selected_load_cases)
+    case_columns = [column for column in values.columns if column in selected]
+    columns = list(keys.columns) + [LOAD_CASE_COLUMN, VALUE_COLUMN]
+
+    required_keys = keys[list(required)] if required is not None else keys
+    row_mask = required_keys.notna().all(axis=1).to_numpy()
+    if not case_columns or not row_mask.any():
+        return pd.DataFrame(columns=columns)
+
+    keys = keys.loc[row_mask].reset_index(drop=True)
+    block = values.loc[row_mask, case_columns].reset_index(drop=True)
+
+    long_df = block.melt(
+        var_name=LOAD_CASE_COLUMN,
+        value_name=VALUE_COLUMN,
+        ignore_index=False,
+    )
+    long_df = long_df[long_df[VALUE_COLUMN].notna()].sort_index(kind="stable")
+
+    result = keys.loc[long_df.index].reset_index(drop=True)
+    result[LOAD_CASE_COLUMN] = long_df[LOAD_CASE_COLUMN].to_numpy()
+    result[VALUE_COLUMN] = long_df[VALUE_COLUMN].astype(float).to_numpy()
+    return result
+
+
+def resolve_load_case_ids(
+    names: pd.Series,
+    get_or_create: Callable[[str], Any],
+) -> pd.Series:
+    """Map load-case names to IDs, resolving each distinct name once.
+
+    Args:
+        names: Load-case name per record
+        get_or_create: Importer's ``_get_or_create_load_case``
+
+    Returns:
+        Series of load case IDs aligned with ``names``
+    """
+    ids = {name: get_or_create(name).id for name in pd.unique(names)}
+    return names.map(ids)
+
+
+def bulk_insert(session: Session, model_class: Type, rows: List[Dict[str, Any]]) -> int:
+    """Insert all rows with one Core executemany statement.
+
+    Args:
+        session: Database session (rows join its current transaction)
+        model_class: ORM model whose table receives the rows
+        rows: Column→value mappings
+
+    Returns:
+        Number of inserted rows
+    """
+    if not rows:
+        return 0
+    session.execute(insert(model_class.__table__), rows)
+    return len(rows)
+
+
+def bulk_insert_frame(session: Session, model_class: Type, frame: pd.DataFrame) -> int:
+    """Insert a long-format DataFrame whose columns match the model's table.
+
+    Args:
+        session: Database session
+        model_class: ORM model whose table receives the rows
+        frame: One row per record, NaN meaning NULL
+
+    Returns:
+        Number of inserted rows
+    """
+    if frame.empty:
+        return 0
+    frame = frame.astype(object).where(frame.notna(), None)
+    return bulk_insert(session, model_class, frame.to_dict("records"))
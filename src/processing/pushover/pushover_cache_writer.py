@@ -0,0 +1,155 @@
+"""
+Set-based cache writer for pushover results.
+
+Pushover importers finish by folding their long result rows (one row per
+element/story/load case) into cache rows whose ``results_matrix`` JSON maps
+each load case to its value. Each builder used to load full ORM instances,
+group them in Python dicts and ``session.add`` every cache row. These helpers
+select only the needed scalar columns, pivot them in one pass and replace the
+cache rows of a (result set, result type) with one DELETE and one
+executemany INSERT.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Type
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from database.models import ElementPeak, ElementResultsCache, LoadCase
+from processing.cache_summary import element_peaks
+from processing.pushover.pushover_bulk import LOAD_CASE_COLUMN, VALUE_COLUMN, bulk_insert
+
+logger = logging.getLogger(__name__)
+
+SORT_ORDER_COLUMN = "story_sort_order"
+MATRIX_COLUMN = "results_matrix"
+
+
+def fetch_cache_records(
+    session: Session,
+    model_class: Type,
+    value_field: str,
+    columns: Sequence[str],
+    load_case_ids: Iterable[int],
+    filters: Sequence[Any] = (),
+    joins: Sequence[Tuple[Any, Any]] = (),
+) -> pd.DataFrame:
+    """Select the scalar columns needed to build cache rows.
+
+    Args:
+        session: Database session
+        model_class: Result model (StoryDrift, BeamRotation, ...)
+        value_field: Model attribute holding the cached value
+        columns: Model attributes carried through (keys, sort order, ...)
+        load_case_ids: Load cases to include
+        filters: Extra WHERE conditions
+        joins: Extra ``(target, onclause)`` inner joins
+
+    Returns:
+        DataFrame with ``columns`` plus ``LoadCase`` (name) and ``Value``,
+        in database row order; values keep their Python types (None for NULL)
+    """
+    statement = (
+        select(
+            *(getattr(model_class, column) for column in columns),
+            LoadCase.name.label(LOAD_CASE_COLUMN),
+            getattr(model_class, value_field).label(VALUE_COLUMN),
+        )
+        .select_from(model_class)
+        .join(LoadCase, model_class.load_case_id == LoadCase.id)
+    )
+    for target, onclause in joins:
+        statement = statement.join(target, onclause)
+    statement = statement.where(model_class.load_case_id.in_(list(load_case_ids)), *filters)
+
+    rows = session.execute(statement).all()
+    return pd.DataFrame(
+        rows,
+        columns=[*columns, LOAD_CASE_COLUMN, VALUE_COLUMN],
+        dtype=object,
+    )
+
+
+def build_results_matrices(
+    records: pd.DataFrame,
+    key_columns: Sequence[str],
+) -> List[Dict[str, Any]]:
+    """Pivot long records into one ``results_matrix`` per key.
+
+    Keys appear in first-seen order and each matrix lists load cases in
+    record order. A repeated load case keeps its first position but takes the
+    last value, and ``story_sort_order`` comes from the first record of each
+    key, matching the dict-based loops this replaces.
+
+    Args:
+        records: Output of :func:`fetch_cache_records`
+        key_columns: Columns identifying one cache row (e.g. element_id, story_id)
+
+    Returns:
+        List of ``{key columns..., story_sort_order, results_matrix}`` dicts
+    """
+    if records.empty:
+        return []
+
+    keys = list(key_columns)
+    group_ids = records.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+    order = np.argsort(group_ids, kind="stable")
+    boundaries = np.flatnonzero(np.diff(group_ids[order])) + 1
+    starts = np.concatenate(([0], boundaries))
+
+    cases = np.split(records[LOAD_CASE_COLUMN].to_numpy()[order], boundaries)
+    values = np.split(records[VALUE_COLUMN].to_numpy()[order], boundaries)
+    heads = records.iloc[order[starts]][keys + [SORT_ORDER_COLUMN]].to_dict("records")
+
+    for row, case_chunk, value_chunk in zip(heads, cases, values):
+        row[MATRIX_COLUMN] = dict(zip(case_chunk.tolist(), value_chunk.tolist()))
+    return heads
+
+
+def replace_cache_rows(
+    session: Session,
+    cache_model: Type,
+    result_set_id: int,
+    result_type: str,
+    rows: List[Dict[str, Any]],
+    **constants: Any,
+) -> int:
+    """Replace every cache row of one result type in a result set.
+
+    Element caches also get their per-element peaks (``ElementPeak``) replaced.
+
+    Args:
+        session: Database session
+        cache_model: GlobalResultsCache or ElementResultsCache
+        result_set_id: Result set being rebuilt
+        result_type: Cache result type (e.g. 'Drifts', 'BeamRotations')
+        rows: Output of :func:`build_results_matrices`
+        **constants: Values shared by all rows (e.g. project_id)
+
+    Returns:
+        Number of inserted cache rows
+    """
+    table = cache_model.__table__
+    session.execute(
+        delete(table).where(
+            table.c.result_set_id == result_set_id,
+            table.c.result_type == result_type,
+        )
+    )
+    shared = {**constants, "result_set_id": result_set_id, "result_type": result_type}
+    count = bulk_insert(session, cache_model, [{**shared, **row} for row in rows])
+    if cache_model is ElementResultsCache:
+        # Keep governing-element peaks in step with the element cache
+        peaks = ElementPeak.__table__
+        session.execute(
+            delete(peaks).where(
+                peaks.c.result_set_id == result_set_id,
+                peaks.c.result_type == result_type,
+            )
+        )
+        bulk_insert(session, ElementPeak, [{**shared, **peak} for peak in element_peaks(rows)])
+    logger.info("Created %s cache entries for %s", count, result_type)
+    return count
@@ -7,11 +7,11 @@
 
 import logging
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
-from database.models import Element, Story, LoadCase, ColumnRotation
+from database.models import ColumnRotation
 from processing.pushover.pushover_element_base import (
     PushoverElementBaseImporter,
     ResultTypeConfig,
@@ -58,23 +58,9 @@ def _get_result_types(self) -> List[ResultTypeConfig]:
             ),
         ]
 
-    def _create_result_record(
-        self,
-        config: ResultTypeConfig,
-        element: Element,
-        story: Story,
-        load_case: LoadCase,
-        value: float,
-        story_sort_order: int,
-    ) -> ColumnRotation:
-        return ColumnRotation(
-            element_id=element.id,
-            story_id=story.id,
-            load_case_id=load_case.id,
-            direction=config.name,  # 'R2' or 'R3'
-            rotation=value,
-            story_sort_order=story_sort_order,
-        )
+    def _get_record_constants(self, config: ResultTypeConfig) -> Dict[str, Any]:
+        """Tag each rotation with its hinge direction ('R2' or 'R3')."""
+        return {'direction': config.name}
 
     def _get_cache_base_name(self) -> str:
         return 'ColumnRotations'
@@ -7,11 +7,10 @@
 
 import pandas as pd
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-from pathlib import Path
+from typing import List, Optional
 import logging
 
-from utils.pushover_utils import detect_direction
+from processing.pushover.pushover_base_parser import BasePushoverParser
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +23,7 @@ class PushoverColumnResults:
     direction: str = ""  # 'X' or 'Y'
 
 
-class PushoverColumnParser:
+class PushoverColumnParser(BasePushoverParser):
     """Parser for pushover column hinge rotation Excel files.
 
     Extracts rotation values (R2 and R3) for each column hinge location.
@@ -35,31 +34,10 @@ class PushoverColumnParser:
     - Extracts Max/Min values per hinge location
     """
 
-    def __init__(self, file_path: Path):
-        """Initialize parser with Excel file path.
+    def _get_primary_sheet(self) -> str:
+        return 'Fiber Hinge States'
 
-        Args:
-            file_path: Path to Excel file with pushover column hinge results
-        """
-        self.file_path = file_path
-        self.excel_data = pd.ExcelFile(file_path)
-        self._sheet_cache = {}
-        self._results_cache = {}
-
-    def _read_sheet(self, sheet_name: str, header: int = 1, drop_units: bool = True) -> pd.DataFrame:
-        """Read and cache a sheet from the Excel file."""
-        cache_key = (sheet_name, header, drop_units)
-        if cache_key in self._sheet_cache:
-            return self._sheet_cache[cache_key].copy()
-
-        df = pd.read_excel(self.excel_data, sheet_name=sheet_name, header=header)
-        if drop_units and len(df) > 0:
-            df = df.drop(0)
-
-        self._sheet_cache[cache_key] = df
-        return df.copy()
-
-    def parse(self, direction: str) -> PushoverColumnResults:
+    def _parse_direction(self, direction: str) -> PushoverColumnResults:
         """Parse all column hinge results for specified direction.
 
         Args:
@@ -67,19 +45,7 @@ def parse(self, direction: str) -> PushoverColumnResults:
 
         Returns:
             PushoverColumnResults with extracted data
-
-        Raises:
-            ValueError: If invalid direction specified
         """
-        if direction.upper() not in ['X', 'Y', 'XY']:
-            raise ValueError(f"Invalid direction '{direction}'. Must be 'X', 'Y', or 'XY'.")
-
-        direction = direction.upper()
-
-        cached = self._results_cache.get(direction)
-        if cached is not None:
-            return cached
-
         results = PushoverColumnResults(direction=direction)
 
         # Extract each rotation type with error handling
@@ -95,7 +61,6 @@ def parse(self, direction: str) -> PushoverColumnResults:
             logger.warning(f"Failed to extract R3 rotations for {direction}: {e}")
             results.rotations_r3 = None
 
-        self._results_cache[direction] = results
         return results
 
     def _extract_column_rotations(self, direction: str, rotation_column: str) -> pd.DataFrame:
@@ -111,18 +76,12 @@ def _extract_column_rotations(self, direction: str, rotation_column: str) -> pd.
         Returns:
             DataFrame with columns: Frame/Wall, Unique Name, [Output Cases...]
         """
-        # Read Fiber Hinge States sheet
-        df = self._read_sheet('Fiber Hinge States')
+        # Read Fiber Hinge States rows for this pushover direction
+        df = self._read_direction_sheet('Fiber Hinge States', direction)
 
         # Filter columns
         df = df[['Frame/Wall', 'Unique Name', 'Output Case', 'Step Type', rotation_column]]
 
-        # Filter by pushover direction
-        if direction == 'XY':
-            df = df[df['Output Case'].apply(lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper())]
-        else:
-            df = df[df['Output Case'].apply(lambda x: direction in str(x).upper())]
-
         # Preserve column and hinge order from Excel
         column_order = df['Frame/Wall'].unique().tolist()
         unique_name_order = df['Unique Name'].unique().tolist()
@@ -143,60 +102,10 @@ def _extract_column_rotations(self, direction: str, rotation_column: str) -> pd.
 
         return max_rotations
 
-    def get_available_directions(self) -> List[str]:
-        """Detect available pushover directions from output cases.
-
-        Returns:
-            List of detected directions (e.g., ['X', 'Y', 'XY'])
-        """
-        # Read Fiber Hinge States sheet to detect directions
-        df = self._read_sheet('Fiber Hinge States')
-
-        output_cases = df['Output Case'].unique()
-
-        directions = []
-
-        # Check for bi-directional first (both X and Y in name)
-        if any('X' in str(case).upper() and 'Y' in str(case).upper() for case in output_cases):
-            directions.append('XY')
-
-        # Check for uni-directional
-        if any('X' in str(case).upper() for case in output_cases):
-            directions.append('X')
-        if any('Y' in str(case).upper() for case in output_cases):
-            directions.append('Y')
-
-        return directions
-
-    def get_output_cases(self, direction: str) -> List[str]:
-        """Get list of output cases for a direction.
-
-        Args:
-            direction: 'X', 'Y', or 'XY'
-
-        Returns:
-            List of output case names
-        """
-        df = self._read_sheet('Fiber Hinge States')
-
-        direction = direction.upper()
-
-        # Filter based on direction
-        if direction == 'XY':
-            # Both X and Y in name
-            cases = df[df['Output Case'].apply(lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper())]['Output Case'].unique()
-        else:
-            # X or Y in name
-            cases = df[df['Output Case'].apply(lambda x: direction in str(x).upper())]['Output Case'].unique()
-
-        return sorted(cases.tolist())
-
     def get_columns(self) -> List[str]:
         """Get list of all columns in the file.
 
         Returns:
             List of column names
         """
-        df = self._read_sheet('Fiber Hinge States')
-
-        return sorted(df['Frame/Wall'].unique().tolist())
+        return sorted(self._distinct_column('Fiber Hinge States', 'Frame/Wall'))
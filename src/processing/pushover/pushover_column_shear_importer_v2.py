@@ -10,8 +10,14 @@
 
 import pandas as pd
 
-from database.models import Element, Story, LoadCase, ColumnShear, ElementResultsCache
+from database.models import Element, Story, ColumnShear, ElementResultsCache
 from processing.pushover.pushover_base_importer import BasePushoverImporter
+from processing.pushover.pushover_bulk import VALUE_COLUMN, map_ids, melt_load_case_columns
+from processing.pushover.pushover_cache_writer import (
+    build_results_matrices,
+    fetch_cache_records,
+    replace_cache_rows,
+)
 from processing.pushover.pushover_column_shear_parser import PushoverColumnShearParser
 
 logger = logging.getLogger(__name__)
@@ -52,13 +58,11 @@ def _ensure_entities(self):
         """Ensure all stories and column elements from data exist in database."""
         parser = self._get_parser()
 
-        # Get columns and stories from first available direction
-        if self.selected_load_cases_x:
-            results = parser.parse('X')
-        elif self.selected_load_cases_y:
-            results = parser.parse('Y')
-        else:
+        # Parse every selected direction in one pass; entities come from the first
+        directions = self._selected_directions()
+        if not directions:
             return
+        results = parser.parse_all(directions)[directions[0]]
 
         if results.shears_v2 is None:
             return
@@ -113,53 +117,25 @@ def _import_shears(
         Returns:
             Count of imported records
         """
-        count = 0
         column_col = df.columns[0]  # 'Column'
         story_col = df.columns[1]  # 'Story'
 
-        for _, row in df.iterrows():
-            column_name = str(row[column_col])
-            story_name = str(row[story_col])
-
-            # Look up element and story from cache
-            element = self.elements_cache.get(f"Column:{column_name}")
-            story = self.stories_cache.get(story_name)
-
-            if not element or not story:
-                continue
-
-            # Import each load case column
-            for load_case_name in df.columns[2:]:
-                if load_case_name not in selected_load_cases:
-                    continue
-
-                value = row[load_case_name]
-                if pd.isna(value):
-                    continue
+        # Look up element and story IDs once per row; unmatched rows drop out in the melt
+        keys = pd.DataFrame({
+            'element_id': map_ids(df[column_col].astype(str), self._element_ids('Column')),
+            'story_id': map_ids(df[story_col].astype(str), self._story_ids()),
+        })
 
-                load_case = self._get_or_create_load_case(load_case_name)
-
-                shear = ColumnShear(
-                    element_id=element.id,
-                    story_id=story.id,
-                    load_case_id=load_case.id,
-                    direction=direction,
-                    force=float(value),
-                    story_sort_order=story.sort_order,
-                )
-                self.session.add(shear)
-                count += 1
-
-        return count
+        records = melt_load_case_columns(keys, df.iloc[:, 2:], selected_load_cases)
+        records['story_sort_order'] = map_ids(records['story_id'], self._story_sort_orders())
+        return self._insert_results(
+            ColumnShear,
+            records.rename(columns={VALUE_COLUMN: 'force'}),
+            direction=direction,
+        )
 
     def _build_cache(self):
         """Build element results cache for column shears."""
-        # Delete existing cache entries
-        self.session.query(ElementResultsCache).filter(
-            ElementResultsCache.result_set_id == self.result_set_id,
-            ElementResultsCache.result_type.in_(['ColumnShears_V2', 'ColumnShears_V3'])
-        ).delete(synchronize_session=False)
-
         # Build cache for V2 and V3
         self._cache_direction('V2')
         self._cache_direction('V3')
@@ -168,56 +144,30 @@ def _build_cache(self):
 
     def _cache_direction(self, direction: str):
         """Build cache for one shear direction (V2 or V3)."""
+        rows = []
         load_case_ids = self._get_load_case_ids()
-        if not load_case_ids:
-            logger.warning(f"No load cases in cache for {direction}")
-            return
-
-        # Query all column shears for this direction
-        records = self.session.query(
-            ColumnShear,
-            LoadCase.name,
-            ColumnShear.element_id,
-            ColumnShear.story_id,
-            ColumnShear.story_sort_order
-        ).join(
-            LoadCase, ColumnShear.load_case_id == LoadCase.id
-        ).filter(
-            ColumnShear.load_case_id.in_(load_case_ids),
-            ColumnShear.direction == direction
-        ).all()
-
-        logger.info(f"Query returned {len(records)} column shear records for {direction}")
-
-        if not records:
-            return
-
-        # Group by element and story
-        element_story_data = {}
-        for shear, load_case_name, element_id, story_id, story_sort_order in records:
-            key = (element_id, story_id)
-            if key not in element_story_data:
-                element_story_data[key] = {
-                    'results_matrix': {},
-                    'story_sort_order': story_sort_order
-                }
-            element_story_data[key]['results_matrix'][load_case_name] = shear.force
-
-        # Create cache entries
-        result_type = f"ColumnShears_{direction}"
-        for (element_id, story_id), data in element_story_data.items():
-            cache_entry = ElementResultsCache(
-                project_id=self.project_id,
-                result_set_id=self.result_set_id,
-                element_id=element_id,
-                story_id=story_id,
-                result_type=result_type,
-                story_sort_order=data['story_sort_order'],
-                results_matrix=data['results_matrix']
+        if load_case_ids:
+            records = fetch_cache_records(
+                self.session,
+                ColumnShear,
+                'force',
+                ['element_id', 'story_id', 'story_sort_order'],
+                load_case_ids,
+                filters=[ColumnShear.direction == direction],
             )
-            self.session.add(cache_entry)
+            logger.info(f"Query returned {len(records)} column shear records for {direction}")
+            rows = build_results_matrices(records, ['element_id', 'story_id'])
+        else:
+            logger.warning(f"No load cases in cache for {direction}")
 
-        logger.info(f"Created {len(element_story_data)} cache entries for {result_type}")
+        replace_cache_rows(
+            self.session,
+            ElementResultsCache,
+            self.result_set_id,
+            f"ColumnShears_{direction}",
+            rows,
+            project_id=self.project_id,
+        )
 
 
 # Alias for backward compatibility
@@ -6,11 +6,10 @@
 
 import pandas as pd
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-from pathlib import Path
+from typing import List, Optional
 import logging
 
-from utils.pushover_utils import detect_direction
+from processing.pushover.pushover_base_parser import BasePushoverParser
 
 logger = logging.getLogger(__name__)
 
@@ -23,37 +22,16 @@ class PushoverColumnShearResults:
     direction: str = ""  # 'X' or 'Y'
 
 
-class PushoverColumnShearParser:
+class PushoverColumnShearParser(BasePushoverParser):
     """Parser for pushover column shear force Excel files.
 
     Extracts shear force values (V2, V3) for each column from "Element Forces - Columns" sheet.
     """
 
-    def __init__(self, file_path: Path):
-        """Initialize parser with Excel file path.
+    def _get_primary_sheet(self) -> str:
+        return 'Element Forces - Columns'
 
-        Args:
-            file_path: Path to Excel file with pushover column shear results
-        """
-        self.file_path = file_path
-        self.excel_data = pd.ExcelFile(file_path)
-        self._sheet_cache = {}
-        self._results_cache = {}
-
-    def _read_sheet(self, sheet_name: str, header: int = 1, drop_units: bool = True) -> pd.DataFrame:
-        """Read and cache a sheet from the Excel file."""
-        cache_key = (sheet_name, header, drop_units)
-        if cache_key in self._sheet_cache:
-            return self._sheet_cache[cache_key].copy()
-
-        df = pd.read_excel(self.excel_data, sheet_name=sheet_name, header=header)
-        if drop_units and len(df) > 0:
-            df = df.drop(0)
-
-        self._sheet_cache[cache_key] = df
-        return df.copy()
-
-    def parse(self, direction: str) -> PushoverColumnShearResults:
+    def _parse_direction(self, direction: str) -> PushoverColumnShearResults:
         """Parse all column shear results for specified direction.
 
         Args:
@@ -61,19 +39,7 @@ def parse(self, direction: str) -> PushoverColumnShearResults:
 
         Returns:
             PushoverColumnShearResults with extracted data
-
-        Raises:
-            ValueError: If invalid direction specified
         """
-        if direction.upper() not in ['X', 'Y', 'XY']:
-            raise ValueError(f"Invalid direction '{direction}'. Must be 'X', 'Y', or 'XY'.")
-
-        direction = direction.upper()
-
-        cached = self._results_cache.get(direction)
-        if cached is not None:
-            return cached
-
         results = PushoverColumnShearResults(direction=direction)
 
         # Extract shears with error handling
@@ -89,7 +55,6 @@ def parse(self, direction: str) -> PushoverColumnShearResults:
             logger.warning(f"Failed to extract V3 shears for {direction}: {e}")
             results.shears_v3 = None
 
-        self._results_cache[direction] = results
         return results
 
     def _extract_column_shears(self, direction: str, shear_direction: str) -> pd.DataFrame:
@@ -105,19 +70,13 @@ def _extract_column_shears(self, direction: str, shear_direction: str) -> pd.Dat
         Returns:
             DataFrame with columns: Column, Story, [Output Cases...]
         """
-        # Read Element Forces - Columns sheet
-        df = self._read_sheet('Element Forces - Columns')
+        # Read Element Forces - Columns rows for this pushover direction
+        df = self._read_direction_sheet('Element Forces - Columns', direction)
 
         # Filter columns
         required_cols = ['Story', 'Column', 'Output Case', 'Step Type', shear_direction]
         df = df[required_cols]
 
-        # Filter by pushover direction
-        if direction == 'XY':
-            df = df[df['Output Case'].apply(lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper())]
-        else:
-            df = df[df['Output Case'].apply(lambda x: direction in str(x).upper())]
-
         # Preserve column and story order from Excel
         column_order = df['Column'].unique().tolist()
         story_order = df['Story'].unique().tolist()
@@ -138,54 +97,6 @@ def _extract_column_shears(self, direction: str, shear_direction: str) -> pd.Dat
 
         return max_shears
 
-    def get_available_directions(self) -> List[str]:
-        """Detect available pushover directions from output cases.
-
-        Returns:
-            List of detected directions (e.g., ['X', 'Y', 'XY'])
-        """
-        # Read Element Forces - Columns sheet to detect directions
-        df = self._read_sheet('Element Forces - Columns')
-
-        output_cases = df['Output Case'].unique()
-
-        directions = []
-
-        # Check for bi-directional first (both X and Y in name)
-        if any('X' in str(case).upper() and 'Y' in str(case).upper() for case in output_cases):
-            directions.append('XY')
-
-        # Check for uni-directional
-        if any('X' in str(case).upper() for case in output_cases):
-            directions.append('X')
-        if any('Y' in str(case).upper() for case in output_cases):
-            directions.append('Y')
-
-        return directions
-
-    def get_output_cases(self, direction: str) -> List[str]:
-        """Get list of output cases for a direction.
-
-        Args:
-            direction: 'X', 'Y', or 'XY'
-
-        Returns:
-            List of output case names
-        """
-        df = self._read_sheet('Element Forces - Columns')
-
-        direction = direction.upper()
-
-        # Filter based on direction
-        if direction == 'XY':
-            # Both X and Y in name
-            cases = df[df['Output Case'].apply(lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper())]['Output Case'].unique()
-        else:
-            # X or Y in name
-            cases = df[df['Output Case'].apply(lambda x: direction in str(x).upper())]['Output Case'].unique()
-
-        return sorted(cases.tolist())
-
     def get_columns(self) -> List[str]:
         """Get list of all columns in the file.
 
@@ -35,6 +35,7 @@ def __init__(self, file_path: str | Path):
         self.file_path = Path(file_path)
         self.excel_file = pd.ExcelFile(file_path)
         self._sheet_cache = {}
+        self._curves_cache: Dict[str, Dict[str, PushoverCurveData]] = {}
 
     def _read_sheet(self, sheet_name: str, header: int = 1, drop_units: bool = True) -> pd.DataFrame:
         """Read and cache a sheet from the Excel file."""
@@ -59,6 +60,10 @@ def parse_curves(self, base_story: str) -> Dict[str, PushoverCurveData]:
         Returns:
             Dictionary mapping case names to PushoverCurveData objects
         """
+        cached = self._curves_cache.get(base_story)
+        if cached is not None:
+            return cached
+
         # Extract displacement data
         displacement_data = self._parse_displacements()
 
@@ -68,6 +73,7 @@ def parse_curves(self, base_story: str) -> Dict[str, PushoverCurveData]:
         # Merge displacement and shear data
         curves = self._merge_data(displacement_data, shear_data)
 
+        self._curves_cache[base_story] = curves
         return curves
 
     def _parse_displacements(self) -> Dict[str, Tuple[List[int], List[float], str]]:
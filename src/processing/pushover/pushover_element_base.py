@@ -3,7 +3,7 @@
 
 Extends BasePushoverImporter with common patterns for element-based results:
 - Entity creation (stories, elements)
-- Row-by-row DataFrame processing
+- Vectorized DataFrame processing with bulk inserts
 - ElementResultsCache building
 
 Subclasses implement:
@@ -11,7 +11,7 @@
 - _get_parser(): Return parser instance
 - _get_story_mapping_sheet(): Return sheet name for unique_name→story mapping
 - _get_result_types(): Return list of result type configs
-- _create_result_record(): Create ORM record for one result
+- _get_record_constants(): Optional extra column values for each record
 """
 
 from abc import abstractmethod
@@ -23,14 +23,19 @@
 import pandas as pd
 from sqlalchemy.orm import Session
 
-from database.models import (
-    ResultSet,
-    Story,
-    LoadCase,
-    Element,
-    ElementResultsCache,
-)
+from database.models import ResultSet, ElementResultsCache
 from processing.pushover.pushover_base_importer import BasePushoverImporter
+from processing.pushover.pushover_bulk import (
+    VALUE_COLUMN,
+    map_ids,
+    melt_load_case_columns,
+    normalize_unique_names,
+)
+from processing.pushover.pushover_cache_writer import (
+    build_results_matrices,
+    fetch_cache_records,
+    replace_cache_rows,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +56,7 @@ class PushoverElementBaseImporter(BasePushoverImporter):
     Handles the common workflow for importing element-based results
     (beams, columns, walls) that follow the pattern:
     1. Create stories and elements from DataFrame
-    2. Import rows with load case filtering
+    2. Melt rows with load case filtering and bulk insert them
     3. Build ElementResultsCache
 
     Subclasses configure the import via abstract methods rather than
@@ -125,30 +130,18 @@ def _get_result_types(self) -> List[ResultTypeConfig]:
         """
         pass
 
-    @abstractmethod
-    def _create_result_record(
-        self,
-        config: ResultTypeConfig,
-        element: Element,
-        story: Story,
-        load_case: LoadCase,
-        value: float,
-        story_sort_order: int,
-    ) -> Any:
-        """Create ORM record for one result.
+    def _get_record_constants(self, config: ResultTypeConfig) -> Dict[str, Any]:
+        """Return column values shared by every record of a result type.
+
+        Override to add fields like direction='R2'.
 
         Args:
             config: Result type configuration
-            element: Element entity
-            story: Story entity
-            load_case: LoadCase entity
-            value: Result value
-            story_sort_order: Sort order for story
 
         Returns:
-            ORM record instance (not yet added to session)
+            Dict of model field → value (empty by default)
         """
-        pass
+        return {}
 
     # ===== Implemented Template Methods =====
 
@@ -164,13 +157,11 @@ def _ensure_entities(self):
         """Ensure all stories and elements exist in database."""
         parser = self._get_parser()
 
-        # Get data from first available direction
-        if self.selected_load_cases_x:
-            results = parser.parse('X')
-        elif self.selected_load_cases_y:
-            results = parser.parse('Y')
-        else:
+        # Parse every selected direction in one pass; entities come from the first
+        directions = self._selected_directions()
+        if not directions:
             return
+        results = parser.parse_all(directions)[directions[0]]
 
         # Use first result type to extract elements
         result_types = self._get_result_types()
@@ -196,10 +187,10 @@ def _ensure_entities(self):
         sheet_name = self._get_story_mapping_sheet()
         if sheet_name:
             raw_df = parser._read_sheet(sheet_name)
-            for _, row in raw_df.iterrows():
-                unique_name = str(int(float(row['Unique Name'])))
-                story_name = str(row['Story'])
-                self.unique_name_story_map[unique_name] = story_name
+            self.unique_name_story_map.update(zip(
+                normalize_unique_names(raw_df['Unique Name']),
+                raw_df['Story'].astype(str),
+            ))
 
             # Create stories
             for story_name in set(self.unique_name_story_map.values()):
@@ -235,63 +226,32 @@ def _import_result_type(
         Returns:
             Count of imported records
         """
-        count = 0
-
         # First two columns are element and unique name
         element_col = df.columns[0]
         unique_name_col = df.columns[1]
 
-        for _, row in df.iterrows():
-            element_name = str(row[element_col])
-            unique_name = str(int(float(row[unique_name_col])))
-
-            # Look up element and story
-            element = self.elements_cache.get(element_name)
-            story_name = self.unique_name_story_map.get(unique_name)
-            story = self.stories_cache.get(story_name) if story_name else None
-
-            if not element or not story:
-                continue
-
-            # Import each load case
-            for load_case_name in df.columns[2:]:
-                if load_case_name not in selected_load_cases:
-                    continue
-
-                value = row[load_case_name]
-                if pd.isna(value):
-                    continue
-
-                load_case = self._get_or_create_load_case(load_case_name)
-                story_sort_order = story.sort_order
-
-                record = self._create_result_record(
-                    config=config,
-                    element=element,
-                    story=story,
-                    load_case=load_case,
-                    value=float(value),
-                    story_sort_order=story_sort_order,
-                )
-                self.session.add(record)
-                count += 1
-
-        return count
+        # Look up element and story once per row; unmatched rows drop out in the melt
+        element_ids = {name: element.id for name, element in self.elements_cache.items()}
+        story_ids = {
+            unique_name: self.stories_cache[story_name].id
+            for unique_name, story_name in self.unique_name_story_map.items()
+            if story_name in self.stories_cache
+        }
+        keys = pd.DataFrame({
+            'element_id': map_ids(df[element_col].astype(str), element_ids),
+            'story_id': map_ids(normalize_unique_names(df[unique_name_col]), story_ids),
+        })
+
+        records = melt_load_case_columns(keys, df.iloc[:, 2:], selected_load_cases)
+        records['story_sort_order'] = map_ids(records['story_id'], self._story_sort_orders())
+        return self._insert_results(
+            config.model_class,
+            records.rename(columns={VALUE_COLUMN: config.model_field}),
+            **self._get_record_constants(config),
+        )
 
     def _build_cache(self):
         """Build element results cache for all result types."""
-        # Delete existing cache entries for this result set
-        result_type_names = [
-            f"{self._get_cache_base_name()}{config.cache_suffix}"
-            for config in self._get_result_types()
-        ]
-
-        self.session.query(ElementResultsCache).filter(
-            ElementResultsCache.result_set_id == self.result_set_id,
-            ElementResultsCache.result_type.in_(result_type_names)
-        ).delete(synchronize_session=False)
-
-        # Build cache for each result type
         for config in self._get_result_types():
             self._build_cache_for_type(config)
 
@@ -308,64 +268,38 @@ def _get_cache_base_name(self) -> str:
         return f"{element_type}Rotations"
 
     def _build_cache_for_type(self, config: ResultTypeConfig):
-        """Build cache entries for one result type.
+        """Replace the cache entries of one result type.
 
         Args:
             config: Result type configuration
         """
-        load_case_ids = self._get_load_case_ids()
-        if not load_case_ids:
-            logger.warning(f"No load cases in cache for {config.name}")
-            return
-
-        # Query all records for this result type
-        model_class = config.model_class
-        records = self.session.query(
-            model_class,
-            LoadCase.name,
-            model_class.element_id,
-            model_class.story_id,
-            model_class.story_sort_order
-        ).join(
-            LoadCase, model_class.load_case_id == LoadCase.id
-        ).filter(
-            model_class.load_case_id.in_(load_case_ids),
-            *self._get_cache_query_filters(config, model_class)
-        ).all()
-
-        logger.info(f"Query returned {len(records)} records for {config.name}")
-
-        if not records:
-            return
-
-        # Group by element and story
-        element_story_data = {}
-        for record, load_case_name, element_id, story_id, story_sort_order in records:
-            key = (element_id, story_id)
-            if key not in element_story_data:
-                element_story_data[key] = {
-                    'results_matrix': {},
-                    'story_sort_order': story_sort_order
-                }
-            # Get value from record using model_field
-            value = getattr(record, config.model_field)
-            element_story_data[key]['results_matrix'][load_case_name] = value
-
-        # Create cache entries
         result_type = f"{self._get_cache_base_name()}{config.cache_suffix}"
-        for (element_id, story_id), data in element_story_data.items():
-            cache_entry = ElementResultsCache(
-                project_id=self.project_id,
-                result_set_id=self.result_set_id,
-                element_id=element_id,
-                story_id=story_id,
-                result_type=result_type,
-                story_sort_order=data['story_sort_order'],
-                results_matrix=data['results_matrix']
+        rows = []
+
+        load_case_ids = self._get_load_case_ids()
+        if load_case_ids:
+            model_class = config.model_class
+            records = fetch_cache_records(
+                self.session,
+                model_class,
+                config.model_field,
+                ["element_id", "story_id", "story_sort_order"],
+                load_case_ids,
+                filters=self._get_cache_query_filters(config, model_class),
             )
-            self.session.add(cache_entry)
+            logger.info(f"Query returned {len(records)} records for {config.name}")
+            rows = build_results_matrices(records, ["element_id", "story_id"])
+        else:
+            logger.warning(f"No load cases in cache for {config.name}")
 
-        logger.info(f"Created {len(element_story_data)} cache entries for {result_type}")
+        replace_cache_rows(
+            self.session,
+            ElementResultsCache,
+            self.result_set_id,
+            result_type,
+            rows,
+            project_id=self.project_id,
+        )
 
     def _get_cache_query_filters(self, config: ResultTypeConfig, model_class) -> list:
         """Return additional filters for cache query.
@@ -22,6 +22,13 @@
     StoryForce,
     GlobalResultsCache,
 )
+from processing.pushover.pushover_base_importer import SelectedDirectionsMixin
+from processing.pushover.pushover_bulk import LOAD_CASE_COLUMN
+from processing.pushover.pushover_cache_writer import (
+    build_results_matrices,
+    fetch_cache_records,
+    replace_cache_rows,
+)
 from processing.pushover.pushover_global_parser import PushoverGlobalParser
 
 logger = logging.getLogger(__name__)
@@ -56,7 +63,7 @@ def ensure_pushover_result_set(
     return result_set
 
 
-class PushoverGlobalImporter:
+class PushoverGlobalImporter(SelectedDirectionsMixin):
     """Importer for pushover global results.
 
     Imports story-level results (drifts, displacements, forces) from Excel files
@@ -360,13 +367,12 @@ def _ensure_stories(self, parser: Optional[PushoverGlobalParser] = None):
         if parser is None:
             parser = PushoverGlobalParser(self.valid_files[0])
 
-        # Get stories from drifts (all result types should have same stories)
-        if self.selected_load_cases_x:
-            results = parser.parse('X')
-        elif self.selected_load_cases_y:
-            results = parser.parse('Y')
-        else:
+        # Parse every selected direction in one pass; stories come from the
+        # first direction's drifts (all result types should have same stories)
+        directions = self._selected_directions()
+        if not directions:
             return
+        results = parser.parse_all(directions)[directions[0]]
 
         if results.drifts is None:
             return
@@ -424,11 +430,6 @@ def _build_cache(self):
         - result_type: "Drifts", "Forces", "Displacements" (no direction suffix)
         - results_matrix: {load_case_name: value, ...} for all load cases (X and Y combined)
         """
-        # Delete existing cache for this result set
-        self.session.query(GlobalResultsCache).filter(
-            GlobalResultsCache.result_set_id == self.result_set.id
-        ).delete()
-
         # Cache each result type (merging X and Y data)
         self._cache_result_type('Drifts')
         self._cache_result_type('Displacements')
@@ -454,79 +455,49 @@ def _cache_result_type(self, result_type: str):
         else:
             return
 
+        rows = []
+
         # Get load case IDs that were imported in this session
-        if not self.load_cases_cache:
+        if self.load_cases_cache:
+            load_case_ids = [lc.id for lc in self.load_cases_cache.values()]
+            logger.info(f"Building cache for {result_type}: {len(load_case_ids)} load cases")
+
+            # Query data for imported load cases only (both X and Y directions)
+            records = fetch_cache_records(
+                self.session,
+                model,
+                value_col,
+                ['story_id', 'story_sort_order', 'direction'],
+                load_case_ids,
+                joins=[(Story, model.story_id == Story.id)],
+            )
+            logger.info(f"Query returned {len(records)} records for {result_type}")
+
+            if records.empty:
+                logger.warning(f"No records found for {result_type}")
+            else:
+                # Add direction suffix to load case names (matching NLTHA pattern).
+                # For pushover, replace underscores in load case name to prevent transformer from splitting incorrectly
+                # e.g., "Push_X+Ecc+" becomes "Push-X+Ecc+_X" for Drifts X direction
+                # The transformer will strip "_X" and display "Push-X+Ecc+"
+                suffixes = {direction: suffix[result_type] for direction, suffix in direction_suffix_map.items()}
+                records[LOAD_CASE_COLUMN] = (
+                    records[LOAD_CASE_COLUMN].str.replace('_', '-', regex=False)
+                    + records['direction'].map(suffixes)
+                )
+                rows = build_results_matrices(records.drop(columns='direction'), ['story_id'])
+        else:
             logger.warning(f"No load cases in cache for {result_type}")
-            return
-
-        load_case_ids = [lc.id for lc in self.load_cases_cache.values()]
-        logger.info(f"Building cache for {result_type}: {len(load_case_ids)} load cases")
-        logger.debug(f"Load case names: {list(self.load_cases_cache.keys())}")
 
-        # Query data for imported load cases only (both X and Y directions)
-        from database.models import LoadCase, Story
-
-        records = self.session.query(model, LoadCase.name, Story.name, model.story_sort_order, model.direction).join(
-            LoadCase, model.load_case_id == LoadCase.id
-        ).join(
-            Story, model.story_id == Story.id
-        ).filter(
-            model.load_case_id.in_(load_case_ids)
-        ).all()
-
-        logger.info(f"Query returned {len(records)} records for {result_type}")
-
-        if not records:
-            logger.warning(f"No records found for {result_type}")
-            return
-
-        # Debug: Check directions in records
-        directions_in_records = set(r[4] for r in records)
-        stories_in_records = set(r[2] for r in records)
-        logger.debug(f"Directions in records: {directions_in_records}")
-        logger.debug(f"Stories in records: {stories_in_records}")
-
-        # Build cache grouped by story
-        # Format: {story_id: {load_case_name: value, ...}}
-        story_data = {}
-
-        for record, load_case_name, story_name, story_sort_order, direction in records:
-            story_id = record.story_id
-
-            if story_id not in story_data:
-                story_data[story_id] = {
-                    'results_matrix': {},
-                    'story_sort_order': story_sort_order,  # From result record (Excel sheet order)
-                }
-
-            # Add load case value to results matrix with direction suffix (matching NLTHA pattern)
-            # For pushover, replace underscores in load case name to prevent transformer from splitting incorrectly
-            # e.g., "Push_X+Ecc+" becomes "Push-X+Ecc+_X" for Drifts X direction
-            # The transformer will strip "_X" and display "Push-X+Ecc+"
-            suffix = direction_suffix_map[direction][result_type]
-
-            # Replace underscores with hyphens in load case name to prevent split issues
-            safe_load_case_name = load_case_name.replace('_', '-')
-            load_case_key = f"{safe_load_case_name}{suffix}"
-            value = getattr(record, value_col)
-            story_data[story_id]['results_matrix'][load_case_key] = value
-
-        # Create cache entries (one per story per result type)
-        logger.info(f"Creating {len(story_data)} cache entries for {result_type}")
-        for story_id, data in story_data.items():
-            story_name = self.session.query(Story).get(story_id).name
-            load_case_count = len(data['results_matrix'])
-            logger.debug(f"  {story_name}: {load_case_count} load cases")
-
-            cache_entry = GlobalResultsCache(
-                project_id=self.project_id,
-                result_set_id=self.result_set.id,
-                result_type=result_type,  # Just "Drifts", "Forces", "Displacements"
-                story_id=story_id,
-                results_matrix=data['results_matrix'],
-                story_sort_order=data['story_sort_order'],
-            )
-            self.session.add(cache_entry)
+        # One cache entry per story per result type
+        replace_cache_rows(
+            self.session,
+            GlobalResultsCache,
+            self.result_set.id,
+            result_type,
+            rows,
+            project_id=self.project_id,
+        )
 
     def _log_progress(self, message: str, current: int, total: int):
         """Log progress message."""
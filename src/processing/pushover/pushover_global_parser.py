@@ -5,12 +5,15 @@
 Based on the approach from Old_scripts/ETPS/ETPS_Library/ETPS_Responses.py
 """
 
+import logging
+
 import pandas as pd
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-from pathlib import Path
+from typing import Optional
+
+from processing.pushover.pushover_base_parser import BasePushoverParser
 
-from utils.pushover_utils import detect_direction
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -22,7 +25,7 @@ class PushoverGlobalResults:
     direction: str = ""  # 'X' or 'Y'
 
 
-class PushoverGlobalParser:
+class PushoverGlobalParser(BasePushoverParser):
     """Parser for pushover global results Excel files.
 
     Extracts maximum values per story and output case for:
@@ -33,31 +36,10 @@ class PushoverGlobalParser:
     Based on ETPS_Responses.py approach.
     """
 
-    def __init__(self, file_path: Path):
-        """Initialize parser with Excel file path.
-
-        Args:
-            file_path: Path to Excel file with pushover global results
-        """
-        self.file_path = file_path
-        self.excel_data = pd.ExcelFile(file_path)
-        self._sheet_cache = {}
-        self._results_cache = {}
-
-    def _read_sheet(self, sheet_name: str, header: int = 1, drop_units: bool = True) -> pd.DataFrame:
-        """Read and cache a sheet from the Excel file."""
-        cache_key = (sheet_name, header, drop_units)
-        if cache_key in self._sheet_cache:
-            return self._sheet_cache[cache_key].copy()
-
-        df = pd.read_excel(self.excel_data, sheet_name=sheet_name, header=header)
-        if drop_units and len(df) > 0:
-            df = df.drop(0)
-
-        self._sheet_cache[cache_key] = df
-        return df.copy()
+    def _get_primary_sheet(self) -> str:
+        return 'Story Drifts'
 
-    def parse(self, direction: str) -> PushoverGlobalResults:
+    def _parse_direction(self, direction: str) -> PushoverGlobalResults:
         """Parse all global results for specified direction.
 
         Args:
@@ -65,44 +47,28 @@ def parse(self, direction: str) -> PushoverGlobalResults:
 
         Returns:
             PushoverGlobalResults with extracted data
-
-        Raises:
-            ValueError: If invalid direction specified
         """
-        if direction.upper() not in ['X', 'Y', 'XY']:
-            raise ValueError(f"Invalid direction '{direction}'. Must be 'X', 'Y', or 'XY'.")
-
-        direction = direction.upper()
-
-        cached = self._results_cache.get(direction)
-        if cached is not None:
-            return cached
-
         results = PushoverGlobalResults(direction=direction)
 
         # Extract each result type with error handling
         try:
             results.drifts = self._extract_drifts(direction)
         except Exception as e:
-            import logging
-            logging.warning(f"Failed to extract drifts for {direction}: {e}")
+            logger.warning(f"Failed to extract drifts for {direction}: {e}")
             results.drifts = None
 
         try:
             results.displacements = self._extract_displacements(direction)
         except Exception as e:
-            import logging
-            logging.warning(f"Failed to extract displacements for {direction}: {e}")
+            logger.warning(f"Failed to extract displacements for {direction}: {e}")
             results.displacements = None
 
         try:
             results.forces = self._extract_forces(direction)
         except Exception as e:
-            import logging
-            logging.warning(f"Failed to extract forces for {direction}: {e}")
+            logger.warning(f"Failed to extract forces for {direction}: {e}")
             results.forces = None
 
-        self._results_cache[direction] = results
         return results
 
     def _extract_drifts(self, direction: str) -> pd.DataFrame:
@@ -116,18 +82,13 @@ def _extract_drifts(self, direction: str) -> pd.DataFrame:
         Returns:
             DataFrame with columns: Story, [Output Cases...]
         """
-        # Read Story Drifts sheet
-        df = self._read_sheet('Story Drifts')
+        # Read Story Drifts rows for this pushover direction (not drift component direction!)
+        df = self._read_direction_sheet('Story Drifts', direction)
 
         # Filter columns
         df = df[['Story', 'Output Case', 'Step Type', 'Direction', 'Drift']]
 
-        # Filter by pushover direction (not drift component direction!)
-        # Keep only cases where the pushover is in the specified direction
         if direction == 'XY':
-            # Bi-directional: match cases with both X and Y in name
-            df = df[df['Output Case'].apply(lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper())]
-
             # For XY, we need both X and Y components to compute resultant
             # Get X drifts
             df_x = df[df['Direction'] == 'X'].copy()
@@ -151,9 +112,6 @@ def _extract_drifts(self, direction: str) -> pd.DataFrame:
             df = df_merged[['Story', 'Output Case', 'Step Type', 'Drift']]
         else:
             # Uni-directional: X or Y
-            # Match cases with direction letter in name
-            df = df[df['Output Case'].apply(lambda x: direction in str(x).upper())]
-
             # Filter to only the primary drift component (Direction matches pushover direction)
             # For X pushover, use X drift; for Y pushover, use Y drift
             df = df[df['Direction'] == direction]
@@ -187,14 +145,12 @@ def _extract_displacements(self, direction: str) -> pd.DataFrame:
         Returns:
             DataFrame with columns: Story, [Output Cases...]
         """
-        # Read Joint Displacements sheet
-        df = self._read_sheet('Joint Displacements')
+        # Read Joint Displacements rows for this pushover direction
+        df = self._read_direction_sheet('Joint Displacements', direction)
 
         # Handle based on direction
         if direction == 'XY':
             # Bi-directional: compute resultant from Ux and Uy
-            df = df[df['Output Case'].apply(lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper())]
-
             # Filter columns
             df = df[['Story', 'Output Case', 'Step Type', 'Ux', 'Uy']]
 
@@ -208,9 +164,6 @@ def _extract_displacements(self, direction: str) -> pd.DataFrame:
             # Filter columns
             df = df[['Story', 'Output Case', 'Step Type', col_disp]]
 
-            # Filter by pushover direction
-            df = df[df['Output Case'].apply(lambda x: direction in str(x).upper())]
-
         # Preserve story order from Excel (first occurrence order)
         story_order = df['Story'].unique().tolist()
 
@@ -240,8 +193,8 @@ def _extract_forces(self, direction: str) -> pd.DataFrame:
         Returns:
             DataFrame with columns: Story, [Output Cases...]
         """
-        # Read Story Forces sheet
-        df = self._read_sheet('Story Forces')
+        # Read Story Forces rows for this pushover direction
+        df = self._read_direction_sheet('Story Forces', direction)
 
         # Filter to Bottom location only (exclude Top)
         df = df[~df['Location'].str.contains('Top', na=False)]
@@ -249,8 +202,6 @@ def _extract_forces(self, direction: str) -> pd.DataFrame:
         # Handle based on direction
         if direction == 'XY':
             # Bi-directional: compute resultant from VX and VY
-            df = df[df['Output Case'].apply(lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper())]
-
             # Filter columns
             df = df[['Story', 'Output Case', 'Step Type', 'Location', 'VX', 'VY']]
 
@@ -264,9 +215,6 @@ def _extract_forces(self, direction: str) -> pd.DataFrame:
             # Filter columns
             df = df[['Story', 'Output Case', 'Step Type', 'Location', col_shear]]
 
-            # Filter by pushover direction
-            df = df[df['Output Case'].apply(lambda x: direction in str(x).upper())]
-
         # Preserve story order from Excel (first occurrence order)
         story_order = df['Story'].unique().tolist()
 
@@ -283,51 +231,3 @@ def _extract_forces(self, direction: str) -> pd.DataFrame:
         max_shears.columns.name = None
 
         return max_shears
-
-    def get_available_directions(self) -> List[str]:
-        """Detect available pushover directions from output cases.
-
-        Returns:
-            List of detected directions (e.g., ['X', 'Y', 'XY'])
-        """
-        # Read Story Drifts sheet to detect directions
-        df = self._read_sheet('Story Drifts')
-
-        output_cases = df['Output Case'].unique()
-
-        directions = []
-
-        # Check for bi-directional first (both X and Y in name)
-        if any('X' in str(case).upper() and 'Y' in str(case).upper() for case in output_cases):
-            directions.append('XY')
-
-        # Check for uni-directional
-        if any('X' in str(case).upper() for case in output_cases):
-            directions.append('X')
-        if any('Y' in str(case).upper() for case in output_cases):
-            directions.append('Y')
-
-        return directions
-
-    def get_output_cases(self, direction: str) -> List[str]:
-        """Get list of output cases for a direction.
-
-        Args:
-            direction: 'X', 'Y', or 'XY'
-
-        Returns:
-            List of output case names
-        """
-        df = self._read_sheet('Story Drifts')
-
-        direction = direction.upper()
-
-        # Filter based on direction
-        if direction == 'XY':
-            # Both X and Y in name
-            cases = df[df['Output Case'].apply(lambda x: 'X' in str(x).upper() and 'Y' in str(x).upper())]['Output Case'].unique()
-        else:
-            # X or Y in name
-            cases = df[df['Output Case'].apply(lambda x: direction in str(x).upper())]['Output Case'].unique()
-
-        return sorted(cases.tolist())
@@ -18,11 +18,13 @@
     LoadCase,
     JointResultsCache,
 )
+from .pushover_base_importer import SelectedDirectionsMixin
+from .pushover_bulk import LOAD_CASE_COLUMN, bulk_insert, melt_load_case_columns
 
 logger = logging.getLogger(__name__)
 
 
-class BasePushoverJointImporter(ABC):
+class BasePushoverJointImporter(SelectedDirectionsMixin, ABC):
     """Base class for pushover joint result importers.
 
     Subclasses must implement:
@@ -86,6 +88,10 @@ def import_all(self) -> Dict:
             stats = self._get_stats_template()
             parser = self._create_parser()
 
+            # Parse every selected direction from one read of each sheet
+            self._log_progress("Parsing results...", 20, 100)
+            parser.parse_all(self._selected_directions())
+
             # Import X direction
             if self.selected_load_cases_x:
                 self._log_progress("Importing X direction...", 30, 100)
@@ -187,6 +193,31 @@ def _get_or_create_load_case(self, load_case_name: str) -> LoadCase:
         self.load_cases_cache[load_case_name] = load_case
         return load_case
 
+    def _melt_selected_values(
+        self,
+        keys: pd.DataFrame,
+        values: pd.DataFrame,
+        selected_load_cases: Set[str],
+    ) -> pd.DataFrame:
+        """Melt load-case columns and register every load case that has a value.
+
+        Args:
+            keys: Per-row joint key columns (normalized names)
+            values: Load-case columns of the wide DataFrame
+            selected_load_cases: Set of load cases to import
+
+        Returns:
+            Long-format DataFrame (keys, LoadCase, Value)
+        """
+        records = melt_load_case_columns(keys, values, selected_load_cases)
+        for load_case_name in pd.unique(records[LOAD_CASE_COLUMN]):
+            self._get_or_create_load_case(load_case_name)
+        return records
+
+    def _insert_cache_entries(self, entries: List[Dict]) -> int:
+        """Bulk insert JointResultsCache rows built with ``_create_cache_row``."""
+        return bulk_insert(self.session, JointResultsCache, entries)
+
     def _delete_existing_cache(self, result_types: List[str]) -> None:
         """Delete existing cache entries for specified result types."""
         self.session.query(JointResultsCache).filter(
@@ -194,22 +225,22 @@ def _delete_existing_cache(self, result_types: List[str]) -> None:
             JointResultsCache.result_type.in_(result_types)
         ).delete(synchronize_session=False)
 
-    def _create_cache_entry(
+    def _create_cache_row(
         self,
         shell_object: str,
         unique_name: str,
         result_type: str,
         results_matrix: Dict
-    ) -> JointResultsCache:
-        """Create a JointResultsCache entry."""
-        return JointResultsCache(
-            project_id=self.project_id,
-            result_set_id=self.result_set_id,
-            shell_object=shell_object,
-            unique_name=unique_name,
-            result_type=result_type,
-            results_matrix=results_matrix
-        )
+    ) -> Dict:
+        """Create a JointResultsCache column mapping for bulk insertion."""
+        return {
+            'project_id': self.project_id,
+            'result_set_id': self.result_set_id,
+            'shell_object': shell_object,
+            'unique_name': unique_name,
+            'result_type': result_type,
+            'results_matrix': results_matrix,
+        }
 
     def _log_progress(self, message: str, current: int, total: int) -> None:
         """Log progress message."""
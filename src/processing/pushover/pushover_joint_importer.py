@@ -11,6 +11,7 @@
 import pandas as pd
 
 from .pushover_joint_base import BasePushoverJointImporter
+from .pushover_bulk import normalize_unique_names
 from .pushover_joint_parser import PushoverJointParser
 
 logger = logging.getLogger(__name__)
@@ -82,39 +83,28 @@ def _import_direction(self, parser: PushoverJointParser, direction: str, selecte
 
     def _import_displacements(self, df: pd.DataFrame, displacement_type: str, selected_load_cases: Set[str]) -> int:
         """Import joint displacements from DataFrame."""
-        count = 0
-
         story_col = df.columns[0]  # 'Story'
         label_col = df.columns[1]  # 'Label'
         unique_name_col = df.columns[2]  # 'Unique Name'
 
-        for _, row in df.iterrows():
-            story_name = str(row[story_col])
-            label = str(int(float(row[label_col])))
-            unique_name = str(int(float(row[unique_name_col])))
-
-            joint_key = (story_name, label, unique_name)
-
-            if joint_key not in self.joint_data:
-                self.joint_data[joint_key] = {}
-
-            for load_case_name in df.columns[3:]:
-                if load_case_name not in selected_load_cases:
-                    continue
-
-                value = row[load_case_name]
-                if pd.isna(value):
-                    continue
+        keys = pd.DataFrame({
+            'story': df[story_col].astype(str),
+            'label': normalize_unique_names(df[label_col]),
+            'unique_name': normalize_unique_names(df[unique_name_col]),
+        })
 
-                self._get_or_create_load_case(load_case_name)
+        # Every joint gets an entry, even when none of its values are selected
+        for joint_key in zip(keys['story'], keys['label'], keys['unique_name']):
+            self.joint_data.setdefault(joint_key, {})
 
-                if displacement_type not in self.joint_data[joint_key]:
-                    self.joint_data[joint_key][displacement_type] = {}
+        records = self._melt_selected_values(keys, df.iloc[:, 3:], selected_load_cases)
+        for story_name, label, unique_name, load_case_name, value in records.itertuples(
+            index=False, name=None
+        ):
+            joint_values = self.joint_data[(story_name, label, unique_name)]
+            joint_values.setdefault(displacement_type, {})[load_case_name] = value
 
-                self.joint_data[joint_key][displacement_type][load_case_name] = float(value)
-                count += 1
-
-        return count
+        return len(records)
 
     def _build_cache(self) -> None:
         """Build joint results cache for joint displacements."""
@@ -129,22 +119,17 @@ def _build_cache(self) -> None:
     def _cache_displacement_type(self, displacement_type: str) -> None:
         """Build cache for one displacement type (Ux, Uy, or Uz)."""
         result_type = f"JointDisplacements_{displacement_type}"
-        count = 0
-
-        for (story, label, unique_name), displacement_data in self.joint_data.items():
-            if displacement_type not in displacement_data:
-                continue
-
-            # Create joint identifier (Story-Label format for shell_object)
-            shell_object = f"{story}-{label}"
-
-            cache_entry = self._create_cache_entry(
-                shell_object=shell_object,
+        entries = [
+            # Joint identifier uses Story-Label format for shell_object
+            self._create_cache_row(
+                shell_object=f"{story}-{label}",
                 unique_name=unique_name,
                 result_type=result_type,
                 results_matrix=displacement_data[displacement_type]
             )
-            self.session.add(cache_entry)
-            count += 1
+            for (story, label, unique_name), displacement_data in self.joint_data.items()
+            if displacement_type in displacement_data
+        ]
+        count = self._insert_cache_entries(entries)
 
         logger.info(f"Created {count} cache entries for {result_type}")
@@ -5,12 +5,15 @@
 Extracts Ux, Uy, Uz displacements for joints at each pushover step.
 """
 
+import re
+
 import pandas as pd
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-from pathlib import Path
+from typing import List, Optional
 import logging
 
+from processing.pushover.pushover_base_parser import BasePushoverParser
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +26,7 @@ class PushoverJointResults:
     direction: str = ""  # 'X' or 'Y'
 
 
-class PushoverJointParser:
+class PushoverJointParser(BasePushoverParser):
     """Parser for pushover joint displacement Excel files.
 
     Extracts displacement values (Ux, Uy, Uz) for each joint at pushover steps.
@@ -34,31 +37,16 @@ class PushoverJointParser:
     - Takes absolute max across Max/Min step types per joint/case
     """
 
-    def __init__(self, file_path: Path):
-        """Initialize parser with Excel file path.
-
-        Args:
-            file_path: Path to Excel file with pushover joint displacement results
-        """
-        self.file_path = file_path
-        self.excel_data = pd.ExcelFile(file_path)
-        self._sheet_cache = {}
-        self._results_cache = {}
-
-    def _read_sheet(self, sheet_name: str, header: int = 1, drop_units: bool = True) -> pd.DataFrame:
-        """Read and cache a sheet from the Excel file."""
-        cache_key = (sheet_name, header, drop_units)
-        if cache_key in self._sheet_cache:
-            return self._sheet_cache[cache_key].copy()
+    VALID_DIRECTIONS = ('X', 'Y')
 
-        df = pd.read_excel(self.excel_data, sheet_name=sheet_name, header=header)
-        if drop_units and len(df) > 0:
-            df = df.drop(0)
+    def _get_primary_sheet(self) -> str:
+        return 'Joint Displacements'
 
-        self._sheet_cache[cache_key] = df
-        return df.copy()
+    def _case_matches_direction(self, case, direction: str) -> bool:
+        """Match pushover cases by their _X+ / _Y- style direction suffix."""
+        return re.search(f'[_/]{direction}[+-]', str(case)) is not None
 
-    def parse(self, direction: str) -> PushoverJointResults:
+    def _parse_direction(self, direction: str) -> PushoverJointResults:
         """Parse all joint displacement results for specified direction.
 
         Args:
@@ -66,19 +54,7 @@ def parse(self, direction: str) -> PushoverJointResults:
 
         Returns:
             PushoverJointResults with extracted data
-
-        Raises:
-            ValueError: If invalid direction specified
         """
-        if direction.upper() not in ['X', 'Y']:
-            raise ValueError(f"Invalid direction '{direction}'. Must be 'X' or 'Y'.")
-
-        direction = direction.upper()
-
-        cached = self._results_cache.get(direction)
-        if cached is not None:
-            return cached
-
         results = PushoverJointResults(direction=direction)
 
         # Extract displacements with error handling
@@ -100,7 +76,6 @@ def parse(self, direction: str) -> PushoverJointResults:
             logger.warning(f"Failed to extract Uz displacements for {direction}: {e}")
             results.displacements_uz = None
 
-        self._results_cache[direction] = results
         return results
 
     def _extract_joint_displacements(self, direction: str, displacement_column: str) -> pd.DataFrame:
@@ -116,17 +91,12 @@ def _extract_joint_displacements(self, direction: str, displacement_column: str)
         Returns:
             DataFrame with columns: Story, Label, Unique Name, [Output Cases...]
         """
-        # Read Joint Displacements sheet
-        df = self._read_sheet('Joint Displacements')
+        # Read Joint Displacements rows for this pushover direction (_X+, _X-, _Y+, _Y- etc.)
+        df = self._read_direction_sheet('Joint Displacements', direction)
 
         # Filter columns
         df = df[['Story', 'Label', 'Unique Name', 'Output Case', 'Step Type', displacement_column]]
 
-        # Filter by pushover direction (pattern: _X+ or _Y+ in the Output Case name)
-        import re
-        pattern = f'[_/]{direction}[+-]'  # Matches _X+, _X-, _Y+, _Y- etc.
-        df = df[df['Output Case'].str.contains(pattern, na=False, regex=True)]
-
         # Preserve joint order from Excel
         story_order = df['Story'].unique().tolist()
         label_order = df['Label'].unique().tolist()
@@ -171,26 +141,6 @@ def get_available_directions(self) -> List[str]:
 
         return directions
 
-    def get_output_cases(self, direction: str) -> List[str]:
-        """Get list of output cases for a direction.
-
-        Args:
-            direction: 'X' or 'Y'
-
-        Returns:
-            List of output case names
-        """
-        df = self._read_sheet('Joint Displacements')
-
-        # Filter by pushover direction in Output Case name
-        direction = direction.upper()
-
-        import re
-        pattern = f'[_/]{direction}[+-]'  # Matches _X+, _X-, _Y+, _Y- etc.
-        cases = df[df['Output Case'].str.contains(pattern, na=False, regex=True)]['Output Case'].unique()
-
-        return sorted(cases.tolist())
-
     def get_joints(self) -> List[str]:
         """Get list of all unique joints in the file.
 
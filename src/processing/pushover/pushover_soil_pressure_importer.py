@@ -11,6 +11,7 @@
 import pandas as pd
 
 from .pushover_joint_base import BasePushoverJointImporter
+from .pushover_bulk import normalize_unique_names
 from .pushover_soil_pressure_parser import PushoverSoilPressureParser
 from ..import_utils import require_sheets
 
@@ -67,49 +68,40 @@ def _import_direction(self, parser: PushoverSoilPressureParser, direction: str,
 
     def _import_soil_pressures(self, df: pd.DataFrame, selected_load_cases: Set[str]) -> int:
         """Import soil pressures from DataFrame."""
-        count = 0
-
         shell_object_col = df.columns[0]  # 'Shell Object'
         unique_name_col = df.columns[1]  # 'Unique Name'
 
-        for _, row in df.iterrows():
-            shell_object = str(row[shell_object_col])
-            unique_name = str(int(float(row[unique_name_col])))
-
-            element_key = (shell_object, unique_name)
-
-            if element_key not in self.soil_pressure_data:
-                self.soil_pressure_data[element_key] = {}
+        keys = pd.DataFrame({
+            'shell_object': df[shell_object_col].astype(str),
+            'unique_name': normalize_unique_names(df[unique_name_col]),
+        })
 
-            for load_case_name in df.columns[2:]:
-                if load_case_name not in selected_load_cases:
-                    continue
+        # Every element gets an entry, even when none of its values are selected
+        for element_key in zip(keys['shell_object'], keys['unique_name']):
+            self.soil_pressure_data.setdefault(element_key, {})
 
-                value = row[load_case_name]
-                if pd.isna(value):
-                    continue
+        records = self._melt_selected_values(keys, df.iloc[:, 2:], selected_load_cases)
+        for shell_object, unique_name, load_case_name, value in records.itertuples(
+            index=False, name=None
+        ):
+            self.soil_pressure_data[(shell_object, unique_name)][load_case_name] = value
 
-                self._get_or_create_load_case(load_case_name)
-                self.soil_pressure_data[element_key][load_case_name] = float(value)
-                count += 1
-
-        return count
+        return len(records)
 
     def _build_cache(self) -> None:
         """Build joint results cache for soil pressures."""
         self._delete_existing_cache(self._get_result_types())
 
         result_type = "SoilPressures_Min"
-        count = 0
-
-        for (shell_object, unique_name), pressure_data in self.soil_pressure_data.items():
-            cache_entry = self._create_cache_entry(
+        entries = [
+            self._create_cache_row(
                 shell_object=shell_object,
                 unique_name=unique_name,
                 result_type=result_type,
                 results_matrix=pressure_data
             )
-            self.session.add(cache_entry)
-            count += 1
+            for (shell_object, unique_name), pressure_data in self.soil_pressure_data.items()
+        ]
+        count = self._insert_cache_entries(entries)
 
         logger.info(f"Created {count} cache entries for {result_type}")
@@ -7,10 +7,11 @@
 
 import pandas as pd
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-from pathlib import Path
+from typing import List, Optional
 import logging
 
+from processing.pushover.pushover_base_parser import BasePushoverParser
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +22,7 @@ class PushoverSoilPressureResults:
     direction: str = ""  # 'X' or 'Y'
 
 
-class PushoverSoilPressureParser:
+class PushoverSoilPressureParser(BasePushoverParser):
     """Parser for pushover soil pressure Excel files.
 
     Extracts minimum soil pressure values for each foundation element at pushover steps.
@@ -32,31 +33,12 @@ class PushoverSoilPressureParser:
     - Takes minimum soil pressure per element/case (from Min step type)
     """
 
-    def __init__(self, file_path: Path):
-        """Initialize parser with Excel file path.
-
-        Args:
-            file_path: Path to Excel file with pushover soil pressure results
-        """
-        self.file_path = file_path
-        self.excel_data = pd.ExcelFile(file_path)
-        self._sheet_cache = {}
-        self._results_cache = {}
-
-    def _read_sheet(self, sheet_name: str, header: int = 1, drop_units: bool = True) -> pd.DataFrame:
-        """Read and cache a sheet from the Excel file."""
-        cache_key = (sheet_name, header, drop_units)
-        if cache_key in self._sheet_cache:
-            return self._sheet_cache[cache_key].copy()
+    VALID_DIRECTIONS = ('X', 'Y')
 
-        df = pd.read_excel(self.excel_data, sheet_name=sheet_name, header=header)
-        if drop_units and len(df) > 0:
-            df = df.drop(0)
+    def _get_primary_sheet(self) -> str:
+        return 'Soil Pressures'
 
-        self._sheet_cache[cache_key] = df
-        return df.copy()
-
-    def parse(self, direction: str) -> PushoverSoilPressureResults:
+    def _parse_direction(self, direction: str) -> PushoverSoilPressureResults:
         """Parse soil pressure results for specified direction.
 
         Args:
@@ -64,19 +46,7 @@ def parse(self, direction: str) -> PushoverSoilPressureResults:
 
         Returns:
             PushoverSoilPressureResults with extracted data
-
-        Raises:
-            ValueError: If invalid direction specified
         """
-        if direction.upper() not in ['X', 'Y']:
-            raise ValueError(f"Invalid direction '{direction}'. Must be 'X' or 'Y'.")
-
-        direction = direction.upper()
-
-        cached = self._results_cache.get(direction)
-        if cached is not None:
-            return cached
-
         results = PushoverSoilPressureResults(direction=direction)
 
         # Extract soil pressures with error handling
@@ -86,7 +56,6 @@ def parse(self, direction: str) -> PushoverSoilPressureResults:
             logger.warning(f"Failed to extract soil pressures for {direction}: {e}")
             results.soil_pressures = None
 
-        self._results_cache[direction] = results
         return results
 
     def _extract_soil_pressures(self, direction: str) -> pd.DataFrame:
@@ -100,8 +69,8 @@ def _extract_soil_pressures(self, direction: str) -> pd.DataFrame:
         Returns:
             DataFrame with columns: Shell Object, Unique Name, [Output Cases...]
         """
-        # Read Soil Pressures sheet
-        df = self._read_sheet('Soil Pressures')
+        # Read Soil Pressures rows for this pushover direction (X+, X-, Y+, Y-, X, Y)
+        df = self._read_direction_sheet('Soil Pressures', direction)
 
         # Ensure expected columns
         expected_cols = ['Story', 'Shell Object', 'Unique Name', 'Shell Element', 'Joint',
@@ -114,11 +83,6 @@ def _extract_soil_pressures(self, direction: str) -> pd.DataFrame:
         # Filter to relevant columns
         df = df[expected_cols]
 
-        # Filter by pushover direction (pattern: _X+ or _Y+ in the Output Case name)
-        import re
-        pattern = f'{direction}[+-]?'  # Matches X+, X-, Y+, Y-, X, Y (no underscore for pushover)
-        df = df[df['Output Case'].str.contains(pattern, na=False, regex=True, case=False)]
-
         # Numeric safety
         df['Soil Pressure'] = pd.to_numeric(df['Soil Pressure'], errors='coerce')
 
@@ -153,49 +117,6 @@ def _extract_soil_pressures(self, direction: str) -> pd.DataFrame:
 
         return min_pressures
 
-    def get_available_directions(self) -> List[str]:
-        """Detect available pushover directions from output cases.
-
-        Returns:
-            List of detected directions (e.g., ['X', 'Y'])
-        """
-        # Read Soil Pressures sheet to detect directions
-        df = self._read_sheet('Soil Pressures')
-
-        if 'Output Case' not in df.columns:
-            return []
-
-        output_cases = df['Output Case'].dropna().unique()
-
-        directions = []
-        if any('X' in str(case).upper() for case in output_cases):
-            directions.append('X')
-        if any('Y' in str(case).upper() for case in output_cases):
-            directions.append('Y')
-
-        return directions
-
-    def get_output_cases(self, direction: str) -> List[str]:
-        """Get list of output cases for a direction.
-
-        Args:
-            direction: 'X' or 'Y'
-
-        Returns:
-            List of output case names
-        """
-        df = self._read_sheet('Soil Pressures')
-
-        if 'Output Case' not in df.columns:
-            return []
-
-        # Filter by pushover direction in Output Case name
-        direction = direction.upper()
-        pattern = f'{direction}[+-]?'  # Matches X+, X-, Y+, Y-, X, Y
-        cases = df[df['Output Case'].str.contains(pattern, na=False, regex=True, case=False)]['Output Case'].unique()
-
-        return sorted(cases.tolist())
-
     def get_foundation_elements(self) -> List[str]:
         """Get list of all foundation elements in the file.
 
@@ -211,14 +132,3 @@ def get_foundation_elements(self) -> List[str]:
         elements = df['Unique Name'].dropna().astype(str).unique().tolist()
 
         return sorted(elements)
-
-    def validate_sheet_exists(self, sheet_name: str) -> bool:
-        """Check if a sheet exists in the Excel file.
-
-        Args:
-            sheet_name: Name of sheet to check
-
-        Returns:
-            True if sheet exists, False otherwise
-        """
-        return sheet_name in self.excel_data.sheet_names
@@ -11,6 +11,7 @@
 import pandas as pd
 
 from .pushover_joint_base import BasePushoverJointImporter
+from .pushover_bulk import normalize_unique_names
 from .pushover_vert_displacement_parser import PushoverVertDisplacementParser
 from ..import_utils import require_sheets
 
@@ -73,54 +74,43 @@ def _import_direction(self, parser: PushoverVertDisplacementParser, direction: s
 
     def _import_vert_displacements(self, df: pd.DataFrame, selected_load_cases: Set[str]) -> int:
         """Import vertical displacements from DataFrame."""
-        count = 0
-
         story_col = df.columns[0]  # 'Story'
         label_col = df.columns[1]  # 'Label'
         unique_name_col = df.columns[2]  # 'Unique Name'
 
-        for _, row in df.iterrows():
-            story_name = str(row[story_col])
-            label = str(int(float(row[label_col])))
-            unique_name = str(int(float(row[unique_name_col])))
-
-            joint_key = (story_name, label, unique_name)
-
-            if joint_key not in self.vert_displacement_data:
-                self.vert_displacement_data[joint_key] = {}
+        keys = pd.DataFrame({
+            'story': df[story_col].astype(str),
+            'label': normalize_unique_names(df[label_col]),
+            'unique_name': normalize_unique_names(df[unique_name_col]),
+        })
 
-            for load_case_name in df.columns[3:]:
-                if load_case_name not in selected_load_cases:
-                    continue
+        # Every joint gets an entry, even when none of its values are selected
+        for joint_key in zip(keys['story'], keys['label'], keys['unique_name']):
+            self.vert_displacement_data.setdefault(joint_key, {})
 
-                value = row[load_case_name]
-                if pd.isna(value):
-                    continue
+        records = self._melt_selected_values(keys, df.iloc[:, 3:], selected_load_cases)
+        for story_name, label, unique_name, load_case_name, value in records.itertuples(
+            index=False, name=None
+        ):
+            self.vert_displacement_data[(story_name, label, unique_name)][load_case_name] = value
 
-                self._get_or_create_load_case(load_case_name)
-                self.vert_displacement_data[joint_key][load_case_name] = float(value)
-                count += 1
-
-        return count
+        return len(records)
 
     def _build_cache(self) -> None:
         """Build joint results cache for vertical displacements."""
         self._delete_existing_cache(self._get_result_types())
 
         result_type = "VerticalDisplacements_Min"
-        count = 0
-
-        for (story, label, unique_name), displacement_data in self.vert_displacement_data.items():
-            # Create joint identifier (Story-Label format for shell_object)
-            shell_object = f"{story}-{label}"
-
-            cache_entry = self._create_cache_entry(
-                shell_object=shell_object,
+        entries = [
+            # Joint identifier uses Story-Label format for shell_object
+            self._create_cache_row(
+                shell_object=f"{story}-{label}",
                 unique_name=unique_name,
                 result_type=result_type,
                 results_matrix=displacement_data
             )
-            self.session.add(cache_entry)
-            count += 1
+            for (story, label, unique_name), displacement_data in self.vert_displacement_data.items()
+        ]
+        count = self._insert_cache_entries(entries)
 
         logger.info(f"Created {count} cache entries for {result_type}")
@@ -7,10 +7,12 @@
 
 import pandas as pd
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import List, Optional
 from pathlib import Path
 import logging
 
+from processing.pushover.pushover_base_parser import BasePushoverParser
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +23,7 @@ class PushoverVertDisplacementResults:
     direction: str = ""  # 'X' or 'Y'
 
 
-class PushoverVertDisplacementParser:
+class PushoverVertDisplacementParser(BasePushoverParser):
     """Parser for pushover vertical displacement Excel files.
 
     Extracts vertical displacement (Uz) values for foundation joints at pushover steps.
@@ -35,32 +37,21 @@ class PushoverVertDisplacementParser:
     - Takes minimum Uz per joint/case (from Min step type)
     """
 
+    VALID_DIRECTIONS = ('X', 'Y')
+
     def __init__(self, file_path: Path):
         """Initialize parser with Excel file path.
 
         Args:
             file_path: Path to Excel file with pushover joint displacement results
         """
-        self.file_path = file_path
-        self.excel_data = pd.ExcelFile(file_path)
-        self._sheet_cache = {}
-        self._results_cache = {}
+        super().__init__(file_path)
         self._foundation_joints = None
 
-    def _read_sheet(self, sheet_name: str, header: int = 1, drop_units: bool = True) -> pd.DataFrame:
-        """Read and cache a sheet from the Excel file."""
-        cache_key = (sheet_name, header, drop_units)
-        if cache_key in self._sheet_cache:
-            return self._sheet_cache[cache_key].copy()
-
-        df = pd.read_excel(self.excel_data, sheet_name=sheet_name, header=header)
-        if drop_units and len(df) > 0:
-            df = df.drop(0)
+    def _get_primary_sheet(self) -> str:
+        return 'Joint Displacements'
 
-        self._sheet_cache[cache_key] = df
-        return df.copy()
-
-    def parse(self, direction: str) -> PushoverVertDisplacementResults:
+    def _parse_direction(self, direction: str) -> PushoverVertDisplacementResults:
         """Parse vertical displacement results for specified direction.
 
         Args:
@@ -68,19 +59,7 @@ def parse(self, direction: str) -> PushoverVertDisplacementResults:
 
         Returns:
             PushoverVertDisplacementResults with extracted data
-
-        Raises:
-            ValueError: If invalid direction specified
         """
-        if direction.upper() not in ['X', 'Y']:
-            raise ValueError(f"Invalid direction '{direction}'. Must be 'X' or 'Y'.")
-
-        direction = direction.upper()
-
-        cached = self._results_cache.get(direction)
-        if cached is not None:
-            return cached
-
         results = PushoverVertDisplacementResults(direction=direction)
 
         # Extract vertical displacements with error handling
@@ -90,7 +69,6 @@ def parse(self, direction: str) -> PushoverVertDisplacementResults:
             logger.warning(f"Failed to extract vertical displacements for {direction}: {e}")
             results.vert_displacements = None
 
-        self._results_cache[direction] = results
         return results
 
     def _extract_vert_displacements(self, direction: str) -> pd.DataFrame:
@@ -112,8 +90,8 @@ def _extract_vert_displacements(self, direction: str) -> pd.DataFrame:
             logger.warning("No foundation joints found in Fou sheet")
             return pd.DataFrame()
 
-        # Read Joint Displacements sheet
-        df = self._read_sheet('Joint Displacements')
+        # Read Joint Displacements rows for this pushover direction (X+, X-, Y+, Y-, X, Y)
+        df = self._read_direction_sheet('Joint Displacements', direction)
 
         # Filter to required columns
         required_cols = ['Story', 'Label', 'Unique Name', 'Output Case', 'Step Type', 'Uz']
@@ -129,11 +107,6 @@ def _extract_vert_displacements(self, direction: str) -> pd.DataFrame:
             logger.warning(f"No foundation joint data found for direction {direction}")
             return pd.DataFrame()
 
-        # Filter by pushover direction (pattern: X or Y in the Output Case name)
-        import re
-        pattern = f'{direction}[+-]?'  # Matches X+, X-, Y+, Y-, X, Y
-        df = df[df['Output Case'].str.contains(pattern, na=False, regex=True, case=False)]
-
         # Numeric safety
         df['Uz'] = pd.to_numeric(df['Uz'], errors='coerce')
 
@@ -205,49 +178,6 @@ def get_foundation_joints(self) -> List[str]:
             logger.error(f"Failed to read Fou sheet: {e}")
             return []
 
-    def get_available_directions(self) -> List[str]:
-        """Detect available pushover directions from output cases.
-
-        Returns:
-            List of detected directions (e.g., ['X', 'Y'])
-        """
-        # Read Joint Displacements sheet to detect directions
-        df = self._read_sheet('Joint Displacements')
-
-        if 'Output Case' not in df.columns:
-            return []
-
-        output_cases = df['Output Case'].dropna().unique()
-
-        directions = []
-        if any('X' in str(case).upper() for case in output_cases):
-            directions.append('X')
-        if any('Y' in str(case).upper() for case in output_cases):
-            directions.append('Y')
-
-        return directions
-
-    def get_output_cases(self, direction: str) -> List[str]:
-        """Get list of output cases for a direction.
-
-        Args:
-            direction: 'X' or 'Y'
-
-        Returns:
-            List of output case names
-        """
-        df = self._read_sheet('Joint Displacements')
-
-        if 'Output Case' not in df.columns:
-            return []
-
-        # Filter by pushover direction in Output Case name
-        direction = direction.upper()
-        pattern = f'{direction}[+-]?'  # Matches X+, X-, Y+, Y-, X, Y
-        cases = df[df['Output Case'].str.contains(pattern, na=False, regex=True, case=False)]['Output Case'].unique()
-
-        return sorted(cases.tolist())
-
     def get_foundation_joints_with_data(self) -> List[str]:
         """Get list of foundation joints that have displacement data.
 
@@ -272,14 +202,3 @@ def get_foundation_joints_with_data(self) -> List[str]:
         joints_with_data = df[df['Unique Name'].isin(foundation_joints)]['Unique Name'].unique().tolist()
 
         return sorted(joints_with_data)
-
-    def validate_sheet_exists(self, sheet_name: str) -> bool:
-        """Check if a sheet exists in the Excel file.
-
-        Args:
-            sheet_name: Name of sheet to check
-
-        Returns:
-            True if sheet exists, False otherwise
-        """
-        return sheet_name in self.excel_data.sheet_names
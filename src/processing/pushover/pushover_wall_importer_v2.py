@@ -17,13 +17,18 @@
 from database.models import (
     Element,
     Story,
-    LoadCase,
     WallShear,
     QuadRotation,
     ElementResultsCache,
     ResultCategory,
 )
 from processing.pushover.pushover_base_importer import BasePushoverImporter
+from processing.pushover.pushover_bulk import VALUE_COLUMN, map_ids, melt_load_case_columns
+from processing.pushover.pushover_cache_writer import (
+    build_results_matrices,
+    fetch_cache_records,
+    replace_cache_rows,
+)
 from processing.pushover.pushover_wall_parser import PushoverWallParser
 
 logger = logging.getLogger(__name__)
@@ -71,15 +76,11 @@ def _ensure_entities(self):
 
         # Build entities from every selected direction. Quad rotations can have
         # story coverage that differs from pier shears or the opposite direction.
-        parsed_results = []
-        if self.selected_load_cases_x:
-            parsed_results.append(parser.parse("X"))
-        if self.selected_load_cases_y:
-            parsed_results.append(parser.parse("Y"))
+        parsed_results = parser.parse_all(self._selected_directions())
         if not parsed_results:
             return
 
-        for results in parsed_results:
+        for results in parsed_results.values():
             # Process pier elements and stories from shears
             if results.shears_v2 is not None:
                 self._ensure_piers_and_stories(results.shears_v2)
@@ -164,49 +165,36 @@ def _import_shears(
         Returns:
             Count of imported records
         """
-        count = 0
         pier_col = df.columns[0]
         story_col = df.columns[1]
         result_category_id = self._get_or_create_result_category_id()
 
-        for _, row in df.iterrows():
-            pier_name = str(row[pier_col])
-            story_name = str(row[story_col])
-
-            element = self.elements_cache.get(f"Wall:{pier_name}")
-            story = self.stories_cache.get(story_name)
-
-            if not element or not story:
-                continue
-
-            # Get per-pier story order
-            story_order_key = (pier_name, story_name)
-            story_sort_order = self.story_order.get(story_order_key, story.sort_order)
-
-            for load_case_name in df.columns[2:]:
-                if load_case_name not in selected_load_cases:
-                    continue
-
-                value = row[load_case_name]
-                if pd.isna(value):
-                    continue
-
-                load_case = self._get_or_create_load_case(load_case_name)
-
-                shear = WallShear(
-                    element_id=element.id,
-                    story_id=story.id,
-                    load_case_id=load_case.id,
-                    result_category_id=result_category_id,
-                    direction=direction,
-                    location="Bottom",  # Pushover uses bottom location
-                    force=float(value),
-                    story_sort_order=story_sort_order,
-                )
-                self.session.add(shear)
-                count += 1
+        pier_names = df[pier_col].astype(str)
+        story_names = df[story_col].astype(str)
+        keys = pd.DataFrame({
+            "element_id": map_ids(pier_names, self._element_ids("Wall")),
+            "story_id": map_ids(story_names, self._story_ids()),
+        })
+        # Per-pier story order, falling back to the global story order
+        global_order = {name: story.sort_order for name, story in self.stories_cache.items()}
+        keys["story_sort_order"] = pd.array(
+            [
+                self.story_order.get((pier_name, story_name), global_order.get(story_name))
+                for pier_name, story_name in zip(pier_names, story_names)
+            ],
+            dtype="Int64",
+        )
 
-        return count
+        records = melt_load_case_columns(
+            keys, df.iloc[:, 2:], selected_load_cases, required=["element_id", "story_id"]
+        )
+        return self._insert_results(
+            WallShear,
+            records.rename(columns={VALUE_COLUMN: "force"}),
+            result_category_id=result_category_id,
+            direction=direction,
+            location="Bottom",  # Pushover uses bottom location
+        )
 
     def _import_rotations(self, df: pd.DataFrame, selected_load_cases: Set[str]) -> int:
         """Import quad rotations from DataFrame.
@@ -218,56 +206,33 @@ def _import_rotations(self, df: pd.DataFrame, selected_load_cases: Set[str]) ->
         Returns:
             Count of imported records
         """
-        count = 0
         name_col = df.columns[0]
         story_col = df.columns[1]
         result_category_id = self._get_or_create_result_category_id()
 
-        for _, row in df.iterrows():
-            element_name = self._format_quad_name(row[name_col])
-            story_name = str(row[story_col])
-
-            element = self.quads_cache.get(element_name)
-            story = self.stories_cache.get(story_name)
-
-            if not element or not story:
-                continue
-
-            for load_case_name in df.columns[2:]:
-                if load_case_name not in selected_load_cases:
-                    continue
-
-                value = row[load_case_name]
-                if pd.isna(value):
-                    continue
-
-                load_case = self._get_or_create_load_case(load_case_name)
-
-                rotation = QuadRotation(
-                    element_id=element.id,
-                    story_id=story.id,
-                    load_case_id=load_case.id,
-                    result_category_id=result_category_id,
-                    quad_name=element_name,
-                    direction="Pier",
-                    rotation=float(value),
-                    story_sort_order=story.sort_order,  # Global order for quads
-                )
-                self.session.add(rotation)
-                count += 1
+        quad_names = df[name_col].map(self._format_quad_name)
+        keys = pd.DataFrame({
+            "element_id": map_ids(
+                quad_names, {name: element.id for name, element in self.quads_cache.items()}
+            ),
+            "story_id": map_ids(df[story_col].astype(str), self._story_ids()),
+            "quad_name": quad_names,
+        })
 
-        return count
+        records = melt_load_case_columns(
+            keys, df.iloc[:, 2:], selected_load_cases, required=["element_id", "story_id"]
+        )
+        # Global story order for quads
+        records["story_sort_order"] = map_ids(records["story_id"], self._story_sort_orders())
+        return self._insert_results(
+            QuadRotation,
+            records.rename(columns={VALUE_COLUMN: "rotation"}),
+            result_category_id=result_category_id,
+            direction="Pier",
+        )
 
     def _build_cache(self):
         """Build element results cache for wall shears and quad rotations."""
-        # Delete existing cache entries
-        self.session.query(ElementResultsCache).filter(
-            ElementResultsCache.result_set_id == self.result_set_id,
-            ElementResultsCache.result_type.in_(
-                ["WallShears_V2", "WallShears_V3", "QuadRotations"]
-            ),
-        ).delete(synchronize_session=False)
-
         # Build cache for wall shears
         self._cache_wall_shears("V2")
         self._cache_wall_shears("V3")
@@ -279,109 +244,45 @@ def _build_cache(self):
 
     def _cache_wall_shears(self, direction: str):
         """Build cache for one wall shear direction (V2 or V3)."""
-        load_case_ids = self._get_load_case_ids()
-        if not load_case_ids:
-            return
-
-        records = (
-            self.session.query(
-                WallShear,
-                LoadCase.name,
-                WallShear.element_id,
-                WallShear.story_id,
-                WallShear.story_sort_order,
-            )
-            .join(LoadCase, WallShear.load_case_id == LoadCase.id)
-            .filter(
-                WallShear.load_case_id.in_(load_case_ids),
-                WallShear.direction == direction,
-                WallShear.result_category_id == self._get_or_create_result_category_id(),
-            )
-            .all()
+        self._replace_cache(
+            WallShear,
+            "force",
+            f"WallShears_{direction}",
+            WallShear.direction == direction,
         )
 
-        logger.info(f"Query returned {len(records)} wall shear records for {direction}")
-
-        if not records:
-            return
-
-        element_story_data = {}
-        for shear, load_case_name, element_id, story_id, story_sort_order in records:
-            key = (element_id, story_id)
-            if key not in element_story_data:
-                element_story_data[key] = {
-                    "results_matrix": {},
-                    "story_sort_order": story_sort_order,
-                }
-            element_story_data[key]["results_matrix"][load_case_name] = shear.force
-
-        result_type = f"WallShears_{direction}"
-        for (element_id, story_id), data in element_story_data.items():
-            cache_entry = ElementResultsCache(
-                project_id=self.project_id,
-                result_set_id=self.result_set_id,
-                element_id=element_id,
-                story_id=story_id,
-                result_type=result_type,
-                story_sort_order=data["story_sort_order"],
-                results_matrix=data["results_matrix"],
-            )
-            self.session.add(cache_entry)
-
-        logger.info(f"Created {len(element_story_data)} cache entries for {result_type}")
-
     def _cache_quad_rotations(self):
         """Build cache for quad rotations."""
-        load_case_ids = self._get_load_case_ids()
-        if not load_case_ids:
-            return
+        self._replace_cache(QuadRotation, "rotation", "QuadRotations")
 
-        records = (
-            self.session.query(
-                QuadRotation,
-                LoadCase.name,
-                QuadRotation.element_id,
-                QuadRotation.story_id,
-                QuadRotation.story_sort_order,
-            )
-            .join(LoadCase, QuadRotation.load_case_id == LoadCase.id)
-            .filter(
-                QuadRotation.load_case_id.in_(load_case_ids),
-                QuadRotation.result_category_id == self._get_or_create_result_category_id(),
+    def _replace_cache(self, model_class, value_field: str, result_type: str, *filters):
+        """Replace the cache entries of one result type from this result set's rows."""
+        rows = []
+        load_case_ids = self._get_load_case_ids()
+        if load_case_ids:
+            records = fetch_cache_records(
+                self.session,
+                model_class,
+                value_field,
+                ["element_id", "story_id", "story_sort_order"],
+                load_case_ids,
+                filters=[
+                    *filters,
+                    model_class.result_category_id == self._get_or_create_result_category_id(),
+                ],
             )
-            .all()
+            logger.info(f"Query returned {len(records)} records for {result_type}")
+            rows = build_results_matrices(records, ["element_id", "story_id"])
+
+        replace_cache_rows(
+            self.session,
+            ElementResultsCache,
+            self.result_set_id,
+            result_type,
+            rows,
+            project_id=self.project_id,
         )
 
-        logger.info(f"Query returned {len(records)} quad rotation records")
-
-        if not records:
-            return
-
-        element_story_data = {}
-        for rotation, load_case_name, element_id, story_id, story_sort_order in records:
-            key = (element_id, story_id)
-            if key not in element_story_data:
-                element_story_data[key] = {
-                    "results_matrix": {},
-                    "story_sort_order": story_sort_order,
-                }
-            element_story_data[key]["results_matrix"][load_case_name] = rotation.rotation
-
-        result_type = "QuadRotations"
-        for (element_id, story_id), data in element_story_data.items():
-            cache_entry = ElementResultsCache(
-                project_id=self.project_id,
-                result_set_id=self.result_set_id,
-                element_id=element_id,
-                story_id=story_id,
-                result_type=result_type,
-                story_sort_order=data["story_sort_order"],
-                results_matrix=data["results_matrix"],
-            )
-            self.session.add(cache_entry)
-
-        logger.info(f"Created {len(element_story_data)} cache entries for {result_type}")
-
     @staticmethod
     def _format_quad_name(value) -> str:
         """Normalize numeric ETABS ids while preserving named quad labels."""
@@ -7,11 +7,10 @@
 
 import pandas as pd
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-from pathlib import Path
+from typing import List, Optional
 import logging
 
-from utils.pushover_utils import detect_direction
+from processing.pushover.pushover_base_parser import BasePushoverParser
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +25,7 @@ class PushoverWallResults:
     direction: str = ""  # 'X' or 'Y'
 
 
-class PushoverWallParser:
+class PushoverWallParser(BasePushoverParser):
     """Parser for pushover wall (pier) forces Excel files.
 
     Extracts maximum and minimum force values per pier, story, and output case for:
@@ -39,33 +38,10 @@ class PushoverWallParser:
     - Extracts Max/Min step type values
     """
 
-    def __init__(self, file_path: Path):
-        """Initialize parser with Excel file path.
+    def _get_primary_sheet(self) -> str:
+        return "Pier Forces"
 
-        Args:
-            file_path: Path to Excel file with pushover wall results
-        """
-        self.file_path = file_path
-        self.excel_data = pd.ExcelFile(file_path)
-        self._sheet_cache = {}
-        self._results_cache = {}
-
-    def _read_sheet(
-        self, sheet_name: str, header: int = 1, drop_units: bool = True
-    ) -> pd.DataFrame:
-        """Read and cache a sheet from the Excel file."""
-        cache_key = (sheet_name, header, drop_units)
-        if cache_key in self._sheet_cache:
-            return self._sheet_cache[cache_key].copy()
-
-        df = pd.read_excel(self.excel_data, sheet_name=sheet_name, header=header)
-        if drop_units and len(df) > 0:
-            df = df.drop(0)
-
-        self._sheet_cache[cache_key] = df
-        return df.copy()
-
-    def parse(self, direction: str) -> PushoverWallResults:
+    def _parse_direction(self, direction: str) -> PushoverWallResults:
         """Parse all wall results for specified direction.
 
         Args:
@@ -73,19 +49,7 @@ def parse(self, direction: str) -> PushoverWallResults:
 
         Returns:
             PushoverWallResults with extracted data
-
-        Raises:
-            ValueError: If invalid direction specified
         """
-        if direction.upper() not in ["X", "Y", "XY"]:
-            raise ValueError(f"Invalid direction '{direction}'. Must be 'X', 'Y', or 'XY'.")
-
-        direction = direction.upper()
-
-        cached = self._results_cache.get(direction)
-        if cached is not None:
-            return cached
-
         results = PushoverWallResults(direction=direction)
 
         # Extract each force type with error handling
@@ -108,7 +72,6 @@ def parse(self, direction: str) -> PushoverWallResults:
             logger.warning(f"Failed to extract rotations for {direction}: {e}")
             results.rotations = None
 
-        self._results_cache[direction] = results
         return results
 
     def _extract_pier_forces(self, direction: str, force_column: str) -> pd.DataFrame:
@@ -123,20 +86,12 @@ def _extract_pier_forces(self, direction: str, force_column: str) -> pd.DataFram
         Returns:
             DataFrame with columns: Pier, Story, [Output Cases...]
         """
-        # Read Pier Forces sheet
-        df = self._read_sheet("Pier Forces")
+        # Read Pier Forces rows for this pushover direction
+        df = self._read_direction_sheet("Pier Forces", direction)
 
         # Filter columns
         df = df[["Story", "Pier", "Output Case", "Step Type", "Location", force_column]]
 
-        # Filter by pushover direction
-        if direction == "XY":
-            df = df[
-                df["Output Case"].apply(lambda x: "X" in str(x).upper() and "Y" in str(x).upper())
-            ]
-        else:
-            df = df[df["Output Case"].apply(lambda x: direction in str(x).upper())]
-
         # Filter to Bottom location only (per ETPS pattern)
         df = df[df["Location"] == "Bottom"]
 
@@ -202,8 +157,8 @@ def _extract_quad_rotations(self, direction: str) -> pd.DataFrame:
         Returns:
             DataFrame with columns: Quad, Story, [Output Cases...]
         """
-        # Read Quad Strain Gauge - Rotation sheet
-        df = self._read_sheet("Quad Strain Gauge - Rotation")
+        # Read Quad Strain Gauge - Rotation rows for this pushover direction
+        df = self._read_direction_sheet("Quad Strain Gauge - Rotation", direction)
 
         # Filter columns
         required_cols = ["Story", "Name", "Output Case", "StepType", "Rotation"]
@@ -212,14 +167,6 @@ def _extract_quad_rotations(self, direction: str) -> pd.DataFrame:
         df = df[required_cols].copy()
         df["Quad"] = self._quad_label_series(df)
 
-        # Filter by pushover direction
-        if direction == "XY":
-            df = df[
-                df["Output Case"].apply(lambda x: "X" in str(x).upper() and "Y" in str(x).upper())
-            ]
-        else:
-            df = df[df["Output Case"].apply(lambda x: direction in str(x).upper())]
-
         # Preserve element and story order from Excel
         element_order = df["Quad"].unique().tolist()
         story_order = df["Story"].unique().tolist()
@@ -249,67 +196,13 @@ def _extract_quad_rotations(self, direction: str) -> pd.DataFrame:
 
         return max_rotations
 
-    def get_available_directions(self) -> List[str]:
-        """Detect available pushover directions from output cases.
-
-        Returns:
-            List of detected directions (e.g., ['X', 'Y', 'XY'])
-        """
-        # Read Pier Forces sheet to detect directions
-        df = self._read_sheet("Pier Forces")
-
-        output_cases = df["Output Case"].unique()
-
-        directions = []
-
-        # Check for bi-directional first (both X and Y in name)
-        if any("X" in str(case).upper() and "Y" in str(case).upper() for case in output_cases):
-            directions.append("XY")
-
-        # Check for uni-directional
-        if any("X" in str(case).upper() for case in output_cases):
-            directions.append("X")
-        if any("Y" in str(case).upper() for case in output_cases):
-            directions.append("Y")
-
-        return directions
-
-    def get_output_cases(self, direction: str) -> List[str]:
-        """Get list of output cases for a direction.
-
-        Args:
-            direction: 'X', 'Y', or 'XY'
-
-        Returns:
-            List of output case names
-        """
-        df = self._read_sheet("Pier Forces")
-
-        direction = direction.upper()
-
-        # Filter based on direction
-        if direction == "XY":
-            # Both X and Y in name
-            cases = df[
-                df["Output Case"].apply(lambda x: "X" in str(x).upper() and "Y" in str(x).upper())
-            ]["Output Case"].unique()
-        else:
-            # X or Y in name
-            cases = df[df["Output Case"].apply(lambda x: direction in str(x).upper())][
-                "Output Case"
-            ].unique()
-
-        return sorted(cases.tolist())
-
     def get_piers(self) -> List[str]:
         """Get list of all piers in the file.
 
         Returns:
             List of pier names
         """
-        df = self._read_sheet("Pier Forces")
-
-        return sorted(df["Pier"].unique().tolist())
+        return sorted(self._distinct_column("Pier Forces", "Pier"))
 
     def get_quads(self) -> List[str]:
         """Get list of all quad elements in the file.
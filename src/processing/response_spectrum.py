@@ -0,0 +1,440 @@
+"""Elastic response spectra of imported base accelerations.
+
+The spectrum of a record is the peak response of linear single-degree-of-freedom
+oscillators over a range of periods and damping ratios. Each oscillator is
+integrated with the piecewise-exact recurrence (Nigam & Jennings, as tabulated
+in Chopra, *Dynamics of Structures*, section 5.2), which is exact for an input
+that varies linearly within a time step and unconditionally stable, so short
+periods need no sub-stepping. The recurrence is sequential in time but
+independent per oscillator, so every (damping, period) pair advances together
+as one array per step.
+
+``ResponseSpectrumBatch`` computes the spectra of every record in a result set
+in a process pool and stores them in ``ResponseSpectrumCache``. Base
+accelerations are stored in mm/s²; spectra are stored and returned in g.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from database.models import ResponseSpectrumCache, TimeSeriesGlobalCache
+from database.time_series_store import TimeSeriesStore
+from utils.parallel import spawn_process_pool
+
+logger = logging.getLogger(__name__)
+
+# 1 g in the mm/s² used by imported accelerations
+G_MM_S2 = 9810.0
+
+DEFAULT_PERIODS = np.round(np.geomspace(0.02, 10.0, 200), 4)
+DEFAULT_DAMPING_RATIOS = (0.02, 0.05, 0.10)
+
+
+@dataclass
+class ResponseSpectrum:
+    """Peak oscillator response of one record."""
+
+    periods: np.ndarray  # (periods,)
+    damping_ratios: np.ndarray  # (dampings,)
+    sd: np.ndarray  # (dampings, periods) peak relative displacement
+    pga: float  # Peak absolute input acceleration
+
+    @property
+    def psa(self) -> np.ndarray:
+        """Pseudo-spectral acceleration ω²·Sd, in the input acceleration units."""
+        omega = 2.0 * np.pi / self.periods
+        return self.sd * omega**2
+
+
+@dataclass
+class ResponseSpectrumSet:
+    """Spectra of several records for one direction and damping ratio."""
+
+    direction: str
+    damping_ratio: float
+    periods: np.ndarray  # (periods,)
+    load_case_names: List[str]
+    psa: np.ndarray  # (records, periods), in g
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self.psa.mean(axis=0)
+
+    @property
+    def std(self) -> np.ndarray:
+        """Sample standard deviation across records (zero for a single record)."""
+        if len(self.psa) < 2:
+            return np.zeros_like(self.periods, dtype=float)
+        return self.psa.std(axis=0, ddof=1)
+
+
+def sdof_coefficients(periods: np.ndarray, damping_ratios: np.ndarray, dt: float) -> np.ndarray:
+    """Piecewise-exact recurrence coefficients for unit-mass oscillators.
+
+    Returns an array of shape (8, dampings, periods) holding A, B, C, D and
+    A', B', C', D' of
+
+        u[i+1] = A u[i] + B v[i] + C p[i] + D p[i+1]
+        v[i+1] = A' u[i] + B' v[i] + C' p[i] + D' p[i+1]
+    """
+    zeta = np.asarray(damping_ratios, dtype=np.float64)[:, None]
+    omega = 2.0 * np.pi / np.asarray(periods, dtype=np.float64)[None, :]
+    root = np.sqrt(1.0 - zeta**2)
+    omega_d = omega * root
+    decay = np.exp(-zeta * omega * dt)
+    sin = np.sin(omega_d * dt)
+    cos = np.cos(omega_d * dt)
+    stiffness = omega**2
+
+    a = decay * (zeta / root * sin + cos)
+    b = decay * sin / omega_d
+    c = (
+        2 * zeta / (omega * dt)
+        + decay
+        * (
+            ((1 - 2 * zeta**2) / (omega_d * dt) - zeta / root) * sin
+            - (1 + 2 * zeta / (omega * dt)) * cos
+        )
+    ) / stiffness
+    d = (
+        1
+        - 2 * zeta / (omega * dt)
+        + decay * ((2 * zeta**2 - 1) / (omega_d * dt) * sin + 2 * zeta / (omega * dt) * cos)
+    ) / stiffness
+    a_v = -decay * omega / root * sin
+    b_v = decay * (cos - zeta / root * sin)
+    c_v = (-1 / dt + decay * ((omega / root + zeta / (dt * root)) * sin + cos / dt)) / stiffness
+    d_v = (1 - decay * (zeta / root * sin + cos)) / (stiffness * dt)
+    return np.stack(np.broadcast_arrays(a, b, c, d, a_v, b_v, c_v, d_v))
+
+
+def compute_spectrum(
+    accelerations: Sequence[float],
+    dt: float,
+    periods: Sequence[float] = DEFAULT_PERIODS,
+    damping_ratios: Sequence[float] = DEFAULT_DAMPING_RATIOS,
+) -> ResponseSpectrum:
+    """Response spectrum of a uniformly sampled ground acceleration.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        accelerations: Ground acceleration samples
+        dt: Sample spacing in seconds
+        periods: Oscillator periods in seconds (all > 0)
+        damping_ratios: Critical damping ratios (each in [0, 1))
+    """
+    periods = np.asarray(periods, dtype=np.float64)
+    damping_ratios = np.asarray(damping_ratios, dtype=np.float64)
+    if dt <= 0:
+        raise ValueError(f"Time step must be positive, got {dt}")
+    if periods.size == 0 or np.any(periods <= 0):
+        raise ValueError("Periods must be positive")
+    if np.any(damping_ratios < 0) or np.any(damping_ratios >= 1):
+        raise ValueError("Damping ratios must be in [0, 1)")
+
+    # Unit mass: the effective load is -ag
+    load = -np.asarray(accelerations, dtype=np.float64)
+    a, b, c, d, a_v, b_v, c_v, d_v = sdof_coefficients(periods, damping_ratios, dt)
+
+    shape = a.shape
+    u = np.zeros(shape)
+    v = np.zeros(shape)
+    peak = np.zeros(shape)
+    u_next = np.empty(shape)
+    scratch = np.empty(shape)
+    for p_i, p_next in zip(load[:-1], load[1:]):
+        np.multiply(a, u, out=u_next)
+        u_next += np.multiply(b, v, out=scratch)
+        u_next += np.multiply(c, p_i, out=scratch)
+        u_next += np.multiply(d, p_next, out=scratch)
+        # v uses the previous u, so update it before swapping u
+        np.multiply(b_v, v, out=v)
+        v += np.multiply(a_v, u, out=scratch)
+        v += np.multiply(c_v, p_i, out=scratch)
+        v += np.multiply(d_v, p_next, out=scratch)
+        u, u_next = u_next, u
+        np.maximum(peak, np.abs(u, out=scratch), out=peak)
+
+    pga = float(np.max(np.abs(load))) if load.size else 0.0
+    return ResponseSpectrum(periods=periods, damping_ratios=damping_ratios, sd=peak, pga=pga)
+
+
+def sample_spacing(time_steps: Sequence[float]) -> float:
+    """Median step of a time axis (records are sampled uniformly)."""
+    steps = np.diff(np.asarray(time_steps, dtype=np.float64))
+    return float(np.median(steps)) if steps.size else 0.0
+
+
+class ResponseSpectrumRepository:
+    """Repository for cached response spectra."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def replace(
+        self,
+        project_id: int,
+        result_set_id: int,
+        load_case_name: str,
+        direction: str,
+        spectrum: ResponseSpectrum,
+    ) -> None:
+        """Store one record's spectra (in g), replacing any cached ones."""
+        self.delete(result_set_id, load_case_name, direction)
+        psa = spectrum.psa / G_MM_S2
+        periods = spectrum.periods.tolist()
+        rows = [
+            {
+                "project_id": project_id,
+                "result_set_id": result_set_id,
+                "load_case_name": load_case_name,
+                "direction": direction,
+                "damping_ratio": float(zeta),
+                "periods": periods,
+                "values": psa[index].tolist(),
+                "pga": spectrum.pga / G_MM_S2,
+            }
+            for index, zeta in enumerate(spectrum.damping_ratios)
+        ]
+        self.session.execute(insert(ResponseSpectrumCache.__table__), rows)
+
+    def delete(
+        self,
+        result_set_id: int,
+        load_case_name: Optional[str] = None,
+        direction: Optional[str] = None,
+    ) -> int:
+        """Drop cached spectra of a result set, optionally one load case / direction."""
+        query = self.session.query(ResponseSpectrumCache).filter(
+            ResponseSpectrumCache.result_set_id == result_set_id
+        )
+        if load_case_name is not None:
+            query = query.filter(ResponseSpectrumCache.load_case_name == load_case_name)
+        if direction is not None:
+            query = query.filter(ResponseSpectrumCache.direction == direction)
+        return query.delete(synchronize_session=False)
+
+    def get_cached_load_cases(self, result_set_id: int, direction: str) -> List[str]:
+        rows = (
+            self.session.query(ResponseSpectrumCache.load_case_name)
+            .filter(
+                ResponseSpectrumCache.result_set_id == result_set_id,
+                ResponseSpectrumCache.direction == direction,
+            )
+            .distinct()
+            .all()
+        )
+        return [name for (name,) in rows]
+
+    def get_spectra(self, result_set_id: int, direction: str) -> List[ResponseSpectrumSet]:
+        """Cached spectra of a result set, one set per damping ratio (ascending)."""
+        rows = (
+            self.session.query(ResponseSpectrumCache)
+            .filter(
+                ResponseSpectrumCache.result_set_id == result_set_id,
+                ResponseSpectrumCache.direction == direction,
+            )
+            .order_by(ResponseSpectrumCache.damping_ratio, ResponseSpectrumCache.load_case_name)
+            .all()
+        )
+        grouped: Dict[float, List[ResponseSpectrumCache]] = {}
+        for row in rows:
+            grouped.setdefault(row.damping_ratio, []).append(row)
+
+        spectra = []
+        for damping_ratio, group in grouped.items():
+            periods = np.asarray(group[0].periods, dtype=np.float64)
+            # Rows computed with another period grid are skipped, not mixed in
+            group = [row for row in group if len(row.periods) == len(periods)]
+            spectra.append(
+                ResponseSpectrumSet(
+                    direction=direction,
+                    damping_ratio=damping_ratio,
+                    periods=periods,
+                    load_case_names=[row.load_case_name for row in group],
+                    psa=np.asarray([row.values for row in group], dtype=np.float64),
+                )
+            )
+        return spectra
+
+
+class ResponseSpectrumBatch:
+    """Computes and caches the base acceleration spectra of a result set.
+
+    Usage:
+        batch = ResponseSpectrumBatch(session, project_id, result_set_id)
+        batch.compute(directions=("X",))
+        spectra = ResponseSpectrumRepository(session).get_spectra(result_set_id, "X")
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        project_id: int,
+        result_set_id: int,
+        periods: Sequence[float] = DEFAULT_PERIODS,
+        damping_ratios: Sequence[float] = DEFAULT_DAMPING_RATIOS,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    ):
+        """Initialize the batch.
+
+        Args:
+            session: Database session used to read records and write the cache
+            project_id: Project ID
+            result_set_id: Result set holding the time-history records
+            periods: Oscillator periods in seconds
+            damping_ratios: Critical damping ratios
+            max_workers: Worker processes (default: CPU count); 1 computes inline
+            progress_callback: Optional callback(message, current, total)
+        """
+        self.session = session
+        self.project_id = project_id
+        self.result_set_id = result_set_id
+        self.periods = np.asarray(periods, dtype=np.float64)
+        self.damping_ratios = np.asarray(damping_ratios, dtype=np.float64)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.progress_callback = progress_callback
+
+    def compute(
+        self,
+        load_case_names: Optional[Iterable[str]] = None,
+        directions: Sequence[str] = ("X", "Y"),
+        only_missing: bool = False,
+    ) -> int:
+        """Compute spectra of the base story accelerations and commit them.
+
+        Args:
+            load_case_names: Records to compute; None computes every record
+            directions: Acceleration directions
+            only_missing: Skip records that already have cached spectra
+
+        Returns:
+            Number of (record, direction) spectra written
+        """
+        from .time_history_importer import TimeSeriesRepository
+
+        if load_case_names is None:
+            load_case_names = TimeSeriesRepository(self.session).get_available_load_cases(
+                self.project_id, self.result_set_id
+            )
+        repository = ResponseSpectrumRepository(self.session)
+        tasks: List[Tuple[str, str, np.ndarray, float]] = []
+        for direction in directions:
+            cached = set(repository.get_cached_load_cases(self.result_set_id, direction))
+            for load_case_name in load_case_names:
+                if only_missing and load_case_name in cached:
+                    continue
+                base = self._base_acceleration(load_case_name, direction)
+                if base is not None:
+                    tasks.append((load_case_name, direction, *base))
+
+        total = len(tasks)
+        written = 0
+        for done, ((load_case_name, direction), spectrum, error) in enumerate(
+            self._run(tasks), start=1
+        ):
+            if error is not None:
+                logger.warning(
+                    "Response spectrum of %s (%s) failed: %s", load_case_name, direction, error
+                )
+                self._report_progress(f"Failed {load_case_name} {direction}: {error}", done, total)
+                continue
+            repository.replace(
+                self.project_id, self.result_set_id, load_case_name, direction, spectrum
+            )
+            written += 1
+            self._report_progress(f"Computed {load_case_name} {direction}", done, total)
+        self.session.commit()
+        return written
+
+    def missing_load_cases(self, direction: str) -> List[str]:
+        """Records with base accelerations in ``direction`` but no cached spectra."""
+        rows = (
+            self.session.query(TimeSeriesGlobalCache.load_case_name)
+            .filter(
+                TimeSeriesGlobalCache.project_id == self.project_id,
+                TimeSeriesGlobalCache.result_set_id == self.result_set_id,
+                TimeSeriesGlobalCache.result_type == "Accelerations",
+                TimeSeriesGlobalCache.direction == direction,
+            )
+            .distinct()
+            .all()
+        )
+        cached = set(
+            ResponseSpectrumRepository(self.session).get_cached_load_cases(
+                self.result_set_id, direction
+            )
+        )
+        return sorted(name for (name,) in rows if name not in cached)
+
+    # ===== Internals =====
+
+    def _base_acceleration(
+        self, load_case_name: str, direction: str
+    ) -> Optional[Tuple[np.ndarray, float]]:
+        """(samples in mm/s², dt) of the base story, read like the animated view does."""
+        from .time_history_importer import TimeSeriesRepository
+
+        store = TimeSeriesStore.for_session(self.session)
+        record = None
+        if store is not None:
+            record = store.read(self.result_set_id, load_case_name, "Accelerations", direction)
+        if record is not None and record.values.shape[1] > 1:
+            return np.array(record.values[0], dtype=np.float64), sample_spacing(record.time_steps)
+
+        entries = TimeSeriesRepository(self.session).get_time_series(
+            self.project_id, self.result_set_id, load_case_name, "Accelerations", direction
+        )
+        if not entries or len(entries[0].values) < 2:
+            return None
+        base = entries[0]
+        return np.asarray(base.values, dtype=np.float64), sample_spacing(base.time_steps)
+
+    def _run(self, tasks: List[Tuple[str, str, np.ndarray, float]]):
+        """Yield ((load case, direction), spectrum, error) as computations finish."""
+        args = (self.periods, self.damping_ratios)
+        if self.max_workers <= 1 or len(tasks) <= 1:
+            for load_case_name, direction, values, dt in tasks:
+                try:
+                    yield (load_case_name, direction), compute_spectrum(values, dt, *args), None
+                except Exception as exc:
+                    yield (load_case_name, direction), None, str(exc) or type(exc).__name__
+            return
+
+        with spawn_process_pool(min(self.max_workers, len(tasks))) as executor:
+            futures = {
+                executor.submit(compute_spectrum, values, dt, *args): (load_case_name, direction)
+                for load_case_name, direction, values, dt in tasks
+            }
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as exc:
+                    yield futures[future], None, str(exc) or type(exc).__name__
+
+    def _report_progress(self, message: str, current: int, total: int) -> None:
+        if self.progress_callback:
+            self.progress_callback(message, current, total)
+
+
+__all__ = [
+    "DEFAULT_DAMPING_RATIOS",
+    "DEFAULT_PERIODS",
+    "ResponseSpectrum",
+    "ResponseSpectrumBatch",
+    "ResponseSpectrumRepository",
+    "ResponseSpectrumSet",
+    "compute_spectrum",
+    "sdof_coefficients",
+]
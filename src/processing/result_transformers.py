@@ -2,9 +2,24 @@
 
 import pandas as pd
 from abc import ABC, abstractmethod
+from typing import Optional
+
 from config.result_config import RESULT_CONFIGS, get_config
 
 
+def row_statistics(df: pd.DataFrame) -> pd.DataFrame:
+    """Avg, Max and Min of each row across all numeric columns."""
+    numeric_data = df.apply(pd.to_numeric, errors='coerce')
+    return pd.DataFrame(
+        {
+            'Avg': numeric_data.mean(axis=1),
+            'Max': numeric_data.max(axis=1),
+            'Min': numeric_data.min(axis=1),
+        },
+        index=df.index,
+    )
+
+
 class ResultTransformer(ABC):
     """Base class for result-specific data transformations."""
 
@@ -46,19 +61,28 @@ def clean_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         df.columns = cleaned_columns
         return df
 
-    def add_statistics(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_statistics(
+        self, df: pd.DataFrame, statistics: Optional[pd.DataFrame] = None
+    ) -> pd.DataFrame:
         """
-        Add computed statistics columns (Avg, Max, Min).
+        Add statistics columns (Avg, Max, Min).
 
-        Default implementation calculates across all numeric columns.
+        Uses ``statistics`` (row-aligned Avg/Max/Min, e.g. stored by the cache
+        builder) when given; otherwise calculates across all numeric columns.
         """
-        numeric_data = df.apply(pd.to_numeric, errors='coerce')
-        df['Avg'] = numeric_data.mean(axis=1)
-        df['Max'] = numeric_data.max(axis=1)
-        df['Min'] = numeric_data.min(axis=1)
+        if statistics is None:
+            statistics = row_statistics(df)
+        df['Avg'] = statistics['Avg'].to_numpy()
+        df['Max'] = statistics['Max'].to_numpy()
+        df['Min'] = statistics['Min'].to_numpy()
         return df
 
-    def transform(self, df: pd.DataFrame, skip_summary: bool = False) -> pd.DataFrame:
+    def transform(
+        self,
+        df: pd.DataFrame,
+        skip_summary: bool = False,
+        statistics: Optional[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
         """
         Full transformation pipeline.
 
@@ -69,11 +93,12 @@ def transform(self, df: pd.DataFrame, skip_summary: bool = False) -> pd.DataFram
         Args:
             df: Input DataFrame
             skip_summary: If True, skip adding Avg/Max/Min columns (for Pushover results)
+            statistics: Precomputed Avg/Max/Min rows to use instead of recomputing
         """
         df = self.filter_columns(df)
         df = self.clean_column_names(df)
         if not skip_summary:
-            df = self.add_statistics(df)
+            df = self.add_statistics(df, statistics)
         return df
 
 
@@ -0,0 +1,274 @@
+"""Batch time-history import with parallel parsing and a single DB writer.
+
+Parsing a time-history workbook is CPU-bound and independent per file and per
+result sheet, while writing to SQLite must stay on one connection. The batch
+importer therefore:
+
+1. inspects every file in a process pool (load case name + result sheets),
+2. applies the load case selection and conflict resolution,
+3. parses every (file, sheet) pair in the same pool, so files and the sheets
+   inside a file are parsed concurrently without nested pools,
+4. merges the sheets of each record and hands it to one
+   :class:`TimeHistoryImporter` in the calling thread as soon as the record
+   is complete.
+
+A record that fails to parse or write is rolled back and reported; the
+remaining records are still imported.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import Future, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from utils.parallel import InlineExecutor, spawn_process_pool
+from .time_history_importer import TimeHistoryImporter
+from .time_history_parser import TimeHistoryParseResult, TimeHistoryParser
+
+logger = logging.getLogger(__name__)
+
+# Parse result fields filled by each sheet
+_SERIES_FIELDS = (
+    "drifts_x",
+    "drifts_y",
+    "forces_x",
+    "forces_y",
+    "displacements_x",
+    "displacements_y",
+    "accelerations_x",
+    "accelerations_y",
+    "stories",
+)
+
+
+def inspect_record(file_path: str) -> Tuple[str, List[str]]:
+    """Return (load case name, result sheets present) for one workbook.
+
+    Module-level so it can run in a worker process.
+    """
+    parser = TimeHistoryParser(file_path)
+    load_case_name = parser.parse(sheets=()).load_case_name
+    return load_case_name, parser.available_sheets()
+
+
+def parse_record_sheet(file_path: str, sheet: str) -> TimeHistoryParseResult:
+    """Parse a single result sheet of one workbook (worker process entry point)."""
+    return TimeHistoryParser(file_path).parse(sheets=[sheet])
+
+
+def merge_parse_results(load_case_name: str, parts: Iterable[TimeHistoryParseResult]) -> TimeHistoryParseResult:
+    """Combine per-sheet parse results of one record into a single result."""
+    merged = TimeHistoryParseResult(load_case_name=load_case_name)
+    for part in parts:
+        for name in _SERIES_FIELDS:
+            values = getattr(part, name)
+            if values:
+                setattr(merged, name, values)
+    return merged
+
+
+@dataclass
+class TimeHistoryRecordResult:
+    """Outcome of importing one time-history file."""
+
+    file_path: str
+    load_case_name: str = "Unknown"
+    count: int = 0
+    skipped: Optional[str] = None  # Reason the record was not imported
+    error: Optional[str] = None
+
+
+@dataclass
+class TimeHistoryBatchResult:
+    """Outcome of a batch import."""
+
+    records: List[TimeHistoryRecordResult] = field(default_factory=list)
+
+    @property
+    def total_count(self) -> int:
+        return sum(record.count for record in self.records)
+
+    @property
+    def imported(self) -> List[TimeHistoryRecordResult]:
+        return [r for r in self.records if r.error is None and r.skipped is None]
+
+    @property
+    def errors(self) -> List[str]:
+        return [f"{Path(r.file_path).name}: {r.error}" for r in self.records if r.error]
+
+
+class TimeHistoryBatchImporter:
+    """Imports many time-history files into one result set.
+
+    Usage:
+        batch = TimeHistoryBatchImporter(session, project_id, result_set_id)
+        outcome = batch.import_files(paths, selected_load_cases={"TH01", "TH02"})
+        if outcome.errors:
+            ...
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        project_id: int,
+        result_set_id: int,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    ):
+        """Initialize the batch importer.
+
+        Args:
+            session: Database session used by the single writer
+            project_id: Project ID
+            result_set_id: Result set ID for the time history data
+            max_workers: Parser processes (default: CPU count); 1 parses inline
+            progress_callback: Optional callback(message, current, total)
+        """
+        self.session = session
+        self.project_id = project_id
+        self.result_set_id = result_set_id
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.progress_callback = progress_callback
+
+    def import_files(
+        self,
+        file_paths: Sequence[str | Path],
+        selected_load_cases: Optional[Set[str]] = None,
+        conflict_resolution: Optional[Dict[str, str]] = None,
+    ) -> TimeHistoryBatchResult:
+        """Parse files in parallel and import them one record at a time.
+
+        Args:
+            file_paths: Workbooks to import (one load case each)
+            selected_load_cases: Load cases to import; None imports all
+            conflict_resolution: load case → preferred file path when several
+                files hold the same load case
+
+        Returns:
+            TimeHistoryBatchResult with one entry per file
+        """
+        conflict_resolution = conflict_resolution or {}
+        records = {str(path): TimeHistoryRecordResult(file_path=str(path)) for path in file_paths}
+        outcome = TimeHistoryBatchResult(records=list(records.values()))
+        total = len(records)
+        if not total:
+            return outcome
+
+        importer = TimeHistoryImporter(self.session, self.project_id, self.result_set_id)
+
+        with self._executor() as executor:
+            # Inspect every file first so selection and conflicts are known up front
+            pending: Dict[str, List[str]] = {}
+            for path, value, error in self._run(executor, inspect_record, [(path,) for path in records]):
+                record = records[path]
+                if error is not None:
+                    record.error = error
+                    continue
+                record.load_case_name, sheets = value
+                record.skipped = self._skip_reason(path, record.load_case_name, selected_load_cases, conflict_resolution)
+                if record.skipped is None:
+                    pending[path] = sheets
+
+            done = total - len(pending)
+            self._report_progress("Parsing time history records...", done, total)
+
+            tasks = [(path, sheet) for path, sheets in pending.items() for sheet in sheets]
+            parts: Dict[str, List[TimeHistoryParseResult]] = {path: [] for path in pending}
+            remaining = {path: len(sheets) for path, sheets in pending.items()}
+
+            # Records without result sheets still create their stories (none) and commit
+            for path in [p for p, n in remaining.items() if n == 0]:
+                done += 1
+                self._write_record(importer, records[path], parts[path], done, total)
+
+            for path, value, error in self._run(executor, parse_record_sheet, tasks):
+                record = records[path]
+                if error is not None and record.error is None:
+                    record.error = error
+                elif error is None:
+                    parts[path].append(value)
+
+                remaining[path] -= 1
+                if remaining[path]:
+                    continue
+                done += 1
+                if record.error is not None:
+                    self._report_progress(f"Failed {Path(path).name}: {record.error}", done, total)
+                    continue
+                self._write_record(importer, record, parts.pop(path), done, total)
+
+        logger.info(
+            "Time history batch import: %s records, %s series, %s errors",
+            len(outcome.imported),
+            outcome.total_count,
+            len(outcome.errors),
+        )
+        return outcome
+
+    # ===== Internals =====
+
+    def _executor(self):
+        """Process pool for parsing, or an inline runner when one worker is requested."""
+        if self.max_workers <= 1:
+            return InlineExecutor()
+        return spawn_process_pool(self.max_workers)
+
+    @staticmethod
+    def _run(
+        executor: Any,
+        fn: Callable[..., Any],
+        tasks: List[Tuple[str, ...]],
+    ) -> Iterator[Tuple[str, Any, Optional[str]]]:
+        """Yield (file_path, result, error) for each task as it completes."""
+        futures: Dict[Future, str] = {executor.submit(fn, *task): task[0] for task in tasks}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                yield path, future.result(), None
+            except Exception as exc:
+                logger.warning("Failed to parse %s: %s", Path(path).name, exc)
+                yield path, None, str(exc) or type(exc).__name__
+
+    @staticmethod
+    def _skip_reason(
+        path: str,
+        load_case_name: str,
+        selected_load_cases: Optional[Set[str]],
+        conflict_resolution: Dict[str, str],
+    ) -> Optional[str]:
+        if selected_load_cases is not None and load_case_name not in selected_load_cases:
+            return f"load case '{load_case_name}' not selected"
+        preferred_file = conflict_resolution.get(load_case_name)
+        if preferred_file and path != preferred_file:
+            return f"using {Path(preferred_file).name} for {load_case_name}"
+        return None
+
+    def _write_record(
+        self,
+        importer: TimeHistoryImporter,
+        record: TimeHistoryRecordResult,
+        parts: List[TimeHistoryParseResult],
+        done: int,
+        total: int,
+    ) -> None:
+        """Write one merged record; roll back and record the error on failure."""
+        name = Path(record.file_path).name
+        try:
+            record.count = importer.import_result(merge_parse_results(record.load_case_name, parts))
+        except Exception as exc:
+            self.session.rollback()
+            record.error = str(exc) or type(exc).__name__
+            logger.exception("Failed to import %s", name)
+            self._report_progress(f"Failed {name}: {record.error}", done, total)
+            return
+        self._report_progress(f"Imported {record.load_case_name} from {name}", done, total)
+
+    def _report_progress(self, message: str, current: int, total: int) -> None:
+        if self.progress_callback:
+            self.progress_callback(message, current, total)
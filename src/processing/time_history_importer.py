@@ -6,18 +6,22 @@
 from __future__ import annotations
 
 import logging
+from contextlib import suppress
 from pathlib import Path
-from typing import Callable, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from database.models import (
     Project,
+    ResponseSpectrumCache,
     ResultSet,
     Story,
     TimeSeriesGlobalCache,
 )
 from database.repositories import StoryRepository
+from database.time_series_store import TimeSeriesRecord, TimeSeriesStore, stack_series
 
 from .time_history_parser import TimeHistoryParser, TimeHistoryParseResult, TimeSeriesData
 
@@ -41,6 +45,8 @@ def __init__(
 
         self._story_lookup: dict[str, int] = {}
         self._story_repo = StoryRepository(session)
+        # Binary store records to write once the cache rows are committed
+        self._pending_records: List[Tuple[Tuple[str, str, str], Optional[TimeSeriesRecord]]] = []
 
     def import_file(
         self,
@@ -67,6 +73,18 @@ def import_file(
             self._report_progress(100, f"Skipping load case '{result.load_case_name}' (not selected)")
             return 0
 
+        return self.import_result(result)
+
+    def import_result(self, result: TimeHistoryParseResult) -> int:
+        """Write one parsed record to the cache and commit.
+
+        Args:
+            result: Parsed time history data for one load case
+
+        Returns:
+            Number of time series records imported
+        """
+        self._pending_records = []
         self._report_progress(20, f"Creating stories for {result.load_case_name}...")
         self._ensure_stories(result.stories)
 
@@ -87,8 +105,15 @@ def import_file(
         count += self._import_series(result.accelerations_x, result.load_case_name, "Accelerations", "X")
         count += self._import_series(result.accelerations_y, result.load_case_name, "Accelerations", "Y")
 
+        # Spectra of the previous import of this record are stale
+        self.session.query(ResponseSpectrumCache).filter_by(
+            result_set_id=self.result_set_id,
+            load_case_name=result.load_case_name,
+        ).delete(synchronize_session=False)
+
         self._report_progress(95, "Committing to database...")
         self.session.commit()
+        self._write_store_records()
 
         self._report_progress(100, f"Imported {count} time series records for {result.load_case_name}")
         return count
@@ -130,48 +155,105 @@ def _import_series(
         Returns:
             Number of records imported
         """
-        count = 0
-
-        for series in series_list:
-            story_id = self._story_lookup.get(series.story)
-            if not story_id:
-                logger.warning(f"Story '{series.story}' not found in lookup, skipping")
-                continue
+        if not series_list:
+            return 0
 
-            # Check if entry already exists
-            existing = self.session.query(TimeSeriesGlobalCache).filter_by(
+        # One lookup for all existing entries of this load case / type / direction
+        existing = {
+            entry.story_id: entry
+            for entry in self.session.query(TimeSeriesGlobalCache).filter_by(
                 project_id=self.project_id,
                 result_set_id=self.result_set_id,
                 load_case_name=load_case_name,
                 result_type=result_type,
                 direction=direction,
-                story_id=story_id,
-            ).first()
+            )
+        }
 
-            if existing:
+        count = 0
+        new_rows = []
+        for series in series_list:
+            story_id = self._story_lookup.get(series.story)
+            if not story_id:
+                logger.warning(f"Story '{series.story}' not found in lookup, skipping")
+                continue
+
+            entry = existing.get(story_id)
+            if entry is not None:
                 # Update existing entry
-                existing.time_steps = series.time_steps
-                existing.values = series.values
-                existing.story_sort_order = series.story_sort_order
+                entry.time_steps = series.time_steps
+                entry.values = series.values
+                entry.story_sort_order = series.story_sort_order
             else:
-                # Create new entry
-                cache_entry = TimeSeriesGlobalCache(
-                    project_id=self.project_id,
-                    result_set_id=self.result_set_id,
-                    load_case_name=load_case_name,
-                    result_type=result_type,
-                    direction=direction,
-                    story_id=story_id,
-                    time_steps=series.time_steps,
-                    values=series.values,
-                    story_sort_order=series.story_sort_order,
-                )
-                self.session.add(cache_entry)
+                new_rows.append({
+                    "project_id": self.project_id,
+                    "result_set_id": self.result_set_id,
+                    "load_case_name": load_case_name,
+                    "result_type": result_type,
+                    "direction": direction,
+                    "story_id": story_id,
+                    "time_steps": series.time_steps,
+                    "values": series.values,
+                    "story_sort_order": series.story_sort_order,
+                })
 
             count += 1
 
+        if new_rows:
+            self.session.execute(insert(TimeSeriesGlobalCache.__table__), new_rows)
+
+        self._queue_store_record((load_case_name, result_type, direction), series_list, existing)
         return count
 
+    def _queue_store_record(
+        self,
+        key: Tuple[str, str, str],
+        series_list: List[TimeSeriesData],
+        existing: Dict[int, TimeSeriesGlobalCache],
+    ) -> None:
+        """Queue the binary store record matching the cache rows of ``key``.
+
+        Rows are ordered like ``TimeSeriesRepository.get_time_series``
+        (story_sort_order descending). When older rows for stories missing
+        from this file remain, the record is dropped instead and rebuilt from
+        the database on first read.
+        """
+        imported = [
+            (self._story_lookup[series.story], series)
+            for series in series_list
+            if self._story_lookup.get(series.story)
+        ]
+        if set(existing) - {story_id for story_id, _ in imported}:
+            self._pending_records.append((key, None))
+            return
+
+        # NULL sort orders come last in a descending SQLite ORDER BY
+        imported.sort(
+            key=lambda item: (item[1].story_sort_order is None, -(item[1].story_sort_order or 0))
+        )
+        record = stack_series(
+            [story_id for story_id, _ in imported],
+            [series.time_steps for _, series in imported],
+            [series.values for _, series in imported],
+        )
+        self._pending_records.append((key, record))
+
+    def _write_store_records(self) -> None:
+        pending, self._pending_records = self._pending_records, []
+        store = TimeSeriesStore.for_session(self.session)
+        if store is None:
+            return
+        for (load_case_name, result_type, direction), record in pending:
+            try:
+                if record is None:
+                    store.delete(self.result_set_id, load_case_name, result_type, direction)
+                else:
+                    store.write(self.result_set_id, load_case_name, result_type, direction, record)
+            except OSError as exc:
+                logger.warning(f"Could not write time series store record: {exc}")
+                with suppress(OSError):
+                    store.delete(self.result_set_id, load_case_name, result_type, direction)
+
     def _report_progress(self, percent: int, message: str) -> None:
         """Report progress to callback if available."""
         if self.progress_callback:
@@ -278,5 +360,11 @@ def delete_time_series(self, project_id: int, result_set_id: int) -> int:
             project_id=project_id,
             result_set_id=result_set_id,
         ).delete()
+        self.session.query(ResponseSpectrumCache).filter_by(
+            result_set_id=result_set_id,
+        ).delete()
         self.session.commit()
+        store = TimeSeriesStore.for_session(self.session)
+        if store is not None:
+            store.delete_result_set(result_set_id)
         return count
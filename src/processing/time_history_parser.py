@@ -12,10 +12,14 @@
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from .xlsx_row_stream import XlsxRowStream
+from .xlsx_scanner import XlsxScanner
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,39 +58,98 @@ class TimeHistoryParser:
     STORY_FORCES_SHEET = "Story Forces"
     JOINT_DISPLACEMENTS_SHEET = "Joint Displacements"
     DIAPHRAGM_ACCELERATIONS_SHEET = "Diaphragm Accelerations"
+    RESULT_SHEETS = (
+        STORY_DRIFTS_SHEET,
+        STORY_FORCES_SHEET,
+        JOINT_DISPLACEMENTS_SHEET,
+        DIAPHRAGM_ACCELERATIONS_SHEET,
+    )
+
+    # Row 1 holds headers and row 2 units; data starts on worksheet row 3
+    DATA_START_ROW = 3
+    STEP_BY_STEP = "Step By Step"
+
+    # Set by parse() for .xlsx files; other formats fall back to pandas
+    _stream: Optional[XlsxRowStream] = None
 
     def __init__(self, file_path: str | Path):
         self.file_path = Path(file_path)
         self._xl: Optional[pd.ExcelFile] = None
 
-    def parse(self) -> TimeHistoryParseResult:
-        """Parse the Excel file and extract all time series data."""
-        self._xl = pd.ExcelFile(self.file_path)
+    def parse(self, sheets: Optional[Iterable[str]] = None) -> TimeHistoryParseResult:
+        """Parse the Excel file and extract all time series data.
 
-        # Detect load case name from Story Drifts sheet
-        load_case_name = self._detect_load_case_name()
+        Args:
+            sheets: Optional subset of ``RESULT_SHEETS`` to parse (default: all).
+                Lets a batch import parse the sheets of one file in parallel.
+        """
+        requested = set(self.RESULT_SHEETS if sheets is None else sheets)
+
+        if XlsxRowStream.supports(self.file_path):
+            self._stream = XlsxRowStream(self.file_path)
+        else:
+            self._xl = pd.ExcelFile(self.file_path)
 
-        result = TimeHistoryParseResult(load_case_name=load_case_name)
+        try:
+            sheet_names = set(self._sheet_names()) & requested
 
-        # Parse each sheet
-        if self.STORY_DRIFTS_SHEET in self._xl.sheet_names:
-            result.drifts_x, result.drifts_y, result.stories = self._parse_story_drifts()
+            # Detect load case name from Story Drifts sheet
+            load_case_name = self._detect_load_case_name()
 
-        if self.STORY_FORCES_SHEET in self._xl.sheet_names:
-            result.forces_x, result.forces_y, _ = self._parse_story_forces()
+            result = TimeHistoryParseResult(load_case_name=load_case_name)
 
-        if self.JOINT_DISPLACEMENTS_SHEET in self._xl.sheet_names:
-            result.displacements_x, result.displacements_y, _ = self._parse_joint_displacements()
+            # Parse each sheet
+            if self.STORY_DRIFTS_SHEET in sheet_names:
+                result.drifts_x, result.drifts_y, result.stories = self._parse_story_drifts()
 
-        if self.DIAPHRAGM_ACCELERATIONS_SHEET in self._xl.sheet_names:
-            result.accelerations_x, result.accelerations_y, _ = self._parse_diaphragm_accelerations()
+            if self.STORY_FORCES_SHEET in sheet_names:
+                result.forces_x, result.forces_y, _ = self._parse_story_forces()
+
+            if self.JOINT_DISPLACEMENTS_SHEET in sheet_names:
+                result.displacements_x, result.displacements_y, _ = self._parse_joint_displacements()
+
+            if self.DIAPHRAGM_ACCELERATIONS_SHEET in sheet_names:
+                result.accelerations_x, result.accelerations_y, _ = self._parse_diaphragm_accelerations()
+        finally:
+            self.close()
 
-        self._xl.close()
         return result
 
+    def available_sheets(self) -> List[str]:
+        """Return the result sheets present in the file, without parsing them."""
+        if XlsxRowStream.supports(self.file_path):
+            with XlsxRowStream(self.file_path) as stream:
+                names = stream.sheet_names
+        else:
+            with pd.ExcelFile(self.file_path) as xl:
+                names = xl.sheet_names
+        return [sheet for sheet in self.RESULT_SHEETS if sheet in names]
+
+    def close(self) -> None:
+        """Release the workbook handles opened by parse()."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._xl is not None:
+            self._xl.close()
+            self._xl = None
+
+    def _sheet_names(self) -> List[str]:
+        if self._stream is not None:
+            return self._stream.sheet_names
+        return self._xl.sheet_names
+
     def _detect_load_case_name(self) -> str:
         """Detect the load case name from the Story Drifts sheet."""
-        if self.STORY_DRIFTS_SHEET not in self._xl.sheet_names:
+        if self.STORY_DRIFTS_SHEET not in self._sheet_names():
+            return "Unknown"
+
+        if self._stream is not None:
+            # Column 1 is "Output Case"; look at the first 5 data rows like the pandas path
+            rows = self._stream.iter_rows(self.STORY_DRIFTS_SHEET, [1], min_row=self.DATA_START_ROW)
+            for _, (output_case,) in zip(range(5), rows):
+                if output_case not in (None, ""):
+                    return str(output_case)
             return "Unknown"
 
         df = pd.read_excel(self._xl, sheet_name=self.STORY_DRIFTS_SHEET, header=0, skiprows=[1], nrows=5)
@@ -101,24 +164,12 @@ def _parse_story_drifts(self) -> Tuple[List[TimeSeriesData], List[TimeSeriesData
         Returns:
             Tuple of (drifts_x, drifts_y, story_order)
         """
-        df = pd.read_excel(self._xl, sheet_name=self.STORY_DRIFTS_SHEET, header=0, skiprows=[1])
-
-        # Map to proper column names
         # Columns: Story, Output Case, Case Type, Step Type, Step Number, Direction, Drift, ...
-        col_mapping = {
-            df.columns[0]: "Story",
-            df.columns[1]: "Output_Case",
-            df.columns[2]: "Case_Type",
-            df.columns[3]: "Step_Type",
-            df.columns[4]: "Step_Num",
-            df.columns[5]: "Direction",
-            df.columns[6]: "Drift",
-        }
-        df = df.rename(columns=col_mapping)
-
-        # Filter valid rows
-        df = df.dropna(subset=["Story"])
-        df = df[df["Step_Type"] == "Step By Step"]
+        df = self._read_filtered(
+            self.STORY_DRIFTS_SHEET,
+            {"Story": 0, "Step_Num": 4, "Direction": 5, "Drift": 6},
+            where={3: self.STEP_BY_STEP},
+        )
 
         # Get story order (preserve first-occurrence order)
         story_order = df["Story"].unique().tolist()
@@ -137,26 +188,13 @@ def _parse_story_forces(self) -> Tuple[List[TimeSeriesData], List[TimeSeriesData
         Returns:
             Tuple of (forces_x, forces_y, story_order)
         """
-        df = pd.read_excel(self._xl, sheet_name=self.STORY_FORCES_SHEET, header=0, skiprows=[1])
-
         # Columns: Story, Output Case, Case Type, Step Type, Step Number, Location, P, VX, VY, T, MX, MY
-        col_mapping = {
-            df.columns[0]: "Story",
-            df.columns[1]: "Output_Case",
-            df.columns[2]: "Case_Type",
-            df.columns[3]: "Step_Type",
-            df.columns[4]: "Step_Num",
-            df.columns[5]: "Location",
-            df.columns[6]: "P",
-            df.columns[7]: "VX",
-            df.columns[8]: "VY",
-        }
-        df = df.rename(columns=col_mapping)
-
-        # Filter valid rows - use Bottom location for shears
-        df = df.dropna(subset=["Story"])
-        df = df[df["Step_Type"] == "Step By Step"]
-        df = df[df["Location"] == "Bottom"]
+        # Use Bottom location for shears
+        df = self._read_filtered(
+            self.STORY_FORCES_SHEET,
+            {"Story": 0, "Step_Num": 4, "VX": 7, "VY": 8},
+            where={3: self.STEP_BY_STEP, 5: "Bottom"},
+        )
 
         # Get story order
         story_order = df["Story"].unique().tolist()
@@ -177,27 +215,13 @@ def _parse_joint_displacements(self) -> Tuple[List[TimeSeriesData], List[TimeSer
         Returns:
             Tuple of (displacements_x, displacements_y, story_order)
         """
-        df = pd.read_excel(self._xl, sheet_name=self.JOINT_DISPLACEMENTS_SHEET, header=0, skiprows=[1])
-
         # Columns: Story, Label, Unique Name, Output Case, Case Type, Step Type, Step Number, Ux, Uy, Uz, ...
-        col_mapping = {
-            df.columns[0]: "Story",
-            df.columns[1]: "Label",
-            df.columns[2]: "Unique_Name",
-            df.columns[3]: "Output_Case",
-            df.columns[4]: "Case_Type",
-            df.columns[5]: "Step_Type",
-            df.columns[6]: "Step_Num",
-            df.columns[7]: "Ux",
-            df.columns[8]: "Uy",
-            df.columns[9]: "Uz",
-        }
-        df = df.rename(columns=col_mapping)
-
-        # Filter valid rows - use Label=1 joint for floor displacements
-        df = df.dropna(subset=["Story"])
-        df = df[df["Step_Type"] == "Step By Step"]
-        df = df[df["Label"] == 1]
+        # Use Label=1 joint for floor displacements
+        df = self._read_filtered(
+            self.JOINT_DISPLACEMENTS_SHEET,
+            {"Story": 0, "Step_Num": 6, "Ux": 7, "Uy": 8},
+            where={5: self.STEP_BY_STEP, 1: 1},
+        )
 
         # Get story order
         story_order = df["Story"].unique().tolist()
@@ -216,24 +240,12 @@ def _parse_diaphragm_accelerations(self) -> Tuple[List[TimeSeriesData], List[Tim
         Returns:
             Tuple of (accelerations_x, accelerations_y, story_order)
         """
-        df = pd.read_excel(self._xl, sheet_name=self.DIAPHRAGM_ACCELERATIONS_SHEET, header=0, skiprows=[1])
-
         # Columns: Story, Diaphragm, Output Case, Case Type, Step Type, Step Number, Max UX, Max UY, ...
-        col_mapping = {
-            df.columns[0]: "Story",
-            df.columns[1]: "Diaphragm",
-            df.columns[2]: "Output_Case",
-            df.columns[3]: "Case_Type",
-            df.columns[4]: "Step_Type",
-            df.columns[5]: "Step_Num",
-            df.columns[6]: "Max_UX",
-            df.columns[7]: "Max_UY",
-        }
-        df = df.rename(columns=col_mapping)
-
-        # Filter valid rows
-        df = df.dropna(subset=["Story"])
-        df = df[df["Step_Type"] == "Step By Step"]
+        df = self._read_filtered(
+            self.DIAPHRAGM_ACCELERATIONS_SHEET,
+            {"Story": 0, "Step_Num": 5, "Max_UX": 6, "Max_UY": 7},
+            where={4: self.STEP_BY_STEP},
+        )
 
         # Get story order
         story_order = df["Story"].unique().tolist()
@@ -246,39 +258,63 @@ def _parse_diaphragm_accelerations(self) -> Tuple[List[TimeSeriesData], List[Tim
 
         return accelerations_x, accelerations_y, story_order
 
+    def _read_filtered(
+        self, sheet_name: str, columns: Dict[str, int], where: Dict[int, Any]
+    ) -> pd.DataFrame:
+        """Read only the named columns of rows that have a story and match ``where``.
+
+        For .xlsx files the predicates are evaluated while streaming the
+        worksheet, so non-matching rows and unused columns are never converted.
+
+        Args:
+            sheet_name: Worksheet to read
+            columns: Output column name → 0-based column position
+            where: 0-based column position → value the cell must equal
+
+        Returns:
+            DataFrame with one row per matching sheet row, in sheet order
+        """
+        names = list(columns)
+        positions = list(columns.values())
+        story_position = columns["Story"]
+
+        if self._stream is not None:
+            rows = self._stream.iter_rows(
+                sheet_name,
+                positions,
+                where=where,
+                required=[story_position],
+                min_row=self.DATA_START_ROW,
+            )
+            df = pd.DataFrame.from_records(list(rows), columns=names)
+            # Numbers stored as text become numeric, as read_excel's type inference did
+            for name in names:
+                if name != "Story" and df[name].dtype == object:
+                    try:
+                        df[name] = pd.to_numeric(df[name])
+                    except (ValueError, TypeError):
+                        pass
+            return df
+
+        df = pd.read_excel(self._xl, sheet_name=sheet_name, header=None, skiprows=self.DATA_START_ROW - 1)
+        mask = df.iloc[:, story_position].notna()
+        for position, value in where.items():
+            mask &= df.iloc[:, position] == value
+        df = df.loc[mask].iloc[:, positions]
+        df.columns = names
+        return df.reset_index(drop=True)
+
     def _extract_time_series_by_direction(
         self, df: pd.DataFrame, direction: str, value_col: str, story_order: List[str]
     ) -> List[TimeSeriesData]:
         """Extract time series for each story filtered by direction column."""
-        result = []
-
         df_dir = df[df["Direction"] == direction]
-
-        for idx, story in enumerate(story_order):
-            story_df = df_dir[df_dir["Story"] == story].sort_values("Step_Num")
-
-            if story_df.empty:
-                continue
-
-            time_steps = story_df["Step_Num"].tolist()
-            values = story_df[value_col].tolist()
-
-            result.append(TimeSeriesData(
-                story=story,
-                direction=direction,
-                time_steps=time_steps,
-                values=values,
-                story_sort_order=idx,
-            ))
-
-        return result
+        return self._group_time_series(df_dir, value_col, direction, story_order)
 
     def _extract_time_series_direct(
         self, df: pd.DataFrame, value_col: str, story_order: List[str]
     ) -> List[TimeSeriesData]:
         """Extract time series for each story from a direct value column."""
-        result = []
-
         # Determine direction from column name
         if value_col in ("VX", "Ux", "Max_UX"):
             direction = "X"
@@ -287,21 +323,40 @@ def _extract_time_series_direct(
         else:
             direction = ""
 
-        for idx, story in enumerate(story_order):
-            story_df = df[df["Story"] == story].sort_values("Step_Num")
+        return self._group_time_series(df, value_col, direction, story_order)
+
+    def _group_time_series(
+        self, df: pd.DataFrame, value_col: str, direction: str, story_order: List[str]
+    ) -> List[TimeSeriesData]:
+        """Split rows into per-story series sorted by step, in story order.
+
+        One stable sort by (story position, step) replaces a filter-and-sort
+        per story; stories without rows are skipped.
+        """
+        codes = pd.Categorical(df["Story"], categories=story_order).codes
+        keep = codes >= 0
+        if not keep.any():
+            return []
 
-            if story_df.empty:
-                continue
+        codes = codes[keep]
+        steps = df["Step_Num"].to_numpy()[keep]
+        values = df[value_col].to_numpy()[keep]
 
-            time_steps = story_df["Step_Num"].tolist()
-            values = story_df[value_col].tolist()
+        order = np.lexsort((steps, codes))
+        codes, steps, values = codes[order], steps[order], values[order]
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate(([0], boundaries))
 
+        result = []
+        for code, story_steps, story_values in zip(
+            codes[starts], np.split(steps, boundaries), np.split(values, boundaries)
+        ):
             result.append(TimeSeriesData(
-                story=story,
+                story=story_order[code],
                 direction=direction,
-                time_steps=time_steps,
-                values=values,
-                story_sort_order=idx,
+                time_steps=story_steps.tolist(),
+                values=story_values.tolist(),
+                story_sort_order=int(code),
             ))
 
         return result
@@ -313,6 +368,23 @@ def prescan_time_history_file(file_path: str | Path) -> Dict:
     Returns:
         Dict with keys: load_case_name, num_stories, num_time_steps, available_sheets
     """
+    if XlsxScanner.supports(file_path):
+        # Reads only the story, load case and step columns straight from the archive
+        with XlsxScanner(file_path) as scanner:
+            result = {
+                "load_case_name": "Unknown",
+                "num_stories": 0,
+                "num_time_steps": 0,
+                "available_sheets": scanner.sheet_names,
+            }
+            if "Story Drifts" in scanner.sheet_names:
+                distinct = scanner.distinct_columns("Story Drifts", [0, 1, 4], min_row=3, required=0)
+                if distinct[1]:
+                    result["load_case_name"] = str(distinct[1][0])
+                result["num_stories"] = len(distinct[0])
+                result["num_time_steps"] = len(distinct[4])
+            return result
+
     xl = pd.ExcelFile(file_path)
 
     result = {
@@ -0,0 +1,287 @@
+"""Streaming, filtered row reader for .xlsx worksheets.
+
+``pd.read_excel`` converts every cell of a sheet into Python objects before
+any filtering can happen. For time-history exports that is every joint ×
+every step × every column, most of which is discarded afterwards. This reader
+walks the worksheet XML directly from the zip archive and:
+
+- decodes only the requested columns (plus the columns used in predicates),
+- evaluates equality predicates while scanning, so non-matching rows are
+  dropped before any of their other values are converted,
+- yields plain tuples, one per matching row.
+
+Cell values follow pandas' openpyxl conversion: numbers that are integral come
+back as ``int``, other numbers as ``float``, text as ``str``, empty cells as
+``None``.
+"""
+
+from __future__ import annotations
+
+import logging
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_ROW = f"{_MAIN_NS}row"
+_SHEET_DATA = f"{_MAIN_NS}sheetData"
+_VALUE = f"{_MAIN_NS}v"
+_TEXT = f"{_MAIN_NS}t"
+_RUN = f"{_MAIN_NS}r"
+_INLINE = f"{_MAIN_NS}is"
+_SHARED_ITEM = f"{_MAIN_NS}si"
+
+_SUPPORTED_SUFFIXES = (".xlsx", ".xlsm")
+_CLEAR_EVERY = 1000  # Rows between releases of already-scanned row elements
+
+
+def _column_index(letters: str) -> int:
+    """Convert column letters ('A', 'AB') to a 0-based index."""
+    index = 0
+    for char in letters:
+        index = index * 26 + (ord(char) - 64)
+    return index - 1
+
+
+def _rich_text(element: ET.Element) -> str:
+    """Concatenate the text runs of a shared or inline string (phonetic runs excluded)."""
+    parts = []
+    for child in element:
+        if child.tag == _TEXT:
+            parts.append(child.text or "")
+        elif child.tag == _RUN:
+            parts.extend(t.text or "" for t in child.iter(_TEXT))
+    return "".join(parts)
+
+
+def _number(text: str) -> Any:
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def _matches(value: Any, expected: Any) -> bool:
+    """Equality predicate; numeric targets also match numbers stored as text.
+
+    pandas infers numeric columns from text cells such as "1", so ``Label == 1``
+    matched those rows when whole sheets went through ``read_excel``.
+    """
+    if value == expected:
+        return True
+    if isinstance(value, str) and isinstance(expected, (int, float)) and not isinstance(expected, bool):
+        try:
+            return float(value) == expected
+        except ValueError:
+            return False
+    return False
+
+
+class _SharedStrings:
+    """Shared string table decoded on demand, up to the highest index requested.
+
+    Workbooks that keep a large payload in a later sheet (e.g. IMPORT_DATA)
+    store its strings at the end of the table, so reading an earlier sheet
+    never decodes them.
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, part: Optional[str]):
+        self._strings: List[str] = []
+        self._handle = archive.open(part) if part else None
+        self._events = ET.iterparse(self._handle) if self._handle is not None else iter(())
+
+    def __getitem__(self, index: int) -> str:
+        while index >= len(self._strings):
+            if not self._read_next():
+                raise IndexError(f"Shared string {index} not found")
+        return self._strings[index]
+
+    def _read_next(self) -> bool:
+        for _, element in self._events:
+            if element.tag == _SHARED_ITEM:
+                self._strings.append(_rich_text(element))
+                element.clear()
+                return True
+        self.close()
+        return False
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            self._events = iter(())
+
+
+class XlsxRowStream:
+    """Reads selected columns of matching rows from an .xlsx workbook.
+
+    Usage:
+        with XlsxRowStream(path) as stream:
+            for story, step, drift in stream.iter_rows(
+                "Story Drifts", columns=[0, 4, 6], where={3: "Step By Step"},
+                required=[0], min_row=3,
+            ):
+                ...
+    """
+
+    def __init__(self, file_path: str | Path):
+        self.file_path = Path(file_path)
+        self._zip = zipfile.ZipFile(self.file_path)
+        self._sheet_paths = self._read_sheet_paths()
+        self._shared_strings: Optional[_SharedStrings] = None
+
+    @staticmethod
+    def supports(file_path: str | Path) -> bool:
+        """Return True when the file is an OOXML workbook this reader can stream."""
+        path = Path(file_path)
+        return path.suffix.lower() in _SUPPORTED_SUFFIXES and zipfile.is_zipfile(path)
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self._sheet_paths)
+
+    def close(self) -> None:
+        if self._shared_strings is not None:
+            self._shared_strings.close()
+        self._zip.close()
+
+    def __enter__(self) -> "XlsxRowStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def iter_rows(
+        self,
+        sheet_name: str,
+        columns: Sequence[int],
+        where: Optional[Dict[int, Any]] = None,
+        required: Sequence[int] = (),
+        min_row: int = 1,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Yield the selected cells of every row that passes the predicates.
+
+        Args:
+            sheet_name: Worksheet name
+            columns: 0-based column indices to return, in output order
+            where: 0-based column index → value the cell must equal
+            required: Columns that must hold a non-empty value
+            min_row: First 1-based worksheet row to consider (skips headers)
+
+        Returns:
+            Iterator of tuples aligned with ``columns``
+        """
+        if sheet_name not in self._sheet_paths:
+            raise ValueError(f"Sheet '{sheet_name}' not found in {self.file_path.name}")
+
+        where = dict(where or {})
+        required = tuple(required)
+        wanted = set(columns) | set(where) | set(required)
+        letters_cache: Dict[str, int] = {}
+        shared = self._get_shared_strings()
+
+        with self._zip.open(self._sheet_paths[sheet_name]) as handle:
+            sheet_data = None
+            scanned = 0
+            for event, element in ET.iterparse(handle, events=("start", "end")):
+                if event == "start":
+                    if element.tag == _SHEET_DATA:
+                        sheet_data = element
+                    continue
+                if element.tag != _ROW:
+                    continue
+
+                scanned += 1
+                row_number = element.get("r")
+                if row_number is not None and int(row_number) < min_row:
+                    element.clear()
+                    continue
+
+                raw = self._collect_cells(element, wanted, letters_cache)
+                element.clear()
+                if scanned % _CLEAR_EVERY == 0 and sheet_data is not None:
+                    sheet_data.clear()
+
+                values = {index: self._convert(cell, shared) for index, cell in raw.items()
+                          if index in where or index in required}
+                if any(values.get(index) in (None, "") for index in required):
+                    continue
+                if not all(_matches(values.get(index), expected) for index, expected in where.items()):
+                    continue
+
+                yield tuple(
+                    values[index] if index in values else self._convert(raw.get(index), shared)
+                    for index in columns
+                )
+
+    # ===== Internals =====
+
+    def _read_sheet_paths(self) -> Dict[str, str]:
+        """Map worksheet names to their part names inside the archive."""
+        workbook = ET.fromstring(self._zip.read("xl/workbook.xml"))
+        rels = ET.fromstring(self._zip.read("xl/_rels/workbook.xml.rels"))
+        targets = {rel.get("Id"): rel.get("Target") for rel in rels.iter(f"{_PKG_REL_NS}Relationship")}
+
+        paths = {}
+        for sheet in workbook.iter(f"{_MAIN_NS}sheet"):
+            target = targets.get(sheet.get(f"{_REL_NS}id"))
+            if not target:
+                continue
+            if target.startswith("/"):
+                paths[sheet.get("name")] = target.lstrip("/")
+            else:
+                paths[sheet.get("name")] = posixpath.normpath(posixpath.join("xl", target))
+        return paths
+
+    def _get_shared_strings(self) -> "_SharedStrings":
+        if self._shared_strings is None:
+            part = "xl/sharedStrings.xml" if "xl/sharedStrings.xml" in self._zip.namelist() else None
+            self._shared_strings = _SharedStrings(self._zip, part)
+        return self._shared_strings
+
+    @staticmethod
+    def _collect_cells(row: ET.Element, wanted: set, letters_cache: Dict[str, int]) -> Dict[int, ET.Element]:
+        """Return the wanted cell elements of a row keyed by column index."""
+        cells = {}
+        position = -1
+        for cell in row:
+            ref = cell.get("r")
+            if ref is None:
+                position += 1
+            else:
+                letters = ref.rstrip("0123456789")
+                position = letters_cache.get(letters)
+                if position is None:
+                    position = letters_cache[letters] = _column_index(letters)
+            if position in wanted:
+                cells[position] = cell
+        return cells
+
+    @staticmethod
+    def _convert(cell: Optional[ET.Element], shared: "_SharedStrings") -> Any:
+        """Convert one cell element to a Python value."""
+        if cell is None:
+            return None
+        cell_type = cell.get("t", "n")
+        if cell_type == "inlineStr":
+            inline = cell.find(_INLINE)
+            return _rich_text(inline) if inline is not None else None
+
+        value = cell.find(_VALUE)
+        if value is None or value.text is None:
+            return None
+        text = value.text
+        if cell_type == "s":
+            return shared[int(text)]
+        if cell_type == "n":
+            return _number(text)
+        if cell_type == "b":
+            return text == "1"
+        if cell_type == "e":
+            return None
+        return text
@@ -0,0 +1,296 @@
+"""Zip-level metadata scanner for .xlsx workbooks.
+
+Prescans only need sheet names, row counts and the distinct values of a few
+columns (load cases, stories, element names), but opening a workbook through
+``pd.ExcelFile``/openpyxl loads its styles and the whole shared string table,
+and reading a column converts every row of the sheet. This scanner reads the
+archive directly:
+
+- sheet names come from ``xl/workbook.xml``,
+- row counts come from the sheet's ``<dimension>`` element,
+- distinct column values come from a byte-level scan of the sheet XML that
+  only looks at cells in the requested columns and decodes each distinct
+  shared string once.
+
+Usage:
+    with XlsxScanner(path) as scanner:
+        if "Story Drifts" in scanner.sheet_names:
+            cases = scanner.distinct_values("Story Drifts", "Output Case", header_row=2, min_row=4)
+"""
+
+from __future__ import annotations
+
+import html
+import logging
+import re
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .xlsx_row_stream import _ROW, XlsxRowStream, _column_index, _number
+
+logger = logging.getLogger(__name__)
+
+_READ_SIZE = 4 * 1024 * 1024  # Bytes of sheet XML scanned per step
+_DIMENSION = re.compile(rb'<dimension ref="[A-Z]+(\d+)(?::[A-Z]+(\d+))?"')
+_EMPTY_SHEET = re.compile(rb"<sheetData\s*(?:/>|></sheetData>)")
+_CELL_TYPE = re.compile(rb'\bt="(\w+)"')
+_VALUE = re.compile(rb"<v>([^<]*)</v>")
+_INLINE_TEXT = re.compile(rb"<t(?:\s[^>]*)?>([^<]*)</t>")
+_ROW_START = re.compile(rb'<row [^>]*?r="(\d+)"')
+_ROW_END = b"</row>"
+
+
+def _column_letters(index: int) -> str:
+    """Convert a 0-based column index to letters (0 → 'A', 27 → 'AB')."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class XlsxScanner(XlsxRowStream):
+    """Reads sheet names, row counts and distinct column values from an .xlsx archive."""
+
+    def row_count(self, sheet_name: str) -> Optional[int]:
+        """Last used row number from the sheet's ``<dimension>``, or None if absent.
+
+        The count includes header rows; an empty sheet reports 0.
+        """
+        with self._zip.open(self._sheet_part(sheet_name)) as handle:
+            head = handle.read(4096)
+        match = _DIMENSION.search(head)
+        if match is None:
+            return None
+        if _EMPTY_SHEET.search(head):
+            return 0
+        return int(match.group(2) or match.group(1))
+
+    def header(self, sheet_name: str, row: int = 1) -> List[Any]:
+        """Cell values of one worksheet row (1-based), up to its last used cell."""
+        shared = self._get_shared_strings()
+        with self._zip.open(self._sheet_part(sheet_name)) as handle:
+            position = 0
+            for _, element in ET.iterparse(handle):
+                if element.tag != _ROW:
+                    continue
+                position = int(element.get("r", position + 1))
+                if position < row:
+                    element.clear()
+                    continue
+                if position > row:
+                    return []
+                cells: Dict[int, Any] = {}
+                column = -1
+                for cell in element:
+                    ref = cell.get("r")
+                    column = column + 1 if ref is None else _column_index(ref.rstrip("0123456789"))
+                    cells[column] = self._convert(cell, shared)
+                last = max((index for index, value in cells.items() if value is not None), default=-1)
+                return [cells.get(index) for index in range(last + 1)]
+        return []
+
+    def column_index(self, sheet_name: str, column_name: str, header_row: int = 1) -> Optional[int]:
+        """0-based index of a header name, ignoring case, spaces and punctuation."""
+        target = _normalize(column_name)
+        for index, value in enumerate(self.header(sheet_name, header_row)):
+            if value is not None and _normalize(value) == target:
+                return index
+        return None
+
+    def distinct_values(
+        self,
+        sheet_name: str,
+        column: Union[int, str],
+        header_row: int = 1,
+        min_row: Optional[int] = None,
+    ) -> List[Any]:
+        """Distinct non-empty values of one column, in first-occurrence order.
+
+        Args:
+            sheet_name: Worksheet name
+            column: 0-based column index, or a header name looked up in ``header_row``
+            header_row: 1-based row holding the column names
+            min_row: First 1-based data row (default: the row after ``header_row``)
+
+        Returns:
+            Values converted like XlsxRowStream (int/float/str); empty if the
+            named column does not exist
+        """
+        if isinstance(column, str):
+            index = self.column_index(sheet_name, column, header_row)
+            if index is None:
+                return []
+        else:
+            index = column
+        first_row = header_row + 1 if min_row is None else min_row
+        return self.distinct_columns(sheet_name, [index], min_row=first_row)[index]
+
+    def distinct_columns(
+        self,
+        sheet_name: str,
+        columns: Sequence[int],
+        min_row: int = 1,
+        required: Optional[int] = None,
+    ) -> Dict[int, List[Any]]:
+        """Distinct non-empty values of several columns in one pass over the sheet.
+
+        Args:
+            sheet_name: Worksheet name
+            columns: 0-based column indices
+            min_row: First 1-based row to consider
+            required: Column that must be non-empty for a row to count
+
+        Returns:
+            Dict of column index → distinct values in first-occurrence order
+        """
+        columns = list(dict.fromkeys(columns))
+        wanted = set(columns) | ({required} if required is not None else set())
+        letters = {_column_letters(index).encode(): index for index in wanted}
+        alternatives = b"|".join(letters)
+
+        raw: Dict[int, Dict[tuple, None]] = {index: {} for index in columns}
+        if not self._has_cell_references(sheet_name):
+            rows = self._positional_rows(sheet_name, sorted(wanted), min_row)
+        elif required is None:
+            # No per-row condition: deduplicate cells per block before decoding any of them
+            cell = re.compile(rb'<c r="(' + alternatives + rb')\d+"([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+            for block in self._row_blocks(sheet_name, min_row):
+                for column, attributes, content in dict.fromkeys(cell.findall(block)):
+                    key = _raw_value(attributes, content)
+                    if key is not None:
+                        raw[letters[column]][key] = None
+            rows = ()
+        else:
+            cell = re.compile(rb'<c r="(' + alternatives + rb')(\d+)"([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+            rows = self._referenced_rows(sheet_name, cell, letters, min_row)
+
+        for row_cells in rows:
+            if required is not None and required not in row_cells:
+                continue
+            for index, key in row_cells.items():
+                if index in raw:
+                    raw[index][key] = None
+
+        shared = self._get_shared_strings()
+        result: Dict[int, List[Any]] = {}
+        for index, keys in raw.items():
+            values = dict.fromkeys(self._decode(key, shared) for key in keys)
+            values.pop(None, None)
+            values.pop("", None)
+            result[index] = list(values)
+        return result
+
+    # ===== Internals =====
+
+    def _sheet_part(self, sheet_name: str) -> str:
+        if sheet_name not in self._sheet_paths:
+            raise ValueError(f"Sheet '{sheet_name}' not found in {self.file_path.name}")
+        return self._sheet_paths[sheet_name]
+
+    def _has_cell_references(self, sheet_name: str) -> bool:
+        """True when rows and cells carry ``r`` references (Excel and openpyxl always write them)."""
+        with self._zip.open(self._sheet_part(sheet_name)) as handle:
+            head = handle.read(64 * 1024)
+        if not re.search(rb"<c[\s>]", head):
+            return True
+        return b'<c r="' in head and _ROW_START.search(head) is not None
+
+    def _row_blocks(self, sheet_name: str, min_row: int) -> Iterator[bytes]:
+        """Yield the sheet XML in blocks of whole rows, starting at row ``min_row``."""
+        with self._zip.open(self._sheet_part(sheet_name)) as handle:
+            pending = b""
+            skipping = min_row > 1
+            while True:
+                data = handle.read(_READ_SIZE)
+                buffer = pending + data
+                if data:
+                    cut = buffer.rfind(_ROW_END)
+                    if cut < 0:
+                        pending = buffer
+                        continue
+                    cut += len(_ROW_END)
+                    buffer, pending = buffer[:cut], buffer[cut:]
+                if skipping:
+                    buffer, skipping = _skip_rows(buffer, min_row)
+                if buffer:
+                    yield buffer
+                if not data:
+                    return
+
+    def _referenced_rows(self, sheet_name, cell_pattern, letters, min_row) -> Iterator[Dict[int, tuple]]:
+        """Yield {column index: (type, raw value)} for each row with wanted cells."""
+        for block in self._row_blocks(sheet_name, min_row):
+            row_number = None
+            row_cells: Dict[int, tuple] = {}
+            for match in cell_pattern.finditer(block):
+                number = match.group(2)
+                if number != row_number:
+                    if row_cells:
+                        yield row_cells
+                    row_number, row_cells = number, {}
+                key = _raw_value(match.group(3), match.group(4))
+                if key is not None:
+                    row_cells[letters[match.group(1)]] = key
+            if row_cells:
+                yield row_cells
+
+    def _positional_rows(self, sheet_name, columns, min_row) -> Iterator[Dict[int, tuple]]:
+        """Fallback for cells without references, through the XML row reader."""
+        with self._zip.open(self._sheet_part(sheet_name)) as handle:
+            rows_numbered = _ROW_START.search(handle.read(64 * 1024)) is not None
+        rows = self.iter_rows(sheet_name, columns=columns, min_row=min_row if rows_numbered else 1)
+        for position, values in enumerate(rows, start=1):
+            if not rows_numbered and position < min_row:
+                continue
+            row_cells = {
+                index: ("value", value) for index, value in zip(columns, values) if value not in (None, "")
+            }
+            if row_cells:
+                yield row_cells
+
+    @staticmethod
+    def _decode(key: tuple, shared) -> Any:
+        kind, raw = key
+        if kind == "value":
+            return raw
+        if kind == "s":
+            return shared[int(raw)]
+        if kind == "n":
+            return _number(raw.decode())
+        if kind == "b":
+            return raw == b"1"
+        if kind == "e":
+            return None
+        return html.unescape(raw.decode("utf-8"))
+
+
+def _raw_value(attributes: bytes, content: Optional[bytes]) -> Optional[tuple]:
+    """(type, raw bytes) of a cell, or None when it holds no value."""
+    if not content:
+        return None
+    type_match = _CELL_TYPE.search(attributes)
+    cell_type = type_match.group(1).decode() if type_match else "n"
+    if cell_type == "inlineStr":
+        parts = _INLINE_TEXT.findall(content)
+        return ("str", b"".join(parts)) if parts else None
+    value = _VALUE.search(content)
+    if value is None:
+        return None
+    return (cell_type, value.group(1))
+
+
+def _skip_rows(block: bytes, min_row: int) -> Tuple[bytes, bool]:
+    """Drop the rows before ``min_row``; returns the rest and whether skipping continues."""
+    for match in _ROW_START.finditer(block):
+        if int(match.group(1)) >= min_row:
+            return block[match.start():], False
+    return b"", True
+
+
+def _normalize(name: object) -> str:
+    return "".join(ch for ch in str(name).lower() if ch.isalnum())
+
+
+__all__ = ["XlsxScanner"]
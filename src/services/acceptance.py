@@ -0,0 +1,322 @@
+"""Acceptance criteria evaluation over whole result sets.
+
+Checks story drifts, element rotations, soil pressures and any other result
+type with a declared limit (``config.acceptance_criteria``) against every
+row of a result set at once:
+
+- per-row demands are read from the caches once per (result set, result
+  type) and kept (``processing.acceptance.RowDemands``),
+- demand-to-capacity ratios form a separate cached layer
+  (``processing.acceptance.AcceptanceLayer``) that is rebuilt from the kept
+  demands when limits change, without touching the database.
+
+Usage:
+    service = AcceptanceService(project_id, session_factory)
+    result = service.evaluate([1, 2])
+    service.set_limits(apply_overrides(ACCEPTANCE_LIMITS, {"Drifts": 2.5}))
+    result = service.evaluate([1, 2])  # Ratios only; demands are reused
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from config.acceptance_criteria import ACCEPTANCE_LIMITS, AcceptanceLimit, DCR_WARNING, has_limits
+from config.result_config import RESULT_TYPE_SPECS, get_config
+from database.repositories import (
+    CacheRepository,
+    ElementCacheRepository,
+    ElementRepository,
+    JointCacheRepository,
+    ResultSetRepository,
+    StoryRepository,
+)
+from database.session import ResultSetSessionFactory, ResultSetSessionScope, SessionFactory
+from processing.acceptance import (
+    STATISTICS,
+    AcceptanceLayer,
+    GoverningRatio,
+    RowDemands,
+    evaluate,
+    row_demands,
+)
+from processing.result_transformers import get_transformer
+from services.governing_elements import display_config
+
+logger = logging.getLogger(__name__)
+
+GLOBAL = "global"
+ELEMENT = "element"
+JOINT = "joint"
+
+
+@dataclass
+class AcceptanceRow:
+    """Acceptance summary of one result type in one result set."""
+
+    result_set_id: int
+    result_type: str
+    unit: str
+    checked_rows: int
+    max_ratio: Optional[float]
+    exceeding: int  # Rows with ratio >= 1.0
+    approaching: int  # Rows with DCR_WARNING <= ratio < 1.0
+    governing: Optional[GoverningRatio] = None
+    result_set: str = ""
+
+
+@dataclass
+class AcceptanceResult:
+    """Acceptance summaries of an evaluation."""
+
+    statistic: str
+    rows: List[AcceptanceRow] = field(default_factory=list)
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per (result set, result type), governing row included."""
+        columns = [
+            "Result Set",
+            "Result Type",
+            "Max D/C",
+            "Exceeding",
+            "Approaching",
+            "Checked",
+            "Element",
+            "Location",
+            "Load Case",
+            "Demand",
+            "Capacity",
+            "Unit",
+        ]
+        records = []
+        for row in self.rows:
+            governing = row.governing
+            records.append(
+                {
+                    "Result Set": row.result_set,
+                    "Result Type": row.result_type,
+                    "Max D/C": row.max_ratio,
+                    "Exceeding": row.exceeding,
+                    "Approaching": row.approaching,
+                    "Checked": row.checked_rows,
+                    "Element": (governing.element or "") if governing else "",
+                    "Location": governing.location if governing else "",
+                    "Load Case": (governing.load_case or "") if governing else "",
+                    "Demand": governing.demand if governing else None,
+                    "Capacity": governing.capacity if governing else None,
+                    "Unit": row.unit,
+                }
+            )
+        return pd.DataFrame(records, columns=columns)
+
+
+def _global_check_types(cache_type: str) -> List[str]:
+    """Directional result config keys of a global cache result type ('Drifts' -> 'Drifts_X', ...)."""
+    for spec in RESULT_TYPE_SPECS:
+        if spec.key == cache_type and spec.variants:
+            return [f"{spec.key}_{variant.key_suffix}" for variant in spec.variants]
+    return [cache_type]
+
+
+class AcceptanceService(ResultSetSessionScope):
+    """Demand-to-capacity evaluation of a project's result sets.
+
+    Args:
+        project_id: Project ID
+        session_factory: Callable returning a new project database session
+        result_set_session_factory: Optional per-result-set session factory
+        limits: Acceptance limits (defaults to ``ACCEPTANCE_LIMITS``)
+    """
+
+    def __init__(
+        self,
+        project_id: int,
+        session_factory: SessionFactory,
+        result_set_session_factory: Optional[ResultSetSessionFactory] = None,
+        limits: Optional[Iterable[AcceptanceLimit]] = None,
+    ) -> None:
+        self.project_id = project_id
+        self._session_factory = session_factory
+        self._result_set_session_factory = result_set_session_factory
+        self._limits: Tuple[AcceptanceLimit, ...] = tuple(
+            ACCEPTANCE_LIMITS if limits is None else limits
+        )
+        # Result set ID -> check result type -> (cache kind, cache result type)
+        self._checks: Dict[int, Dict[str, Tuple[str, str]]] = {}
+        self._demands: Dict[Tuple[int, str], RowDemands] = {}
+        self._layers: Dict[Tuple[int, str], AcceptanceLayer] = {}
+
+    @property
+    def limits(self) -> Tuple[AcceptanceLimit, ...]:
+        return self._limits
+
+    def set_limits(self, limits: Iterable[AcceptanceLimit]) -> None:
+        """Replace the limits; ratios are re-evaluated from the kept demands."""
+        self._limits = tuple(limits)
+        self._layers.clear()
+
+    def invalidate(self, result_set_id: Optional[int] = None) -> None:
+        """Drop kept demands and ratios (e.g. after a result set was re-imported)."""
+        if result_set_id is None:
+            self._checks.clear()
+            self._demands.clear()
+            self._layers.clear()
+            return
+        self._checks.pop(result_set_id, None)
+        for cache in (self._demands, self._layers):
+            for key in [key for key in cache if key[0] == result_set_id]:
+                del cache[key]
+
+    def result_types(self, result_set_ids: Sequence[int]) -> List[str]:
+        """Result types with declared limits present in any of the result sets."""
+        result_types = set()
+        for result_set_id in result_set_ids:
+            result_types.update(self._result_set_checks(result_set_id))
+        return sorted(result_types)
+
+    def layer(self, result_set_id: int, result_type: str) -> Optional[AcceptanceLayer]:
+        """Ratios of every row of a result type, or None if it is not cached."""
+        key = (result_set_id, result_type)
+        if key not in self._layers:
+            demands = self._row_demands(result_set_id, result_type)
+            if demands is None:
+                return None
+            self._layers[key] = evaluate(demands, self._limits)
+        return self._layers[key]
+
+    def evaluate(
+        self,
+        result_set_ids: Sequence[int],
+        result_types: Optional[Sequence[str]] = None,
+        statistic: str = "peak",
+    ) -> AcceptanceResult:
+        """Acceptance summary per (result set, result type).
+
+        Args:
+            result_set_ids: Result sets to check
+            result_types: Result types to check (default: every type with limits)
+            statistic: Compare the 'peak' |value| or the 'mean' (|Avg|) of each row
+        """
+        if statistic not in STATISTICS:
+            raise ValueError(f"Unknown statistic: {statistic}. Available: {', '.join(STATISTICS)}")
+        result = AcceptanceResult(statistic=statistic)
+        for result_set_id in result_set_ids:
+            checks = self._result_set_checks(result_set_id)
+            for result_type in result_types if result_types is not None else sorted(checks):
+                if result_type not in checks:
+                    continue
+                layer = self.layer(result_set_id, result_type)
+                if layer is None or not layer.checked_rows:
+                    continue
+                exceeding = layer.count_exceeding(statistic)
+                result.rows.append(
+                    AcceptanceRow(
+                        result_set_id=result_set_id,
+                        result_type=result_type,
+                        unit=display_config(result_type).unit,
+                        checked_rows=layer.checked_rows,
+                        max_ratio=layer.max_ratio(statistic),
+                        exceeding=exceeding,
+                        approaching=layer.count_exceeding(statistic, DCR_WARNING) - exceeding,
+                        governing=layer.governing(statistic),
+                    )
+                )
+        self._attach_result_set_names(result.rows)
+        return result
+
+    def _result_set_checks(self, result_set_id: int) -> Dict[str, Tuple[str, str]]:
+        """Check result type -> (cache kind, cache result type) for a result set."""
+        if result_set_id not in self._checks:
+            checks: Dict[str, Tuple[str, str]] = {}
+            with self._session_scope(result_set_id) as session:
+                for cache_type in CacheRepository(session).get_result_types(result_set_id):
+                    for result_type in _global_check_types(cache_type):
+                        checks[result_type] = (GLOBAL, cache_type)
+                for cache_type in ElementCacheRepository(session).get_result_types(result_set_id):
+                    checks[cache_type] = (ELEMENT, cache_type)
+                for cache_type in JointCacheRepository(session).get_result_types(result_set_id):
+                    checks[cache_type] = (JOINT, cache_type)
+            self._checks[result_set_id] = checks
+        return {
+            result_type: source
+            for result_type, source in self._checks[result_set_id].items()
+            if has_limits(self._limits, result_type)
+        }
+
+    def _row_demands(self, result_set_id: int, result_type: str) -> Optional[RowDemands]:
+        key = (result_set_id, result_type)
+        if key in self._demands:
+            return self._demands[key]
+        source = self._result_set_checks(result_set_id).get(result_type)
+        if source is None:
+            return None
+        kind, cache_type = source
+
+        with self._session_scope(result_set_id) as session:
+            if kind == GLOBAL:
+                entries = CacheRepository(session).get_cache_for_display(
+                    self.project_id, cache_type, result_set_id
+                )
+            elif kind == ELEMENT:
+                entries = ElementCacheRepository(session).get_cache_for_result_type(
+                    self.project_id, cache_type, result_set_id
+                )
+            else:
+                entries = JointCacheRepository(session).get_all_for_type(
+                    self.project_id, result_set_id, cache_type
+                )
+            matrices = [entry.results_matrix for entry in entries]
+            story_ids = [getattr(entry, "story_id", None) for entry in entries]
+            element_ids = [getattr(entry, "element_id", None) for entry in entries]
+            joint_names = [getattr(entry, "unique_name", None) for entry in entries]
+        if not matrices:
+            return None
+
+        if kind == JOINT:
+            locations = joint_names
+        else:
+            stories = self._names(StoryRepository, story_ids)
+            locations = [stories.get(story_id, f"Story {story_id}") for story_id in story_ids]
+        element_names = None
+        if kind == ELEMENT:
+            elements = self._names(ElementRepository, element_ids)
+            element_names = [
+                elements.get(element_id, f"Element {element_id}") for element_id in element_ids
+            ]
+
+        config = get_config(result_type) if kind != ELEMENT else display_config(result_type)
+        demands = row_demands(
+            result_type,
+            matrices,
+            locations,
+            element_names=element_names,
+            multiplier=config.multiplier,
+            transformer=get_transformer(result_type) if kind == GLOBAL else None,
+        )
+        logger.debug(
+            f"Loaded {len(demands)} {result_type} demand rows (result set {result_set_id})"
+        )
+        self._demands[key] = demands
+        return demands
+
+    def _names(self, repository, ids: Iterable[int]) -> Dict[int, str]:
+        with self._session_scope() as session:
+            return repository(session).get_names(ids)
+
+    def _attach_result_set_names(self, rows: List[AcceptanceRow]) -> None:
+        if not rows:
+            return
+        names = self._names(ResultSetRepository, (row.result_set_id for row in rows))
+        for row in rows:
+            row.result_set = names.get(row.result_set_id, f"Result Set {row.result_set_id}")
+
+
+__all__ = [
+    "AcceptanceResult",
+    "AcceptanceRow",
+    "AcceptanceService",
+]
@@ -23,11 +23,10 @@
 from __future__ import annotations
 
 import logging
-from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional, TYPE_CHECKING
 
-from sqlalchemy.orm import Session
+from database.session import ResultSetSessionFactory, ResultSetSessionScope, SessionFactory
 
 if TYPE_CHECKING:
     from database.models import (
@@ -40,6 +39,8 @@
         ResultSet,
         Story,
     )
+    from database.time_series_store import TimeSeriesRecord
+    from processing.response_spectrum import ResponseSpectrumSet
 
 logger = logging.getLogger(__name__)
 
@@ -189,31 +190,25 @@ def from_model(cls, model: "Project") -> "ProjectInfo":
 # Data Access Service
 # =============================================================================
 
-class DataAccessService:
+class DataAccessService(ResultSetSessionScope):
     """Facade for all data access operations used by GUI layer.
     
     This service provides a clean interface to the data layer, preventing
     direct repository access from GUI code. All operations use short-lived
-    sessions for thread safety.
+    sessions for thread safety (see ``ResultSetSessionScope``).
     
     Args:
         session_factory: Callable that returns a new SQLAlchemy session
+        result_set_session_factory: Optional per-result-set session factory
     """
     
-    def __init__(self, session_factory: Callable[[], Session]):
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        result_set_session_factory: Optional[ResultSetSessionFactory] = None,
+    ):
         self._session_factory = session_factory
-    
-    @contextmanager
-    def _session_scope(self):
-        """Provide a transactional scope around a series of operations.
-        
-        Automatically closes the session when done.
-        """
-        session = self._session_factory()
-        try:
-            yield session
-        finally:
-            session.close()
+        self._result_set_session_factory = result_set_session_factory
     
     # =========================================================================
     # Result Sets
@@ -557,9 +552,19 @@ def get_time_series_load_cases(
         """
         from processing.time_history_importer import TimeSeriesRepository
         
-        with self._session_scope() as session:
-            repo = TimeSeriesRepository(session)
-            return repo.get_available_load_cases_by_result_set(project_id, result_set_ids)
+        if self._result_set_session_factory is None:
+            with self._session_scope() as session:
+                repo = TimeSeriesRepository(session)
+                return repo.get_available_load_cases_by_result_set(project_id, result_set_ids)
+
+        load_cases: Dict[int, List[str]] = {}
+        for result_set_id in result_set_ids:
+            with self._session_scope(result_set_id) as session:
+                repo = TimeSeriesRepository(session)
+                load_cases.update(
+                    repo.get_available_load_cases_by_result_set(project_id, [result_set_id])
+                )
+        return load_cases
 
     def get_time_series_entries(
         self,
@@ -572,7 +577,7 @@ def get_time_series_entries(
         """Get raw time series entries for plotting (short-lived session)."""
         from processing.time_history_importer import TimeSeriesRepository
 
-        with self._session_scope() as session:
+        with self._session_scope(result_set_id) as session:
             repo = TimeSeriesRepository(session)
             return repo.get_time_series(
                 project_id=project_id,
@@ -581,7 +586,111 @@ def get_time_series_entries(
                 result_type=result_type,
                 direction=direction,
             )
-    
+
+    def get_time_series_record(
+        self,
+        project_id: int,
+        result_set_id: int,
+        load_case_name: str,
+        result_type: str,
+        direction: str,
+    ) -> Optional["TimeSeriesRecord"]:
+        """Get all stories of one time series as a stories x steps matrix.
+
+        Reads the memory-mapped binary store next to the project database and
+        falls back to the cache rows (writing the store record for next time).
+        The record carries per-story envelopes and a min/max LOD pyramid.
+
+        Returns:
+            TimeSeriesRecord, or None when there is no data
+        """
+        from database.time_series_store import TimeSeriesStore, stack_series, summarize
+        from processing.time_history_importer import TimeSeriesRepository
+
+        with self._session_scope(result_set_id) as session:
+            store = TimeSeriesStore.for_session(session)
+            key = (result_set_id, load_case_name, result_type, direction)
+            if store is not None:
+                record = store.read(*key)
+                if record is not None:
+                    return record
+
+            entries = TimeSeriesRepository(session).get_time_series(
+                project_id=project_id,
+                result_set_id=result_set_id,
+                load_case_name=load_case_name,
+                result_type=result_type,
+                direction=direction,
+            )
+            record = stack_series(
+                [entry.story_id for entry in entries],
+                [entry.time_steps for entry in entries],
+                [entry.values for entry in entries],
+            )
+            if record is None:
+                return None
+            record = summarize(record)
+            if store is not None:
+                try:
+                    store.write(*key, record)
+                except OSError as exc:
+                    logger.warning(f"Could not write time series store record: {exc}")
+            return record
+
+    def get_response_spectra(
+        self,
+        project_id: int,
+        result_set_id: int,
+        direction: str,
+    ) -> List["ResponseSpectrumSet"]:
+        """Get the cached base acceleration response spectra of a result set.
+
+        Read-only: records without cached spectra are left out (see
+        ``compute_response_spectra``).
+
+        Returns:
+            One ResponseSpectrumSet per damping ratio, ascending
+        """
+        from processing.response_spectrum import ResponseSpectrumRepository
+
+        with self._session_scope(result_set_id) as session:
+            return ResponseSpectrumRepository(session).get_spectra(result_set_id, direction)
+
+    def get_missing_response_spectra(
+        self,
+        project_id: int,
+        result_set_id: int,
+        direction: str,
+    ) -> List[str]:
+        """Load cases with base accelerations but no cached spectra."""
+        from processing.response_spectrum import ResponseSpectrumBatch
+
+        with self._session_scope(result_set_id) as session:
+            return ResponseSpectrumBatch(session, project_id, result_set_id).missing_load_cases(
+                direction
+            )
+
+    def compute_response_spectra(
+        self,
+        project_id: int,
+        result_set_id: int,
+        direction: str,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    ) -> int:
+        """Compute and cache the spectra of records that have none (in worker processes).
+
+        Long-running; call it off the GUI thread.
+
+        Returns:
+            Number of spectra written
+        """
+        from processing.response_spectrum import ResponseSpectrumBatch
+
+        with self._session_scope(result_set_id) as session:
+            return ResponseSpectrumBatch(
+                session, project_id, result_set_id, progress_callback=progress_callback
+            ).compute(directions=(direction,), only_missing=True)
+
     # =========================================================================
     # Projects (Catalog)
     # =========================================================================
@@ -607,6 +716,25 @@ def check_project_name_exists(self, name: str) -> bool:
     # Cache Type Discovery (for export dialogs, comparison dialogs, etc.)
     # =========================================================================
 
+    def _distinct_cache_types(self, model, result_set_ids: List[int]) -> List[str]:
+        """Distinct ``result_type`` values of a cache model across result sets."""
+        if self._result_set_session_factory is None:
+            groups = [list(result_set_ids)]
+        else:
+            groups = [[result_set_id] for result_set_id in result_set_ids]
+
+        result_types: List[str] = []
+        for ids in groups:
+            with self._session_scope(ids[0] if len(ids) == 1 else None) as session:
+                types = (
+                    session.query(model.result_type)
+                    .filter(model.result_set_id.in_(ids))
+                    .distinct()
+                    .all()
+                )
+            result_types.extend(t[0] for t in types if t[0] not in result_types)
+        return result_types
+
     def get_available_global_types(self, result_set_ids: List[int]) -> List[str]:
         """Get distinct global result types available in the cache.
 
@@ -618,14 +746,7 @@ def get_available_global_types(self, result_set_ids: List[int]) -> List[str]:
         """
         from database.models import GlobalResultsCache
 
-        with self._session_scope() as session:
-            types = (
-                session.query(GlobalResultsCache.result_type)
-                .filter(GlobalResultsCache.result_set_id.in_(result_set_ids))
-                .distinct()
-                .all()
-            )
-            return [t[0] for t in types]
+        return self._distinct_cache_types(GlobalResultsCache, result_set_ids)
 
     def get_available_element_types(self, result_set_ids: List[int]) -> List[str]:
         """Get distinct element result types available in the cache.
@@ -638,14 +759,7 @@ def get_available_element_types(self, result_set_ids: List[int]) -> List[str]:
         """
         from database.models import ElementResultsCache
 
-        with self._session_scope() as session:
-            types = (
-                session.query(ElementResultsCache.result_type)
-                .filter(ElementResultsCache.result_set_id.in_(result_set_ids))
-                .distinct()
-                .all()
-            )
-            return [t[0] for t in types]
+        return self._distinct_cache_types(ElementResultsCache, result_set_ids)
 
     def get_available_joint_types(self, result_set_ids: List[int]) -> List[str]:
         """Get distinct joint result types available in the cache.
@@ -658,14 +772,7 @@ def get_available_joint_types(self, result_set_ids: List[int]) -> List[str]:
         """
         from database.models import JointResultsCache
 
-        with self._session_scope() as session:
-            types = (
-                session.query(JointResultsCache.result_type)
-                .filter(JointResultsCache.result_set_id.in_(result_set_ids))
-                .distinct()
-                .all()
-            )
-            return [t[0] for t in types]
+        return self._distinct_cache_types(JointResultsCache, result_set_ids)
 
     def has_time_series(self, result_set_id: int) -> bool:
         """Check if a result set has time series data.
@@ -678,7 +785,7 @@ def has_time_series(self, result_set_id: int) -> bool:
         """
         from database.models import TimeSeriesGlobalCache
 
-        with self._session_scope() as session:
+        with self._session_scope(result_set_id) as session:
             exists = (
                 session.query(TimeSeriesGlobalCache.id)
                 .filter(TimeSeriesGlobalCache.result_set_id == result_set_id)
@@ -749,7 +856,7 @@ def get_global_cache_with_matrix(
         """
         from database.models import GlobalResultsCache
 
-        with self._session_scope() as session:
+        with self._session_scope(result_set_id) as session:
             results = (
                 session.query(
                     GlobalResultsCache.result_type,
@@ -774,7 +881,7 @@ def get_available_element_types_for_result_set(
         """
         from database.models import ElementResultsCache
 
-        with self._session_scope() as session:
+        with self._session_scope(result_set_id) as session:
             types = (
                 session.query(ElementResultsCache.result_type)
                 .filter(ElementResultsCache.result_set_id == result_set_id)
@@ -797,7 +904,7 @@ def get_available_joint_types_for_result_set(
         """
         from database.models import JointResultsCache
 
-        with self._session_scope() as session:
+        with self._session_scope(result_set_id) as session:
             types = (
                 session.query(JointResultsCache.result_type)
                 .filter(JointResultsCache.result_set_id == result_set_id)
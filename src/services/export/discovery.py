@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pandas as pd
 from sqlalchemy.orm import Session
 from types import SimpleNamespace
 from database.repositories import ProjectRepository, ResultSetRepository
+from database.session import ResultSetSessionFactory, ResultSetSessionScope
 from database.models import GlobalResultsCache, ElementResultsCache, JointResultsCache, PushoverCase
 
 
-class ExportDiscovery:
+class ExportDiscovery(ResultSetSessionScope):
     """Discovers available result types and builds DataFrames for export."""
 
-    def __init__(self, session_factory, context):
+    def __init__(
+        self,
+        session_factory,
+        context,
+        result_set_session_factory: Optional[ResultSetSessionFactory] = None,
+    ):
         self._session_factory = session_factory
+        self._result_set_session_factory = result_set_session_factory
         self.context = context
 
     def discover_and_write(
@@ -35,7 +42,7 @@ def discover_and_write(
 
         result_sheets: Dict[str, List[str]] = {"global": [], "element": []}
 
-        with self.context.session() as session:
+        with self._session_scope(result_set_id) as session:
             self._export_global_tables(session, writer, result_set_id, result_sheets, progress_callback)
             self._export_element_tables(session, writer, result_set_id, result_sheets, progress_callback)
 
@@ -112,8 +119,9 @@ def _export_element_tables(
         result_sheets: Dict[str, List[str]],
         progress_callback,
     ) -> None:
+        from sqlalchemy import select
+        from database.analytics import open_analytics
         from database.models import ElementResultsCache, Element, Story, ResultSet
-        from database.repositories import ElementCacheRepository
 
         # Check if this is a Pushover result set
         result_set = session.query(ResultSet).filter(ResultSet.id == result_set_id).first()
@@ -126,39 +134,38 @@ def _export_element_tables(
             ElementResultsCache.result_set_id == result_set_id
         ).distinct().all()
 
-        element_cache_repo = ElementCacheRepository(session)
+        # All cache entries of the result set in one query, in source Excel order
+        statement = (
+            select(
+                ElementResultsCache.result_type,
+                Element.name.label("Element"),
+                Story.name.label("Story"),
+                ElementResultsCache.results_matrix,
+            )
+            .join(Element, ElementResultsCache.element_id == Element.id)
+            .join(Story, ElementResultsCache.story_id == Story.id)
+            .where(
+                ElementResultsCache.result_set_id == result_set_id,
+                ElementResultsCache.result_type.notlike("BeamRotations%"),
+            )
+            .order_by(ElementResultsCache.id)
+        )
+        with open_analytics(session) as analytics:
+            entries = analytics.frame(statement)
+        entries_by_type = dict(tuple(entries.groupby("result_type", sort=False)))
 
         for result_type, in element_types:
             # Skip BeamRotations - already exported above
             if result_type.startswith("BeamRotations"):
                 continue
 
-            # Query all cache entries for this result type
-            # Order by cache entry id to preserve source Excel order
-            entries = session.query(
-                ElementResultsCache, Element, Story
-            ).join(
-                Element, ElementResultsCache.element_id == Element.id
-            ).join(
-                Story, ElementResultsCache.story_id == Story.id
-            ).filter(
-                ElementResultsCache.result_set_id == result_set_id,
-                ElementResultsCache.result_type == result_type
-            ).order_by(
-                ElementResultsCache.id
-            ).all()
-
-            if not entries:
+            type_entries = entries_by_type.get(result_type)
+            if type_entries is None:
                 continue
 
-            rows = []
-            for cache_entry, element, story in entries:
-                row = {"Element": element.name, "Story": story.name}
-                if cache_entry.results_matrix:
-                    row.update(cache_entry.results_matrix)
-                rows.append(row)
-
-            df = pd.DataFrame(rows)
+            df = pd.DataFrame([matrix or {} for matrix in type_entries["results_matrix"]])
+            df.insert(0, "Element", type_entries["Element"].tolist())
+            df.insert(1, "Story", type_entries["Story"].tolist())
 
             # Add summary columns (Average, Maximum, Minimum) - only for NLTHA, not Pushover
             if not df.empty and not is_pushover:
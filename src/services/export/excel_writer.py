@@ -124,5 +124,7 @@ def _write_result_data_sheets(
             return {"global": [], "element": []}
 
         result_set = result_sets[0]
-        discovery = ExportDiscovery(self.context.session, self.context)
+        discovery = ExportDiscovery(
+            self.context.session, self.context, self.context.result_set_session_factory
+        )
         return discovery.discover_and_write(writer, result_set.id, result_sets, progress_callback)
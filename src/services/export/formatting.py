@@ -9,7 +9,7 @@
 
 
 def apply_excel_formatting(file_path: Path) -> None:
-    """Apply formatting to Excel workbook (bold headers, hide IMPORT_DATA sheet)."""
+    """Apply formatting to Excel workbook (bold headers, hide the import sheets)."""
     wb = load_workbook(file_path)
 
     if "README" in wb.sheetnames:
@@ -18,7 +18,8 @@ def apply_excel_formatting(file_path: Path) -> None:
             for cell in row:
                 cell.font = Font(bold=True, size=14)
 
-    if "IMPORT_DATA" in wb.sheetnames:
-        wb["IMPORT_DATA"].sheet_state = "hidden"
+    for sheet_name in ("IMPORT_MANIFEST", "IMPORT_DATA"):
+        if sheet_name in wb.sheetnames:
+            wb[sheet_name].sheet_state = "hidden"
 
     wb.save(file_path)
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import json
+from contextlib import ExitStack
 from datetime import datetime
-from typing import Dict
+from typing import Callable, Dict, List
 
 import pandas as pd
-
+from sqlalchemy.orm import Session
+
+from database.shards import list_shards
+from services.import_manifest import (
+    MANIFEST_COLUMN,
+    MANIFEST_SHEET,
+    PAYLOAD_COLUMN,
+    PAYLOAD_SHEET,
+    build_manifest,
+    chunk_json,
+)
 from .serialization import (
     serialize_absolute_maxmin_drifts,
     serialize_element_cache,
@@ -21,15 +32,20 @@
 )
 
 class ImportDataBuilder:
-    """Builds the IMPORT_DATA sheet with normalized and cache data dumps."""
+    """Builds the IMPORT_DATA sheet with normalized and cache data dumps, plus its manifest."""
 
     def __init__(self, context, app_version: str) -> None:
         self.context = context
         self.app_version = app_version
 
     def write_import_data_sheet(self, writer, metadata: dict, result_sheets: dict) -> None:
-        """Write IMPORT_DATA sheet with complete database dump."""
-        with self.context.session() as session:
+        """Write IMPORT_MANIFEST and the IMPORT_DATA sheet with complete database dump."""
+        with ExitStack() as stack:
+            sessions = [stack.enter_context(self.context.session())]
+            # Sharded result sets keep their result and cache rows in their shard
+            for result_set_id in list_shards(self.context.db_path):
+                factory = self.context.result_set_session_factory(result_set_id)
+                sessions.append(stack.enter_context(factory()))
             import_data = {
                 "version": self.app_version,
                 "export_timestamp": datetime.now().isoformat(),
@@ -72,25 +88,37 @@ def write_import_data_sheet(self, writer, metadata: dict, result_sheets: dict) -
                 ],
                 "result_sheet_mapping": result_sheets,
                 "normalized_data": {
-                    "story_drifts": self._serialize_story_drifts(session),
-                    "story_accelerations": self._serialize_story_accelerations(session),
-                    "story_forces": self._serialize_story_forces(session),
-                    "story_displacements": self._serialize_story_displacements(session),
-                    "absolute_maxmin_drifts": self._serialize_absolute_maxmin_drifts(session),
-                    "quad_rotations": self._serialize_quad_rotations(session),
-                    "wall_shears": self._serialize_wall_shears(session),
+                    "story_drifts": self._collect(sessions, self._serialize_story_drifts),
+                    "story_accelerations": self._collect(sessions, self._serialize_story_accelerations),
+                    "story_forces": self._collect(sessions, self._serialize_story_forces),
+                    "story_displacements": self._collect(sessions, self._serialize_story_displacements),
+                    "absolute_maxmin_drifts": self._collect(sessions, self._serialize_absolute_maxmin_drifts),
+                    "quad_rotations": self._collect(sessions, self._serialize_quad_rotations),
+                    "wall_shears": self._collect(sessions, self._serialize_wall_shears),
                 },
                 "cache_data": {
-                    "global_results_cache": self._serialize_global_cache(session),
-                    "element_results_cache": self._serialize_element_cache(session),
+                    "global_results_cache": self._collect(sessions, self._serialize_global_cache),
+                    "element_results_cache": self._collect(sessions, self._serialize_element_cache),
                 },
             }
 
             json_str = json.dumps(import_data, separators=(",", ":"))
-            chunk_size = 30000
-            chunks = [json_str[i : i + chunk_size] for i in range(0, len(json_str), chunk_size)]
-            df = pd.DataFrame(chunks, columns=["import_metadata"])
-            df.to_excel(writer, sheet_name="IMPORT_DATA", index=False)
+
+            # Manifest first: its strings precede the payload's in the shared string table
+            manifest_str = json.dumps(build_manifest(import_data, json_str), separators=(",", ":"))
+            pd.DataFrame(chunk_json(manifest_str), columns=[MANIFEST_COLUMN]).to_excel(
+                writer, sheet_name=MANIFEST_SHEET, index=False
+            )
+            df = pd.DataFrame(chunk_json(json_str), columns=[PAYLOAD_COLUMN])
+            df.to_excel(writer, sheet_name=PAYLOAD_SHEET, index=False)
+
+    @staticmethod
+    def _collect(sessions: List[Session], serialize: Callable[[Session], list]) -> list:
+        """Rows of one serializer across the project database and its shards."""
+        rows: list = []
+        for session in sessions:
+            rows.extend(serialize(session))
+        return rows
 
     def _serialize_story_drifts(self, session) -> list:
         return serialize_story_drifts(session)
@@ -162,8 +162,8 @@ def get_available_result_types(self, result_set_id: int) -> list[str]:
         """
         available = []
 
-        # Use context.session() to create session (correct pattern)
-        with self.context.session() as session:
+        # Sharded result sets keep their cache rows in their shard
+        with self.context.result_set_session_factory(result_set_id)() as session:
             # Query GlobalResultsCache for available types
             global_types = session.query(GlobalResultsCache.result_type).filter(
                 GlobalResultsCache.result_set_id == result_set_id
@@ -201,7 +201,7 @@ def get_element_export_dataframe(self, result_type: str, result_set_id: int, is_
             return self._get_beam_rotations_wide_dataframe(result_set_id, is_pushover)
 
         # Get all elements with data for this result type
-        with self.context.session() as session:
+        with self.context.result_set_session_factory(result_set_id)() as session:
             element_cache_repo = ElementCacheRepository(session)
 
             # Query all cache entries for this result type
@@ -255,7 +255,7 @@ def _get_beam_rotations_wide_dataframe(self, result_set_id: int, is_pushover: bo
         from sqlalchemy import text
         from database.models import BeamRotation, Element, Story, LoadCase, ResultCategory
 
-        with self.context.session() as session:
+        with self.context.result_set_session_factory(result_set_id)() as session:
             # Check if step_type column exists (for backward compatibility with old DBs)
             try:
                 has_step_type = True
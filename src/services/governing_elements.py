@@ -0,0 +1,306 @@
+"""Governing elements: top-N and threshold queries over element results.
+
+Answers "which walls, columns or hinges govern" for an element cache result
+type (e.g. 'WallShears_V2', 'QuadRotations') across result sets: the N
+elements with the largest |Avg| or Max, or every element whose peak reaches a
+limit. Queries read ``ElementPeak`` rows, written with the element caches
+(see ``processing.cache_summary.element_peaks``), through their
+(result_set_id, result_type, value) indexes, so each result set costs one
+index range scan however many elements it holds.
+
+Result sets cached before peaks existed, or whose element cache rows were
+rewritten after their peaks, get them (re)built from the cache rows on the
+next query.
+
+Usage:
+    service = GoverningElementsService(project_id, session_factory)
+    top = service.top_elements("WallShears_V2", [1, 2], metric="abs_avg", count=10)
+    print(top.to_frame())
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from config.result_config import RESULT_CONFIGS, ResultTypeConfig, get_config
+from database.repositories import (
+    ElementCacheRepository,
+    ElementPeakRepository,
+    ElementRepository,
+    ResultSetRepository,
+    StoryRepository,
+)
+from database.session import ResultSetSessionFactory, ResultSetSessionScope, SessionFactory
+from processing.cache_summary import element_peaks
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GoverningMetric:
+    """Per-element peak that elements are ranked and filtered by."""
+
+    key: str
+    label: str
+    column: str  # ElementPeak value column
+    largest: bool  # Governing values are the largest (else the smallest)
+
+
+GOVERNING_METRICS: Dict[str, GoverningMetric] = {
+    metric.key: metric
+    for metric in (
+        GoverningMetric("abs_avg", "|Avg|", "abs_avg", True),
+        GoverningMetric("abs_max", "|Peak|", "abs_max", True),
+        GoverningMetric("max", "Max", "max_value", True),
+        GoverningMetric("min", "Min", "min_value", False),
+    )
+}
+
+
+@dataclass
+class GoverningRow:
+    """Peak of one element in one result set, in display units."""
+
+    result_set_id: int
+    element_id: int
+    story_id: int
+    value: float
+    result_set: str = ""
+    element: str = ""
+    story: str = ""
+
+
+@dataclass
+class GoverningResult:
+    """Answer of a governing-element query."""
+
+    result_type: str
+    metric: str
+    unit: str
+    rows: List[GoverningRow] = field(default_factory=list)
+    total: int = 0  # Exceedances: matching rows before ``max_rows``
+    built_result_sets: List[int] = field(default_factory=list)  # Peaks built by this query
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per (result set, element) with the metric value."""
+        value_column = f"{GOVERNING_METRICS[self.metric].label} [{self.unit}]"
+        records = [
+            {
+                "Result Set": row.result_set,
+                "Element": row.element,
+                "Story": row.story,
+                value_column: row.value,
+            }
+            for row in self.rows
+        ]
+        return pd.DataFrame(records, columns=["Result Set", "Element", "Story", value_column])
+
+
+def resolve_metric(metric: str) -> GoverningMetric:
+    """Validate a metric key.
+
+    Raises:
+        ValueError: For unknown metric keys
+    """
+    if metric not in GOVERNING_METRICS:
+        raise ValueError(
+            f"Unknown metric: {metric}. Available: {', '.join(GOVERNING_METRICS)}"
+        )
+    return GOVERNING_METRICS[metric]
+
+
+def display_config(result_type: str) -> ResultTypeConfig:
+    """Display config of an element cache result type (e.g. 'QuadRotations_Pier')."""
+    if result_type in RESULT_CONFIGS:
+        return RESULT_CONFIGS[result_type]
+    return get_config(result_type.split("_", 1)[0])
+
+
+class GoverningElementsService(ResultSetSessionScope):
+    """Top-N and threshold queries over per-element peaks of a project.
+
+    Args:
+        project_id: Project ID
+        session_factory: Callable returning a new project database session
+        result_set_session_factory: Optional per-result-set session factory
+    """
+
+    def __init__(
+        self,
+        project_id: int,
+        session_factory: SessionFactory,
+        result_set_session_factory: Optional[ResultSetSessionFactory] = None,
+    ) -> None:
+        self.project_id = project_id
+        self._session_factory = session_factory
+        self._result_set_session_factory = result_set_session_factory
+
+    def result_types(self, result_set_ids: Sequence[int]) -> List[str]:
+        """Element cache result types present in any of the result sets."""
+        result_types = set()
+        for result_set_id in result_set_ids:
+            with self._session_scope(result_set_id) as session:
+                result_types.update(ElementCacheRepository(session).get_result_types(result_set_id))
+        return sorted(result_types)
+
+    def top_elements(
+        self,
+        result_type: str,
+        result_set_ids: Sequence[int],
+        metric: str = "abs_avg",
+        count: int = 10,
+    ) -> GoverningResult:
+        """The ``count`` elements with the governing peaks across result sets.
+
+        Each element is listed once, with the result set it governs in.
+        """
+        governing = resolve_metric(metric)
+        result = self._new_result(result_type, metric)
+        candidates: List[GoverningRow] = []
+        for result_set_id in result_set_ids:
+            with self._session_scope(result_set_id) as session:
+                if self._ensure_peaks(session, result_set_id, result_type):
+                    result.built_result_sets.append(result_set_id)
+                # An element in the overall top N is in the top N of the set it governs in
+                rows = ElementPeakRepository(session).get_ranked(
+                    result_set_id,
+                    result_type,
+                    governing.column,
+                    largest=governing.largest,
+                    limit=count,
+                )
+            candidates.extend(self._rows(result_set_id, rows, result_type))
+
+        best: Dict[int, GoverningRow] = {}
+        for row in self._ordered(candidates, governing):
+            best.setdefault(row.element_id, row)
+        result.rows = list(best.values())[:count]
+        result.total = len(result.rows)
+        self._attach_names(result.rows)
+        return result
+
+    def exceedances(
+        self,
+        result_type: str,
+        result_set_ids: Sequence[int],
+        limit: float,
+        metric: str = "abs_max",
+        max_rows: Optional[int] = None,
+    ) -> GoverningResult:
+        """Every (result set, element) whose peak reaches ``limit``.
+
+        Args:
+            result_type: Element cache result type
+            result_set_ids: Result sets to search
+            limit: Limit in display units (e.g. percent for rotations); minima
+                exceed it from below
+            metric: Peak compared with the limit
+            max_rows: Optional cap on returned rows (``total`` counts all)
+        """
+        governing = resolve_metric(metric)
+        result = self._new_result(result_type, metric)
+        threshold = limit / display_config(result_type).multiplier
+        rows: List[GoverningRow] = []
+        for result_set_id in result_set_ids:
+            with self._session_scope(result_set_id) as session:
+                if self._ensure_peaks(session, result_set_id, result_type):
+                    result.built_result_sets.append(result_set_id)
+                repo = ElementPeakRepository(session)
+                result.total += repo.count_exceeding(
+                    result_set_id,
+                    result_type,
+                    governing.column,
+                    threshold,
+                    largest=governing.largest,
+                )
+                ranked = repo.get_ranked(
+                    result_set_id,
+                    result_type,
+                    governing.column,
+                    largest=governing.largest,
+                    limit=max_rows,
+                    threshold=threshold,
+                )
+            rows.extend(self._rows(result_set_id, ranked, result_type))
+
+        result.rows = self._ordered(rows, governing)[:max_rows]
+        self._attach_names(result.rows)
+        return result
+
+    def _new_result(self, result_type: str, metric: str) -> GoverningResult:
+        return GoverningResult(
+            result_type=result_type, metric=metric, unit=display_config(result_type).unit
+        )
+
+    def _ensure_peaks(self, session: Session, result_set_id: int, result_type: str) -> bool:
+        """(Re)build peaks when missing or older than the element cache; True if built."""
+        peak_repo = ElementPeakRepository(session)
+        if peak_repo.has_current_peaks(result_set_id, result_type):
+            return False
+        entries = ElementCacheRepository(session).get_cache_for_result_type(
+            project_id=self.project_id,
+            result_type=result_type,
+            result_set_id=result_set_id,
+        )
+        if not entries:
+            return False
+        peaks = element_peaks(
+            {
+                "element_id": entry.element_id,
+                "story_id": entry.story_id,
+                "results_matrix": entry.results_matrix,
+            }
+            for entry in entries
+        )
+        peak_repo.replace_peaks(self.project_id, result_set_id, result_type, peaks)
+        logger.info(f"Built {len(peaks)} element peaks for {result_type} (result set {result_set_id})")
+        return True
+
+    @staticmethod
+    def _rows(result_set_id: int, ranked: List[tuple], result_type: str) -> List[GoverningRow]:
+        multiplier = display_config(result_type).multiplier
+        return [
+            GoverningRow(
+                result_set_id=result_set_id,
+                element_id=element_id,
+                story_id=story_id,
+                value=value * multiplier,
+            )
+            for element_id, value, story_id in ranked
+        ]
+
+    @staticmethod
+    def _ordered(rows: List[GoverningRow], governing: GoverningMetric) -> List[GoverningRow]:
+        return sorted(
+            rows,
+            key=lambda row: (-row.value if governing.largest else row.value, row.element_id),
+        )
+
+    def _attach_names(self, rows: List[GoverningRow]) -> None:
+        """Fill result set, element and story names from the project database."""
+        if not rows:
+            return
+        with self._session_scope() as session:
+            result_sets = ResultSetRepository(session).get_names(row.result_set_id for row in rows)
+            elements = ElementRepository(session).get_names(row.element_id for row in rows)
+            stories = StoryRepository(session).get_names(row.story_id for row in rows)
+        for row in rows:
+            row.result_set = result_sets.get(row.result_set_id, f"Result Set {row.result_set_id}")
+            row.element = elements.get(row.element_id, f"Element {row.element_id}")
+            row.story = stories.get(row.story_id, f"Story {row.story_id}")
+
+
+__all__ = [
+    "GOVERNING_METRICS",
+    "GoverningMetric",
+    "GoverningRow",
+    "GoverningResult",
+    "GoverningElementsService",
+    "display_config",
+    "resolve_metric",
+]
@@ -0,0 +1,135 @@
+"""Manifest and payload access for the hidden import sheets of a project export.
+
+An export stores the complete project database as chunked JSON in the hidden
+IMPORT_DATA sheet. IMPORT_MANIFEST is a small companion sheet written before
+it, with the project info, row counts, sheet mapping and a checksum of the
+payload, so the import preview can read it without decoding the payload.
+
+Workbooks exported before the manifest existed have no IMPORT_MANIFEST sheet;
+readers fall back to the payload for those.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pandas as pd
+
+from processing.xlsx_row_stream import XlsxRowStream
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_SHEET = "IMPORT_MANIFEST"
+MANIFEST_COLUMN = "import_manifest"
+PAYLOAD_SHEET = "IMPORT_DATA"
+PAYLOAD_COLUMN = "import_metadata"
+MANIFEST_VERSION = 1
+CHUNK_SIZE = 30000  # Characters per cell (Excel's cell limit is 32,767)
+
+# Top-level payload lists counted in the manifest
+_COUNTED_LISTS = ("result_sets", "result_categories", "load_cases", "stories", "elements")
+
+
+def chunk_json(json_str: str) -> List[str]:
+    """Split a JSON string into cell-sized chunks."""
+    return [json_str[i : i + CHUNK_SIZE] for i in range(0, len(json_str), CHUNK_SIZE)]
+
+
+def build_manifest(import_data: dict, payload: str) -> dict:
+    """Summarize an IMPORT_DATA payload for the manifest sheet.
+
+    Args:
+        import_data: The payload dict
+        payload: Its serialized JSON, exactly as written to IMPORT_DATA
+    """
+    counts = {name: len(import_data.get(name, [])) for name in _COUNTED_LISTS}
+    for section in ("normalized_data", "cache_data"):
+        for table, rows in import_data.get(section, {}).items():
+            counts[table] = len(rows)
+
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "version": import_data.get("version"),
+        "export_timestamp": import_data.get("export_timestamp"),
+        "project": import_data.get("project", {}),
+        "counts": counts,
+        "result_sheet_mapping": import_data.get("result_sheet_mapping", {}),
+        "payload": {
+            "sheet": PAYLOAD_SHEET,
+            "chunks": len(chunk_json(payload)),
+            "length": len(payload),
+            "sha256": hashlib.sha256(payload.encode("utf-8")).hexdigest(),
+        },
+    }
+
+
+def read_manifest(excel_path: Path) -> Optional[dict]:
+    """Read the IMPORT_MANIFEST sheet, or return None if the workbook has none."""
+    excel_path = Path(excel_path)
+    if XlsxRowStream.supports(excel_path):
+        with XlsxRowStream(excel_path) as stream:
+            if MANIFEST_SHEET not in stream.sheet_names:
+                return None
+            return json.loads("".join(_cells(stream, MANIFEST_SHEET)))
+
+    xl_file = pd.ExcelFile(excel_path)
+    if MANIFEST_SHEET not in xl_file.sheet_names:
+        return None
+    df = xl_file.parse(MANIFEST_SHEET)
+    return json.loads("".join(str(chunk) for chunk in df[MANIFEST_COLUMN] if pd.notna(chunk)))
+
+
+def read_payload(excel_path: Path, manifest: Optional[dict] = None) -> dict:
+    """Stream the IMPORT_DATA chunks and parse the payload once.
+
+    When a manifest is given, the payload length and checksum are verified
+    before parsing.
+
+    Raises:
+        ValueError: The payload does not match the manifest checksum
+    """
+    excel_path = Path(excel_path)
+    if XlsxRowStream.supports(excel_path):
+        with XlsxRowStream(excel_path) as stream:
+            json_str = "".join(_cells(stream, PAYLOAD_SHEET))
+    else:
+        df = pd.read_excel(excel_path, sheet_name=PAYLOAD_SHEET)
+        json_str = "".join(str(chunk) for chunk in df[PAYLOAD_COLUMN] if pd.notna(chunk))
+
+    expected = (manifest or {}).get("payload")
+    if expected:
+        digest = hashlib.sha256(json_str.encode("utf-8")).hexdigest()
+        if len(json_str) != expected.get("length") or digest != expected.get("sha256"):
+            raise ValueError(
+                f"{PAYLOAD_SHEET} in {excel_path.name} does not match its manifest checksum; "
+                "the workbook may have been modified after export."
+            )
+
+    return json.loads(json_str)
+
+
+def result_sheets_from(import_data: dict) -> List[str]:
+    """Global and element result sheet names from a manifest or payload."""
+    mapping = import_data.get("result_sheet_mapping", {})
+    return mapping.get("global", []) + mapping.get("element", [])
+
+
+def _cells(stream: XlsxRowStream, sheet_name: str) -> Iterator[str]:
+    """Non-empty first-column cells below the header row, as text."""
+    for (chunk,) in stream.iter_rows(sheet_name, columns=[0], required=[0], min_row=2):
+        yield str(chunk)
+
+
+__all__ = [
+    "MANIFEST_SHEET",
+    "PAYLOAD_SHEET",
+    "build_manifest",
+    "chunk_json",
+    "read_manifest",
+    "read_payload",
+    "result_sheets_from",
+]
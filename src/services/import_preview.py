@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 
 import pandas as pd
 
+from processing.xlsx_row_stream import XlsxRowStream
+from services.import_manifest import read_manifest, read_payload, result_sheets_from
 from services.import_models import ImportPreview
 
 logger = logging.getLogger(__name__)
@@ -17,38 +18,37 @@ def preview_import(excel_path: Path) -> ImportPreview:
     """Preview Excel file before importing.
 
     Validates file structure and returns summary without creating project.
+    Reads only the IMPORT_MANIFEST sheet; workbooks exported without one fall
+    back to parsing the full IMPORT_DATA payload.
     """
     warnings = []
     can_import = True
 
     try:
-        # Read IMPORT_DATA sheet (may be split across multiple rows)
-        import_data_df = pd.read_excel(excel_path, sheet_name="IMPORT_DATA")
+        manifest = read_manifest(excel_path)
+        if manifest is not None:
+            summary = manifest
+            counts = manifest.get("counts", {})
+        else:
+            summary = read_payload(excel_path)
+            counts = {name: len(summary.get(name, [])) for name in ("result_sets", "load_cases", "stories", "elements")}
 
-        # Concatenate all rows to reassemble the JSON
-        json_chunks = import_data_df["import_metadata"].tolist()
-        json_str = "".join(str(chunk) for chunk in json_chunks if pd.notna(chunk))
-
-        import_metadata = json.loads(json_str)
-
-        project_info = import_metadata.get("project", {})
-        result_sheets = import_metadata.get("result_sheet_mapping", {})
-
-        logger.debug("Preview result_sheet_mapping: %s", result_sheets)
+        project_info = summary.get("project", {})
+        logger.debug("Preview result_sheet_mapping: %s", summary.get("result_sheet_mapping", {}))
 
         # Validate required sheets exist
-        xl_file = pd.ExcelFile(excel_path)
-        logger.debug("Preview Excel sheets: %s", xl_file.sheet_names)
+        sheet_names = _sheet_names(excel_path)
+        logger.debug("Preview Excel sheets: %s", sheet_names)
         required_sheets = ["README", "Result Sets", "Load Cases", "Stories", "IMPORT_DATA"]
-        missing_sheets = [s for s in required_sheets if s not in xl_file.sheet_names]
+        missing_sheets = [s for s in required_sheets if s not in sheet_names]
 
         if missing_sheets:
             warnings.append(f"Missing required sheets: {', '.join(missing_sheets)}")
             can_import = False
 
         # Validate result data sheets exist
-        all_result_types = result_sheets.get("global", []) + result_sheets.get("element", [])
-        missing_data = [rt for rt in all_result_types if rt[:31] not in xl_file.sheet_names]
+        all_result_types = result_sheets_from(summary)
+        missing_data = [rt for rt in all_result_types if rt[:31] not in sheet_names]
 
         if missing_data:
             warnings.append(f"Missing result data sheets: {', '.join(missing_data)}")
@@ -57,11 +57,11 @@ def preview_import(excel_path: Path) -> ImportPreview:
             project_name=project_info.get("name", "Unknown"),
             description=project_info.get("description", ""),
             created_at=project_info.get("created_at", ""),
-            exported_at=import_metadata.get("export_timestamp", ""),
-            result_sets_count=len(import_metadata.get("result_sets", [])),
-            load_cases_count=len(import_metadata.get("load_cases", [])),
-            stories_count=len(import_metadata.get("stories", [])),
-            elements_count=len(import_metadata.get("elements", [])),
+            exported_at=summary.get("export_timestamp", ""),
+            result_sets_count=counts.get("result_sets", 0),
+            load_cases_count=counts.get("load_cases", 0),
+            stories_count=counts.get("stories", 0),
+            elements_count=counts.get("elements", 0),
             result_types=all_result_types,
             warnings=warnings,
             can_import=can_import,
@@ -84,4 +84,12 @@ def preview_import(excel_path: Path) -> ImportPreview:
         )
 
 
+def _sheet_names(excel_path: Path) -> list:
+    """Worksheet names, read from the workbook index when possible."""
+    if XlsxRowStream.supports(excel_path):
+        with XlsxRowStream(excel_path) as stream:
+            return stream.sheet_names
+    return pd.ExcelFile(excel_path).sheet_names
+
+
 __all__ = ["preview_import"]
@@ -1,12 +1,12 @@
 """Import service for RPS projects."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Callable, Optional
 
 import pandas as pd
 
+from services.import_manifest import read_manifest, read_payload
 from services.import_models import ImportPreview, ImportProjectExcelOptions
 from services.import_database_json import (
     import_database_from_json as import_database_from_json_payload,
@@ -59,13 +59,8 @@ def import_project_excel(
         if progress_callback:
             progress_callback("Reading import metadata...", 1, total_steps)
 
-        import_data_df = pd.read_excel(options.excel_path, sheet_name="IMPORT_DATA")
-
-        # Concatenate all rows to reassemble the JSON (may be chunked)
-        json_chunks = import_data_df['import_metadata'].tolist()
-        json_str = ''.join(str(chunk) for chunk in json_chunks if pd.notna(chunk))
-
-        import_metadata = json.loads(json_str)
+        # Stream the chunked payload and parse it once, checked against the manifest
+        import_metadata = read_payload(options.excel_path, read_manifest(options.excel_path))
 
         project_info = import_metadata.get('project', {})
         project_name = options.new_project_name or project_info.get('name')
@@ -0,0 +1,432 @@
+"""Portfolio queries: peak results of every result set across all catalogued projects.
+
+Answers questions such as "peak drift and max quad rotation for every
+project/result set" without opening each project. Each project database (and
+its per-result-set shards, see ``database.shards``) is opened read-only in a
+spawned worker process and queried with SQLite's ``json_each`` over the cache
+tables, so only one number per result set and metric leaves the worker.
+
+Per-project answers are cached in a JSON file keyed by the database files'
+modification times; unchanged projects are answered from the cache.
+
+Usage:
+    result = PortfolioService().query(["peak_drift", "max_quad_rotation"])
+    print(result.to_frame())
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+from database.session import DATA_DIR
+from database.shards import list_shards, shard_dir, shard_path
+from utils.parallel import spawn_process_pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = DATA_DIR / "portfolio_cache.json"
+CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class PortfolioMetric:
+    """Peak absolute value of one result family in a cache table."""
+
+    key: str
+    label: str
+    table: str
+    result_type: str  # exact name, or a LIKE pattern when it contains '%'
+
+
+PORTFOLIO_METRICS: Dict[str, PortfolioMetric] = {
+    metric.key: metric
+    for metric in (
+        PortfolioMetric("peak_drift", "Peak Drift", "global_results_cache", "Drifts"),
+        PortfolioMetric(
+            "peak_acceleration", "Peak Acceleration", "global_results_cache", "Accelerations"
+        ),
+        PortfolioMetric("peak_story_force", "Peak Story Shear", "global_results_cache", "Forces"),
+        # NLTHA imports cache quad rotations as "QuadRotations_Pier"
+        PortfolioMetric(
+            "max_quad_rotation", "Max Quad Rotation", "element_results_cache", "QuadRotations%"
+        ),
+        PortfolioMetric(
+            "max_column_rotation",
+            "Max Column Rotation",
+            "element_results_cache",
+            "ColumnRotations_%",
+        ),
+        PortfolioMetric(
+            "max_beam_rotation", "Max Beam Rotation", "element_results_cache", "BeamRotations_%"
+        ),
+        PortfolioMetric(
+            "max_wall_shear", "Max Wall Shear", "element_results_cache", "WallShears_%"
+        ),
+    )
+}
+
+DEFAULT_METRICS = ("peak_drift", "max_quad_rotation")
+
+
+@dataclass
+class PortfolioRow:
+    """Metric values of one result set."""
+
+    project: str
+    result_set: str
+    analysis_type: str
+    values: Dict[str, Optional[float]] = field(default_factory=dict)
+
+
+@dataclass
+class ProjectAnswer:
+    """Rows of one project, as computed by a worker or read from the cache."""
+
+    project: str
+    rows: List[PortfolioRow] = field(default_factory=list)
+    error: Optional[str] = None
+    cached: bool = False
+
+
+@dataclass
+class PortfolioResult:
+    """Aggregated answer across projects."""
+
+    metrics: Tuple[str, ...]
+    rows: List[PortfolioRow]
+    errors: Dict[str, str]
+    cached_projects: int = 0
+    queried_projects: int = 0
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per result set with one column per metric label."""
+        labels = [PORTFOLIO_METRICS[key].label for key in self.metrics]
+        records = [
+            {
+                "Project": row.project,
+                "Result Set": row.result_set,
+                "Type": row.analysis_type,
+                **{label: row.values.get(key) for key, label in zip(self.metrics, labels)},
+            }
+            for row in self.rows
+        ]
+        return pd.DataFrame(records, columns=["Project", "Result Set", "Type", *labels])
+
+
+def resolve_metrics(metrics: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    """Validate metric keys; defaults to DEFAULT_METRICS.
+
+    Raises:
+        ValueError: For unknown metric keys
+    """
+    keys = tuple(dict.fromkeys(metrics or DEFAULT_METRICS))
+    unknown = [key for key in keys if key not in PORTFOLIO_METRICS]
+    if unknown:
+        raise ValueError(
+            f"Unknown metric(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(PORTFOLIO_METRICS)}"
+        )
+    return keys
+
+
+def database_signature(db_path: Path) -> List[List[int]]:
+    """Modification time and size of a project database and its shards."""
+    paths = [db_path]
+    directory = shard_dir(db_path)
+    if directory.is_dir():
+        paths.extend(sorted(directory.glob("rs*.db")))
+    signature = []
+    for path in paths:
+        stat = path.stat()
+        signature.append([stat.st_mtime_ns, stat.st_size])
+    return signature
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+
+def _read_only_engine(path: Path):
+    """Engine on read-only SQLite connections to one database file."""
+
+    def _connect():
+        return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+    return create_engine("sqlite://", creator=_connect, poolclass=NullPool)
+
+
+def _peak_values(connection, metric: PortfolioMetric) -> Dict[int, float]:
+    operator = "LIKE" if "%" in metric.result_type else "="
+    statement = (
+        f"SELECT c.result_set_id, MAX(ABS(j.value)) "
+        f"FROM {metric.table} AS c, json_each(c.results_matrix) AS j "
+        f"WHERE c.result_type {operator} ? AND j.type IN ('integer', 'real') "
+        f"GROUP BY c.result_set_id"
+    )
+    try:
+        rows = connection.exec_driver_sql(statement, (metric.result_type,)).all()
+    except Exception as exc:
+        # Databases from before a cache table existed simply have no values
+        if "no such table" in str(exc):
+            return {}
+        raise
+    return {result_set_id: value for result_set_id, value in rows if result_set_id is not None}
+
+
+def query_project(project: str, db_path: str, metrics: Sequence[str]) -> ProjectAnswer:
+    """Compute metric values for every result set of one project (read-only)."""
+    path = Path(db_path)
+    if not path.exists():
+        return ProjectAnswer(project=project, error=f"Database not found: {path}")
+
+    try:
+        engine = _read_only_engine(path)
+        try:
+            with engine.connect() as connection:
+                result_sets = connection.exec_driver_sql(
+                    "SELECT id, name, analysis_type FROM result_sets ORDER BY id"
+                ).all()
+                peaks = {key: _peak_values(connection, PORTFOLIO_METRICS[key]) for key in metrics}
+        finally:
+            engine.dispose()
+
+        for result_set_id in list_shards(path):
+            engine = _read_only_engine(shard_path(path, result_set_id))
+            try:
+                with engine.connect() as connection:
+                    for key in metrics:
+                        for rs_id, value in _peak_values(
+                            connection, PORTFOLIO_METRICS[key]
+                        ).items():
+                            peaks[key][rs_id] = max(value, peaks[key].get(rs_id, value))
+            finally:
+                engine.dispose()
+    except Exception as exc:
+        logger.exception("Portfolio query failed for %s", project)
+        return ProjectAnswer(project=project, error=str(exc) or type(exc).__name__)
+
+    rows = [
+        PortfolioRow(
+            project=project,
+            result_set=name,
+            analysis_type=analysis_type or "NLTHA",
+            values={key: peaks[key].get(result_set_id) for key in metrics},
+        )
+        for result_set_id, name, analysis_type in result_sets
+    ]
+    return ProjectAnswer(project=project, rows=rows)
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class PortfolioCache:
+    """Per-project answers in a JSON file, keyed by database path and signature."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("projects", {})
+
+    def get(
+        self, project: str, db_path: Path, signature: list, metrics: Sequence[str]
+    ) -> Optional[ProjectAnswer]:
+        entry = self._entries.get(str(db_path))
+        if not entry or entry["signature"] != signature or entry["project"] != project:
+            return None
+        if any(key not in entry["metrics"] for key in metrics):
+            return None
+        rows = [
+            PortfolioRow(
+                project=project,
+                result_set=row["result_set"],
+                analysis_type=row["analysis_type"],
+                values={key: row["values"].get(key) for key in metrics},
+            )
+            for row in entry["rows"]
+        ]
+        return ProjectAnswer(project=project, rows=rows, cached=True)
+
+    def put(self, db_path: Path, signature: list, answer: ProjectAnswer, metrics: Sequence[str]):
+        with self._lock:
+            entry = self._entries.get(str(db_path))
+            if entry and entry["signature"] == signature and entry["project"] == answer.project:
+                # Same database state: merge new metrics into the cached rows
+                previous = {row["result_set"]: row["values"] for row in entry["rows"]}
+                cached_metrics = set(entry["metrics"]) | set(metrics)
+            else:
+                previous, cached_metrics = {}, set(metrics)
+            self._entries[str(db_path)] = {
+                "project": answer.project,
+                "signature": signature,
+                "metrics": sorted(cached_metrics),
+                "rows": [
+                    {
+                        "result_set": row.result_set,
+                        "analysis_type": row.analysis_type,
+                        "values": {**previous.get(row.result_set, {}), **row.values},
+                    }
+                    for row in answer.rows
+                ],
+            }
+
+    def save(self) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"version": CACHE_VERSION, "projects": self._entries}
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+
+class PortfolioService:
+    """Fan out portfolio queries over project databases and aggregate the answers.
+
+    Args:
+        projects: Callable returning ``(project name, db path)`` pairs; defaults
+            to every project in the catalog
+        cache_path: JSON cache file; None disables caching
+        max_workers: Worker processes (default: CPU count, 1 queries in-process)
+    """
+
+    def __init__(
+        self,
+        projects: Optional[Callable[[], Sequence[Tuple[str, Path]]]] = None,
+        cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+        max_workers: Optional[int] = None,
+    ):
+        self._projects = projects or _catalog_projects
+        self._cache = PortfolioCache(cache_path) if cache_path is not None else None
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def query(
+        self,
+        metrics: Optional[Sequence[str]] = None,
+        refresh: bool = False,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    ) -> PortfolioResult:
+        """Metric values for every result set of every project.
+
+        Args:
+            metrics: Metric keys from PORTFOLIO_METRICS (default: DEFAULT_METRICS)
+            refresh: Ignore cached answers
+            progress_callback: Called with (project, done, total) as projects finish
+        """
+        keys = resolve_metrics(metrics)
+        projects = list(self._projects())
+        answers: List[Optional[ProjectAnswer]] = [None] * len(projects)
+        signatures: Dict[int, list] = {}
+        pending: List[int] = []
+        done = 0
+
+        def _finish(index: int, answer: ProjectAnswer) -> None:
+            nonlocal done
+            answers[index] = answer
+            done += 1
+            if progress_callback:
+                progress_callback(answer.project, done, len(projects))
+
+        for index, (name, db_path) in enumerate(projects):
+            db_path = Path(db_path)
+            if self._cache is not None and db_path.exists():
+                signatures[index] = database_signature(db_path)
+                cached = (
+                    None if refresh else self._cache.get(name, db_path, signatures[index], keys)
+                )
+                if cached is not None:
+                    _finish(index, cached)
+                    continue
+            pending.append(index)
+
+        for index, answer in self._run(projects, pending, keys):
+            _finish(index, answer)
+            if self._cache is not None and answer.error is None and index in signatures:
+                self._cache.put(Path(projects[index][1]), signatures[index], answer, keys)
+
+        if self._cache is not None and pending:
+            self._cache.save()
+
+        rows = [row for answer in answers for row in answer.rows]
+        errors = {answer.project: answer.error for answer in answers if answer.error}
+        return PortfolioResult(
+            metrics=keys,
+            rows=rows,
+            errors=errors,
+            cached_projects=sum(1 for answer in answers if answer.cached),
+            queried_projects=len(pending),
+        )
+
+    def _run(self, projects, pending: List[int], keys: Tuple[str, ...]):
+        """Yield (index, answer) for the pending projects, in worker processes when allowed."""
+        if self.max_workers <= 1 or len(pending) <= 1:
+            for index in pending:
+                name, db_path = projects[index]
+                yield index, query_project(name, str(db_path), keys)
+            return
+
+        with spawn_process_pool(min(self.max_workers, len(pending))) as executor:
+            futures = {
+                executor.submit(
+                    query_project, projects[index][0], str(projects[index][1]), keys
+                ): index
+                for index in pending
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    answer = future.result()
+                except Exception as exc:  # Worker process died
+                    answer = ProjectAnswer(
+                        project=projects[index][0], error=str(exc) or type(exc).__name__
+                    )
+                yield index, answer
+
+
+def _catalog_projects() -> List[Tuple[str, Path]]:
+    from services.project_service import list_project_contexts
+
+    return [(context.name, context.db_path) for context in list_project_contexts()]
+
+
+__all__ = [
+    "PortfolioMetric",
+    "PORTFOLIO_METRICS",
+    "DEFAULT_METRICS",
+    "PortfolioRow",
+    "ProjectAnswer",
+    "PortfolioResult",
+    "PortfolioCache",
+    "PortfolioService",
+    "database_signature",
+    "query_project",
+    "resolve_metrics",
+]
@@ -46,7 +46,9 @@ class ProjectRuntime:
     data_service: Optional[DataAccessService] = None
 
     def dispose(self) -> None:
-        """Dispose of the underlying SQLAlchemy session."""
+        """Dispose of the underlying SQLAlchemy sessions."""
+        if self.result_service:
+            self.result_service.close()
         if self.session:
             self.session.close()
             self.session = None
@@ -83,10 +85,11 @@ def build_project_runtime(context: ProjectContext) -> ProjectRuntime:
         element_repo=repos.element,
         joint_cache_repo=repos.joint_cache,
         session=session,
+        result_set_session_factory=context.result_set_session_factory,
     )
 
     # DataAccessService for thread-safe operations (worker threads, etc.)
-    data_service = DataAccessService(context.session)
+    data_service = DataAccessService(context.session, context.result_set_session_factory)
 
     return ProjectRuntime(
         context=context,
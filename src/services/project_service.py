@@ -16,6 +16,7 @@
     init_catalog_db,
     get_catalog_session,
     project_session_factory,
+    result_set_session_factory,
     CATALOG_DB_PATH,
     PROJECTS_DIR,
     dispose_project_engine,
@@ -45,6 +46,9 @@ def session(self):
     def session_factory(self):
         return project_session_factory(self.db_path)
 
+    def result_set_session_factory(self, result_set_id: int):
+        return result_set_session_factory(self.db_path, result_set_id)
+
 
 @dataclass
 class ProjectSummary:
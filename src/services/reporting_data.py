@@ -2,25 +2,21 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import Callable, Optional
+from typing import Optional
 
-from sqlalchemy.orm import Session
+from database.session import ResultSetSessionFactory, ResultSetSessionScope, SessionFactory
 
 
-class ReportingDataService:
+class ReportingDataService(ResultSetSessionScope):
     """Provide report-focused data retrieval using short-lived sessions."""
 
-    def __init__(self, session_factory: Callable[[], Session]):
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        result_set_session_factory: Optional[ResultSetSessionFactory] = None,
+    ):
         self._session_factory = session_factory
-
-    @contextmanager
-    def _session_scope(self):
-        session = self._session_factory()
-        try:
-            yield session
-        finally:
-            session.close()
+        self._result_set_session_factory = result_set_session_factory
 
     def get_beam_rotation_data(
         self,
@@ -33,7 +29,7 @@ def get_beam_rotation_data(
         from sqlalchemy import or_
         from database.models import BeamRotation, LoadCase, Story, Element, ResultCategory
 
-        with self._session_scope() as session:
+        with self._session_scope(result_set_id) as session:
             base_query = (
                 session.query(BeamRotation, LoadCase, Story, Element)
                 .join(LoadCase, BeamRotation.load_case_id == LoadCase.id)
@@ -150,7 +146,7 @@ def get_column_rotation_data(
         from sqlalchemy import or_
         from database.models import ColumnRotation, LoadCase, Story, Element, ResultCategory
 
-        with self._session_scope() as session:
+        with self._session_scope(result_set_id) as session:
             base_query = (
                 session.query(ColumnRotation, LoadCase, Story, Element)
                 .join(LoadCase, ColumnRotation.load_case_id == LoadCase.id)
@@ -282,97 +278,83 @@ def _get_generic_element_data(
         multiplier: float = 1.0,
     ) -> Optional[dict]:
         import pandas as pd
-        from sqlalchemy import or_
+        from sqlalchemy import and_, case, func, literal, or_, select
+        from database.analytics import open_analytics
         from database.models import LoadCase, Story, Element, ResultCategory
 
-        with self._session_scope() as session:
-            base_query = (
-                session.query(model_cls, LoadCase, Story, Element)
-                .join(LoadCase, getattr(model_cls, "load_case_id") == LoadCase.id)
-                .join(Story, getattr(model_cls, "story_id") == Story.id)
-                .join(Element, getattr(model_cls, "element_id") == Element.id)
+        value = getattr(model_cls, value_field)
+        max_value = getattr(model_cls, max_field)
+        min_value = getattr(model_cls, min_field)
+        # Table value: the larger magnitude of max/min, else whichever exists
+        table_value = case(
+            (
+                and_(max_value.isnot(None), min_value.isnot(None)),
+                case((func.abs(max_value) >= func.abs(min_value), max_value), else_=min_value),
+            ),
+            (max_value.isnot(None), max_value),
+            (min_value.isnot(None), min_value),
+            else_=value,
+        )
+        direction = (
+            func.coalesce(getattr(model_cls, dir_field), "") if dir_field else literal("")
+        )
+        statement = (
+            select(
+                Story.name.label("Story"),
+                func.coalesce(Story.sort_order, 0).label("StoryOrder"),
+                Element.name.label(element_label),
+                direction.label("Dir"),
+                LoadCase.name.label("load_case"),
+                (value * multiplier).label("value"),
+                (max_value * multiplier).label("max_value"),
+                (min_value * multiplier).label("min_value"),
+                (table_value * multiplier).label("table_value"),
+            )
+            .select_from(model_cls)
+            .join(LoadCase, getattr(model_cls, "load_case_id") == LoadCase.id)
+            .join(Story, getattr(model_cls, "story_id") == Story.id)
+            .join(Element, getattr(model_cls, "element_id") == Element.id)
+            .order_by(Story.sort_order, Element.name, LoadCase.name)
+        )
+        category_join = getattr(model_cls, "result_category_id") == ResultCategory.id
+        if analysis_context == "Pushover":
+            statement = statement.outerjoin(ResultCategory, category_join).where(
+                Story.project_id == project_id,
+                or_(
+                    ResultCategory.result_set_id == result_set_id,
+                    ResultCategory.result_set_id.is_(None),
+                ),
+            )
+        else:
+            statement = statement.join(ResultCategory, category_join).where(
+                Story.project_id == project_id,
+                ResultCategory.result_set_id == result_set_id,
             )
 
-            if analysis_context == "Pushover":
-                records = (
-                    base_query
-                    .outerjoin(ResultCategory, getattr(model_cls, "result_category_id") == ResultCategory.id)
-                    .filter(
-                        Story.project_id == project_id,
-                        or_(
-                            ResultCategory.result_set_id == result_set_id,
-                            ResultCategory.result_set_id.is_(None),
-                        ),
-                    )
-                    .order_by(Story.sort_order, Element.name, LoadCase.name)
-                    .all()
-                )
-            else:
-                records = (
-                    base_query
-                    .join(ResultCategory, getattr(model_cls, "result_category_id") == ResultCategory.id)
-                    .filter(
-                        Story.project_id == project_id,
-                        ResultCategory.result_set_id == result_set_id,
-                    )
-                    .order_by(Story.sort_order, Element.name, LoadCase.name)
-                    .all()
+        with self._session_scope(result_set_id) as session:
+            with open_analytics(session) as analytics:
+                records = analytics.frame(statement)
+                if records.empty:
+                    return None
+                df = analytics.pivot(
+                    records, ["Story", "StoryOrder", element_label, "Dir"], "load_case", "table_value"
                 )
 
-        if not records:
-            return None
-
-        load_cases = sorted({lc.name for _, lc, _, _ in records})
-        data_dict = {}
-        plot_data_max = []
-        plot_data_min = []
-
-        for record_tuple in records:
-            record_obj, load_case, story, element = record_tuple
-            val = getattr(record_obj, value_field, None)
-            max_val = getattr(record_obj, max_field, None)
-            min_val = getattr(record_obj, min_field, None)
-
-            if max_val is not None:
-                max_v = max_val * multiplier
-                plot_data_max.append((story.name, story.sort_order or 0, max_v))
-            if min_val is not None:
-                min_v = min_val * multiplier
-                plot_data_min.append((story.name, story.sort_order or 0, min_v))
-            
-            if max_val is None and min_val is None and val is not None:
-                v = val * multiplier
-                plot_data_max.append((story.name, story.sort_order or 0, v))
-                plot_data_min.append((story.name, story.sort_order or 0, v))
+        for column in ("value", "max_value", "min_value", "table_value"):
+            records[column] = pd.to_numeric(records[column])
+        # A record plots its max (min), or its value when it has neither max nor min
+        max_values, min_values = records["max_value"], records["min_value"]
+        plot_max = max_values.where(max_values.notna(), records["value"].where(min_values.isna()))
+        plot_min = min_values.where(min_values.notna(), records["value"].where(max_values.isna()))
+        stories = records["Story"].tolist()
+        orders = records["StoryOrder"].astype(int).tolist()
+        plot_data_max = [
+            (stories[i], orders[i], v) for i, v in enumerate(plot_max.tolist()) if pd.notna(v)
+        ]
+        plot_data_min = [
+            (stories[i], orders[i], v) for i, v in enumerate(plot_min.tolist()) if pd.notna(v)
+        ]
 
-            table_value = None
-            if max_val is not None and min_val is not None:
-                if abs(max_val) >= abs(min_val):
-                    table_value = max_val * multiplier
-                else:
-                    table_value = min_val * multiplier
-            elif max_val is not None:
-                table_value = max_val * multiplier
-            elif min_val is not None:
-                table_value = min_val * multiplier
-            elif val is not None:
-                table_value = val * multiplier
-
-            direction_val = getattr(record_obj, dir_field, "") if dir_field else ""
-            key = (story.name, element.name, direction_val)
-            
-            entry = data_dict.setdefault(
-                key,
-                {
-                    "Story": story.name,
-                    "StoryOrder": story.sort_order or 0,
-                    element_label: element.name,
-                    "Dir": direction_val,
-                },
-            )
-            entry[load_case.name] = table_value
-
-        df = pd.DataFrame(list(data_dict.values()))
         if df.empty:
             return None
 
@@ -1,6 +1,13 @@
 """Result data service facade and supporting components."""
 
-from .models import ResultDataset, MaxMinDataset, ResultDatasetMeta, ComparisonDataset, ComparisonSeries
+from .models import (
+    ResultDataset,
+    MaxMinDataset,
+    ResultDatasetMeta,
+    ComparisonDataset,
+    ComparisonSeries,
+    DatasetSummary,
+)
 from .service import ResultDataService
 
 __all__ = [
@@ -10,4 +17,5 @@
     "ResultDatasetMeta",
     "ComparisonDataset",
     "ComparisonSeries",
+    "DatasetSummary",
 ]
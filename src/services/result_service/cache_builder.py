@@ -5,10 +5,11 @@
 import pandas as pd
 
 from config.result_config import get_config
+from processing.cache_summary import stored_statistics
 from processing.result_transformers import get_transformer
 
 from .metadata import build_display_label
-from .models import ResultDataset, ResultDatasetMeta
+from .models import DatasetSummary, ResultDataset, ResultDatasetMeta
 from .story_loader import StoryProvider
 
 SUMMARY_COLUMNS = ("Avg", "Max", "Min")
@@ -16,6 +17,26 @@
 PUSHOVER_MAX_SUMMARY_TYPES = {"Drifts", "Forces", "Displacements"}
 
 
+def scale_summary(summary, multiplier: float = 1.0) -> DatasetSummary:
+    """DatasetSummary from a stored CacheSummary, converted to display units."""
+
+    def scale(value):
+        return None if value is None else value * multiplier
+
+    column_max = {col: scale(value) for col, value in (summary.column_max or {}).items()}
+    column_min = {col: scale(value) for col, value in (summary.column_min or {}).items()}
+    min_value, max_value = scale(summary.min_value), scale(summary.max_value)
+    if multiplier < 0:
+        column_max, column_min = column_min, column_max
+        min_value, max_value = max_value, min_value
+    return DatasetSummary(
+        column_max=column_max,
+        column_min=column_min,
+        min_value=min_value,
+        max_value=max_value,
+    )
+
+
 def build_standard_dataset(
     project_id: int,
     result_type: str,
@@ -24,7 +45,13 @@ def build_standard_dataset(
     cache_entries: Iterable[object],
     story_provider: StoryProvider,
     is_pushover: bool = False,
+    summary: Optional[object] = None,
 ) -> Optional[ResultDataset]:
+    """Story-by-load-case dataset of a global result type.
+
+    ``summary`` is the CacheSummary stored for the result type and direction;
+    its row statistics replace the Avg/Max/Min computation when it is current.
+    """
     cache_entries = list(cache_entries)
     if not cache_entries:
         return None
@@ -54,11 +81,16 @@ def entry_sort_key(entry):
         result_dicts.append(cache_entry.results_matrix or {})
 
     raw_df = pd.DataFrame(result_dicts)
+    statistics = stored_statistics(
+        summary, [str(entry.story_id) for entry in ordered_entries], ordered_entries
+    )
 
     transformer_key = f"{result_type}_{direction}" if direction else result_type
     transformer = get_transformer(transformer_key)
     # Skip summary columns for Pushover analysis
-    transformed_df = transformer.transform(raw_df, skip_summary=is_pushover)
+    transformed_df = transformer.transform(
+        raw_df, skip_summary=is_pushover, statistics=statistics
+    )
 
     numeric_df = transformed_df.apply(pd.to_numeric, errors="coerce")
 
@@ -100,6 +132,7 @@ def entry_sort_key(entry):
         config=config,
         load_case_columns=sorted_load_case_cols,
         summary_columns=summary_columns,
+        summary=scale_summary(summary, config.multiplier) if statistics is not None else None,
     )
 
 
@@ -112,7 +145,13 @@ def build_element_dataset(
     cache_entries: Iterable[object],
     story_provider: StoryProvider,
     is_pushover: bool = False,
+    summary: Optional[object] = None,
 ) -> Optional[ResultDataset]:
+    """Story-by-load-case dataset of one element.
+
+    ``summary`` is the CacheSummary stored for the element and cache result
+    type; its row statistics replace the Avg/Max/Min computation when current.
+    """
     cache_entries = list(cache_entries)
     if not cache_entries:
         return None
@@ -143,13 +182,20 @@ def entry_sort_key(entry):
 
     raw_df = pd.DataFrame(result_dicts)
     numeric_df = raw_df.apply(pd.to_numeric, errors="coerce")
+    statistics = stored_statistics(
+        summary, [str(entry.story_id) for entry in ordered_entries], ordered_entries
+    )
 
     # Add summary columns only for NLTHA, not Pushover
     summary_columns: List[str] = []
     if not is_pushover:
-        numeric_df["Avg"] = numeric_df.mean(axis=1)
-        numeric_df["Max"] = numeric_df.max(axis=1)
-        numeric_df["Min"] = numeric_df.min(axis=1)
+        if statistics is not None:
+            for column in SUMMARY_COLUMNS:
+                numeric_df[column] = statistics[column].to_numpy()
+        else:
+            numeric_df["Avg"] = numeric_df.mean(axis=1)
+            numeric_df["Max"] = numeric_df.max(axis=1)
+            numeric_df["Min"] = numeric_df.min(axis=1)
         summary_columns = [col for col in SUMMARY_COLUMNS if col in numeric_df.columns]
 
     transformer_key = f"{result_type}_{direction}" if direction else result_type
@@ -187,4 +233,6 @@ def entry_sort_key(entry):
         config=config,
         load_case_columns=sorted_load_case_cols,
         summary_columns=summary_columns,
+        summary=scale_summary(summary, config.multiplier) if statistics is not None else None,
     )
+
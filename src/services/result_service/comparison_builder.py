@@ -13,6 +13,25 @@
 from config.result_config import format_result_type_with_unit
 
 
+def _metric_values(data: pd.DataFrame, metric: str) -> List[tuple]:
+    """(story, value) pairs of a dataset's metric column, skipping missing values."""
+    if metric not in data.columns:
+        return []
+    present = data[["Story", metric]].dropna(subset=[metric])
+    return list(zip(present["Story"].tolist(), present[metric].astype(float).tolist()))
+
+
+def _merge_series(
+    keys: List[str], key_column: str, series_list: List[ComparisonSeries], suffix: str
+) -> pd.DataFrame:
+    """One row per key and one column per series; missing values are None (shown as "—")."""
+    df = pd.DataFrame({key_column: keys})
+    for series in series_list:
+        values = series.values if series.has_data else {}
+        df[f"{series.result_set_name}{suffix}"] = pd.Series([values.get(key) for key in keys])
+    return df
+
+
 def build_global_comparison(
     result_type: str,
     direction: Optional[str],
@@ -80,16 +99,13 @@ def build_global_comparison(
 
             # Extract metric column
             values = {}
-            for idx, row in dataset.data.iterrows():
-                story = row['Story']
-                value = row.get(metric)
-                if pd.notna(value):
-                    values[story] = float(value)
-                    if story not in story_values:
-                        story_values[story] = {}
-                        if not all_stories or story != all_stories[-1]:
-                            all_stories.append(story)
-                    story_values[story][result_set_name] = float(value)
+            for story, value in _metric_values(dataset.data, metric):
+                values[story] = value
+                if story not in story_values:
+                    story_values[story] = {}
+                    if not all_stories or story != all_stories[-1]:
+                        all_stories.append(story)
+                story_values[story][result_set_name] = value
 
             series_list.append(ComparisonSeries(
                 result_set_id=result_set_id,
@@ -114,18 +130,7 @@ def build_global_comparison(
         # No data at all
         df = pd.DataFrame(columns=["Story"])
     else:
-        rows = []
-        for story in all_stories:
-            row = {"Story": story}
-            for series in series_list:
-                col_name = f"{series.result_set_name}_{metric}"
-                if series.has_data and story in series.values:
-                    row[col_name] = series.values[story]
-                else:
-                    row[col_name] = None  # Will display as "—"
-            rows.append(row)
-
-        df = pd.DataFrame(rows)
+        df = _merge_series(all_stories, "Story", series_list, f"_{metric}")
 
         # Add ratio column if we have at least 2 result sets with data
         series_with_data = [s for s in series_list if s.has_data]
@@ -230,16 +235,13 @@ def build_element_comparison(
 
             # Extract metric column
             values = {}
-            for idx, row in dataset.data.iterrows():
-                story = row['Story']
-                value = row.get(metric)
-                if pd.notna(value):
-                    values[story] = float(value)
-                    if story not in story_values:
-                        story_values[story] = {}
-                        if not all_stories or story != all_stories[-1]:
-                            all_stories.append(story)
-                    story_values[story][result_set_name] = float(value)
+            for story, value in _metric_values(dataset.data, metric):
+                values[story] = value
+                if story not in story_values:
+                    story_values[story] = {}
+                    if not all_stories or story != all_stories[-1]:
+                        all_stories.append(story)
+                story_values[story][result_set_name] = value
 
             series_list.append(ComparisonSeries(
                 result_set_id=result_set_id,
@@ -263,18 +265,7 @@ def build_element_comparison(
     if not all_stories:
         df = pd.DataFrame(columns=["Story"])
     else:
-        rows = []
-        for story in all_stories:
-            row = {"Story": story}
-            for series in series_list:
-                col_name = f"{series.result_set_name}_{metric}"
-                if series.has_data and story in series.values:
-                    row[col_name] = series.values[story]
-                else:
-                    row[col_name] = None
-            rows.append(row)
-
-        df = pd.DataFrame(rows)
+        df = _merge_series(all_stories, "Story", series_list, f"_{metric}")
 
         # Add ratio column if we have at least 2 result sets with data
         series_with_data = [s for s in series_list if s.has_data]
@@ -411,18 +402,7 @@ def build_joint_comparison(
         # No data at all
         df = pd.DataFrame(columns=["Load Case"])
     else:
-        rows = []
-        for load_case in all_load_cases:
-            row = {"Load Case": load_case}
-            for series in series_list:
-                col_name = f"{series.result_set_name}_Avg"
-                if series.has_data and load_case in series.values:
-                    row[col_name] = series.values[load_case]
-                else:
-                    row[col_name] = None  # Will display as "—"
-            rows.append(row)
-
-        df = pd.DataFrame(rows)
+        df = _merge_series(all_load_cases, "Load Case", series_list, "_Avg")
 
         # Add ratio column if we have at least 2 result sets with data
         series_with_data = [s for s in series_list if s.has_data]
@@ -18,6 +18,26 @@ class ResultDatasetMeta:
     display_name: str
 
 
+@dataclass
+class DatasetSummary:
+    """Stored extrema of a dataset's load case columns, in display units."""
+
+    column_max: Dict[str, Optional[float]]
+    column_min: Dict[str, Optional[float]]
+    min_value: Optional[float]
+    max_value: Optional[float]
+
+    def value_range(self, columns: List[str]) -> Optional[Tuple[float, float]]:
+        """Min/max across the given load case columns (None if any is unknown)."""
+        if any(col not in self.column_max for col in columns):
+            return None
+        lows = [self.column_min[col] for col in columns if self.column_min.get(col) is not None]
+        highs = [self.column_max[col] for col in columns if self.column_max[col] is not None]
+        if not lows or not highs:
+            return None
+        return min(lows), max(highs)
+
+
 @dataclass
 class ResultDataset:
     """Container for a transformed result dataset."""
@@ -27,6 +47,7 @@ class ResultDataset:
     config: ResultTypeConfig
     load_case_columns: List[str]
     summary_columns: List[str] = field(default_factory=list)
+    summary: Optional[DatasetSummary] = None  # Stored at cache-build time, if available
 
 
 @dataclass
@@ -2,6 +2,7 @@
 
 from collections import OrderedDict
 from enum import Enum
+from time import perf_counter
 from typing import Dict, List, Optional, Tuple, TypeVar
 import os
 import logging
@@ -9,7 +10,9 @@
 import pandas as pd
 
 from config.result_config import get_config
-from .cache_builder import build_element_dataset, build_standard_dataset
+from utils import metrics
+from processing.cache_summary import stored_statistics
+from .cache_builder import build_element_dataset, build_standard_dataset, scale_summary
 from .metadata import build_display_label
 from .models import ResultDataset, ResultDatasetMeta
 from .story_loader import StoryProvider
@@ -24,12 +27,27 @@
 V = TypeVar("V")
 
 
+def _record_cache_event(event: str, cache: str, **fields) -> None:
+    """Count a dataset cache hit/miss/store/evict; log it too under RPS_CACHE_DEBUG."""
+    metrics.increment(f"dataset_cache.{event}", cache=cache)
+    if CACHE_DEBUG:
+        logger.debug(f"cache_{event}.{cache}", extra=fields)
+
+
+def _dataset_bytes(value) -> int:
+    data = getattr(value, "data", None)
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(index=True, deep=False).sum())
+    return 0
+
+
 class LRUCache(OrderedDict[K, V]):
     """Simple LRU cache with configurable max size."""
 
-    def __init__(self, max_size: int = DEFAULT_MAX_CACHE_SIZE) -> None:
+    def __init__(self, max_size: int = DEFAULT_MAX_CACHE_SIZE, name: str = "dataset") -> None:
         super().__init__()
         self.max_size = max_size
+        self.name = name
 
     def get_item(self, key: K) -> Optional[V]:
         """Get item and move to end (most recently used)."""
@@ -45,9 +63,15 @@ def set_item(self, key: K, value: V) -> None:
         self[key] = value
         while len(self) > self.max_size:
             oldest_key = next(iter(self))
-            if CACHE_DEBUG:
-                logger.debug("cache_evict", extra={"key": str(oldest_key)})
+            _record_cache_event("evict", self.name, key=str(oldest_key))
             del self[oldest_key]
+        if metrics.is_enabled():
+            metrics.set_gauge("dataset_cache.entries", len(self), cache=self.name)
+            metrics.set_gauge(
+                "dataset_cache.bytes",
+                sum(_dataset_bytes(item) for item in self.values()),
+                cache=self.name,
+            )
 
 
 class ResultCategory(str, Enum):
@@ -67,12 +91,14 @@ def __init__(
         cache_repo,
         story_provider: StoryProvider,
         max_cache_size: int = DEFAULT_MAX_CACHE_SIZE,
+        summary_repo=None,
     ) -> None:
         self.project_id = project_id
         self.cache_repo = cache_repo
         self.story_provider = story_provider
+        self.summary_repo = summary_repo
         self._cache: LRUCache[Tuple[str, str, int, bool], Optional[ResultDataset]] = LRUCache(
-            max_cache_size
+            max_cache_size, name="standard"
         )
 
     def get(
@@ -80,17 +106,16 @@ def get(
     ) -> Optional[ResultDataset]:
         cache_key = (result_type, direction, result_set_id, is_pushover)
         if cache_key in self._cache:
-            if CACHE_DEBUG:
-                logger.debug(
-                    "cache_hit.standard",
-                    extra={
-                        "result_type": result_type,
-                        "direction": direction,
-                        "result_set_id": result_set_id,
-                    },
-                )
+            _record_cache_event(
+                "hit",
+                "standard",
+                result_type=result_type,
+                direction=direction,
+                result_set_id=result_set_id,
+            )
             return self._cache.get_item(cache_key)
 
+        start = perf_counter()
         cache_entries = self.cache_repo.get_cache_for_display(
             project_id=self.project_id,
             result_type=result_type,
@@ -98,15 +123,13 @@ def get(
         )
 
         if not cache_entries:
-            if CACHE_DEBUG:
-                logger.debug(
-                    "cache_miss.standard",
-                    extra={
-                        "result_type": result_type,
-                        "direction": direction,
-                        "result_set_id": result_set_id,
-                    },
-                )
+            _record_cache_event(
+                "miss",
+                "standard",
+                result_type=result_type,
+                direction=direction,
+                result_set_id=result_set_id,
+            )
             self._cache[cache_key] = None
             return None
 
@@ -118,17 +141,21 @@ def get(
             cache_entries=cache_entries,
             story_provider=self.story_provider,
             is_pushover=is_pushover,
+            summary=(
+                self.summary_repo.get_summary(result_set_id, "global", result_type, direction)
+                if self.summary_repo
+                else None
+            ),
         )
+        metrics.observe("dataset.build_seconds", perf_counter() - start, cache="standard")
 
-        if CACHE_DEBUG:
-            logger.debug(
-                "cache_store.standard",
-                extra={
-                    "result_type": result_type,
-                    "direction": direction,
-                    "result_set_id": result_set_id,
-                },
-            )
+        _record_cache_event(
+            "store",
+            "standard",
+            result_type=result_type,
+            direction=direction,
+            result_set_id=result_set_id,
+        )
         self._cache.set_item(cache_key, dataset)
         return dataset
 
@@ -158,12 +185,14 @@ def __init__(
         element_cache_repo,
         story_provider: StoryProvider,
         max_cache_size: int = DEFAULT_MAX_CACHE_SIZE,
+        summary_repo=None,
     ) -> None:
         self.project_id = project_id
         self.element_cache_repo = element_cache_repo
         self.story_provider = story_provider
+        self.summary_repo = summary_repo
         self._cache: LRUCache[Tuple[int, str, str, int, bool], Optional[ResultDataset]] = LRUCache(
-            max_cache_size
+            max_cache_size, name="element"
         )
 
     def get(
@@ -179,33 +208,20 @@ def get(
 
         cache_key = (element_id, result_type, direction, result_set_id, is_pushover)
         if cache_key in self._cache:
-            if CACHE_DEBUG:
-                logger.debug(
-                    "cache_hit.element",
-                    extra={
-                        "result_type": result_type,
-                        "direction": direction,
-                        "result_set_id": result_set_id,
-                        "element_id": element_id,
-                    },
-                )
+            _record_cache_event(
+                "hit",
+                "element",
+                result_type=result_type,
+                direction=direction,
+                result_set_id=result_set_id,
+                element_id=element_id,
+            )
             return self._cache.get_item(cache_key)
 
         # Resolve cache key (element cache stores more specific result_type names)
-        fallback_types = [f"{result_type}_{direction}" if direction else result_type]
-        if result_type == "QuadRotations":
-            fallback_types.append("QuadRotations_Pier")
-        if not direction:
-            if result_type == "BeamRotations":
-                fallback_types.append("BeamRotations_R3Plastic")
-            elif result_type == "ColumnRotations":
-                # Prefer R3 if not explicitly requested
-                fallback_types.extend(["ColumnRotations_R3", "ColumnRotations_R2"])
-            elif result_type == "ColumnAxials":
-                fallback_types.extend(["ColumnAxials_Min", "ColumnAxials_Max"])
-            elif result_type == "BraceAxials":
-                fallback_types.extend(["BraceAxials_Min", "BraceAxials_Max"])
+        fallback_types = self._fallback_types(result_type, direction)
 
+        start = perf_counter()
         cache_entries = None
         chosen_direction = direction
         for rt in fallback_types:
@@ -225,16 +241,14 @@ def get(
                 break
 
         if not cache_entries:
-            if CACHE_DEBUG:
-                logger.debug(
-                    "cache_miss.element",
-                    extra={
-                        "result_type": result_type,
-                        "direction": direction,
-                        "result_set_id": result_set_id,
-                        "element_id": element_id,
-                    },
-                )
+            _record_cache_event(
+                "miss",
+                "element",
+                result_type=result_type,
+                direction=direction,
+                result_set_id=result_set_id,
+                element_id=element_id,
+            )
             self._cache[cache_key] = None
             return None
 
@@ -247,21 +261,45 @@ def get(
             cache_entries=cache_entries,
             story_provider=self.story_provider,
             is_pushover=is_pushover,
+            summary=(
+                self.summary_repo.get_summary(
+                    result_set_id, "element", full_result_type, element_id=element_id
+                )
+                if self.summary_repo
+                else None
+            ),
         )
+        metrics.observe("dataset.build_seconds", perf_counter() - start, cache="element")
 
-        if CACHE_DEBUG:
-            logger.debug(
-                "cache_store.element",
-                extra={
-                    "result_type": result_type,
-                    "direction": direction,
-                    "result_set_id": result_set_id,
-                    "element_id": element_id,
-                },
-            )
+        _record_cache_event(
+            "store",
+            "element",
+            result_type=result_type,
+            direction=direction,
+            result_set_id=result_set_id,
+            element_id=element_id,
+        )
         self._cache.set_item(cache_key, dataset)
         return dataset
 
+    @staticmethod
+    def _fallback_types(result_type: str, direction: str) -> List[str]:
+        """Element cache types to try, most specific first."""
+        fallback_types = [f"{result_type}_{direction}" if direction else result_type]
+        if result_type == "QuadRotations":
+            fallback_types.append("QuadRotations_Pier")
+        if not direction:
+            if result_type == "BeamRotations":
+                fallback_types.append("BeamRotations_R3Plastic")
+            elif result_type == "ColumnRotations":
+                # Prefer R3 if not explicitly requested
+                fallback_types.extend(["ColumnRotations_R3", "ColumnRotations_R2"])
+            elif result_type == "ColumnAxials":
+                fallback_types.extend(["ColumnAxials_Min", "ColumnAxials_Max"])
+            elif result_type == "BraceAxials":
+                fallback_types.extend(["BraceAxials_Min", "BraceAxials_Max"])
+        return fallback_types
+
     def invalidate(
         self, element_id: int, result_type: str, direction: str, result_set_id: int
     ) -> None:
@@ -285,12 +323,17 @@ class JointDatasetProvider:
     """Builds cached datasets for joint/foundation results."""
 
     def __init__(
-        self, project_id: int, joint_cache_repo, max_cache_size: int = DEFAULT_MAX_CACHE_SIZE
+        self,
+        project_id: int,
+        joint_cache_repo,
+        max_cache_size: int = DEFAULT_MAX_CACHE_SIZE,
+        summary_repo=None,
     ) -> None:
         self.project_id = project_id
         self.joint_cache_repo = joint_cache_repo
+        self.summary_repo = summary_repo
         self._cache: LRUCache[Tuple[str, int, bool], Optional[ResultDataset]] = LRUCache(
-            max_cache_size
+            max_cache_size, name="joint"
         )
 
     def get(
@@ -301,13 +344,15 @@ def get(
 
         cache_key = (result_type, result_set_id, is_pushover)
         if cache_key in self._cache:
-            if CACHE_DEBUG:
-                logger.debug(
-                    "cache_hit.joint",
-                    extra={"result_type": result_type, "result_set_id": result_set_id},
-                )
+            _record_cache_event(
+                "hit",
+                "joint",
+                result_type=result_type,
+                result_set_id=result_set_id,
+            )
             return self._cache.get_item(cache_key)
 
+        start = perf_counter()
         cache_entries = self.joint_cache_repo.get_all_for_type(
             project_id=self.project_id,
             result_set_id=result_set_id,
@@ -315,11 +360,12 @@ def get(
         )
 
         if not cache_entries:
-            if CACHE_DEBUG:
-                logger.debug(
-                    "cache_miss.joint",
-                    extra={"result_type": result_type, "result_set_id": result_set_id},
-                )
+            _record_cache_event(
+                "miss",
+                "joint",
+                result_type=result_type,
+                result_set_id=result_set_id,
+            )
             self._cache[cache_key] = None
             return None
 
@@ -342,12 +388,28 @@ def get(
         non_data_cols = ["Shell Object", "Unique Name"]
         load_case_columns = [col for col in df.columns if col not in non_data_cols]
 
+        summary = (
+            self.summary_repo.get_summary(result_set_id, "joint", result_type)
+            if self.summary_repo
+            else None
+        )
+        statistics = (
+            stored_statistics(summary, df["Unique Name"].tolist(), cache_entries)
+            if not df.empty
+            else None
+        )
+
         # Add summary columns only for NLTHA, not Pushover
         summary_columns: List[str] = []
         if load_case_columns and not df.empty and not is_pushover:
-            df["Average"] = df[load_case_columns].mean(axis=1)
-            df["Maximum"] = df[load_case_columns].max(axis=1)
-            df["Minimum"] = df[load_case_columns].min(axis=1)
+            if statistics is not None:
+                df["Average"] = statistics["Avg"].to_numpy()
+                df["Maximum"] = statistics["Max"].to_numpy()
+                df["Minimum"] = statistics["Min"].to_numpy()
+            else:
+                df["Average"] = df[load_case_columns].mean(axis=1)
+                df["Maximum"] = df[load_case_columns].max(axis=1)
+                df["Minimum"] = df[load_case_columns].min(axis=1)
             summary_columns.extend(["Average", "Maximum", "Minimum"])
 
         meta = ResultDatasetMeta(
@@ -363,13 +425,11 @@ def get(
             config=config,
             load_case_columns=load_case_columns,
             summary_columns=summary_columns,
+            summary=scale_summary(summary) if statistics is not None else None,
         )
 
-        if CACHE_DEBUG:
-            logger.debug(
-                "cache_store.joint",
-                extra={"result_type": result_type, "result_set_id": result_set_id},
-            )
+        metrics.observe("dataset.build_seconds", perf_counter() - start, cache="joint")
+        _record_cache_event("store", "joint", result_type=result_type, result_set_id=result_set_id)
         self._cache.set_item(cache_key, dataset)
         return dataset
 
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set, Tuple
+import inspect
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 from sqlalchemy import or_
+from sqlalchemy.orm import Session
 
 from config.result_config import get_config
 from database.element_result_repository import ElementResultQueryRepository
+from database.repositories import (
+    AbsoluteMaxMinDriftRepository,
+    CacheRepository,
+    CacheSummaryRepository,
+    ElementCacheRepository,
+    ElementRepository,
+    JointCacheRepository,
+    LoadCaseRepository,
+    StoryRepository,
+)
 from utils.error_handling import timed
 
 from .comparison_builder import (
@@ -26,8 +39,32 @@
 from .story_loader import StoryProvider
 
 
+def _per_result_set(method):
+    """Run ``method`` on the service bound to its ``result_set_id``'s session.
+
+    Sharded result sets are served by a child service whose repositories use
+    the shard session (see ``ResultDataService._service_for``).
+    """
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result_set_id = signature.bind(self, *args, **kwargs).arguments["result_set_id"]
+        service = self._service_for(result_set_id)
+        if service is not self:
+            return getattr(service, method.__name__)(*args, **kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class ResultDataService:
-    """Fetches and caches result datasets for UI presentation."""
+    """Fetches and caches result datasets for UI presentation.
+
+    ``result_set_session_factory`` (result set ID -> session factory) routes
+    the result and cache queries of sharded result sets to their shard; see
+    ``database.shards``.
+    """
 
     def __init__(
         self,
@@ -40,6 +77,7 @@ def __init__(
         element_repo=None,
         joint_cache_repo=None,
         session=None,
+        result_set_session_factory: Optional[Callable[[int], Callable[[], Session]]] = None,
     ) -> None:
         self.project_id = project_id
         self.cache_repo = cache_repo
@@ -50,6 +88,10 @@ def __init__(
         self.element_repo = element_repo
         self.joint_cache_repo = joint_cache_repo
         self.session = session
+        self._result_set_session_factory = result_set_session_factory
+        self._result_set_services: Dict[int, ResultDataService] = {}
+        # Summaries stored at cache-build time; datasets recompute without them
+        self.summary_repo = CacheSummaryRepository(session) if session else None
 
         self._maxmin_cache: Dict[Tuple[str, int], Optional[MaxMinDataset]] = {}
         self._category_cache: Dict[int, Optional[int]] = {}
@@ -61,15 +103,18 @@ def __init__(
                 project_id=self.project_id,
                 cache_repo=self.cache_repo,
                 story_provider=self._stories,
+                summary_repo=self.summary_repo,
             ),
             ResultCategory.ELEMENT: ElementDatasetProvider(
                 project_id=self.project_id,
                 element_cache_repo=self.element_cache_repo,
                 story_provider=self._stories,
+                summary_repo=self.summary_repo,
             ),
             ResultCategory.JOINT: JointDatasetProvider(
                 project_id=self.project_id,
                 joint_cache_repo=self.joint_cache_repo,
+                summary_repo=self.summary_repo,
             ),
         }
         self._element_result_query_repo = (
@@ -80,6 +125,7 @@ def __init__(
     # Standard datasets
     # ------------------------------------------------------------------
 
+    @_per_result_set
     @timed
     def get_standard_dataset(
         self, result_type: str, direction: str, result_set_id: int, is_pushover: bool = False
@@ -87,6 +133,7 @@ def get_standard_dataset(
         provider = self._dataset_providers[ResultCategory.GLOBAL]
         return provider.get(result_type, direction, result_set_id, is_pushover=is_pushover)
 
+    @_per_result_set
     def invalidate_standard_dataset(
         self, result_type: str, direction: str, result_set_id: int
     ) -> None:
@@ -97,6 +144,7 @@ def invalidate_standard_dataset(
     # Element datasets
     # ------------------------------------------------------------------
 
+    @_per_result_set
     @timed
     def get_element_dataset(
         self,
@@ -111,6 +159,7 @@ def get_element_dataset(
             element_id, result_type, direction, result_set_id, is_pushover=is_pushover
         )
 
+    @_per_result_set
     def invalidate_element_dataset(
         self, element_id: int, result_type: str, direction: str, result_set_id: int
     ) -> None:
@@ -121,6 +170,7 @@ def invalidate_element_dataset(
     # Joint datasets (for soil pressures and other joint-based results)
     # ------------------------------------------------------------------
 
+    @_per_result_set
     @timed
     def get_joint_dataset(
         self, result_type: str, result_set_id: int, is_pushover: bool = False
@@ -128,6 +178,7 @@ def get_joint_dataset(
         provider = self._dataset_providers[ResultCategory.JOINT]
         return provider.get(result_type, result_set_id, is_pushover=is_pushover)
 
+    @_per_result_set
     def invalidate_joint_dataset(self, result_type: str, result_set_id: int) -> None:
         provider = self._dataset_providers[ResultCategory.JOINT]
         provider.invalidate(result_type, result_set_id)
@@ -136,6 +187,7 @@ def invalidate_joint_dataset(self, result_type: str, result_set_id: int) -> None
     # Max/min datasets
     # ------------------------------------------------------------------
 
+    @_per_result_set
     def get_maxmin_dataset(
         self,
         result_set_id: int,
@@ -170,6 +222,7 @@ def get_maxmin_dataset(
         self._maxmin_cache[cache_key] = dataset
         return dataset
 
+    @_per_result_set
     def invalidate_maxmin_dataset(
         self, result_set_id: int, base_result_type: str = "Drifts"
     ) -> None:
@@ -180,6 +233,7 @@ def invalidate_maxmin_dataset(
     # Element max/min + rotation helpers
     # ------------------------------------------------------------------
 
+    @_per_result_set
     def get_element_maxmin_dataset(
         self,
         element_id: int,
@@ -271,6 +325,7 @@ def get_element_maxmin_dataset(
             source_type=base_result_type,
         )
 
+    @_per_result_set
     def get_all_quad_rotations_dataset(
         self, result_set_id: int, max_min: str = "Max"
     ) -> Optional[pd.DataFrame]:
@@ -360,6 +415,7 @@ def get_all_quad_rotations_dataset(
         df = pd.DataFrame(data_rows)
         return df.sort_values(by="StoryOrder", ascending=True).reset_index(drop=True)
 
+    @_per_result_set
     def get_all_column_rotations_dataset(
         self, result_set_id: int, max_min: str = "Max"
     ) -> Optional[pd.DataFrame]:
@@ -420,6 +476,7 @@ def get_all_column_rotations_dataset(
         df = pd.DataFrame(data_rows)
         return df.sort_values(by="StoryOrder", ascending=True).reset_index(drop=True)
 
+    @_per_result_set
     def get_all_beam_rotations_dataset(
         self, result_set_id: int, max_min: str = "Max"
     ) -> Optional[pd.DataFrame]:
@@ -497,6 +554,7 @@ def get_all_beam_rotations_dataset(
         df = pd.DataFrame(data_rows)
         return df.sort_values(by="StoryOrder", ascending=True).reset_index(drop=True)
 
+    @_per_result_set
     def get_beam_rotations_table_dataset(self, result_set_id: int) -> Optional[pd.DataFrame]:
         """Return beam rotation data in wide format for table display."""
         if not self.session or not self.element_repo:
@@ -568,6 +626,7 @@ def get_beam_rotations_table_dataset(self, result_set_id: int) -> Optional[pd.Da
 
         return df
 
+    @_per_result_set
     def get_all_brace_axials_dataset(
         self, result_set_id: int, max_min: str = "Max"
     ) -> Optional[pd.DataFrame]:
@@ -623,6 +682,7 @@ def get_all_brace_axials_dataset(
         df = pd.DataFrame(data_rows)
         return df.sort_values(by="StoryOrder", ascending=True).reset_index(drop=True)
 
+    @_per_result_set
     def get_brace_axials_table_dataset(self, result_set_id: int) -> Optional[pd.DataFrame]:
         """Return brace axial force envelopes in wide format for table display."""
         if not self.session or not self.element_repo:
@@ -816,9 +876,11 @@ def invalidate_all(self) -> None:
         self._maxmin_cache.clear()
         self._comparison_cache.clear()
         self._category_cache.clear()
+        self.close()
 
     def invalidate_result_set(self, result_set_id: int) -> None:
         """Invalidate all caches associated with a specific result set."""
+        self._close_result_set_service(result_set_id)
         for provider in self._dataset_providers.values():
             clear_fn = getattr(provider, "clear_for_result_set", None)
             if callable(clear_fn):
@@ -843,10 +905,50 @@ def _key_matches(target_key) -> bool:
 
         self._category_cache.pop(result_set_id, None)
 
+    def close(self) -> None:
+        """Close the sessions opened for sharded result sets."""
+        for result_set_id in list(self._result_set_services):
+            self._close_result_set_service(result_set_id)
+
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
+    def _service_for(self, result_set_id: int) -> "ResultDataService":
+        """Service whose repositories read the result set's rows.
+
+        That is this service unless the result set session factory routes the
+        result set to another database (its shard); such result sets get a
+        child service on their own session, kept until invalidated.
+        """
+        if self._result_set_session_factory is None or not self.session:
+            return self
+        service = self._result_set_services.get(result_set_id)
+        if service is None:
+            session = self._result_set_session_factory(result_set_id)()
+            if session.get_bind() is self.session.get_bind():
+                session.close()
+                service = self
+            else:
+                service = ResultDataService(
+                    project_id=self.project_id,
+                    cache_repo=CacheRepository(session),
+                    story_repo=StoryRepository(session),
+                    load_case_repo=LoadCaseRepository(session),
+                    abs_maxmin_repo=AbsoluteMaxMinDriftRepository(session),
+                    element_cache_repo=ElementCacheRepository(session),
+                    element_repo=ElementRepository(session),
+                    joint_cache_repo=JointCacheRepository(session),
+                    session=session,
+                )
+            self._result_set_services[result_set_id] = service
+        return service
+
+    def _close_result_set_service(self, result_set_id: int) -> None:
+        service = self._result_set_services.pop(result_set_id, None)
+        if service is not None and service is not self:
+            service.session.close()
+
     def _get_global_category_id(self, result_set_id: int) -> Optional[int]:
         if result_set_id in self._category_cache:
             return self._category_cache[result_set_id]
@@ -48,6 +48,9 @@ def expensive_operation():
 from functools import wraps
 from typing import Any, Callable, Optional, TypeVar
 
+from utils import metrics
+from utils.timing import operation
+
 logger = logging.getLogger(__name__)
 
 # Environment variable to enable performance timing
@@ -59,8 +62,10 @@ def expensive_operation():
 def timed(func: F) -> F:
     """Decorator to log execution time of functions.
 
-    Only active when RPS_PERF_DEBUG=1 environment variable is set.
-    Logs timing at DEBUG level to avoid noise in production.
+    Timing is only logged when RPS_PERF_DEBUG=1 environment variable is set,
+    at DEBUG level to avoid noise in production. The call always runs as a
+    named ``utils.timing.operation`` so SQL query stats group under it, and
+    its duration goes to the ``call.seconds`` metric when metrics are enabled.
 
     Args:
         func: Function to wrap with timing
@@ -77,21 +82,28 @@ def build_cache(result_set_id: int) -> dict:
         # Enable timing:
         # RPS_PERF_DEBUG=1 python src/main.py
     """
+    name = func.__qualname__
+
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        if not PERF_DEBUG:
-            return func(*args, **kwargs)
+        if not PERF_DEBUG and not metrics.is_enabled():
+            with operation(name):
+                return func(*args, **kwargs)
 
         start = time.perf_counter()
         try:
-            result = func(*args, **kwargs)
-            elapsed = time.perf_counter() - start
-            logger.debug(f"PERF: {func.__module__}.{func.__name__} took {elapsed:.3f}s")
-            return result
+            with operation(name):
+                result = func(*args, **kwargs)
         except Exception:
             elapsed = time.perf_counter() - start
-            logger.debug(f"PERF: {func.__module__}.{func.__name__} failed after {elapsed:.3f}s")
+            if PERF_DEBUG:
+                logger.debug(f"PERF: {func.__module__}.{func.__name__} failed after {elapsed:.3f}s")
             raise
+        elapsed = time.perf_counter() - start
+        metrics.observe("call.seconds", elapsed, function=name)
+        if PERF_DEBUG:
+            logger.debug(f"PERF: {func.__module__}.{func.__name__} took {elapsed:.3f}s")
+        return result
 
     return wrapper  # type: ignore
 
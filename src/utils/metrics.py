@@ -0,0 +1,299 @@
+"""Process-wide metrics registry (disable with RPS_METRICS=0).
+
+Counters, gauges and histograms keyed by a dotted name plus optional labels,
+fed by PhaseTimer phases, ``@timed`` calls, the dataset caches and the
+importers. When disabled, the recording functions return after one flag
+check.
+
+- ``snapshot()`` returns cumulative values since startup (or the last reset)
+  and is what the Diagnostics dialog shows.
+- ``MetricsExporter`` appends periodic rollups (the activity of each interval)
+  to ``data/logs/metrics.jsonl``, one JSON object per line, for analysis
+  across machines. The interval is RPS_METRICS_INTERVAL seconds (default 300).
+
+Usage:
+    from utils import metrics
+
+    metrics.increment("dataset_cache.hit", cache="standard")
+    metrics.observe("import.rows_per_s", 4200.0)
+    metrics.set_gauge("dataset_cache.entries", 12, cache="standard")
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import math
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXPORT_INTERVAL_S = 300.0
+HISTOGRAM_SAMPLES = 1024  # Recent observations kept per histogram for percentiles
+
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _env_enabled() -> bool:
+    value = os.environ.get("RPS_METRICS", "1")
+    return value.strip().lower() not in {"0", "false", "no", "off"}
+
+
+_ENABLED = _env_enabled()
+
+
+def is_enabled() -> bool:
+    """Return True when metrics are recorded."""
+    return _ENABLED
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn recording on or off at runtime (recorded values are kept)."""
+    global _ENABLED
+    _ENABLED = enabled
+
+
+class _Summary:
+    """Count, sum, min, max and recent samples of observed values."""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.samples: Deque[float] = deque(maxlen=HISTOGRAM_SAMPLES)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.samples.append(value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum if self.count else None,
+            "max": self.maximum if self.count else None,
+            "mean": self.total / self.count if self.count else None,
+            "p50": _percentile(ordered, 0.50),
+            "p95": _percentile(ordered, 0.95),
+        }
+
+
+def _percentile(ordered: List[float], fraction: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class MetricsRegistry:
+    """Thread-safe store of counters, gauges and histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[MetricKey, float] = {}
+        self._gauges: Dict[MetricKey, float] = {}
+        self._histograms: Dict[MetricKey, _Summary] = {}
+        # Activity since the last rollup
+        self._window_counters: Dict[MetricKey, float] = {}
+        self._window_histograms: Dict[MetricKey, _Summary] = {}
+        self._window_started = datetime.now()
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+            self._window_counters[key] = self._window_counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            summary = self._histograms.get(key)
+            if summary is None:
+                summary = self._histograms[key] = _Summary()
+            summary.add(value)
+            window = self._window_histograms.get(key)
+            if window is None:
+                window = self._window_histograms[key] = _Summary()
+            window.add(value)
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Cumulative values: {"counters": [...], "gauges": [...], "histograms": [...]}."""
+        with self._lock:
+            return _export(self._counters, self._gauges, self._histograms)
+
+    def rollup(self) -> Optional[Dict[str, Any]]:
+        """Activity since the previous rollup, then start a new window.
+
+        Returns None when nothing was counted or observed in the window.
+        Gauges are reported with their current value.
+        """
+        now = datetime.now()
+        with self._lock:
+            if not self._window_counters and not self._window_histograms:
+                return None
+            payload = _export(self._window_counters, self._gauges, self._window_histograms)
+            started = self._window_started
+            self._window_counters = {}
+            self._window_histograms = {}
+            self._window_started = now
+        return {
+            "timestamp": now.isoformat(timespec="seconds"),
+            "window_start": started.isoformat(timespec="seconds"),
+            "interval_s": round((now - started).total_seconds(), 3),
+            "pid": os.getpid(),
+            **payload,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+            self._window_counters.clear()
+            self._window_histograms.clear()
+            self._window_started = datetime.now()
+
+
+def _key(name: str, labels: Dict[str, Any]) -> MetricKey:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def _export(counters, gauges, histograms) -> Dict[str, List[Dict[str, Any]]]:
+    def entry(key: MetricKey, **values: Any) -> Dict[str, Any]:
+        name, labels = key
+        return {"name": name, "labels": dict(labels), **values}
+
+    return {
+        "counters": [entry(key, value=value) for key, value in sorted(counters.items())],
+        "gauges": [entry(key, value=value) for key, value in sorted(gauges.items())],
+        "histograms": [
+            entry(key, **summary.as_dict()) for key, summary in sorted(histograms.items())
+        ],
+    }
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """Return the process-wide registry."""
+    return _registry
+
+
+def increment(name: str, value: float = 1, **labels: Any) -> None:
+    """Add ``value`` to a counter."""
+    if _ENABLED:
+        _registry.increment(name, value, **labels)
+
+
+def set_gauge(name: str, value: float, **labels: Any) -> None:
+    """Set a gauge to its current value."""
+    if _ENABLED:
+        _registry.set_gauge(name, value, **labels)
+
+
+def observe(name: str, value: float, **labels: Any) -> None:
+    """Record one histogram observation (durations in seconds)."""
+    if _ENABLED:
+        _registry.observe(name, value, **labels)
+
+
+class MetricsExporter:
+    """Appends registry rollups to a JSON-lines file from a daemon thread."""
+
+    def __init__(
+        self,
+        path: Path,
+        registry: Optional[MetricsRegistry] = None,
+        interval_s: float = DEFAULT_EXPORT_INTERVAL_S,
+    ) -> None:
+        self.path = Path(path)
+        self.registry = registry or _registry
+        self.interval_s = interval_s
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="metrics-export", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Stop the thread and write the final rollup."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    def flush(self) -> bool:
+        """Write one rollup line if there was activity; returns True when written."""
+        rollup = self.registry.rollup()
+        if rollup is None:
+            return False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(rollup, default=str) + "\n")
+        except OSError as exc:
+            logger.warning(f"Could not write metrics rollup to {self.path}: {exc}")
+            return False
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            self.flush()
+
+
+_exporter: Optional[MetricsExporter] = None
+
+
+def start_metrics_export(path: Optional[Path] = None) -> Optional[MetricsExporter]:
+    """Start periodic rollups to ``data/logs/metrics.jsonl`` unless metrics are disabled."""
+    global _exporter
+    if not _ENABLED:
+        return None
+    if _exporter is None:
+        from utils.logging_utils import LOG_DIR
+
+        try:
+            interval = float(os.environ.get("RPS_METRICS_INTERVAL", DEFAULT_EXPORT_INTERVAL_S))
+        except ValueError:
+            interval = DEFAULT_EXPORT_INTERVAL_S
+        _exporter = MetricsExporter(
+            path or LOG_DIR / "metrics.jsonl", interval_s=max(interval, 1.0)
+        )
+        _exporter.start()
+    return _exporter
+
+
+__all__ = [
+    "MetricsExporter",
+    "MetricsRegistry",
+    "get_registry",
+    "increment",
+    "is_enabled",
+    "observe",
+    "set_enabled",
+    "set_gauge",
+    "start_metrics_export",
+]
@@ -0,0 +1,42 @@
+"""Executors shared by the batch import, analysis and export paths."""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable
+
+
+def spawn_process_pool(max_workers: int, **kwargs: Any) -> ProcessPoolExecutor:
+    """Process pool whose workers start from a fresh interpreter.
+
+    Spawned workers avoid forking the Qt / SQLAlchemy state of the parent.
+    Extra keyword arguments (``initializer``, ...) go to ProcessPoolExecutor.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        **kwargs,
+    )
+
+
+class InlineExecutor:
+    """Runs submitted calls immediately in the calling thread.
+
+    Stands in for a pool executor (``submit`` + context manager) when only
+    one worker is requested, so callers keep a single code path.
+    """
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def __enter__(self) -> "InlineExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
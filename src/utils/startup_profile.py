@@ -0,0 +1,185 @@
+"""Startup profiling (enable with RPS_STARTUP_PROFILE=1).
+
+Records how long each startup phase takes and which first-time imports were
+the most expensive, similar to ``python -X importtime`` but without a
+relaunch, and writes the breakdown to the structured JSON log as one
+"Startup profile" record.
+
+Usage (src/main.py):
+    profiler = StartupProfiler.from_env()
+    with profiler.phase("qt_app"):
+        app = QApplication(sys.argv)
+    ...
+    profiler.report()
+"""
+
+from __future__ import annotations
+
+import builtins
+import importlib.util
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TOP_IMPORTS = 40  # Slowest imports kept in the report
+
+
+def is_startup_profile_enabled() -> bool:
+    """Return True when RPS_STARTUP_PROFILE asks for a startup breakdown."""
+    value = os.environ.get("RPS_STARTUP_PROFILE", "")
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass
+class ImportTiming:
+    """Time spent importing one module for the first time."""
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+class ImportTimer:
+    """Times first-time imports by wrapping ``builtins.__import__``.
+
+    Like ``-X importtime``: cumulative time includes nested imports, self time
+    excludes them. Modules already in ``sys.modules`` are not recorded.
+    """
+
+    def __init__(self) -> None:
+        self.timings: List[ImportTiming] = []
+        self._stack: List[List[float]] = []  # per active import: [child time]
+        self._original = None
+
+    def install(self) -> None:
+        if self._original is None:
+            self._original = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original
+        module_name = _resolve(name, globals, level)
+        if module_name is not None and module_name in sys.modules and fromlist:
+            # "from package import submodule" loads the submodule inside this call
+            pending = [
+                f"{module_name}.{item}" for item in fromlist
+                if item != "*" and f"{module_name}.{item}" not in sys.modules
+            ]
+            module_name = ", ".join(pending) if pending else module_name
+        if module_name is None or module_name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        self._stack.append([0.0])
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            (children,) = self._stack.pop()
+            if self._stack:
+                self._stack[-1][0] += elapsed
+            self.timings.append(
+                ImportTiming(
+                    module=module_name,
+                    self_ms=round((elapsed - children) * 1000, 3),
+                    cumulative_ms=round(elapsed * 1000, 3),
+                    depth=len(self._stack),
+                )
+            )
+
+
+def _resolve(name: str, globals: Optional[dict], level: int) -> Optional[str]:
+    """Absolute module name of an import statement, or None if it cannot be resolved."""
+    if level == 0:
+        return name
+    package = (globals or {}).get("__package__") or (globals or {}).get("__name__")
+    if not package:
+        return None
+    try:
+        return importlib.util.resolve_name("." * level + name, package)
+    except (ImportError, ValueError):
+        return None
+
+
+class StartupProfiler:
+    """Collects phase durations and import timings during startup.
+
+    A disabled profiler keeps the same API and does nothing, so call sites do
+    not need to check whether profiling is on.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.phases: Dict[str, float] = {}
+        self._origin = time.perf_counter()
+        self._imports = ImportTimer() if enabled else None
+        if self._imports is not None:
+            self._imports.install()
+
+    @classmethod
+    def from_env(cls) -> "StartupProfiler":
+        return cls(enabled=is_startup_profile_enabled())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a named startup phase."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - start) * 1000, 3)
+
+    def mark(self, name: str) -> None:
+        """Record the time since the profiler was created (e.g. first paint)."""
+        if self.enabled:
+            self.phases[name] = round((time.perf_counter() - self._origin) * 1000, 3)
+
+    def summary(self) -> dict:
+        """Phase durations and the slowest first-time imports, in milliseconds."""
+        imports = self._imports.timings if self._imports is not None else []
+        top_level = [timing for timing in imports if timing.depth == 0]
+        # Circular imports can record a module twice; keep its outermost timing
+        outermost: Dict[str, ImportTiming] = {}
+        for timing in imports:
+            seen = outermost.get(timing.module)
+            if seen is None or timing.cumulative_ms > seen.cumulative_ms:
+                outermost[timing.module] = timing
+        slowest = sorted(outermost.values(), key=lambda timing: timing.cumulative_ms, reverse=True)[:TOP_IMPORTS]
+        return {
+            "phases_ms": dict(self.phases),
+            "total_ms": round((time.perf_counter() - self._origin) * 1000, 3),
+            "modules_imported": len(outermost),
+            "import_ms": round(sum(timing.cumulative_ms for timing in top_level), 3),
+            "slowest_imports": [
+                {"module": t.module, "self_ms": t.self_ms, "cumulative_ms": t.cumulative_ms}
+                for t in slowest
+            ],
+        }
+
+    def report(self) -> Optional[dict]:
+        """Stop import tracing and log the breakdown to the structured log."""
+        if not self.enabled:
+            return None
+        if self._imports is not None:
+            self._imports.uninstall()
+        summary = self.summary()
+        logger.info("Startup profile", extra={"startup_profile": summary})
+        return summary
+
+
+__all__ = ["ImportTimer", "StartupProfiler", "is_startup_profile_enabled"]
@@ -2,8 +2,36 @@
 
 from __future__ import annotations
 
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
 from time import perf_counter
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils import metrics
+
+# (name, invocation id) of the innermost logical operation; read by the SQL query profiler
+_OPERATION: ContextVar[Optional[Tuple[str, int]]] = ContextVar("rps_operation", default=None)
+_INVOCATIONS = itertools.count(1)
+
+
+def current_operation() -> Optional[Tuple[str, int]]:
+    """Name and invocation id of the innermost active ``operation`` scope, if any."""
+    return _OPERATION.get()
+
+
+@contextmanager
+def operation(name: str) -> Iterator[None]:
+    """Label the work done in this block (import phase, dataset load, export step).
+
+    Scopes nest; the innermost name wins. Each entry gets a fresh invocation
+    id so repeated runs of the same operation can be told apart.
+    """
+    token = _OPERATION.set((name, next(_INVOCATIONS)))
+    try:
+        yield
+    finally:
+        _OPERATION.reset(token)
 
 
 class PhaseTimer:
@@ -17,7 +45,11 @@ def as_list(self) -> List[Dict[str, Any]]:
         return list(self._entries)
 
     def measure(self, phase: str, extra: Optional[Dict[str, Any]] = None):
-        """Context manager recording elapsed wall time for a phase."""
+        """Context manager recording elapsed wall time for a phase.
+
+        The phase is also the current ``operation`` while it runs, and its
+        duration is recorded in the ``phase.seconds`` metric.
+        """
 
         class _TimerCtx:
             def __init__(self, outer: "PhaseTimer") -> None:
@@ -25,12 +57,16 @@ def __init__(self, outer: "PhaseTimer") -> None:
                 self.phase = phase
                 self.extra = extra or {}
                 self.start = perf_counter()
+                self.scope = operation(phase)
 
             def __enter__(self):
+                self.scope.__enter__()
                 return None
 
             def __exit__(self, exc_type, exc, tb):
+                self.scope.__exit__(exc_type, exc, tb)
                 duration = perf_counter() - self.start
+                metrics.observe("phase.seconds", duration, phase=self.phase)
                 entry: Dict[str, Any] = {"phase": self.phase, "duration": duration}
                 entry.update(self.outer._base_context)
                 if self.extra:
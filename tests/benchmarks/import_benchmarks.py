@@ -0,0 +1,724 @@
+#!/usr/bin/env python
+"""Import throughput benchmarks on synthetic ETABS/SAP2000 workbooks.
+
+Measures wall time, peak RSS and rows/sec of the import pipeline:
+
+- ``data_importer``: DataImporter on one NLTHA workbook (all TARGET_SHEETS, no cache)
+- ``cache_builder``: CacheBuilder.generate_all over that imported workbook
+- ``folder_importer``: FolderImporter on a folder of NLTHA workbooks, with caches
+- ``time_history_importer``: TimeHistoryImporter over a batch of time-history files
+- ``pushover_global``: PushoverGlobalImporter on a pushover workbook
+- ``pushover_elements``: the element/joint pushover importers on the same workbook
+
+Workbooks are generated once per scale (see ``synthetic_workbooks``) and
+reused from ``--workdir``. Each case gets a fresh project database, prepared
+outside the measurement, and runs in its own spawned process so peak RSS
+belongs to that case alone.
+
+Usage (from the repository root):
+    python -m tests.benchmarks.import_benchmarks run --scale medium --output bench.json
+    python -m tests.benchmarks.import_benchmarks run --scale medium --baseline baseline.json
+    python -m tests.benchmarks.import_benchmarks compare bench.json baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    import resource  # Not available on Windows
+except ImportError:
+    resource = None
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+for path in (ROOT, SRC):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from tests.benchmarks.synthetic_workbooks import (  # noqa: E402
+    PUSHOVER_SHEETS,
+    SCALE_PRESETS,
+    BenchmarkScale,
+    pushover_cases,
+    write_nltha_workbook,
+    write_pushover_workbook,
+    write_time_history_workbook,
+)
+
+SCHEMA_VERSION = 1
+PROJECT_NAME = "Benchmark"
+DEFAULT_TIME_TOLERANCE = 0.20  # Fractional slowdown flagged as a regression
+DEFAULT_MEMORY_TOLERANCE = 0.20  # Fractional peak RSS growth flagged as a regression
+MIN_TIME_DELTA = 0.05  # Seconds; smaller slowdowns are timer noise on short cases
+
+# Pushover importers run after the global import, in the order of the import dialog
+PUSHOVER_ELEMENT_IMPORTERS = (
+    "wall",
+    "column_rotation",
+    "column_shear",
+    "beam_rotation",
+    "brace_axial",
+    "joint_displacement",
+    "soil_pressure",
+    "vertical_displacement",
+)
+PUSHOVER_GLOBAL_SHEETS = ("Story Drifts", "Story Forces", "Joint Displacements")
+
+
+# ---------------------------------------------------------------------------
+# Inputs
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class BenchmarkInputs:
+    """Generated workbooks and their data row counts."""
+
+    nltha_files: List[Path]
+    nltha_rows: List[Dict[str, int]]
+    time_history_files: List[Path]
+    time_history_rows: List[Dict[str, int]]
+    pushover_file: Path
+    pushover_rows: Dict[str, int]
+
+
+def prepare_inputs(directory: Path, scale: BenchmarkScale) -> BenchmarkInputs:
+    """Generate the workbooks for ``scale``, or reuse them if already generated.
+
+    Args:
+        directory: Directory holding the workbooks and a manifest of the scale
+        scale: Model size
+    """
+    manifest_path = directory / "manifest.json"
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text())
+        if manifest.get("scale") == scale.as_dict():
+            return _inputs_from_manifest(directory, manifest)
+    if directory.exists():
+        shutil.rmtree(directory)
+
+    nltha_dir = directory / "nltha"
+    th_dir = directory / "time_history"
+    manifest: Dict[str, Any] = {"scale": scale.as_dict(), "nltha": {}, "time_history": {}}
+    for index in range(scale.files):
+        name = f"Synthetic_DES_{index + 1}.xlsx"
+        manifest["nltha"][name] = write_nltha_workbook(nltha_dir / name, scale, file_index=index)
+    for index in range(scale.files):
+        load_case = f"TH{index + 1:02d}"
+        name = f"Synthetic_{load_case}.xlsx"
+        manifest["time_history"][name] = write_time_history_workbook(
+            th_dir / name, scale, load_case
+        )
+    manifest["pushover"] = write_pushover_workbook(
+        directory / "pushover" / "Synthetic_Push.xlsx", scale
+    )
+
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    return _inputs_from_manifest(directory, manifest)
+
+
+def _inputs_from_manifest(directory: Path, manifest: Dict[str, Any]) -> BenchmarkInputs:
+    return BenchmarkInputs(
+        nltha_files=[directory / "nltha" / name for name in manifest["nltha"]],
+        nltha_rows=list(manifest["nltha"].values()),
+        time_history_files=[directory / "time_history" / name for name in manifest["time_history"]],
+        time_history_rows=list(manifest["time_history"].values()),
+        pushover_file=directory / "pushover" / "Synthetic_Push.xlsx",
+        pushover_rows=manifest["pushover"],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One measured operation.
+
+    ``prepare`` builds the case's starting database state and is not timed;
+    ``run`` is timed and returns ``{"rows": ..., "details": {...}}``. Both
+    receive the case's own working directory, and ``run`` also gets the JSON
+    context returned by ``prepare``.
+    """
+
+    name: str
+    prepare: Callable[[Path, BenchmarkInputs, BenchmarkScale], Dict[str, Any]]
+    run: Callable[[Path, BenchmarkInputs, BenchmarkScale, Dict[str, Any]], Dict[str, Any]]
+
+
+def _session_factory(workdir: Path):
+    from database.session import project_session_factory
+
+    return project_session_factory(workdir / "benchmark.db")
+
+
+def _create_result_set(workdir: Path, name: str, analysis_type: str) -> Dict[str, Any]:
+    from database.repositories.project import ProjectRepository
+    from database.repositories.result_set import ResultSetRepository
+
+    session = _session_factory(workdir)()
+    try:
+        project = ProjectRepository(session).create(PROJECT_NAME)
+        result_set = ResultSetRepository(session).get_or_create(project.id, name)
+        result_set.analysis_type = analysis_type
+        session.commit()
+        return {"project_id": project.id, "result_set_id": result_set.id}
+    finally:
+        session.close()
+
+
+def _no_preparation(
+    workdir: Path, inputs: BenchmarkInputs, scale: BenchmarkScale
+) -> Dict[str, Any]:
+    return {}
+
+
+def _run_data_importer(workdir, inputs, scale, context) -> Dict[str, Any]:
+    from processing.data_importer import DataImporter
+
+    importer = DataImporter(
+        file_path=str(inputs.nltha_files[0]),
+        project_name=PROJECT_NAME,
+        result_set_name="DES",
+        session_factory=_session_factory(workdir),
+        generate_cache=False,
+    )
+    stats = importer.import_all()
+    return {
+        "rows": sum(inputs.nltha_rows[0].values()),
+        "details": {
+            "phase_timings": stats.get("phase_timings", []),
+            "errors": len(stats.get("errors", [])),
+        },
+    }
+
+
+def _prepare_cache_builder(workdir, inputs, scale) -> Dict[str, Any]:
+    from database.repositories.project import ProjectRepository
+    from processing.data_importer import DataImporter
+
+    importer = DataImporter(
+        file_path=str(inputs.nltha_files[0]),
+        project_name=PROJECT_NAME,
+        result_set_name="DES",
+        session_factory=_session_factory(workdir),
+        generate_cache=False,
+    )
+    importer.import_all()
+
+    session = _session_factory(workdir)()
+    try:
+        project_id = ProjectRepository(session).get_by_name(PROJECT_NAME).id
+    finally:
+        session.close()
+    return {
+        "project_id": project_id,
+        "result_set_id": importer.result_set_id,
+        "result_category_id": importer.result_category_id,
+    }
+
+
+def _run_cache_builder(workdir, inputs, scale, context) -> Dict[str, Any]:
+    from processing.cache_builder import CacheBuilder
+
+    session = _session_factory(workdir)()
+    try:
+        CacheBuilder(session=session, **context).generate_all()
+        session.commit()
+    finally:
+        session.close()
+    return {"rows": sum(inputs.nltha_rows[0].values()), "details": {}}
+
+
+def _run_folder_importer(workdir, inputs, scale, context) -> Dict[str, Any]:
+    from processing.folder_importer import FolderImporter
+
+    importer = FolderImporter(
+        folder_path=str(inputs.nltha_files[0].parent),
+        project_name=PROJECT_NAME,
+        result_set_name="DES",
+        session_factory=_session_factory(workdir),
+    )
+    stats = importer.import_all()
+    return {
+        "rows": sum(sum(rows.values()) for rows in inputs.nltha_rows),
+        "details": {"files": stats.get("files_processed"), "errors": len(stats.get("errors", []))},
+    }
+
+
+def _prepare_time_history(workdir, inputs, scale) -> Dict[str, Any]:
+    return _create_result_set(workdir, "TH", "NLTHA")
+
+
+def _run_time_history_importer(workdir, inputs, scale, context) -> Dict[str, Any]:
+    from processing.time_history_importer import TimeHistoryImporter
+
+    session = _session_factory(workdir)()
+    try:
+        importer = TimeHistoryImporter(session, context["project_id"], context["result_set_id"])
+        series = sum(importer.import_file(path) for path in inputs.time_history_files)
+    finally:
+        session.close()
+    return {
+        "rows": sum(sum(rows.values()) for rows in inputs.time_history_rows),
+        "details": {"files": len(inputs.time_history_files), "series": series},
+    }
+
+
+def _prepare_pushover_global(workdir, inputs, scale) -> Dict[str, Any]:
+    return _create_result_set(workdir, "Push", "Pushover")
+
+
+def _run_pushover_global(workdir, inputs, scale, context) -> Dict[str, Any]:
+    from processing.pushover.pushover_global_importer import PushoverGlobalImporter
+
+    cases = pushover_cases(scale)
+    session = _session_factory(workdir)()
+    try:
+        stats = PushoverGlobalImporter(
+            project_id=context["project_id"],
+            session=session,
+            folder_path=inputs.pushover_file.parent,
+            result_set_name="Push",
+            valid_files=[inputs.pushover_file],
+            selected_load_cases_x=cases["X"],
+            selected_load_cases_y=cases["Y"],
+        ).import_all()
+    finally:
+        session.close()
+    return {
+        "rows": sum(inputs.pushover_rows[sheet] for sheet in PUSHOVER_GLOBAL_SHEETS),
+        "details": {"errors": len(stats.get("errors", []))},
+    }
+
+
+def _prepare_pushover_elements(workdir, inputs, scale) -> Dict[str, Any]:
+    # Element importers run on top of a global import, as in the import dialog
+    context = _prepare_pushover_global(workdir, inputs, scale)
+    _run_pushover_global(workdir, inputs, scale, context)
+    return context
+
+
+def _run_pushover_elements(workdir, inputs, scale, context) -> Dict[str, Any]:
+    from processing.pushover.pushover_importer_factory import create_importer
+
+    cases = pushover_cases(scale)
+    timings: Dict[str, float] = {}
+    session = _session_factory(workdir)()
+    try:
+        for importer_type in PUSHOVER_ELEMENT_IMPORTERS:
+            start = time.perf_counter()
+            create_importer(
+                importer_type,
+                project_id=context["project_id"],
+                session=session,
+                result_set_id=context["result_set_id"],
+                file_path=inputs.pushover_file,
+                selected_load_cases_x=cases["X"],
+                selected_load_cases_y=cases["Y"],
+            ).import_all()
+            timings[importer_type] = round(time.perf_counter() - start, 4)
+    finally:
+        session.close()
+    element_sheets = [
+        sheet for sheet in PUSHOVER_SHEETS if sheet not in ("Story Drifts", "Story Forces")
+    ]
+    return {
+        "rows": sum(inputs.pushover_rows[sheet] for sheet in element_sheets),
+        "details": {"importer_seconds": timings},
+    }
+
+
+CASES: Dict[str, BenchmarkCase] = {
+    case.name: case
+    for case in (
+        BenchmarkCase("data_importer", _no_preparation, _run_data_importer),
+        BenchmarkCase("cache_builder", _prepare_cache_builder, _run_cache_builder),
+        BenchmarkCase("folder_importer", _no_preparation, _run_folder_importer),
+        BenchmarkCase("time_history_importer", _prepare_time_history, _run_time_history_importer),
+        BenchmarkCase("pushover_global", _prepare_pushover_global, _run_pushover_global),
+        BenchmarkCase("pushover_elements", _prepare_pushover_elements, _run_pushover_elements),
+    )
+}
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB, or None where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _prepare_case(
+    name: str, workdir: str, inputs: BenchmarkInputs, scale: BenchmarkScale
+) -> Dict[str, Any]:
+    from database.session import dispose_all_engines
+
+    try:
+        return CASES[name].prepare(Path(workdir), inputs, scale)
+    finally:
+        dispose_all_engines()
+
+
+def _measure_case(
+    name: str, workdir: str, inputs: BenchmarkInputs, scale: BenchmarkScale, context: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Run one case and return its metrics (executed in the measuring process)."""
+    from database.session import dispose_all_engines
+
+    gc.collect()
+    start = time.perf_counter()
+    try:
+        outcome = CASES[name].run(Path(workdir), inputs, scale, context)
+    finally:
+        dispose_all_engines()
+    wall = time.perf_counter() - start
+    rows = outcome["rows"]
+    return {
+        "wall_s": round(wall, 4),
+        "peak_rss_mb": peak_rss_mb(),
+        "rows": rows,
+        "rows_per_s": round(rows / wall, 1) if wall > 0 else None,
+        "details": outcome.get("details", {}),
+    }
+
+
+def _in_fresh_process(function: Callable, *args: Any) -> Any:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(function, *args).result()
+
+
+def run_case(
+    name: str,
+    workdir: Path,
+    inputs: BenchmarkInputs,
+    scale: BenchmarkScale,
+    repeat: int = 1,
+    isolated: bool = True,
+) -> Dict[str, Any]:
+    """Prepare and measure one case ``repeat`` times.
+
+    Every repetition starts from a freshly prepared database. The fastest
+    run is reported, with the highest peak RSS seen across runs.
+
+    Args:
+        isolated: Prepare and measure in separate spawned processes (default).
+            In-process runs are quicker but their peak RSS includes everything
+            the calling process allocated before.
+    """
+    execute = _in_fresh_process if isolated else (lambda function, *args: function(*args))
+    runs = []
+    for attempt in range(repeat):
+        case_dir = workdir / f"{name}_{attempt + 1}"
+        if case_dir.exists():
+            shutil.rmtree(case_dir)
+        case_dir.mkdir(parents=True)
+        context = execute(_prepare_case, name, str(case_dir), inputs, scale)
+        runs.append(execute(_measure_case, name, str(case_dir), inputs, scale, context))
+        shutil.rmtree(case_dir, ignore_errors=True)
+
+    best = min(runs, key=lambda run: run["wall_s"])
+    peaks = [run["peak_rss_mb"] for run in runs if run["peak_rss_mb"] is not None]
+    return dict(
+        best, peak_rss_mb=max(peaks) if peaks else None, runs=[run["wall_s"] for run in runs]
+    )
+
+
+def run_benchmarks(
+    scale: BenchmarkScale,
+    workdir: Path,
+    cases: Optional[Sequence[str]] = None,
+    repeat: int = 1,
+    isolated: bool = True,
+    scale_name: Optional[str] = None,
+    progress: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """Generate (or reuse) the inputs and measure the selected cases.
+
+    Returns:
+        JSON-serializable results: scale, environment and per-case metrics
+    """
+    names = list(cases or CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        raise ValueError(
+            f"Unknown benchmark cases: {', '.join(unknown)}. Available: {', '.join(CASES)}"
+        )
+
+    inputs = prepare_inputs(workdir / "inputs", scale)
+    results: Dict[str, Any] = {}
+    for name in names:
+        if progress:
+            progress(f"Running {name}...")
+        results[name] = run_case(
+            name, workdir / "runs", inputs, scale, repeat=repeat, isolated=isolated
+        )
+        if progress:
+            progress(_format_case(name, results[name]))
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "scale_name": scale_name,
+        "scale": scale.as_dict(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "isolated": isolated,
+        },
+        "cases": results,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class MetricComparison:
+    """One metric of one case, current run against the baseline."""
+
+    case: str
+    metric: str
+    baseline: float
+    current: float
+    regression: bool
+
+    @property
+    def change(self) -> float:
+        """Fractional change relative to the baseline (+0.25 = 25% higher)."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+    memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE,
+    min_time_delta: float = MIN_TIME_DELTA,
+) -> List[MetricComparison]:
+    """Compare wall time and peak RSS of the cases present in both results.
+
+    A case regresses when its wall time grows by more than ``time_tolerance``
+    (and by at least ``min_time_delta`` seconds), or its peak RSS by more
+    than ``memory_tolerance``.
+
+    Raises:
+        ValueError: The results were measured at different scales
+    """
+    if current.get("scale") != baseline.get("scale"):
+        raise ValueError(
+            f"Scale mismatch: current {current.get('scale')} vs baseline {baseline.get('scale')}"
+        )
+
+    comparisons: List[MetricComparison] = []
+    for name, metrics in current.get("cases", {}).items():
+        reference = baseline.get("cases", {}).get(name)
+        if reference is None:
+            continue
+
+        wall, base_wall = metrics["wall_s"], reference["wall_s"]
+        comparisons.append(
+            MetricComparison(
+                name,
+                "wall_s",
+                base_wall,
+                wall,
+                regression=wall > base_wall * (1 + time_tolerance)
+                and wall - base_wall >= min_time_delta,
+            )
+        )
+
+        rss, base_rss = metrics.get("peak_rss_mb"), reference.get("peak_rss_mb")
+        if rss is not None and base_rss:
+            comparisons.append(
+                MetricComparison(
+                    name,
+                    "peak_rss_mb",
+                    base_rss,
+                    rss,
+                    regression=rss > base_rss * (1 + memory_tolerance),
+                )
+            )
+    return comparisons
+
+
+def format_comparisons(comparisons: Sequence[MetricComparison]) -> str:
+    lines = [f"{'case':<24}{'metric':<14}{'baseline':>12}{'current':>12}{'change':>10}"]
+    for item in comparisons:
+        flag = "  REGRESSION" if item.regression else ""
+        lines.append(
+            f"{item.case:<24}{item.metric:<14}{item.baseline:>12.3f}{item.current:>12.3f}"
+            f"{item.change:>+10.1%}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def _format_case(name: str, metrics: Dict[str, Any]) -> str:
+    rss = metrics["peak_rss_mb"]
+    return (
+        f"  {name}: {metrics['wall_s']:.2f} s, {metrics['rows']:,} rows, "
+        f"{metrics['rows_per_s'] or 0:,.0f} rows/s, peak RSS {'n/a' if rss is None else f'{rss:.0f} MB'}"
+    )
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def _report_comparison(
+    current: Dict[str, Any], baseline_path: Path, args: argparse.Namespace
+) -> int:
+    baseline = json.loads(Path(baseline_path).read_text())
+    comparisons = compare_results(
+        current, baseline, time_tolerance=args.tolerance, memory_tolerance=args.memory_tolerance
+    )
+    print(format_comparisons(comparisons))
+    regressions = [item for item in comparisons if item.regression]
+    if regressions:
+        print(f"{len(regressions)} regression(s) against {baseline_path}")
+        return 1
+    print(f"No regressions against {baseline_path}")
+    return 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    scale = BenchmarkScale.preset(
+        args.scale,
+        stories=args.stories,
+        elements=args.elements,
+        load_cases=args.load_cases,
+        steps=args.steps,
+        files=args.files,
+    )
+    print(f"Scale '{args.scale}': {scale.as_dict()}")
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="rps_bench_"))
+    try:
+        results = run_benchmarks(
+            scale,
+            workdir,
+            cases=args.case,
+            repeat=args.repeat,
+            isolated=not args.in_process,
+            scale_name=args.scale,
+            progress=print,
+        )
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}")
+    if args.baseline:
+        return _report_comparison(results, Path(args.baseline), args)
+    return 0
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    current = json.loads(Path(args.current).read_text())
+    return _report_comparison(current, Path(args.baseline), args)
+
+
+def _add_tolerance_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TIME_TOLERANCE,
+        help="Fractional wall-time increase flagged as a regression (default: 0.20).",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=DEFAULT_MEMORY_TOLERANCE,
+        help="Fractional peak RSS increase flagged as a regression (default: 0.20).",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Import throughput benchmarks on synthetic workbooks."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="Generate workbooks and measure the import cases."
+    )
+    run_parser.add_argument(
+        "--scale", choices=list(SCALE_PRESETS), default="small", help="Scale preset."
+    )
+    for dimension in ("stories", "elements", "load-cases", "steps", "files"):
+        run_parser.add_argument(
+            f"--{dimension}", type=int, help=f"Override the preset's {dimension}."
+        )
+    run_parser.add_argument(
+        "--case",
+        action="append",
+        choices=list(CASES),
+        help="Case to run (repeatable; default: all).",
+    )
+    run_parser.add_argument(
+        "--repeat", type=int, default=1, help="Runs per case; the fastest is kept."
+    )
+    run_parser.add_argument(
+        "--workdir",
+        help="Keep generated workbooks here and reuse them on later runs (default: temp dir).",
+    )
+    run_parser.add_argument("--output", help="Write results JSON to this path.")
+    run_parser.add_argument(
+        "--baseline", help="Compare against a stored results JSON; exit 1 on regressions."
+    )
+    run_parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run cases in this process (peak RSS is then cumulative).",
+    )
+    _add_tolerance_arguments(run_parser)
+    run_parser.set_defaults(func=cmd_run)
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two results files.")
+    compare_parser.add_argument("current", help="Results JSON to check.")
+    compare_parser.add_argument("baseline", help="Baseline results JSON.")
+    _add_tolerance_arguments(compare_parser)
+    compare_parser.set_defaults(func=cmd_compare)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,492 @@
+#!/usr/bin/env python
+"""Query benchmarks for the hot result-table and cache statements.
+
+Times the statements that the index audit (``database.index_audit``) flagged,
+through the same repository/service code the application runs:
+
+- ``delete_load_case_data``: LoadCaseDataDeleter for a few load cases of one category
+- ``category_cases_read``: result rows of one category and a few load cases
+- ``pushover_cache_fetch``: fetch_cache_records over one result set's load cases
+- ``element_cache_replace``: replace_cache_rows delete for one result type
+- ``global_cache_display``: CacheRepository.get_cache_for_display
+- ``element_cache_set_read``: all element cache rows of one result type (export view)
+- ``column_rotations_dataset``: ResultDataService.get_all_column_rotations_dataset
+
+The database is synthesised directly (no workbooks) and built once per scale in
+``--workdir``. ``--legacy-indexes`` swaps in the index set from before the
+composite index revision, so two runs give the before/after numbers:
+
+    python -m tests.benchmarks.query_benchmarks run --scale medium --legacy-indexes --output before.json
+    python -m tests.benchmarks.query_benchmarks run --scale medium --baseline before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+for path in (ROOT, SRC):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
+
+from database.base import Base  # noqa: E402
+from database.models import ColumnRotation, ElementResultsCache, StoryDrift  # noqa: E402
+from database.repositories import CacheRepository, ElementRepository  # noqa: E402
+from processing.data_deleter import LoadCaseDataDeleter  # noqa: E402
+from processing.pushover.pushover_cache_writer import (  # noqa: E402
+    fetch_cache_records,
+    replace_cache_rows,
+)
+from services.result_service import ResultDataService  # noqa: E402
+from tests.benchmarks.import_benchmarks import compare_results, format_comparisons  # noqa: E402
+
+SCHEMA_VERSION = 1
+PROJECT_ID = 1
+DIRECTIONS = ("R2", "R3")
+CACHE_TYPES = ("Drifts", "Forces", "Displacements", "Accelerations")
+ELEMENT_CACHE_TYPES = (
+    "ColumnRotations_R2",
+    "ColumnRotations_R3",
+    "ColumnShears_V2",
+    "ColumnShears_V3",
+)
+DELETED_CASES = 3  # Load cases removed/read by the category cases
+
+# Index set before the composite index revision: (name, table, columns)
+LEGACY_INDEXES = (
+    ("ix_drift_category", "story_drifts", ("result_category_id",)),
+    ("ix_accel_category", "story_accelerations", ("result_category_id",)),
+    ("ix_force_category", "story_forces", ("result_category_id",)),
+    ("ix_disp_category", "story_displacements", ("result_category_id",)),
+    ("ix_wallshear_category", "wall_shears", ("result_category_id",)),
+    ("ix_quadrot_category", "quad_rotations", ("result_category_id",)),
+    ("ix_colshear_category", "column_shears", ("result_category_id",)),
+    ("ix_colaxial_category", "column_axials", ("result_category_id",)),
+    ("ix_braceaxial_category", "brace_axials", ("result_category_id",)),
+    ("ix_colrot_category", "column_rotations", ("result_category_id",)),
+    ("ix_beamrot_category", "beam_rotations", ("result_category_id",)),
+    ("ix_cache_lookup", "global_results_cache", ("project_id", "result_set_id", "result_type")),
+    (
+        "ix_elem_cache_lookup",
+        "element_results_cache",
+        ("project_id", "result_set_id", "result_type", "element_id"),
+    ),
+    (
+        "ix_joint_cache_lookup",
+        "joint_results_cache",
+        ("project_id", "result_set_id", "result_type"),
+    ),
+)
+
+
+@dataclass(frozen=True)
+class QueryScale:
+    """Size of the synthetic project database."""
+
+    stories: int
+    elements: int
+    load_cases: int  # Per result set
+    result_sets: int
+
+    @classmethod
+    def preset(cls, name: str, **overrides: Optional[int]) -> "QueryScale":
+        scale = SCALE_PRESETS[name]
+        return replace(scale, **{key: value for key, value in overrides.items() if value})
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+    @property
+    def rotation_rows(self) -> int:
+        return self.elements * self.load_cases * self.result_sets * len(DIRECTIONS)
+
+
+SCALE_PRESETS: Dict[str, QueryScale] = {
+    "smoke": QueryScale(stories=4, elements=12, load_cases=4, result_sets=2),
+    "small": QueryScale(stories=20, elements=300, load_cases=11, result_sets=3),
+    "medium": QueryScale(stories=40, elements=1000, load_cases=11, result_sets=4),
+    "large": QueryScale(stories=60, elements=3000, load_cases=22, result_sets=6),
+}
+
+
+# ---------------------------------------------------------------------------
+# Database
+# ---------------------------------------------------------------------------
+
+
+def build_database(path: Path, scale: QueryScale) -> None:
+    """Create a project database with column rotations, drifts and caches.
+
+    Every result set has one category and its own load cases; each column sits
+    on one story and has a row per load case and direction.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    engine = create_engine(f"sqlite:///{path}", poolclass=NullPool)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+    stories = range(1, scale.stories + 1)
+    elements = range(1, scale.elements + 1)
+    sets = range(1, scale.result_sets + 1)
+    matrix = json.dumps({f"TH{case:02d}": 0.01 * case for case in range(scale.load_cases)})
+
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO projects (id, name) VALUES (?, ?)", (PROJECT_ID, "Benchmark"))
+        conn.executemany(
+            "INSERT INTO result_sets (id, project_id, name) VALUES (?, ?, ?)",
+            [(set_id, PROJECT_ID, f"SET{set_id}") for set_id in sets],
+        )
+        conn.executemany(
+            "INSERT INTO result_categories (id, result_set_id, category_name, category_type) "
+            "VALUES (?, ?, 'Envelopes', 'Global')",
+            [(set_id, set_id) for set_id in sets],
+        )
+        conn.executemany(
+            "INSERT INTO load_cases (id, project_id, name) VALUES (?, ?, ?)",
+            [
+                (case_id, PROJECT_ID, f"SET{set_id}_TH{case_id:03d}")
+                for set_id in sets
+                for case_id in _case_ids(scale, set_id)
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO stories (id, project_id, name, sort_order) VALUES (?, ?, ?, ?)",
+            [(story, PROJECT_ID, f"L{story:02d}", story) for story in stories],
+        )
+        conn.executemany(
+            "INSERT INTO elements (id, project_id, element_type, name, unique_name) "
+            "VALUES (?, ?, 'Column', ?, ?)",
+            [(element, PROJECT_ID, f"C{element}", str(element)) for element in elements],
+        )
+        conn.executemany(
+            "INSERT INTO column_rotations (element_id, story_id, load_case_id, "
+            "result_category_id, direction, rotation, max_rotation, min_rotation, "
+            "story_sort_order) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (element, _story(element, scale), case, set_id, direction, 0.001, 0.002, -0.002, 0)
+                for set_id in sets
+                for case in _case_ids(scale, set_id)
+                for element in elements
+                for direction in DIRECTIONS
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO story_drifts (story_id, load_case_id, result_category_id, direction, "
+            "drift, story_sort_order) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (story, case, set_id, direction, 0.001, story)
+                for set_id in sets
+                for case in _case_ids(scale, set_id)
+                for story in stories
+                for direction in ("X", "Y")
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO global_results_cache (project_id, result_set_id, result_type, story_id, "
+            "results_matrix, story_sort_order) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (PROJECT_ID, set_id, result_type, story, matrix, story)
+                for set_id in sets
+                for result_type in CACHE_TYPES
+                for story in stories
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO element_results_cache (project_id, result_set_id, result_type, "
+            "element_id, story_id, results_matrix, story_sort_order) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (PROJECT_ID, set_id, result_type, element, _story(element, scale), matrix, 0)
+                for set_id in sets
+                for result_type in ELEMENT_CACHE_TYPES
+                for element in elements
+            ),
+        )
+
+
+def use_legacy_indexes(path: Path) -> None:
+    """Replace the revised indexes with the ones they superseded."""
+    revised = {
+        index.name
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes
+        if index.name.endswith(("_category_case", "_set_type", "_set_type_order"))
+    }
+    with sqlite3.connect(path) as conn:
+        for name in sorted(revised):
+            conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+        for name, table, columns in LEGACY_INDEXES:
+            conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON {table} ({", ".join(columns)})')
+
+
+def _case_ids(scale: QueryScale, set_id: int) -> range:
+    first = (set_id - 1) * scale.load_cases + 1
+    return range(first, first + scale.load_cases)
+
+
+def _story(element: int, scale: QueryScale) -> int:
+    return (element - 1) % scale.stories + 1
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class QueryCase:
+    """One measured call; ``mutates`` cases run on a fresh copy of the database."""
+
+    name: str
+    run: Callable[[Session, QueryScale], int]
+    mutates: bool = False
+
+
+def _delete_load_case_data(session: Session, scale: QueryScale) -> int:
+    stats = LoadCaseDataDeleter.delete_load_case_data(
+        session,
+        project_id=PROJECT_ID,
+        result_set_id=1,
+        result_category_id=1,
+        load_case_ids=list(_case_ids(scale, 1))[:DELETED_CASES],
+    )
+    return sum(stats.values())
+
+
+def _category_cases_read(session: Session, scale: QueryScale) -> int:
+    case_ids = list(_case_ids(scale, scale.result_sets))[:DELETED_CASES]
+    rows = 0
+    for model in (ColumnRotation, StoryDrift):
+        statement = select(model.id, model.load_case_id).where(
+            model.result_category_id == scale.result_sets,
+            model.load_case_id.in_(case_ids),
+        )
+        rows += len(session.execute(statement).all())
+    return rows
+
+
+def _pushover_cache_fetch(session: Session, scale: QueryScale) -> int:
+    records = fetch_cache_records(
+        session,
+        ColumnRotation,
+        "rotation",
+        ["element_id", "story_id", "story_sort_order"],
+        list(_case_ids(scale, 1)),
+        filters=[ColumnRotation.direction == "R2"],
+    )
+    return len(records)
+
+
+def _element_cache_replace(session: Session, scale: QueryScale) -> int:
+    replace_cache_rows(
+        session, ElementResultsCache, 1, ELEMENT_CACHE_TYPES[0], [], project_id=PROJECT_ID
+    )
+    return 0
+
+
+def _global_cache_display(session: Session, scale: QueryScale) -> int:
+    repository = CacheRepository(session)
+    rows = 0
+    for result_type in CACHE_TYPES:
+        rows += len(repository.get_cache_for_display(PROJECT_ID, result_type, result_set_id=1))
+    return rows
+
+
+def _element_cache_set_read(session: Session, scale: QueryScale) -> int:
+    statement = (
+        select(ElementResultsCache)
+        .where(
+            ElementResultsCache.result_set_id == 1,
+            ElementResultsCache.result_type == ELEMENT_CACHE_TYPES[0],
+        )
+        .order_by(ElementResultsCache.id)
+    )
+    return len(session.execute(statement).scalars().all())
+
+
+def _column_rotations_dataset(session: Session, scale: QueryScale) -> int:
+    service = ResultDataService(
+        PROJECT_ID, None, None, None, element_repo=ElementRepository(session), session=session
+    )
+    dataset = service.get_all_column_rotations_dataset(result_set_id=1)
+    return 0 if dataset is None else len(dataset)
+
+
+CASES: Dict[str, QueryCase] = {
+    case.name: case
+    for case in (
+        QueryCase("delete_load_case_data", _delete_load_case_data, mutates=True),
+        QueryCase("category_cases_read", _category_cases_read),
+        QueryCase("pushover_cache_fetch", _pushover_cache_fetch),
+        QueryCase("element_cache_replace", _element_cache_replace, mutates=True),
+        QueryCase("global_cache_display", _global_cache_display),
+        QueryCase("element_cache_set_read", _element_cache_set_read),
+        QueryCase("column_rotations_dataset", _column_rotations_dataset),
+    )
+}
+
+
+def measure_case(case: QueryCase, database: Path, scale: QueryScale, repeat: int) -> Dict[str, Any]:
+    """Median and fastest wall time of ``repeat`` calls on a fresh session each."""
+    timings: List[float] = []
+    rows = 0
+    for _ in range(max(repeat, 1)):
+        target = database
+        if case.mutates:
+            target = database.with_name(f"{database.stem}_scratch.db")
+            shutil.copyfile(database, target)
+        engine = create_engine(f"sqlite:///{target}", poolclass=NullPool)
+        try:
+            with Session(engine) as session:
+                started = time.perf_counter()
+                rows = case.run(session, scale)
+                timings.append(time.perf_counter() - started)
+                session.rollback()
+        finally:
+            engine.dispose()
+    return {
+        "wall_s": min(timings),
+        "median_s": statistics.median(timings),
+        "rows": rows,
+    }
+
+
+def run_benchmarks(
+    scale: QueryScale,
+    workdir: Path,
+    cases: Optional[Sequence[str]] = None,
+    repeat: int = 5,
+    legacy_indexes: bool = False,
+    scale_name: str = "custom",
+    progress: Callable[[str], None] = lambda message: None,
+) -> Dict[str, Any]:
+    """Build (or reuse) the database for ``scale`` and time the selected cases."""
+    database = workdir / f"queries_{'legacy' if legacy_indexes else 'current'}.db"
+    manifest_path = workdir / f"{database.stem}.json"
+    manifest = {"scale": scale.as_dict(), "schema": SCHEMA_VERSION}
+    if (
+        not database.exists()
+        or not manifest_path.exists()
+        or (json.loads(manifest_path.read_text()) != manifest)
+    ):
+        progress(f"Building {database.name} ({scale.rotation_rows:,} column rotation rows)")
+        build_database(database, scale)
+        if legacy_indexes:
+            use_legacy_indexes(database)
+        manifest_path.write_text(json.dumps(manifest))
+
+    results: Dict[str, Any] = {
+        "schema_version": SCHEMA_VERSION,
+        "scale": scale.as_dict(),
+        "scale_name": scale_name,
+        "indexes": "legacy" if legacy_indexes else "current",
+        "cases": {},
+    }
+    for name in cases or list(CASES):
+        metrics = measure_case(CASES[name], database, scale, repeat)
+        results["cases"][name] = metrics
+        progress(
+            f"  {name}: {metrics['wall_s'] * 1000:.2f} ms "
+            f"(median {metrics['median_s'] * 1000:.2f} ms, {metrics['rows']:,} rows)"
+        )
+    return results
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    scale = QueryScale.preset(
+        args.scale,
+        stories=args.stories,
+        elements=args.elements,
+        load_cases=args.load_cases,
+        result_sets=args.result_sets,
+    )
+    print(f"Scale '{args.scale}': {scale.as_dict()}")
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="rps_qbench_"))
+    try:
+        results = run_benchmarks(
+            scale,
+            workdir,
+            cases=args.case,
+            repeat=args.repeat,
+            legacy_indexes=args.legacy_indexes,
+            scale_name=args.scale,
+            progress=print,
+        )
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        print(format_comparisons(compare_results(results, baseline, min_time_delta=0.0)))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Hot query benchmarks on a synthetic project.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Build the database and time the queries.")
+    run_parser.add_argument(
+        "--scale", choices=list(SCALE_PRESETS), default="small", help="Scale preset."
+    )
+    for dimension in ("stories", "elements", "load-cases", "result-sets"):
+        run_parser.add_argument(
+            f"--{dimension}", type=int, help=f"Override the preset's {dimension}."
+        )
+    run_parser.add_argument(
+        "--case",
+        action="append",
+        choices=list(CASES),
+        help="Case to run (repeatable; default: all).",
+    )
+    run_parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per case; fastest and median are kept."
+    )
+    run_parser.add_argument(
+        "--legacy-indexes",
+        action="store_true",
+        help="Measure with the index set from before the composite index revision.",
+    )
+    run_parser.add_argument(
+        "--workdir",
+        help="Keep the generated databases here and reuse them on later runs (default: temp dir).",
+    )
+    run_parser.add_argument("--output", help="Write results JSON to this path.")
+    run_parser.add_argument("--baseline", help="Compare against a stored results JSON.")
+    run_parser.set_defaults(func=cmd_run)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,884 @@
+"""Synthetic ETABS/SAP2000 workbooks for import benchmarks.
+
+Writes workbooks with the same sheet layouts as real ETABS exports (title row,
+header row, units row, then data) at a configurable scale, so import
+throughput can be measured far beyond the tiny correctness fixtures in
+``tests/resources``. Three layouts are produced:
+
+- NLTHA envelopes: every sheet in ``TARGET_SHEETS`` plus the ``Fou`` joint
+  list, with Max/Min rows per load case (also used by the folder importer)
+- Pushover envelopes: the same sheets with ``Push X*``/``Push Y*`` cases
+- Time histories: one load case per file, ``Step By Step`` rows per step
+
+Values come from a seeded generator, so a given scale always produces the
+same workbooks.
+
+Usage:
+    scale = BenchmarkScale.preset("small")
+    rows = write_nltha_workbook(tmp_path / "DES.xlsx", scale)
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import shutil
+import tempfile
+import zipfile
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from processing.folder_importer import TARGET_SHEETS
+
+
+@dataclass(frozen=True)
+class BenchmarkScale:
+    """Size of the generated models.
+
+    Attributes:
+        stories: Stories per model
+        elements: Elements of each type (piers, columns, beams...) per story
+        load_cases: Load cases per workbook (split evenly over X/Y for pushover)
+        steps: Time steps per time-history file
+        files: Workbooks per folder import and time-history batch
+    """
+
+    stories: int = 10
+    elements: int = 10
+    load_cases: int = 6
+    steps: int = 200
+    files: int = 2
+
+    @classmethod
+    def preset(cls, name: str, **overrides: Optional[int]) -> "BenchmarkScale":
+        """Named scale with optional per-dimension overrides (None keeps the preset value)."""
+        if name not in SCALE_PRESETS:
+            raise ValueError(f"Unknown scale '{name}'. Available: {', '.join(SCALE_PRESETS)}")
+        return replace(
+            SCALE_PRESETS[name], **{key: value for key, value in overrides.items() if value}
+        )
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+SCALE_PRESETS: Dict[str, BenchmarkScale] = {
+    "smoke": BenchmarkScale(stories=3, elements=2, load_cases=2, steps=5, files=2),
+    "small": BenchmarkScale(stories=10, elements=10, load_cases=6, steps=200, files=2),
+    "medium": BenchmarkScale(stories=30, elements=40, load_cases=11, steps=1000, files=3),
+    "large": BenchmarkScale(stories=60, elements=120, load_cases=22, steps=4000, files=4),
+}
+
+
+# ---------------------------------------------------------------------------
+# Sheet layouts
+# ---------------------------------------------------------------------------
+
+# Yields the data rows of one sheet
+RowBuilder = Callable[["_Context"], Iterator[list]]
+
+
+@dataclass
+class _Context:
+    stories: List[str]
+    cases: List[str]
+    elements: int
+    case_type: str
+    rng: random.Random
+
+    def value(self, scale: float = 1.0) -> float:
+        return round(self.rng.uniform(-scale, scale), 6)
+
+    def envelope(self) -> Iterator[tuple]:
+        """(story index, story, case, step type) in ETABS export order."""
+        for case in self.cases:
+            for index, story in enumerate(self.stories):
+                for step_type in ("Max", "Min"):
+                    yield index, story, case, step_type
+
+    def unique_name(self, story_index: int, element: int, offset: int = 0) -> str:
+        return str(offset + story_index * self.elements + element + 1)
+
+
+def _story_drifts(ctx: _Context) -> Iterator[list]:
+    for _, story, case, step in ctx.envelope():
+        for direction in ("X", "Y"):
+            yield [
+                story,
+                case,
+                ctx.case_type,
+                step,
+                direction,
+                abs(ctx.value(0.02)),
+                "1",
+                0.0,
+                0.0,
+                3.0,
+            ]
+
+
+def _diaphragm_accelerations(ctx: _Context) -> Iterator[list]:
+    for _, story, case, step in ctx.envelope():
+        maxima = [abs(ctx.value(5000)) for _ in range(6)]
+        minima = [-abs(ctx.value(5000)) for _ in range(6)]
+        yield [story, "D1", case, ctx.case_type, step] + maxima + minima
+
+
+def _story_forces(ctx: _Context) -> Iterator[list]:
+    for _, story, case, step in ctx.envelope():
+        for location in ("Top", "Bottom"):
+            yield [story, case, ctx.case_type, step, location] + [ctx.value(5000) for _ in range(6)]
+
+
+def _joint_displacements(ctx: _Context) -> Iterator[list]:
+    for index, story, case, step in ctx.envelope():
+        for element in range(ctx.elements):
+            label = str(element + 1)
+            yield [story, label, ctx.unique_name(index, element), case, ctx.case_type, step] + [
+                ctx.value(100) for _ in range(6)
+            ]
+
+
+def _pier_forces(ctx: _Context) -> Iterator[list]:
+    for _, story, case, step in ctx.envelope():
+        for element in range(ctx.elements):
+            for location in ("Top", "Bottom"):
+                yield [story, f"P{element + 1}", case, ctx.case_type, step, location] + [
+                    ctx.value(1000) for _ in range(6)
+                ]
+
+
+def _frame_forces(prefix: str, offset: int) -> RowBuilder:
+    def build(ctx: _Context) -> Iterator[list]:
+        for index, story, case, step in ctx.envelope():
+            for element in range(ctx.elements):
+                unique = ctx.unique_name(index, element, offset)
+                for station in (0.0, 3.0):
+                    yield [
+                        story,
+                        f"{prefix}{element + 1}",
+                        unique,
+                        case,
+                        ctx.case_type,
+                        step,
+                        station,
+                    ] + [ctx.value(500) for _ in range(6)] + [
+                        f"{unique}-1",
+                        station,
+                        "Bottom" if station == 0 else "Top",
+                    ]
+
+    return build
+
+
+def _hinge_states(prefix: str, offset: int, hinge: str) -> RowBuilder:
+    def build(ctx: _Context) -> Iterator[list]:
+        for index, story, case, step in ctx.envelope():
+            for element in range(ctx.elements):
+                name = f"{prefix}{element + 1}"
+                yield [
+                    story,
+                    name,
+                    ctx.unique_name(index, element, offset),
+                    case,
+                    ctx.case_type,
+                    step,
+                    hinge,
+                    f"{name}H1",
+                    0.0,
+                    0.0,
+                ] + [ctx.value(500) for _ in range(6)] + [ctx.value(0.02) for _ in range(6)] + [
+                    "A to B",
+                    "A to IO",
+                ]
+
+    return build
+
+
+def _quad_rotations(ctx: _Context) -> Iterator[list]:
+    for index, story, case, step in ctx.envelope():
+        for element in range(ctx.elements):
+            rotation = ctx.value(0.01)
+            yield [
+                story,
+                ctx.unique_name(index, element, 40000),
+                f"QuadGauge{element + 1}",
+                case,
+                ctx.case_type,
+                step,
+                "Pier",
+                rotation,
+                abs(rotation),
+                -abs(rotation),
+                "A to IO",
+            ]
+
+
+def _soil_pressures(ctx: _Context) -> Iterator[list]:
+    # Soil pressures are reported on the base story only, for every foundation shell
+    for case in ctx.cases:
+        for element in range(ctx.elements * len(ctx.stories)):
+            for step in ("Max", "Min"):
+                yield [
+                    "Base",
+                    f"F{element + 1}",
+                    str(element + 1),
+                    str(element + 1),
+                    str(50000 + element),
+                    case,
+                    ctx.case_type,
+                    step,
+                    -abs(ctx.value(300)),
+                    1000.0 * element,
+                    0.0,
+                    0.0,
+                ]
+
+
+_FRAME_UNITS = ["", "", "", "", "", "", "m", "kN", "kN", "kN", "kN-m", "kN-m", "kN-m", "", "m", ""]
+_HINGE_UNITS = [
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "m",
+    "kN",
+    "kN",
+    "kN",
+    "kN-m",
+    "kN-m",
+    "kN-m",
+    "mm",
+    "mm",
+    "mm",
+    "rad",
+    "rad",
+    "rad",
+    "",
+    "",
+]
+_HINGE_HEADER = [
+    "Story",
+    "Frame/Wall",
+    "Unique Name",
+    "Output Case",
+    "Case Type",
+    "Step Type",
+    "Hinge",
+    "Generated Hinge",
+    "Rel Dist",
+    "Abs Dist",
+    "P",
+    "V2",
+    "V3",
+    "T",
+    "M2",
+    "M3",
+]
+
+
+@dataclass(frozen=True)
+class SheetLayout:
+    header: Sequence[str]
+    units: Sequence[str]
+    rows: RowBuilder
+
+
+# Envelope layouts, keyed by ETABS table name, matching the column positions ExcelParser reads
+ENVELOPE_LAYOUTS: Dict[str, SheetLayout] = {
+    "Story Drifts": SheetLayout(
+        [
+            "Story",
+            "Output Case",
+            "Case Type",
+            "Step Type",
+            "Direction",
+            "Drift",
+            "Label",
+            "X",
+            "Y",
+            "Z",
+        ],
+        ["", "", "", "", "", "", "", "m", "m", "m"],
+        _story_drifts,
+    ),
+    "Diaphragm Accelerations": SheetLayout(
+        [
+            "Story",
+            "Diaphragm",
+            "Output Case",
+            "Case Type",
+            "Step Type",
+            "Max UX",
+            "Max UY",
+            "Max UZ",
+            "Max RX",
+            "Max RY",
+            "Max RZ",
+            "Min UX",
+            "Min UY",
+            "Min UZ",
+            "Min RX",
+            "Min RY",
+            "Min RZ",
+        ],
+        ["", "", "", "", ""]
+        + ["mm/sec²"] * 3
+        + ["rad/sec²"] * 3
+        + ["mm/sec²"] * 3
+        + ["rad/sec²"] * 3,
+        _diaphragm_accelerations,
+    ),
+    "Story Forces": SheetLayout(
+        [
+            "Story",
+            "Output Case",
+            "Case Type",
+            "Step Type",
+            "Location",
+            "P",
+            "VX",
+            "VY",
+            "T",
+            "MX",
+            "MY",
+        ],
+        ["", "", "", "", "", "kN", "kN", "kN", "kN-m", "kN-m", "kN-m"],
+        _story_forces,
+    ),
+    "Joint Displacements": SheetLayout(
+        [
+            "Story",
+            "Label",
+            "Unique Name",
+            "Output Case",
+            "Case Type",
+            "Step Type",
+            "Ux",
+            "Uy",
+            "Uz",
+            "Rx",
+            "Ry",
+            "Rz",
+        ],
+        ["", "", "", "", "", "", "mm", "mm", "mm", "rad", "rad", "rad"],
+        _joint_displacements,
+    ),
+    "Pier Forces": SheetLayout(
+        [
+            "Story",
+            "Pier",
+            "Output Case",
+            "Case Type",
+            "Step Type",
+            "Location",
+            "P",
+            "V2",
+            "V3",
+            "T",
+            "M2",
+            "M3",
+        ],
+        ["", "", "", "", "", "", "kN", "kN", "kN", "kN-m", "kN-m", "kN-m"],
+        _pier_forces,
+    ),
+    "Element Forces - Columns": SheetLayout(
+        [
+            "Story",
+            "Column",
+            "Unique Name",
+            "Output Case",
+            "Case Type",
+            "Step Type",
+            "Station",
+            "P",
+            "V2",
+            "V3",
+            "T",
+            "M2",
+            "M3",
+            "Element",
+            "Elem Station",
+            "Location",
+        ],
+        _FRAME_UNITS,
+        _frame_forces("C", 10000),
+    ),
+    "Element Forces - Braces": SheetLayout(
+        [
+            "Story",
+            "Brace",
+            "Unique Name",
+            "Output Case",
+            "Case Type",
+            "Step Type",
+            "Station",
+            "P",
+            "V2",
+            "V3",
+            "T",
+            "M2",
+            "M3",
+            "Element",
+            "Elem Station",
+            "Location",
+        ],
+        _FRAME_UNITS,
+        _frame_forces("D", 20000),
+    ),
+    "Fiber Hinge States": SheetLayout(
+        _HINGE_HEADER + ["U1", "U2", "U3", "R1", "R2", "R3", "Hinge State", "Hinge Status"],
+        _HINGE_UNITS,
+        _hinge_states("C", 10000, "Column Hinge"),
+    ),
+    "Hinge States": SheetLayout(
+        _HINGE_HEADER
+        + [
+            "U1 Plastic",
+            "U2 Plastic",
+            "U3 Plastic",
+            "R1 Plastic",
+            "R2 Plastic",
+            "R3 Plastic",
+            "Hinge State",
+            "Hinge Status",
+        ],
+        _HINGE_UNITS,
+        _hinge_states("B", 30000, "SB2"),
+    ),
+    "Quad Strain Gauge - Rotation": SheetLayout(
+        [
+            "Story",
+            "Name",
+            "PropertyName",
+            "Output Case",
+            "CaseType",
+            "StepType",
+            "Direction",
+            "Rotation",
+            "MaxRotation",
+            "MinRotation",
+            "GaugeStatus",
+        ],
+        ["", "", "", "", "", "", "", "rad", "rad", "rad", ""],
+        _quad_rotations,
+    ),
+    "Soil Pressures": SheetLayout(
+        [
+            "Story",
+            "Shell Object",
+            "Unique Name",
+            "Shell Element",
+            "Joint",
+            "Output Case",
+            "Case Type",
+            "Step Type",
+            "Soil Pressure",
+            "Global X",
+            "Global Y",
+            "Global Z",
+        ],
+        ["", "", "", "", "", "", "", "", "kN/m²", "mm", "mm", "mm"],
+        _soil_pressures,
+    ),
+}
+
+# Pushover importers read these sheets by column name; accelerations are NLTHA-only
+PUSHOVER_SHEETS = (
+    "Story Drifts",
+    "Story Forces",
+    "Joint Displacements",
+    "Pier Forces",
+    "Element Forces - Columns",
+    "Element Forces - Braces",
+    "Fiber Hinge States",
+    "Hinge States",
+    "Quad Strain Gauge - Rotation",
+    "Soil Pressures",
+)
+
+TIME_HISTORY_STEP_TYPE = "Step By Step"
+
+
+# ---------------------------------------------------------------------------
+# Writers
+# ---------------------------------------------------------------------------
+
+
+def story_names(scale: BenchmarkScale) -> List[str]:
+    """Story names top-down, as ETABS lists them."""
+    return [f"L{number:02d}" for number in range(scale.stories, 0, -1)]
+
+
+def nltha_cases(scale: BenchmarkScale, file_index: int = 0) -> List[str]:
+    """Time-history load case names; each file of a folder holds its own block of cases."""
+    first = file_index * scale.load_cases + 1
+    return [f"TH{number:02d}" for number in range(first, first + scale.load_cases)]
+
+
+def pushover_cases(scale: BenchmarkScale) -> Dict[str, List[str]]:
+    """Pushover load cases split over X and Y (at least one each)."""
+    per_direction = max(1, scale.load_cases // 2)
+    return {
+        direction: [f"Push {direction}{number}" for number in range(1, per_direction + 1)]
+        for direction in ("X", "Y")
+    }
+
+
+def write_nltha_workbook(
+    path: Path, scale: BenchmarkScale, file_index: int = 0, sheets: Optional[Sequence[str]] = None
+) -> Dict[str, int]:
+    """Write an NLTHA envelope workbook with every sheet in ``TARGET_SHEETS``.
+
+    Args:
+        path: Output .xlsx path
+        scale: Model size
+        file_index: Position in a folder, selecting this file's load cases
+        sheets: Subset of sheets to write (default: all of ``TARGET_SHEETS``)
+
+    Returns:
+        Data row count per sheet
+    """
+    sheet_names = list(sheets if sheets is not None else TARGET_SHEETS)
+    missing = [name for name in sheet_names if name not in ENVELOPE_LAYOUTS]
+    if missing:
+        raise ValueError(f"No synthetic layout for sheets: {', '.join(missing)}")
+
+    ctx = _Context(
+        story_names(scale),
+        nltha_cases(scale, file_index),
+        scale.elements,
+        "NonDirHist",
+        random.Random(file_index),
+    )
+    return _write_envelope(path, ctx, sheet_names)
+
+
+def write_pushover_workbook(path: Path, scale: BenchmarkScale) -> Dict[str, int]:
+    """Write a pushover envelope workbook read by the global and element pushover importers.
+
+    Returns:
+        Data row count per sheet
+    """
+    cases = pushover_cases(scale)
+    ctx = _Context(
+        story_names(scale),
+        cases["X"] + cases["Y"],
+        scale.elements,
+        "NonStatic",
+        random.Random(1000),
+    )
+    return _write_envelope(path, ctx, PUSHOVER_SHEETS)
+
+
+def write_time_history_workbook(
+    path: Path, scale: BenchmarkScale, load_case: str
+) -> Dict[str, int]:
+    """Write one time-history workbook (header row 1, units row 2, data from row 3).
+
+    Returns:
+        Data row count per sheet
+    """
+    rng = random.Random(load_case)
+    stories = story_names(scale)
+    steps = range(1, scale.steps + 1)
+    layouts = {
+        "Story Drifts": (
+            ["Story", "Output Case", "Case Type", "Step Type", "Step Number", "Direction", "Drift"],
+            ["", "", "", "", "", "", ""],
+            lambda story, step: [
+                [
+                    story,
+                    load_case,
+                    "NonDirHist",
+                    TIME_HISTORY_STEP_TYPE,
+                    step,
+                    direction,
+                    round(rng.uniform(0, 0.02), 6),
+                ]
+                for direction in ("X", "Y")
+            ],
+        ),
+        "Story Forces": (
+            [
+                "Story",
+                "Output Case",
+                "Case Type",
+                "Step Type",
+                "Step Number",
+                "Location",
+                "P",
+                "VX",
+                "VY",
+                "T",
+                "MX",
+                "MY",
+            ],
+            ["", "", "", "", "", "", "kN", "kN", "kN", "kN-m", "kN-m", "kN-m"],
+            lambda story, step: [
+                [story, load_case, "NonDirHist", TIME_HISTORY_STEP_TYPE, step, location]
+                + [round(rng.uniform(-5000, 5000), 3) for _ in range(6)]
+                for location in ("Top", "Bottom")
+            ],
+        ),
+        "Joint Displacements": (
+            [
+                "Story",
+                "Label",
+                "Unique Name",
+                "Output Case",
+                "Case Type",
+                "Step Type",
+                "Step Number",
+                "Ux",
+                "Uy",
+                "Uz",
+                "Rx",
+                "Ry",
+                "Rz",
+            ],
+            ["", "", "", "", "", "", "", "mm", "mm", "mm", "rad", "rad", "rad"],
+            lambda story, step: [
+                [story, 1, story, load_case, "NonDirHist", TIME_HISTORY_STEP_TYPE, step]
+                + [round(rng.uniform(-100, 100), 4) for _ in range(6)]
+            ],
+        ),
+        "Diaphragm Accelerations": (
+            [
+                "Story",
+                "Diaphragm",
+                "Output Case",
+                "Case Type",
+                "Step Type",
+                "Step Number",
+                "Max UX",
+                "Max UY",
+            ],
+            ["", "", "", "", "", "", "mm/sec²", "mm/sec²"],
+            lambda story, step: [
+                [
+                    story,
+                    "D1",
+                    load_case,
+                    "NonDirHist",
+                    TIME_HISTORY_STEP_TYPE,
+                    step,
+                    round(rng.uniform(-5000, 5000), 3),
+                    round(rng.uniform(-5000, 5000), 3),
+                ]
+            ],
+        ),
+    }
+
+    counts: Dict[str, int] = {}
+    with _XlsxWriter(path) as writer:
+        for name, (header, units, build) in layouts.items():
+            rows = (row for step in steps for story in stories for row in build(story, step))
+            counts[name] = writer.add_sheet(name, [header, units], rows)
+    return counts
+
+
+def _write_envelope(path: Path, ctx: _Context, sheet_names: Sequence[str]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    with _XlsxWriter(path) as writer:
+        for name in sheet_names:
+            layout = ENVELOPE_LAYOUTS[name]
+            counts[name] = writer.add_sheet(
+                name, [[f"TABLE:  {name}"], layout.header, layout.units], layout.rows(ctx)
+            )
+
+        if "Joint Displacements" in sheet_names:
+            # Foundation joint list enabling vertical displacements: the bottom story's joints
+            bottom = len(ctx.stories) - 1
+            joints = ([ctx.unique_name(bottom, element)] for element in range(ctx.elements))
+            writer.add_sheet("Fou", [["Unique Name"]], joints)
+    return counts
+
+
+class _XlsxWriter:
+    """Streaming .xlsx writer laid out like Excel's own output.
+
+    openpyxl's write-only mode manages only a few thousand rows per second,
+    which makes the larger scales take minutes to generate. This writer emits
+    the sheet XML directly: cell and row references, a ``<dimension>`` per
+    sheet and one shared string table, as Excel and ETABS write them.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._zip = zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED, compresslevel=1)
+        self._strings: Dict[str, int] = {}
+        self._sheets: List[str] = []
+
+    def __enter__(self) -> "_XlsxWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add_sheet(
+        self, name: str, header_rows: Sequence[Sequence], rows: Iterable[Sequence]
+    ) -> int:
+        """Write a worksheet; returns the number of rows after ``header_rows``."""
+        self._sheets.append(name)
+        strings = self._strings
+        letters = [_column_letters(index) for index in range(64)]
+        width = 1
+        number = 0
+        data_rows = 0
+        with tempfile.TemporaryFile() as body:
+            chunk: List[str] = []
+            for row in itertools.chain(header_rows, rows):
+                number += 1
+                if number > len(header_rows):
+                    data_rows += 1
+                cells = []
+                for column, value in enumerate(row):
+                    if value is None or value == "":
+                        continue
+                    if isinstance(value, str):
+                        index = strings.get(value)
+                        if index is None:
+                            index = strings[value] = len(strings)
+                        cells.append(f'<c r="{letters[column]}{number}" t="s"><v>{index}</v></c>')
+                    else:
+                        cells.append(f'<c r="{letters[column]}{number}"><v>{value!r}</v></c>')
+                width = max(width, len(row))
+                chunk.append(f'<row r="{number}">{"".join(cells)}</row>')
+                if len(chunk) >= 5000:
+                    body.write("".join(chunk).encode("utf-8"))
+                    chunk = []
+            body.write("".join(chunk).encode("utf-8"))
+
+            dimension = f"A1:{letters[width - 1]}{number}" if number else "A1"
+            body.seek(0)
+            with self._zip.open(f"xl/worksheets/sheet{len(self._sheets)}.xml", "w") as part:
+                part.write(
+                    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<worksheet xmlns="{_MAIN_NS}">'
+                    f'<dimension ref="{dimension}"/><sheetData>'.encode("utf-8")
+                )
+                shutil.copyfileobj(body, part)
+                part.write(b"</sheetData></worksheet>")
+        return data_rows
+
+    def close(self) -> None:
+        if self._zip.fp is None:
+            return
+        sheets = range(1, len(self._sheets) + 1)
+        self._zip.writestr(
+            "[Content_Types].xml",
+            (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                '<Default Extension="xml" ContentType="application/xml"/>'
+                '<Override PartName="/xl/workbook.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                + "".join(
+                    f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+                    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                    for i in sheets
+                )
+                + '<Override PartName="/xl/sharedStrings.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+                '<Override PartName="/xl/styles.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+                "</Types>"
+            ),
+        )
+        self._zip.writestr(
+            "_rels/.rels",
+            (
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Relationships xmlns="{_REL_NS}">'
+                f'<Relationship Id="rId1" Type="{_DOC_REL}/officeDocument" Target="xl/workbook.xml"/>'
+                "</Relationships>"
+            ),
+        )
+        self._zip.writestr(
+            "xl/workbook.xml",
+            (
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<workbook xmlns="{_MAIN_NS}" '
+                f'xmlns:r="{_DOC_REL}"><sheets>'
+                + "".join(
+                    f'<sheet name="{escape(name, _QUOTE)}" sheetId="{i}" r:id="rId{i}"/>'
+                    for i, name in zip(sheets, self._sheets)
+                )
+                + "</sheets></workbook>"
+            ),
+        )
+        extra = len(self._sheets)
+        self._zip.writestr(
+            "xl/_rels/workbook.xml.rels",
+            (
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Relationships xmlns="{_REL_NS}">'
+                + "".join(
+                    f'<Relationship Id="rId{i}" Type="{_DOC_REL}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+                    for i in sheets
+                )
+                + f'<Relationship Id="rId{extra + 1}" Type="{_DOC_REL}/sharedStrings" Target="sharedStrings.xml"/>'
+                f'<Relationship Id="rId{extra + 2}" Type="{_DOC_REL}/styles" Target="styles.xml"/>'
+                "</Relationships>"
+            ),
+        )
+        self._zip.writestr(
+            "xl/sharedStrings.xml",
+            (
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<sst xmlns="{_MAIN_NS}" '
+                f'count="{len(self._strings)}" uniqueCount="{len(self._strings)}">'
+                + "".join(f"<si><t>{escape(text)}</t></si>" for text in self._strings)
+                + "</sst>"
+            ),
+        )
+        self._zip.writestr(
+            "xl/styles.xml",
+            (
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<styleSheet xmlns="{_MAIN_NS}">'
+                '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+                '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+                '<fill><patternFill patternType="gray125"/></fill></fills>'
+                '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+                '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+                '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+                '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+                "</styleSheet>"
+            ),
+        )
+        self._zip.close()
+
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_QUOTE = {'"': "&quot;"}
+
+
+def _column_letters(index: int) -> str:
+    """Convert a 0-based column index to letters (0 → 'A', 27 → 'AB')."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+__all__ = [
+    "BenchmarkScale",
+    "ENVELOPE_LAYOUTS",
+    "PUSHOVER_SHEETS",
+    "SCALE_PRESETS",
+    "nltha_cases",
+    "pushover_cases",
+    "story_names",
+    "write_nltha_workbook",
+    "write_pushover_workbook",
+    "write_time_history_workbook",
+]
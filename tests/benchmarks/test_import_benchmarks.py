@@ -0,0 +1,119 @@
+"""Tests for the synthetic workbooks and the import benchmark runner.
+
+Only the ``smoke`` scale runs here; real measurements go through the CLI.
+"""
+
+import json
+
+import pytest
+
+from processing.excel_parser import ExcelParser
+from processing.folder_importer import TARGET_SHEETS
+from processing.time_history_parser import TimeHistoryParser
+from processing.xlsx_scanner import XlsxScanner
+from tests.benchmarks.import_benchmarks import CASES, compare_results, main, run_benchmarks
+from tests.benchmarks.synthetic_workbooks import (
+    BenchmarkScale,
+    nltha_cases,
+    story_names,
+    write_nltha_workbook,
+    write_time_history_workbook,
+)
+
+SMOKE = BenchmarkScale.preset("smoke")
+
+
+def test_nltha_workbook_has_every_target_sheet(tmp_path):
+    path = tmp_path / "DES.xlsx"
+    rows = write_nltha_workbook(path, SMOKE, file_index=1)
+
+    parser = ExcelParser(str(path))
+    assert set(TARGET_SHEETS) <= set(parser.get_available_sheets())
+    _, load_cases, stories = parser.get_story_drifts()
+    _, _, _, piers = parser.get_pier_forces()
+    parser.close()
+
+    assert load_cases == nltha_cases(SMOKE, file_index=1) == ["TH03", "TH04"]
+    assert stories == story_names(SMOKE)
+    assert piers == ["P1", "P2"]
+    with XlsxScanner(path) as scanner:
+        # Title, header and units rows precede the data
+        assert all(scanner.row_count(sheet) == count + 3 for sheet, count in rows.items())
+
+
+def test_time_history_workbook_parses(tmp_path):
+    path = tmp_path / "TH01.xlsx"
+    write_time_history_workbook(path, SMOKE, "TH01")
+
+    result = TimeHistoryParser(path).parse()
+
+    assert result.load_case_name == "TH01"
+    assert result.stories == story_names(SMOKE)
+    assert [len(series.values) for series in result.drifts_x] == [SMOKE.steps] * SMOKE.stories
+    assert len(result.accelerations_y) == SMOKE.stories
+
+
+def test_preset_overrides_and_unknown_preset():
+    assert BenchmarkScale.preset("smoke", stories=7, steps=None).stories == 7
+    assert BenchmarkScale.preset("smoke", steps=None).steps == SMOKE.steps
+    with pytest.raises(ValueError, match="Unknown scale"):
+        BenchmarkScale.preset("huge")
+
+
+def test_run_benchmarks_in_process(tmp_path):
+    results = run_benchmarks(SMOKE, tmp_path, isolated=False, scale_name="smoke")
+
+    assert results["scale"] == SMOKE.as_dict()
+    assert list(results["cases"]) == list(CASES)
+    for metrics in results["cases"].values():
+        assert metrics["rows"] > 0
+        assert metrics["wall_s"] > 0
+        assert metrics["rows_per_s"] > 0
+    assert results["cases"]["folder_importer"]["details"]["errors"] == 0
+    assert set(results["cases"]["pushover_elements"]["details"]["importer_seconds"]) >= {
+        "wall",
+        "beam_rotation",
+    }
+    # Inputs are generated once per scale and reused
+    assert (tmp_path / "inputs" / "manifest.json").exists()
+    json.dumps(results)
+
+
+def _results(wall_s, peak_rss_mb, scale=None):
+    return {
+        "scale": scale or SMOKE.as_dict(),
+        "cases": {"data_importer": {"wall_s": wall_s, "peak_rss_mb": peak_rss_mb, "rows": 100}},
+    }
+
+
+def test_compare_flags_time_and_memory_regressions():
+    comparisons = compare_results(_results(2.0, 260.0), _results(1.0, 200.0))
+
+    assert [(item.metric, item.regression) for item in comparisons] == [
+        ("wall_s", True),
+        ("peak_rss_mb", True),
+    ]
+    assert comparisons[0].change == pytest.approx(1.0)
+
+
+def test_compare_ignores_noise_and_missing_rss():
+    # +40% but only 0.02 s slower: below the minimum time delta
+    comparisons = compare_results(_results(0.07, None), _results(0.05, 200.0))
+
+    assert [(item.metric, item.regression) for item in comparisons] == [("wall_s", False)]
+
+
+def test_compare_rejects_different_scales():
+    with pytest.raises(ValueError, match="Scale mismatch"):
+        compare_results(_results(1.0, 100.0), _results(1.0, 100.0, scale={"stories": 99}))
+
+
+def test_compare_command_exit_code(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps(_results(1.0, 200.0)))
+    current.write_text(json.dumps(_results(1.1, 210.0)))
+
+    assert main(["compare", str(current), str(baseline)]) == 0
+    assert main(["compare", str(current), str(baseline), "--tolerance", "0.05"]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,15 @@
+"""Smoke test for the query benchmark runner (real measurements go through the CLI)."""
+
+from tests.benchmarks.query_benchmarks import CASES, QueryScale, run_benchmarks
+
+SMOKE = QueryScale.preset("smoke")
+
+
+def test_every_case_runs_with_current_and_legacy_indexes(tmp_path):
+    for legacy in (False, True):
+        results = run_benchmarks(SMOKE, tmp_path, repeat=1, legacy_indexes=legacy)
+
+        assert results["indexes"] == ("legacy" if legacy else "current")
+        assert set(results["cases"]) == set(CASES)
+        assert results["cases"]["delete_load_case_data"]["rows"] > 0
+        assert all(metrics["wall_s"] >= 0 for metrics in results["cases"].values())
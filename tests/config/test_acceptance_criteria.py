@@ -0,0 +1,58 @@
+"""Tests for acceptance limit resolution."""
+
+import pytest
+
+from config.acceptance_criteria import (
+    ACCEPTANCE_LIMITS,
+    AcceptanceLimit,
+    apply_overrides,
+    dcr_band,
+    has_limits,
+    resolve_limit,
+)
+
+LIMITS = (
+    AcceptanceLimit("Drifts", 2.0),
+    AcceptanceLimit("QuadRotations", 1.5),
+    AcceptanceLimit("QuadRotations", 0.8, element_group="C*"),
+    AcceptanceLimit("ColumnRotations_R2", 3.0),
+    AcceptanceLimit("SoilPressures_Min", -400.0),
+)
+
+
+@pytest.mark.parametrize(
+    ("result_type", "element_name", "expected"),
+    [
+        ("Drifts_X", None, 2.0),  # Base type covers its variants
+        ("QuadRotations", "P1", 1.5),
+        ("QuadRotations", "C12", 0.8),  # Group limit wins
+        ("QuadRotations", None, 1.5),
+        ("ColumnRotations_R2", "C1", 3.0),
+        ("ColumnRotations_R3", "C1", None),
+        ("SoilPressures_Min", None, 400.0),  # Compared with |demand|
+        ("Accelerations_X", None, None),
+    ],
+)
+def test_resolve_limit(result_type, element_name, expected):
+    assert resolve_limit(LIMITS, result_type, element_name) == expected
+
+
+def test_overrides_replace_limits_by_key():
+    limits = apply_overrides(LIMITS, {"QuadRotations|C*": 1.0, "Drifts": 2.5, "Unknown": 9.0})
+
+    assert resolve_limit(limits, "QuadRotations", "C1") == 1.0
+    assert resolve_limit(limits, "Drifts_Y") == 2.5
+    assert resolve_limit(apply_overrides(LIMITS, {"Drifts": 0.0}), "Drifts_X") is None
+    assert has_limits(ACCEPTANCE_LIMITS, "BeamRotations_R3Plastic")
+    assert not has_limits(ACCEPTANCE_LIMITS, "WallShears_V2")
+
+
+def test_dcr_band():
+    assert [dcr_band(value) for value in (None, float("nan"), 0.5, 0.8, 1.0, 2.0)] == [
+        None,
+        None,
+        None,
+        "warning",
+        "exceeded",
+        "exceeded",
+    ]
@@ -1,5 +1,6 @@
 """Pytest configuration and fixtures."""
 
+import os
 import sys
 from pathlib import Path
 from typing import Generator
@@ -23,6 +24,31 @@
 )
 
 
+# ---------------------------------------------------------------------------
+# Index audit (RPS_INDEX_AUDIT=<report.json> captures query plans of every test)
+# ---------------------------------------------------------------------------
+
+_index_auditor = None
+
+
+def pytest_sessionstart(session):
+    global _index_auditor
+    if os.environ.get("RPS_INDEX_AUDIT"):
+        from database.index_audit import IndexAuditor
+
+        _index_auditor = IndexAuditor()
+        _index_auditor.install()
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _index_auditor is None:
+        return
+    _index_auditor.uninstall()
+    path = _index_auditor.write_report(Path(os.environ["RPS_INDEX_AUDIT"]))
+    terminalreporter.write_line(_index_auditor.format_report())
+    terminalreporter.write_line(f"Index audit report: {path}")
+
+
 # ---------------------------------------------------------------------------
 # Database Fixtures
 # ---------------------------------------------------------------------------
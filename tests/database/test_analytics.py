@@ -0,0 +1,173 @@
+"""Tests for analytics.py and the report queries built on it."""
+
+import sqlite3
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from database.analytics import (
+    DuckDBAnalytics,
+    SQLiteAnalytics,
+    configured_engine,
+    get_analytics,
+    literal_sql,
+    open_analytics,
+)
+from database.base import Base
+from database.models import Element, LoadCase, ResultCategory, WallShear
+from services.reporting_data import ReportingDataService
+
+
+def test_pivot_keeps_first_appearance_order_and_last_value():
+    frame = pd.DataFrame(
+        {
+            "Story": ["L2", "L2", "L1", "L1", "L2"],
+            "load_case": ["TH02", "TH01", "TH01", "TH03", "TH02"],
+            "value": [1.0, 2.0, 3.0, 4.0, 5.0],
+        }
+    )
+
+    wide = SQLiteAnalytics(None).pivot(frame, ["Story"], "load_case", "value")
+
+    assert list(wide.columns) == ["Story", "TH02", "TH01", "TH03"]
+    assert wide["Story"].tolist() == ["L2", "L1"]
+    assert wide.loc[0, "TH02"] == 5.0
+    assert pd.isna(wide.loc[0, "TH03"]) and pd.isna(wide.loc[1, "TH02"])
+
+
+def test_literal_sql_matches_session_results(db_session, sample_project, sample_load_cases):
+    statement = (
+        select(LoadCase.name.label("name"), (LoadCase.id * 1.5).label("scaled"))
+        .where(LoadCase.project_id == sample_project.id, LoadCase.name.like("DES%"))
+        .order_by(LoadCase.name)
+    )
+    expected = SQLiteAnalytics(db_session).frame(statement)
+
+    connection = db_session.connection().connection.dbapi_connection
+    assert isinstance(connection, sqlite3.Connection)
+    rows = connection.execute(literal_sql(statement)).fetchall()
+
+    assert [tuple(row) for row in expected.itertuples(index=False)] == rows
+    assert expected["name"].tolist() == ["DES_X", "DES_Y"]
+
+
+def test_in_memory_sessions_fall_back_to_sqlite(db_session, monkeypatch):
+    assert get_analytics(db_session, "duckdb").name == "sqlite"
+
+    monkeypatch.delenv("RPS_ANALYTICS_ENGINE", raising=False)
+    assert configured_engine() == "sqlite"
+    monkeypatch.setenv("RPS_ANALYTICS_ENGINE", "DuckDB")
+    assert configured_engine() == "duckdb"
+    monkeypatch.setenv("RPS_ANALYTICS_ENGINE", "parquet")
+    assert configured_engine() == "sqlite"
+
+
+@pytest.fixture
+def wall_shears(db_session, sample_project, sample_result_set, sample_stories, sample_load_cases):
+    category = ResultCategory(
+        result_set_id=sample_result_set.id, category_name="Envelopes", category_type="Elements"
+    )
+    walls = [Element(project_id=sample_project.id, element_type="Wall", name=n) for n in "PQ"]
+    db_session.add_all([category, *walls])
+    db_session.flush()
+    rows = [
+        # story, wall, load case, force, max, min
+        (1, 0, 0, 1.0, 4.0, -6.0),
+        (1, 0, 1, 2.0, 3.0, None),
+        (1, 1, 0, 9.0, None, None),
+        (0, 0, 0, 5.0, None, -2.0),
+    ]
+    for story, wall, load_case, force, max_force, min_force in rows:
+        db_session.add(
+            WallShear(
+                element_id=walls[wall].id,
+                story_id=sample_stories[story].id,
+                load_case_id=sample_load_cases[load_case].id,
+                result_category_id=category.id,
+                direction="V2",
+                force=force,
+                max_force=max_force,
+                min_force=min_force,
+            )
+        )
+    db_session.commit()
+    return sample_project.id, sample_result_set.id
+
+
+def test_element_report_table_and_plot_data(db_session, wall_shears):
+    project_id, result_set_id = wall_shears
+
+    data = ReportingDataService(lambda: db_session).get_wall_shear_data(
+        project_id, result_set_id, "NLTHA"
+    )
+
+    table = data["all_data"]
+    assert data["load_cases"] == ["DES_X", "DES_Y"]
+    assert table[["Story", "Wall"]].values.tolist() == [
+        ["Ground", "P"],
+        ["Level 1", "P"],
+        ["Level 1", "Q"],
+    ]
+    # Larger magnitude of max/min, else the one present, else the force
+    assert table["DES_X"].tolist() == [-2.0, -6.0, 9.0]
+    assert table["DES_Y"].tolist()[1] == 3.0
+    assert table["Avg"].tolist()[1] == pytest.approx(-1.5)
+    assert data["plot_data_max"] == [("Level 1", 1, 4.0), ("Level 1", 1, 3.0), ("Level 1", 1, 9.0)]
+    assert data["plot_data_min"] == [("Ground", 0, -2.0), ("Level 1", 1, -6.0), ("Level 1", 1, 9.0)]
+    assert data["stories"] == ["Level 1", "Ground"]
+
+
+class TestDuckDBParity:
+    """DuckDB runs SQLite-compiled SQL, so its results must match the SQLite backend."""
+
+    @pytest.fixture
+    def db_session(self, tmp_path):
+        pytest.importorskip("duckdb")
+        engine = create_engine(f"sqlite:///{tmp_path / 'project.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            yield session
+        finally:
+            session.close()
+            engine.dispose()
+
+    def test_frame_matches_sqlite(self, db_session, wall_shears):
+        statement = (
+            select(
+                Element.name.label("Wall"),
+                LoadCase.name.label("load_case"),
+                (WallShear.force * 2.5).label("value"),
+            )
+            .join(Element, WallShear.element_id == Element.id)
+            .join(LoadCase, WallShear.load_case_id == LoadCase.id)
+            .order_by(WallShear.id)
+        )
+
+        expected = SQLiteAnalytics(db_session).frame(statement)
+        duckdb_analytics = DuckDBAnalytics(db_session)
+        try:
+            actual = duckdb_analytics.frame(statement)
+        finally:
+            duckdb_analytics.close()
+
+        assert len(expected) == 4
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+    def test_element_report_matches_sqlite(self, db_session, wall_shears, monkeypatch):
+        project_id, result_set_id = wall_shears
+        service = ReportingDataService(lambda: db_session)
+
+        monkeypatch.setenv("RPS_ANALYTICS_ENGINE", "sqlite")
+        expected = service.get_wall_shear_data(project_id, result_set_id, "NLTHA")
+        monkeypatch.setenv("RPS_ANALYTICS_ENGINE", "duckdb")
+        with open_analytics(db_session) as analytics:
+            assert analytics.name == "duckdb"
+        actual = service.get_wall_shear_data(project_id, result_set_id, "NLTHA")
+
+        for key in ("all_data", "top_10"):
+            pd.testing.assert_frame_equal(actual[key], expected[key], check_dtype=False)
+        for key in ("load_cases", "stories", "plot_data_max", "plot_data_min"):
+            assert actual[key] == expected[key]
@@ -0,0 +1,120 @@
+"""Tests for index_audit.py and the composite result/cache indexes."""
+
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from database.base import RETIRED_INDEXES, dispose_project_engine, init_project_db
+from database.index_audit import IndexAuditor, PlanRecord
+from database.models import ColumnRotation, ElementResultsCache
+from database.session import project_session_factory
+from processing.data_deleter import LoadCaseDataDeleter
+from processing.pushover.pushover_cache_writer import replace_cache_rows
+from tests.benchmarks.query_benchmarks import (
+    LEGACY_INDEXES,
+    QueryScale,
+    build_database,
+    use_legacy_indexes,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE rows (id INTEGER PRIMARY KEY, kind TEXT, value REAL)"))
+    return engine
+
+
+@pytest.fixture
+def project_db(tmp_path):
+    path = tmp_path / "project.db"
+    build_database(path, QueryScale(stories=3, elements=6, load_cases=3, result_sets=2))
+    yield path
+    dispose_project_engine(path)
+
+
+def _audit(engine, statements):
+    auditor = IndexAuditor()
+    auditor.install(engine)
+    try:
+        with engine.connect() as conn:
+            for statement, params in statements:
+                conn.execute(text(statement), params)
+    finally:
+        auditor.uninstall()
+    return auditor
+
+
+def test_plan_record_flags_scans_but_not_index_reads():
+    assert PlanRecord("q", ["SCAN rows"]).full_scans == ["rows"]
+    assert PlanRecord("q", ["SCAN rows USING COVERING INDEX ix_kind"]).full_scans == []
+    assert PlanRecord("q", ["SCAN CONSTANT ROW"]).full_scans == []
+    assert PlanRecord("q", ["SEARCH rows USING INDEX ix_kind (kind=?)"]).full_scans == []
+    assert PlanRecord("q", ["USE TEMP B-TREE FOR ORDER BY"]).temp_btree
+
+
+def test_auditor_records_one_plan_per_fingerprint(engine):
+    auditor = _audit(
+        engine,
+        [("SELECT * FROM rows WHERE kind = :kind", {"kind": kind}) for kind in ("a", "b")],
+    )
+
+    (record,) = auditor.records()
+    assert record.fingerprint == "SELECT * FROM rows WHERE kind = ?"
+    assert record.count == 2
+    assert record.full_scans == ["rows"]
+    assert "1 with full table scans" in auditor.format_report()
+
+
+def test_auditor_sees_indexes(engine, tmp_path):
+    with engine.begin() as conn:
+        conn.execute(text("CREATE INDEX ix_kind ON rows (kind)"))
+
+    auditor = _audit(engine, [("SELECT * FROM rows WHERE kind = :kind", {"kind": "a"})])
+
+    (record,) = auditor.records()
+    assert record.full_scans == []
+    assert "ix_kind" in record.plan[0]
+    report = auditor.write_report(tmp_path / "audit.json")
+    assert '"with_full_scans": 0' in report.read_text()
+
+
+def test_hot_result_and_cache_statements_use_composite_indexes(project_db):
+    session = project_session_factory(project_db)()
+    auditor = IndexAuditor()
+    auditor.install(session.get_bind())
+    try:
+        LoadCaseDataDeleter.delete_load_case_data(session, 1, 1, 1, [1, 2])
+        replace_cache_rows(session, ElementResultsCache, 1, "ColumnRotations_R2", [], project_id=1)
+        session.query(ColumnRotation).filter(ColumnRotation.result_category_id == 2).all()
+        session.commit()
+    finally:
+        auditor.uninstall()
+        session.close()
+
+    plans = {record.fingerprint: record for record in auditor.records()}
+    deletes = [record for key, record in plans.items() if key.startswith("DELETE")]
+    assert deletes and not any(record.full_scans for record in deletes)
+    plan_text = "\n".join(line for record in plans.values() for line in record.plan)
+    assert "ix_colrot_category_case (result_category_id=? AND load_case_id=?)" in plan_text
+    assert "ix_elem_cache_set_type (result_set_id=? AND result_type=?)" in plan_text
+    assert all(record.origins for record in deletes)
+
+
+def test_opening_a_project_database_upgrades_its_indexes(project_db):
+    use_legacy_indexes(project_db)
+
+    init_project_db(project_db)
+
+    with sqlite3.connect(project_db) as conn:
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        indexes = {name for (name,) in rows}
+    assert not indexes & RETIRED_INDEXES
+    assert {name for name, _, _ in LEGACY_INDEXES} == set(RETIRED_INDEXES)
+    assert {
+        "ix_colrot_category_case",
+        "ix_cache_set_type_order",
+        "ix_joint_cache_set_type",
+    } <= indexes
@@ -0,0 +1,190 @@
+"""Tests for query_profile.py"""
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+
+import database.query_profile as query_profile
+from database.query_profile import (
+    UNSCOPED_OPERATION,
+    QueryProfiler,
+    fingerprint,
+    is_query_profiling_enabled,
+    profile_engine,
+    set_query_profiling_enabled,
+)
+from utils.error_handling import timed
+from utils.timing import PhaseTimer, operation
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE stories (id INTEGER PRIMARY KEY, name TEXT)"))
+    return engine
+
+
+@pytest.fixture
+def profiler(engine):
+    profiler = QueryProfiler(slow_query_ms=10_000, repeated_threshold=5)
+    profiler.install(engine)
+    yield profiler
+    profiler.uninstall()
+
+
+def _by_operation(profiler):
+    return {(stats.operation, stats.fingerprint): stats for stats in profiler.snapshot()}
+
+
+def test_fingerprint_collapses_literals_and_parameter_lists():
+    assert fingerprint("SELECT *\n  FROM stories WHERE id IN (?, ?, ?) AND name = 'L''1'") == (
+        "SELECT * FROM stories WHERE id IN (?) AND name = ?"
+    )
+    assert fingerprint("SELECT anon_1.x FROM t LIMIT 10 OFFSET 20") == (
+        "SELECT anon_1.x FROM t LIMIT ? OFFSET ?"
+    )
+    assert (
+        fingerprint("INSERT INTO t (a, b) VALUES (?, ?), (?, ?)")
+        == "INSERT INTO t (a, b) VALUES (?)"
+    )
+
+
+def test_statements_are_grouped_per_operation(engine, profiler):
+    timer = PhaseTimer()
+    with engine.begin() as conn:
+        with timer.measure("stories"):
+            conn.execute(text("INSERT INTO stories (name) VALUES ('L1')"))
+            conn.execute(text("INSERT INTO stories (name) VALUES ('L2')"))
+        with operation("lookup"):
+            conn.execute(text("SELECT * FROM stories WHERE id = 1"))
+        conn.execute(text("SELECT count(*) FROM stories"))
+
+    stats = _by_operation(profiler)
+
+    inserts = stats[("stories", "INSERT INTO stories (name) VALUES (?)")]
+    assert inserts.count == 2
+    assert inserts.rows == 2
+    assert inserts.total_ms > 0
+    assert 0 < inserts.p95_ms <= inserts.max_s * 1000
+    assert stats[("lookup", "SELECT * FROM stories WHERE id = ?")].count == 1
+    assert (UNSCOPED_OPERATION, "SELECT count(*) FROM stories") in stats
+
+
+def test_timed_functions_are_operations(engine, profiler):
+    @timed
+    def load_dataset():
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT name FROM stories")).all()
+
+    load_dataset()
+
+    operations = {stats.operation for stats in profiler.snapshot()}
+    assert any(name.endswith("load_dataset") for name in operations)
+
+
+def test_slow_queries_are_logged(engine, caplog):
+    profiler = QueryProfiler(slow_query_ms=0)
+    profiler.install(engine)
+    try:
+        with caplog.at_level(logging.WARNING, logger="database.query_profile"):
+            with engine.connect() as conn, operation("export"):
+                conn.execute(text("SELECT 1"))
+    finally:
+        profiler.uninstall()
+
+    record = next(record for record in caplog.records if record.getMessage() == "Slow query")
+    assert record.operation == "export"
+    assert record.statement == "SELECT ?"
+    assert profiler.snapshot()[0].slow_count == 1
+
+
+def test_repeated_queries_are_flagged_once_per_operation_run(engine, profiler, caplog):
+    with caplog.at_level(logging.WARNING, logger="database.query_profile"):
+        with engine.connect() as conn:
+            for _ in range(3):
+                # Same operation name, separate runs below the threshold
+                with operation("get_or_create"):
+                    for story_id in range(3):
+                        conn.execute(text(f"SELECT * FROM stories WHERE id = {story_id}"))
+            assert not caplog.records
+
+            with operation("get_or_create"):
+                for story_id in range(12):
+                    conn.execute(text(f"SELECT * FROM stories WHERE id = {story_id}"))
+
+    warnings = [record for record in caplog.records if "N+1" in record.getMessage()]
+    assert len(warnings) == 1
+    assert warnings[0].statement == "SELECT * FROM stories WHERE id = ?"
+    (stats,) = profiler.snapshot()
+    assert stats.count == 21
+    assert stats.repeated
+
+
+def test_executemany_is_not_a_repeated_query(engine, profiler):
+    with engine.begin() as conn, operation("bulk"):
+        for _ in range(6):
+            conn.execute(
+                text("INSERT INTO stories (name) VALUES (:name)"), [{"name": "A"}, {"name": "B"}]
+            )
+
+    (stats,) = profiler.snapshot()
+    assert stats.count == 6
+    assert stats.rows == 12
+    assert not stats.repeated
+
+
+def test_failed_statement_does_not_skew_timings(engine, profiler):
+    with engine.connect() as conn:
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+        assert not conn.info.get("rps_query_start")
+
+    assert [stats.fingerprint for stats in profiler.snapshot()] == ["SELECT ?"]
+
+
+def test_reset_and_uninstall(engine, profiler):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    profiler.reset()
+    assert profiler.snapshot() == []
+
+    profiler.uninstall()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert profiler.snapshot() == []
+
+
+def test_profiling_is_opt_in_and_limited_to_registered_engines(engine, monkeypatch):
+    monkeypatch.delenv("RPS_SQL_PROFILE", raising=False)
+    monkeypatch.setattr(query_profile, "_enabled", None)
+    monkeypatch.setattr(query_profile, "_engines", type(query_profile._engines)())
+    profiler = QueryProfiler()
+    monkeypatch.setattr(query_profile, "_profiler", profiler)
+    other = create_engine("sqlite:///:memory:")
+
+    assert not is_query_profiling_enabled()
+    profile_engine(engine)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert profiler.snapshot() == []
+
+    set_query_profiling_enabled(True)
+    try:
+        for target in (engine, other):
+            with target.connect() as conn:
+                conn.execute(text("SELECT 2"))
+        (stats,) = profiler.snapshot()
+        assert stats.count == 1  # The unregistered engine is not profiled
+    finally:
+        set_query_profiling_enabled(False)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 3"))
+    assert profiler.snapshot()[0].count == 1
+
+    monkeypatch.setenv("RPS_SQL_PROFILE", "1")
+    monkeypatch.setattr(query_profile, "_enabled", None)
+    assert is_query_profiling_enabled()
@@ -81,6 +81,19 @@ def test_list_all_returns_all_entities(self, test_session):
 
         assert len(all_projects) == 3
 
+    def test_get_names_queries_ids_in_chunks(self, test_session, monkeypatch):
+        """Test get_names maps IDs to names across several IN queries."""
+        import database.base_repository as base_repository
+
+        monkeypatch.setattr(base_repository, "IN_QUERY_CHUNK", 2)
+        repo = ProjectRepository(test_session)
+        ids = [repo.create(name=f"Project {i}").id for i in range(5)]
+
+        names = repo.get_names([ids[4], ids[0], ids[2], ids[2], None, 9999])
+
+        assert names == {ids[0]: "Project 0", ids[2]: "Project 2", ids[4]: "Project 4"}
+        assert repo.get_names([]) == {}
+
 
 class TestProjectRepository:
     """Tests for ProjectRepository specific methods."""
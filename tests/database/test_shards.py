@@ -0,0 +1,361 @@
+"""Tests for shards.py (per-result-set shard databases)."""
+
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from database.base import dispose_project_engine, get_project_session, init_project_db
+from database.models import (
+    Element,
+    ElementResultsCache,
+    GlobalResultsCache,
+    LoadCase,
+    Project,
+    ResultCategory,
+    ResultSet,
+    Story,
+    StoryDrift,
+    TimeSeriesGlobalCache,
+    WallShear,
+)
+from database.shards import (
+    create_shard,
+    drop_shard,
+    get_shard_session,
+    list_shards,
+    move_to_shard,
+    replace_shard,
+    shard_path,
+)
+from database.session import result_set_session_factory
+from processing.data_deleter import LoadCaseDataDeleter
+from processing.folder_importer import FolderImporter
+from processing.time_history_importer import TimeHistoryImporter, TimeSeriesRepository
+from processing.time_history_parser import TimeHistoryParseResult, TimeSeriesData
+from services.data_access import DataAccessService
+from services.export.discovery import ExportDiscovery
+from services.export.import_data import ImportDataBuilder
+from services.import_manifest import read_payload
+from services.project_service import ProjectContext
+from services.reporting_data import ReportingDataService
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def project_db(tmp_path):
+    path = tmp_path / "tower.db"
+    init_project_db(path)
+    session = get_project_session(path)
+    project = Project(name="Tower")
+    session.add(project)
+    session.flush()
+    sets = [ResultSet(project_id=project.id, name=name) for name in ("DES", "MCE")]
+    session.add_all(sets)
+    session.commit()
+    ids = (project.id, sets[0].id, sets[1].id)
+    session.close()
+    yield path, ids
+    dispose_project_engine(path)
+
+
+def _import(session, project_id, result_set_id, load_case="TH01"):
+    series = TimeSeriesData(
+        story="Roof",
+        direction="X",
+        time_steps=[0.0, 0.01, 0.02],
+        values=[0.0, 1.5, -0.5],
+        story_sort_order=0,
+    )
+    result = TimeHistoryParseResult(load_case_name=load_case, stories=["Roof"], drifts_x=[series])
+    TimeHistoryImporter(session, project_id, result_set_id).import_result(result)
+
+
+def _count(path, table):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_shard_session_writes_rows_to_shard_and_metadata_to_project(project_db):
+    db_path, (project_id, des_id, _) = project_db
+    create_shard(db_path, des_id)
+
+    session = get_shard_session(db_path, des_id)
+    _import(session, project_id, des_id)
+    session.close()
+
+    assert _count(shard_path(db_path, des_id), "time_series_global_cache") == 1
+    assert _count(db_path, "time_series_global_cache") == 0
+    assert _count(db_path, "stories") == 1
+    # The project is attached, so joins across both files work
+    session = get_shard_session(db_path, des_id)
+    assert session.query(TimeSeriesGlobalCache, Story).join(Story).count() == 1
+    session.close()
+
+
+def test_result_set_sessions_are_routed_to_their_shard(project_db):
+    db_path, (project_id, des_id, mce_id) = project_db
+    create_shard(db_path, des_id)
+    for result_set_id in (des_id, mce_id):
+        session = result_set_session_factory(db_path, result_set_id)()
+        _import(session, project_id, result_set_id)
+        session.close()
+
+    assert list_shards(db_path) == [des_id]
+    assert _count(db_path, "time_series_global_cache") == 1
+
+    service = DataAccessService(
+        lambda: get_project_session(db_path),
+        lambda result_set_id: result_set_session_factory(db_path, result_set_id),
+    )
+    assert service.has_time_series(des_id) and service.has_time_series(mce_id)
+    assert service.get_time_series_load_cases(project_id, [des_id, mce_id]) == {
+        des_id: ["TH01"],
+        mce_id: ["TH01"],
+    }
+    record = service.get_time_series_record(project_id, des_id, "TH01", "Drifts", "X")
+    assert record.values[0].tolist() == [0.0, 1.5, -0.5]
+
+    unrouted = DataAccessService(lambda: get_project_session(db_path))
+    assert not unrouted.has_time_series(des_id)
+
+
+def test_cache_types_are_collected_across_shards(project_db):
+    db_path, (project_id, des_id, mce_id) = project_db
+    create_shard(db_path, des_id)
+    session = get_project_session(db_path)
+    story = Story(project_id=project_id, name="Roof")
+    session.add(story)
+    session.commit()
+    for result_set_id, result_type in ((des_id, "Drifts"), (mce_id, "Forces")):
+        scoped = result_set_session_factory(db_path, result_set_id)()
+        scoped.add(
+            GlobalResultsCache(
+                project_id=project_id,
+                result_set_id=result_set_id,
+                result_type=result_type,
+                story_id=story.id,
+                results_matrix={"TH01_X": 0.01},
+            )
+        )
+        scoped.commit()
+        scoped.close()
+    session.close()
+
+    service = DataAccessService(
+        lambda: get_project_session(db_path),
+        lambda result_set_id: result_set_session_factory(db_path, result_set_id),
+    )
+    assert service.get_available_global_types([des_id, mce_id]) == ["Drifts", "Forces"]
+
+
+def test_drop_and_replace_are_file_operations(project_db):
+    db_path, (project_id, des_id, _) = project_db
+    path = create_shard(db_path, des_id)
+    session = get_shard_session(db_path, des_id)
+    _import(session, project_id, des_id)
+    session.close()
+    store_root = path.parent / f"{path.stem}_timeseries"
+    assert store_root.is_dir()
+
+    replace_shard(db_path, des_id)
+
+    assert _count(path, "time_series_global_cache") == 0
+    assert not store_root.exists()
+    session = get_shard_session(db_path, des_id)
+    assert TimeSeriesRepository(session).get_available_load_cases(project_id, des_id) == []
+    session.close()
+
+    assert drop_shard(db_path, des_id)
+    assert not path.exists()
+    assert list_shards(db_path) == []
+    assert not drop_shard(db_path, des_id)
+    with pytest.raises(FileNotFoundError):
+        get_shard_session(db_path, des_id)
+
+
+def _add_drifts(session, project_id, result_set_id):
+    """One story drift row of TH01 in the result set's envelope category."""
+    category = ResultCategory(
+        result_set_id=result_set_id, category_name="Envelopes", category_type="Global"
+    )
+    story = session.query(Story).filter_by(name="Roof").first() or Story(
+        project_id=project_id, name="Roof"
+    )
+    load_case = session.query(LoadCase).filter_by(name="TH01").first() or LoadCase(
+        project_id=project_id, name="TH01"
+    )
+    session.add_all([category, story, load_case])
+    session.flush()
+    session.add(
+        StoryDrift(
+            story_id=story.id,
+            load_case_id=load_case.id,
+            result_category_id=category.id,
+            direction="X",
+            drift=0.01,
+        )
+    )
+    session.commit()
+    return category.id, load_case.id
+
+
+def test_move_to_shard_moves_rows_and_time_series_store(project_db):
+    db_path, (project_id, des_id, mce_id) = project_db
+    session = get_project_session(db_path)
+    for result_set_id in (des_id, mce_id):
+        _import(session, project_id, result_set_id)
+        _add_drifts(session, project_id, result_set_id)
+    session.close()
+    project_store = db_path.parent / f"{db_path.stem}_timeseries"
+    assert (project_store / f"rs{des_id}").is_dir()
+
+    moved = move_to_shard(db_path, des_id)
+
+    assert moved == {"story_drifts": 1, "time_series_global_cache": 1}
+    path = shard_path(db_path, des_id)
+    assert _count(path, "story_drifts") == 1
+    assert _count(db_path, "story_drifts") == 1  # MCE stays in the project
+    assert _count(db_path, "time_series_global_cache") == 1
+    assert not (project_store / f"rs{des_id}").exists()
+    assert (path.parent / f"{path.stem}_timeseries" / f"rs{des_id}").is_dir()
+
+    service = DataAccessService(
+        lambda: get_project_session(db_path),
+        lambda result_set_id: result_set_session_factory(db_path, result_set_id),
+    )
+    record = service.get_time_series_record(project_id, des_id, "TH01", "Drifts", "X")
+    assert record.values[0].tolist() == [0.0, 1.5, -0.5]
+    with pytest.raises(ValueError):
+        move_to_shard(db_path, des_id)
+
+
+def test_folder_import_and_replacement_use_the_shard(project_db, tmp_path):
+    db_path, (project_id, des_id, mce_id) = project_db
+    session = get_project_session(db_path)
+    category_id, load_case_id = _add_drifts(session, project_id, des_id)
+    session.close()
+    move_to_shard(db_path, des_id)
+
+    importer = FolderImporter(
+        folder_path=str(tmp_path),
+        project_name="Tower",
+        result_set_name="DES",
+        session_factory=lambda: get_project_session(db_path),
+        result_set_session_factory=lambda result_set_id: result_set_session_factory(
+            db_path, result_set_id
+        ),
+    )
+    scoped = importer._import_session_factory("Tower", "DES")()
+    assert scoped.query(StoryDrift).count() == 1
+    LoadCaseDataDeleter.delete_load_case_data(
+        scoped, project_id, des_id, category_id, [load_case_id], task_labels=["Story Drifts"]
+    )
+    scoped.close()
+    assert _count(shard_path(db_path, des_id), "story_drifts") == 0
+
+    # Unsharded and new result sets are written to the project database
+    unsharded = importer._import_session_factory("Tower", "MCE")()
+    assert unsharded.get_bind().url.database == str(db_path)
+    unsharded.close()
+
+
+def test_export_and_report_read_sharded_result_sets(project_db, tmp_path):
+    db_path, (project_id, des_id, mce_id) = project_db
+    session = get_project_session(db_path)
+    for result_set_id in (des_id, mce_id):
+        category_id, load_case_id = _add_drifts(session, project_id, result_set_id)
+    des_category = session.query(ResultCategory).filter_by(result_set_id=des_id).one()
+    story = session.query(Story).filter_by(name="Roof").one()
+    wall = Element(project_id=project_id, element_type="Wall", name="P1")
+    session.add(wall)
+    session.flush()
+    session.add_all(
+        [
+            WallShear(
+                element_id=wall.id,
+                story_id=story.id,
+                load_case_id=load_case_id,
+                result_category_id=des_category.id,
+                direction="V2",
+                force=120.0,
+            ),
+            ElementResultsCache(
+                project_id=project_id,
+                result_set_id=des_id,
+                element_id=wall.id,
+                story_id=story.id,
+                result_type="WallShears_V2",
+                results_matrix={"TH01": 120.0},
+            ),
+        ]
+    )
+    session.commit()
+    session.close()
+    move_to_shard(db_path, des_id)
+    context = ProjectContext(name="Tower", slug="tower", db_path=db_path)
+
+    output = tmp_path / "export.xlsx"
+    metadata = {
+        "catalog_project": SimpleNamespace(
+            name="Tower", slug="tower", description="", created_at=datetime(2024, 1, 1)
+        ),
+        "result_sets": [SimpleNamespace(id=des_id, name="DES", description="", created_at=None)],
+        "load_cases": [],
+        "stories": [],
+        "elements": [],
+    }
+    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+        discovery = ExportDiscovery(context.session, context, context.result_set_session_factory)
+        result_sheets = discovery.discover_and_write(writer, des_id, [], None)
+        ImportDataBuilder(context, app_version="test").write_import_data_sheet(
+            writer, metadata, result_sheets
+        )
+
+    assert result_sheets == {"global": ["Drifts_X"], "element": ["WallShears_V2"]}
+    sheets = pd.read_excel(output, sheet_name=None)
+    assert sheets["Drifts_X"]["TH01"].tolist() == [0.01]
+    assert sheets["WallShears_V2"]["TH01"].tolist() == [120.0]
+    payload = read_payload(output)
+    # Rows of the sharded and the unsharded result set
+    assert len(payload["normalized_data"]["story_drifts"]) == 2
+    assert len(payload["normalized_data"]["wall_shears"]) == 1
+    assert len(payload["cache_data"]["element_results_cache"]) == 1
+
+    reporting = ReportingDataService(context.session, context.result_set_session_factory)
+    data = reporting.get_wall_shear_data(project_id, des_id, "NLTHA")
+    assert data["all_data"]["TH01"].tolist() == [120.0]
+
+
+def test_cli_moves_result_sets_into_shards(project_db, monkeypatch, capsys):
+    db_path, (project_id, des_id, mce_id) = project_db
+    session = get_project_session(db_path)
+    _add_drifts(session, project_id, des_id)
+    session.close()
+    monkeypatch.syspath_prepend(str(ROOT / "scripts"))
+    import project_tools
+
+    context = SimpleNamespace(name="Tower", db_path=db_path)
+    monkeypatch.setattr(
+        project_tools, "get_project_context", lambda name: context if name == "Tower" else None
+    )
+    monkeypatch.setattr(
+        project_tools,
+        "get_result_sets_for_project",
+        lambda ctx: [(des_id, "DES"), (mce_id, "MCE")],
+    )
+
+    assert project_tools.main(["shard", "--name", "Tower", "--result-set", "DES"]) == 0
+    assert "DES: moved 1 rows" in capsys.readouterr().out
+    assert list_shards(db_path) == [des_id]
+    assert project_tools.main(["shard", "--name", "Tower"]) == 0
+    assert "DES: already sharded" in capsys.readouterr().out
+    assert list_shards(db_path) == [des_id, mce_id]
+    assert project_tools.main(["shard", "--name", "Tower", "--result-set", "SLE"]) == 1
+    assert project_tools.main(["shard", "--name", "Other"]) == 1
+    sys.modules.pop("project_tools", None)
@@ -0,0 +1,207 @@
+"""Tests for time_series_store.py"""
+
+import numpy as np
+import pytest
+
+from database.base import dispose_project_engine
+from database.models import Project, ResultSet, TimeSeriesGlobalCache
+from database.session import project_session_factory
+from database.time_series_store import (
+    LodPyramid,
+    TimeSeriesRecord,
+    TimeSeriesStore,
+    stack_series,
+    summarize,
+)
+from processing.time_history_importer import TimeHistoryImporter, TimeSeriesRepository
+from processing.time_history_parser import TimeHistoryParseResult, TimeSeriesData
+from services.data_access import DataAccessService
+
+KEY = (1, "TH01", "Drifts", "X")
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TimeSeriesStore(tmp_path / "store")
+
+
+@pytest.fixture
+def project_db(tmp_path):
+    db_path = tmp_path / "tower" / "tower.db"
+    factory = project_session_factory(db_path)
+    with factory() as session:
+        project = Project(name="Tower")
+        session.add(project)
+        session.flush()
+        session.add(ResultSet(project_id=project.id, name="TH", analysis_type="NLTHA"))
+        session.commit()
+    yield db_path, factory
+    dispose_project_engine(db_path)
+
+
+def _record(stories=3, steps=5):
+    values = np.arange(stories * steps, dtype=np.float32).reshape(stories, steps)
+    return TimeSeriesRecord(list(range(1, stories + 1)), np.linspace(0, 1, steps), values)
+
+
+def _series(story, sort_order, values):
+    return TimeSeriesData(
+        story=story,
+        direction="X",
+        time_steps=[0.01 * step for step in range(len(values))],
+        values=values,
+        story_sort_order=sort_order,
+    )
+
+
+def test_stack_series_pads_short_stories():
+    record = stack_series([7, 8], [[0.0, 0.1, 0.2], [0.0, 0.1]], [[1, 2, 3], [4, 5]])
+
+    assert record.story_ids == [7, 8]
+    assert record.values.dtype == np.float32
+    np.testing.assert_array_equal(record.values, [[1, 2, 3], [4, 5, 5]])
+    np.testing.assert_allclose(record.time_steps, [0.0, 0.1, 0.2])
+
+    extended = stack_series([1], [[0.0, 0.5]], [[1, 2, 3, 4]])
+    np.testing.assert_allclose(extended.time_steps, [0.0, 0.5, 1.0, 1.5])
+    assert stack_series([], [], []) is None
+
+
+def test_records_are_read_back_as_memory_maps(store):
+    store.write(*KEY, _record())
+
+    record = store.read(*KEY)
+
+    assert isinstance(record.values, np.memmap)
+    assert not record.values.flags.writeable
+    assert record.story_ids == [1, 2, 3]
+    np.testing.assert_array_equal(record.values, _record().values)
+    assert store.read(1, "TH02", "Drifts", "X") is None
+
+
+def test_rewrite_switches_manifest_while_old_record_is_mapped(store):
+    store.write(*KEY, _record())
+    mapped = store.read(*KEY)
+
+    store.write(*KEY, _record(stories=2, steps=4))
+
+    assert store.read(*KEY).values.shape == (2, 4)
+    assert mapped.values.shape == (3, 5)
+    directory = store.record_dir(*KEY)
+    assert len(list(directory.glob("values-*.npy"))) == 1
+
+
+def test_lod_pyramid_keeps_every_peak():
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal((2, 5000)).astype(np.float32)
+    values[1, 4321] = 50.0
+
+    lod = LodPyramid.build(values, factor=4, min_bins=100)
+
+    assert lod.factors == [4, 16, 64]
+    assert [level.shape for level in lod.mins] == [(2, 1250), (2, 313), (2, 79)]
+    np.testing.assert_array_equal(lod.maxs[0][0, :3], values[0, :12].reshape(3, 4).max(axis=1))
+    assert lod.maxs[-1][1].max() == 50.0
+    assert lod.mins[-1][0].min() == values[0].min()
+
+
+def test_peak_series_selects_level_from_pixel_width():
+    values = np.sin(np.linspace(0, 200, 100_000, dtype=np.float32))[None, :]
+    time_steps = np.arange(100_000) * 0.01
+    lod = LodPyramid.build(values)
+
+    times, points = lod.peak_series(0, time_steps, values, 0, 100_000, 800)
+
+    assert 1600 <= len(points) <= 2 * 100_000 / 16
+    assert points.max() == values.max() and points.min() == values.min()
+    assert times[0] == 0.0 and np.all(np.diff(times) >= 0)
+    raw_times, raw = lod.peak_series(0, time_steps, values, 500, 900, 800)
+    np.testing.assert_array_equal(raw, values[0, 500:900])
+    np.testing.assert_array_equal(raw_times, time_steps[500:900])
+
+
+def test_records_are_written_with_envelopes_and_lod(store):
+    values = np.random.default_rng(1).standard_normal((3, 6000)).astype(np.float32)
+    store.write(*KEY, TimeSeriesRecord([1, 2, 3], np.arange(6000) * 0.01, values))
+
+    record = store.read(*KEY)
+
+    np.testing.assert_array_equal(record.envelope_max, values.max(axis=1))
+    np.testing.assert_array_equal(record.envelope_min, values.min(axis=1))
+    expected = LodPyramid.build(values)
+    assert record.lod.factors == expected.factors
+    for level, reference in zip(record.lod.maxs, expected.maxs):
+        assert isinstance(level, np.memmap)
+        np.testing.assert_array_equal(level, reference)
+
+
+def test_summarize_short_records_without_levels():
+    record = summarize(_record())
+
+    assert record.lod.factors == []
+    np.testing.assert_array_equal(record.envelope_max, [4, 9, 14])
+    assert summarize(record) is record
+
+
+def test_unsafe_load_case_names_get_distinct_directories(store):
+    first = store.record_dir(1, "TH/01", "Drifts", "X")
+    second = store.record_dir(1, "TH:01", "Drifts", "X")
+
+    assert first != second
+    assert first.parent == store.root / "rs1"
+
+
+def test_delete_falls_back_to_missing(store):
+    store.write(*KEY, _record())
+    store.delete(*KEY)
+    assert store.read(*KEY) is None
+
+    store.write(*KEY, _record())
+    store.delete_result_set(1)
+    assert store.read(*KEY) is None
+
+
+def test_importer_writes_store_records_after_commit(project_db):
+    db_path, factory = project_db
+    result = TimeHistoryParseResult(
+        load_case_name="TH01",
+        stories=["Roof", "L1"],
+        drifts_x=[_series("Roof", 0, [0.1, 0.2, 0.3]), _series("L1", 1, [0.4, 0.5, 0.6])],
+    )
+    with factory() as session:
+        TimeHistoryImporter(session, project_id=1, result_set_id=1).import_result(result)
+        entries = TimeSeriesRepository(session).get_time_series(1, 1, "TH01", "Drifts", "X")
+
+    record = TimeSeriesStore.for_database(db_path).read(*KEY)
+
+    assert record.story_ids == [entry.story_id for entry in entries]
+    np.testing.assert_allclose(record.values, [entry.values for entry in entries], rtol=1e-6)
+
+
+def test_service_rebuilds_missing_records_from_cache_rows(project_db):
+    db_path, factory = project_db
+    with factory() as session:
+        session.add(
+            TimeSeriesGlobalCache(
+                project_id=1,
+                result_set_id=1,
+                load_case_name="TH01",
+                result_type="Drifts",
+                direction="X",
+                story_id=5,
+                time_steps=[0.0, 0.01],
+                values=[1.5, 2.5],
+                story_sort_order=0,
+            )
+        )
+        session.commit()
+    store = TimeSeriesStore.for_database(db_path)
+    assert store.read(*KEY) is None
+
+    service = DataAccessService(factory)
+    record = service.get_time_series_record(1, *KEY)
+
+    assert record.story_ids == [5]
+    np.testing.assert_array_equal(record.values, [[1.5, 2.5]])
+    assert isinstance(service.get_time_series_record(1, *KEY).values, np.memmap)
+    assert service.get_time_series_record(1, 1, "TH09", "Drifts", "X") is None
@@ -0,0 +1,82 @@
+"""Acceptance criteria dialog tests."""
+
+from __future__ import annotations
+
+import pytest
+from PyQt6.QtCore import Qt
+
+import gui.settings_manager as settings_manager
+from config.acceptance_criteria import ACCEPTANCE_LIMITS
+from gui.dialogs import AcceptanceCriteriaDialog
+from processing.acceptance import GoverningRatio
+from services.acceptance import AcceptanceResult, AcceptanceRow
+
+
+class FakeService:
+    def __init__(self):
+        self.limits = ACCEPTANCE_LIMITS
+        self.calls = []
+
+    def set_limits(self, limits):
+        self.limits = tuple(limits)
+
+    def evaluate(self, result_set_ids, result_types=None, statistic="peak"):
+        drift_limit = next(limit.limit for limit in self.limits if limit.result_type == "Drifts")
+        self.calls.append((list(result_set_ids), statistic, drift_limit))
+        ratio = 2.7 / drift_limit
+        return AcceptanceResult(
+            statistic=statistic,
+            rows=[
+                AcceptanceRow(
+                    result_set_id=2,
+                    result_type="Drifts_X",
+                    unit="%",
+                    checked_rows=12,
+                    max_ratio=ratio,
+                    exceeding=int(ratio >= 1.0),
+                    approaching=0,
+                    governing=GoverningRatio(None, "L7", "TH03", 2.7, drift_limit, ratio),
+                    result_set="MCE",
+                )
+            ],
+        )
+
+
+@pytest.fixture
+def isolated_settings(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings_manager, "SETTINGS_FILE", tmp_path / "settings.json")
+    monkeypatch.setattr(
+        settings_manager.settings, "_settings", dict(settings_manager.settings._settings)
+    )
+    return settings_manager.settings
+
+
+def _wait(dialog, qt_app):
+    dialog._worker.wait(5000)
+    qt_app.processEvents()
+
+
+def test_limit_edit_is_saved_and_re_evaluated(qt_app, isolated_settings):
+    service = FakeService()
+    dialog = AcceptanceCriteriaDialog(service, [(1, "DES"), (2, "MCE")])
+    dialog.result_set_list.item(0).setCheckState(Qt.CheckState.Unchecked)
+    _wait(dialog, qt_app)
+
+    assert dialog.table.item(0, 2).text() == "0.90"
+    drift_row = next(
+        row for row, limit in enumerate(dialog.limits()) if limit.result_type == "Drifts"
+    )
+    dialog.limits_table.cellWidget(drift_row, 2).setValue(2.5)
+    _wait(dialog, qt_app)
+
+    assert service.calls[-1] == ([2], "peak", 2.5)
+    assert isolated_settings.acceptance_limits == {"Drifts": 2.5}
+    assert dialog.table.item(0, 2).text() == "1.08"
+    assert dialog.table.item(0, 2).foreground().color().name() == "#ef4444"
+    assert dialog.table.item(0, 8).text() == "TH03"
+    assert dialog.status_label.text().startswith("1 checks, 1 exceeding limits")
+
+    dialog.reset_limits()
+    _wait(dialog, qt_app)
+    assert isolated_settings.acceptance_limits == {}
+    assert service.calls[-1][2] == 3.0
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from gui.dialogs.settings.diagnostics_dialog import read_log_tail
+from database.query_profile import QueryStats
+from gui.dialogs.settings.diagnostics_dialog import metrics_rows, query_stats_rows, read_log_tail
+from utils.metrics import MetricsRegistry
 
 
 def test_read_log_tail_returns_full_file_when_small(tmp_path):
@@ -22,3 +24,31 @@ def test_read_log_tail_truncates_to_tail(tmp_path):
     text = read_log_tail(log_file, max_bytes=3)
 
     assert text == "efg"
+
+
+def test_query_stats_rows_flag_slow_and_repeated_queries():
+    stats = QueryStats("story_drifts", "SELECT * FROM stories WHERE id = ?", count=3, total_s=0.5)
+    stats.durations.extend([0.1, 0.1, 0.3])
+    stats.slow_count = 1
+    stats.repeated = True
+
+    (row,) = query_stats_rows([stats])
+
+    assert row[:4] == ["story_drifts", "SELECT * FROM stories WHERE id = ?", 3, 500.0]
+    assert row[4] == 300.0
+    assert row[-1] == "slow ×1, N+1"
+
+
+def test_metrics_rows_list_counters_gauges_and_histograms():
+    registry = MetricsRegistry()
+    registry.increment("dataset_cache.hit", 4, cache="standard")
+    registry.set_gauge("dataset_cache.entries", 2, cache="standard")
+    registry.observe("dataset.build_seconds", 0.25, cache="element")
+
+    rows = metrics_rows(registry.snapshot())
+
+    assert rows == [
+        ["dataset_cache.hit", "cache=standard", "counter", 4, "", "", ""],
+        ["dataset_cache.entries", "cache=standard", "gauge", 2, "", "", ""],
+        ["dataset.build_seconds", "cache=element", "histogram", 1, 0.25, 0.25, 0.25],
+    ]
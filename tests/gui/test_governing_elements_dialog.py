@@ -0,0 +1,47 @@
+"""Governing elements dialog tests."""
+
+from __future__ import annotations
+
+from PyQt6.QtCore import Qt
+
+from gui.dialogs import GoverningElementsDialog
+from services.governing_elements import GoverningResult, GoverningRow
+
+
+class FakeService:
+    def __init__(self):
+        self.calls = []
+
+    def result_types(self, result_set_ids):
+        return ["QuadRotations", "WallShears_V2"]
+
+    def exceedances(self, result_type, result_set_ids, limit, metric="abs_max", max_rows=None):
+        self.calls.append((result_type, list(result_set_ids), limit, metric))
+        return GoverningResult(
+            result_type=result_type,
+            metric=metric,
+            unit="%",
+            rows=[GoverningRow(2, 7, 3, 0.81234, "MCE", "P1", "L2")],
+            total=12,
+            built_result_sets=[2],
+        )
+
+
+def test_dialog_runs_exceedance_query_for_checked_result_sets(qt_app):
+    service = FakeService()
+    dialog = GoverningElementsDialog(service, [(1, "DES"), (2, "MCE")])
+    dialog.result_set_list.item(0).setCheckState(Qt.CheckState.Unchecked)
+    dialog.mode_combo.setCurrentIndex(dialog.mode_combo.findData("exceeding"))
+    dialog.limit_spin.setValue(0.5)
+
+    assert dialog.limit_spin.suffix() == " %"
+    dialog.run_query()
+    dialog._worker.wait(5000)
+    qt_app.processEvents()
+
+    assert service.calls == [("QuadRotations", [2], 0.5, "abs_avg")]
+    assert dialog.table.rowCount() == 1
+    assert dialog.table.horizontalHeaderItem(3).text() == "|Avg| [%]"
+    assert dialog.table.item(0, 3).text() == "0.81"
+    assert dialog.status_label.text() == "12 exceedances (showing 1). Indexed 1 result set(s)"
+    assert dialog.run_button.isEnabled()
@@ -0,0 +1,39 @@
+"""Portfolio dashboard page tests."""
+
+from __future__ import annotations
+
+from gui.portfolio_page import PortfolioPage
+from services.portfolio import PortfolioResult, PortfolioRow
+
+
+class FakeService:
+    def __init__(self):
+        self.calls = []
+
+    def query(self, metrics=None, refresh=False, progress_callback=None):
+        self.calls.append(refresh)
+        progress_callback("Tower", 1, 1)
+        return PortfolioResult(
+            metrics=("peak_drift",),
+            rows=[PortfolioRow("Tower", "DES", "NLTHA", {"peak_drift": 0.0213})],
+            errors={"Annex": "Database not found"},
+            queried_projects=1,
+        )
+
+
+def test_page_runs_query_once_and_fills_table(qt_app):
+    service = FakeService()
+    page = PortfolioPage(service_factory=lambda: service)
+    page.ignore_cache_check.setChecked(True)
+
+    page.ensure_loaded()
+    page._worker.wait(5000)
+    qt_app.processEvents()
+    page.ensure_loaded()
+
+    assert service.calls == [True]
+    assert page.table.rowCount() == 1
+    assert page.table.horizontalHeaderItem(3).text() == "Peak Drift"
+    assert page.table.item(0, 3).text() == "0.0213"
+    assert "Annex: Database not found" in page.status_label.text()
+    assert page.refresh_button.isEnabled()
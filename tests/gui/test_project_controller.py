@@ -19,7 +19,7 @@ def fake_builder(ctx):
         return fake_runtime
 
     monkeypatch.setattr(
-        "gui.controllers.project_controller.build_project_runtime",
+        "services.project_runtime.build_project_runtime",
         fake_builder,
     )
 
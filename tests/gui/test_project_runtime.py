@@ -5,9 +5,18 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from database.base import Base
-from database.models import Project
+from database.base import Base, dispose_project_engine, get_project_session, init_project_db
+from database.models import (
+    Element,
+    ElementResultsCache,
+    GlobalResultsCache,
+    Project,
+    ResultSet,
+    Story,
+)
+from database.shards import dispose_shard_engines, move_to_shard
 from services.project_runtime import build_project_runtime
+from services.project_service import ProjectContext
 
 
 class FakeContext:
@@ -18,6 +27,9 @@ def __init__(self, session_factory):
     def session(self):
         return self._session_factory()
 
+    def result_set_session_factory(self, result_set_id):
+        return self._session_factory
+
 
 def _make_session_factory():
     engine = create_engine("sqlite:///:memory:")
@@ -53,3 +65,60 @@ def test_build_project_runtime_returns_service():
         assert runtime.result_service is not None
     finally:
         runtime.dispose()
+
+
+def test_runtime_reads_sharded_result_sets(tmp_path):
+    db_path = tmp_path / "tower.db"
+    init_project_db(db_path)
+    session = get_project_session(db_path)
+    project = Project(name="Tower")
+    session.add(project)
+    session.flush()
+    story = Story(project_id=project.id, name="Roof", sort_order=0)
+    pier = Element(project_id=project.id, element_type="Wall", name="P1")
+    sets = [ResultSet(project_id=project.id, name=name) for name in ("DES", "MCE")]
+    session.add_all([story, pier, *sets])
+    session.flush()
+    for result_set, drift in zip(sets, (0.01, 0.02)):
+        session.add_all(
+            [
+                GlobalResultsCache(
+                    project_id=project.id,
+                    result_set_id=result_set.id,
+                    result_type="Drifts",
+                    story_id=story.id,
+                    results_matrix={"TH01_X": drift},
+                ),
+                ElementResultsCache(
+                    project_id=project.id,
+                    result_set_id=result_set.id,
+                    result_type="WallShears_V2",
+                    element_id=pier.id,
+                    story_id=story.id,
+                    results_matrix={"TH01": drift * 100},
+                ),
+            ]
+        )
+    session.commit()
+    des_id, mce_id, pier_id = sets[0].id, sets[1].id, pier.id
+    session.close()
+    move_to_shard(db_path, des_id)
+
+    runtime = build_project_runtime(ProjectContext(name="Tower", slug="tower", db_path=db_path))
+    try:
+        service = runtime.result_service
+        # Drifts display in percent, the shears as stored
+        for result_set_id, value in ((des_id, 1.0), (mce_id, 2.0)):
+            dataset = service.get_standard_dataset("Drifts", "X", result_set_id)
+            assert dataset is not None and dataset.data.loc[0, "TH01"] == value
+            element = service.get_element_dataset(pier_id, "WallShears", "V2", result_set_id)
+            assert element is not None and element.data.loc[0, "TH01"] == value
+
+        comparison = service.get_comparison_dataset("Drifts", "X", [des_id, mce_id])
+        assert comparison is not None and not comparison.data.empty
+        # Without routing the project tables no longer hold the sharded rows
+        assert runtime.repos.cache.get_cache_for_display(runtime.project.id, "Drifts", des_id) == []
+    finally:
+        runtime.dispose()
+        dispose_shard_engines(db_path)
+        dispose_project_engine(db_path)
@@ -0,0 +1,75 @@
+"""Report preview page cache tests."""
+
+from __future__ import annotations
+
+from PyQt6.QtCore import QSize
+
+from gui.reporting.report_models import ReportSection
+from gui.reporting.report_page_cache import ReportPageCache, paginate_sections
+from gui.reporting.report_preview_widget import ReportPreviewWidget
+
+
+def _sections(dataset, count):
+    sections = []
+    for i in range(count):
+        section = ReportSection(
+            title=f"Story Drifts {i}",
+            result_type="Drifts",
+            direction="X",
+            result_set_id=1,
+        )
+        section.dataset = dataset
+        sections.append(section)
+    return sections
+
+
+def test_paginate_sections_respects_content_height(sample_result_dataset):
+    """Sections are grouped into pages without exceeding the estimated content height."""
+    pages = paginate_sections(_sections(sample_result_dataset, 7))
+
+    assert sum(len(page) for page in pages) == 7
+    assert len(pages) > 1
+    assert paginate_sections([]) == []
+
+
+def test_render_pages_reuses_unchanged_pages(qt_app, sample_result_dataset):
+    """Only pages whose sections changed are painted again."""
+    cache = ReportPageCache("Project", max_workers=2)
+    sections = _sections(sample_result_dataset, 6)
+    pages = paginate_sections(sections)
+
+    first = cache.render_pages(pages)
+    assert len(first) == len(pages)
+    assert first[0].size() == QSize(525, 743)
+    assert not first[0].isNull()
+
+    # Unchanged selection: same images, nothing re-rendered
+    again = cache.render_pages(pages)
+    assert all(a is b for a, b in zip(first, again))
+
+    # Changing the last page's data only re-renders that page
+    sections[-1].dataset = type(sample_result_dataset)(**vars(sample_result_dataset))
+    updated = cache.render_pages(paginate_sections(sections))
+    assert all(a is b for a, b in zip(first[:-1], updated[:-1]))
+    assert updated[-1] is not first[-1]
+
+
+def test_render_pages_evicts_least_recently_used(qt_app, sample_result_dataset):
+    cache = ReportPageCache("Project", max_pages=2, max_workers=1)
+    pages = paginate_sections(_sections(sample_result_dataset, 9))
+
+    cache.render_pages(pages)
+
+    assert len(pages) > 2
+    assert len(cache) == 2
+
+
+def test_preview_widget_builds_page_widgets(qt_app, sample_result_dataset):
+    widget = ReportPreviewWidget("Project")
+    widget.set_sections(_sections(sample_result_dataset, 6))
+
+    assert len(widget._pages) == len(paginate_sections(_sections(sample_result_dataset, 6)))
+    assert [page.page_number for page in widget._pages] == list(range(1, len(widget._pages) + 1))
+
+    widget.set_sections([])
+    assert widget._pages == []
@@ -0,0 +1,116 @@
+"""Report section catalog and headless batch report tests."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from gui.reporting import batch_report
+from gui.reporting.batch_report import ReportJob, ReportJobResult, run_report_jobs
+from gui.reporting.report_section_catalog import (
+    get_available_sections,
+    parse_template,
+    select_sections,
+)
+
+
+def _data_service():
+    service = MagicMock()
+    service.get_global_cache_with_matrix.return_value = [
+        ("Drifts", {"TH01_X": 0.1, "TH01_Y": 0.2}),
+        ("Forces", '{"TH01_VX": 1.0}'),
+    ]
+    service.get_available_element_types_for_result_set.return_value = [
+        "ColumnRotations_R2",
+        "BeamRotations_R3Plastic",
+        "ColumnRotations_R3",
+    ]
+    service.get_available_joint_types_for_result_set.return_value = ["SoilPressures_Min", "Other"]
+    return service
+
+
+def test_available_section_paths_follow_tree_order():
+    available = get_available_sections(_data_service(), result_set_id=3)
+
+    assert available.paths() == [
+        "Global/Drifts/X",
+        "Global/Drifts/Y",
+        "Global/Forces/X",
+        "Element/ColumnRotations",
+        "Element/BeamRotations",
+        "Joint/SoilPressures_Min",
+    ]
+
+
+def test_select_sections_matches_patterns_and_titles():
+    available = get_available_sections(_data_service(), result_set_id=3)
+
+    sections = select_sections(available, ["Global/Drifts/*", "Joint/*"], 3, "NLTHA")
+
+    assert [s.title for s in sections] == [
+        "Story Drifts [%] - X Direction",
+        "Story Drifts [%] - Y Direction",
+        "Soil Pressures (Min) [kN/m²]",
+    ]
+    assert {s.result_set_id for s in sections} == {3}
+    assert sections[-1].category == "Joint"
+    assert sections[-1].direction == ""
+
+
+def test_parse_template_skips_comments_and_blanks():
+    lines = ["# drifts only", "", "Global/Drifts/*  # both directions", "  Element/*  "]
+    assert parse_template(lines) == ["Global/Drifts/*", "Element/*"]
+
+
+def test_run_report_jobs_collects_failures_inline():
+    jobs = [
+        ReportJob("P", 1, "DES", "NLTHA", "out/p_des.pdf"),
+        ReportJob("P", 2, "MCE", "NLTHA", "out/p_mce.pdf"),
+    ]
+
+    def fake_run(job):
+        if job.result_set_name == "MCE":
+            raise RuntimeError("boom")
+        return ReportJobResult(job=job, sections=4, load_seconds=0.5, render_seconds=0.25)
+
+    seen = []
+    with patch.object(batch_report, "run_report_job", side_effect=fake_run):
+        results = run_report_jobs(jobs, max_workers=1, on_result=seen.append)
+
+    assert [r.job.result_set_name for r in results] == ["DES", "MCE"]
+    assert results[0].error is None and results[0].total_seconds == 0.75
+    assert results[1].error == "boom"
+    assert "FAILED - boom" in results[1].summary()
+    assert seen == results
+    assert results[0].to_record()["patterns"] == ["*"]
+
+
+def test_cli_all_skips_projects_without_requested_result_set(tmp_path, monkeypatch, capsys):
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parents[2] / "scripts"))
+    import project_tools
+
+    def fake_plan(name, output_dir, result_set_names, patterns):
+        if name == "Annex":
+            raise ValueError(f"Result set(s) not found in '{name}': MCE")
+        return [ReportJob(name, 1, "MCE", "NLTHA", str(output_dir / "tower_mce.pdf"))]
+
+    monkeypatch.setattr(
+        project_tools,
+        "list_project_contexts",
+        lambda: [SimpleNamespace(name=name) for name in ("Annex", "Tower")],
+    )
+    monkeypatch.setattr(batch_report, "plan_report_jobs", fake_plan)
+    monkeypatch.setattr(
+        batch_report,
+        "run_report_jobs",
+        lambda jobs, max_workers, on_result: [ReportJobResult(job=job) for job in jobs],
+    )
+
+    args = ["report", "--all", "--result-set", "MCE", "--output-dir", str(tmp_path)]
+    assert project_tools.main(args) == 0
+    out = capsys.readouterr().out
+    assert "Warning: skipping 'Annex'" in out
+    assert "1 of 1 reports written." in out
+    sys.modules.pop("project_tools", None)
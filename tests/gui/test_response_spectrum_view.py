@@ -0,0 +1,105 @@
+"""Tests for the response spectrum view."""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+from gui.result_views.response_spectrum_view import ResponseSpectrumView
+from processing.response_spectrum import ResponseSpectrumSet
+
+PERIODS = np.array([0.1, 0.5, 1.0])
+
+
+def _spectra():
+    return [
+        ResponseSpectrumSet(
+            "X",
+            damping,
+            PERIODS,
+            ["TH01", "TH02"],
+            np.array([[1.0, 2.0, 0.5], [3.0, 2.0, 0.5]]) * scale,
+        )
+        for damping, scale in ((0.02, 2.0), (0.05, 1.0))
+    ]
+
+
+def test_view_shows_records_and_envelopes_for_default_damping(qt_app):
+    view = ResponseSpectrumView()
+
+    view.set_data(_spectra())
+
+    assert view.damping_combo.count() == 2
+    assert view.damping_combo.currentText() == "5%"
+    assert len(view._record_lines) == 2
+    np.testing.assert_allclose(view.mean_line.getData()[1], [2.0, 2.0, 0.5])
+    np.testing.assert_allclose(view.upper_line.getData()[1], [2.0 + np.sqrt(2), 2.0, 0.5])
+    np.testing.assert_allclose(view.lower_line.getData()[1], [2.0 - np.sqrt(2), 2.0, 0.5])
+
+
+def test_damping_selector_switches_spectra(qt_app):
+    view = ResponseSpectrumView()
+    view.set_data(_spectra())
+
+    view.damping_combo.setCurrentIndex(0)
+
+    np.testing.assert_allclose(view.mean_line.getData()[1], [4.0, 4.0, 1.0])
+    assert len(view._record_lines) == 2
+    view.clear()
+    assert view._record_lines == [] and view.damping_combo.count() == 0
+
+
+class _FakeDataService:
+    def __init__(self):
+        self.spectra = []
+        self.computed = []
+
+    def get_response_spectra(self, project_id, result_set_id, direction):
+        return list(self.spectra)
+
+    def get_missing_response_spectra(self, project_id, result_set_id, direction):
+        return [] if self.spectra else ["TH01", "TH02"]
+
+    def compute_response_spectra(self, project_id, result_set_id, direction, progress_callback):
+        self.computed.append((result_set_id, direction, threading.current_thread()))
+        self.spectra = _spectra()
+        progress_callback("Computed TH02 X", 2, 2)
+        return 2
+
+
+def test_loader_reads_cached_spectra_and_computes_missing_in_worker(qt_app):
+    from types import SimpleNamespace
+
+    from PyQt6.QtWidgets import QLabel, QStatusBar
+
+    from gui.project_detail.loaders.time_series import load_response_spectrum
+
+    status_bar = QStatusBar()
+    data_service = _FakeDataService()
+    window = SimpleNamespace(
+        project_id=1,
+        data_service=data_service,
+        controller=SimpleNamespace(
+            selection=SimpleNamespace(result_type="ResponseSpectrum", result_set_id=4, direction="X")
+        ),
+        statusBar=lambda: status_bar,
+    )
+    area = SimpleNamespace(
+        show_response_spectrum=lambda: None,
+        response_spectrum_view=ResponseSpectrumView(),
+        content_title=QLabel(),
+    )
+
+    load_response_spectrum(window, "X", area)
+
+    assert area.content_title.text() == "Response Spectra - X Direction"
+
+    window._response_spectrum_worker.wait(5000)
+    qt_app.processEvents()
+
+    ((result_set_id, direction, thread),) = data_service.computed
+    assert (result_set_id, direction) == (4, "X")
+    assert thread is not threading.main_thread()
+    assert area.content_title.text() == "Response Spectra - X Direction (2 records)"
+    assert len(area.response_spectrum_view._record_lines) == 2
@@ -0,0 +1,81 @@
+"""Tests for the animated time series view."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from database.time_series_store import TimeSeriesRecord, summarize
+from gui.result_views.time_series_animated_view import TimeSeriesAnimatedView, TimeSeriesPlotData
+
+STEPS = 40_000
+
+
+def _plot_data(with_summary: bool = True) -> TimeSeriesPlotData:
+    values = np.random.default_rng(0).standard_normal((2, STEPS)).astype(np.float32) * 9810.0
+    values[0, 12_345] = 5 * 9810.0
+    record = TimeSeriesRecord([1, 2], np.arange(STEPS) * 0.005, values)
+    if with_summary:
+        record = summarize(record)
+    return TimeSeriesPlotData(
+        result_type="Accelerations",
+        direction="X",
+        stories=["Base", "Roof"],
+        time_steps=record.time_steps.tolist(),
+        values_matrix=record.values,
+        unit="g",
+        min_envelope=record.envelope_min,
+        max_envelope=record.envelope_max,
+        lod=record.lod,
+        scale=1.0 / 9810.0,
+    )
+
+
+def test_base_acceleration_is_drawn_from_lod_levels(qt_app):
+    view = TimeSeriesAnimatedView()
+    view.set_data("X", None, None, _plot_data(), None)
+
+    x, y = view._base_accel_line.getData()
+    assert len(y) < STEPS / 4
+    assert np.isclose(y.max(), 5.0)
+
+    view._base_accel_plot_widget.setXRange(10.0, 11.0, padding=0)
+    x, y = view._base_accel_line.getData()
+    assert len(y) <= 203
+    steps = np.rint(x / 0.005).astype(int)
+    assert steps[0] <= 2000 and steps[-1] >= 2200
+    np.testing.assert_allclose(y, view._base_accel_data.values_matrix[0, steps] / 9810.0)
+
+
+def test_envelopes_come_from_plot_data(qt_app):
+    data = _plot_data()
+    data.max_envelope = np.array([1.0, 2.0], dtype=np.float32) * 9810.0
+    data.min_envelope = np.array([-0.5, -1.0], dtype=np.float32) * 9810.0
+    view = TimeSeriesAnimatedView()
+
+    view.set_data("X", None, None, data, None)
+
+    np.testing.assert_allclose(view.acceleration_plot.max_envelope, [1.0, 2.0])
+    np.testing.assert_allclose(view._base_accel_plot_widget.viewRange()[1], [-1.1, 1.1], rtol=0.1)
+
+
+def test_view_builds_lod_without_precomputed_summary(qt_app):
+    view = TimeSeriesAnimatedView()
+    view.set_data("X", None, None, _plot_data(with_summary=False), None)
+
+    x, y = view._base_accel_line.getData()
+    assert len(y) < STEPS / 4
+    assert np.isclose(y.max(), 5.0)
+    assert np.isclose(view.acceleration_plot.max_envelope[0], 5.0)
+
+
+def test_long_records_play_back_within_frame_budget(qt_app):
+    view = TimeSeriesAnimatedView()
+    view.set_data("X", None, None, _plot_data(), None)
+
+    view._advance_frame()
+
+    assert view._current_position == STEPS / view.MAX_PLAYBACK_FRAMES
+    x, _ = view.acceleration_plot.profile_line.getData()
+    assert len(x) == 2
+    view.clear()
+    assert view._base_accel_data is None
@@ -239,6 +239,26 @@ def test_click_handler_dispatches_comparison_result_type(self):
 
         browser.comparison_selected.emit.assert_called_once_with(1, "Drifts", "X")
 
+    def test_click_handler_dispatches_response_spectrum(self):
+        """Test that response spectrum clicks carry the direction."""
+        from gui.tree_browser import click_handlers, nltha_builders
+        from PyQt6.QtWidgets import QApplication, QTreeWidgetItem
+
+        app = QApplication.instance() or QApplication([])
+
+        browser = MagicMock()
+        browser.time_series_load_cases = {1: ["TH01", "TH02"]}
+        parent = QTreeWidgetItem()
+        nltha_builders.add_response_spectrum_section(browser, parent, 1)
+
+        spectra_item = parent.child(0)
+        assert "Response Spectra" in spectra_item.text(0)
+        assert spectra_item.childCount() == 2
+
+        click_handlers.on_item_clicked(browser, spectra_item.child(1), 0)
+
+        browser.selection_changed.emit.assert_called_once_with(1, "Time-Series", "ResponseSpectrum", "Y", 0)
+
     def test_click_handler_ignores_invalid_data(self):
         """Test that click handler handles items without valid data."""
         from gui.tree_browser import click_handlers
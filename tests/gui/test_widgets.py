@@ -89,3 +89,38 @@ def test_beam_rotations_widget_tabs(qt_app, beam_rotations_df_max, beam_rotation
     widget.set_active_tab("table")
     assert widget.tab_widget.currentIndex() == 0
     assert widget.current_mode == "table"
+
+
+def test_results_table_widget_acceptance_overlay(qt_app, sample_result_dataset):
+    """Cells approaching or exceeding the acceptance limit keep their tint through selection."""
+    from PyQt6.QtCore import Qt
+
+    widget = ResultsTableWidget()
+    widget.load_dataset(sample_result_dataset, acceptance_limit=0.018)
+
+    def background(row, col):
+        color = widget.table.item(row, col).data(Qt.ItemDataRole.BackgroundRole)
+        return color.name() if color is not None else None
+
+    assert background(0, 1) is None  # 0.010 / 0.018
+    assert background(0, 2) == "#fbbf24"  # 0.015 / 0.018 approaching
+    assert background(1, 1) == "#ef4444"  # 0.020 / 0.018 exceeded
+    assert widget.table.item(1, 1).toolTip() == "D/C 1.11"
+
+    widget._selected_load_cases = {"LC2"}
+    widget._update_column_highlighting()
+    widget._selected_load_cases = set()
+    widget._update_column_highlighting()
+    assert background(0, 2) == "#fbbf24"
+    assert background(0, 1) is None
+
+
+def test_results_plot_widget_draws_acceptance_limit(qt_app, sample_result_dataset):
+    """ResultsPlotWidget draws the limit line and keeps it in view."""
+    widget = ResultsPlotWidget()
+    widget.load_dataset(sample_result_dataset, acceptance_limit=0.05)
+
+    plot = widget._get_plot_from_container(widget.envelope_plot)
+    lines = [item for item in plot.getPlotItem().items if isinstance(item, pg.InfiniteLine)]
+    assert [line.value() for line in lines] == [0.05]
+    assert plot.getViewBox().viewRange()[0][1] >= 0.05
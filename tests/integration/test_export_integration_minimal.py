@@ -119,4 +119,4 @@ def test_export_discovery_and_import_data_end_to_end(tmp_path):
     xls = pd.ExcelFile(output)
     sheets = set(xls.sheet_names)
     # Expect global and element sheets plus metadata/import sheets
-    assert {"Drifts_X", "WallShears_V2", "IMPORT_DATA"}.issubset(sheets)
+    assert {"Drifts_X", "WallShears_V2", "IMPORT_MANIFEST", "IMPORT_DATA"}.issubset(sheets)
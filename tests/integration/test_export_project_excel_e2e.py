@@ -18,6 +18,9 @@ def session(self):
     def session_factory(self):
         return self.session
 
+    def result_set_session_factory(self, result_set_id):
+        return self.session
+
 
 class _ResultServiceStub:
     def __init__(self):
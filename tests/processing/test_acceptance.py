@@ -0,0 +1,68 @@
+"""Tests for acceptance.py (vectorized demand-to-capacity ratios)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config.acceptance_criteria import AcceptanceLimit
+from processing.acceptance import evaluate, ratio_frame, row_demands
+from processing.result_transformers import get_transformer
+
+
+def test_row_demands_reduce_global_matrices_per_direction():
+    demands = row_demands(
+        "Drifts_X",
+        [
+            {"DES_TH01_X": 0.010, "DES_TH02_X": -0.025, "DES_TH01_Y": 0.09},
+            {"DES_TH01_X": 0.004, "DES_TH02_X": None},
+            {},
+        ],
+        ["L1", "L2", "Roof"],
+        multiplier=100.0,
+        transformer=get_transformer("Drifts_X"),
+    )
+
+    assert demands.load_cases == ["TH01", "TH02"]
+    np.testing.assert_allclose(demands.peak, [2.5, 0.4, np.nan])
+    np.testing.assert_allclose(demands.mean, [0.75, 0.4, np.nan])
+    assert demands.peak_case.tolist() == [1, 0, -1]
+    assert demands.element_names == [None]
+
+
+def test_evaluate_resolves_group_limits_once_per_element():
+    demands = row_demands(
+        "QuadRotations",
+        [{"TH01": 0.012}, {"TH01": 0.009}, {"TH01": 0.006}, {"TH01": None}],
+        ["L1", "L2", "L1", "L2"],
+        element_names=["P1", "P1", "C1", "C1"],
+        multiplier=100.0,
+    )
+    layer = evaluate(
+        demands,
+        [AcceptanceLimit("QuadRotations", 1.5), AcceptanceLimit("QuadRotations", 0.5, "C*")],
+    )
+
+    np.testing.assert_allclose(layer.capacities, [1.5, 1.5, 0.5, 0.5])
+    np.testing.assert_allclose(layer.peak_ratios, [0.8, 0.6, 1.2, np.nan])
+    assert layer.checked_rows == 4
+    assert layer.count_exceeding() == 1
+    assert layer.count_exceeding(threshold=0.8) == 2
+    governing = layer.governing()
+    assert (governing.element, governing.location, governing.load_case) == ("C1", "L1", "TH01")
+    assert governing.ratio == pytest.approx(1.2)
+
+    relaxed = evaluate(demands, [AcceptanceLimit("QuadRotations", 2.0)])
+    assert relaxed.max_ratio() == pytest.approx(0.6)
+    assert evaluate(demands, []).max_ratio() is None
+    with pytest.raises(ValueError, match="Unknown statistic"):
+        layer.ratios("median")
+
+
+def test_ratio_frame_is_absolute_over_limit():
+    frame = pd.DataFrame({"Story": ["L1"], "TH01": [-3.0], "Max": ["-"]})
+
+    ratios = ratio_frame(frame, ["TH01", "Max"], 2.0)
+
+    assert ratios["TH01"].tolist() == [1.5]
+    assert np.isnan(ratios["Max"].iloc[0])
+    assert ratio_frame(frame, ["TH01"], None)["TH01"].isna().all()
@@ -0,0 +1,193 @@
+"""Tests for cache_summary.py (summary statistics stored at cache-build time)."""
+
+import pandas as pd
+import pytest
+
+from database.models import (
+    CacheSummary,
+    Element,
+    ElementPeak,
+    LoadCase,
+    ResultCategory,
+    SoilPressure,
+    StoryDrift,
+    WallShear,
+)
+from database.repositories import (
+    CacheRepository,
+    ElementCacheRepository,
+    JointCacheRepository,
+    LoadCaseRepository,
+    StoryRepository,
+)
+from processing.cache_builder import CacheBuilder
+from processing.cache_summary import summarize_matrices
+from services.result_service import ResultDataService
+
+
+@pytest.fixture
+def built_cache(db_session, sample_project, sample_result_set, sample_stories):
+    category = ResultCategory(
+        result_set_id=sample_result_set.id, category_name="Envelopes", category_type="Global"
+    )
+    wall = Element(project_id=sample_project.id, element_type="Wall", name="P1")
+    des, mce = (LoadCase(project_id=sample_project.id, name=name) for name in ("TH01", "TH02"))
+    db_session.add_all([category, wall, des, mce])
+    db_session.flush()
+    for story_index, story in enumerate(sample_stories[:3]):
+        for load_case, scale in ((des, 1.0), (mce, -2.0)):
+            for direction, factor in (("X", 1.0), ("Y", 0.5)):
+                db_session.add(
+                    StoryDrift(
+                        story_id=story.id,
+                        load_case_id=load_case.id,
+                        result_category_id=category.id,
+                        direction=direction,
+                        drift=0.001 * (story_index + 1) * scale * factor,
+                        story_sort_order=story_index,
+                    )
+                )
+            db_session.add(
+                WallShear(
+                    element_id=wall.id,
+                    story_id=story.id,
+                    load_case_id=load_case.id,
+                    result_category_id=category.id,
+                    direction="V2",
+                    force=100.0 * (story_index + 1) * scale,
+                    story_sort_order=story_index,
+                )
+            )
+        db_session.add(
+            SoilPressure(
+                project_id=sample_project.id,
+                result_set_id=sample_result_set.id,
+                load_case_id=des.id,
+                shell_object=f"F{story_index}",
+                unique_name=str(story_index),
+                min_pressure=-50.0 * (story_index + 1),
+            )
+        )
+    db_session.commit()
+
+    CacheBuilder(
+        session=db_session,
+        project_id=sample_project.id,
+        result_set_id=sample_result_set.id,
+        result_category_id=category.id,
+    ).generate_all()
+    return sample_project.id, sample_result_set.id, wall.id
+
+
+def _service(db_session, project_id, with_summaries=True):
+    service = ResultDataService(
+        project_id=project_id,
+        cache_repo=CacheRepository(db_session),
+        story_repo=StoryRepository(db_session),
+        load_case_repo=LoadCaseRepository(db_session),
+        element_cache_repo=ElementCacheRepository(db_session),
+        joint_cache_repo=JointCacheRepository(db_session),
+        session=db_session,
+    )
+    if not with_summaries:
+        for provider in service._dataset_providers.values():
+            provider.summary_repo = None
+    return service
+
+
+def _summary(db_session, **filters):
+    return db_session.query(CacheSummary).filter_by(**filters).one()
+
+
+def test_cache_builder_stores_summaries_per_type_direction_and_element(db_session, built_cache):
+    _, result_set_id, wall_id = built_cache
+
+    drifts_x = _summary(db_session, cache_kind="global", result_type="Drifts", direction="X")
+    assert drifts_x.column_max == pytest.approx({"TH01": 0.003, "TH02": -0.002})
+    assert (drifts_x.min_value, drifts_x.max_value) == pytest.approx((-0.006, 0.003))
+    assert len(drifts_x.row_stats) == 3
+    drifts_y = _summary(db_session, cache_kind="global", result_type="Drifts", direction="Y")
+    assert drifts_y.max_value == pytest.approx(0.0015)
+
+    walls = _summary(db_session, cache_kind="element", result_type="WallShears_V2")
+    assert walls.element_id == wall_id
+    # Avg, Max, Min per story
+    assert sorted(tuple(row) for row in walls.row_stats.values()) == [
+        (-150.0, 300.0, -600.0),
+        (-100.0, 200.0, -400.0),
+        (-50.0, 100.0, -200.0),
+    ]
+    peak = db_session.query(ElementPeak).filter_by(result_type="WallShears_V2").one()
+    assert (peak.element_id, peak.abs_avg, peak.abs_max, peak.min_value) == (
+        wall_id,
+        150.0,
+        600.0,
+        -600.0,
+    )
+    soil = _summary(db_session, cache_kind="joint", result_type="SoilPressures_Min")
+    assert soil.row_stats["2"] == pytest.approx([-150.0, -150.0, -150.0])
+
+
+def test_datasets_from_stored_summaries_match_recomputed(db_session, built_cache):
+    project_id, result_set_id, wall_id = built_cache
+    stored = _service(db_session, project_id)
+    recomputed = _service(db_session, project_id, with_summaries=False)
+
+    pairs = [
+        (
+            stored.get_standard_dataset("Drifts", "X", result_set_id),
+            recomputed.get_standard_dataset("Drifts", "X", result_set_id),
+        ),
+        (
+            stored.get_element_dataset(wall_id, "WallShears", "V2", result_set_id),
+            recomputed.get_element_dataset(wall_id, "WallShears", "V2", result_set_id),
+        ),
+        (
+            stored.get_joint_dataset("SoilPressures_Min", result_set_id),
+            recomputed.get_joint_dataset("SoilPressures_Min", result_set_id),
+        ),
+    ]
+    for from_summary, from_rows in pairs:
+        assert from_summary.summary is not None and from_rows.summary is None
+        pd.testing.assert_frame_equal(from_summary.data, from_rows.data, rtol=1e-12)
+
+    drifts = pairs[0][0]
+    # Display units: drifts are shown in percent
+    assert drifts.summary.value_range(drifts.load_case_columns) == pytest.approx((-0.6, 0.3))
+    assert drifts.summary.value_range(["TH01"]) == pytest.approx((0.1, 0.3))
+    assert drifts.summary.value_range(["TH99"]) is None
+
+
+def test_stored_statistics_are_used_until_cache_rows_change(db_session, built_cache):
+    project_id, result_set_id, _ = built_cache
+    summary = _summary(db_session, cache_kind="global", result_type="Drifts", direction="X")
+    story_key = next(iter(summary.row_stats))
+    summary.row_stats = {**summary.row_stats, story_key: [9.0, 9.0, 9.0]}
+    db_session.commit()
+
+    dataset = _service(db_session, project_id).get_standard_dataset("Drifts", "X", result_set_id)
+    assert 900.0 in dataset.data["Max"].tolist()
+
+    # Rewriting a cache row after the summary makes the summary stale
+    cache_repo = CacheRepository(db_session)
+    entry = cache_repo.get_cache_for_display(project_id, "Drifts", result_set_id)[0]
+    cache_repo.upsert_cache_entry(
+        project_id=project_id,
+        story_id=entry.story_id,
+        result_type="Drifts",
+        results_matrix={**entry.results_matrix, "TH01_X": 0.05},
+        result_set_id=result_set_id,
+    )
+
+    dataset = _service(db_session, project_id).get_standard_dataset("Drifts", "X", result_set_id)
+    assert dataset.summary is None
+    assert 900.0 not in dataset.data["Max"].tolist()
+    assert dataset.data["Max"].max() == pytest.approx(5.0)
+
+
+def test_summarize_matrices_handles_missing_values():
+    summary = summarize_matrices({"1": {"TH01": 1.0, "TH02": None}, "2": {"TH02": -3.0}})
+
+    assert summary["row_stats"] == {"1": [1.0, 1.0, 1.0], "2": [-3.0, -3.0, -3.0]}
+    assert summary["column_max"] == {"TH01": 1.0, "TH02": -3.0}
+    assert (summary["min_value"], summary["max_value"]) == (-3.0, 1.0)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import Dict, List
 
 import pytest
+from openpyxl import Workbook
 
+from processing.import_preparation import PROCESS_POOL_MIN_BYTES, prescan_executor_kind, prescan_workers
 from services.import_preparation import (
     ImportPreparationService,
     detect_conflicts,
@@ -126,6 +129,92 @@ def test_prescan_records_summary_even_without_target_sheets() -> None:
     assert summary.foundation_joints == ["J1"]
 
 
+class SlowFirstParserFactory(StubParserFactory):
+    """Finishes file1 last so completion order differs from file order."""
+
+    def __call__(self, path: Path) -> StubParser:
+        if path.name == "file1.xlsx":
+            time.sleep(0.2)
+        return super().__call__(path)
+
+
+def test_prescan_applies_results_in_file_order() -> None:
+    files = [Path("file1.xlsx"), Path("file2.xlsx"), Path("file3.xlsx")]
+    parser_data = {
+        "file1.xlsx": {"Story Drifts": ["DES_X"], "Fou": ["J3"]},
+        "file2.xlsx": {"Story Drifts": ["MCE_X"], "Fou": ["J1"]},
+        "file3.xlsx": {"Story Drifts": ["SLE_X"], "Fou": ["J2"]},
+    }
+    service = ImportPreparationService(
+        target_sheets={"Story Drifts": ["Story Drifts"]},
+        parser_factory=SlowFirstParserFactory(parser_data),
+        executor="thread",
+        max_workers=3,
+    )
+    messages = []
+
+    result = service.prescan_files(files, progress_callback=lambda msg, cur, tot: messages.append((msg, cur)))
+
+    assert list(result.file_summaries) == ["file1.xlsx", "file2.xlsx", "file3.xlsx"]
+    assert result.foundation_joints == ["J3", "J1", "J2"]
+    assert [cur for msg, cur in messages if msg.startswith("Scanning")] == [0, 1, 2]
+
+
+def test_prescan_records_parser_failures() -> None:
+    service = ImportPreparationService(
+        target_sheets={"Story Drifts": ["Story Drifts"]},
+        parser_factory=StubParserFactory({}),
+        executor="inline",
+    )
+
+    result = service.prescan_files([Path("missing.xlsx")])
+
+    assert result.file_summaries == {}
+    assert result.errors == ["missing.xlsx: 'missing.xlsx'"]
+
+
+def test_prescan_executor_selection(monkeypatch) -> None:
+    monkeypatch.delenv("RPS_PRESCAN_EXECUTOR", raising=False)
+    assert prescan_executor_kind(40, 8, total_bytes=PROCESS_POOL_MIN_BYTES) == "process"
+    assert prescan_executor_kind(40, 8, total_bytes=1024) == "thread"
+    assert prescan_executor_kind(40, 1, executor="process") == "inline"
+    assert prescan_executor_kind(1, 8, executor="process") == "inline"
+
+    monkeypatch.setenv("RPS_PRESCAN_EXECUTOR", "thread")
+    assert prescan_executor_kind(40, 8, total_bytes=PROCESS_POOL_MIN_BYTES) == "thread"
+
+
+def test_prescan_workers_env_override(monkeypatch) -> None:
+    monkeypatch.setenv("RPS_PRESCAN_WORKERS", "3")
+    assert prescan_workers() == 3
+    assert prescan_workers(5) == 5
+    monkeypatch.setenv("RPS_PRESCAN_WORKERS", "many")
+    assert prescan_workers() >= 1
+
+
+def test_prescan_process_pool_matches_inline(tmp_path) -> None:
+    for index, case in enumerate(["DES_X", "MCE_X"]):
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Story Drifts"
+        ws.append(["TABLE: Story Drifts"])
+        ws.append(["Story", "Output Case", "Case Type", "Step Type", "Direction", "Drift"])
+        ws.append([None, None, None, None, None, "%"])
+        ws.append(["L1", case, "LinStatic", None, "X", 0.1])
+        wb.save(tmp_path / f"file{index}.xlsx")
+    files = sorted(tmp_path.glob("*.xlsx"))
+    target = {"Story Drifts": ["Story Drifts"]}
+
+    inline = ImportPreparationService(target, executor="inline").prescan_files(files)
+    pooled = ImportPreparationService(target, executor="process", max_workers=2).prescan_files(files)
+
+    assert pooled.errors == []
+    assert pooled.file_load_cases == inline.file_load_cases == {
+        "file0.xlsx": {"Story Drifts": ["DES_X"]},
+        "file1.xlsx": {"Story Drifts": ["MCE_X"]},
+    }
+
+
 def test_detect_conflicts_flags_duplicate_load_cases() -> None:
     file_load_cases = {
         "file1.xlsx": {"Story Drifts": ["DES_X", "MCE_X"]},
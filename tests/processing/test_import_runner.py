@@ -5,7 +5,9 @@
 from pathlib import Path
 
 from processing.import_runner import merge_task_stats, run_import_tasks, task_sheets_available
+from processing.import_stats import count_result_rows
 from processing.import_tasks import ImportTask
+from utils import metrics
 
 
 class DummyTimer:
@@ -78,6 +80,36 @@ def test_run_import_tasks_merges_stats_and_timings():
     assert ("demo", {"task": "Demo"}) in timer.measured
 
 
+def test_run_import_tasks_records_row_metrics():
+    metrics.get_registry().reset()
+    harness = Harness()
+    task = ImportTask(label="Demo", handler="handler", phase="demo", sheets=())
+
+    run_import_tasks(
+        tasks=[task],
+        should_import=harness._should_import,
+        sheet_available=harness._sheet_available,
+        get_handler=lambda name: getattr(harness, name, None),
+        phase_timer=DummyTimer(),
+        session=None,
+        project_id=1,
+        stats={"errors": []},
+        file_name="file.xlsx",
+    )
+
+    snapshot = metrics.get_registry().snapshot()
+    assert snapshot["counters"] == [{"name": "import.rows", "labels": {"phase": "demo"}, "value": 2}]
+    assert snapshot["histograms"][0]["name"] == "import.rows_per_s"
+    metrics.get_registry().reset()
+
+
+def test_count_result_rows_ignores_metadata_counts():
+    stats = {"drifts": 10, "forces": 4, "stories": 3, "load_cases": 2, "project": "Tower"}
+
+    assert count_result_rows(stats) == 14
+    assert count_result_rows(None) == 0
+
+
 def test_merge_task_stats_handles_non_numeric_and_errors():
     stats = {"drifts": 1, "errors": []}
     merge_task_stats(stats, {"drifts": 2, "meta": "ok", "errors": ["boom"]})
@@ -23,11 +23,23 @@ class ConcretePushoverParser(BasePushoverParser):
     def _get_primary_sheet(self) -> str:
         return "Test Sheet"
 
-    def parse(self, direction: str) -> MockResults:
-        direction = self._validate_direction(direction)
+    def _parse_direction(self, direction: str) -> MockResults:
         return MockResults(direction=direction)
 
 
+class SplittingPushoverParser(BasePushoverParser):
+    """Concrete parser that builds results through the parse-once API."""
+
+    def _get_primary_sheet(self) -> str:
+        return "Test Sheet"
+
+    def _parse_direction(self, direction: str) -> MockResults:
+        return MockResults(
+            data=self._read_direction_sheet("Test Sheet", direction),
+            direction=direction,
+        )
+
+
 class TestBasePushoverParserInit:
     """Test parser initialization."""
 
@@ -41,6 +53,18 @@ def test_init_stores_file_path(self, tmp_path):
 
         assert parser.file_path == excel_path
 
+    def test_subclass_without_parse_direction_cannot_be_created(self, tmp_path):
+        """Missing _parse_direction() fails at construction, not mid-parse."""
+        excel_path = tmp_path / "test.xlsx"
+        pd.DataFrame({"A": [1]}).to_excel(excel_path, index=False)
+
+        class IncompleteParser(BasePushoverParser):
+            def _get_primary_sheet(self) -> str:
+                return "Test Sheet"
+
+        with pytest.raises(TypeError, match="_parse_direction"):
+            IncompleteParser(excel_path)
+
     def test_init_loads_excel_data(self, tmp_path):
         """Parser loads Excel file."""
         excel_path = tmp_path / "test.xlsx"
@@ -194,6 +218,74 @@ def test_filter_is_case_insensitive(self, parser):
         assert len(result) == 3
 
 
+class TestSplitByDirection:
+    """Test single-pass direction splitting."""
+
+    @pytest.fixture
+    def parser(self, tmp_path):
+        excel_path = tmp_path / "test.xlsx"
+        pd.DataFrame({"A": [1]}).to_excel(excel_path, index=False)
+        return ConcretePushoverParser(excel_path)
+
+    def test_splits_into_every_direction_preserving_row_order(self, parser):
+        """XY cases also count towards X and Y, matching _filter_by_direction."""
+        df = pd.DataFrame({
+            'Output Case': ['Push_Y+', 'Push_X+', 'Push_XY+', None, 'Other'],
+            'Value': [1, 2, 3, 4, 5]
+        })
+
+        splits = parser._split_by_direction(df)
+
+        assert splits['X']['Value'].tolist() == [2, 3]
+        assert splits['Y']['Value'].tolist() == [1, 3]
+        assert splits['XY']['Value'].tolist() == [3]
+        for direction, part in splits.items():
+            pd.testing.assert_frame_equal(part, parser._filter_by_direction(df, direction))
+
+
+class TestParseAll:
+    """Test the parse-once multi-direction API."""
+
+    @pytest.fixture
+    def parser(self, tmp_path):
+        excel_path = tmp_path / "test.xlsx"
+        _create_etabs_style_excel(excel_path, 'Test Sheet', [
+            {'Story': 'Text', 'Output Case': 'Text', 'Value': 'kN'},
+            {'Story': 'L1', 'Output Case': 'Push_X+', 'Value': 1},
+            {'Story': 'L1', 'Output Case': 'Push_Y+', 'Value': 2},
+            {'Story': 'L2', 'Output Case': 'Push_X-', 'Value': 3},
+        ])
+        return SplittingPushoverParser(excel_path)
+
+    def test_reads_each_sheet_once_for_all_directions(self, parser):
+        """One read serves every requested direction."""
+        with patch(
+            'processing.pushover.pushover_base_parser.pd.read_excel',
+            wraps=pd.read_excel,
+        ) as read_excel:
+            results = parser.parse_all(['X', 'Y'])
+
+        assert read_excel.call_count == 1
+        assert list(results) == ['X', 'Y']
+        assert results['X'].data['Value'].tolist() == [1, 3]
+        assert results['Y'].data['Value'].tolist() == [2]
+
+    def test_parse_returns_cached_result(self, parser):
+        """parse() is a view onto the parse_all() cache."""
+        results = parser.parse_all(['x'])
+
+        assert parser.parse('X') is results['X']
+
+    def test_defaults_to_detected_directions(self, parser):
+        """Without arguments all directions found in the primary sheet are parsed."""
+        assert list(parser.parse_all()) == ['X', 'Y']
+
+    def test_rejects_invalid_direction(self, parser):
+        """Invalid directions raise before any parsing."""
+        with pytest.raises(ValueError, match="Invalid direction"):
+            parser.parse_all(['Z'])
+
+
 class TestAggregateMaxAbs:
     """Test max absolute aggregation."""
 
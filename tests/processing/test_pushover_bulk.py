@@ -0,0 +1,116 @@
+"""Tests for vectorized pushover bulk import helpers."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from database.models import LoadCase
+from processing.pushover.pushover_bulk import (
+    LOAD_CASE_COLUMN,
+    VALUE_COLUMN,
+    bulk_insert_frame,
+    map_ids,
+    melt_load_case_columns,
+    normalize_unique_names,
+    resolve_load_case_ids,
+)
+
+
+class TestNormalizeUniqueNames:
+    """Tests for normalize_unique_names."""
+
+    def test_matches_scalar_conversion(self):
+        """Floats, ints and numeric strings all become integer strings."""
+        values = pd.Series([101.0, 7, "12", "3.0"], dtype=object)
+        expected = [str(int(float(v))) for v in values]
+        assert normalize_unique_names(values).tolist() == expected
+
+    def test_missing_value_raises(self):
+        """Missing identifiers fail loudly, like the scalar conversion."""
+        with pytest.raises(ValueError):
+            normalize_unique_names(pd.Series([1.0, np.nan]))
+
+
+class TestMeltLoadCaseColumns:
+    """Tests for melt_load_case_columns."""
+
+    def test_row_major_order_and_filters(self):
+        """Keeps selected, non-null values in row-major order."""
+        keys = pd.DataFrame({"element_id": map_ids(pd.Series(["A", "B", "C"]), {"A": 1, "C": 3})})
+        values = pd.DataFrame({
+            "LC1": [0.1, 0.2, np.nan],
+            "LC2": [1.0, 2.0, 3.0],
+            "Other": [9.0, 9.0, 9.0],
+        })
+
+        result = melt_load_case_columns(keys, values, {"LC1", "LC2"})
+
+        assert result["element_id"].tolist() == [1, 1, 3]
+        assert result[LOAD_CASE_COLUMN].tolist() == ["LC1", "LC2", "LC2"]
+        assert result[VALUE_COLUMN].tolist() == [0.1, 1.0, 3.0]
+
+    def test_optional_keys_are_carried(self):
+        """Only required keys drop rows; other key columns may be null."""
+        keys = pd.DataFrame({
+            "element_id": pd.array([1, 2], dtype="Int64"),
+            "story_sort_order": pd.array([None, 4], dtype="Int64"),
+        })
+        values = pd.DataFrame({"LC1": [0.5, 0.6]})
+
+        result = melt_load_case_columns(keys, values, {"LC1"}, required=["element_id"])
+
+        assert len(result) == 2
+        assert result["story_sort_order"].isna().tolist() == [True, False]
+
+    def test_no_selected_columns_returns_empty_frame(self):
+        """Returns an empty frame with the expected columns."""
+        keys = pd.DataFrame({"element_id": [1]})
+        values = pd.DataFrame({"LC1": [0.5]})
+
+        result = melt_load_case_columns(keys, values, {"LC9"})
+
+        assert result.empty
+        assert list(result.columns) == ["element_id", LOAD_CASE_COLUMN, VALUE_COLUMN]
+
+
+class TestResolveLoadCaseIds:
+    """Tests for resolve_load_case_ids."""
+
+    def test_resolves_each_name_once(self):
+        """Calls get_or_create once per distinct name in first-seen order."""
+        get_or_create = MagicMock(side_effect=lambda name: SimpleNamespace(id=len(name)))
+        names = pd.Series(["AA", "B", "AA", "B"])
+
+        ids = resolve_load_case_ids(names, get_or_create)
+
+        assert ids.tolist() == [2, 1, 2, 1]
+        assert [c.args[0] for c in get_or_create.call_args_list] == ["AA", "B"]
+
+
+class TestBulkInsertFrame:
+    """Tests for bulk_insert_frame."""
+
+    def test_inserts_rows_with_nulls(self, db_session, sample_project):
+        """Writes all rows in one statement, converting missing values to NULL."""
+        frame = pd.DataFrame({
+            "project_id": pd.array([sample_project.id, sample_project.id], dtype="Int64"),
+            "name": ["LC1", "LC2"],
+            "case_type": ["Pushover", None],
+        })
+
+        count = bulk_insert_frame(db_session, LoadCase, frame)
+        db_session.commit()
+
+        assert count == 2
+        rows = db_session.query(LoadCase).order_by(LoadCase.name).all()
+        assert [(lc.name, lc.case_type) for lc in rows] == [("LC1", "Pushover"), ("LC2", None)]
+
+    def test_empty_frame_skips_execute(self):
+        """An empty frame does not touch the session."""
+        session = MagicMock()
+
+        assert bulk_insert_frame(session, LoadCase, pd.DataFrame()) == 0
+        session.execute.assert_not_called()
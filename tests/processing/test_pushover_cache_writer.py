@@ -0,0 +1,176 @@
+"""Tests for the set-based pushover cache writer."""
+
+from pathlib import Path
+
+import pandas as pd
+from sqlalchemy import event
+
+from database.models import (
+    GlobalResultsCache,
+    LoadCase,
+    ResultSet,
+    Story,
+    StoryDrift,
+)
+from processing.pushover.pushover_bulk import LOAD_CASE_COLUMN, VALUE_COLUMN
+from processing.pushover.pushover_cache_writer import (
+    build_results_matrices,
+    fetch_cache_records,
+    replace_cache_rows,
+)
+from processing.pushover.pushover_global_importer import PushoverGlobalImporter
+
+
+def _records(rows):
+    return pd.DataFrame(
+        rows,
+        columns=["element_id", "story_id", "story_sort_order", LOAD_CASE_COLUMN, VALUE_COLUMN],
+        dtype=object,
+    )
+
+
+class TestBuildResultsMatrices:
+    """Tests for build_results_matrices."""
+
+    def test_groups_in_first_seen_order(self):
+        """Keys and load cases keep record order; sort order comes from the first record."""
+        records = _records([
+            (2, 1, 5, "LC1", 0.1),
+            (1, 1, 3, "LC1", 0.2),
+            (2, 1, 9, "LC2", 0.3),
+            (1, 1, 3, "LC2", None),
+        ])
+
+        rows = build_results_matrices(records, ["element_id", "story_id"])
+
+        assert rows == [
+            {"element_id": 2, "story_id": 1, "story_sort_order": 5,
+             "results_matrix": {"LC1": 0.1, "LC2": 0.3}},
+            {"element_id": 1, "story_id": 1, "story_sort_order": 3,
+             "results_matrix": {"LC1": 0.2, "LC2": None}},
+        ]
+        assert list(rows[0]["results_matrix"]) == ["LC1", "LC2"]
+
+    def test_repeated_load_case_keeps_last_value(self):
+        """A repeated load case stays in its first position with the last value."""
+        records = _records([
+            (1, 1, 0, "LC1", 1.0),
+            (1, 1, 0, "LC2", 2.0),
+            (1, 1, 0, "LC1", 3.0),
+        ])
+
+        rows = build_results_matrices(records, ["element_id", "story_id"])
+
+        assert list(rows[0]["results_matrix"].items()) == [("LC1", 3.0), ("LC2", 2.0)]
+
+    def test_empty_records(self):
+        """No records produce no cache rows."""
+        assert build_results_matrices(_records([]), ["element_id", "story_id"]) == []
+
+
+class TestReplaceCacheRows:
+    """Tests for fetch_cache_records and replace_cache_rows against a database."""
+
+    def _seed(self, db_session, project, result_set):
+        stories = [Story(project_id=project.id, name=name, sort_order=i) for i, name in enumerate(["L1", "L2"])]
+        cases = [LoadCase(project_id=project.id, name=name) for name in ["Push_X", "Push_Y"]]
+        db_session.add_all(stories + cases)
+        db_session.flush()
+        for story in stories:
+            for case, direction in zip(cases, ["X", "Y"]):
+                db_session.add(StoryDrift(
+                    story_id=story.id,
+                    load_case_id=case.id,
+                    direction=direction,
+                    drift=0.01 * story.sort_order,
+                    story_sort_order=story.sort_order,
+                ))
+        db_session.commit()
+        return stories, cases
+
+    def test_fetch_filters_by_load_case(self, db_session, sample_project, sample_result_set):
+        """Only the requested load cases are selected, as scalar columns."""
+        _, cases = self._seed(db_session, sample_project, sample_result_set)
+
+        records = fetch_cache_records(
+            db_session, StoryDrift, "drift", ["story_id", "direction"], [cases[0].id]
+        )
+
+        assert list(records.columns) == ["story_id", "direction", LOAD_CASE_COLUMN, VALUE_COLUMN]
+        assert set(records[LOAD_CASE_COLUMN]) == {"Push_X"}
+        assert len(records) == 2
+
+    def test_replaces_only_its_result_type(self, db_session, sample_project, sample_result_set):
+        """Existing rows of the same type are replaced; other types are untouched."""
+        stories, _ = self._seed(db_session, sample_project, sample_result_set)
+        for result_type in ["Drifts", "Forces"]:
+            db_session.add(GlobalResultsCache(
+                project_id=sample_project.id,
+                result_set_id=sample_result_set.id,
+                result_type=result_type,
+                story_id=stories[0].id,
+                results_matrix={"old": 1.0},
+            ))
+        db_session.commit()
+
+        rows = [{"story_id": stories[1].id, "story_sort_order": 1, "results_matrix": {"LC": 0.5}}]
+        count = replace_cache_rows(
+            db_session,
+            GlobalResultsCache,
+            sample_result_set.id,
+            "Drifts",
+            rows,
+            project_id=sample_project.id,
+        )
+        db_session.commit()
+
+        assert count == 1
+        cached = {
+            entry.result_type: entry
+            for entry in db_session.query(GlobalResultsCache).all()
+        }
+        assert cached["Forces"].results_matrix == {"old": 1.0}
+        assert cached["Drifts"].story_id == stories[1].id
+        assert cached["Drifts"].results_matrix == {"LC": 0.5}
+        assert cached["Drifts"].last_updated is not None
+
+    def test_global_cache_build_issues_no_per_story_queries(self, db_session, sample_project):
+        """The global cache builder runs a fixed number of statements regardless of story count."""
+        result_set = ResultSet(project_id=sample_project.id, name="Push", analysis_type="Pushover")
+        db_session.add(result_set)
+        db_session.commit()
+        _, cases = self._seed(db_session, sample_project, result_set)
+
+        importer = PushoverGlobalImporter(
+            project_id=sample_project.id,
+            session=db_session,
+            folder_path=Path("."),
+            result_set_name="Push",
+            valid_files=[],
+            selected_load_cases_x=[],
+            selected_load_cases_y=[],
+        )
+        importer.result_set = result_set
+        importer.load_cases_cache = {case.name: case for case in cases}
+
+        statements = []
+        engine = db_session.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            importer._build_cache()
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        db_session.commit()
+
+        assert not any("FROM stories WHERE stories.id =" in sql for sql in statements)
+        # Drifts, Displacements, Forces: one SELECT, one DELETE and at most one INSERT each
+        assert len(statements) <= 9
+
+        drifts = (
+            db_session.query(GlobalResultsCache)
+            .filter_by(result_set_id=result_set.id, result_type="Drifts")
+            .order_by(GlobalResultsCache.story_sort_order)
+            .all()
+        )
+        assert [list(entry.results_matrix) for entry in drifts] == [["Push-X_X", "Push-Y_Y"]] * 2
@@ -196,18 +196,18 @@ def test_ensure_entities_uses_quad_rotation_stories_from_both_directions(self):
             selected_load_cases_y=["LCY"],
         )
         parser = MagicMock()
-        parser.parse.side_effect = [
-            SimpleNamespace(
+        parser.parse_all.return_value = {
+            "X": SimpleNamespace(
                 shears_v2=None,
                 shears_v3=None,
                 rotations=pd.DataFrame({"Name": [101.0], "Story": ["Level 1"], "LCX": [0.001]}),
             ),
-            SimpleNamespace(
+            "Y": SimpleNamespace(
                 shears_v2=None,
                 shears_v3=None,
                 rotations=pd.DataFrame({"Name": [101.0], "Story": ["Level 2"], "LCY": [0.002]}),
             ),
-        ]
+        }
         importer._parser = parser
         importer._get_or_create_element = MagicMock(return_value=MagicMock())
         importer._get_or_create_story = MagicMock()
@@ -215,12 +215,48 @@ def test_ensure_entities_uses_quad_rotation_stories_from_both_directions(self):
 
         importer._ensure_entities()
 
-        parser.parse.assert_any_call("X")
-        parser.parse.assert_any_call("Y")
+        parser.parse_all.assert_called_once_with(["X", "Y"])
         story_names = [call.args[0] for call in importer._get_or_create_story.call_args_list]
         assert story_names == ["Level 1", "Level 2"]
 
 
+    def test_import_shears_bulk_inserts_selected_values(self, db_session, sample_project):
+        """Shears are melted and inserted with per-pier story order and skip rules."""
+        from database.models import ResultSet, WallShear
+        from processing.pushover.pushover_wall_importer_v2 import PushoverWallImporterV2
+
+        result_set = ResultSet(project_id=sample_project.id, name="PUSH", analysis_type="Pushover")
+        db_session.add(result_set)
+        db_session.commit()
+
+        importer = PushoverWallImporterV2(
+            project_id=sample_project.id,
+            session=db_session,
+            result_set_id=result_set.id,
+            file_path=Path("test.xlsx"),
+            selected_load_cases_x=["Push X+"],
+            selected_load_cases_y=[],
+        )
+        shears = pd.DataFrame({
+            "Pier": ["P1", "P1", "Unknown"],
+            "Story": ["Level 2", "Level 1", "Level 1"],
+            "Push X+": [10.0, None, 30.0],
+            "Push X-": [1.0, 2.0, 3.0],
+        })
+        importer._ensure_piers_and_stories(shears.iloc[:2])
+
+        count = importer._import_shears(shears, "V2", {"Push X+"})
+        db_session.flush()
+
+        assert count == 1
+        record = db_session.query(WallShear).one()
+        assert record.force == 10.0
+        assert record.direction == "V2"
+        assert record.location == "Bottom"
+        assert record.story_sort_order == 0
+        assert record.result_category_id == importer._get_or_create_result_category_id()
+
+
 class TestPushoverColumnImporterV2:
     """Tests for the refactored column importer."""
 
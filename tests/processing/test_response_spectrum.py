@@ -0,0 +1,187 @@
+"""Tests for response_spectrum.py"""
+
+import numpy as np
+import pytest
+
+from database.models import ResponseSpectrumCache
+from processing.response_spectrum import (
+    G_MM_S2,
+    ResponseSpectrumBatch,
+    ResponseSpectrumRepository,
+    compute_spectrum,
+)
+from processing.time_history_importer import TimeHistoryImporter
+from processing.time_history_parser import TimeHistoryParseResult, TimeSeriesData
+
+DT = 0.01
+
+
+def _ground_motion(steps=400, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal(steps) * 0.3 * G_MM_S2 * np.hanning(steps)
+
+
+def _reference_peak(accelerations, dt, period, damping, substeps=40):
+    """Peak |u| at the samples by average-acceleration Newmark on a refined, linearly interpolated input."""
+    omega = 2 * np.pi / period
+    h = dt / substeps
+    fine = np.interp(
+        np.arange((len(accelerations) - 1) * substeps + 1) * h,
+        np.arange(len(accelerations)) * dt,
+        accelerations,
+    )
+    k_eff = omega**2 + 2 * damping * omega * 2 / h + 4 / h**2
+    u = v = 0.0
+    a = -fine[0]
+    peak = 0.0
+    for index in range(1, len(fine)):
+        rhs = (
+            -fine[index] + (4 / h**2) * u + (4 / h) * v + a + 2 * damping * omega * (2 / h * u + v)
+        )
+        u_next = rhs / k_eff
+        v_next = 2 / h * (u_next - u) - v
+        a = 4 / h**2 * (u_next - u) - 4 / h * v - a
+        u, v = u_next, v_next
+        if index % substeps == 0:
+            peak = max(peak, abs(u))
+    return peak
+
+
+def _series(story, sort_order, values):
+    return TimeSeriesData(
+        story=story,
+        direction="X",
+        time_steps=[DT * step for step in range(len(values))],
+        values=list(values),
+        story_sort_order=sort_order,
+    )
+
+
+def _import(session, project_id, result_set_id, load_case, seed):
+    result = TimeHistoryParseResult(
+        load_case_name=load_case,
+        stories=["Roof", "Base"],
+        accelerations_x=[
+            _series("Roof", 0, 2 * _ground_motion(seed=seed)),
+            _series("Base", 1, _ground_motion(seed=seed)),
+        ],
+    )
+    TimeHistoryImporter(session, project_id, result_set_id).import_result(result)
+
+
+class TestComputeSpectrum:
+    """Tests for the vectorized SDOF recurrence."""
+
+    @pytest.mark.parametrize("period,damping", [(0.1, 0.0), (0.5, 0.05), (2.0, 0.1)])
+    def test_matches_fine_step_integration(self, period, damping):
+        accelerations = _ground_motion()
+        spectrum = compute_spectrum(accelerations, DT, [period], [damping])
+
+        expected = _reference_peak(accelerations, DT, period, damping)
+        assert spectrum.sd[0, 0] == pytest.approx(expected, rel=2e-3)
+
+    def test_grid_matches_individual_oscillators(self):
+        accelerations = _ground_motion()
+        periods, dampings = [0.05, 0.3, 1.0, 4.0], [0.02, 0.05]
+
+        spectrum = compute_spectrum(accelerations, DT, periods, dampings)
+
+        assert spectrum.sd.shape == (2, 4)
+        for i, damping in enumerate(dampings):
+            for j, period in enumerate(periods):
+                single = compute_spectrum(accelerations, DT, [period], [damping])
+                assert spectrum.sd[i, j] == pytest.approx(single.sd[0, 0], rel=1e-12)
+
+    def test_rigid_oscillator_follows_ground(self):
+        accelerations = _ground_motion(steps=2000)
+
+        spectrum = compute_spectrum(accelerations, 0.005, [0.005], [0.05])
+
+        assert spectrum.psa[0, 0] == pytest.approx(spectrum.pga, rel=0.05)
+
+    @pytest.mark.parametrize(
+        "dt,periods,dampings",
+        [(0.0, [1.0], [0.05]), (DT, [0.0, 1.0], [0.05]), (DT, [1.0], [1.0])],
+    )
+    def test_invalid_arguments(self, dt, periods, dampings):
+        with pytest.raises(ValueError):
+            compute_spectrum(_ground_motion(), dt, periods, dampings)
+
+
+class TestResponseSpectrumBatch:
+    """Tests for batch computation and the project DB cache."""
+
+    @pytest.fixture
+    def records(self, db_session, sample_project, sample_result_set):
+        for seed, load_case in enumerate(("TH01", "TH02", "TH03")):
+            _import(db_session, sample_project.id, sample_result_set.id, load_case, seed)
+        return sample_project.id, sample_result_set.id
+
+    def test_spectra_are_cached_per_damping(self, db_session, records):
+        project_id, result_set_id = records
+        batch = ResponseSpectrumBatch(
+            db_session, project_id, result_set_id, periods=[0.1, 1.0], max_workers=1
+        )
+
+        assert batch.compute(directions=("X", "Y")) == 3
+
+        spectra = ResponseSpectrumRepository(db_session).get_spectra(result_set_id, "X")
+        assert [spectrum.damping_ratio for spectrum in spectra] == [0.02, 0.05, 0.1]
+        five = spectra[1]
+        assert five.load_case_names == ["TH01", "TH02", "TH03"]
+        assert five.psa.shape == (3, 2)
+        # The base story (lowest floor, first row) is used, in g
+        expected = compute_spectrum(_ground_motion(seed=1), DT, [0.1, 1.0], [0.05])
+        np.testing.assert_allclose(five.psa[1], expected.psa[0] / G_MM_S2)
+        np.testing.assert_allclose(five.mean, five.psa.mean(axis=0))
+        np.testing.assert_allclose(five.std, five.psa.std(axis=0, ddof=1))
+        assert ResponseSpectrumRepository(db_session).get_spectra(result_set_id, "Y") == []
+
+    def test_only_missing_and_reimport_invalidation(self, db_session, records):
+        project_id, result_set_id = records
+        batch = ResponseSpectrumBatch(
+            db_session, project_id, result_set_id, periods=[0.5], max_workers=1
+        )
+        batch.compute(load_case_names=["TH01"], directions=("X",))
+
+        assert batch.compute(directions=("X",), only_missing=True) == 2
+
+        _import(db_session, project_id, result_set_id, "TH02", seed=7)
+        cached = {row.load_case_name for row in db_session.query(ResponseSpectrumCache)}
+        assert cached == {"TH01", "TH03"}
+
+    def test_process_pool_matches_inline(self, db_session, records):
+        project_id, result_set_id = records
+        ResponseSpectrumBatch(
+            db_session, project_id, result_set_id, periods=[0.2, 2.0], max_workers=2
+        ).compute(directions=("X",))
+        pooled = ResponseSpectrumRepository(db_session).get_spectra(result_set_id, "X")
+
+        ResponseSpectrumBatch(
+            db_session, project_id, result_set_id, periods=[0.2, 2.0], max_workers=1
+        ).compute(directions=("X",))
+        inline = ResponseSpectrumRepository(db_session).get_spectra(result_set_id, "X")
+
+        for left, right in zip(pooled, inline):
+            np.testing.assert_allclose(left.psa, right.psa)
+
+    def test_service_reads_and_computes_missing_spectra_separately(self, db_session, records):
+        from services.data_access import DataAccessService
+
+        project_id, result_set_id = records
+        service = DataAccessService(lambda: db_session)
+
+        # Reading never computes; missing records are listed for a background worker
+        assert service.get_response_spectra(project_id, result_set_id, "X") == []
+        assert service.get_missing_response_spectra(project_id, result_set_id, "X") == [
+            "TH01",
+            "TH02",
+            "TH03",
+        ]
+
+        assert service.compute_response_spectra(project_id, result_set_id, "X") == 3
+        spectra = service.get_response_spectra(project_id, result_set_id, "X")
+
+        assert [len(spectrum.load_case_names) for spectrum in spectra] == [3, 3, 3]
+        assert spectra[0].periods.shape == (200,)
+        assert service.get_missing_response_spectra(project_id, result_set_id, "X") == []
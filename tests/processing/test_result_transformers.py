@@ -70,6 +70,18 @@ def test_add_statistics_computes_avg_max_min(self):
         assert result.loc[0, 'Max'] == pytest.approx(0.15)
         assert result.loc[0, 'Min'] == pytest.approx(0.1)
 
+    def test_add_statistics_uses_precomputed_rows(self):
+        """Test that stored statistics are used instead of recomputing."""
+        transformer = GenericResultTransformer('Drifts')
+
+        df = pd.DataFrame({'TH01': [0.1, 0.2], 'TH02': [0.15, 0.25]})
+        stored = pd.DataFrame({'Avg': [1.0, 2.0], 'Max': [3.0, 4.0], 'Min': [5.0, 6.0]})
+
+        result = transformer.add_statistics(df, stored)
+
+        assert result['Avg'].tolist() == [1.0, 2.0]
+        assert result['Min'].tolist() == [5.0, 6.0]
+
     def test_transform_full_pipeline(self):
         """Test complete transformation pipeline."""
         transformer = GenericResultTransformer('Drifts')
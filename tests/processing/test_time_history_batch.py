@@ -0,0 +1,125 @@
+"""Tests for time_history_batch.py"""
+
+import pytest
+from openpyxl import Workbook
+
+from database.models import TimeSeriesGlobalCache
+from processing.time_history_batch import (
+    TimeHistoryBatchImporter,
+    inspect_record,
+    merge_parse_results,
+    parse_record_sheet,
+)
+from processing.time_history_parser import TimeHistoryParser
+
+
+def _write_record(path, load_case, stories=("Roof", "L1"), steps=(1, 2)):
+    """Write a small time-history workbook with drifts and forces sheets."""
+    wb = Workbook()
+    drifts = wb.active
+    drifts.title = "Story Drifts"
+    drifts.append(["Story", "Output Case", "Case Type", "Step Type", "Step Number", "Direction", "Drift"])
+    drifts.append([None] * 7)
+    forces = wb.create_sheet("Story Forces")
+    forces.append(["Story", "Output Case", "Case Type", "Step Type", "Step Number", "Location", "P", "VX", "VY"])
+    forces.append([None] * 9)
+    for story in stories:
+        for step in steps:
+            for direction in ("X", "Y"):
+                drifts.append([story, load_case, "LinModHist", "Step By Step", step, direction, step / 100])
+            forces.append([story, load_case, "LinModHist", "Step By Step", step, "Bottom", 0.0, step * 10.0, step * 20.0])
+    wb.save(path)
+    return path
+
+
+@pytest.fixture
+def record_files(tmp_path):
+    return [
+        _write_record(tmp_path / "TH01.xlsx", "TH01"),
+        _write_record(tmp_path / "TH02.xlsx", "TH02"),
+    ]
+
+
+def _cached(db_session, result_set_id):
+    return {
+        (entry.load_case_name, entry.result_type, entry.direction, entry.story.name): entry.values
+        for entry in db_session.query(TimeSeriesGlobalCache).filter_by(result_set_id=result_set_id)
+    }
+
+
+class TestRecordTasks:
+    """Tests for the per-file and per-sheet worker tasks."""
+
+    def test_inspect_record(self, record_files):
+        assert inspect_record(str(record_files[0])) == ("TH01", ["Story Drifts", "Story Forces"])
+
+    def test_sheet_parts_merge_to_full_parse(self, record_files):
+        path = str(record_files[0])
+        parts = [parse_record_sheet(path, sheet) for sheet in ("Story Forces", "Story Drifts")]
+
+        assert parts[0].drifts_x == [] and parts[1].forces_x == []
+        assert merge_parse_results("TH01", parts) == TimeHistoryParser(path).parse()
+
+
+class TestTimeHistoryBatchImporter:
+    """Tests for TimeHistoryBatchImporter."""
+
+    def test_imports_all_records_inline(self, db_session, sample_project, sample_result_set, record_files):
+        progress = []
+        batch = TimeHistoryBatchImporter(
+            db_session,
+            sample_project.id,
+            sample_result_set.id,
+            max_workers=1,
+            progress_callback=lambda message, current, total: progress.append((current, total)),
+        )
+
+        outcome = batch.import_files(record_files)
+
+        assert outcome.errors == []
+        assert [r.load_case_name for r in outcome.imported] == ["TH01", "TH02"]
+        # Drifts X/Y and forces X/Y for two stories, per record
+        assert outcome.total_count == 16
+        cached = _cached(db_session, sample_result_set.id)
+        assert cached[("TH02", "Forces", "Y", "Roof")] == [20.0, 40.0]
+        assert progress[-1] == (2, 2)
+
+    def test_process_pool_matches_inline(self, db_session, sample_project, sample_result_set, record_files):
+        batch = TimeHistoryBatchImporter(db_session, sample_project.id, sample_result_set.id, max_workers=2)
+
+        outcome = batch.import_files(record_files)
+
+        assert outcome.errors == []
+        assert outcome.total_count == 16
+        assert _cached(db_session, sample_result_set.id)[("TH01", "Drifts", "X", "L1")] == [0.01, 0.02]
+
+    def test_failed_record_is_collected(self, db_session, sample_project, sample_result_set, record_files, tmp_path):
+        broken = tmp_path / "broken.xlsx"
+        broken.write_bytes(b"not a workbook")
+
+        batch = TimeHistoryBatchImporter(db_session, sample_project.id, sample_result_set.id, max_workers=1)
+        outcome = batch.import_files([broken, *record_files])
+
+        assert len(outcome.errors) == 1
+        assert outcome.errors[0].startswith("broken.xlsx: ")
+        assert [r.load_case_name for r in outcome.imported] == ["TH01", "TH02"]
+        assert {key[0] for key in _cached(db_session, sample_result_set.id)} == {"TH01", "TH02"}
+
+    def test_selection_and_conflict_resolution(self, db_session, sample_project, sample_result_set, record_files, tmp_path):
+        duplicate = _write_record(tmp_path / "TH01_rerun.xlsx", "TH01", steps=(1, 2, 3))
+
+        batch = TimeHistoryBatchImporter(db_session, sample_project.id, sample_result_set.id, max_workers=1)
+        outcome = batch.import_files(
+            [*record_files, duplicate],
+            selected_load_cases={"TH01"},
+            conflict_resolution={"TH01": str(duplicate)},
+        )
+
+        skipped = {r.file_path: r.skipped for r in outcome.records if r.skipped}
+        assert skipped == {
+            str(record_files[0]): "using TH01_rerun.xlsx for TH01",
+            str(record_files[1]): "load case 'TH02' not selected",
+        }
+        cached = _cached(db_session, sample_result_set.id)
+        assert {key[0] for key in cached} == {"TH01"}
+        assert cached[("TH01", "Drifts", "X", "Roof")] == [0.01, 0.02, 0.03]
@@ -0,0 +1,100 @@
+"""Tests for xlsx_row_stream.py"""
+
+import pytest
+from openpyxl import Workbook
+
+from processing.time_history_parser import TimeHistoryParser
+from processing.xlsx_row_stream import XlsxRowStream
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    """Workbook with header and unit rows followed by mixed data rows."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Joint Displacements"
+    ws.append(["Story", "Label", "Unique Name", "Output Case", "Case Type", "Step Type", "Step Number", "Ux", "Uy"])
+    ws.append([None, None, None, None, None, None, None, "mm", "mm"])
+    ws.append(["Roof", 1, "J1", "TH01", "LinModHist", "Step By Step", 1, 1.5, 2.0])
+    ws.append(["Roof", 2, "J2", "TH01", "LinModHist", "Step By Step", 1, 9.9, 9.9])
+    ws.append(["Roof", 1, "J1", "TH01", "LinModHist", "Max", None, 7.0, 7.0])
+    ws.append([None, None, None, None, None, None, None, None, None])
+    ws.append(["L1", "1", "J3", "TH01", "LinModHist", "Step By Step", 2, None, 0.25])
+    wb.create_sheet("Other").append(["x"])
+    path = tmp_path / "th.xlsx"
+    wb.save(path)
+    return path
+
+
+class TestXlsxRowStream:
+    """Tests for XlsxRowStream."""
+
+    def test_lists_sheet_names(self, workbook_path):
+        with XlsxRowStream(workbook_path) as stream:
+            assert stream.sheet_names == ["Joint Displacements", "Other"]
+
+    def test_supports_only_xlsx_archives(self, workbook_path, tmp_path):
+        legacy = tmp_path / "old.xls"
+        legacy.write_bytes(b"not a zip")
+        assert XlsxRowStream.supports(workbook_path)
+        assert not XlsxRowStream.supports(legacy)
+
+    def test_returns_selected_columns_of_matching_rows(self, workbook_path):
+        """Predicates drop rows during the scan; numeric text matches numeric targets."""
+        with XlsxRowStream(workbook_path) as stream:
+            rows = list(stream.iter_rows(
+                "Joint Displacements",
+                columns=[0, 6, 7, 8],
+                where={5: "Step By Step", 1: 1},
+                required=[0],
+                min_row=3,
+            ))
+
+        assert rows == [("Roof", 1, 1.5, 2), ("L1", 2, None, 0.25)]
+        assert isinstance(rows[0][1], int)
+
+    def test_min_row_skips_headers(self, workbook_path):
+        with XlsxRowStream(workbook_path) as stream:
+            first = next(stream.iter_rows("Joint Displacements", columns=[0, 7]))
+        assert first == ("Story", "Ux")
+
+    def test_missing_sheet_raises(self, workbook_path):
+        with XlsxRowStream(workbook_path) as stream:
+            with pytest.raises(ValueError, match="not found"):
+                list(stream.iter_rows("Story Drifts", columns=[0]))
+
+
+class TestTimeHistoryParserStreaming:
+    """TimeHistoryParser reads .xlsx sheets through the filtered stream."""
+
+    def test_parses_label_1_step_by_step_rows(self, tmp_path):
+        wb = Workbook()
+        drifts = wb.active
+        drifts.title = "Story Drifts"
+        drifts.append(["Story", "Output Case", "Case Type", "Step Type", "Step Number", "Direction", "Drift"])
+        drifts.append([None] * 7)
+        for story in ["Roof", "L1"]:
+            for step in [2, 1]:
+                drifts.append([story, "TH05", "LinModHist", "Step By Step", step, "X", step / 100])
+            drifts.append([story, "TH05", "LinModHist", "Max", None, "X", 1.0])
+
+        joints = wb.create_sheet("Joint Displacements")
+        joints.append(["Story", "Label", "Unique Name", "Output Case", "Case Type", "Step Type", "Step Number", "Ux", "Uy", "Uz"])
+        joints.append([None] * 10)
+        for label in [1, 2]:
+            for step in [1, 2]:
+                joints.append(["Roof", label, f"J{label}", "TH05", "LinModHist", "Step By Step", step, label * 10 + step, 0.5, 0.0])
+        path = tmp_path / "TH05.xlsx"
+        wb.save(path)
+
+        result = TimeHistoryParser(path).parse()
+
+        assert result.load_case_name == "TH05"
+        assert result.stories == ["Roof", "L1"]
+        assert [(d.story, d.time_steps, d.values, d.story_sort_order) for d in result.drifts_x] == [
+            ("Roof", [1, 2], [0.01, 0.02], 0),
+            ("L1", [1, 2], [0.01, 0.02], 1),
+        ]
+        assert result.drifts_y == []
+        assert [d.values for d in result.displacements_x] == [[11, 12]]
+        assert result.forces_x == []
@@ -0,0 +1,119 @@
+"""Tests for xlsx_scanner.py"""
+
+import re
+import zipfile
+
+import pytest
+from openpyxl import Workbook
+
+from processing.excel_parser import ExcelParser
+from processing.pushover.pushover_wall_parser import PushoverWallParser
+from processing.time_history_parser import prescan_time_history_file
+from processing.xlsx_scanner import XlsxScanner
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    """ETABS layout: title row, header row, units row, then data."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Story Drifts"
+    ws.append(["TABLE: Story Drifts"])
+    ws.append(["Story", "Output Case", "Case Type", "Step Type", "Step Number", "Direction", "Drift"])
+    ws.append([None, None, None, None, None, None, "%"])
+    ws.append(["L2", "TH01", "NonDirHist", "Step By Step", 1, "X", 0.1])
+    ws.append(["L1", "TH01", "NonDirHist", "Step By Step", 1, "X", 0.2])
+    ws.append(["L2", "TH01", "NonDirHist", "Step By Step", 2, "X", 0.3])
+    ws.append([None, "Orphan", None, None, 3, None, None])
+    ws.append(["L1", "Push <X> & Y", "NonStatic", "Max", None, "X", 0.4])
+
+    pier = wb.create_sheet("Pier Forces")
+    pier.append(["TABLE: Pier Forces"])
+    pier.append(["Story", "Pier", "Output Case", "Location", "V2"])
+    pier.append([None, None, None, None, "kN"])
+    pier.append(["L1", "P2", "Push X", "Top", 1.0])
+    pier.append(["L1", "P1", "Push Y", "Top", 2.0])
+    pier.append(["L2", "P2", "Push X", "Bottom", 3.0])
+
+    wb.create_sheet("Empty")
+    path = tmp_path / "results.xlsx"
+    wb.save(path)
+    return path
+
+
+class TestXlsxScanner:
+    """Tests for XlsxScanner."""
+
+    def test_row_counts_come_from_dimension(self, workbook_path):
+        with XlsxScanner(workbook_path) as scanner:
+            assert scanner.row_count("Story Drifts") == 8
+            assert scanner.row_count("Pier Forces") == 6
+            assert scanner.row_count("Empty") == 0
+
+    def test_header_and_column_lookup(self, workbook_path):
+        with XlsxScanner(workbook_path) as scanner:
+            assert scanner.header("Story Drifts", 2)[:3] == ["Story", "Output Case", "Case Type"]
+            assert scanner.column_index("Story Drifts", "output case", header_row=2) == 1
+            assert scanner.column_index("Story Drifts", "Missing", header_row=2) is None
+
+    def test_distinct_values_in_first_occurrence_order(self, workbook_path):
+        with XlsxScanner(workbook_path) as scanner:
+            cases = scanner.distinct_values("Story Drifts", "Output Case", header_row=2, min_row=4)
+            assert cases == ["TH01", "Orphan", "Push <X> & Y"]
+            assert scanner.distinct_values("Story Drifts", "Missing", header_row=2) == []
+
+    def test_distinct_columns_with_required_column(self, workbook_path):
+        with XlsxScanner(workbook_path) as scanner:
+            distinct = scanner.distinct_columns("Story Drifts", [0, 1, 4], min_row=4, required=0)
+
+        assert distinct == {0: ["L2", "L1"], 1: ["TH01", "Push <X> & Y"], 4: [1, 2]}
+
+    def test_cells_without_references_use_positional_reader(self, tmp_path):
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Story Drifts"
+        for row in (["TABLE"], ["Story", "Output Case"], ["", ""], ["L2", "TH01"], ["L1", "TH02"], ["L2", "TH01"]):
+            ws.append(row)
+        source_path = tmp_path / "refs.xlsx"
+        wb.save(source_path)
+
+        # Some writers omit cell and row references; cells are then positional
+        stripped = tmp_path / "no_refs.xlsx"
+        with zipfile.ZipFile(source_path) as source, zipfile.ZipFile(stripped, "w") as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename.startswith("xl/worksheets/"):
+                    data = re.sub(rb' r="[A-Z]*\d+"', b"", data)
+                target.writestr(item, data)
+
+        with XlsxScanner(stripped) as scanner:
+            cases = scanner.distinct_values("Story Drifts", "Output Case", header_row=2, min_row=4)
+            distinct = scanner.distinct_columns("Story Drifts", [0], min_row=4, required=1)
+
+        assert cases == ["TH01", "TH02"]
+        assert distinct == {0: ["L2", "L1"]}
+
+
+def test_excel_parser_load_cases_use_scanner(workbook_path):
+    parser = ExcelParser(str(workbook_path))
+
+    assert parser.get_available_sheets() == ["Story Drifts", "Pier Forces", "Empty"]
+    assert parser.get_load_cases_only("Story Drifts") == ["TH01", "Orphan", "Push <X> & Y"]
+    assert parser._excel_file is None
+
+
+def test_time_history_prescan(workbook_path):
+    result = prescan_time_history_file(workbook_path)
+
+    assert result["load_case_name"] == "TH01"
+    assert result["num_stories"] == 2
+    assert result["num_time_steps"] == 2
+
+
+def test_pushover_scan_does_not_open_workbook(workbook_path):
+    parser = PushoverWallParser(workbook_path)
+
+    assert parser.get_available_directions() == ["X", "Y"]
+    assert parser.get_output_cases("X") == ["Push X"]
+    assert parser.get_piers() == ["P1", "P2"]
+    assert parser._excel_data is None
@@ -0,0 +1,161 @@
+"""Tests for acceptance.py (acceptance criteria evaluation over result sets)."""
+
+import pytest
+
+from config.acceptance_criteria import AcceptanceLimit
+from database.base import dispose_project_engine, get_project_session, init_project_db
+from database.models import Element, Project, ResultSet, Story
+from database.repositories import CacheRepository, ElementCacheRepository, JointCacheRepository
+from database.session import project_session_factory
+from services.acceptance import AcceptanceService
+
+LIMITS = (
+    AcceptanceLimit("Drifts", 2.0),
+    AcceptanceLimit("QuadRotations", 1.5),
+    AcceptanceLimit("QuadRotations", 0.5, element_group="C*"),
+    AcceptanceLimit("SoilPressures_Min", 400.0),
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project DB with global, element and joint caches in one result set."""
+    path = tmp_path / "tower.db"
+    init_project_db(path)
+    session = get_project_session(path)
+    project = Project(name="Tower")
+    session.add(project)
+    session.flush()
+    stories = [Story(project_id=project.id, name=name) for name in ("L1", "L2")]
+    elements = [
+        Element(project_id=project.id, element_type="Quad", name=name) for name in ("P1", "C1")
+    ]
+    result_set = ResultSet(project_id=project.id, name="DES")
+    session.add_all([*stories, *elements, result_set])
+    session.commit()
+    project_id, result_set_id = project.id, result_set.id
+    l1, l2 = (story.id for story in stories)
+    p1, c1 = (element.id for element in elements)
+    shared = {"project_id": project_id, "result_set_id": result_set_id}
+
+    CacheRepository(session).replace_cache_entries(
+        project_id,
+        result_set_id,
+        "Drifts",
+        [
+            {
+                **shared,
+                "result_type": "Drifts",
+                "story_id": l1,
+                "story_sort_order": 0,
+                "results_matrix": {"DES_TH01_X": 0.010, "DES_TH02_X": -0.025, "DES_TH01_Y": 0.012},
+            },
+            {
+                **shared,
+                "result_type": "Drifts",
+                "story_id": l2,
+                "story_sort_order": 1,
+                "results_matrix": {"DES_TH01_X": 0.004, "DES_TH02_X": 0.006, "DES_TH01_Y": 0.019},
+            },
+        ],
+    )
+    ElementCacheRepository(session).replace_cache_entries(
+        project_id,
+        result_set_id,
+        "QuadRotations",
+        [
+            {
+                **shared,
+                "result_type": "QuadRotations",
+                "element_id": p1,
+                "story_id": l1,
+                "results_matrix": {"TH01": 0.012, "TH02": 0.006},
+            },
+            {
+                **shared,
+                "result_type": "QuadRotations",
+                "element_id": c1,
+                "story_id": l2,
+                "results_matrix": {"TH01": -0.004, "TH02": -0.006},
+            },
+        ],
+    )
+    JointCacheRepository(session).replace_cache_entries(
+        project_id,
+        result_set_id,
+        "SoilPressures_Min",
+        [
+            {
+                **shared,
+                "result_type": "SoilPressures_Min",
+                "shell_object": "F1",
+                "unique_name": "J1",
+                "results_matrix": {"TH01": -350.0, "TH02": -410.0},
+            },
+        ],
+    )
+    session.close()
+
+    service = AcceptanceService(project_id, project_session_factory(path), limits=LIMITS)
+    yield service, result_set_id
+    dispose_project_engine(path)
+
+
+def _summary(result):
+    return {
+        row.result_type: (round(row.max_ratio, 4), row.exceeding, row.approaching)
+        for row in result.rows
+    }
+
+
+def test_evaluate_checks_every_cache_kind_with_limits(project):
+    service, result_set_id = project
+
+    assert service.result_types([result_set_id]) == [
+        "Drifts_X",
+        "Drifts_Y",
+        "QuadRotations",
+        "SoilPressures_Min",
+    ]
+    result = service.evaluate([result_set_id])
+
+    assert _summary(result) == {
+        "Drifts_X": (1.25, 1, 0),
+        "Drifts_Y": (0.95, 0, 1),
+        "QuadRotations": (1.2, 1, 1),  # C1 against its group limit of 0.5 %
+        "SoilPressures_Min": (1.025, 1, 0),
+    }
+    drifts_x = result.rows[0]
+    assert drifts_x.result_set == "DES" and drifts_x.unit == "%"
+    governing = drifts_x.governing
+    assert (governing.location, governing.load_case, governing.demand) == ("L1", "TH02", 2.5)
+    quads = next(row for row in result.rows if row.result_type == "QuadRotations")
+    assert (quads.governing.element, quads.governing.capacity) == ("C1", 0.5)
+    frame = result.to_frame()
+    assert frame.loc[0, ["Location", "Load Case", "Max D/C"]].tolist() == ["L1", "TH02", 1.25]
+
+
+def test_limit_changes_reuse_cached_demands(project):
+    service, result_set_id = project
+    service.evaluate([result_set_id])
+    calls = []
+    factory = service._session_factory
+    service._session_factory = lambda: calls.append(1) or factory()
+
+    service.set_limits((AcceptanceLimit("Drifts", 2.5), AcceptanceLimit("QuadRotations", 1.5)))
+    result = service.evaluate([result_set_id], result_types=["Drifts_X", "QuadRotations"])
+
+    assert _summary(result) == {"Drifts_X": (1.0, 1, 0), "QuadRotations": (0.8, 0, 1)}
+    assert _summary(service.evaluate([result_set_id], statistic="mean"))["Drifts_X"] == (
+        0.3,
+        0,
+        0,
+    )
+    # Only result set names were read; demands came from the kept layer inputs
+    assert len(calls) == 2
+
+    service.invalidate(result_set_id)
+    service._session_factory = factory
+    assert _summary(service.evaluate([result_set_id]))["Drifts_X"] == (1.0, 1, 0)
+    with pytest.raises(ValueError, match="Unknown statistic"):
+        service.evaluate([result_set_id], statistic="median")
@@ -0,0 +1,186 @@
+"""Tests for governing_elements.py (top-N and limit exceedance queries)."""
+
+import pytest
+
+from database.base import dispose_project_engine, get_project_session, init_project_db
+from database.models import Element, ElementPeak, ElementResultsCache, Project, ResultSet, Story
+from database.repositories import ElementCacheRepository
+from database.session import project_session_factory, result_set_session_factory
+from database.shards import create_shard
+from processing.pushover.pushover_cache_writer import replace_cache_rows
+from services.governing_elements import GoverningElementsService
+
+# Quad rotations per (result set, element, story)
+ROTATIONS = {
+    "DES": {
+        "Q1": {"L1": {"TH01": 0.001, "TH02": 0.003}, "L2": {"TH01": 0.002, "TH02": 0.002}},
+        "Q2": {"L1": {"TH01": -0.004, "TH02": -0.006}, "L2": {"TH01": 0.001, "TH02": None}},
+        "Q3": {"L1": {"TH01": 0.0005, "TH02": 0.0005}},
+    },
+    "MCE": {
+        "Q1": {"L2": {"TH01": 0.008, "TH02": 0.006}},
+        "Q2": {"L1": {"TH01": -0.001, "TH02": -0.002}},
+    },
+}
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project DB with DES in the project file and MCE in a shard."""
+    path = tmp_path / "tower.db"
+    init_project_db(path)
+    session = get_project_session(path)
+    project = Project(name="Tower")
+    session.add(project)
+    session.flush()
+    stories = {name: Story(project_id=project.id, name=name) for name in ("L1", "L2")}
+    quads = {
+        name: Element(project_id=project.id, element_type="Quad", name=name)
+        for name in ("Q1", "Q2", "Q3")
+    }
+    session.add_all([*stories.values(), *quads.values()])
+    session.flush()
+    project_id = project.id
+    story_ids = {name: story.id for name, story in stories.items()}
+    quad_ids = {name: quad.id for name, quad in quads.items()}
+
+    result_set_ids = {}
+    for set_name, elements in ROTATIONS.items():
+        result_set = ResultSet(project_id=project_id, name=set_name)
+        session.add(result_set)
+        session.commit()
+        result_set_id = result_set_ids[set_name] = result_set.id
+        scoped = session
+        if set_name == "MCE":
+            create_shard(path, result_set_id)
+            scoped = result_set_session_factory(path, result_set_id)()
+        ElementCacheRepository(scoped).replace_cache_entries(
+            project_id,
+            result_set_id,
+            "QuadRotations",
+            [
+                {
+                    "project_id": project_id,
+                    "result_set_id": result_set_id,
+                    "result_type": "QuadRotations",
+                    "element_id": quad_ids[element],
+                    "story_id": story_ids[story],
+                    "results_matrix": matrix,
+                }
+                for element, story_matrices in elements.items()
+                for story, matrix in story_matrices.items()
+            ],
+        )
+        if scoped is not session:
+            scoped.close()
+    session.close()
+
+    service = GoverningElementsService(
+        project_id,
+        project_session_factory(path),
+        lambda result_set_id: result_set_session_factory(path, result_set_id),
+    )
+    yield service, path, result_set_ids, quad_ids
+    dispose_project_engine(path)
+
+
+def _table(result):
+    return [(row.result_set, row.element, row.story, round(row.value, 6)) for row in result.rows]
+
+
+def test_top_elements_build_peaks_once_and_rank_across_result_sets(project):
+    service, _, result_set_ids, _ = project
+    sets = [result_set_ids["DES"], result_set_ids["MCE"]]
+
+    first = service.top_elements("QuadRotations", sets, metric="abs_avg", count=2)
+
+    assert sorted(first.built_result_sets) == sorted(sets)
+    # Each element once, in the result set it governs in; values in percent
+    assert _table(first) == [("MCE", "Q1", "L2", 0.7), ("DES", "Q2", "L1", 0.5)]
+    assert first.to_frame().columns.tolist() == ["Result Set", "Element", "Story", "|Avg| [%]"]
+
+    again = service.top_elements("QuadRotations", sets, metric="min", count=10)
+    assert again.built_result_sets == []
+    assert _table(again)[0] == ("DES", "Q2", "L1", -0.6)
+    assert [row.element for row in again.rows] == ["Q2", "Q3", "Q1"]
+
+
+def test_exceedances_use_display_limit_and_cap_rows(project):
+    service, _, result_set_ids, _ = project
+    sets = [result_set_ids["DES"], result_set_ids["MCE"]]
+
+    result = service.exceedances("QuadRotations", sets, 0.3, metric="abs_max")
+
+    assert _table(result) == [
+        ("MCE", "Q1", "L2", 0.8),
+        ("DES", "Q2", "L1", 0.6),
+        ("DES", "Q1", "L1", 0.3),
+    ]
+    assert result.total == 3
+
+    capped = service.exceedances("QuadRotations", sets, 0.3, metric="abs_max", max_rows=1)
+    assert capped.total == 3 and len(capped.rows) == 1
+
+    below = service.exceedances("QuadRotations", sets, -0.2, metric="min")
+    assert [(row.result_set, row.element) for row in below.rows] == [("DES", "Q2"), ("MCE", "Q2")]
+    with pytest.raises(ValueError, match="Unknown metric"):
+        service.exceedances("QuadRotations", sets, 1.0, metric="torsion")
+
+
+def test_pushover_cache_writer_keeps_peaks_current(project):
+    service, path, result_set_ids, quad_ids = project
+    des = result_set_ids["DES"]
+    session = get_project_session(path)
+    story_id = session.query(Story.id).filter(Story.name == "L1").scalar()
+
+    replace_cache_rows(
+        session,
+        ElementResultsCache,
+        des,
+        "WallShears_V2",
+        [{"element_id": quad_ids["Q3"], "story_id": story_id, "results_matrix": {"Push": 250.0}}],
+        project_id=session.query(Project.id).scalar(),
+    )
+    session.commit()
+    peak = session.query(ElementPeak).filter_by(result_type="WallShears_V2").one()
+    assert (peak.abs_max, peak.abs_max_story_id) == (250.0, story_id)
+    session.close()
+
+    result = service.top_elements("WallShears_V2", [des], metric="max")
+    assert result.built_result_sets == []
+    assert _table(result) == [("DES", "Q3", "L1", 250.0)]
+    assert service.result_types([des]) == ["QuadRotations", "WallShears_V2"]
+
+
+def test_reimported_element_cache_rebuilds_stale_peaks(project):
+    service, path, result_set_ids, quad_ids = project
+    des = result_set_ids["DES"]
+    first = service.top_elements("QuadRotations", [des], metric="abs_max", count=1)
+    assert first.built_result_sets == [des]
+    assert _table(first) == [("DES", "Q2", "L1", 0.6)]
+
+    # Re-import: the element cache is rewritten without touching the peaks
+    session = get_project_session(path)
+    project_id = session.query(Project.id).scalar()
+    story_id = session.query(Story.id).filter(Story.name == "L2").scalar()
+    ElementCacheRepository(session).replace_cache_entries(
+        project_id,
+        des,
+        "QuadRotations",
+        [
+            {
+                "project_id": project_id,
+                "result_set_id": des,
+                "result_type": "QuadRotations",
+                "element_id": quad_ids["Q3"],
+                "story_id": story_id,
+                "results_matrix": {"TH01": 0.009},
+            }
+        ],
+    )
+    session.close()
+
+    second = service.top_elements("QuadRotations", [des], metric="abs_max", count=5)
+    assert second.built_result_sets == [des]
+    assert _table(second) == [("DES", "Q3", "L2", 0.9)]
+    assert service.top_elements("QuadRotations", [des], count=1).built_result_sets == []
@@ -0,0 +1,96 @@
+"""Tests for the IMPORT_MANIFEST sheet and manifest-first import preview."""
+
+import json
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from services import import_manifest
+from services.export.formatting import apply_excel_formatting
+from services.import_manifest import build_manifest, chunk_json, read_manifest, read_payload
+from services.import_preview import preview_import
+
+
+def _payload():
+    return {
+        "version": "2.0",
+        "export_timestamp": "2026-01-02T03:04:05",
+        "project": {"name": "Tower", "slug": "tower", "description": "demo", "created_at": "2025-12-01"},
+        "result_sets": [{"name": "DES"}, {"name": "MCE"}],
+        "load_cases": [{"name": "TH01"}],
+        "stories": [{"name": "L1"}, {"name": "L2"}, {"name": "L3"}],
+        "elements": [],
+        "result_sheet_mapping": {"global": ["Drifts_X"], "element": ["WallShears_V2"]},
+        # Long enough to span several chunks
+        "normalized_data": {"story_drifts": [{"drift": i / 7} for i in range(6000)]},
+        "cache_data": {"global_results_cache": [{"id": 1}]},
+    }
+
+
+def _write_export(path, payload, with_manifest=True):
+    json_str = json.dumps(payload, separators=(",", ":"))
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        for sheet in ("README", "Result Sets", "Load Cases", "Stories", "Drifts_X"):
+            pd.DataFrame({"A": [sheet]}).to_excel(writer, sheet_name=sheet, index=False)
+        if with_manifest:
+            manifest_str = json.dumps(build_manifest(payload, json_str))
+            pd.DataFrame(chunk_json(manifest_str), columns=["import_manifest"]).to_excel(
+                writer, sheet_name="IMPORT_MANIFEST", index=False
+            )
+        pd.DataFrame(chunk_json(json_str), columns=["import_metadata"]).to_excel(
+            writer, sheet_name="IMPORT_DATA", index=False
+        )
+    apply_excel_formatting(path)
+    return json_str
+
+
+def test_manifest_summarizes_payload(tmp_path):
+    path = tmp_path / "export.xlsx"
+    json_str = _write_export(path, _payload())
+
+    manifest = read_manifest(path)
+
+    assert manifest["project"]["name"] == "Tower"
+    assert manifest["counts"]["result_sets"] == 2
+    assert manifest["counts"]["story_drifts"] == 6000
+    assert manifest["payload"]["length"] == len(json_str)
+    assert manifest["payload"]["chunks"] > 1
+    assert read_payload(path, manifest) == _payload()
+
+
+def test_preview_reads_manifest_without_payload(tmp_path):
+    path = tmp_path / "export.xlsx"
+    _write_export(path, _payload())
+
+    with patch.object(import_manifest.json, "loads", wraps=json.loads) as loads:
+        preview = preview_import(path)
+
+    # Only the manifest is decoded; the payload would be far larger
+    assert all(len(call.args[0]) < 5000 for call in loads.call_args_list)
+    assert preview.project_name == "Tower"
+    assert (preview.result_sets_count, preview.load_cases_count, preview.stories_count) == (2, 1, 3)
+    assert preview.result_types == ["Drifts_X", "WallShears_V2"]
+    assert preview.warnings == ["Missing result data sheets: WallShears_V2"]
+    assert preview.can_import
+
+
+def test_preview_falls_back_to_payload_without_manifest(tmp_path):
+    path = tmp_path / "legacy.xlsx"
+    _write_export(path, _payload(), with_manifest=False)
+
+    preview = preview_import(path)
+
+    assert read_manifest(path) is None
+    assert preview.project_name == "Tower"
+    assert preview.stories_count == 3
+
+
+def test_read_payload_rejects_checksum_mismatch(tmp_path):
+    path = tmp_path / "export.xlsx"
+    _write_export(path, _payload())
+    manifest = read_manifest(path)
+    manifest["payload"]["sha256"] = "0" * 64
+
+    with pytest.raises(ValueError, match="manifest checksum"):
+        read_payload(path, manifest)
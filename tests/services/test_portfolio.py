@@ -0,0 +1,163 @@
+"""Tests for portfolio.py (cross-project portfolio queries)."""
+
+import os
+import sys
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from database.base import dispose_project_engine, get_project_session, init_project_db
+from database.models import (
+    ElementResultsCache,
+    Element,
+    GlobalResultsCache,
+    Project,
+    ResultSet,
+    Story,
+)
+from database.session import result_set_session_factory
+from database.shards import create_shard
+from services.portfolio import PortfolioService, query_project, resolve_metrics
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _make_project(path, name, drifts, quad_rotations=None, shard=False):
+    """Project DB with one result set per entry of ``drifts`` ({set name: matrix})."""
+    init_project_db(path)
+    session = get_project_session(path)
+    project = Project(name=name)
+    session.add(project)
+    session.flush()
+    story = Story(project_id=project.id, name="Roof")
+    element = Element(project_id=project.id, element_type="Quad", name="P1")
+    session.add_all([story, element])
+    session.flush()
+    for set_name, matrix in drifts.items():
+        result_set = ResultSet(project_id=project.id, name=set_name)
+        session.add(result_set)
+        session.commit()
+        scoped = session
+        if shard:
+            create_shard(path, result_set.id)
+            scoped = result_set_session_factory(path, result_set.id)()
+        scoped.add(
+            GlobalResultsCache(
+                project_id=project.id,
+                result_set_id=result_set.id,
+                result_type="Drifts",
+                story_id=story.id,
+                results_matrix=matrix,
+            )
+        )
+        if quad_rotations and set_name in quad_rotations:
+            scoped.add(
+                ElementResultsCache(
+                    project_id=project.id,
+                    result_set_id=result_set.id,
+                    result_type="QuadRotations_Pier",
+                    element_id=element.id,
+                    story_id=story.id,
+                    results_matrix=quad_rotations[set_name],
+                )
+            )
+        scoped.commit()
+        if scoped is not session:
+            scoped.close()
+    session.close()
+    dispose_project_engine(path)
+    return path
+
+
+@pytest.fixture
+def portfolio(tmp_path):
+    tower = _make_project(
+        tmp_path / "tower.db",
+        "Tower",
+        {"DES": {"TH01_X": 0.01, "TH02_X": -0.02}, "MCE": {"TH01_X": 0.03}},
+        quad_rotations={"DES": {"TH01": -0.004, "TH02": 0.001}},
+    )
+    annex = _make_project(tmp_path / "annex.db", "Annex", {"DES": {"TH01_Y": 0.005}}, shard=True)
+    return [("Tower", tower), ("Annex", annex)]
+
+
+def test_query_project_reads_peaks_per_result_set(portfolio):
+    answer = query_project("Tower", str(portfolio[0][1]), ("peak_drift", "max_quad_rotation"))
+
+    assert answer.error is None
+    assert [(row.result_set, row.values) for row in answer.rows] == [
+        ("DES", {"peak_drift": 0.02, "max_quad_rotation": 0.004}),
+        ("MCE", {"peak_drift": 0.03, "max_quad_rotation": None}),
+    ]
+    # Shard rows are included
+    annex = query_project("Annex", str(portfolio[1][1]), ("peak_drift",))
+    assert annex.rows[0].values == {"peak_drift": 0.005}
+
+
+def test_answers_are_cached_until_the_database_changes(portfolio, tmp_path):
+    service = PortfolioService(lambda: portfolio, tmp_path / "cache.json", max_workers=1)
+
+    first = service.query()
+    assert first.queried_projects == 2 and first.cached_projects == 0
+    assert first.to_frame()[["Project", "Result Set", "Peak Drift"]].values.tolist() == [
+        ["Tower", "DES", 0.02],
+        ["Tower", "MCE", 0.03],
+        ["Annex", "DES", 0.005],
+    ]
+
+    # A fresh service reads the same cache file
+    second = PortfolioService(lambda: portfolio, tmp_path / "cache.json", max_workers=1).query()
+    assert second.cached_projects == 2 and second.queried_projects == 0
+    assert second.rows == first.rows
+
+    tower = portfolio[0][1]
+    stat = tower.stat()
+    os.utime(tower, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    third = service.query()
+    assert third.queried_projects == 1 and third.cached_projects == 1
+
+    # New metrics need a query, refresh ignores the cache
+    assert service.query(["peak_drift", "peak_acceleration"]).queried_projects == 2
+    assert service.query(refresh=True).cached_projects == 0
+
+
+def test_errors_are_reported_per_project(portfolio, tmp_path):
+    projects = portfolio + [("Missing", tmp_path / "missing.db")]
+    service = PortfolioService(lambda: projects, None, max_workers=1)
+
+    result = service.query(["peak_drift"])
+
+    assert list(result.errors) == ["Missing"]
+    assert {row.project for row in result.rows} == {"Tower", "Annex"}
+    with pytest.raises(ValueError, match="Unknown metric"):
+        resolve_metrics(["peak_drift", "max_torsion"])
+
+
+def test_process_pool_matches_in_process_results(portfolio):
+    inline = PortfolioService(lambda: portfolio, None, max_workers=1).query()
+    pooled = PortfolioService(lambda: portfolio, None, max_workers=2).query()
+
+    assert pooled.rows == inline.rows
+
+
+def test_cli_prints_portfolio_table(portfolio, tmp_path, monkeypatch, capsys):
+    monkeypatch.syspath_prepend(str(ROOT / "scripts"))
+    import project_tools
+    import services.portfolio as portfolio_module
+
+    monkeypatch.setattr(
+        portfolio_module,
+        "PortfolioService",
+        partial(PortfolioService, lambda: portfolio, tmp_path / "cache.json"),
+    )
+    output = tmp_path / "portfolio.csv"
+
+    assert project_tools.main(["portfolio", "--metric", "peak_drift", "--workers", "1"]) == 0
+    assert "Tower" in capsys.readouterr().out
+    assert project_tools.main(["portfolio", "--workers", "1", "--csv", str(output)]) == 0
+    assert (
+        output.read_text().splitlines()[0] == "Project,Result Set,Type,Peak Drift,Max Quad Rotation"
+    )
+    assert project_tools.main(["portfolio", "--metric", "max_torsion"]) == 1
+    sys.modules.pop("project_tools", None)
@@ -1,6 +1,10 @@
 """Tests for LRU cache implementation in providers."""
 
+import pandas as pd
+
+from services.result_service.models import ResultDataset, ResultDatasetMeta
 from services.result_service.providers import LRUCache
+from utils import metrics
 
 
 def test_lru_cache_basic_operations():
@@ -90,3 +94,27 @@ def test_lru_cache_pop():
     assert cache.get_item("a") is None
     assert cache.get_item("b") == 2
     assert len(cache) == 1
+
+
+def test_lru_cache_reports_evictions_and_size_metrics():
+    metrics.get_registry().reset()
+    cache = LRUCache(max_size=1, name="standard")
+    frame = pd.DataFrame({"TH01": [1.0, 2.0, 3.0]})
+    dataset = ResultDataset(
+        meta=ResultDatasetMeta("Drifts", "X", result_set_id=1, display_name="Drifts"),
+        data=frame,
+        config=None,
+        load_case_columns=["TH01"],
+    )
+
+    cache.set_item("a", dataset)
+    cache.set_item("b", dataset)
+
+    snapshot = metrics.get_registry().snapshot()
+    counters = {entry["name"]: entry for entry in snapshot["counters"]}
+    gauges = {entry["name"]: entry["value"] for entry in snapshot["gauges"]}
+    assert counters["dataset_cache.evict"]["value"] == 1
+    assert counters["dataset_cache.evict"]["labels"] == {"cache": "standard"}
+    assert gauges["dataset_cache.entries"] == 1
+    assert gauges["dataset_cache.bytes"] == frame.memory_usage(index=True, deep=False).sum()
+    metrics.get_registry().reset()
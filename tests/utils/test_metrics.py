@@ -0,0 +1,113 @@
+"""Tests for metrics.py"""
+
+import json
+
+import pytest
+
+from utils import metrics
+from utils.error_handling import timed
+from utils.metrics import MetricsExporter, MetricsRegistry
+from utils.timing import PhaseTimer
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    metrics.get_registry().reset()
+    yield
+    metrics.set_enabled(True)
+    metrics.get_registry().reset()
+
+
+def _find(snapshot, kind, name, **labels):
+    labels = {key: str(value) for key, value in labels.items()}
+    return next(
+        entry for entry in snapshot[kind] if entry["name"] == name and entry["labels"] == labels
+    )
+
+
+def test_counters_gauges_and_histograms_are_keyed_by_labels():
+    registry = MetricsRegistry()
+    registry.increment("dataset_cache.hit", cache="standard")
+    registry.increment("dataset_cache.hit", 2, cache="standard")
+    registry.increment("dataset_cache.hit", cache="joint")
+    registry.set_gauge("dataset_cache.entries", 5, cache="standard")
+    registry.set_gauge("dataset_cache.entries", 3, cache="standard")
+    for value in range(1, 101):
+        registry.observe("dataset.build_seconds", value / 100)
+
+    snapshot = registry.snapshot()
+
+    assert _find(snapshot, "counters", "dataset_cache.hit", cache="standard")["value"] == 3
+    assert _find(snapshot, "counters", "dataset_cache.hit", cache="joint")["value"] == 1
+    assert _find(snapshot, "gauges", "dataset_cache.entries", cache="standard")["value"] == 3
+    histogram = _find(snapshot, "histograms", "dataset.build_seconds")
+    assert histogram["count"] == 100
+    assert histogram["min"] == 0.01 and histogram["max"] == 1.0
+    assert histogram["p50"] == 0.5 and histogram["p95"] == 0.95
+    assert histogram["mean"] == pytest.approx(0.505)
+
+
+def test_rollup_reports_activity_since_previous_rollup():
+    registry = MetricsRegistry()
+    assert registry.rollup() is None
+
+    registry.increment("import.rows", 10)
+    registry.observe("phase.seconds", 2.0, phase="parse")
+    registry.set_gauge("dataset_cache.entries", 4)
+    first = registry.rollup()
+    registry.increment("import.rows", 5)
+    second = registry.rollup()
+
+    assert first["counters"][0]["value"] == 10
+    assert first["histograms"][0]["count"] == 1
+    assert second["counters"][0]["value"] == 5
+    assert second["histograms"] == []
+    assert second["gauges"][0]["value"] == 4
+    assert registry.rollup() is None
+    # Cumulative values are unaffected by rollups
+    assert registry.snapshot()["counters"][0]["value"] == 15
+
+
+def test_disabled_metrics_are_not_recorded():
+    metrics.set_enabled(False)
+    metrics.increment("import.rows", 10)
+    metrics.observe("phase.seconds", 1.0)
+    metrics.set_gauge("dataset_cache.entries", 1)
+
+    assert metrics.get_registry().snapshot() == {"counters": [], "gauges": [], "histograms": []}
+
+
+def test_exporter_appends_json_lines(tmp_path):
+    registry = MetricsRegistry()
+    path = tmp_path / "logs" / "metrics.jsonl"
+    exporter = MetricsExporter(path, registry=registry, interval_s=60)
+
+    assert exporter.flush() is False
+    registry.increment("import.rows", 7)
+    assert exporter.flush() is True
+    registry.observe("call.seconds", 0.2, function="load")
+    exporter.start()
+    exporter.stop()
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == 2
+    assert lines[0]["counters"] == [{"name": "import.rows", "labels": {}, "value": 7}]
+    assert lines[1]["histograms"][0]["labels"] == {"function": "load"}
+    assert {"timestamp", "window_start", "interval_s", "pid"} <= set(lines[0])
+
+
+def test_phase_timer_and_timed_feed_the_registry():
+    timer = PhaseTimer()
+    with timer.measure("story_drifts"):
+        pass
+
+    @timed
+    def build_dataset():
+        return 1
+
+    build_dataset()
+    snapshot = metrics.get_registry().snapshot()
+
+    assert _find(snapshot, "histograms", "phase.seconds", phase="story_drifts")["count"] == 1
+    function = build_dataset.__qualname__
+    assert _find(snapshot, "histograms", "call.seconds", function=function)["count"] == 1
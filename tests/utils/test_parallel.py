@@ -0,0 +1,19 @@
+"""Tests for shared executors."""
+
+import pytest
+
+from utils.parallel import InlineExecutor
+
+
+def test_inline_executor_runs_calls_immediately():
+    with InlineExecutor() as executor:
+        future = executor.submit(pow, 2, 5)
+
+    assert future.done() and future.result() == 32
+
+
+def test_inline_executor_captures_exceptions_in_future():
+    future = InlineExecutor().submit(int, "not a number")
+
+    with pytest.raises(ValueError):
+        future.result()
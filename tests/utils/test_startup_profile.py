@@ -0,0 +1,82 @@
+"""Tests for startup profiling and the lazy main window import path."""
+
+import builtins
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from utils.startup_profile import ImportTimer, StartupProfiler, is_startup_profile_enabled
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+
+@pytest.mark.parametrize("value,expected", [("1", True), ("on", True), ("0", False), ("", False)])
+def test_is_startup_profile_enabled(monkeypatch, value, expected):
+    monkeypatch.setenv("RPS_STARTUP_PROFILE", value)
+    assert is_startup_profile_enabled() is expected
+
+
+def test_import_timer_records_first_time_imports_only():
+    sys.modules.pop("colorsys", None)
+    timer = ImportTimer()
+    timer.install()
+    try:
+        import colorsys  # noqa: F401
+        import colorsys  # noqa: F401,F811 - second import is a sys.modules hit
+    finally:
+        timer.uninstall()
+
+    assert builtins.__import__ is not timer._import
+    recorded = [t for t in timer.timings if t.module == "colorsys"]
+    assert len(recorded) == 1
+    assert recorded[0].depth == 0
+    assert recorded[0].cumulative_ms >= recorded[0].self_ms >= 0
+
+
+def test_disabled_profiler_is_a_no_op():
+    original_import = builtins.__import__
+    profiler = StartupProfiler(enabled=False)
+
+    with profiler.phase("qt_app"):
+        pass
+    profiler.mark("first_paint")
+
+    assert builtins.__import__ is original_import
+    assert profiler.phases == {}
+    assert profiler.report() is None
+
+
+def test_report_logs_phases_and_uninstalls(caplog):
+    original_import = builtins.__import__
+    profiler = StartupProfiler(enabled=True)
+    with profiler.phase("catalog_db"):
+        pass
+    profiler.mark("first_paint")
+
+    with caplog.at_level(logging.INFO, logger="utils.startup_profile"):
+        summary = profiler.report()
+
+    assert builtins.__import__ is original_import
+    assert set(summary["phases_ms"]) == {"catalog_db", "first_paint"}
+    record = next(r for r in caplog.records if r.getMessage() == "Startup profile")
+    assert record.startup_profile == summary
+
+
+def test_main_window_import_defers_heavy_stacks():
+    code = (
+        "import sys\n"
+        "import gui.main_window\n"
+        "heavy = [m for m in ('pandas', 'pyqtgraph', 'gui.project_detail') if m in sys.modules]\n"
+        "print(','.join(heavy))\n"
+    )
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=str(SRC_DIR))
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
@@ -1,4 +1,4 @@
-from utils.timing import PhaseTimer
+from utils.timing import PhaseTimer, current_operation, operation
 
 
 def test_phase_timer_records_phase_and_context():
@@ -22,3 +22,18 @@ def test_phase_timer_records_phase_and_context():
     assert second["phase"] == "cache_build"
     assert second["file"] == "example.xlsx"
     assert "sheet" not in second
+
+
+def test_phase_timer_phases_are_nested_operations():
+    timer = PhaseTimer()
+
+    assert current_operation() is None
+    with operation("import"):
+        outer = current_operation()
+        with timer.measure("parse"):
+            inner = current_operation()
+        assert current_operation() == outer
+
+    assert outer[0] == "import"
+    assert inner[0] == "parse" and inner[1] != outer[1]
+    assert current_operation() is None